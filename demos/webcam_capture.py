@@ -3,7 +3,7 @@
 # dependencies = [
 #     "marimo",
 #     "mohtml",
-#     "wigglystuff==0.3.1",
+#     "wigglystuff",
 # ]
 # ///
 import marimo
@@ -35,9 +35,11 @@ def _(widget):
 
 
 @app.cell
-def _(div, img, widget):
+def _(div, img, mo, widget):
+    # Re-runs whenever the browser syncs a new frame_count.
     div(
         img(src=widget.image_base64),
+        mo.md(f"Frames received: {widget.frame_count}"),
         klass="bg-slate-100 border border-slate-200 rounded-2xl p-4",
     )
     return
@@ -72,6 +72,9 @@ function render({ model, el }) {
     let selectedNodes = new Set(model.get("selected_nodes") || []);
     let selectedEdges = new Set(model.get("selected_edges") || []);
     let resizeObserver = null;
+    // Where a cluster was just expanded or folded, so the nodes that replace
+    // it start there instead of in the middle of the canvas.
+    let spawnPoint = null;
 
     const simulation = forceSimulation()
         .force("link", forceLink().id((d) => d.id).distance(95).strength(0.9))
@@ -172,6 +175,35 @@ function render({ model, el }) {
         tooltip.style.display = "none";
     }
 
+    // Float32 x/y pairs in node order, in [-1, 1], when Python computed a
+    // layout for exactly these nodes; otherwise null.
+    function presetPositions(count) {
+        const raw = model.get("positions");
+        if (!raw || !count) return null;
+        const buffer = raw.buffer ?? raw;
+        const offset = raw.byteOffset ?? 0;
+        const length = raw.byteLength ?? 0;
+        if (length !== count * 8) return null;
+        return new Float32Array(buffer.slice(offset, offset + length));
+    }
+
+    function presetPoint(preset, index) {
+        const pad = 24;
+        return {
+            x: effectiveWidth / 2 + preset[2 * index] * Math.max(effectiveWidth / 2 - pad, 1),
+            y: height / 2 + preset[2 * index + 1] * Math.max(height / 2 - pad, 1),
+        };
+    }
+
+    function applyPositions() {
+        const preset = presetPositions(simNodes.length);
+        if (!preset) return;
+        simNodes.forEach((node, index) => {
+            Object.assign(node, presetPoint(preset, index), { vx: 0, vy: 0 });
+        });
+        simulation.alpha(0.05).restart();
+    }
+
     function rebuildGraph() {
         const nodes = model.get("nodes") || [];
         const edges = model.get("edges") || [];
@@ -193,6 +225,15 @@ function render({ model, el }) {
                 return { x: Number(node.x), y: Number(node.y) };
             }
 
+            if (spawnPoint) {
+                const angle = index * 2.399963229728653;
+                const radius = 6 + Math.sqrt(index % 64) * 6;
+                return {
+                    x: spawnPoint.x + Math.cos(angle) * radius,
+                    y: spawnPoint.y + Math.sin(angle) * radius,
+                };
+            }
+
             const edgeIndex = edges.findIndex((edge) => {
                 return (
                     (edge.source === node.id && oldPositions.has(edge.target)) ||
@@ -219,12 +260,13 @@ function render({ model, el }) {
             };
         }
 
+        const preset = presetPositions(nodes.length);
         simNodes = nodes.map((node, index) => {
             const old = oldPositions.get(node.id);
             if (old) return { ...node, ...old };
             return {
                 ...node,
-                ...newNodePosition(node, index),
+                ...(preset ? presetPoint(preset, index) : newNodePosition(node, index)),
             };
         });
 
@@ -239,9 +281,11 @@ function render({ model, el }) {
         selectedNodes = new Set((model.get("selected_nodes") || []).filter((id) => nodeMap.has(id)));
         selectedEdges = new Set((model.get("selected_edges") || []).filter((id) => simEdges.some((edge) => edge.id === id)));
 
+        spawnPoint = null;
+
         simulation.nodes(simNodes);
         simulation.force("link").links(simEdges);
-        simulation.alpha(oldPositions.size ? 0.16 : 0.35).restart();
+        simulation.alpha(preset ? 0.05 : oldPositions.size ? 0.16 : 0.35).restart();
         updateVisuals();
     }
 
@@ -284,6 +328,7 @@ function render({ model, el }) {
                 .on("drag", dragged)
                 .on("end", dragEnded))
             .on("click", handleNodeClick)
+            .on("dblclick", handleNodeDoubleClick)
             .on("mouseenter", (event, d) => {
                 showTooltip(event, d, "node");
                 model.set("hovered_node", d.id);
@@ -304,7 +349,8 @@ function render({ model, el }) {
         mergedNodes.select(".graph-widget-node")
             .attr("r", nodeRadius)
             .attr("fill", (d) => d.color || colorScale(d.id))
-            .classed("is-selected", (d) => selectedNodes.has(d.id));
+            .classed("is-selected", (d) => selectedNodes.has(d.id))
+            .classed("is-cluster", (d) => Boolean(d.cluster));
         mergedNodes.select(".graph-widget-node-name")
             .attr("dy", (d) => nodeRadius(d) + 14)
             .text((d) => d.name || "");
@@ -365,6 +411,12 @@ function render({ model, el }) {
 
     function handleNodeClick(event, d) {
         event.stopPropagation();
+        if (d.cluster) {
+            // Super-nodes from GraphWidget.cluster(): ask Python for the members.
+            spawnPoint = { x: d.x, y: d.y };
+            model.send({ type: "expand", id: d.id });
+            return;
+        }
         if (event.ctrlKey || event.metaKey) {
             if (selectedNodes.has(d.id)) selectedNodes.delete(d.id);
             else selectedNodes.add(d.id);
@@ -379,6 +431,13 @@ function render({ model, el }) {
         updateVisuals();
     }
 
+    function handleNodeDoubleClick(event, d) {
+        event.stopPropagation();
+        if (d.cluster) return;
+        spawnPoint = { x: d.x, y: d.y };
+        model.send({ type: "collapse", id: d.id });
+    }
+
     function handleEdgeClick(event, d) {
         event.stopPropagation();
         if (event.ctrlKey || event.metaKey) {
@@ -412,6 +471,7 @@ function render({ model, el }) {
 
     model.on("change:nodes", rebuildGraph);
     model.on("change:edges", rebuildGraph);
+    model.on("change:positions", applyPositions);
     model.on("change:directed", updateVisuals);
     model.on("change:bounded", restartSimulation);
     model.on("change:selected_nodes", syncFromModelSelection);
@@ -430,6 +490,7 @@ function render({ model, el }) {
         }
         model.off("change:nodes", rebuildGraph);
         model.off("change:edges", rebuildGraph);
+        model.off("change:positions", applyPositions);
         model.off("change:directed", updateVisuals);
         model.off("change:bounded", restartSimulation);
         model.off("change:selected_nodes", syncFromModelSelection);
@@ -171,9 +171,30 @@ function render({ model, el }) {
             .attr("transform", d => `translate(${d.x},${d.y})`);
     }
 
+    // Batches streamed by Python while a query is still reading records. They
+    // are shown on top of the synced lists until the traits catch up.
+    let streamed = null;
+
+    function handleMessage(msg) {
+        if (!msg || msg.type !== "delta") return;
+        if (msg.reset || !streamed) {
+            streamed = msg.reset
+                ? { nodes: [], rels: [] }
+                : { nodes: [...(model.get("nodes") || [])], rels: [...(model.get("relationships") || [])] };
+        }
+        streamed.nodes.push(...(msg.nodes || []));
+        streamed.rels.push(...(msg.relationships || []));
+        rebuildGraph();
+    }
+
+    function handleSynced() {
+        streamed = null;
+        rebuildGraph();
+    }
+
     function rebuildGraph() {
-        const nodes = model.get("nodes") || [];
-        const rels = model.get("relationships") || [];
+        const nodes = streamed ? streamed.nodes : model.get("nodes") || [];
+        const rels = streamed ? streamed.rels : model.get("relationships") || [];
 
         const nodeMap = new Map(nodes.map(n => [n.element_id, n]));
 
@@ -515,8 +536,9 @@ function render({ model, el }) {
     });
 
     // --- Observe model changes ---
-    model.on("change:nodes", rebuildGraph);
-    model.on("change:relationships", rebuildGraph);
+    model.on("change:nodes", handleSynced);
+    model.on("change:relationships", handleSynced);
+    model.on("msg:custom", handleMessage);
 
     model.on("change:error", () => {
         const err = model.get("error");
@@ -530,6 +552,7 @@ function render({ model, el }) {
 
     model.on("change:query_running", () => {
         const running = model.get("query_running");
+        if (!running && streamed) handleSynced();
         runBtn.textContent = running ? "..." : "Run";
         runBtn.disabled = running;
     });
@@ -120,6 +120,15 @@ function pathToKey(path) {
   return path.join("\u0000");
 }
 
+function findDataNode(data, path) {
+  if (!data || !path.length || data.name !== path[0]) return null;
+  let cur = data;
+  for (let i = 1; i < path.length && cur; i++) {
+    cur = (cur.children || []).find((c) => c.name === path[i]);
+  }
+  return cur || null;
+}
+
 function render({ model, el }) {
   const root = document.createElement("div");
   root.className = "wiggly-nested-table";
@@ -230,7 +239,8 @@ function render({ model, el }) {
     const here = path.concat(node.name);
     const key = pathToKey(here);
     const isExpanded = expanded.has(key);
-    const hasChildren = !!(node.children && node.children.length);
+    // A lazy node's children arrive from Python once it is expanded.
+    const hasChildren = !!((node.children && node.children.length) || node.lazy);
 
     const tr = document.createElement("tr");
     if (key === selectedKey) tr.classList.add("-selected");
@@ -287,7 +297,7 @@ function render({ model, el }) {
 
     tbody.appendChild(tr);
 
-    if (hasChildren && isExpanded) {
+    if (hasChildren && isExpanded && node.children) {
       for (const child of node.children) {
         renderRow(child, here, depth + 1, rootTotals, cols, pctCols);
       }
@@ -316,8 +326,22 @@ function render({ model, el }) {
     const synced = model.get("selected_path") || [];
     setSelectedKey(synced.length ? pathToKey(synced) : null);
   });
+  model.on("msg:custom", (msg) => {
+    if (!msg || msg.type !== "children") return;
+    const data = model.get("data");
+    for (const { path, children } of msg.nodes || []) {
+      const node = findDataNode(data, path);
+      if (!node) continue;
+      node.children = children;
+      delete node.lazy;
+    }
+    redraw();
+  });
 
   build();
+  // Python remembers which lazy subtrees it has sent. This view starts from
+  // `data` alone, so ask it to resend the ones the current view needs.
+  model.send({ type: "resync" });
 }
 
 export default { render };
@@ -1,7 +1,12 @@
-import { createRender, useModelState } from "@anywidget/react";
+import { createRender, useModel, useModelState } from "@anywidget/react";
 import React, { useRef, useState, useEffect } from 'react';
 
 const MAX_UNDO_STEPS = 20;
+// Edge of the square tiles the canvas is synced in; must match paint.py.
+const TILE_SIZE = 64;
+
+type UndoEntry = { image: ImageData; tiles: Set<number> };
+type Stroke = { tool: string; size: number; color: string; timestamp: number; points: number[] };
 
 function Component() {
   const canvasRef = useRef<HTMLCanvasElement>(null);
@@ -10,7 +15,7 @@ function Component() {
   const [markerSize, setMarkerSize] = useState(8);
   const [eraserSize, setEraserSize] = useState(20);
   const [rainbowSize, setRainbowSize] = useState(14);
-  let [base64, setBase64] = useModelState<string>("base64");
+  const model = useModel();
   let [height] = useModelState<number>("height");
   let [width] = useModelState<number>("width");
   let [storeBackground] = useModelState<boolean>("store_background");
@@ -20,25 +25,114 @@ function Component() {
   let [showEraser] = useModelState<boolean>("eraser");
   let [showColorPicker] = useModelState<boolean>("color_picker");
   let [color, setColor] = useModelState<string>("color");
+  let [, setRevision] = useModelState<number>("revision");
+  let [syncTiles] = useModelState<boolean>("sync_tiles");
 
-  const originalImageRef = useRef<string>("");
-  const lastLoadedBase64Ref = useRef<string>("");
-  const isLoadingRef = useRef(false);
-  const [exportTrigger, setExportTrigger] = useState(0);
-  const undoStackRef = useRef<ImageData[]>([]);
+  // Canvas as first synced from Python, restored by Clear
+  const originalImageRef = useRef<ImageData | null>(null);
+  const undoStackRef = useRef<UndoEntry[]>([]);
   const [undoCount, setUndoCount] = useState(0);
-
-  // Capture the original base64 once on mount
-  useEffect(() => {
-    originalImageRef.current = base64;
-  }, []);
+  // Indices (row * cols + col) of tiles drawn on since the last flush
+  const dirtyRef = useRef<Set<number>>(new Set());
+  const lastPointRef = useRef<[number, number]>([0, 0]);
+  // Stroke being drawn, sent to Python's stroke log when it ends
+  const strokeRef = useRef<Stroke | null>(null);
 
   const getContext = () => canvasRef.current?.getContext('2d') ?? null;
 
-  // Clear undo stack when dimensions change
+  const tileCols = () => Math.ceil((canvasRef.current?.width ?? 0) / TILE_SIZE);
+
+  const markDirty = (x0: number, y0: number, x1: number, y1: number, pad: number) => {
+    const canvas = canvasRef.current;
+    if (!canvas) return;
+    const cols = tileCols();
+    const rows = Math.ceil(canvas.height / TILE_SIZE);
+    const c0 = Math.max(0, Math.floor((Math.min(x0, x1) - pad) / TILE_SIZE));
+    const c1 = Math.min(cols - 1, Math.floor((Math.max(x0, x1) + pad) / TILE_SIZE));
+    const r0 = Math.max(0, Math.floor((Math.min(y0, y1) - pad) / TILE_SIZE));
+    const r1 = Math.min(rows - 1, Math.floor((Math.max(y0, y1) + pad) / TILE_SIZE));
+    const entry = undoStackRef.current[undoStackRef.current.length - 1];
+    for (let r = r0; r <= r1; r++) {
+      for (let c = c0; c <= c1; c++) {
+        dirtyRef.current.add(r * cols + c);
+        entry?.tiles.add(r * cols + c);
+      }
+    }
+  };
+
+  const markAllDirty = () => {
+    const canvas = canvasRef.current;
+    if (canvas) markDirty(0, 0, canvas.width - 1, canvas.height - 1, 0);
+  };
+
+  // Send the dirty tiles to Python as raw RGBA buffers, then bump revision
+  // so observers run once the tiles (or just the stroke log) have landed.
+  const flushTiles = () => {
+    const ctx = getContext();
+    const canvas = canvasRef.current;
+    if (!ctx || !canvas || dirtyRef.current.size === 0) return;
+    if (!syncTiles) {
+      dirtyRef.current.clear();
+      setRevision((model.get("revision") ?? 0) + 1);
+      return;
+    }
+    const cols = tileCols();
+    const tiles: number[][] = [];
+    const buffers: ArrayBuffer[] = [];
+    for (const index of dirtyRef.current) {
+      const x = (index % cols) * TILE_SIZE;
+      const y = Math.floor(index / cols) * TILE_SIZE;
+      const w = Math.min(TILE_SIZE, canvas.width - x);
+      const h = Math.min(TILE_SIZE, canvas.height - y);
+      tiles.push([x, y, w, h]);
+      buffers.push(ctx.getImageData(x, y, w, h).data.buffer);
+    }
+    dirtyRef.current.clear();
+    model.send({ type: "tiles", tiles }, undefined, buffers);
+    setRevision((model.get("revision") ?? 0) + 1);
+  };
+
+  // Tiles from Python: the starting canvas (base), a full sync (reset), or
+  // the changes of undo_stroke
+  useEffect(() => {
+    const onMessage = (msg: any, buffers: DataView[]) => {
+      const ctx = getContext();
+      const canvas = canvasRef.current;
+      // undo_stroke() in Python: its tiles follow, so just drop our step
+      if (msg?.type === "undo") {
+        undoStackRef.current.pop();
+        setUndoCount(undoStackRef.current.length);
+        return;
+      }
+      if (!msg || msg.type !== "tiles" || !ctx || !canvas) return;
+      if (msg.reset) ctx.clearRect(0, 0, canvas.width, canvas.height);
+      msg.tiles.forEach(([x, y, w, h]: number[], i: number) => {
+        if (x + w > canvas.width || y + h > canvas.height) return;
+        const view = buffers[i];
+        const pixels = new Uint8ClampedArray(view.buffer, view.byteOffset, w * h * 4);
+        ctx.putImageData(new ImageData(pixels, w, h), x, y);
+      });
+      // A base (sync or replace_with_pil) is what Clear restores, and like
+      // Python's stroke log the undo history starts over on top of it.
+      if ((msg.base || (msg.reset && !originalImageRef.current)) && canvas.width > 0 && canvas.height > 0) {
+        originalImageRef.current = ctx.getImageData(0, 0, canvas.width, canvas.height);
+      }
+      if (msg.base) {
+        undoStackRef.current = [];
+        setUndoCount(0);
+      }
+    };
+    model.on("msg:custom", onMessage);
+    return () => model.off("msg:custom", onMessage);
+  }, [model]);
+
+  // Clear undo stack when dimensions change and ask Python for the canvas
   useEffect(() => {
     undoStackRef.current = [];
     setUndoCount(0);
+    dirtyRef.current.clear();
+    originalImageRef.current = null;
+    if (width > 0 && height > 0) model.send({ type: "sync" });
   }, [width, height]);
 
   // Keep the selected tool valid when tools are toggled off. If the current
@@ -89,60 +183,6 @@ function Component() {
     };
   }, []);
 
-  // Load initial/updated image
-  useEffect(() => {
-    const ctx = getContext();
-    if (!ctx || !canvasRef.current || !base64) return;
-    if (width === 0 || height === 0) return;
-
-    if (base64 === lastLoadedBase64Ref.current) {
-      const canvas = canvasRef.current;
-      if (canvas.width > 0 && canvas.height > 0) {
-        try {
-          const data = ctx.getImageData(0, 0, canvas.width, canvas.height);
-          if (data.data.some(p => p !== 0)) return;
-        } catch {}
-      }
-    }
-
-    isLoadingRef.current = true;
-    const img = new Image();
-    img.onload = () => {
-      ctx.clearRect(0, 0, canvasRef.current!.width, canvasRef.current!.height);
-      ctx.drawImage(img, 0, 0, canvasRef.current!.width, canvasRef.current!.height);
-      lastLoadedBase64Ref.current = base64;
-      isLoadingRef.current = false;
-    };
-    img.onerror = () => { isLoadingRef.current = false; };
-    img.src = `data:image/png;base64,${base64}`;
-  }, [base64, width, height]);
-
-  // Export on trigger
-  useEffect(() => {
-    if (!canvasRef.current || exportTrigger === 0 || isLoadingRef.current) return;
-
-    const exportCanvas = document.createElement('canvas');
-    exportCanvas.width = canvasRef.current.width;
-    exportCanvas.height = canvasRef.current.height;
-    const exportCtx = exportCanvas.getContext('2d', { alpha: true });
-    if (!exportCtx) return;
-
-    exportCtx.clearRect(0, 0, exportCanvas.width, exportCanvas.height);
-
-    if (storeBackground) {
-      exportCtx.fillStyle = '#FFFFFF';
-      exportCtx.fillRect(0, 0, exportCanvas.width, exportCanvas.height);
-    }
-
-    exportCtx.globalCompositeOperation = 'source-over';
-    exportCtx.drawImage(canvasRef.current, 0, 0);
-
-    try {
-      const dataUrl = exportCanvas.toDataURL('image/png');
-      setBase64(dataUrl.split(',')[1]);
-    } catch {}
-  }, [storeBackground, width, height, exportTrigger]);
-
   // Save undo snapshot before a stroke
   const saveUndoSnapshot = () => {
     const ctx = getContext();
@@ -152,7 +192,7 @@ function Component() {
     const snapshot = ctx.getImageData(0, 0, canvas.width, canvas.height);
     const stack = undoStackRef.current;
     if (stack.length >= MAX_UNDO_STEPS) stack.shift();
-    stack.push(snapshot);
+    stack.push({ image: snapshot, tiles: new Set() });
     setUndoCount(stack.length);
   };
 
@@ -161,12 +201,15 @@ function Component() {
     const canvas = canvasRef.current;
     if (!ctx || !canvas) return;
 
-    const snapshot = undoStackRef.current.pop();
-    if (!snapshot) return;
+    const entry = undoStackRef.current.pop();
+    if (!entry) return;
+    model.send({ type: "undo" });
 
-    ctx.putImageData(snapshot, 0, 0);
+    // Only the tiles the undone step touched need to go back to Python
+    ctx.putImageData(entry.image, 0, 0);
+    for (const index of entry.tiles) dirtyRef.current.add(index);
     setUndoCount(undoStackRef.current.length);
-    setExportTrigger(prev => prev + 1);
+    flushTiles();
   };
 
   const handleClear = () => {
@@ -176,24 +219,11 @@ function Component() {
 
     // Save current state so clear is undoable
     saveUndoSnapshot();
+    model.send({ type: "clear" });
     ctx.clearRect(0, 0, canvas.width, canvas.height);
-
-    if (originalImageRef.current) {
-      isLoadingRef.current = true;
-      const img = new Image();
-      img.onload = () => {
-        ctx.drawImage(img, 0, 0, canvas.width, canvas.height);
-        isLoadingRef.current = false;
-        setExportTrigger(prev => prev + 1);
-      };
-      img.onerror = () => {
-        isLoadingRef.current = false;
-        setExportTrigger(prev => prev + 1);
-      };
-      img.src = `data:image/png;base64,${originalImageRef.current}`;
-    } else {
-      setExportTrigger(prev => prev + 1);
-    }
+    if (originalImageRef.current) ctx.putImageData(originalImageRef.current, 0, 0);
+    markAllDirty();
+    flushTiles();
   };
 
   const sprayRainbowAt = (ctx: CanvasRenderingContext2D, x: number, y: number, radius: number) => {
@@ -216,8 +246,14 @@ function Component() {
     saveUndoSnapshot();
     ctx.beginPath();
     ctx.moveTo(x, y);
+    lastPointRef.current = [x, y];
+    const size = tool === 'rainbow' ? rainbowSize : tool === 'eraser' ? eraserSize : tool === 'marker' ? markerSize : 2;
+    strokeRef.current = { tool, size, color, timestamp: Date.now(), points: [x, y] };
     setIsDrawing(true);
-    if (tool === 'rainbow') sprayRainbowAt(ctx, x, y, rainbowSize);
+    if (tool === 'rainbow') {
+      sprayRainbowAt(ctx, x, y, rainbowSize);
+      markDirty(x, y, x, y, rainbowSize + 2);
+    }
   };
 
   const drawAt = (x: number, y: number) => {
@@ -225,12 +261,18 @@ function Component() {
     const ctx = getContext();
     if (!ctx) return;
 
+    strokeRef.current?.points.push(x, y);
     if (tool === 'rainbow') {
       sprayRainbowAt(ctx, x, y, rainbowSize);
+      markDirty(x, y, x, y, rainbowSize + 2);
       return;
     }
 
     ctx.lineTo(x, y);
+    const lineWidth = tool === 'eraser' ? eraserSize : tool === 'marker' ? markerSize : 2;
+    const [px, py] = lastPointRef.current;
+    markDirty(px, py, x, y, lineWidth / 2 + 2);
+    lastPointRef.current = [x, y];
 
     if (tool === 'eraser') {
       ctx.save();
@@ -250,7 +292,13 @@ function Component() {
 
   const stopDrawing = () => {
     if (!isDrawing) return;
-    setExportTrigger(prev => prev + 1);
+    const stroke = strokeRef.current;
+    strokeRef.current = null;
+    if (stroke) {
+      const { points, ...meta } = stroke;
+      model.send({ type: "stroke", ...meta }, undefined, [new Float32Array(points).buffer]);
+    }
+    flushTiles();
     setIsDrawing(false);
   };
 
@@ -169,6 +169,15 @@ function isSamePath(a, b) {
   return a.every((part, index) => part === b[index]);
 }
 
+function findDataNode(data, path) {
+  if (!data || !path.length || data.name !== path[0]) return null;
+  let cur = data;
+  for (let i = 1; i < path.length && cur; i++) {
+    cur = (cur.children || []).find((c) => c.name === path[i]);
+  }
+  return cur || null;
+}
+
 function findNodeByPath(root, path) {
   if (!path || path.length === 0) return root;
   let cur = root;
@@ -383,6 +392,18 @@ function render({ model, el }) {
       .round(true)(hierarchy);
   }
 
+  function layoutHierarchy(data, width, height) {
+    const valueCol = model.get("value_col") || "";
+    hierarchy = d3Hierarchy(data)
+      .sum((d) =>
+        d.children && d.children.length ? 0 : pickValue(d.value, valueCol)
+      )
+      .sort((a, b) => b.value - a.value);
+
+    applyTreemap(width, height);
+    assignSiblingIndexes(hierarchy);
+  }
+
   function invalidateVisibleCache() {
     cachedVisible = null;
     cachedSelected = null;
@@ -417,7 +438,6 @@ function render({ model, el }) {
     const data = model.get("data");
     const widthRaw = model.get("width");
     const height = model.get("height") || 400;
-    const valueCol = model.get("value_col") || "";
     chart.style.width =
       typeof widthRaw === "number" ? widthRaw + "px" : widthRaw || "600px";
     chart.style.height = height + "px";
@@ -438,14 +458,7 @@ function render({ model, el }) {
       return;
     }
 
-    hierarchy = d3Hierarchy(data)
-      .sum((d) =>
-        d.children && d.children.length ? 0 : pickValue(d.value, valueCol)
-      )
-      .sort((a, b) => b.value - a.value);
-
-    applyTreemap(width, height);
-    assignSiblingIndexes(hierarchy);
+    layoutHierarchy(data, width, height);
     lastMeasuredWidth = width;
 
     const syncedPath = model.get("selected_path") || [];
@@ -461,6 +474,27 @@ function render({ model, el }) {
     draw(currentExtent);
   }
 
+  function graft(updates) {
+    const data = model.get("data");
+    if (!hierarchy || !data) return;
+    for (const { path, children } of updates) {
+      const node = findDataNode(data, path);
+      if (!node) continue;
+      node.children = children;
+      delete node.lazy;
+    }
+    // Grafted children sum to their lazy parent's value, so every rectangle on
+    // screen keeps its place: re-layout and carry the current view over.
+    const keep = nodePath(selected);
+    layoutHierarchy(data, lastMeasuredWidth || measuredWidth(), model.get("height") || 400);
+    selected = findNodeByPath(hierarchy, keep) || hierarchy;
+    hoveredNode = null;
+    hoverTarget = null;
+    colorTransition = null;
+    invalidateVisibleCache();
+    draw(currentExtent || extentOf(selected));
+  }
+
   function draw(extent) {
     if (!hierarchy || !selected) return;
     const width = measuredWidth();
@@ -785,8 +819,14 @@ function render({ model, el }) {
       setSelected(target, true, false);
     }
   });
+  model.on("msg:custom", (msg) => {
+    if (msg && msg.type === "children") graft(msg.nodes || []);
+  });
 
   build();
+  // Python remembers which lazy subtrees it has sent. This view starts from
+  // `data` alone, so ask it to resend the ones the current view needs.
+  model.send({ type: "resync" });
 }
 
 export default { render };
@@ -1,9 +1,13 @@
 import asyncio
+import io
+import json
 import sys
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 
 import pytest
 
-from wigglystuff.async_flow import AsyncFlowLogger
+from wigglystuff.async_flow import _DONE, _SPAWN, _START, AsyncFlow, AsyncFlowLogger, _ChromeTraceWriter
 
 
 @pytest.fixture
@@ -25,3 +29,520 @@ def test_logger_does_not_evict_an_active_profiler(occupied_profiler_slot):
     asyncio.run(go())
     # The pre-existing profiler/coverage tool must survive the logger's run.
     assert sys.monitoring.get_tool(occupied_profiler_slot) == "pretend-profiler"
+
+
+async def _sleeper():
+    await asyncio.sleep(0)
+    return "ok"
+
+
+def _drive(logger, steps):
+    """Spawn ``_sleeper`` via the logger's task factory and replay ``steps``
+    (callback name, offset) through it, without needing ``sys.monitoring``."""
+
+    async def go():
+        loop = asyncio.get_running_loop()
+        logger._t0 = time.perf_counter()
+        task = logger._task_factory(loop, _sleeper())
+        code = _sleeper.__code__
+        for name, offset in steps:
+            if name == "sleep":
+                time.sleep(offset)
+            elif name in ("resume", "start"):
+                getattr(logger, f"_on_{name}")(code, offset)
+            else:
+                getattr(logger, f"_on_{name}")(code, offset, None)
+        await task
+
+    asyncio.run(go())
+
+
+def test_logger_materializes_buffered_events():
+    logger = AsyncFlowLogger(files=[__file__])
+    yield_offset = next(s for s, _, line in _sleeper.__code__.co_lines() if line)
+    _drive(logger, [("resume", 0), ("yield", yield_offset), ("return", 0)])
+
+    events = logger.events
+    assert [e["event"] for e in events] == ["SPAWN", "RESUME", "SUSPEND", "RETURN", "DONE"]
+    assert {e["coro"] for e in events} == {"_sleeper"}
+    assert events[0]["detail"].startswith("by ")
+    assert events[-1]["detail"] == "'ok'"
+    assert events[1]["line"] is None
+    assert events[2]["line"] == logger._line_of(_sleeper.__code__, yield_offset)
+    assert events[2]["line"] is not None
+    assert all(isinstance(e["t_ms"], float) for e in events)
+
+
+def test_logger_line_table_matches_co_lines():
+    logger = AsyncFlowLogger(files=[__file__])
+    code = _sleeper.__code__
+    for start, end, lineno in code.co_lines():
+        for offset in range(start, end, 2):
+            expected = -1 if lineno is None else lineno
+            assert logger._line_of(code, offset) == expected
+
+
+def test_logger_batches_on_event_calls():
+    seen = []
+    logger = AsyncFlowLogger(files=[__file__], on_event=seen.append, flush_ms=10_000)
+    _drive(logger, [("resume", 0)] * 5)
+    # Only the first event falls outside the flush window; the rest are held
+    # until an explicit flush.
+    assert len(seen) == 1
+    batch = logger.flush()
+    assert len(batch) == logger.recorded - 1
+    assert len(seen) == logger.recorded
+    assert logger.flush() == []
+
+
+def test_logger_ring_keeps_most_recent_events():
+    logger = AsyncFlowLogger(files=[__file__], max_events=3)
+    _drive(logger, [("resume", 0)] * 10)
+
+    events = logger.events
+    assert len(events) == 3
+    assert [e["event"] for e in events] == ["RESUME", "RESUME", "DONE"]
+    assert logger.recorded == 12
+    assert logger.dropped == 9
+    assert events[-1]["detail"] == "'ok'"
+
+
+def test_logger_rejects_non_positive_max_events():
+    with pytest.raises(ValueError, match="max_events"):
+        AsyncFlowLogger(files=[], max_events=0)
+
+
+def _ev(t_ms, coro, event, task, line=None, detail=None):
+    return {"t_ms": t_ms, "coro": coro, "event": event, "task": task, "line": line, "detail": detail}
+
+
+# main spawns two workers; worker A waits 30ms at line 5, worker B is queued
+# for 2ms behind A, then waits 10ms at line 5 and 20ms at line 7; main waits
+# on both at line 12.
+TRACE = [
+    _ev(0.0, "main", "SPAWN", "T0", detail="by root"),
+    _ev(0.0, "main", "RESUME", "T0", detail="start"),
+    _ev(2.0, "main", "SUSPEND", "T0", line=12),
+    _ev(2.0, "worker", "SPAWN", "T1", detail="by T0"),
+    _ev(2.0, "worker", "SPAWN", "T2", detail="by T0"),
+    _ev(2.0, "worker", "RESUME", "T1", detail="start"),
+    _ev(4.0, "worker", "SUSPEND", "T1", line=5),
+    _ev(4.0, "worker", "RESUME", "T2", detail="start"),
+    _ev(5.0, "worker", "SUSPEND", "T2", line=5),
+    _ev(15.0, "worker", "RESUME", "T2"),
+    _ev(16.0, "worker", "SUSPEND", "T2", line=7),
+    _ev(34.0, "worker", "RESUME", "T1"),
+    _ev(36.0, "worker", "DONE", "T1"),
+    _ev(36.0, "worker", "RESUME", "T2"),
+    _ev(38.0, "worker", "DONE", "T2"),
+    _ev(38.0, "main", "RESUME", "T0"),
+    _ev(40.0, "main", "DONE", "T0"),
+]
+
+
+def _flow(events, now_ms=40.0):
+    flow = AsyncFlow()
+    flow.events = events
+    flow.now_ms = now_ms
+    return flow
+
+
+def test_coroutine_stats_split_running_and_suspended():
+    stats = {row["coro"]: row for row in _flow(TRACE).coroutine_stats()}
+    assert stats["main"] == {
+        "coro": "main", "tasks": 1, "wall_ms": 40.0, "running_ms": 4.0, "suspended_ms": 36.0,
+    }
+    worker = stats["worker"]
+    assert worker["tasks"] == 2
+    assert worker["wall_ms"] == 34.0 + 36.0
+    assert worker["running_ms"] == (2 + 2) + (1 + 1 + 2)
+    assert worker["suspended_ms"] == 30 + (10 + 20)
+    # T2's 2ms in the ready queue is neither running nor suspended.
+    assert worker["running_ms"] + worker["suspended_ms"] == worker["wall_ms"] - 2
+
+
+def test_slowest_awaits_group_by_line():
+    sites = _flow(TRACE).slowest_awaits()
+    assert [(s["coro"], s["line"]) for s in sites] == [
+        ("worker", 5), ("main", 12), ("worker", 7),
+    ]
+    assert sites[0] == {
+        "coro": "worker", "line": 5, "count": 2,
+        "total_ms": 40.0, "mean_ms": 20.0, "max_ms": 30.0,
+    }
+    assert len(_flow(TRACE).slowest_awaits(n=1)) == 1
+
+
+def test_max_concurrency_counts_live_tasks():
+    assert _flow(TRACE).max_concurrency() == 3
+    # Back-to-back tasks never overlap.
+    serial = [
+        _ev(0.0, "a", "SPAWN", "T1"), _ev(5.0, "a", "DONE", "T1"),
+        _ev(5.0, "b", "SPAWN", "T2"), _ev(9.0, "b", "DONE", "T2"),
+    ]
+    assert _flow(serial, now_ms=9.0).max_concurrency() == 1
+
+
+def test_utilization_bins_running_time():
+    util = _flow(TRACE).utilization(bin_ms=10)
+    assert util["t_ms"] == [0.0, 10.0, 20.0, 30.0]
+    # 0-10ms: main 0-2, T1 2-4, T2 4-5; T2's wait in the ready queue is idle.
+    assert util["busy"][0] == pytest.approx(0.5)
+    assert util["busy"][1] == pytest.approx(0.1)
+    assert util["busy"][2] == 0.0
+    assert util["busy"][3] == pytest.approx(0.6)
+
+
+def test_utilization_counts_overlapping_runs_once():
+    events = [
+        _ev(0.0, "a", "RESUME", "T1"), _ev(6.0, "a", "SUSPEND", "T1", line=3),
+        _ev(2.0, "b", "RESUME", "T2"), _ev(5.0, "b", "SUSPEND", "T2", line=3),
+        _ev(8.0, "b", "RESUME", "T2"), _ev(9.0, "b", "DONE", "T2"),
+    ]
+    util = _flow(events, now_ms=10.0).utilization(bin_ms=10)
+    assert util["busy"] == [pytest.approx(0.7)]
+
+
+def test_open_tasks_run_until_now():
+    events = [_ev(0.0, "a", "SPAWN", "T1"), _ev(1.0, "a", "SUSPEND", "T1", line=3)]
+    flow = _flow(events, now_ms=11.0)
+    assert flow.coroutine_stats()[0]["suspended_ms"] == 10.0
+    assert flow.slowest_awaits()[0]["max_ms"] == 10.0
+
+
+def test_analytics_on_empty_trace():
+    flow = _flow([], now_ms=0.0)
+    assert flow.coroutine_stats() == []
+    assert flow.slowest_awaits() == []
+    assert flow.max_concurrency() == 0
+    assert flow.utilization() == {"t_ms": [], "busy": []}
+
+
+def test_utilization_rejects_bad_bin():
+    with pytest.raises(ValueError, match="bin_ms"):
+        _flow(TRACE).utilization(bin_ms=-1)
+
+
+def test_sync_sends_only_new_events_including_thread_ones():
+    flow = AsyncFlow()
+    sent = []
+    flow.send = lambda msg, buffers=None: sent.append(msg)
+    logger = AsyncFlowLogger(files=[__file__])
+    logger._t0 = time.perf_counter()
+    coro = logger._ring.intern("main")
+    logger._record(coro, _SPAWN, "T0")
+    job = logger._ring.intern("load")
+    logger._thread_events.append((time.perf_counter(), _START, job, "pool_0", "job 1"))
+
+    flow._sync(logger)
+    assert [e["event"] for e in sent[-1]["events"]] == ["SPAWN", "START"]
+    flow._sync(logger)
+    assert len(sent) == 1
+
+    logger._record(coro, _DONE, "T0")
+    flow._sync(logger)
+    assert [e["event"] for e in sent[-1]["events"]] == ["DONE"]
+    assert [e["event"] for e in flow.events] == ["SPAWN", "START", "DONE"]
+
+
+def test_resync_request_sends_the_full_list():
+    flow = _flow(TRACE)
+    sent = []
+    flow.send = lambda msg, buffers=None: sent.append(msg)
+    flow._handle_message(flow, {"type": "resync"}, [])
+    assert sent == [{"type": "events", "events": TRACE, "reset": True}]
+
+
+def test_logger_flags_runs_longer_than_block_ms():
+    logger = AsyncFlowLogger(files=[__file__], block_ms=0)
+    _drive(logger, [("resume", 0), ("yield", 0), ("yield", 0), ("resume", 0), ("return", 0)])
+
+    kinds = [e["event"] for e in logger.events]
+    # The second yield has no open run, so only two runs are checked.
+    assert kinds.count("BLOCK") == 2
+    assert kinds.index("BLOCK") == kinds.index("SUSPEND") + 1
+    assert len(logger.blocks) == 2
+    assert logger.blocks[0]["coro"] == "_sleeper"
+    assert logger.events[kinds.index("BLOCK")]["detail"].startswith("blocked ")
+
+    (site,) = logger.blocking_calls()
+    assert site["count"] == 2
+    assert site["max_ms"] == max(b["duration_ms"] for b in logger.blocks)
+
+
+def test_logger_flags_blocking_before_the_first_await():
+    logger = AsyncFlowLogger(files=[__file__], block_ms=20)
+    # The first step of a task is a PY_START, never a PY_RESUME.
+    _drive(logger, [("start", 0), ("sleep", 0.05), ("yield", 0), ("resume", 0), ("return", 0)])
+
+    (block,) = logger.blocks
+    assert block["duration_ms"] >= 20
+    assert [e["event"] for e in logger.events].count("BLOCK") == 1
+
+
+def test_inner_return_does_not_end_the_run():
+    logger = AsyncFlowLogger(files=[__file__], block_ms=20)
+    # An awaited coroutine returns into its caller, which keeps the loop.
+    steps = [("start", 0), ("start", 0), ("return", 0), ("sleep", 0.05), ("yield", 0)]
+    _drive(logger, steps + [("resume", 0), ("return", 0)])
+
+    (block,) = logger.blocks
+    assert block["duration_ms"] >= 50
+
+
+def test_block_span_excludes_flush_io():
+    def slow_sink(event):
+        time.sleep(0.05)
+
+    logger = AsyncFlowLogger(files=[__file__], block_ms=30, flush_ms=0, on_event=slow_sink)
+    # Each _record() flushes and sleeps 50ms in on_event; none of that is
+    # time the coroutine held the loop.
+    _drive(logger, [("resume", 0), ("yield", 0)])
+    assert logger.blocks == []
+
+
+async def _sleeps_without_awaiting():
+    time.sleep(0.05)
+    return "done"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="needs sys.monitoring")
+def test_logger_flags_await_free_coroutine():
+    async def go():
+        async with AsyncFlowLogger(files=[__file__], block_ms=20) as logger:
+            await asyncio.create_task(_sleeps_without_awaiting())
+        return logger
+
+    logger = asyncio.run(go())
+    assert [b["coro"] for b in logger.blocks] == ["_sleeps_without_awaiting"]
+
+
+async def _step():
+    return 1
+
+
+async def _blocks_after_awaiting_a_step():
+    await _step()
+    time.sleep(0.05)
+    await asyncio.sleep(0)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="needs sys.monitoring")
+def test_logger_flags_blocking_after_an_awaited_coroutine_returns():
+    async def go():
+        async with AsyncFlowLogger(files=[__file__], block_ms=20) as logger:
+            # Spawning _step once makes it a tracked coroutine.
+            await asyncio.create_task(_step())
+            await asyncio.create_task(_blocks_after_awaiting_a_step())
+        return logger
+
+    logger = asyncio.run(go())
+    assert [b["coro"] for b in logger.blocks] == ["_blocks_after_awaiting_a_step"]
+
+
+def test_logger_ignores_runs_under_block_ms():
+    logger = AsyncFlowLogger(files=[__file__], block_ms=60_000)
+    _drive(logger, [("resume", 0), ("yield", 0)])
+    assert logger.blocks == []
+    assert "BLOCK" not in [e["event"] for e in logger.events]
+
+
+BLOCKED = TRACE[:7] + [
+    _ev(4.0, "worker", "BLOCK", "T1", line=5, detail="blocked 2.0ms since line 3"),
+] + TRACE[7:15] + [
+    _ev(38.0, "worker", "BLOCK", "T2", line=9, detail="blocked 2.0ms since line 7"),
+] + TRACE[15:]
+
+
+def test_flow_blocking_calls_rank_sites():
+    sites = _flow(BLOCKED).blocking_calls()
+    assert [(s["coro"], s["line"]) for s in sites] == [("worker", 5), ("worker", 9)]
+    assert sites[0] == {
+        "coro": "worker", "line": 5, "count": 1, "total_ms": 2.0, "max_ms": 2.0,
+        "from_line": 3, "t_ms": 2.0,
+    }
+
+
+def test_block_events_do_not_change_timings():
+    assert _flow(BLOCKED).coroutine_stats() == _flow(TRACE).coroutine_stats()
+    assert _flow(BLOCKED).slowest_awaits() == _flow(TRACE).slowest_awaits()
+
+
+def _slices(trace):
+    """Pair B/E events per thread into (tid, name, start_us, end_us)."""
+    open_, out = {}, []
+    for e in trace:
+        if e["ph"] == "B":
+            open_[e["tid"]] = e
+        elif e["ph"] == "E":
+            b = open_.pop(e["tid"])
+            out.append((b["tid"], b["name"], b["ts"], e["ts"]))
+    assert not open_
+    return out
+
+
+def test_to_chrome_trace_writes_task_slices(tmp_path):
+    path = _flow(BLOCKED).to_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads(path.read_text())
+
+    names = {e["tid"]: e["args"]["name"] for e in trace if e.get("name") == "thread_name"}
+    assert sorted(names.values()) == ["main (T0)", "worker (T1)", "worker (T2)"]
+    tid = {v.split(" ")[1][1:-1]: k for k, v in names.items()}
+
+    slices = _slices(trace)
+    assert (tid["T1"], "await line 5", 4000, 34000) in slices
+    assert (tid["T0"], "main", 38000, 40000) in slices
+    blocks = [e for e in trace if e["ph"] == "X"]
+    assert [(b["tid"], b["ts"], b["dur"]) for b in blocks] == [
+        (tid["T1"], 2000, 2000), (tid["T2"], 36000, 2000),
+    ]
+    assert sum(e["ph"] == "i" for e in trace) == 3
+
+
+def test_to_chrome_trace_closes_open_tasks_at_now(tmp_path):
+    events = [_ev(0.0, "a", "SPAWN", "T1"), _ev(1.0, "a", "SUSPEND", "T1", line=3)]
+    path = _flow(events, now_ms=11.0).to_chrome_trace(tmp_path / "trace.json")
+    assert _slices(json.loads(path.read_text()))[-1][1:] == ("await line 3", 1000, 11000)
+
+
+def test_chrome_trace_writer_streams_batches(tmp_path):
+    buf = io.StringIO()
+    writer = _ChromeTraceWriter(buf)
+    writer.write(TRACE[:6])
+    # Mid-run the array is unterminated, which trace viewers accept.
+    partial = buf.getvalue()
+    assert partial.startswith("[") and not partial.rstrip().endswith("]")
+    writer.write(TRACE[6:])
+    writer.close(40.0)
+
+    whole = _flow(TRACE).to_chrome_trace(tmp_path / "trace.json")
+    assert json.loads(buf.getvalue()) == json.loads(whole.read_text())
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="needs sys.monitoring")
+def test_logger_streams_trace_file(tmp_path):
+    path = tmp_path / "live.json"
+
+    async def go():
+        async with AsyncFlowLogger(files=[__file__], trace_path=path) as logger:
+            await asyncio.create_task(_sleeper())
+        return logger
+
+    logger = asyncio.run(go())
+    trace = json.loads(path.read_text())
+    assert any(e.get("name") == "_sleeper" for e in trace)
+    assert len(logger.events) > 0
+
+
+def _blocking_work(x):
+    time.sleep(0.01)
+    return x
+
+
+def _run_with_executor_hook(logger, body):
+    async def go():
+        loop = asyncio.get_running_loop()
+        logger._t0 = time.perf_counter()
+        logger._hook_executor(loop)
+        try:
+            return await body(loop)
+        finally:
+            logger._unhook_executor(loop)
+            assert "run_in_executor" not in vars(loop)
+
+    return asyncio.run(go())
+
+
+def test_logger_captures_executor_jobs_on_thread_lanes():
+    logger = AsyncFlowLogger(files=[__file__])
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pool")
+
+    async def body(loop):
+        return await asyncio.gather(
+            asyncio.to_thread(_blocking_work, 1),
+            loop.run_in_executor(pool, _blocking_work, 2),
+            loop.run_in_executor(pool, _blocking_work, 3),
+        )
+
+    assert _run_with_executor_hook(logger, body) == [1, 2, 3]
+    pool.shutdown()
+
+    events = logger.events
+    assert [e["event"] for e in events].count("SUBMIT") == 3
+    assert {e["coro"] for e in events} == {"_blocking_work"}
+    starts = [e for e in events if e["event"] == "START"]
+    finishes = [e for e in events if e["event"] == "FINISH"]
+    assert len(starts) == len(finishes) == 3
+    assert {e["detail"] for e in finishes} == {"ok"}
+    # Both pool jobs ran on the single "pool" worker, one after the other.
+    pool_starts = [e for e in starts if e["task"].startswith("pool")]
+    assert len({e["task"] for e in pool_starts}) == 1
+    assert all("queued" in e["detail"] and "on thread" in e["detail"] for e in starts)
+
+
+def test_logger_records_executor_job_failures():
+    logger = AsyncFlowLogger(files=[__file__])
+
+    def boom():
+        raise KeyError("x")
+
+    async def body(loop):
+        with pytest.raises(KeyError):
+            await loop.run_in_executor(None, boom)
+
+    _run_with_executor_hook(logger, body)
+    (finish,) = [e for e in logger.events if e["event"] == "FINISH"]
+    assert finish["detail"] == "raised KeyError"
+    assert finish["coro"].endswith("boom")
+
+
+def test_logger_passes_process_pools_through():
+    class InlineExecutor(Executor):
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_result(fn(*args))
+            return future
+
+    logger = AsyncFlowLogger(files=[__file__])
+
+    async def body(loop):
+        return await loop.run_in_executor(InlineExecutor(), _blocking_work, 5)
+
+    assert _run_with_executor_hook(logger, body) == 5
+    assert logger.events == []
+
+
+EXECUTOR_TRACE = TRACE[:3] + [
+    _ev(2.5, "load", "SUBMIT", "T1", detail="job 1"),
+    _ev(2.5, "load", "SUBMIT", "T1", detail="job 2"),
+    _ev(3.0, "load", "START", "pool_0", detail="job 1 queued 0.5ms on thread 11"),
+    _ev(13.0, "load", "FINISH", "pool_0", detail="ok"),
+    _ev(13.0, "load", "START", "pool_0", detail="job 2 queued 10.5ms on thread 11"),
+    _ev(23.0, "load", "FINISH", "pool_0", detail="ok"),
+] + TRACE[3:]
+
+
+def test_executor_stats_per_thread():
+    (row,) = _flow(EXECUTOR_TRACE).executor_stats()
+    assert row == {
+        "thread": "pool_0", "thread_id": 11, "jobs": 2, "busy_ms": 20.0, "busy": 0.5,
+        "queued_ms": 11.0, "max_queued_ms": 10.5,
+    }
+
+
+def test_executor_events_stay_out_of_loop_analytics():
+    flow, plain = _flow(EXECUTOR_TRACE), _flow(TRACE)
+    assert flow.coroutine_stats() == plain.coroutine_stats()
+    assert flow.max_concurrency() == plain.max_concurrency()
+    assert flow.utilization(bin_ms=10) == plain.utilization(bin_ms=10)
+
+
+def test_chrome_trace_puts_executor_jobs_on_thread_tracks(tmp_path):
+    path = _flow(EXECUTOR_TRACE).to_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads(path.read_text())
+    names = {e["tid"]: e["args"]["name"] for e in trace if e.get("name") == "thread_name"}
+    pool = next(tid for tid, name in names.items() if name == "pool_0")
+    assert [s[1:] for s in _slices(trace) if s[0] == pool] == [
+        ("load", 3000, 13000), ("load", 13000, 23000),
+    ]
+    assert sum(e.get("name") == "submit load" for e in trace) == 2
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from wigglystuff import EdgeDraw
 
@@ -58,3 +59,54 @@ def test_init_accepts_links_and_directed():
     assert widget.links == [{"source": "A", "target": "B"}, {"source": "B", "target": "C"}]
     assert widget.directed is False
     assert widget.get_adjacency_matrix()[0, 1] == 1
+
+
+def test_index_is_rebuilt_when_links_or_names_change():
+    widget = EdgeDraw(names=["A", "B", "C"], links=[("A", "B")])
+    assert widget.get_neighbors("A") == ["B"]
+
+    widget.links = [("A", "C")]
+    assert widget.get_neighbors("A") == ["C"]
+
+    widget.names = ["C", "A"]
+    np.testing.assert_array_equal(widget.get_adjacency_matrix(directed=True), [[0, 0], [1, 0]])
+
+
+def test_has_cycle_is_iterative():
+    n = 5000
+    chain = [(str(i), str(i + 1)) for i in range(n - 1)]
+    widget = EdgeDraw(names=[str(i) for i in range(n)], links=chain)
+    assert widget.has_cycle(directed=True) is False
+    assert widget.has_cycle(directed=False) is False
+
+    widget.links = chain + [(str(n - 1), "0")]
+    assert widget.has_cycle(directed=True) is True
+    assert EdgeDraw(names=["A"], links=[("A", "A")]).has_cycle(directed=True) is True
+
+
+def test_topological_sort():
+    widget = EdgeDraw(names=["C", "B", "A", "D"], links=[("A", "B"), ("B", "C")])
+    assert widget.topological_sort() == ["A", "D", "B", "C"]
+
+    widget.links = [("A", "B"), ("B", "A")]
+    with pytest.raises(ValueError, match="cycle"):
+        widget.topological_sort()
+
+
+def test_connected_components():
+    widget = EdgeDraw(names=["A", "B", "C", "D", "E"], links=[("B", "A"), ("D", "C")])
+    assert widget.connected_components() == [["A", "B"], ["C", "D"], ["E"]]
+
+
+def test_shortest_path_and_distances():
+    widget = EdgeDraw(
+        names=["A", "B", "C", "D", "E"],
+        links=[("A", "B"), ("B", "C"), ("C", "D"), ("A", "D")],
+    )
+    assert widget.shortest_path("A", "D") == ["A", "D"]
+    assert len(widget.shortest_path("D", "B")) == 3
+    assert widget.shortest_path("D", "B", directed=True) is None
+    assert widget.shortest_path("A", "E") is None
+    assert widget.distances("B", directed=True) == {"B": 0, "C": 1, "D": 2}
+    with pytest.raises(ValueError, match="Unknown node"):
+        widget.distances("Z")
@@ -0,0 +1,222 @@
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from wigglystuff import FramePlayer
+from wigglystuff import frame_player
+
+
+def _images(n):
+    return [Image.new("RGB", (4, 4), (i * 10 % 255, 0, 0)) for i in range(n)]
+
+
+def _collect(player):
+    sent = []
+    player.send = lambda msg, buffers=None: sent.append(msg)
+    return sent
+
+
+def test_only_the_starting_frame_is_encoded_up_front(monkeypatch):
+    calls = []
+    original = frame_player._encode_frame
+    monkeypatch.setattr(frame_player, "_encode_frame", lambda f: calls.append(f) or original(f))
+
+    images = _images(100)
+    player = FramePlayer(images, value=5)
+
+    assert player.n_frames == 100
+    assert calls == [images[5]]
+
+
+def test_bad_starting_frame_fails_fast(tmp_path):
+    with pytest.raises(OSError):
+        FramePlayer([tmp_path / "missing.png"])
+
+    player = FramePlayer(_images(3))
+    with pytest.raises(OSError):
+        player.set_frames([tmp_path / "missing.png"])
+    assert player.n_frames == 3
+
+
+def test_failed_frames_are_reported_to_the_browser(tmp_path):
+    player = FramePlayer([*_images(2), tmp_path / "missing.png"])
+    sent = _collect(player)
+
+    player._handle_message(player, {"type": "frames", "indices": [1, 2], "generation": 0})
+
+    (msg,) = sent
+    assert sorted(msg["frames"]) == ["1"]
+    assert list(msg["errors"]) == ["2"] and "missing.png" in msg["errors"]["2"]
+    assert list(player.errors) == [2]
+
+
+def test_requested_window_is_encoded_and_sent():
+    player = FramePlayer(_images(10))
+    sent = _collect(player)
+
+    player._handle_message(player, {"type": "frames", "indices": [2, 3, 99], "generation": 4})
+
+    (msg,) = sent
+    assert msg["generation"] == 4
+    assert sorted(msg["frames"]) == ["2", "3"]
+    assert msg["frames"]["2"].startswith("data:image/png;base64,")
+
+
+def test_encoding_runs_on_worker_threads_and_is_cached():
+    threads = []
+    images = _images(6)
+
+    def frame(i):
+        threads.append(threading.current_thread().name)
+        return images[i]
+
+    player = FramePlayer(frame, n_frames=6)
+    threads.clear()
+    first = player.encode(range(6))
+    again = player.encode([0, 1])
+
+    assert len(threads) == 5
+    assert all(name.startswith("frame-player") for name in threads)
+    assert again == {0: first[0], 1: first[1]}
+
+
+def test_callable_frames_are_built_one_at_a_time(monkeypatch):
+    monkeypatch.setattr(frame_player, "ENCODE_WORKERS", 4)
+    images = _images(8)
+    running = []
+    overlap = []
+
+    def frame(i):
+        running.append(i)
+        overlap.append(len(running))
+        time.sleep(0.01)
+        running.remove(i)
+        return images[i]
+
+    player = FramePlayer(frame, n_frames=8)
+    player.encode(range(8))
+    assert len(overlap) == 8 and max(overlap) == 1
+
+
+def test_callable_needs_n_frames():
+    with pytest.raises(ValueError, match="n_frames"):
+        FramePlayer(lambda i: None)
+
+
+def test_generator_is_pulled_only_as_far_as_needed():
+    pulled = []
+
+    def gen():
+        for i, img in enumerate(_images(50)):
+            pulled.append(i)
+            yield img
+
+    player = FramePlayer(gen(), n_frames=50)
+    assert pulled == [0]
+    player.encode([3])
+    assert pulled == [0, 1, 2, 3]
+
+
+def test_generator_without_n_frames_is_drained():
+    player = FramePlayer(img for img in _images(5))
+    assert player.n_frames == 5
+
+
+def test_set_frames_resets_the_browser_cache():
+    player = FramePlayer(_images(10), value=8)
+    sent = _collect(player)
+    player.encode([0])
+
+    player.set_frames(_images(3))
+
+    assert sent == [{"type": "reset"}]
+    assert player.n_frames == 3 and player.value == 2
+    assert list(player._cache) == [2]
+
+
+def test_empty_frames_rejected():
+    with pytest.raises(ValueError, match="at least one frame"):
+        FramePlayer([])
+
+
+def test_encodes_inline_when_threads_are_unavailable(monkeypatch):
+    player = FramePlayer(_images(3))
+
+    def no_threads(*args, **kwargs):
+        raise RuntimeError("can't start new thread")
+
+    monkeypatch.setattr(player._pool, "submit", no_threads)
+    assert sorted(player.encode([0, 2])) == [0, 2]
+
+
+def _moving_dot(n, size=64):
+    frames = []
+    for i in range(n):
+        img = Image.new("RGB", (size, size), (240, 240, 240))
+        img.paste((200, 0, 0), (i, 20, i + 4, 24))
+        frames.append(img)
+    return frames
+
+
+def _decode(payload, keyframes):
+    import base64
+    from io import BytesIO
+
+    import numpy as np
+
+    def pixels(uri):
+        raw = base64.b64decode(uri.split("base64,")[1])
+        return np.asarray(Image.open(BytesIO(raw)).convert("RGBA"))
+
+    if "base" not in payload:
+        return pixels(payload["uri"])
+    out = keyframes[payload["base"]].copy()
+    if "uri" in payload:
+        patch = pixels(payload["uri"])
+        out[payload["y"] : payload["y"] + patch.shape[0], payload["x"] : payload["x"] + patch.shape[1]] = patch
+    return out
+
+
+def test_delta_encoding_rebuilds_frames_from_keyframe_patches():
+    import numpy as np
+
+    frames = _moving_dot(12)
+    frames[7] = frames[5]  # unchanged region only
+    player = FramePlayer(frames, encoding="delta", keyframe_interval=5)
+    encoded = player.encode(range(12))
+
+    assert "base" not in encoded[0] and "base" not in encoded[5]
+    assert encoded[3]["base"] == 0 and encoded[8]["base"] == 5
+    keyframes = {k: _decode(encoded[k], {}) for k in (0, 5, 10)}
+    for i, img in enumerate(frames):
+        assert np.array_equal(_decode(encoded[i], keyframes), np.asarray(img.convert("RGBA")))
+
+
+def test_delta_payload_is_much_smaller_for_static_backgrounds():
+    import numpy as np
+
+    noise = np.random.default_rng(0).integers(0, 255, (256, 256, 3), dtype=np.uint8)
+    frames = []
+    for i in range(30):
+        img = Image.fromarray(noise)
+        img.paste((200, 0, 0), (i, 20, i + 4, 24))
+        frames.append(img)
+    png = FramePlayer(frames).encode(range(30))
+    delta = FramePlayer(frames, encoding="delta", keyframe_interval=30).encode(range(30))
+
+    png_size = sum(len(uri) for uri in png.values())
+    delta_size = sum(len(entry.get("uri", "")) for entry in delta.values())
+    assert delta_size * 10 < png_size
+
+
+def test_changing_encoding_resets_the_browser():
+    player = FramePlayer(_images(4))
+    sent = _collect(player)
+    player.encode([0])
+
+    player.encoding = "delta"
+
+    assert sent == [{"type": "reset"}] and player._cache == {}
+    assert isinstance(player.encode([1])[1], dict)
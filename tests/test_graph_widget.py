@@ -1,3 +1,5 @@
+import sys
+
 import numpy as np
 import pytest
 
@@ -223,3 +225,258 @@ def test_hovered_node_defaults_to_none_and_can_be_set():
     widget.hovered_node = "A"
     assert widget.hovered_node == "A"
 
+
+
+def _fresh_index(widget):
+    from wigglystuff.graph_widget import _GraphIndex
+
+    return _GraphIndex(widget.nodes, widget.edges)
+
+
+def test_sparse_adjacency_matches_dense():
+    pytest.importorskip("scipy")
+    widget = GraphWidget(
+        nodes=["A", "B", "C", "D"],
+        edges=[("A", "B"), ("B", "C"), ("A", "B"), ("D", "A")],
+    )
+
+    for directed in (True, False):
+        dense = widget.get_adjacency_matrix(directed=directed)
+        sparse = widget.get_adjacency_matrix(directed=directed, sparse=True)
+        assert sparse.format == "csr"
+        np.testing.assert_array_equal(sparse.toarray(), dense)
+    # Parallel edges collapse to a single 1.
+    assert widget.get_adjacency_matrix(sparse=True)[0, 1] == 1
+
+
+def test_sparse_adjacency_of_empty_graph():
+    pytest.importorskip("scipy")
+    matrix = GraphWidget().get_adjacency_matrix(sparse=True)
+    assert matrix.shape == (0, 0)
+
+
+def test_index_follows_helpers_incrementally():
+    widget = GraphWidget(nodes=["A", "B", "C"], edges=[("A", "B"), ("B", "C")])
+    index = widget._graph()
+
+    widget.add_node("D")
+    widget.add_edge("C", "D")
+    widget.attach_node("D", "E")
+    widget.attach_node("A", "C", color="red")
+    widget.remove_edge("edge-1")
+    widget.remove_node("B")
+
+    # The same index object was updated in place, not rebuilt...
+    assert widget._graph() is index
+    # ...and agrees with one built from scratch.
+    fresh = _fresh_index(widget)
+    assert index.node_by_id == fresh.node_by_id
+    assert index.edge_by_id == fresh.edge_by_id
+    assert index.incident == fresh.incident
+    assert +index.out_degree == +fresh.out_degree
+    assert +index.in_degree == +fresh.in_degree
+    assert index.out_degree["D"] == 1 and index.in_degree["D"] == 1
+    assert index.node_by_id["C"]["color"] == "red"
+    assert all(index.node_by_id[n["id"]] is n for n in widget.nodes)
+
+
+def test_index_rebuilds_after_traits_are_reassigned():
+    widget = GraphWidget(nodes=["A", "B"], edges=[("A", "B")])
+    old = widget._graph()
+
+    widget.nodes = ["A", "B", "C"]
+    widget.edges = [("B", "C")]
+
+    assert widget._graph() is not old
+    assert widget._graph().in_degree["C"] == 1
+    widget.selected_nodes = ["C", "missing", "A"]
+    assert [n["id"] for n in widget.get_selected_node_data()] == ["A", "C"]
+
+
+def test_helpers_keep_generated_ids_unique():
+    widget = GraphWidget(nodes=[{"id": "node-1"}], edges=[])
+    assert widget.add_node() == "node-1-1"
+    widget.add_edge("node-1", "node-1-1", id="edge-1")
+    assert widget.add_edge("node-1", "node-1-1") == "edge-1-1"
+
+
+def _two_cliques(size=8):
+    left = [f"L{i}" for i in range(size)]
+    right = [f"R{i}" for i in range(size)]
+    edges = [(a, b) for group in (left, right) for i, a in enumerate(group) for b in group[i + 1 :]]
+    return left + right, edges + [("L0", "R0")]
+
+
+@pytest.mark.parametrize("method", ["force", "spectral"])
+def test_compute_layout_separates_clusters(method):
+    nodes, edges = _two_cliques()
+    widget = GraphWidget(nodes=nodes, edges=edges)
+    pos = widget.compute_layout(method)
+
+    assert pos.shape == (16, 2) and pos.dtype == np.float32
+    assert np.abs(pos).max() <= 1.0
+    assert len(widget.positions) == 8 * len(nodes)
+    np.testing.assert_array_equal(np.frombuffer(widget.positions, dtype=np.float32).reshape(-1, 2), pos)
+    left, right = pos[:8], pos[8:]
+    spread = np.linalg.norm(left - left.mean(axis=0), axis=1).mean()
+    assert np.linalg.norm(left.mean(axis=0) - right.mean(axis=0)) > 2 * spread
+
+
+def test_layout_is_cached_by_topology():
+    nodes, edges = _two_cliques()
+    first = GraphWidget(nodes=nodes, edges=edges).compute_layout()
+    second = GraphWidget(nodes=nodes, edges=edges, layout="force")
+
+    assert second.compute_layout() is first
+    assert second.positions == first.tobytes()
+    assert GraphWidget(nodes=nodes, edges=edges[:-1]).compute_layout() is not first
+
+
+def test_positions_clear_when_topology_changes():
+    widget = GraphWidget(nodes=["A", "B", "C"], edges=[("A", "B")], layout="spectral")
+    assert len(widget.positions) == 24
+
+    widget.add_edge("B", "C")
+    assert widget.positions == b""
+
+
+def test_force_layout_handles_large_graphs():
+    from wigglystuff._graph_layout import EXACT_REPULSION_LIMIT, force_layout
+
+    rng = np.random.default_rng(0)
+    n = EXACT_REPULSION_LIMIT * 2
+    pos = force_layout(n, rng.integers(0, n, 3 * n), rng.integers(0, n, 3 * n), iterations=5)
+    assert pos.shape == (n, 2) and np.isfinite(pos).all()
+
+
+def test_large_layouts_without_scipy_skip_the_dense_solve(monkeypatch):
+    from wigglystuff._graph_layout import DENSE_SPECTRAL_LIMIT, force_layout, spectral_layout
+
+    monkeypatch.setitem(sys.modules, "scipy.sparse.linalg", None)
+    n = DENSE_SPECTRAL_LIMIT + 1
+    src, dst = np.arange(n), (np.arange(n) + 1) % n
+    with pytest.raises(ImportError, match="scipy"):
+        spectral_layout(n, src, dst)
+    pos = force_layout(n, src, dst, iterations=2)
+    assert pos.shape == (n, 2) and np.isfinite(pos).all()
+
+
+def test_compute_layout_rejects_unknown_method():
+    with pytest.raises(ValueError, match="Unknown layout"):
+        GraphWidget(nodes=["A"]).compute_layout("circular")
+
+
+def _communities(count=10, size=20, seed=0):
+    rng = np.random.default_rng(seed)
+    pairs = rng.integers(0, size, (count, 4 * size, 2)) + (np.arange(count) * size)[:, None, None]
+    return [str(i) for i in range(count * size)], pairs.reshape(-1, 2).tolist()
+
+
+def test_max_nodes_clusters_before_first_sync():
+    nodes, edges = _communities()
+    widget = GraphWidget(nodes=nodes, edges=edges, max_nodes=50)
+
+    assert len(widget.nodes) <= 50
+    clusters = [n for n in widget.nodes if n.get("cluster")]
+    assert clusters
+    members = {m for c in clusters for m in widget.cluster_members(c["id"])}
+    plain = {n["id"] for n in widget.nodes if not n.get("cluster")}
+    assert members | plain == set(nodes) and not members & plain
+    assert sum(c["data"]["nodes"] for c in clusters) == len(members)
+
+
+def test_small_graphs_are_not_clustered():
+    widget = GraphWidget(nodes=["A", "B"], edges=[("A", "B")], max_nodes=50)
+    assert [n["id"] for n in widget.nodes] == ["A", "B"]
+
+
+def test_expand_and_collapse_via_messages():
+    nodes, edges = _communities()
+    widget = GraphWidget(nodes=nodes, edges=edges)
+    widget.cluster(max_nodes=20)
+    before = len(widget.nodes)
+    cluster = next(n["id"] for n in widget.nodes if n.get("cluster"))
+    members = widget.cluster_members(cluster)
+
+    widget._handle_message(widget, {"type": "expand", "id": cluster}, [])
+    ids = {n["id"] for n in widget.nodes}
+    assert cluster not in ids and set(members) <= ids
+    # Original edges between now-visible nodes come back untouched.
+    inner = {e["id"] for e in widget.edges if e["source"] in members and e["target"] in members}
+    assert inner and all(not e["id"].startswith("cluster-edge") for e in widget.edges if e["id"] in inner)
+
+    widget._handle_message(widget, {"type": "collapse", "id": members[0]}, [])
+    assert len(widget.nodes) == before and cluster in {n["id"] for n in widget.nodes}
+    assert not widget.expand("not-a-cluster")
+
+
+def test_collapse_inside_a_folded_cluster_is_a_no_op():
+    nodes, edges = _communities()
+    widget = GraphWidget(nodes=nodes, edges=edges, max_nodes=3)
+    before = [n["id"] for n in widget.nodes]
+    # "5"'s own cluster sits inside a visible, larger one.
+    assert "5" not in before and widget._lod.parent["5"] not in before
+
+    assert not widget.collapse("5")
+    assert [n["id"] for n in widget.nodes] == before
+
+
+def test_selected_nodes_resolve_to_original_ids():
+    nodes, edges = _communities()
+    widget = GraphWidget(nodes=nodes, edges=edges, max_nodes=20)
+    cluster = next(n["id"] for n in widget.nodes if n.get("cluster"))
+
+    widget.selected_nodes = [cluster, "0"]
+    assert cluster not in widget.selected_nodes
+    assert set(widget.selected_nodes) == set(widget.cluster_members(cluster)) | {"0"}
+    assert {n["id"] for n in widget.get_selected_node_data()} == set(widget.selected_nodes)
+
+
+def test_aggregated_edges_count_original_edges():
+    nodes, edges = _two_cliques(5)
+    edges.append(("L1", "R1"))
+    widget = GraphWidget(nodes=nodes, edges=edges, max_nodes=2)
+    assert len(widget.nodes) == 2
+    (edge,) = widget.edges
+    assert edge["data"] == {"edges": 2}
+
+    widget.uncluster()
+    assert len(widget.nodes) == 10 and len(widget.edges) == len(edges)
+
+
+def test_reassigning_nodes_drops_clustering():
+    nodes, edges = _communities()
+    widget = GraphWidget(nodes=nodes, edges=edges, max_nodes=20)
+    widget.nodes = ["x", "y"]
+    widget.edges = []
+    widget.selected_nodes = ["x"]
+    assert widget.selected_nodes == ["x"]
+    with pytest.raises(ValueError):
+        widget.cluster_members("cluster-0-0")
+
+
+def test_editing_helpers_raise_while_clustered():
+    nodes, edges = _communities()
+    widget = GraphWidget(nodes=nodes, edges=edges, max_nodes=20)
+    with pytest.raises(RuntimeError, match="uncluster"):
+        widget.add_node("new")
+    with pytest.raises(RuntimeError, match="uncluster"):
+        widget.add_edge("0", "1")
+    with pytest.raises(RuntimeError, match="uncluster"):
+        widget.remove_edge(0)
+
+    widget.uncluster()
+    widget.add_edge("0", "1", id="extra")
+    assert widget.edges[-1]["id"] == "extra"
+
+
+def test_random_graph_clusters_into_many_mid_sized_communities():
+    rng = np.random.default_rng(0)
+    n = 5000
+    pairs = rng.integers(0, n, (2 * n, 2)).tolist()
+    widget = GraphWidget(nodes=[str(i) for i in range(n)], edges=pairs, max_nodes=100)
+
+    assert len(widget.nodes) <= 100
+    sizes = [node["data"]["nodes"] for node in widget.nodes if node.get("cluster")]
+    assert max(sizes) <= 4 * n / 100
+    assert len(widget.edges) > 100
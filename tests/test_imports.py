@@ -116,7 +116,8 @@ def test_no_unexpected_dependencies():
         d.split(">")[0].split("<")[0].split("=")[0].split("[")[0].strip()
         for d in data["project"]["dependencies"]
     }
-    allowed = {"anywidget", "drawdata"}
+    # numpy backs the Paint canvas.
+    allowed = {"anywidget", "drawdata", "numpy"}
     assert deps == allowed, f"Unexpected dependencies: {deps - allowed}"
 
 
@@ -0,0 +1,151 @@
+import json
+
+import numpy as np
+import pytest
+
+from wigglystuff import ModuleTreeWidget
+from wigglystuff.module_tree import _extract_tree
+
+
+@pytest.fixture
+def nn():
+    return pytest.importorskip("torch").nn
+
+
+def _model(nn, layers=80):
+    class Block(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.norm = nn.LayerNorm(8)
+            self.fc = nn.Linear(8, 8)
+
+    return nn.Sequential(
+        nn.Linear(4, 8),
+        nn.Sequential(*[Block() for _ in range(layers)]),
+        nn.Linear(8, 2),
+    )
+
+
+def test_repeated_blocks_collapse_into_one_template(nn):
+    model = _model(nn)
+    tree = _extract_tree(model)
+
+    stack = tree["children"][1]
+    assert len(stack["children"]) == 1
+    template = stack["children"][0]
+    assert template["repeat"] == 80
+    assert template["name"] == "0–79"
+    assert template["total_param_count"] == 80 * (16 + 72)
+    assert tree["total_param_count"] == sum(p.numel() for p in model.parameters())
+
+
+def test_dedupe_off_keeps_every_block(nn):
+    tree = _extract_tree(_model(nn, 3), dedupe=False)
+    assert [c["name"] for c in tree["children"][1]["children"]] == ["0", "1", "2"]
+
+
+def test_shared_parameters_are_counted_once(nn):
+    first = nn.Linear(4, 4)
+    model = nn.Sequential(first, nn.ReLU())
+    model.tied = first
+    tree = _extract_tree(model)
+
+    tied = tree["children"][-1]
+    assert tied["total_param_count"] == 0
+    assert all(p["is_shared"] for p in tied["params"])
+    assert tree["total_param_count"] == 20
+
+
+def test_widget_sends_parameter_rows_on_request(nn):
+    widget = ModuleTreeWidget(_model(nn, 2))
+    assert "params" not in widget.tree
+    assert widget.tree["children"][0]["param_entries"] == 2
+
+    sent = []
+    widget.send = lambda msg, buffers=None: sent.append(msg)
+    widget._handle_message(widget, {"type": "params", "path": "0"})
+
+    assert sent[0]["path"] == "0"
+    assert [p["name"] for p in sent[0]["params"]] == ["weight", "bias"]
+    assert widget.get_params("missing") == []
+
+
+def test_meta_device_model_is_not_all_shared(nn):
+    torch = pytest.importorskip("torch")
+    with torch.device("meta"):
+        model = _model(nn, 2)
+    tree = _extract_tree(model)
+    assert tree["total_param_count"] == 4 * 8 + 8 + 2 * 88 + 8 * 2 + 2
+    assert tree["total_size_bytes"] == 4 * tree["total_param_count"]
+
+
+def test_state_dict_is_read_without_a_model():
+    state = {
+        "embed.weight": np.zeros((10, 4), dtype=np.float16),
+        "layers.0.fc.weight": np.zeros((4, 4), dtype=np.float32),
+        "layers.1.fc.weight": np.zeros((4, 4), dtype=np.float32),
+    }
+    widget = ModuleTreeWidget(state)
+
+    assert widget.total_param_count == 40 + 32
+    assert widget.total_size_bytes == 80 + 128
+    layers = widget.tree["children"][1]
+    assert layers["name"] == "layers" and layers["children"][0]["repeat"] == 2
+    assert widget.get_params("embed") == [
+        {"name": "weight", "shape": [10, 4], "numel": 40, "trainable": True, "dtype": "float16"}
+    ]
+
+
+def test_safetensors_header_is_read_without_weights(tmp_path):
+    header = {
+        "__metadata__": {"format": "pt"},
+        "encoder.weight": {"dtype": "BF16", "shape": [8, 4], "data_offsets": [0, 64]},
+        "encoder.bias": {"dtype": "BF16", "shape": [8], "data_offsets": [64, 80]},
+        "head.weight": {"dtype": "F32", "shape": [2, 8], "data_offsets": [80, 144]},
+    }
+    raw = json.dumps(header).encode()
+    path = tmp_path / "model.safetensors"
+    path.write_bytes(len(raw).to_bytes(8, "little") + raw + bytes(144))
+
+    widget = ModuleTreeWidget(path)
+
+    assert widget.tree["type"] == "safetensors"
+    assert [c["name"] for c in widget.tree["children"]] == ["encoder", "head"]
+    assert widget.total_param_count == 32 + 8 + 16
+    assert widget.total_size_bytes == 144
+    assert widget.get_params("encoder")[0]["dtype"] == "bfloat16"
+
+
+def test_truncated_safetensors_file_is_rejected(tmp_path):
+    path = tmp_path / "broken.safetensors"
+    path.write_bytes((1000).to_bytes(8, "little") + b"{}")
+    with pytest.raises(ValueError, match="not a safetensors file"):
+        ModuleTreeWidget(path)
+
+
+def test_profile_merges_forward_stats_into_the_tree(nn):
+    torch = pytest.importorskip("torch")
+    model = nn.Sequential(
+        nn.Linear(4, 8),
+        nn.Sequential(*[nn.Linear(8, 8) for _ in range(3)]),
+        nn.Linear(8, 2),
+    )
+    widget = ModuleTreeWidget(model)
+
+    stats = widget.profile(torch.zeros(5, 4))
+
+    first, stack, head = widget.tree["children"]
+    assert first["profile"]["output_shapes"] == [[5, 8]]
+    assert first["profile"]["flops"] == 2 * 5 * 8 * 4
+    assert first["profile"]["activation_bytes"] == 5 * 8 * 4
+    # The folded run of three Linear(8, 8) blocks sums all of them.
+    assert stack["children"][0]["repeat"] == 3
+    assert stack["children"][0]["profile"]["flops"] == 3 * 2 * 5 * 8 * 8
+    assert widget.tree["profile"]["flops"] == sum(stats[p]["flops"] for p in ("0", "1", "2"))
+    assert widget.tree["profile"]["time_ms"] >= head["profile"]["time_ms"] >= 0
+
+
+def test_profile_needs_a_module():
+    widget = ModuleTreeWidget({"w": np.zeros(3, dtype=np.float32)})
+    with pytest.raises(ValueError, match="nn.Module"):
+        widget.profile(None)
@@ -0,0 +1,307 @@
+import threading
+import time
+
+import pytest
+
+from wigglystuff import Neo4jWidget
+from wigglystuff import neo4j_widget
+from wigglystuff.neo4j_widget import _push_down_limit
+
+
+class Node(dict):
+    def __init__(self, element_id, labels=(), **props):
+        super().__init__(props)
+        self.element_id = element_id
+        self.labels = set(labels)
+
+
+class Relationship(dict):
+    def __init__(self, element_id, type, start_node, end_node, **props):
+        super().__init__(props)
+        self.element_id = element_id
+        self.type = type
+        self.start_node = start_node
+        self.end_node = end_node
+
+
+class Record(dict):
+    def values(self):
+        return list(super().values())
+
+
+class Result:
+    def __init__(self, records, gate=None):
+        self._records = records
+        self._gate = gate
+        self.read = 0
+        self.consumed = False
+
+    def __iter__(self):
+        for record in self._records:
+            if self._gate is not None:
+                self._gate.wait(timeout=5)
+            self.read += 1
+            yield record
+
+    def consume(self):
+        self.consumed = True
+
+
+SCHEMA = {
+    "CALL db.labels()": [Record(label="Person")],
+    "CALL db.relationshipTypes()": [Record(relationshipType="KNOWS")],
+    "CALL db.propertyKeys()": [Record(propertyKey="name")],
+}
+
+
+class Session:
+    def __init__(self, driver):
+        self.driver = driver
+        self.closed = False
+
+    def run(self, query, **params):
+        self.driver.queries.append((query, params, threading.current_thread().name))
+        if query in SCHEMA:
+            return Result(SCHEMA[query])
+        if self.driver.fail:
+            raise RuntimeError(self.driver.fail)
+        # Match canned rows without the LIMIT the widget may have pushed
+        # down, but honour it like the server would.
+        base, _, limit = query.partition("\nLIMIT ")
+        base = base.replace("RETURN DISTINCT ", "RETURN ")
+        rows = self.driver.expand.get(params.get("eid")) if "eid" in params else self.driver.rows[base]
+        if limit:
+            rows = rows[: int(limit)]
+        result = Result(rows, gate=self.driver.gates.get(base))
+        self.driver.results.append(result)
+        return result
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Driver:
+    """Stand-in for ``neo4j.Driver`` that serves canned records."""
+
+    def __init__(self):
+        self.sessions = []
+        self.queries = []
+        self.results = []
+        self.rows = {}
+        self.expand = {}
+        self.gates = {}
+        self.fail = None
+
+    def session(self, database=None):
+        session = Session(self)
+        self.sessions.append(session)
+        return session
+
+
+alice = Node("n1", ["Person"], name="Alice")
+bob = Node("n2", ["Person"], name="Bob")
+carol = Node("n3", ["Person"], name="Carol")
+knows = Relationship("r1", "KNOWS", alice, bob)
+likes = Relationship("r2", "LIKES", bob, carol)
+
+
+@pytest.fixture
+def driver():
+    driver = Driver()
+    driver.rows["MATCH people"] = [Record(a=alice, r=knows, b=bob)]
+    driver.rows["MATCH carol"] = [Record(c=carol)]
+    driver.expand["n2"] = [Record(n=bob, r=likes, m=carol), Record(n=bob, r=knows, m=alice)]
+    return driver
+
+
+def _ids(items):
+    return sorted(item["element_id"] for item in items)
+
+
+def test_queries_reuse_one_session_on_a_worker_thread(driver):
+    widget = Neo4jWidget(driver, initial_query="MATCH people")
+    widget.run_query("MATCH carol")
+
+    assert len(driver.sessions) == 1
+    assert {thread for *_, thread in driver.queries} == {"neo4j-widget_0"}
+    assert widget.schema["labels"] == ["Person"]
+    assert _ids(widget.nodes) == ["n3"]
+    assert widget.query_running is False
+
+
+def test_browser_queries_do_not_block(driver):
+    gate = driver.gates["MATCH people"] = threading.Event()
+    widget = Neo4jWidget(driver)
+
+    widget._query_request = {"query": "MATCH people"}
+    assert widget.query_running is True and widget.nodes == []
+
+    gate.set()
+    assert widget.wait(timeout=5)
+    assert _ids(widget.nodes) == ["n1", "n2"]
+    assert _ids(widget.relationships) == ["r1"]
+    assert widget.query_running is False
+
+
+def test_superseded_query_is_cancelled(driver):
+    gate = driver.gates["MATCH people"] = threading.Event()
+    driver.rows["MATCH people"] = driver.rows["MATCH people"] * 3
+    widget = Neo4jWidget(driver)
+
+    widget.run_query("MATCH people", block=False)
+    while not driver.results:  # wait until the slow query is reading records
+        time.sleep(0.001)
+    widget.run_query("MATCH carol", block=False)
+    gate.set()
+    assert widget.wait(timeout=5)
+
+    slow = driver.results[0]
+    assert slow.consumed and slow.read < 3
+    assert _ids(widget.nodes) == ["n3"]
+
+
+def test_queued_query_is_dropped_when_superseded(driver):
+    gate = driver.gates["MATCH people"] = threading.Event()
+    widget = Neo4jWidget(driver)
+
+    widget.run_query("MATCH people", block=False)
+    widget._expand_request = {"element_id": "n2"}
+    widget.run_query("MATCH carol", block=False)
+    gate.set()
+    assert widget.wait(timeout=5)
+
+    assert not any("eid" in params for _, params, _ in driver.queries)
+    assert _ids(widget.nodes) == ["n3"]
+
+
+def test_expand_results_are_cached_per_element_id(driver):
+    widget = Neo4jWidget(driver, initial_query="MATCH people")
+
+    widget._expand_request = {"element_id": "n2"}
+    widget.wait(timeout=5)
+    assert _ids(widget.nodes) == ["n1", "n2", "n3"]
+    assert _ids(widget.relationships) == ["r1", "r2"]
+
+    expands = sum(1 for _, params, _ in driver.queries if "eid" in params)
+    widget.run_query("MATCH people")
+    widget._expand_request = {"element_id": "n2", "nonce": 1}
+    widget.wait(timeout=5)
+    assert sum(1 for _, params, _ in driver.queries if "eid" in params) == expands
+    assert _ids(widget.nodes) == ["n1", "n2", "n3"]
+
+    widget.clear()
+    widget._expand_request = {"element_id": "n2", "nonce": 2}
+    widget.wait(timeout=5)
+    assert sum(1 for _, params, _ in driver.queries if "eid" in params) == expands + 1
+
+
+def test_query_errors_reset_the_session(driver):
+    widget = Neo4jWidget(driver)
+    driver.fail = "syntax error"
+
+    widget.run_query("MATCH broken")
+    assert widget.error == "syntax error"
+    assert driver.sessions[0].closed
+
+    driver.fail = None
+    widget.run_query("MATCH carol")
+    assert widget.error == "" and len(driver.sessions) == 2
+    assert _ids(widget.nodes) == ["n3"]
+
+
+def test_results_stream_to_the_browser_as_deltas(driver, monkeypatch):
+    monkeypatch.setattr(neo4j_widget, "BATCH_SIZE", 2)
+    people = [Node(f"p{i}", ["Person"], name=f"P{i}") for i in range(5)]
+    driver.rows["MATCH (p) RETURN p"] = [Record(p=p) for p in people]
+    widget = Neo4jWidget(driver)
+    sent = []
+    widget.send = lambda msg, buffers=None: sent.append(msg)
+
+    widget.run_query("MATCH (p) RETURN p")
+
+    assert [len(msg["nodes"]) for msg in sent] == [2, 2, 1]
+    assert [msg["reset"] for msg in sent] == [True, False, False]
+    assert [n["element_id"] for msg in sent for n in msg["nodes"]] == [n["element_id"] for n in widget.nodes]
+
+    sent.clear()
+    widget._expand_request = {"element_id": "n2"}
+    widget.wait(timeout=5)
+    # An expansion only streams what is new, and never resets the view.
+    assert {n["element_id"] for msg in sent for n in msg["nodes"]} == {"n1", "n2", "n3"}
+    assert not any(msg["reset"] for msg in sent)
+
+
+def test_node_cap_stops_reading_and_pushes_down_limit(driver):
+    people = [Node(f"p{i}", ["Person"]) for i in range(10)]
+    driver.rows["MATCH (p) RETURN p"] = [Record(p=p) for p in people]
+    widget = Neo4jWidget(driver, max_nodes=3)
+
+    widget.run_query("MATCH (p) RETURN p;")
+
+    assert driver.queries[-1][0] == "MATCH (p) RETURN DISTINCT p\nLIMIT 4"
+    assert len(widget.nodes) == 3
+    assert "truncated to 3 nodes" in widget.error
+    assert driver.results[-1].consumed and driver.results[-1].read == 4
+
+
+def test_rows_with_many_relationships_are_not_cut_by_the_node_cap(driver):
+    a, b = Node("a", ["Person"]), Node("b", ["Person"])
+    rels = [Relationship(f"r{i}", "KNOWS", a, b) for i in range(20)]
+    query = "MATCH (a)-[r]->(b) RETURN a, r, b"
+    driver.rows[query] = [Record(a=a, r=r, b=b) for r in rels]
+    driver.expand["a"] = [Record(n=a, r=r, m=b) for r in rels]
+    widget = Neo4jWidget(driver, max_nodes=10)
+
+    widget.run_query(query)
+    assert driver.queries[-1][0] == query
+    assert len(widget.relationships) == 20 and widget.error == ""
+
+    widget.clear()
+    widget._expand_request = {"element_id": "a"}
+    widget.wait(timeout=5)
+    assert len(widget.relationships) == 20 and widget.error == ""
+    assert len(widget._expand_cache["a"][1]) == 20
+
+
+def test_merges_keep_the_id_index_incremental(driver):
+    widget = Neo4jWidget(driver, initial_query="MATCH people")
+    store = widget._known()
+
+    widget._expand_request = {"element_id": "n2"}
+    widget.wait(timeout=5)
+
+    assert widget._known() is store
+    assert store.node_ids == {"n1", "n2", "n3"} and store.rel_ids == {"r1", "r2"}
+    widget.clear()
+    assert widget._known() is not store and not widget._known().node_ids
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("MATCH (n) RETURN n", "MATCH (n) RETURN DISTINCT n\nLIMIT 5"),
+        ("MATCH (n:Person) RETURN n ORDER BY n.name;", "MATCH (n:Person) RETURN DISTINCT n ORDER BY n.name\nLIMIT 5"),
+        ("MATCH (n)-[r]->(m) RETURN n", "MATCH (n)-[r]->(m) RETURN DISTINCT n\nLIMIT 5"),
+        ("MATCH (n)-[r]->(m) RETURN n, r, m", None),
+        ("MATCH (n)-[r]->(m) RETURN r", None),
+        ("MATCH p = (n)-->(m) RETURN p", None),
+        ("MATCH (n) RETURN n.name", None),
+        ("MATCH (n) RETURN n LIMIT 10", None),
+        ("MATCH (n) RETURN n SKIP 3", None),
+        ("RETURN 1 UNION RETURN 2", None),
+        ("CREATE (n:Person)", None),
+        ("CALL db.labels()", None),
+    ],
+)
+def test_push_down_limit(query, expected):
+    pushed, limit = _push_down_limit(query, 5)
+    if expected is None:
+        assert (pushed, limit) == (query, None)
+    else:
+        assert (pushed, limit) == (expected, 5)
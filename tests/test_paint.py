@@ -0,0 +1,200 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from wigglystuff import Paint
+from wigglystuff.paint import TILE_SIZE, pil_to_base64
+
+
+def _outbox(paint):
+    sent = []
+    paint.send = lambda msg, buffers=None: sent.append((msg, buffers))
+    return sent
+
+
+def _tile(paint, x, y, pixels):
+    h, w = pixels.shape[:2]
+    content = {"type": "tiles", "tiles": [[x, y, w, h]]}
+    paint._handle_message(paint, content, [memoryview(pixels.tobytes())])
+
+
+def test_blank_canvas_is_transparent_array():
+    paint = Paint(width=100, height=70, store_background=False)
+    arr = paint.get_array()
+    assert arr.shape == (70, 100, 4) and arr.dtype == np.uint8
+    assert not arr.any()
+
+
+def test_store_background_composites_onto_white():
+    paint = Paint(width=10, height=10)
+    assert (paint.get_array() == 255).all()
+    _tile(paint, 0, 0, np.array([[[255, 0, 0, 255]]], dtype=np.uint8))
+    assert paint.get_array()[0, 0].tolist() == [255, 0, 0, 255]
+    assert paint.get_pil().mode == "RGBA"
+
+
+def test_tiles_from_browser_update_canvas_in_place():
+    paint = Paint(width=150, height=100, store_background=False)
+    patch = np.full((20, 30, 4), 9, dtype=np.uint8)
+    _tile(paint, TILE_SIZE, 10, patch)
+    arr = paint.get_array()
+    assert (arr[10:30, TILE_SIZE : TILE_SIZE + 30] == 9).all()
+    assert arr[:10].sum() == 0
+
+
+def test_out_of_bounds_tile_is_ignored():
+    paint = Paint(width=20, height=20, store_background=False)
+    _tile(paint, 10, 10, np.full((20, 20, 4), 1, dtype=np.uint8))
+    assert not paint.get_array().any()
+
+
+def test_replace_with_pil_resets_the_browser_base():
+    paint = Paint(width=200, height=100, store_background=False)
+    sent = _outbox(paint)
+    img = Image.new("RGBA", (200, 100), (0, 0, 0, 0))
+    img.putpixel((150, 70), (0, 255, 0, 255))
+    paint.replace_with_pil(img)
+
+    (msg, buffers), = sent
+    assert msg["tiles"] == [[128, 64, 64, 36]] and msg["reset"] and msg["base"]
+    assert len(buffers[0]) == 64 * 36 * 4
+    assert paint.get_array()[70, 150].tolist() == [0, 255, 0, 255]
+
+    paint.replace_with_pil(img)
+    assert len(sent) == 1
+
+
+def test_sync_request_sends_painted_tiles():
+    paint = Paint(width=200, height=100, store_background=False)
+    sent = _outbox(paint)
+    _tile(paint, 5, 5, np.full((2, 2, 4), 200, dtype=np.uint8))
+    paint._handle_message(paint, {"type": "sync"}, [])
+    (base, _), (msg, buffers) = sent
+    assert base["reset"] and base["base"] and base["tiles"] == []
+    assert not msg["reset"] and msg["tiles"] == [[0, 0, 64, 64]]
+    assert np.frombuffer(buffers[0], dtype=np.uint8).reshape(64, 64, 4)[5, 5, 0] == 200
+
+
+def test_init_image_and_base64_round_trip():
+    img = Image.new("RGB", (40, 30), (10, 20, 30))
+    paint = Paint(init_image=img)
+    assert (paint.width, paint.height) == (40, 30)
+    assert paint.get_array()[0, 0].tolist() == [10, 20, 30, 255]
+
+    other = Image.new("RGBA", (40, 30), (1, 2, 3, 255))
+    paint.base64 = pil_to_base64(other)
+    assert paint.get_array()[5, 5].tolist() == [1, 2, 3, 255]
+    assert paint.get_base64().startswith("data:image/png;base64,")
+    assert "," not in paint.base64
+
+
+def test_resize_resamples_canvas():
+    paint = Paint(width=20, height=10, store_background=False)
+    paint.width = 40
+    assert paint.get_array().shape == (10, 40, 4)
+
+
+@pytest.mark.parametrize("width,height", [(64, 64), (65, 1), (1, 130)])
+def test_tile_grid_covers_canvas(width, height):
+    from wigglystuff.paint import _tile_boxes
+
+    covered = np.zeros((height, width), dtype=int)
+    for x, y, w, h in _tile_boxes(height, width):
+        covered[y : y + h, x : x + w] += 1
+    assert (covered == 1).all()
+
+
+def _stroke(paint, points, tool="brush", size=2, color="#ff0000", timestamp=1_700_000_000_000):
+    content = {"type": "stroke", "tool": tool, "size": size, "color": color, "timestamp": timestamp}
+    buf = np.asarray(points, dtype=np.float32).tobytes()
+    paint._handle_message(paint, content, [memoryview(buf)])
+
+
+def test_strokes_are_logged():
+    paint = Paint(width=100, height=50)
+    _stroke(paint, [[10, 10], [40, 10]], tool="marker", size=8, color="#00ff00")
+    (stroke,) = paint.strokes
+    assert stroke.tool == "marker" and stroke.size == 8 and stroke.color == "#00ff00"
+    assert stroke.points.tolist() == [[10, 10], [40, 10]]
+    assert stroke.timestamp == pytest.approx(1_700_000_000.0)
+    assert stroke.to_dict()["points"] == [[10.0, 10.0], [40.0, 10.0]]
+
+
+def test_render_strokes_rasterizes_capsule():
+    paint = Paint(width=100, height=50, store_background=False)
+    _stroke(paint, [[10.5, 20.5], [60.5, 20.5]], size=8)
+    arr = paint.render_strokes()
+    assert arr[20, 30].tolist() == [255, 0, 0, 255]
+    assert arr[20, 8].tolist() == [255, 0, 0, 255]  # round cap
+    assert arr[20, 70, 3] == 0 and arr[30, 30, 3] == 0
+
+    big = paint.render_strokes(scale=4)
+    assert big.shape == (200, 400, 4)
+    assert big[82, 120].tolist() == [255, 0, 0, 255]
+    assert paint.render_strokes(n=0)[20, 30, 3] == 0
+
+
+def test_eraser_and_clear_replay():
+    paint = Paint(width=60, height=40, store_background=False)
+    _stroke(paint, [[5, 20], [55, 20]], size=10)
+    _stroke(paint, [[30, 0], [30, 40]], tool="eraser", size=10)
+    arr = paint.render_strokes()
+    assert arr[20, 10, 3] == 255 and arr[20, 30, 3] == 0
+
+    paint._handle_message(paint, {"type": "clear"}, [])
+    assert not paint.render_strokes()[..., 3].any()
+    paint._handle_message(paint, {"type": "undo"}, [])
+    assert len(paint.strokes) == 2
+
+
+def test_rainbow_replay_is_deterministic():
+    paint = Paint(width=80, height=80, store_background=False)
+    _stroke(paint, [[40, 40], [45, 42]], tool="rainbow", size=14, color="")
+    first = paint.render_strokes()
+    assert first[..., 3].any()
+    assert (first == paint.render_strokes()).all()
+
+
+def test_stroke_only_sync_rasterizes_in_python():
+    paint = Paint(width=100, height=50, store_background=False, sync_tiles=False)
+    _stroke(paint, [[10, 25], [90, 25]], size=6, color="#0000ff")
+    assert paint.get_array()[25, 50].tolist() == [0, 0, 255, 255]
+    paint._handle_message(paint, {"type": "undo"}, [])
+    assert not paint.get_array().any()
+
+
+def test_undo_stroke_sends_changed_tiles():
+    paint = Paint(width=200, height=100, store_background=False, sync_tiles=False)
+    _stroke(paint, [[140, 80], [150, 80]], size=4)
+    sent = _outbox(paint)
+    removed = paint.undo_stroke()
+    assert removed.tool == "brush" and paint.strokes == []
+    assert sent[0][0] == {"type": "undo"}
+    assert sent[1][0]["tiles"] == [[128, 64, 64, 36]]
+    assert not paint.get_array().any()
+    assert paint.undo_stroke() is None
+
+
+def test_undo_stroke_restores_browser_pixels_from_snapshot():
+    paint = Paint(width=200, height=100, store_background=False)
+    _stroke(paint, [[10, 10], [40, 10]], tool="rainbow", size=10)
+    _tile(paint, 0, 0, np.full((20, 50, 4), 7, dtype=np.uint8))
+    _stroke(paint, [[150, 80], [160, 80]], size=4)
+    _tile(paint, 140, 70, np.full((20, 30, 4), 9, dtype=np.uint8))
+    sent = _outbox(paint)
+
+    paint.undo_stroke()
+
+    arr = paint.get_array()
+    assert (arr[:20, :50] == 7).all()  # the browser's spray, not a re-render
+    assert not arr[60:].any()
+    assert sent[1][0]["tiles"] == [[128, 64, 64, 36]]
+
+
+def test_replace_with_pil_starts_new_log():
+    paint = Paint(width=40, height=40)
+    _outbox(paint)
+    _stroke(paint, [[0, 0], [10, 10]])
+    paint.replace_with_pil(Image.new("RGBA", (40, 40), (0, 0, 255, 255)))
+    assert paint.strokes == []
+    assert paint.render_strokes()[0, 0].tolist() == [0, 0, 255, 255]
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
 import pytest
 
 from wigglystuff import NestedTable, Treemap
 from wigglystuff._tree_utils import (
+    TreeIndex,
     collect_columns,
     tree_from_dataframe,
     tree_from_paths,
@@ -50,6 +53,62 @@ def test_from_paths_empty_mapping_raises():
         tree_from_paths({})
 
 
+def test_from_paths_aggregates_internal_values():
+    tree = tree_from_paths(
+        {"a/b": {"x": 1.0}, "a/c": {"x": 2.0, "y": 1.0}, "d": {"y": 4.0}}
+    )
+    a = tree["children"][0]
+    assert a["value"] == {"x": 3.0, "y": 1.0}
+    assert tree["value"] == {"x": 3.0, "y": 5.0}
+    assert [c["name"] for c in a["children"]] == ["b", "c"]
+
+
+def test_from_paths_leaf_then_branch_conflict_raises():
+    with pytest.raises(ValueError, match="conflicts with existing leaf"):
+        tree_from_paths({"a/b": 1, "a/b/c": 2})
+
+
+def test_from_paths_rejects_mixed_modes():
+    with pytest.raises(ValueError, match="mixes scalar and dict"):
+        tree_from_paths({"a/b": 1, "c": {"x": 2}})
+
+
+def test_from_paths_matches_widget_built_from_plain_dict():
+    paths = {"a/b/c": 1, "a/b/d": 2, "a/e": 3, "f": 4}
+    plain = {
+        "name": "root",
+        "children": [
+            {
+                "name": "a",
+                "children": [
+                    {
+                        "name": "b",
+                        "children": [
+                            {"name": "c", "value": 1},
+                            {"name": "d", "value": 2},
+                        ],
+                    },
+                    {"name": "e", "value": 3},
+                ],
+            },
+            {"name": "f", "value": 4},
+        ],
+    }
+    assert Treemap.from_paths(paths).data == Treemap(plain).data
+    assert NestedTable.from_paths(paths).data == NestedTable(plain).data
+
+
+@pytest.mark.parametrize("widget", [Treemap, NestedTable])
+def test_built_tree_passed_by_caller_is_copied_and_checked(widget):
+    tree = tree_from_paths({"a/b": 1, "a/c": 2})
+    widget(tree, format=lambda v: f"{v}!")
+    assert "display" not in tree["children"][0]["children"][0]
+
+    tree["children"][0]["children"].append({"name": "d", "value": "oops"})
+    with pytest.raises(ValueError):
+        widget(tree)
+
+
 # ---- tree_from_records: value_cols ----
 
 
@@ -142,6 +201,87 @@ def test_dataframe_autodetect():
     assert collect_columns(tree) == ["hours", "tickets"]
 
 
+HIERARCHY = {
+    "dept": ["eng", "eng", "design", "eng", "design", "ops"],
+    "team": ["infra", "product", "brand", "infra", "web", "infra"],
+    "person": ["ann", "bob", "cyd", "dee", "eve", "fay"],
+    "hours": [40, 70, 55, 10, 5, 20],
+    "tickets": [12, 8, 9, 1, 3, 4],
+}
+HIERARCHY_RECORDS = [dict(zip(HIERARCHY, row)) for row in zip(*HIERARCHY.values())]
+
+
+@pytest.mark.parametrize("library", ["polars", "pandas"])
+@pytest.mark.parametrize("value_cols", ["hours", ["tickets", "hours"], None])
+def test_dataframe_groupby_path_matches_records(library, value_cols):
+    lib = pytest.importorskip(library)
+    df = lib.DataFrame(HIERARCHY)
+    path_cols = ["dept", "team", "person"]
+
+    tree = tree_from_dataframe(df, path_cols=path_cols, value_cols=value_cols)
+    expected = tree_from_records(
+        HIERARCHY_RECORDS, path_cols=path_cols, value_cols=value_cols
+    )
+
+    assert tree == expected
+    assert [c["name"] for c in tree["children"]] == ["eng", "design", "ops"]
+    assert tree["children"][0]["children"][0]["name"] == "infra"
+
+
+@pytest.mark.parametrize("library", ["polars", "pandas"])
+def test_dataframe_groupby_path_names_like_records(library):
+    lib = pytest.importorskip(library)
+    data = {
+        "flag": [True, True, False, False],
+        "day": [
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 2, 9, 30),
+            datetime(2024, 1, 3),
+            datetime(2024, 1, 4),
+        ],
+        "hours": [1, 2, 3, 4],
+    }
+    df = lib.DataFrame(data)
+    records = df.to_dicts() if library == "polars" else df.to_dict(orient="records")
+
+    tree = tree_from_dataframe(df, path_cols=["flag", "day"], value_cols="hours")
+
+    assert tree == tree_from_records(records, path_cols=["flag", "day"], value_cols="hours")
+    assert tree["children"][0]["name"] == "True"
+    assert tree["children"][0]["children"][1]["name"] == "2024-01-02 09:30:00"
+
+
+@pytest.mark.parametrize("library", ["records", "polars", "pandas"])
+def test_missing_path_values_are_rejected(library):
+    data = {"dept": ["eng", None], "team": ["a", "b"], "hours": [1, 2]}
+    if library == "records":
+        build = tree_from_records
+        source = [dict(zip(data, row)) for row in zip(*data.values())]
+    else:
+        lib = pytest.importorskip(library)
+        build = tree_from_dataframe
+        source = lib.DataFrame(data)
+        if library == "pandas":
+            source["dept"] = source["dept"].astype("string")
+    with pytest.raises(ValueError, match="'dept' is missing a value in row 1"):
+        build(source, path_cols=["dept", "team"], value_cols="hours")
+
+
+def test_pandas_nullable_missing_value_is_rejected():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"dept": ["eng", "ops"], "hours": pd.array([1, None], dtype="Int64")})
+    with pytest.raises(ValueError, match=r"value at \['ops'\] must be numeric"):
+        tree_from_dataframe(df, path_cols=["dept"], value_cols="hours")
+
+
+@pytest.mark.parametrize("library", ["polars", "pandas"])
+def test_dataframe_groupby_path_rejects_duplicate_leaf(library):
+    lib = pytest.importorskip(library)
+    df = lib.DataFrame({"dept": ["eng", "eng"], "team": ["a", "a"], "hours": [1, 2]})
+    with pytest.raises(ValueError, match="duplicate"):
+        tree_from_dataframe(df, path_cols=["dept", "team"])
+
+
 def test_dataframe_rejects_non_dataframe():
     with pytest.raises(TypeError):
         tree_from_dataframe({"not": "a df"}, path_cols=["x"])
@@ -286,3 +426,89 @@ def test_nested_table_no_column_labels_attr():
     with pytest.raises(TypeError):
         NestedTable({"name": "r", "children": [{"name": "a", "value": 1}]},
                     column_labels={"value": "x"})
+
+
+# ---- lazy mode ----
+
+
+LAZY_PATHS = {"a/b/c": 1, "a/b/d": 2, "a/e": 3, "f": 4}
+
+
+def _capture_sends(widget):
+    sent = []
+    widget.send = sent.append
+    return sent
+
+
+def test_lazy_tree_index_finds_nodes_by_path():
+    index = TreeIndex(tree_from_paths(LAZY_PATHS))
+    assert index.find(["root", "a", "b", "d"])["value"] == 2
+    assert index.find(["root", "a", "x"]) is None
+    assert index.find(["other"]) is None
+
+
+def test_nested_table_lazy_sends_only_visible_rows():
+    widget = NestedTable.from_paths(LAZY_PATHS, initial_expand_depth=1, lazy=True)
+    a, f = widget.data["children"]
+    assert a == {"name": "a", "value": 6, "lazy": True}
+    assert f == {"name": "f", "value": 4}
+
+
+def test_nested_table_lazy_sends_children_on_expand():
+    widget = NestedTable.from_paths(LAZY_PATHS, initial_expand_depth=1, lazy=True)
+    sent = _capture_sends(widget)
+
+    widget.expanded_paths = [["root"], ["root", "a"]]
+    widget.expanded_paths = [["root"], ["root", "a"], ["root", "a", "b"]]
+
+    assert [[n["path"] for n in msg["nodes"]] for msg in sent] == [
+        [["root", "a"]],
+        [["root", "a", "b"]],
+    ]
+    assert sent[0]["nodes"][0]["children"][0] == {"name": "b", "value": 3, "lazy": True}
+
+
+def test_nested_table_lazy_loads_missing_ancestors_first():
+    widget = NestedTable.from_paths(LAZY_PATHS, initial_expand_depth=1, lazy=True)
+    sent = _capture_sends(widget)
+
+    widget.expanded_paths = [["root", "a", "b"]]
+
+    assert [n["path"] for n in sent[0]["nodes"]] == [["root", "a"], ["root", "a", "b"]]
+
+
+def test_nested_table_lazy_resync_resends_expanded_rows():
+    widget = NestedTable.from_paths(LAZY_PATHS, initial_expand_depth=1, lazy=True)
+    widget.expanded_paths = [["root"], ["root", "a"]]
+    sent = _capture_sends(widget)
+
+    # A second view or a reload only has ``data``.
+    widget._handle_message(widget, {"type": "resync"}, [])
+    widget._handle_message(widget, {"type": "resync"}, [])
+
+    assert [[n["path"] for n in msg["nodes"]] for msg in sent] == [[["root", "a"]]] * 2
+
+
+def test_treemap_lazy_resync_resends_the_zoomed_view():
+    widget = Treemap.from_paths(LAZY_PATHS, max_depth=1, lazy=True)
+    widget.selected_path = ["root", "a"]
+    sent = _capture_sends(widget)
+
+    widget._handle_message(widget, {"type": "resync"}, [])
+
+    assert [n["path"] for n in sent[0]["nodes"]] == [["root", "a"]]
+
+
+def test_treemap_lazy_loads_below_the_zoomed_view():
+    widget = Treemap.from_paths(LAZY_PATHS, max_depth=1, lazy=True)
+    sent = _capture_sends(widget)
+    assert widget.data["children"][0]["lazy"] is True
+
+    widget.selected_path = ["root", "a"]
+
+    assert [n["path"] for n in sent[0]["nodes"]] == [["root", "a"]]
+
+
+def test_tree_widgets_are_eager_by_default():
+    widget = Treemap.from_paths(LAZY_PATHS)
+    assert "lazy" not in widget.data["children"][0]
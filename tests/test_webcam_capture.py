@@ -0,0 +1,163 @@
+import asyncio
+from io import BytesIO
+
+import numpy as np
+import pytest
+import traitlets
+from PIL import Image
+
+from wigglystuff import WebcamCapture
+
+
+def _png(color, size=(4, 3)):
+    buf = BytesIO()
+    Image.new("RGB", size, color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _acks(cam):
+    sent = []
+    cam.send = lambda msg, buffers=None: sent.append(msg)
+    return sent
+
+
+def _send(cam, data, fmt="png", width=4, height=3, timestamp=1_700_000_000_000):
+    content = {"type": "frame", "format": fmt, "width": width, "height": height, "timestamp": timestamp}
+    cam._handle_message(cam, content, [memoryview(data)])
+
+
+def test_no_frame_yet():
+    cam = WebcamCapture()
+    assert cam.get_bytes() == b""
+    assert cam.get_pil() is None and cam.get_array() is None
+    assert cam.image_base64 == ""
+    assert cam.recent_frames() == []
+
+
+def test_binary_frames_are_decoded_once():
+    cam = WebcamCapture()
+    _send(cam, _png((255, 0, 0)))
+
+    assert cam.frame_count == 1
+    assert cam.get_pil() is cam.get_pil()
+    assert cam.get_array() is cam.get_array()
+    assert cam.get_array()[0, 0].tolist() == [255, 0, 0]
+    assert cam.image_base64.startswith("data:image/png;base64,")
+    assert cam.latest.timestamp == pytest.approx(1_700_000_000.0)
+
+
+def test_raw_rgba_frames_need_no_decoding():
+    cam = WebcamCapture(frame_format="rgba")
+    pixels = np.arange(3 * 4 * 4, dtype=np.uint8).reshape(3, 4, 4)
+    _send(cam, pixels.tobytes(), fmt="rgba")
+
+    assert np.array_equal(cam.get_array(), pixels)
+    assert cam.get_pil().size == (4, 3)
+    assert cam.image_base64.startswith("data:image/png;base64,")
+
+
+def test_ring_buffer_keeps_the_latest_frames():
+    cam = WebcamCapture(buffer_size=3)
+    for i in range(5):
+        _send(cam, _png((i, 0, 0)), timestamp=1000 * i)
+
+    frames = cam.recent_frames()
+    assert cam.frame_count == 5
+    assert [f.timestamp for f in frames] == [2.0, 3.0, 4.0]
+    assert cam.recent_frames(2) == frames[1:]
+    assert cam.get_array()[0, 0, 0] == 4
+
+
+def test_frame_count_follows_the_browser_counter():
+    cam = WebcamCapture()
+    _acks(cam)
+    seen = []
+    cam.observe(lambda change: seen.append(change["new"]), names="frame_count")
+    for count in (1, 2):
+        content = {"type": "frame", "format": "png", "width": 4, "height": 3, "count": count}
+        cam._handle_message(cam, content, [memoryview(_png((0, 0, 0)))])
+        # The browser's own trait sync carries the same value: no extra tick.
+        cam.frame_count = count
+    assert seen == [1, 2]
+
+
+def test_other_messages_are_ignored():
+    cam = WebcamCapture()
+    cam._handle_message(cam, {"type": "something"}, [])
+    cam._handle_message(cam, {"type": "frame"}, [])
+    assert cam.frame_count == 0
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="buffer_size"):
+        WebcamCapture(buffer_size=0)
+    with pytest.raises(traitlets.TraitError):
+        WebcamCapture(frame_format="gif")
+
+
+def test_frames_are_acknowledged_on_arrival_without_a_consumer():
+    cam = WebcamCapture()
+    sent = _acks(cam)
+    _send(cam, _png((0, 0, 0)))
+    _send(cam, _png((1, 0, 0)))
+    assert sent == [{"type": "ack", "count": 1}] * 2
+
+
+def test_frames_iterator_acknowledges_after_each_loop_body():
+    cam = WebcamCapture()
+    sent = _acks(cam)
+    seen = []
+
+    async def go():
+        release = asyncio.Event()
+
+        async def consume():
+            async for frame in cam.frames():
+                seen.append(frame.timestamp)
+                await release.wait()
+                release.clear()
+                if len(seen) == 2:
+                    break
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        _send(cam, _png((0, 0, 0)), timestamp=1000)
+        await asyncio.sleep(0.01)
+        assert seen == [1.0] and sent == []  # still processing frame 1
+        release.set()
+        await asyncio.sleep(0.01)
+        assert sent == [{"type": "ack", "count": 1}]
+        _send(cam, _png((1, 0, 0)), timestamp=2000)
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.wait_for(task, 1)
+
+    asyncio.run(go())
+    assert seen == [1.0, 2.0]
+    assert sent == [{"type": "ack", "count": 1}] * 2
+
+
+def test_slow_consumer_skips_to_the_newest_frame():
+    cam = WebcamCapture(max_in_flight=3)
+    sent = _acks(cam)
+    seen = []
+
+    async def go():
+        async def consume():
+            async for frame in cam.frames():
+                seen.append(frame.timestamp)
+                if len(seen) == 2:
+                    break
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        for i in range(3):
+            _send(cam, _png((i, 0, 0)), timestamp=1000 * i)
+        await asyncio.sleep(0.01)
+        _send(cam, _png((9, 0, 0)), timestamp=9000)
+        await asyncio.wait_for(task, 1)
+
+    asyncio.run(go())
+    assert seen == [2.0, 9.0]
+    # Every frame is acknowledged exactly once, skipped ones included.
+    assert sum(msg["count"] for msg in sent) == 4
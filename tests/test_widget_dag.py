@@ -1,7 +1,13 @@
+import random
+from types import SimpleNamespace
+
 import pytest
 
 from wigglystuff import WidgetDAG
 from wigglystuff.widget_dag import (
+    _EDGE_CACHE,
+    _cell_graph_edges,
+    _count_crossings,
     _format_float_html,
     _order_and_route,
     _reduce_edges,
@@ -113,6 +119,151 @@ def test_dice_graph_routes_long_edge_without_adjacent_layer_crossings():
     assert crossings == 0
 
 
+class _FakeGraph:
+    """Just enough of marimo's ``DirectedGraph`` for ``_cell_graph_edges``."""
+
+    def __init__(self, cell_edges, definitions):
+        cells = {c for edge in cell_edges for c in edge} | {
+            c for defs in definitions.values() for c in defs
+        }
+        self.cells = {c: SimpleNamespace(key=f"code-{c}") for c in sorted(cells)}
+        self.parents = {c: set() for c in self.cells}
+        self._children = {c: set() for c in self.cells}
+        for src, dst in cell_edges:
+            self.parents[dst].add(src)
+            self._children[src].add(dst)
+        self.definitions = definitions
+        self.walks = 0
+
+    @property
+    def children(self):
+        self.walks += 1
+        return self._children
+
+    def ancestors(self, cell):
+        found, todo = set(), list(self.parents[cell])
+        while todo:
+            c = todo.pop()
+            if c not in found:
+                found.add(c)
+                todo.extend(self.parents[c])
+        return found
+
+
+def test_cell_graph_edges_match_reduce_edges_on_random_dags():
+    rng = random.Random(3)
+    for trial in range(20):
+        n = rng.randrange(2, 25)
+        cells = [f"c{trial}_{i}" for i in range(n)]
+        cell_edges = [
+            (cells[i], cells[j])
+            for j in range(n)
+            for i in range(j)
+            if rng.random() < 0.2
+        ]
+        order = [f"v{i}" for i in range(n)]
+        rng.shuffle(order)
+        definitions = {f"v{i}": {cells[i]} for i in range(n)}
+        graph = _FakeGraph(cell_edges, definitions)
+        name_to_cell = {v: cells[int(v[1:])] for v in order}
+        ancestors = {c: graph.ancestors(c) for c in cells}
+
+        assert _cell_graph_edges(graph, order) == _reduce_edges(
+            order, name_to_cell, ancestors
+        )
+
+
+def test_cell_graph_edges_are_cached_until_the_graph_changes():
+    _EDGE_CACHE.clear()
+    graph = _FakeGraph([("A", "B"), ("B", "C")], {"a": {"A"}, "b": {"B"}, "c": {"C"}})
+
+    first = _cell_graph_edges(graph, ["a", "b", "c"])
+    walks = graph.walks
+    second = _cell_graph_edges(graph, ["a", "b", "c"])
+
+    assert first == second == [["a", "b"], ["b", "c"]]
+    assert graph.walks == walks
+
+    graph.cells["C"] = SimpleNamespace(key="edited")
+    graph.parents["C"] = {"A"}
+    graph._children["B"] = set()
+    graph._children["A"].add("C")
+    assert _cell_graph_edges(graph, ["a", "b", "c"]) == [["a", "b"], ["a", "c"]]
+
+
+def _adjacent_crossings(layers, routes):
+    positions = {
+        node: (column, row)
+        for column, layer in layers.items()
+        for row, node in enumerate(layer)
+    }
+    segments = [
+        (positions[src], positions[dst])
+        for route in routes
+        for src, dst in zip(route, route[1:])
+    ]
+    return sum(
+        1
+        for index, ((lc, lr), (rc, rr)) in enumerate(segments)
+        for (olc, olr), (orc, orr) in segments[index + 1 :]
+        if lc == olc and rc == orc and (lr - olr) * (rr - orr) < 0
+    )
+
+
+def test_count_crossings_matches_pairwise_count():
+    rng = random.Random(0)
+    for _ in range(50):
+        pairs = [(rng.randrange(6), rng.randrange(6)) for _ in range(rng.randrange(20))]
+        naive = sum(
+            1
+            for a in range(len(pairs))
+            for b in range(a + 1, len(pairs))
+            if (pairs[a][0] - pairs[b][0]) * (pairs[a][1] - pairs[b][1]) < 0
+        )
+        assert _count_crossings(pairs, 6) == naive
+
+
+@pytest.mark.parametrize("heuristic", ["barycenter", "median"])
+def test_wide_columns_are_untangled_without_brute_force(heuristic):
+    # Twelve parallel chains, with the right column seeded in reverse: far too
+    # wide to brute-force, but the heuristic should still find the zero order.
+    left = [f"l{i}" for i in range(12)]
+    right = [f"r{i}" for i in range(12)]
+    edges = [[f"l{i}", f"r{i}"] for i in range(12)]
+    order = left + right[::-1]
+    columns = {**dict.fromkeys(left, 0), **dict.fromkeys(right, 1)}
+
+    layers, routes, _ = _order_and_route(order, columns, edges, heuristic=heuristic)
+
+    assert _adjacent_crossings(layers, routes) == 0
+
+
+def test_heuristic_path_matches_brute_force_on_dice_graph():
+    order = ["e1", "e2", "slider", "g1", "g2", "first", "win", "second"]
+    edges = [
+        ["e1", "g1"],
+        ["e2", "g1"],
+        ["slider", "g2"],
+        ["slider", "first"],
+        ["g1", "second"],
+        ["g2", "second"],
+        ["first", "win"],
+        ["second", "win"],
+    ]
+    columns = layered_layout(dict.fromkeys(order), edges)
+
+    exact = _order_and_route(order, columns, edges)
+    heuristic = _order_and_route(order, columns, edges, brute_cap=0)
+
+    assert _adjacent_crossings(*exact[:2]) == 0
+    assert _adjacent_crossings(*heuristic[:2]) == 0
+
+
+def test_order_and_route_rejects_unknown_heuristic():
+    with pytest.raises(ValueError, match="heuristic"):
+        _order_and_route(["a"], {"a": 0}, [], heuristic="sugiyama")
+
+
 def test_float_nodes_use_compact_text_and_keep_exact_value_in_tooltip():
     assert _format_float_html(0.49500000000000016) == (
         '<span title="Exact value: 0.49500000000000016">0.495</span>'
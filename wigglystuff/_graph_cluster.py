@@ -0,0 +1,338 @@
+"""Community detection and level-of-detail views for :class:`~wigglystuff.graph_widget.GraphWidget`.
+
+``label_propagation`` groups nodes into communities with NumPy array ops.
+``LevelOfDetail`` stacks such groupings into a cluster hierarchy and produces
+the displayed graph: a mix of cluster super-nodes and original nodes, with
+edges between clusters aggregated. Expanding a cluster swaps it for its
+children; collapsing does the reverse.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+# Largest community, as a multiple of the average size ``n / max_nodes``.
+CAP_FACTOR = 4
+
+
+def label_propagation(
+    n: int, src: Any, dst: Any, weight: Any = None, *, seed: int = 0, max_iter: int = 30
+) -> Any:
+    """Group ``n`` nodes into communities by weighted label propagation.
+
+    Every round, a random half of the nodes adopt the label carrying the most
+    edge weight among their neighbours (updating half at a time stops the
+    two-colouring oscillation of fully synchronous updates). Edge direction is
+    ignored. Returns consecutive community labels, one per node.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    if weight is None:
+        weight = np.ones(len(src))
+    keep = src != dst
+    rows = np.concatenate([src[keep], dst[keep]])
+    cols = np.concatenate([dst[keep], src[keep]])
+    w = np.concatenate([weight[keep], weight[keep]]).astype(np.float64)
+    labels = np.arange(n)
+    for _ in range(max_iter):
+        if not len(rows):
+            break
+        pairs, inverse = np.unique(rows * n + labels[cols], return_inverse=True)
+        score = np.bincount(inverse, weights=w)
+        # Random tie-breaking: jitter well below the smallest weight step.
+        score += rng.uniform(0, 1e-6, len(score))
+        pair_row = pairs // n
+        order = np.lexsort((-score, pair_row))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = pair_row[order[1:]] != pair_row[order[:-1]]
+        best_row = pair_row[order[first]]
+        best_label = pairs[order[first]] % n
+        move = rng.random(len(best_row)) < 0.5
+        changed = move & (labels[best_row] != best_label)
+        if not changed.any():
+            # Nothing moved in this half; stop once a full sweep is stable too.
+            if (labels[best_row] == best_label).all():
+                break
+            continue
+        labels[best_row[changed]] = best_label[changed]
+    _, labels = np.unique(labels, return_inverse=True)
+    return labels
+
+
+def split_oversized(labels: Any, sizes: Any, src: Any, dst: Any, cap: int) -> tuple[Any, bool]:
+    """Break communities holding more than ``cap`` original nodes into pieces.
+
+    Label propagation floods sparse graphs without real community structure
+    into one giant label. Members of such a community are walked
+    breadth-first over their internal edges and cut into consecutive runs of
+    at most ``cap`` (by ``sizes``), so every piece stays connected where it
+    can. Returns consecutive labels and whether anything was split.
+    """
+    import numpy as np
+
+    totals = np.bincount(labels, weights=sizes)
+    oversized = np.flatnonzero(totals > cap)
+    if not len(oversized):
+        return labels, False
+    labels = labels.copy()
+    fresh = int(labels.max()) + 1
+    inner = (labels[src] == labels[dst]) & (src != dst)
+    rows = np.concatenate([src[inner], dst[inner]])
+    cols = np.concatenate([dst[inner], src[inner]])
+    order = np.argsort(rows, kind="stable")
+    rows, cols = rows[order], cols[order]
+    start = np.searchsorted(rows, np.arange(len(labels) + 1))
+    for label in oversized.tolist():
+        members = np.flatnonzero(labels == label)
+        seen = np.zeros(len(labels), dtype=bool)
+        walk: list[int] = []
+        for root in members.tolist():
+            if seen[root]:
+                continue
+            seen[root] = True
+            queue = [root]
+            for item in queue:
+                walk.append(item)
+                for kid in cols[start[item] : start[item + 1]].tolist():
+                    if not seen[kid]:
+                        seen[kid] = True
+                        queue.append(kid)
+        piece = np.empty(len(walk), dtype=np.int64)
+        k = total = 0
+        for j, size in enumerate(sizes[walk].tolist()):
+            if total and total + size > cap:
+                k, total = k + 1, 0
+            total += size
+            piece[j] = k
+        labels[walk] = np.where(piece == 0, label, fresh + piece - 1)
+        fresh += k
+    _, labels = np.unique(labels, return_inverse=True)
+    return labels, True
+
+
+class LevelOfDetail:
+    """Cluster hierarchy over a normalized graph plus the currently shown level.
+
+    Clusters are built bottom up: label propagation on the nodes, then on the
+    graph of those communities, and so on until at most ``max_nodes`` items
+    remain at the top or a pass merges nothing. Communities are capped at a
+    few times ``n / max_nodes`` original nodes, so a graph without community
+    structure still opens as many mid-sized clusters instead of one giant
+    one; the cap doubles whenever it is all that blocks a merge. Items left
+    without any edge at that point are bucketed together. Single-member
+    groups are not wrapped, so every cluster has at least two children.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[Mapping[str, Any]],
+        edges: Sequence[Mapping[str, Any]],
+        *,
+        max_nodes: int,
+        seed: int = 0,
+    ) -> None:
+        import numpy as np
+
+        self.nodes = nodes
+        self.edges = edges
+        self.max_nodes = max(int(max_nodes), 1)
+        self.node_pos = {node["id"]: i for i, node in enumerate(nodes)}
+        pos = self.node_pos
+        pairs = [
+            (pos[edge["source"]], pos[edge["target"]])
+            for edge in edges
+            if edge["source"] in pos and edge["target"] in pos
+        ]
+        self._edge_rows = [
+            i for i, edge in enumerate(edges) if edge["source"] in pos and edge["target"] in pos
+        ]
+        arr = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        self.src, self.dst = arr[:, 0], arr[:, 1]
+
+        self.children: dict[str, list[str]] = {}
+        self.parent: dict[str, str] = {}
+        self.size: dict[str, int] = {}
+        # Stable integer per item: node rows first, then clusters as created.
+        self._code = dict(self.node_pos)
+        self._cluster_nodes: dict[str, dict] = {}
+        self._leaves: dict[str, Any] = {}
+        self.visible = self._build(seed)
+        # For every original node, the code of the visible item holding it.
+        self._rep = np.empty(len(nodes), dtype=np.int64)
+        for item in self.visible:
+            self._rep[self._leaf_rows(item)] = self._code[item]
+
+    def _new_id(self, level: int, index: int) -> str:
+        cluster_id = base = f"cluster-{level}-{index}"
+        suffix = 1
+        while cluster_id in self.node_pos or cluster_id in self.children:
+            cluster_id = f"{base}-{suffix}"
+            suffix += 1
+        return cluster_id
+
+    def _group(self, items: list[str], labels: Any, level: int) -> list[str]:
+        import numpy as np
+
+        order = np.argsort(labels, kind="stable")
+        bounds = np.flatnonzero(np.diff(labels[order])) + 1
+        grouped = []
+        for j, members in enumerate(np.split(order, bounds)):
+            if len(members) == 1:
+                grouped.append(items[members[0]])
+                continue
+            cluster_id = self._new_id(level, j)
+            kids = [items[i] for i in members]
+            self.children[cluster_id] = kids
+            self._code[cluster_id] = len(self._code)
+            self.size[cluster_id] = sum(self.size.get(k, 1) for k in kids)
+            for kid in kids:
+                self.parent[kid] = cluster_id
+            grouped.append(cluster_id)
+        return grouped
+
+    def _build(self, seed: int) -> list[str]:
+        import numpy as np
+
+        items = [node["id"] for node in self.nodes]
+        member = np.arange(len(items))  # original node -> current item index
+        cap = max(2, math.ceil(CAP_FACTOR * len(items) / self.max_nodes))
+        level = 0
+        while len(items) > self.max_nodes:
+            src, dst = member[self.src], member[self.dst]
+            labels = label_propagation(len(items), src, dst, seed=seed + level)
+            sizes = np.array([self.size.get(item, 1) for item in items], dtype=np.int64)
+            labels, split = split_oversized(labels, sizes, src, dst, cap)
+            if labels.max(initial=-1) + 1 == len(items):
+                # Propagation is stuck; bucket the items without any edge.
+                isolated = np.ones(len(items), dtype=bool)
+                isolated[src[src != dst]] = False
+                isolated[dst[src != dst]] = False
+                spare = self.max_nodes - int((~isolated).sum())
+                buckets = max(spare, 1)
+                if not isolated.any() or isolated.sum() <= buckets:
+                    if split:
+                        # Only the size cap kept communities apart.
+                        cap *= 2
+                        continue
+                    break
+                labels = np.arange(len(items))
+                loose = np.flatnonzero(isolated)
+                labels[loose] = len(items) + np.arange(len(loose)) * buckets // len(loose)
+                _, labels = np.unique(labels, return_inverse=True)
+            items = self._group(items, labels, level)
+            member = labels[member]
+            level += 1
+        return items
+
+    def _leaf_rows(self, item: str) -> Any:
+        import numpy as np
+
+        if item not in self.children:
+            return np.array([self.node_pos[item]], dtype=np.int64)
+        if item not in self._leaves:
+            rows: list[int] = []
+            stack = [item]
+            while stack:
+                current = stack.pop()
+                kids = self.children.get(current)
+                if kids is None:
+                    rows.append(self.node_pos[current])
+                else:
+                    stack.extend(reversed(kids))
+            self._leaves[item] = np.array(rows, dtype=np.int64)
+        return self._leaves[item]
+
+    def leaves(self, item: str) -> list[str]:
+        """Original node ids under ``item`` (itself when it is a node)."""
+        return [self.nodes[row]["id"] for row in self._leaf_rows(item).tolist()]
+
+    def resolve(self, ids: Iterable[str]) -> list[str]:
+        """Replace cluster ids with their original node ids, keeping order."""
+        out: dict[str, None] = {}
+        for item in ids:
+            for leaf in self.leaves(item) if item in self.children else [item]:
+                out[leaf] = None
+        return list(out)
+
+    def _under(self, item: str, cluster_id: str) -> bool:
+        while item is not None:
+            if item == cluster_id:
+                return True
+            item = self.parent.get(item)
+        return False
+
+    def expand(self, cluster_id: str) -> bool:
+        """Show the children of a visible cluster in its place."""
+        if cluster_id not in self.children or cluster_id not in self.visible:
+            return False
+        at = self.visible.index(cluster_id)
+        kids = self.children[cluster_id]
+        self.visible[at : at + 1] = kids
+        for kid in kids:
+            self._rep[self._leaf_rows(kid)] = self._code[kid]
+        return True
+
+    def collapse(self, item: str) -> bool:
+        """Fold the cluster that ``item`` belongs to back into one node.
+
+        Returns ``False`` when ``item`` has no cluster or nothing visible lies
+        under it (it is already folded into a larger cluster).
+        """
+        cluster_id = self.parent.get(item)
+        if cluster_id is None:
+            return False
+        inside = [i for i, v in enumerate(self.visible) if self._under(v, cluster_id)]
+        if not inside:
+            return False
+        keep = [v for v in self.visible if not self._under(v, cluster_id)]
+        keep.insert(inside[0], cluster_id)
+        self.visible = keep
+        self._rep[self._leaf_rows(cluster_id)] = self._code[cluster_id]
+        return True
+
+    def _cluster_node(self, cluster_id: str) -> dict:
+        if cluster_id not in self._cluster_nodes:
+            size = self.size[cluster_id]
+            self._cluster_nodes[cluster_id] = {
+                "id": cluster_id,
+                "name": f"{size} nodes",
+                "size": round(min(40.0, 12 + 4 * math.log2(size)), 1),
+                "cluster": True,
+                "data": {"nodes": size},
+            }
+        return self._cluster_nodes[cluster_id]
+
+    def view(self) -> tuple[list[dict], list[dict]]:
+        """The displayed nodes and edges for the current level of detail."""
+        import numpy as np
+
+        nodes = [
+            self._cluster_node(item) if item in self.children else self.nodes[self.node_pos[item]]
+            for item in self.visible
+        ]
+        is_cluster = np.array([item in self.children for item in self.visible], dtype=bool)
+        slot = np.full(len(self._code), -1, dtype=np.int64)
+        slot[[self._code[item] for item in self.visible]] = np.arange(len(self.visible))
+        rep_src, rep_dst = slot[self._rep[self.src]], slot[self._rep[self.dst]]
+        plain = ~(is_cluster[rep_src] | is_cluster[rep_dst])
+        edges = [self.edges[self._edge_rows[i]] for i in np.flatnonzero(plain)]
+        outer = ~plain & (rep_src != rep_dst)
+        if outer.any():
+            pairs, counts = np.unique(
+                np.stack([rep_src[outer], rep_dst[outer]], axis=1), axis=0, return_counts=True
+            )
+            for (s, t), count in zip(pairs.tolist(), counts.tolist()):
+                source, target = self.visible[s], self.visible[t]
+                edges.append(
+                    {
+                        "id": f"cluster-edge-{source}-{target}",
+                        "source": source,
+                        "target": target,
+                        "width": round(1 + math.log2(count), 1),
+                        "data": {"edges": count},
+                    }
+                )
+        return nodes, edges
@@ -0,0 +1,207 @@
+"""Vectorized graph layouts for :class:`~wigglystuff.graph_widget.GraphWidget`.
+
+Both layouts take the graph as ``n`` nodes plus ``src``/``dst`` integer edge
+arrays and return an ``(n, 2)`` float32 array scaled into ``[-1, 1]``. Edge
+direction is ignored. Above ``DENSE_SPECTRAL_LIMIT`` nodes the spectral layout
+needs SciPy's sparse eigensolver (the ``scipy`` extra); without it the force
+layout starts from random positions instead.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Up to this many nodes, force repulsion is computed between every pair.
+EXACT_REPULSION_LIMIT = 1000
+# Up to this many nodes, the spectral layout uses a dense eigensolver.
+DENSE_SPECTRAL_LIMIT = 500
+# Rows per chunk when repelling nodes from cell centres, to bound memory.
+CHUNK = 4096
+
+
+def _normalize(pos: Any) -> Any:
+    import numpy as np
+
+    pos = pos - pos.mean(axis=0) if len(pos) else pos
+    scale = np.abs(pos).max() if len(pos) else 0.0
+    if scale > 0:
+        pos = pos / scale
+    return pos.astype(np.float32)
+
+
+def _symmetric_adjacency(n: int, src: Any, dst: Any) -> Any:
+    import numpy as np
+    from scipy.sparse import coo_matrix
+
+    keep = src != dst
+    rows = np.concatenate([src[keep], dst[keep]])
+    cols = np.concatenate([dst[keep], src[keep]])
+    adj = coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n)).tocsr()
+    adj.data[:] = 1.0
+    return adj
+
+
+def spectral_layout(n: int, src: Any, dst: Any, *, seed: int = 0) -> Any:
+    """Place nodes by the leading non-trivial eigenvectors of the graph.
+
+    Uses the regularized normalized adjacency ``D_t^-1/2 A D_t^-1/2`` with
+    ``t`` the mean degree, which keeps disconnected pieces and isolated nodes
+    from collapsing onto a single point.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    if n < 3:
+        return _normalize(rng.uniform(-1, 1, size=(n, 2)))
+    # ARPACK needs k < n and is slower than a dense solve on small graphs.
+    if n <= DENSE_SPECTRAL_LIMIT:
+        adj = np.zeros((n, n))
+        keep = src != dst
+        adj[src[keep], dst[keep]] = 1.0
+        adj[dst[keep], src[keep]] = 1.0
+        deg = adj.sum(axis=1)
+        tau = deg.mean() or 1.0
+        inv = 1.0 / np.sqrt(deg + tau)
+        _, vecs = np.linalg.eigh(adj * inv[:, None] * inv[None, :])
+        pos = vecs[:, -3:-1] * inv[:, None]
+    else:
+        try:
+            from scipy.sparse import diags
+            from scipy.sparse.linalg import eigsh
+        except ImportError as exc:
+            raise ImportError(
+                f"scipy is required for the spectral layout of graphs over "
+                f"{DENSE_SPECTRAL_LIMIT} nodes; install wigglystuff[scipy]."
+            ) from exc
+        adj = _symmetric_adjacency(n, src, dst)
+        deg = np.asarray(adj.sum(axis=1)).ravel()
+        tau = deg.mean() or 1.0
+        inv = diags(1.0 / np.sqrt(deg + tau))
+        v0 = rng.uniform(-1, 1, size=n)
+        vals, vecs = eigsh(inv @ adj @ inv, k=3, which="LA", v0=v0)
+        order = np.argsort(vals)[::-1]
+        pos = vecs[:, order[1:3]] * inv.diagonal()[:, None]
+    # Break exact ties (e.g. structurally identical leaves) with a tiny jitter.
+    spread = np.abs(pos).max() or 1.0
+    pos = pos + rng.normal(scale=spread * 1e-3, size=pos.shape)
+    return _normalize(pos)
+
+
+def _repulsion(pos: Any, mass: Any) -> Any:
+    """ForceAtlas2-style repulsion ``mass_i * mass_j / d`` along ``x_i - x_j``."""
+    import numpy as np
+
+    n = len(pos)
+    if n <= EXACT_REPULSION_LIMIT:
+        return _repulsion_exact(pos, mass)
+
+    # Far field: split the nodes into about sqrt(n) cells of equal count
+    # (strips by x, then by y within each strip) and repel each node from
+    # every other cell's centre of mass, a one-level Barnes-Hut
+    # approximation. Near field: exact pairwise repulsion inside each cell.
+    # Equal-count cells keep the exact part at O(n^1.5) however the nodes
+    # cluster.
+    side = max(2, round(n**0.25))
+    strip = np.empty(n, dtype=np.int64)
+    strip[np.argsort(pos[:, 0], kind="stable")] = np.arange(n) * side // n
+    order = np.lexsort((pos[:, 1], strip))
+    strip_sorted = strip[order]
+    sizes = np.bincount(strip, minlength=side)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    within = np.arange(n) - starts[strip_sorted]
+    cell = np.empty(n, dtype=np.int64)
+    cell[order] = strip_sorted * side + within * side // sizes[strip_sorted]
+
+    n_cells = side * side
+    cell_mass = np.bincount(cell, weights=mass, minlength=n_cells)
+    centre = np.stack(
+        [np.bincount(cell, weights=mass * pos[:, k], minlength=n_cells) for k in (0, 1)],
+        axis=1,
+    ) / np.maximum(cell_mass, 1e-12)[:, None]
+
+    force = np.empty_like(pos)
+    for start in range(0, n, CHUNK):
+        block = slice(start, start + CHUNK)
+        force[block] = _repel(pos[block], mass[block], centre, cell_mass, skip=cell[block])
+
+    # ``order`` already groups nodes by cell: cells are numbered strip-major
+    # and nodes within a strip are sorted by y.
+    bounds = np.flatnonzero(np.diff(cell[order])) + 1
+    for members in np.split(order, bounds):
+        if len(members) > 1:
+            force[members] += _repulsion_exact(pos[members], mass[members])
+    return force
+
+
+def _repel(pos: Any, mass: Any, other: Any, other_mass: Any, skip: Any = None) -> Any:
+    """Sum of ``mass * other_mass / d`` pushes on each of ``pos`` from ``other``.
+
+    ``sum_j c_ij (x_i - x_j)`` is evaluated as ``x_i * sum_j c_ij - C @ x`` so
+    the heavy part is a matrix product. ``skip`` gives, per row, one column
+    to leave out (the point itself, or its own cell).
+    """
+    import numpy as np
+
+    dx = pos[:, 0, None] - other[None, :, 0]
+    dy = pos[:, 1, None] - other[None, :, 1]
+    coeff = dx * dx
+    coeff += dy * dy
+    coeff += 1e-9
+    np.divide(other_mass[None, :], coeff, out=coeff)
+    coeff *= mass[:, None]
+    if skip is not None:
+        coeff[np.arange(len(coeff)), skip] = 0.0
+    return pos * coeff.sum(axis=1)[:, None] - coeff @ other
+
+
+def _repulsion_exact(pos: Any, mass: Any) -> Any:
+    import numpy as np
+
+    return _repel(pos, mass, pos, mass, skip=np.arange(len(pos)))
+
+
+def force_layout(
+    n: int,
+    src: Any,
+    dst: Any,
+    *,
+    iterations: int = 50,
+    seed: int = 0,
+    init: Any = None,
+) -> Any:
+    """ForceAtlas2-flavoured layout: linear edge attraction, degree-weighted
+    repulsion, and a step size that cools linearly over ``iterations``.
+
+    Starts from ``init`` (an ``(n, 2)`` array) when given, otherwise from the
+    spectral layout, so few iterations are needed to settle. Without SciPy,
+    graphs too large for a dense spectral solve start from random positions.
+    """
+    import numpy as np
+
+    if n == 0:
+        return np.zeros((0, 2), dtype=np.float32)
+    if init is None:
+        try:
+            init = spectral_layout(n, src, dst, seed=seed)
+        except ImportError:
+            init = np.random.default_rng(seed).uniform(-1, 1, size=(n, 2))
+    pos = np.asarray(init, dtype=np.float64) * np.sqrt(n)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    mass = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n) + 1.0
+    # Balance repulsion against attraction so a typical edge length is ~1.
+    kr = 1.0 / max(mass.mean(), 1.0)
+    gravity = 1.0 / np.sqrt(n)
+
+    step0 = np.sqrt(n) * 0.1
+    for it in range(iterations):
+        force = kr * _repulsion(pos, mass)
+        delta = pos[src] - pos[dst]
+        for k in (0, 1):
+            force[:, k] -= np.bincount(src, weights=delta[:, k], minlength=n)
+            force[:, k] += np.bincount(dst, weights=delta[:, k], minlength=n)
+        force -= gravity * mass[:, None] * pos / (np.linalg.norm(pos, axis=1, keepdims=True) + 1e-9)
+        step = step0 * (1.0 - it / iterations) + 1e-3
+        length = np.linalg.norm(force, axis=1, keepdims=True) + 1e-9
+        pos += force / length * np.minimum(length, step)
+    return _normalize(pos)
@@ -0,0 +1,122 @@
+"""Forward-hook profiling for :class:`~wigglystuff.module_tree.ModuleTreeWidget`.
+
+``profile_modules`` runs one forward pass with a pre-hook and a hook on every
+submodule and records, per module, its output shapes, the bytes of those
+outputs, the CPU wall time spent inside it (children included) and an
+estimate of the FLOPs of the layers whose cost has a closed form (linear and
+convolution layers). Containers report the FLOPs of everything under them.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+def _tensors(value: Any) -> list:
+    """Tensors in a (possibly nested) forward output."""
+    import torch
+
+    out, stack = [], [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, torch.Tensor):
+            out.append(item)
+        elif isinstance(item, (list, tuple)):
+            stack.extend(reversed(item))
+        elif isinstance(item, dict):
+            stack.extend(reversed(list(item.values())))
+    return out
+
+
+def _kernel_volume(module: Any) -> int:
+    volume = 1
+    for k in module.kernel_size:
+        volume *= k
+    return volume
+
+
+def estimate_flops(module: Any, inputs: tuple, outputs: list) -> int:
+    """Multiply-adds times two for one call of ``module``; 0 when unknown."""
+    import torch.nn as nn
+
+    if not outputs:
+        return 0
+    out = outputs[0]
+    if isinstance(module, nn.Linear):
+        return 2 * out.numel() * module.in_features
+    if isinstance(module, (nn.Conv1d, nn.Conv2d, nn.Conv3d)):
+        per_output = module.in_channels // module.groups * _kernel_volume(module)
+        return 2 * out.numel() * per_output
+    if isinstance(module, (nn.ConvTranspose1d, nn.ConvTranspose2d, nn.ConvTranspose3d)):
+        # Every input element is scattered through the kernel once.
+        inp = _tensors(inputs)
+        if not inp:
+            return 0
+        per_input = module.out_channels // module.groups * _kernel_volume(module)
+        return 2 * inp[0].numel() * per_input
+    return 0
+
+
+def profile_modules(model: Any, sample_input: Any) -> dict[int, dict]:
+    """Run ``model`` once on ``sample_input`` and profile every submodule.
+
+    ``sample_input`` is passed as the single positional argument, unpacked
+    when it is a tuple, or passed as keyword arguments when it is a dict.
+    Returns a dict keyed by ``id(module)`` with ``calls``, ``output_shapes``,
+    ``activation_bytes``, ``time_ms``, ``self_ms`` and ``flops``; modules
+    called more than once accumulate across calls. Runs under
+    ``torch.no_grad()``.
+    """
+    import torch
+
+    stats: dict[int, dict] = {}
+    started: dict[int, list[float]] = {}
+
+    def before(module, inputs):
+        started.setdefault(id(module), []).append(time.perf_counter())
+
+    def after(module, inputs, output):
+        elapsed = time.perf_counter() - started[id(module)].pop()
+        tensors = _tensors(output)
+        entry = stats.get(id(module))
+        if entry is None:
+            entry = stats[id(module)] = {
+                "calls": 0,
+                "output_shapes": [list(t.shape) for t in tensors],
+                "activation_bytes": 0,
+                "time_ms": 0.0,
+                "flops": 0,
+            }
+        entry["calls"] += 1
+        entry["activation_bytes"] += sum(t.numel() * t.element_size() for t in tensors)
+        entry["time_ms"] += elapsed * 1000.0
+        entry["flops"] += estimate_flops(module, inputs, tensors)
+
+    modules = list(model.modules())
+    handles = []
+    try:
+        for module in modules:
+            handles.append(module.register_forward_pre_hook(before))
+            handles.append(module.register_forward_hook(after))
+        with torch.no_grad():
+            if isinstance(sample_input, dict):
+                model(**sample_input)
+            elif isinstance(sample_input, tuple):
+                model(*sample_input)
+            else:
+                model(sample_input)
+    finally:
+        for handle in handles:
+            handle.remove()
+
+    # ``modules()`` lists parents before children, so walking it backwards
+    # folds child FLOPs into containers before those are read.
+    for module in reversed(modules):
+        entry = stats.get(id(module))
+        if entry is None:
+            continue
+        children = [stats[id(c)] for c in module.children() if id(c) in stats]
+        entry["self_ms"] = max(entry["time_ms"] - sum(c["time_ms"] for c in children), 0.0)
+        entry["flops"] += sum(c["flops"] for c in children)
+    return stats
@@ -11,12 +11,14 @@ omit ``value`` -- the widgets sum over their children.
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, Callable, Iterable, Mapping, Sequence
 
 
 Tree = dict[str, Any]
 Value = float | int | dict[str, float]
 EMPTY_TREE_ERROR = "tree must contain at least one leaf"
+# One hierarchy depth of a grouped dataframe: (names, parent rows, value columns).
+Level = tuple[list, list[int], list[list]]
 
 
 def _is_scalar(v: Any) -> bool:
@@ -137,16 +139,31 @@ def tree_from_paths(
     """Build a tree from a mapping of path strings to leaf values.
 
     Values can be a single number or a ``{col: number}`` dict (multi-column).
+    Internal nodes come back with their aggregated ``value`` filled in.
     """
     if not mapping:
         raise ValueError(EMPTY_TREE_ERROR)
-    root: Tree = {"name": root_name, "children": []}
+    builder = _TreeBuilder(root_name)
     for path, value in mapping.items():
         parts = [p for p in path.split(sep) if p]
         if not parts:
             raise ValueError(f"empty path in mapping (after splitting on {sep!r})")
-        _insert_leaf(root, parts, value)
-    return root
+        builder.insert(parts, value)
+    return builder.build()
+
+
+def _is_missing(value: Any) -> bool:
+    """``None``, NaN, NaT or pandas' ``NA``."""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:  # NA != NA is NA, which has no truth value.
+        return True
+
+
+def _missing_path_error(col: str, row: int) -> ValueError:
+    return ValueError(f"path column {col!r} is missing a value in row {row}")
 
 
 def tree_from_records(
@@ -166,6 +183,7 @@ def tree_from_records(
     - ``Sequence[str]``: multi-column dict tree, in the given order.
 
     Raises ``ValueError`` if a requested column is missing or non-numeric,
+    if a path column holds a missing value (``None``, NaN, NaT or ``NA``),
     or if auto-detection finds no numeric columns.
     """
     if not path_cols:
@@ -176,15 +194,20 @@ def tree_from_records(
     sample = records_list[0]
     single = isinstance(value_cols, str)
     resolved = _resolve_value_cols(sample, path_cols, value_cols)
-    root: Tree = {"name": root_name, "children": []}
-    for record in records_list:
-        parts = [str(record[col]) for col in path_cols]
+    builder = _TreeBuilder(root_name)
+    for row, record in enumerate(records_list):
+        parts = []
+        for col in path_cols:
+            part = record[col]
+            if _is_missing(part):
+                raise _missing_path_error(col, row)
+            parts.append(str(part))
         if single:
             value = record[resolved[0]]
         else:
             value = {col: record[col] for col in resolved}
-        _insert_leaf(root, parts, value)
-    return root
+        builder.insert(parts, value)
+    return builder.build()
 
 
 def tree_from_dataframe(
@@ -194,7 +217,19 @@ def tree_from_dataframe(
     value_cols: str | Sequence[str] | None = None,
     root_name: str = "root",
 ) -> Tree:
-    """Build a tree from a pandas or polars dataframe (duck-typed)."""
+    """Build a tree from a pandas or polars dataframe (duck-typed).
+
+    Polars and pandas frames are aggregated natively: one group-by per
+    hierarchy level sums the value columns, and the tree is assembled from
+    those (much smaller) aggregate frames, so rows are never turned into
+    Python dicts. Other objects with ``.to_dicts()`` or
+    ``.to_dict(orient='records')`` go through :func:`tree_from_records`.
+    """
+    # polars first -- it also has .to_dict
+    if hasattr(df, "to_dicts") and hasattr(df, "group_by"):
+        return _tree_from_frame(df, path_cols, value_cols, root_name, _polars_levels)
+    if hasattr(df, "to_dict") and hasattr(df, "groupby"):
+        return _tree_from_frame(df, path_cols, value_cols, root_name, _pandas_levels)
     if hasattr(df, "to_dicts"):
         records = df.to_dicts()
     elif hasattr(df, "to_dict"):
@@ -209,6 +244,169 @@ def tree_from_dataframe(
     )
 
 
+def _tree_from_frame(
+    df: Any,
+    path_cols: Sequence[str],
+    value_cols: str | Sequence[str] | None,
+    root_name: str,
+    levels: Callable[..., list[Level]],
+) -> Tree:
+    """Assemble a tree from per-level aggregates computed by ``levels``.
+
+    ``levels(df, path_cols, value_cols, as_float)`` returns one
+    ``(names, parents, values)`` triple per depth, in first-seen order -- the
+    same sibling order :func:`tree_from_records` produces. ``parents[i]`` is
+    the row of the group's parent in the level above, so assembling the tree
+    is a single append per group.
+    """
+    if not path_cols:
+        raise ValueError("path_cols must be a non-empty sequence")
+    if len(df) == 0:
+        raise ValueError("records is empty")
+    head = df.head(1)
+    if hasattr(head, "to_dicts"):
+        sample = head.to_dicts()[0]
+    else:
+        sample = head.to_dict(orient="records")[0]
+    single = isinstance(value_cols, str)
+    resolved = _resolve_value_cols(sample, path_cols, value_cols)
+
+    root: Tree = {"name": root_name, "children": []}
+    above = [root]
+    depth = len(path_cols)
+    for k, (names, parents, values) in enumerate(
+        levels(df, path_cols, resolved, not single)
+    ):
+        leaf = k == depth - 1
+        if single:
+            row_values: Iterable[Any] = values[0]
+        else:
+            row_values = (dict(zip(resolved, row)) for row in zip(*values))
+        here = []
+        for name, parent, value in zip(names, parents, row_values):
+            node: Tree = {"name": name, "value": value}
+            if not leaf:
+                node["children"] = []
+            above[parent]["children"].append(node)
+            here.append(node)
+        above = here
+    top = [c["value"] for c in root["children"]]
+    if single:
+        root["value"] = sum(top)
+    else:
+        root["value"] = {col: sum(v[col] for v in top) for col in resolved}
+    return root
+
+
+def _polars_levels(
+    df: Any, path_cols: Sequence[str], value_cols: list[str], as_float: bool
+) -> list[Level]:
+    import polars as pl
+
+    depth = len(path_cols)
+    names = []
+    for c in path_cols:
+        col = df.get_column(c)
+        missing = col.is_null() | col.is_nan() if col.dtype.is_float() else col.is_null()
+        if missing.any():
+            raise _missing_path_error(c, int(missing.arg_true()[0]))
+        # str() of each distinct value, as tree_from_records names nodes;
+        # a polars cast would spell booleans and datetimes differently.
+        seen = col.unique(maintain_order=True)
+        labels = pl.Series([str(v) for v in seen.to_list()], dtype=pl.Utf8)
+        names.append(pl.col(c).replace_strict(seen, labels, return_dtype=pl.Utf8))
+    frame = df.select(
+        names
+        + [pl.col(c).cast(pl.Float64) if as_float else pl.col(c) for c in value_cols]
+    )
+    nulls = frame.filter(pl.any_horizontal(pl.col(value_cols).is_null()))
+    if len(nulls):
+        parts = list(nulls.row(0)[:depth])
+        raise ValueError(f"value at {parts} must be numeric, got None")
+    dupes = frame.filter(pl.struct(path_cols).is_duplicated())
+    if len(dupes):
+        raise ValueError(f"duplicate leaf at path {list(dupes.row(0)[:depth])}")
+
+    out = []
+    prev = None
+    for k in range(1, depth + 1):
+        keys = list(path_cols[:k])
+        agg = frame
+        if k < depth:
+            agg = frame.group_by(keys, maintain_order=True).agg(
+                pl.col(value_cols).sum()
+            )
+        if prev is None:
+            parents = [0] * len(agg)
+        else:
+            parents = (
+                agg.select(keys[:-1])
+                .join(
+                    prev.select(keys[:-1]).with_row_index("__parent"),
+                    on=keys[:-1],
+                    how="left",
+                    maintain_order="left",
+                )["__parent"]
+                .to_list()
+            )
+        out.append(
+            (agg[keys[-1]].to_list(), parents, [agg[c].to_list() for c in value_cols])
+        )
+        prev = agg
+    return out
+
+
+def _pandas_levels(
+    df: Any, path_cols: Sequence[str], value_cols: list[str], as_float: bool
+) -> list[Level]:
+    import numpy as np
+
+    depth = len(path_cols)
+    for c in path_cols:
+        missing = df[c].isna().to_numpy()
+        if missing.any():
+            raise _missing_path_error(c, int(missing.argmax()))
+    # Series.map(str) hands Timestamps to str() like the records path does;
+    # .astype(str) would drop the time from datetime columns.
+    frame = df[list(path_cols)].apply(lambda col: col.map(str))
+    for c in value_cols:
+        # NaN in a NumPy float column is a number, as it is for polars and
+        # records; None or NA elsewhere would become NaN on conversion.
+        dtype = df[c].dtype
+        plain_float = isinstance(dtype, np.dtype) and dtype.kind == "f"
+        missing = None if plain_float else df[c].isna().to_numpy()
+        if missing is not None and missing.any():
+            parts = frame.iloc[int(missing.argmax()), :depth].tolist()
+            raise ValueError(f"value at {parts} must be numeric, got None")
+        # .to_numpy() sidesteps index alignment (the index may repeat).
+        frame[c] = df[c].to_numpy(dtype=float) if as_float else df[c].to_numpy()
+    dupes = frame.duplicated(list(path_cols))
+    if dupes.any():
+        parts = frame.loc[dupes, list(path_cols)].iloc[0].tolist()
+        raise ValueError(f"duplicate leaf at path {parts}")
+
+    out = []
+    prev = None
+    for k in range(1, depth + 1):
+        keys = list(path_cols[:k])
+        agg = frame
+        if k < depth:
+            agg = frame.groupby(keys, sort=False, as_index=False)[value_cols].sum()
+        if prev is None:
+            parents = [0] * len(agg)
+        else:
+            rows = prev[keys[:-1]].assign(__parent=range(len(prev)))
+            # A left merge keeps the left frame's row order.
+            parents = agg[keys[:-1]].merge(rows, on=keys[:-1], how="left")[
+                "__parent"
+            ].tolist()
+        out.append(
+            (agg[keys[-1]].tolist(), parents, [agg[c].tolist() for c in value_cols])
+        )
+        prev = agg
+    return out
+
+
 def _resolve_value_cols(
     sample: Mapping[str, Any],
     path_cols: Sequence[str],
@@ -241,27 +439,204 @@ def _resolve_value_cols(
     return requested
 
 
-def _insert_leaf(root: Tree, parts: list[str], value: Any) -> None:
-    if isinstance(value, Mapping):
-        if not _is_value_dict(value):
-            raise ValueError(f"value at {parts} must be a dict of numbers, got {value!r}")
-        coerced: Any = {str(k): float(v) for k, v in value.items()}
-    elif _is_scalar(value):
-        coerced = value
-    else:
-        raise ValueError(f"value at {parts} must be numeric, got {value!r}")
-    node = root
-    for part in parts[:-1]:
-        children = node.setdefault("children", [])
-        match = next((c for c in children if c.get("name") == part), None)
-        if match is None:
-            match = {"name": part, "children": []}
-            children.append(match)
-        elif "children" not in match:
-            raise ValueError(f"path {parts} conflicts with existing leaf at {part!r}")
-        node = match
-    leaf_name = parts[-1]
-    siblings = node.setdefault("children", [])
-    if any(c.get("name") == leaf_name for c in siblings):
-        raise ValueError(f"duplicate leaf at path {parts}")
-    siblings.append({"name": leaf_name, "value": coerced})
+class _BuiltTree:
+    """A tree a widget's ``from_*`` constructor built and passed straight in.
+
+    ``tree_from_*`` validates while inserting and fills in aggregated values,
+    and nobody else holds a reference to the result, so the widget takes it
+    as-is instead of deep-copying, validating and aggregating it again.
+    Trees handed in by callers are always copied and checked.
+    """
+
+    __slots__ = ("tree",)
+
+    def __init__(self, tree: Tree) -> None:
+        self.tree = tree
+
+
+class _TreeBuilder:
+    """Collect leaves under a name-indexed trie, then emit the tree dict once.
+
+    Each branch is a ``{name: child}`` dict, so finding a child or spotting a
+    duplicate is one lookup rather than a scan over its siblings. Leaves are
+    stored as 1-tuples ``(value,)`` to tell them apart from branches, since a
+    multi-column value is itself a dict.
+    """
+
+    def __init__(self, root_name: str) -> None:
+        self.root_name = root_name
+        self._root: dict[str, Any] = {}
+        self._mode: str | None = None
+
+    def insert(self, parts: list[str], value: Any) -> None:
+        if isinstance(value, Mapping):
+            if not _is_value_dict(value):
+                raise ValueError(
+                    f"value at {parts} must be a dict of numbers, got {value!r}"
+                )
+            coerced: Any = {str(k): float(v) for k, v in value.items()}
+            mode = "dict"
+        elif _is_scalar(value):
+            coerced = value
+            mode = "scalar"
+        else:
+            raise ValueError(f"value at {parts} must be numeric, got {value!r}")
+        if self._mode is None:
+            self._mode = mode
+        elif mode != self._mode:
+            raise ValueError(
+                f"tree mixes scalar and dict values (at {parts}); "
+                "choose one representation"
+            )
+        node = self._root
+        for part in parts[:-1]:
+            match = node.get(part)
+            if match is None:
+                match = node[part] = {}
+            elif type(match) is tuple:
+                raise ValueError(
+                    f"path {parts} conflicts with existing leaf at {part!r}"
+                )
+            node = match
+        leaf_name = parts[-1]
+        if leaf_name in node:
+            raise ValueError(f"duplicate leaf at path {parts}")
+        node[leaf_name] = (coerced,)
+
+    def build(self) -> Tree:
+        """Emit the tree, summing values into internal nodes on the way up."""
+        if not self._root:
+            raise ValueError(EMPTY_TREE_ERROR)
+        return _emit_branch(self.root_name, self._root)
+
+
+def _emit_branch(name: str, branch: dict[str, Any]) -> Tree:
+    children = []
+    total: Any = None
+    for child_name, child in branch.items():
+        if type(child) is tuple:
+            value = child[0]
+            children.append({"name": child_name, "value": value})
+        else:
+            node = _emit_branch(child_name, child)
+            value = node["value"]
+            children.append(node)
+        if isinstance(value, dict):
+            if total is None:
+                total = {}
+            for k, x in value.items():
+                total[k] = total.get(k, 0) + x
+        else:
+            total = (total or 0) + value
+    return {"name": name, "children": children, "value": total}
+
+
+class TreeIndex:
+    """Find nodes of a tree dict by path in ``O(depth)``.
+
+    A path starts with the root's name, matching the ``*_path`` traits the
+    widgets sync. Each node's ``{name: child}`` map is built the first time a
+    lookup passes through it, so only the parts of the tree that are actually
+    visited are indexed.
+    """
+
+    def __init__(self, tree: Tree) -> None:
+        self.tree = tree
+        self._names: dict[int, dict[str, Tree]] = {}
+
+    def find(self, path: Sequence[str]) -> Tree | None:
+        """Return the node at ``path``, or ``None`` if there is none."""
+        if not path or path[0] != self.tree.get("name"):
+            return None
+        node = self.tree
+        for part in path[1:]:
+            names = self._names.get(id(node))
+            if names is None:
+                names = {c["name"]: c for c in node.get("children") or []}
+                self._names[id(node)] = names
+            node = names.get(part)
+            if node is None:
+                return None
+        return node
+
+
+class LazyTree:
+    """Server side of the tree widgets' ``lazy`` mode.
+
+    Holds the full (prepared) tree and hands the browser pruned copies: a node
+    at the cut keeps its ``value`` and ``display`` but swaps ``children`` for
+    ``"lazy": True``. :meth:`load` returns the subtrees the browser is missing
+    for a path, and remembers which nodes' children have been sent so each
+    subtree crosses the wire once. That memory covers every view of the
+    widget, since updates go to all of them; a newly mounted view asks for a
+    :meth:`reset` back to what :meth:`initial` returned.
+    """
+
+    def __init__(self, tree: Tree) -> None:
+        self.index = TreeIndex(tree)
+        self._loaded: set[tuple[str, ...]] = set()
+        self._depth = 0
+
+    def initial(self, depth: int) -> Tree:
+        """Return the tree down to ``depth`` levels below the root."""
+        self._loaded.clear()
+        self._depth = depth
+        tree = self.index.tree
+        return self._copy(tree, (tree["name"],), depth)
+
+    def reset(self) -> None:
+        """Forget every subtree sent since :meth:`initial`."""
+        self.initial(self._depth)
+
+    def load(self, path: Sequence[str], depth: int) -> list[dict]:
+        """Return ``{"path", "children"}`` updates so the browser has every
+        ancestor of ``path`` and everything down to ``depth`` levels below it.
+
+        Updates are ordered parents first, so each one can be grafted onto a
+        node the browser already has. Unknown paths yield no updates.
+        """
+        path = tuple(path)
+        node = self.index.find(path)
+        if node is None:
+            return []
+        updates: list[dict] = []
+        for i in range(1, len(path)):
+            self._send(path[:i], self.index.find(path[:i]), 0, updates)
+        self._walk(node, path, depth, updates)
+        return updates
+
+    def _walk(self, node: Tree, path: tuple, depth: int, updates: list) -> None:
+        children = node.get("children")
+        if not children or depth <= 0:
+            return
+        if path not in self._loaded:
+            self._send(path, node, depth - 1, updates)
+            return
+        for child in children:
+            self._walk(child, path + (child["name"],), depth - 1, updates)
+
+    def _send(self, path: tuple, node: Tree, depth: int, updates: list) -> None:
+        if path in self._loaded or not node.get("children"):
+            return
+        self._loaded.add(path)
+        updates.append(
+            {
+                "path": list(path),
+                "children": [
+                    self._copy(c, path + (c["name"],), depth) for c in node["children"]
+                ],
+            }
+        )
+
+    def _copy(self, node: Tree, path: tuple, depth: int) -> Tree:
+        out = {k: v for k, v in node.items() if k != "children"}
+        children = node.get("children")
+        if children:
+            if depth > 0:
+                self._loaded.add(path)
+                out["children"] = [
+                    self._copy(c, path + (c["name"],), depth - 1) for c in children
+                ]
+            else:
+                out["lazy"] = True
+        return out
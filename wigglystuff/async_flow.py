@@ -1,23 +1,370 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
+import json
+import os
+import re
 import sys
+import threading
 import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from typing import IO, Any, Callable, Iterable
 
 import anywidget
 import traitlets
 
 
+# Event kinds, stored in the ring as their index.
+_KINDS = ("SPAWN", "SUSPEND", "RESUME", "RETURN", "DONE", "BLOCK", "SUBMIT", "START", "FINISH")
+(
+    _SPAWN, _SUSPEND, _RESUME, _RETURN, _DONE, _BLOCK, _SUBMIT, _START, _FINISH,
+) = range(len(_KINDS))
+# Executor jobs live on their own thread lanes and don't count as loop time.
+_EXECUTOR_KINDS = ("SUBMIT", "START", "FINISH")
+_OFF_TIMELINE = frozenset(("BLOCK", *_EXECUTOR_KINDS))
+# Detail of a BLOCK event, e.g. "blocked 412.3ms since line 18".
+_BLOCK_DETAIL = re.compile(r"blocked ([0-9.]+)ms(?: since line (\d+))?")
+# Detail of a START event, e.g. "job 3 queued 12.5ms on thread 140211".
+_START_DETAIL = re.compile(r"job (\d+) queued ([0-9.]+)ms on thread (\d+)")
+
+
+def _callable_name(func: Any) -> str:
+    # Unwrap functools.partial layers, including asyncio.to_thread's
+    # partial(context.run, func, ...), to name the function the user passed.
+    while isinstance(func, functools.partial):
+        inner = func.func
+        if getattr(inner, "__self__", None).__class__ is contextvars.Context and func.args:
+            func = func.args[0]
+        else:
+            func = inner
+    return getattr(func, "__qualname__", None) or type(func).__name__
+
+
+class _EventRing:
+    """Struct-of-arrays event store that keeps at most ``capacity`` events.
+
+    Each column is a typed ``array``; coroutine and task names are interned to
+    small ints and the (rare) ``detail`` strings live in a dict keyed by
+    sequence number. Once full, the oldest events are overwritten. Events are
+    addressed by a monotonically increasing sequence number, ``total`` being
+    the next one to be written. ``capacity=None`` never wraps.
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"max_events must be positive, got {capacity}")
+        self.capacity = capacity
+        self.t = array("d")
+        self.kind = array("b")
+        self.coro = array("i")
+        self.task = array("i")
+        self.line = array("i")  # -1 for "no line"
+        self.detail: dict[int, str] = {}
+        self.names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self.total = 0
+
+    def intern(self, name: str) -> int:
+        idx = self._name_ids.get(name)
+        if idx is None:
+            idx = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return idx
+
+    @property
+    def start(self) -> int:
+        """Sequence number of the oldest event still held."""
+        if self.capacity is None:
+            return 0
+        return max(0, self.total - self.capacity)
+
+    def append(
+        self, t: float, kind: int, coro: int, task: int, line: int, detail: str | None
+    ) -> None:
+        seq = self.total
+        cap = self.capacity
+        if cap is None or seq < cap:
+            self.t.append(t)
+            self.kind.append(kind)
+            self.coro.append(coro)
+            self.task.append(task)
+            self.line.append(line)
+        else:
+            slot = seq % cap
+            self.t[slot] = t
+            self.kind[slot] = kind
+            self.coro[slot] = coro
+            self.task[slot] = task
+            self.line[slot] = line
+            self.detail.pop(seq - cap, None)
+        if detail is not None:
+            self.detail[seq] = detail
+        self.total = seq + 1
+
+    def rows(self, begin: int, t0: float) -> list[dict[str, Any]]:
+        """Materialize events ``begin..total`` (clamped to what is held) as dicts."""
+        cap = self.capacity
+        names, detail = self.names, self.detail
+        out = []
+        for seq in range(max(begin, self.start), self.total):
+            slot = seq if cap is None else seq % cap
+            line = self.line[slot]
+            out.append({
+                "t_ms": round((self.t[slot] - t0) * 1000, 1),
+                "coro": names[self.coro[slot]],
+                "event": _KINDS[self.kind[slot]],
+                "task": names[self.task[slot]],
+                "line": None if line < 0 else line,
+                "detail": detail.get(seq),
+            })
+        return out
+
+
+class _Timeline:
+    """Per-task run/wait segments derived from an event list with NumPy.
+
+    Mirrors the widget's own lane building: a task runs from ``RESUME`` or
+    ``RETURN`` until its next event, waits from ``SUSPEND`` until its next
+    event, and stops at ``DONE``. From ``SPAWN`` until its first step (a
+    ``RESUME`` with detail ``"start"``) it is only queued on the loop. A task
+    with no ``DONE`` yet stays open until ``end_ms``.
+    """
+
+    def __init__(self, events: list[dict[str, Any]], end_ms: float) -> None:
+        import numpy as np
+
+        # Block markers annotate a run segment; they don't start a new one.
+        # Executor jobs run off the loop and are summarized separately.
+        events = [e for e in events if e["event"] not in _OFF_TIMELINE]
+        n = len(events)
+        kind_of = {name: i for i, name in enumerate(_KINDS)}
+        t = np.fromiter((e["t_ms"] for e in events), dtype=float, count=n)
+        kind = np.fromiter((kind_of.get(e["event"], -1) for e in events), dtype=np.int8, count=n)
+        line = np.fromiter(
+            (-1 if e["line"] is None else e["line"] for e in events), dtype=np.int64, count=n
+        )
+        task_ids: dict[str, int] = {}
+        coro_ids: dict[str, int] = {}
+        task = np.fromiter(
+            (task_ids.setdefault(e["task"], len(task_ids)) for e in events), dtype=np.int64, count=n
+        )
+        coro = np.fromiter(
+            (coro_ids.setdefault(e["coro"], len(coro_ids)) for e in events), dtype=np.int64, count=n
+        )
+        self.task_names, self.coro_names = list(task_ids), list(coro_ids)
+        self.end_ms = max(end_ms, float(t.max())) if n else end_ms
+
+        # Group each task's events together, keeping their recorded order.
+        order = np.argsort(task, kind="stable")
+        t, kind, line, task, coro = t[order], kind[order], line[order], task[order], coro[order]
+        first = np.ones(n, dtype=bool)
+        first[1:] = task[1:] != task[:-1]
+        last = np.ones(n, dtype=bool)
+        last[:-1] = first[1:]
+
+        seg_end = np.empty(n)
+        seg_end[:-1] = t[1:]
+        seg_end[last] = self.end_ms
+        dur = np.maximum(seg_end - t, 0.0)
+        self.run = np.isin(kind, (_RESUME, _RETURN))
+        self.wait = kind == _SUSPEND
+        self.seg_start, self.seg_end, self.dur = t, seg_end, dur
+        self.seg_task, self.seg_coro, self.seg_line = task, coro, line
+
+        n_tasks = len(self.task_names)
+        self.task_start = t[first]
+        # Tasks that never finished are alive until end_ms.
+        self.task_end = np.full(n_tasks, self.end_ms)
+        done = kind == _DONE
+        self.task_end[task[done]] = t[done]
+        # A task is attributed to the coroutine it was spawned with, falling
+        # back to its first event when the SPAWN was not captured.
+        self.task_coro = coro[first]
+        spawn = kind == _SPAWN
+        self.task_coro[task[spawn]] = coro[spawn]
+
+    def intervals(self, mask: Any) -> tuple[Any, Any]:
+        return self.seg_start[mask], self.seg_end[mask]
+
+
+def _union(starts: Any, ends: Any) -> tuple[Any, Any]:
+    """Merge overlapping intervals into sorted, disjoint ones."""
+    import numpy as np
+
+    if not len(starts):
+        return starts, ends
+    order = np.argsort(starts, kind="stable")
+    starts = starts[order]
+    reach = np.maximum.accumulate(ends[order])
+    opens = np.ones(len(starts), dtype=bool)
+    opens[1:] = starts[1:] > reach[:-1]
+    closes = np.append(np.flatnonzero(opens)[1:] - 1, len(starts) - 1)
+    return starts[opens], reach[closes]
+
+
+def _busy_before(starts: Any, ends: Any, at: Any) -> Any:
+    """Total interval length before each time in ``at``.
+
+    ``starts``/``ends`` are the sorted endpoints of non-negative intervals; the
+    sum of ``clip(t - start, 0, end - start)`` splits into the two prefix sums.
+    """
+    import numpy as np
+
+    def before(points: Any) -> Any:
+        k = np.searchsorted(points, at, side="right")
+        prefix = np.concatenate([[0.0], np.cumsum(points)])
+        return k * at - prefix[k]
+
+    return before(starts) - before(ends)
+
+
+def _worst_blocks(blocks: list[dict[str, Any]], n: int) -> list[dict[str, Any]]:
+    """Group block spans by ``(coro, line)`` and rank them by total time.
+
+    Each entry has ``coro``, ``line`` (the ``await`` that finally yielded),
+    ``count``, ``total_ms`` and ``max_ms``, plus ``from_line`` (where the
+    longest span resumed) and that span's start ``t_ms``.
+    """
+    sites: dict[tuple[str, int | None], dict[str, Any]] = {}
+    for block in blocks:
+        key = (block["coro"], block["line"])
+        site = sites.get(key)
+        if site is None:
+            site = sites[key] = {
+                "coro": block["coro"], "line": block["line"], "count": 0,
+                "total_ms": 0.0, "max_ms": -1.0, "from_line": None, "t_ms": None,
+            }
+        site["count"] += 1
+        site["total_ms"] = round(site["total_ms"] + block["duration_ms"], 1)
+        if block["duration_ms"] > site["max_ms"]:
+            site["max_ms"] = block["duration_ms"]
+            site["from_line"] = block["from_line"]
+            site["t_ms"] = block["t_ms"]
+    return sorted(sites.values(), key=lambda site: -site["total_ms"])[:n]
+
+
+class _ChromeTraceWriter:
+    """Incrementally write events as Trace Event Format JSON (Chrome/Perfetto).
+
+    Each task becomes a thread: running stretches are ``B``/``E`` slices named
+    after the coroutine, suspensions are slices named after the ``await`` line,
+    blocking runs are complete (``X``) slices and ``DONE`` is an instant.
+    Executor worker threads get their own thread with one slice per job. The
+    file is a JSON array that is valid once ``close()`` has run; Perfetto and
+    ``chrome://tracing`` also load it mid-run, when the closing bracket is
+    still missing.
+    """
+
+    def __init__(self, fh: IO[str]) -> None:
+        self._fh = fh
+        self._pid = os.getpid()
+        self._tids: dict[str, int] = {}
+        self._open: set[str] = set()
+        self._first = True
+        fh.write("[")
+        self._emit({"ph": "M", "name": "process_name", "pid": self._pid, "args": {"name": "asyncflow"}})
+
+    def _emit(self, obj: dict[str, Any]) -> None:
+        self._fh.write(("\n" if self._first else ",\n") + json.dumps(obj, separators=(",", ":")))
+        self._first = False
+
+    def write(self, events: Iterable[dict[str, Any]]) -> None:
+        pid = self._pid
+        for e in events:
+            task = e["task"]
+            tid = self._tids.get(task)
+            kind = e["event"]
+            if tid is None:
+                tid = self._tids[task] = len(self._tids) + 1
+                label = task if kind in _EXECUTOR_KINDS else f"{e['coro']} ({task})"
+                self._emit({
+                    "ph": "M", "name": "thread_name", "pid": pid, "tid": tid,
+                    "args": {"name": label},
+                })
+            ts = round(e["t_ms"] * 1000)
+            if kind == "SUBMIT":
+                self._emit({
+                    "ph": "i", "s": "t", "name": f"submit {e['coro']}", "cat": "executor",
+                    "pid": pid, "tid": tid, "ts": ts, "args": {"detail": e["detail"]},
+                })
+                continue
+            if kind == "BLOCK":
+                m = _BLOCK_DETAIL.match(e["detail"] or "")
+                dur = round(float(m.group(1)) * 1000) if m else 0
+                self._emit({
+                    "ph": "X", "name": "blocked loop", "cat": "block", "pid": pid, "tid": tid,
+                    "ts": ts - dur, "dur": dur, "args": {"line": e["line"], "detail": e["detail"]},
+                })
+                continue
+            if task in self._open:
+                self._open.discard(task)
+                self._emit({"ph": "E", "pid": pid, "tid": tid, "ts": ts})
+            if kind == "SUSPEND":
+                self._open.add(task)
+                self._emit({
+                    "ph": "B", "name": f"await line {e['line']}", "cat": "await",
+                    "pid": pid, "tid": tid, "ts": ts, "args": {"coro": e["coro"], "line": e["line"]},
+                })
+            elif kind == "DONE":
+                self._emit({
+                    "ph": "i", "s": "t", "name": "done", "pid": pid, "tid": tid, "ts": ts,
+                    "args": {"detail": e["detail"]},
+                })
+            elif kind == "FINISH":
+                continue
+            else:
+                self._open.add(task)
+                args = {"detail": e["detail"]} if e["detail"] else {}
+                self._emit({
+                    "ph": "B", "name": e["coro"], "cat": "executor" if kind == "START" else "run",
+                    "pid": pid, "tid": tid, "ts": ts, "args": args,
+                })
+        self._fh.flush()
+
+    def close(self, end_ms: float) -> None:
+        """End every still-open slice at ``end_ms`` and terminate the array."""
+        ts = round(end_ms * 1000)
+        for task in sorted(self._open, key=self._tids.__getitem__):
+            self._emit({"ph": "E", "pid": self._pid, "tid": self._tids[task], "ts": ts})
+        self._open.clear()
+        self._fh.write("\n]\n")
+        self._fh.flush()
+
+
 class AsyncFlowLogger:
     """Capture the event stream of an async run on the running event loop.
 
     Records task **spawn**, **suspend** (at an ``await``), **resume**, **return**,
-    and **done** events into ``self.events`` — a list of dicts shaped like
-    ``{"t_ms", "coro", "event", "task", "line", "detail"}``. Each event is also
-    pushed to ``on_event`` the instant it is recorded (the live hook the widget
-    uses to stream into the browser).
+    and **done** events. The hot path only appends to a compact ring buffer
+    (typed arrays with interned names); events are turned into dicts shaped like
+    ``{"t_ms", "coro", "event", "task", "line", "detail"}`` in batches, by
+    ``flush()`` or when ``self.events`` is read. With an ``on_event`` hook, a
+    flush happens at most every ``flush_ms`` while recording, and each flushed
+    event is passed to it.
+
+    ``max_events`` bounds memory on very long runs: only the most recent events
+    are kept, and ``dropped`` counts the ones that were overwritten before they
+    were flushed. Pair it with ``trace_path`` to stream every flushed batch to
+    a Chrome Trace Event Format file (open it in Perfetto), so a multi-minute
+    run keeps its full history on disk rather than in memory.
+
+    Work handed to a thread pool with ``loop.run_in_executor`` or
+    ``asyncio.to_thread`` is captured too: **submit** on the calling task, then
+    **start** and **finish** on a lane named after the worker thread. The start
+    event's detail carries the job number, how long it sat in the executor's
+    queue, and the thread id. Process pools are passed through untouched.
+
+    With ``block_ms`` set, a task that runs longer than that between starting
+    or resuming and its next ``await`` (or return) is holding the event loop
+    (including before its first ``await``, or in a coroutine that never
+    awaits): the span is
+    recorded as a **block** event at the line where it finally yielded, and
+    kept in ``blocks``. ``blocking_calls()`` ranks the offending lines.
 
     Only coroutines whose source file is in ``files`` are logged, which keeps
     asyncio's own internals — and this module's code — out of the stream. The
@@ -32,6 +379,11 @@ class AsyncFlowLogger:
         self,
         files: Iterable[str],
         on_event: Callable[[dict[str, Any]], None] | None = None,
+        *,
+        max_events: int | None = None,
+        flush_ms: float = 100,
+        block_ms: float | None = None,
+        trace_path: str | os.PathLike[str] | None = None,
     ) -> None:
         self._files = set(files)
         # sys.monitoring tool id claimed for the duration of a run; chosen from
@@ -40,10 +392,32 @@ class AsyncFlowLogger:
         # Code objects of coroutines we've seen spawned as tracked tasks. Only
         # these get fine-grained suspend/resume events — this excludes the
         # caller frame (e.g. the notebook cell awaiting us), which shares the
-        # file but is not a task we drive.
-        self._codes: set[Any] = set()
+        # file but is not a task we drive. Each maps to its interned qualname.
+        self._codes: dict[Any, int] = {}
+        # Per-code-object bytecode offset -> line tables, built on first use.
+        self._line_tables: dict[Any, dict[int, int]] = {}
         self._on_event = on_event
-        self.events: list[dict[str, Any]] = []
+        self._trace_path = trace_path
+        self._trace: _ChromeTraceWriter | None = None
+        self._trace_fh: IO[str] | None = None
+        self._ring = _EventRing(max_events)
+        self._events: list[dict[str, Any]] = []
+        self._flushed = 0
+        self._flush_s = flush_ms / 1000
+        self._last_flush = 0.0
+        self.dropped = 0
+        self._block_s = None if block_ms is None else block_ms / 1000
+        # Task name -> (perf_counter, line) of the resume that started its
+        # current run; only the outermost resume of a nested chain is kept.
+        self._resumed: dict[str, tuple[float, int]] = {}
+        # Task name -> tracked frames of the task currently on the stack.
+        self._depth: dict[str, int] = {}
+        self.blocks: list[dict[str, Any]] = []
+        # Executor job events, appended from worker threads (deque appends are
+        # atomic) and moved into the ring on the loop thread by flush().
+        self._thread_events: deque[tuple[float, int, int, str, str]] = deque()
+        self._jobs = 0
+        self._loop_run_in_executor: Callable[..., asyncio.Future] | None = None
         self._t0: float | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
 
@@ -59,27 +433,63 @@ class AsyncFlowLogger:
             return "root"
         return task.get_name() if task is not None else "root"
 
-    @staticmethod
-    def _line_of(code: Any, offset: int) -> int | None:
-        for start, end, lineno in code.co_lines():
-            if lineno is not None and start <= offset < end:
-                return lineno
-        return None
+    def _line_of(self, code: Any, offset: int) -> int:
+        table = self._line_tables.get(code)
+        if table is None:
+            table = self._line_tables[code] = {}
+            for start, end, lineno in code.co_lines():
+                if lineno is not None:
+                    for off in range(start, end, 2):
+                        table[off] = lineno
+        return table.get(offset, -1)
 
     def _record(
-        self, coro: str, event: str, task: str, line: int | None = None, detail: str | None = None
+        self, coro: int, kind: int, task: str, line: int = -1, detail: str | None = None
     ) -> None:
-        entry = {
-            "t_ms": self.now_ms(),
-            "coro": coro,
-            "event": event,
-            "task": task,
-            "line": line,
-            "detail": detail,
-        }
-        self.events.append(entry)
+        t = time.perf_counter()
+        self._ring.append(t, kind, coro, self._ring.intern(task), line, detail)
+        if (
+            self._on_event is not None or self._trace is not None
+        ) and t - self._last_flush >= self._flush_s:
+            self.flush()
+
+    @property
+    def recorded(self) -> int:
+        """Number of events recorded so far, including dropped ones."""
+        return self._ring.total
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        """Every retained event as a dict, oldest first (flushes pending ones)."""
+        self.flush()
+        return self._events
+
+    def flush(self) -> list[dict[str, Any]]:
+        """Materialize the events recorded since the last flush and return them.
+
+        Each one is appended to ``events``, passed to ``on_event`` and written
+        to ``trace_path``.
+        """
+        ring = self._ring
+        self._last_flush = time.perf_counter()
+        pending = self._thread_events
+        while pending:
+            t, kind, coro, thread, detail = pending.popleft()
+            ring.append(t, kind, coro, ring.intern(thread), -1, detail)
+        if self._flushed == ring.total:
+            return []
+        self.dropped += max(0, ring.start - self._flushed)
+        batch = ring.rows(self._flushed, self._t0 or 0.0)
+        self._flushed = ring.total
+        self._events.extend(batch)
+        if ring.capacity is not None and len(self._events) > ring.capacity:
+            del self._events[: len(self._events) - ring.capacity]
+        if self._trace is not None:
+            self._trace.write(batch)
         if self._on_event is not None:
-            self._on_event(entry)
+            for entry in batch:
+                self._on_event(entry)
+        return batch
 
     # -- task factory ------------------------------------------------------
     def _task_factory(self, loop: Any, coro: Any, **kwargs: Any) -> asyncio.Task:
@@ -87,40 +497,169 @@ class AsyncFlowLogger:
         code = getattr(coro, "cr_code", None)
         if code is None or code.co_filename not in self._files:
             return task
-        self._codes.add(code)
-        name = getattr(coro, "__qualname__", str(coro))
-        self._record(name, "SPAWN", task.get_name(), detail=f"by {self._current_task_name()}")
+        name = self._ring.intern(getattr(coro, "__qualname__", str(coro)))
+        if code not in self._codes and self._tool_id is not None:
+            # PY_START was disabled for code we were not tracking yet.
+            sys.monitoring.restart_events()
+        self._codes[code] = name
+        self._record(name, _SPAWN, task.get_name(), detail=f"by {self._current_task_name()}")
 
-        def _on_done(t: asyncio.Task, coro_name: str = name) -> None:
+        def _on_done(t: asyncio.Task, coro_name: int = name) -> None:
             if t.cancelled():
                 detail = "cancelled"
             elif t.exception() is not None:
                 detail = f"raised {type(t.exception()).__name__}"
             else:
                 detail = repr(t.result())
-            self._record(coro_name, "DONE", t.get_name(), detail=detail)
+            self._record(coro_name, _DONE, t.get_name(), detail=detail)
 
         task.add_done_callback(_on_done)
         return task
 
+    # -- executor hook ----------------------------------------------------
+    def _hook_executor(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Shadow the bound method on this loop instance only; loops that don't
+        # allow it (e.g. compiled ones) simply go without executor lanes.
+        self._loop_run_in_executor = loop.run_in_executor
+        try:
+            loop.run_in_executor = self._run_in_executor  # type: ignore[method-assign]
+        except AttributeError:
+            self._loop_run_in_executor = None
+
+    def _unhook_executor(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop_run_in_executor is not None:
+            vars(loop).pop("run_in_executor", None)
+            self._loop_run_in_executor = None
+
+    def _run_in_executor(self, executor: Any, func: Any, *args: Any) -> asyncio.Future:
+        run = self._loop_run_in_executor
+        if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+            return run(executor, func, *args)
+        self._jobs += 1
+        job = self._jobs
+        name = self._ring.intern(_callable_name(func))
+        submitted = time.perf_counter()
+        self._record(name, _SUBMIT, self._current_task_name(), detail=f"job {job}")
+        pending = self._thread_events
+
+        def _job(*args: Any) -> Any:
+            start = time.perf_counter()
+            thread = threading.current_thread()
+            queued = round((start - submitted) * 1000, 1)
+            pending.append((
+                start, _START, name, thread.name,
+                f"job {job} queued {queued}ms on thread {thread.ident}",
+            ))
+            outcome = "ok"
+            try:
+                return func(*args)
+            except BaseException as exc:
+                outcome = f"raised {type(exc).__name__}"
+                raise
+            finally:
+                pending.append((time.perf_counter(), _FINISH, name, thread.name, outcome))
+
+        return run(executor, _job, *args)
+
     # -- sys.monitoring callbacks -----------------------------------------
+    def _on_start(self, code: Any, offset: int) -> Any:
+        # A coroutine's first step: recorded as a resume so the time a task
+        # spent queued after SPAWN is not counted as running. PY_START fires
+        # for every call, so untracked code is switched off (and switched
+        # back on when a new coroutine is tracked).
+        name = self._codes.get(code)
+        if name is None:
+            return sys.monitoring.DISABLE if self._tool_id is not None else None
+        task = self._current_task_name()
+        self._record(name, _RESUME, task, detail="start")
+        if self._block_s is not None:
+            self._enter(task, code, offset)
+        return None
+
+    def _on_throw(self, code: Any, offset: int, exc: Any) -> None:
+        # Resumed with an exception (e.g. cancellation): a resume like any other.
+        self._on_resume(code, offset)
+
     def _on_resume(self, code: Any, offset: int) -> None:
-        if code in self._codes:
-            self._record(code.co_qualname, "RESUME", self._current_task_name())
+        name = self._codes.get(code)
+        if name is not None:
+            task = self._current_task_name()
+            self._record(name, _RESUME, task)
+            if self._block_s is not None:
+                self._enter(task, code, offset)
 
     def _on_yield(self, code: Any, offset: int, retval: Any) -> None:
-        if code in self._codes:
-            self._record(
-                code.co_qualname, "SUSPEND", self._current_task_name(),
-                line=self._line_of(code, offset),
-            )
+        self._on_stop(code, offset, _SUSPEND)
 
     def _on_return(self, code: Any, offset: int, retval: Any) -> None:
-        if code in self._codes:
-            self._record(
-                code.co_qualname, "RETURN", self._current_task_name(),
-                line=self._line_of(code, offset),
-            )
+        self._on_stop(code, offset, _RETURN)
+
+    def _on_stop(self, code: Any, offset: int, kind: int) -> None:
+        name = self._codes.get(code)
+        if name is not None:
+            # Read the clock before _record(), whose flush may do I/O.
+            stopped = time.perf_counter()
+            task = self._current_task_name()
+            line = self._line_of(code, offset)
+            self._record(name, kind, task, line)
+            if self._block_s is not None and self._leave(task, kind):
+                self._check_block(name, task, line, stopped)
+
+    def _on_unwind(self, code: Any, offset: int, exc: Any) -> None:
+        # A tracked frame exiting with an exception leaves the stack like a
+        # return; only registered when block_ms is set.
+        name = self._codes.get(code)
+        if name is not None:
+            stopped = time.perf_counter()
+            task = self._current_task_name()
+            if self._leave(task, _RETURN):
+                self._check_block(name, task, self._line_of(code, offset), stopped)
+
+    def _enter(self, task: str, code: Any, offset: int) -> None:
+        self._depth[task] = self._depth.get(task, 0) + 1
+        self._resumed.setdefault(task, (time.perf_counter(), self._line_of(code, offset)))
+
+    def _leave(self, task: str, kind: int) -> bool:
+        # Whether a tracked frame leaving the stack ends the task's run. A
+        # yield suspends the whole task, but an awaited coroutine returns
+        # straight into its caller, which keeps running: only the return of
+        # the outermost tracked frame ends the run.
+        depth = self._depth.pop(task, 0) - 1
+        if depth > 0:
+            self._depth[task] = depth
+        return kind != _RETURN or depth <= 0
+
+    def _check_block(self, coro: int, task: str, line: int, stopped: float) -> None:
+        # The innermost frame yields first, so it closes the run and reports
+        # the await it reached; the outer frames find nothing left to check.
+        started = self._resumed.pop(task, None)
+        if started is None:
+            return
+        t, from_line = started
+        elapsed = stopped - t
+        if elapsed < self._block_s:
+            return
+        duration_ms = round(elapsed * 1000, 1)
+        detail = f"blocked {duration_ms}ms"
+        if from_line >= 0:
+            detail += f" since line {from_line}"
+        self._record(coro, _BLOCK, task, line, detail)
+        self.blocks.append({
+            "coro": self._ring.names[coro],
+            "task": task,
+            "line": None if line < 0 else line,
+            "from_line": None if from_line < 0 else from_line,
+            "t_ms": round((t - self._t0) * 1000, 1),
+            "duration_ms": duration_ms,
+        })
+
+    def blocking_calls(self, n: int = 10) -> list[dict[str, Any]]:
+        """The lines that blocked the event loop the longest, worst first.
+
+        Each entry has ``coro``, ``line``, ``count``, ``total_ms`` and
+        ``max_ms``, plus ``from_line`` and ``t_ms`` of the longest span.
+        """
+        return _worst_blocks(self.blocks, n)
 
     # -- context manager ---------------------------------------------------
     async def __aenter__(self) -> "AsyncFlowLogger":
@@ -139,22 +678,44 @@ class AsyncFlowLogger:
             )
         mon.use_tool_id(self._tool_id, "asyncflow")
         ev = mon.events
-        mon.set_events(self._tool_id, ev.PY_RESUME | ev.PY_YIELD | ev.PY_RETURN)
+        mon.set_events(
+            self._tool_id,
+            ev.PY_START | ev.PY_RESUME | ev.PY_THROW | ev.PY_YIELD | ev.PY_RETURN,
+        )
+        mon.register_callback(self._tool_id, ev.PY_START, self._on_start)
+        mon.register_callback(self._tool_id, ev.PY_THROW, self._on_throw)
         mon.register_callback(self._tool_id, ev.PY_RESUME, self._on_resume)
         mon.register_callback(self._tool_id, ev.PY_YIELD, self._on_yield)
         mon.register_callback(self._tool_id, ev.PY_RETURN, self._on_return)
+        if self._block_s is not None:
+            mon.set_events(self._tool_id, mon.get_events(self._tool_id) | ev.PY_UNWIND)
+            mon.register_callback(self._tool_id, ev.PY_UNWIND, self._on_unwind)
+        self._hook_executor(self._loop)
+        if self._trace_path is not None:
+            self._trace_fh = open(self._trace_path, "w", encoding="utf-8")
+            self._trace = _ChromeTraceWriter(self._trace_fh)
         return self
 
     async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
         mon = sys.monitoring
         if self._tool_id is not None:
             mon.set_events(self._tool_id, 0)
-            for ev in (mon.events.PY_RESUME, mon.events.PY_YIELD, mon.events.PY_RETURN):
+            events = mon.events
+            for ev in (
+                events.PY_START, events.PY_RESUME, events.PY_THROW,
+                events.PY_YIELD, events.PY_RETURN, events.PY_UNWIND,
+            ):
                 mon.register_callback(self._tool_id, ev, None)
             mon.free_tool_id(self._tool_id)
             self._tool_id = None
         if self._loop is not None:
             self._loop.set_task_factory(None)
+            self._unhook_executor(self._loop)
+        self.flush()
+        if self._trace is not None:
+            self._trace.close(self.now_ms())
+            self._trace_fh.close()
+            self._trace = self._trace_fh = None
         return False
 
 
@@ -164,7 +725,10 @@ class AsyncFlow(anywidget.AnyWidget):
     Runs a coroutine on the notebook's own event loop and streams its task
     activity — spawn, suspend-at-``await``, resume, done — into a swimlane
     timeline that fills in as the run proceeds. One lane per task; solid bars are
-    running, hatched bars are suspended at an ``await``.
+    running, hatched bars are suspended at an ``await``, and red marks are runs
+    that blocked the event loop for ``block_ms`` or longer. Work sent to a
+    thread pool (``asyncio.to_thread``/``run_in_executor``) gets one lane per
+    worker thread below the tasks.
 
     Example (marimo, top-level ``await``)::
 
@@ -187,8 +751,10 @@ class AsyncFlow(anywidget.AnyWidget):
     _esm = Path(__file__).parent / "static" / "asyncflow.js"
     _css = Path(__file__).parent / "static" / "asyncflow.css"
 
-    # The captured event stream, re-synced on every poll tick so the timeline
-    # grows live. Each entry: {t_ms, coro, event, task, line, detail}.
+    # The captured event stream. While a run is going it grows in place and
+    # each poll tick sends only the new events to the browser; the whole list
+    # is synced once the run ends. Each entry: {t_ms, coro, event, task,
+    # line, detail}.
     events = traitlets.List(default_value=[]).tag(sync=True)
     # Elapsed wall-clock ms; advances every tick so open (suspended) bars keep
     # growing even while no events fire (e.g. during a long sleep).
@@ -200,6 +766,14 @@ class AsyncFlow(anywidget.AnyWidget):
     def __init__(self, *, width: int = 0, **kwargs: Any) -> None:
         super().__init__(width=width, **kwargs)
         self.result: Any = None
+        self._timeline_cache: tuple[Any, int, float, _Timeline] | None = None
+        self._max_events: int | None = None
+        self.on_msg(self._handle_message)
+
+    def _handle_message(self, _: Any, content: Any, buffers: Any) -> None:
+        # A view mounted mid-run asks for everything captured so far.
+        if isinstance(content, dict) and content.get("type") == "resync":
+            self.send({"type": "events", "events": self.events, "reset": True})
 
     async def run(
         self,
@@ -207,12 +781,22 @@ class AsyncFlow(anywidget.AnyWidget):
         *,
         targets: Iterable[Any] | None = None,
         poll_ms: int = 100,
+        max_events: int | None = None,
+        block_ms: float | None = 100,
+        trace_path: str | os.PathLike[str] | None = None,
     ) -> Any:
         """Drive ``coro`` to completion, streaming events into the widget.
 
         ``targets`` (functions/coroutines) add extra source files to capture;
         by default only the file of ``coro`` is tracked, which already picks up
         any coroutine defined alongside it.
+
+        Events are buffered by the logger and synced in one batch per
+        ``poll_ms`` frame. ``max_events`` keeps only the most recent events,
+        bounding memory on very long runs. Runs that hold the event loop for
+        ``block_ms`` or longer without awaiting are flagged as blocking
+        (``None`` turns the check off). ``trace_path`` streams the run to a
+        Chrome trace file as it goes (see ``to_chrome_trace``).
         """
         files = set()
         code = getattr(coro, "cr_code", None)
@@ -223,24 +807,224 @@ class AsyncFlow(anywidget.AnyWidget):
             if target_code is not None:
                 files.add(target_code.co_filename)
 
-        logger = AsyncFlowLogger(files, on_event=None)
+        logger = AsyncFlowLogger(
+            files, max_events=max_events, block_ms=block_ms, trace_path=trace_path
+        )
+        self._max_events = max_events
         self.events = []
+        self.send({"type": "events", "events": [], "reset": True})
         self.now_ms = 0.0
         self.running = True
         try:
             async with logger:
                 task = asyncio.ensure_future(coro)
                 while not task.done():
-                    self.now_ms = logger.now_ms()
-                    self.events = list(logger.events)
+                    self._sync(logger)
                     await asyncio.sleep(poll_ms / 1000)
                 self.result = await task
-                self.now_ms = logger.now_ms()
-                self.events = list(logger.events)
+            self._sync(logger)
         finally:
+            # One full sync at the end, for views that open after the run.
+            self.send_state("events")
             self.running = False
         return self.result
 
+    def _sync(self, logger: AsyncFlowLogger) -> None:
+        # flush() also moves executor events still queued by worker threads.
+        batch = logger.flush()
+        if batch:
+            # Grow the list in place (no trait sync) and send just the delta.
+            events = self.events
+            events.extend(batch)
+            if self._max_events is not None and len(events) > self._max_events:
+                del events[: len(events) - self._max_events]
+            self.send({"type": "events", "events": batch, "limit": self._max_events})
+        self.now_ms = logger.now_ms()
+
+    # -- analytics ---------------------------------------------------------
+    def _timeline(self) -> _Timeline:
+        events = self.events
+        key = (events, len(events), self.now_ms)
+        cached = self._timeline_cache
+        if cached is None or cached[0] is not events or cached[1:3] != key[1:]:
+            cached = self._timeline_cache = (*key, _Timeline(events, self.now_ms))
+        return cached[3]
+
+    def coroutine_stats(self) -> list[dict[str, Any]]:
+        """Per-coroutine timings, slowest wall time first.
+
+        Each entry has ``coro``, ``tasks`` (how many tasks ran it), and the
+        summed ``wall_ms`` (spawn to done), ``running_ms`` and ``suspended_ms``
+        over those tasks. Requires NumPy.
+        """
+        import numpy as np
+
+        tl = self._timeline()
+        n_coros = len(tl.coro_names)
+        tasks = np.bincount(tl.task_coro, minlength=n_coros)
+        wall = np.bincount(tl.task_coro, weights=tl.task_end - tl.task_start, minlength=n_coros)
+        # Charge run/wait time to the task's coroutine, not to whichever nested
+        # coroutine happened to emit the event.
+        seg_owner = tl.task_coro[tl.seg_task]
+        running = np.bincount(seg_owner, weights=tl.dur * tl.run, minlength=n_coros)
+        suspended = np.bincount(seg_owner, weights=tl.dur * tl.wait, minlength=n_coros)
+        return [
+            {
+                "coro": tl.coro_names[i],
+                "tasks": int(tasks[i]),
+                "wall_ms": round(float(wall[i]), 1),
+                "running_ms": round(float(running[i]), 1),
+                "suspended_ms": round(float(suspended[i]), 1),
+            }
+            for i in np.argsort(-wall, kind="stable")
+            if tasks[i]
+        ]
+
+    def utilization(self, bin_ms: float | None = None, bins: int = 50) -> dict[str, list[float]]:
+        """Fraction of each time bin during which a traced task was running.
+
+        Bins are ``bin_ms`` wide, or the run is split into ``bins`` equal bins.
+        Returns ``{"t_ms": [...bin starts], "busy": [...fractions in 0..1]}``.
+        Requires NumPy.
+        """
+        import numpy as np
+
+        tl = self._timeline()
+        if not len(tl.seg_start) or tl.end_ms <= 0:
+            return {"t_ms": [], "busy": []}
+        if bin_ms is None:
+            bin_ms = tl.end_ms / bins
+        if bin_ms <= 0:
+            raise ValueError(f"bin_ms must be positive, got {bin_ms}")
+        edges = np.arange(0.0, tl.end_ms + bin_ms, bin_ms)
+        starts, ends = _union(*tl.intervals(tl.run & (tl.dur > 0)))
+        busy = np.diff(_busy_before(starts, ends, edges))
+        return {
+            "t_ms": [round(float(x), 1) for x in edges[:-1]],
+            "busy": [float(x) for x in np.clip(busy / bin_ms, 0.0, 1.0)],
+        }
+
+    def max_concurrency(self) -> int:
+        """Largest number of traced tasks alive (spawned, not yet done) at once.
+
+        Requires NumPy.
+        """
+        import numpy as np
+
+        tl = self._timeline()
+        if not len(tl.task_start):
+            return 0
+        times = np.concatenate([tl.task_start, tl.task_end])
+        delta = np.concatenate([np.ones(len(tl.task_start)), -np.ones(len(tl.task_end))])
+        # At equal times, a finishing task is released before the next starts.
+        order = np.lexsort((delta, times))
+        return int(np.cumsum(delta[order]).max())
+
+    def slowest_awaits(self, n: int = 10) -> list[dict[str, Any]]:
+        """The ``await`` sites with the most total suspended time.
+
+        Each entry has ``coro``, ``line``, ``count``, ``total_ms``, ``mean_ms``
+        and ``max_ms``, summed over every suspension at that line. Requires
+        NumPy.
+        """
+        import numpy as np
+
+        tl = self._timeline()
+        mask = tl.wait
+        if not mask.any():
+            return []
+        coro, line, dur = tl.seg_coro[mask], tl.seg_line[mask], tl.dur[mask]
+        sites, site = np.unique(np.stack([coro, line]), axis=1, return_inverse=True)
+        site = site.reshape(-1)
+        count = np.bincount(site)
+        total = np.bincount(site, weights=dur)
+        longest = np.zeros(len(count))
+        np.maximum.at(longest, site, dur)
+        out = []
+        for i in np.argsort(-total, kind="stable")[:n]:
+            out.append({
+                "coro": tl.coro_names[sites[0, i]],
+                "line": None if sites[1, i] < 0 else int(sites[1, i]),
+                "count": int(count[i]),
+                "total_ms": round(float(total[i]), 1),
+                "mean_ms": round(float(total[i] / count[i]), 1),
+                "max_ms": round(float(longest[i]), 1),
+            })
+        return out
+
+    def executor_stats(self) -> list[dict[str, Any]]:
+        """Per worker thread: how busy it was and how long its jobs queued.
+
+        Each entry has ``thread`` (name), ``thread_id``, ``jobs``, ``busy_ms``
+        (time spent running jobs), ``busy`` (that as a fraction of the run),
+        and ``queued_ms``/``max_queued_ms`` (time jobs waited in the executor
+        queue before this thread picked them up). Saturated pools show threads
+        near ``busy == 1`` with growing queue waits.
+        """
+        end_ms = max([self.now_ms] + [e["t_ms"] for e in self.events])
+        threads: dict[str, dict[str, Any]] = {}
+        started: dict[str, float] = {}
+        for e in self.events:
+            kind = e["event"]
+            if kind == "START":
+                m = _START_DETAIL.match(e["detail"] or "")
+                queued = float(m.group(2)) if m else 0.0
+                row = threads.setdefault(e["task"], {
+                    "thread": e["task"], "thread_id": int(m.group(3)) if m else None,
+                    "jobs": 0, "busy_ms": 0.0, "busy": 0.0,
+                    "queued_ms": 0.0, "max_queued_ms": 0.0,
+                })
+                row["jobs"] += 1
+                row["queued_ms"] = round(row["queued_ms"] + queued, 1)
+                row["max_queued_ms"] = max(row["max_queued_ms"], queued)
+                started[e["task"]] = e["t_ms"]
+            elif kind == "FINISH" and e["task"] in started:
+                row = threads[e["task"]]
+                row["busy_ms"] = round(row["busy_ms"] + e["t_ms"] - started.pop(e["task"]), 1)
+        # Jobs still running count up to the end of the trace.
+        for thread, t in started.items():
+            threads[thread]["busy_ms"] = round(threads[thread]["busy_ms"] + end_ms - t, 1)
+        for row in threads.values():
+            row["busy"] = round(row["busy_ms"] / end_ms, 3) if end_ms > 0 else 0.0
+        return list(threads.values())
+
+    def to_chrome_trace(self, path: str | os.PathLike[str]) -> Path:
+        """Write ``events`` as Chrome Trace Event Format JSON for Perfetto.
+
+        Each task is a thread with slices for running and ``await`` stretches;
+        tasks still open end at ``now_ms``. Returns the path written.
+        """
+        path = Path(path)
+        with path.open("w", encoding="utf-8") as fh:
+            writer = _ChromeTraceWriter(fh)
+            writer.write(self.events)
+            writer.close(max([self.now_ms] + [e["t_ms"] for e in self.events]))
+        return path
+
+    def blocking_calls(self, n: int = 10) -> list[dict[str, Any]]:
+        """The lines that blocked the event loop the longest, worst first.
+
+        Built from the ``BLOCK`` events in ``events``; see
+        ``AsyncFlowLogger.blocking_calls`` for the entry shape.
+        """
+        blocks = []
+        for e in self.events:
+            if e["event"] != "BLOCK":
+                continue
+            m = _BLOCK_DETAIL.match(e.get("detail") or "")
+            if m is None:
+                continue
+            duration_ms = float(m.group(1))
+            blocks.append({
+                "coro": e["coro"],
+                "task": e["task"],
+                "line": e["line"],
+                "from_line": int(m.group(2)) if m.group(2) else None,
+                "t_ms": round(e["t_ms"] - duration_ms, 1),
+                "duration_ms": duration_ms,
+            })
+        return _worst_blocks(blocks, n)
+
     @classmethod
     async def trace(
         cls,
@@ -248,6 +1032,9 @@ class AsyncFlow(anywidget.AnyWidget):
         *,
         targets: Iterable[Any] | None = None,
         poll_ms: int = 100,
+        max_events: int | None = None,
+        block_ms: float | None = 100,
+        trace_path: str | os.PathLike[str] | None = None,
         width: int = 0,
     ) -> "AsyncFlow":
         """Create the widget, display it, and trace ``coro`` live.
@@ -261,5 +1048,12 @@ class AsyncFlow(anywidget.AnyWidget):
             mo.output.append(widget)
         except Exception:  # noqa: BLE001 - display is best-effort (e.g. headless).
             pass
-        await widget.run(coro, targets=targets, poll_ms=poll_ms)
+        await widget.run(
+            coro,
+            targets=targets,
+            poll_ms=poll_ms,
+            max_events=max_events,
+            block_ms=block_ms,
+            trace_path=trace_path,
+        )
         return widget
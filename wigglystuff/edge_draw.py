@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import anywidget
 import traitlets
@@ -10,6 +11,55 @@ if TYPE_CHECKING:
     import numpy as np
 
 
+class _LinkIndex:
+    """Adjacency lists over ``names``/``links``, built once per change.
+
+    ``nodes`` is ``names`` followed by any link endpoint missing from it.
+    ``out``/``into`` hold directed neighbours and ``both`` the undirected
+    ones, each in link order (a self-loop appears twice in ``both``).
+    """
+
+    def __init__(self, names: Sequence[str], links: Iterable[Tuple[str, str]]) -> None:
+        self.names = list(names)
+        self.pos: Dict[str, int] = {}
+        for i, name in enumerate(self.names):
+            self.pos.setdefault(name, i)
+        self.pairs = list(links)
+        nodes = dict.fromkeys(self.names)
+        for source, target in self.pairs:
+            nodes.setdefault(source)
+            nodes.setdefault(target)
+        self.nodes: List[str] = list(nodes)
+        self.out: Dict[str, List[str]] = {node: [] for node in self.nodes}
+        self.into: Dict[str, List[str]] = {node: [] for node in self.nodes}
+        self.both: Dict[str, List[str]] = {node: [] for node in self.nodes}
+        for source, target in self.pairs:
+            self.out[source].append(target)
+            self.into[target].append(source)
+            self.both[source].append(target)
+            self.both[target].append(source)
+        self._endpoints: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def neighbors(self, directed: bool) -> Dict[str, List[str]]:
+        return self.out if directed else self.both
+
+    def endpoints(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Row indices (into ``names``) of every link's source and target."""
+        import numpy as np
+
+        if self._endpoints is None:
+            missing = [n for pair in self.pairs for n in pair if n not in self.pos]
+            if missing:
+                raise ValueError(f"{missing[0]!r} is not in names")
+            flat = np.fromiter(
+                (self.pos[n] for pair in self.pairs for n in pair),
+                dtype=np.int64,
+                count=2 * len(self.pairs),
+            )
+            self._endpoints = (flat[0::2], flat[1::2])
+        return self._endpoints
+
+
 class EdgeDraw(anywidget.AnyWidget):
     """Sketch node/link diagrams and sync edges as adjacency-friendly data.
 
@@ -51,6 +101,21 @@ class EdgeDraw(anywidget.AnyWidget):
     def _validate_links(self, proposal: traitlets.Bunch) -> List[dict]:
         return self._coerce_links(proposal.value)
 
+    _index: Optional[_LinkIndex] = None
+
+    @traitlets.observe("names", "links")
+    def _invalidate_index(self, change: traitlets.Bunch) -> None:
+        self._index = None
+
+    def _graph(self) -> _LinkIndex:
+        if self._index is None:
+            self._index = _LinkIndex(self.names, self._iter_links(self.links))
+        return self._index
+
+    def _require(self, node: str) -> None:
+        if node not in self._graph().out:
+            raise ValueError(f"Unknown node: {node!r}")
+
     @staticmethod
     def _iter_links(
         links: Iterable[dict],
@@ -89,23 +154,15 @@ class EdgeDraw(anywidget.AnyWidget):
 
         num_nodes = len(self.names)
         matrix = np.zeros((num_nodes, num_nodes))
-        for source, target in self._iter_links(self._coerce_links(self.links)):
-            src = self.names.index(source)
-            dst = self.names.index(target)
-            matrix[src][dst] = 1
-            if not directed:
-                matrix[dst][src] = 1
+        src, dst = self._graph().endpoints()
+        matrix[src, dst] = 1
+        if not directed:
+            matrix[dst, src] = 1
         return matrix
 
     def get_neighbors(self, node_name: str, directed: bool = False) -> List[str]:
         """Return neighbors of a node."""
-        neighbors = []
-        for source, target in self._iter_links(self._coerce_links(self.links)):
-            if source == node_name:
-                neighbors.append(target)
-            if not directed and target == node_name:
-                neighbors.append(source)
-        return neighbors
+        return list(self._graph().neighbors(directed).get(node_name, ()))
 
     def has_cycle(self, directed: bool = False) -> bool:
         """Check if the graph contains cycles."""
@@ -114,44 +171,126 @@ class EdgeDraw(anywidget.AnyWidget):
         return self._has_cycle_undirected()
 
     def _has_cycle_directed(self) -> bool:
-        """Detect cycles in a directed graph using DFS."""
+        """Detect cycles in a directed graph using an iterative DFS."""
+        out = self._graph().out
+        done = set()
+        on_path = set()
+        for root in self.names:
+            if root in done:
+                continue
+            on_path.add(root)
+            stack = [(root, iter(out[root]))]
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if neighbor in on_path:
+                        return True
+                    if neighbor not in done:
+                        on_path.add(neighbor)
+                        stack.append((neighbor, iter(out[neighbor])))
+                        break
+                else:
+                    stack.pop()
+                    on_path.discard(node)
+                    done.add(node)
+        return False
+
+    def _has_cycle_undirected(self) -> bool:
+        """Detect cycles in an undirected graph using an iterative DFS."""
+        both = self._graph().both
         visited = set()
-        rec_stack = set()
+        for root in self.names:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, None, iter(both[root]))]
+            while stack:
+                node, parent, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if neighbor == parent:
+                        continue
+                    if neighbor in visited:
+                        return True
+                    visited.add(neighbor)
+                    stack.append((neighbor, node, iter(both[neighbor])))
+                    break
+                else:
+                    stack.pop()
+        return False
 
-        def dfs(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
+    def topological_sort(self) -> List[str]:
+        """Order the nodes so every link points forward.
 
-            for neighbor in self.get_neighbors(node, directed=True):
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
+        Ties keep the order of ``names``. Raises ``ValueError`` when the
+        directed graph has a cycle.
+        """
+        index = self._graph()
+        remaining = {node: len(index.into[node]) for node in index.nodes}
+        ready = deque(node for node in index.nodes if remaining[node] == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for neighbor in index.out[node]:
+                remaining[neighbor] -= 1
+                if remaining[neighbor] == 0:
+                    ready.append(neighbor)
+        if len(order) < len(index.nodes):
+            raise ValueError("Graph has a cycle; no topological order exists.")
+        return order
 
-            rec_stack.remove(node)
-            return False
+    def connected_components(self) -> List[List[str]]:
+        """Group the nodes into connected components, ignoring direction.
 
-        for node in self.names:
-            if node not in visited and dfs(node):
-                return True
-        return False
+        Components are listed in order of their first node in ``names``.
+        """
+        index = self._graph()
+        seen = set()
+        components = []
+        for root in index.nodes:
+            if root in seen:
+                continue
+            seen.add(root)
+            component = [root]
+            queue = deque([root])
+            while queue:
+                for neighbor in index.both[queue.popleft()]:
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        component.append(neighbor)
+                        queue.append(neighbor)
+            components.append(component)
+        return components
 
-    def _has_cycle_undirected(self) -> bool:
-        """Detect cycles in an undirected graph using DFS."""
-        visited = set()
+    def _bfs(self, source: str, directed: bool, target: Optional[str] = None) -> Dict[str, Optional[str]]:
+        self._require(source)
+        neighbors = self._graph().neighbors(directed)
+        parent: Dict[str, Optional[str]] = {source: None}
+        queue = deque([source])
+        while queue and target not in parent:
+            node = queue.popleft()
+            for neighbor in neighbors[node]:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+        return parent
 
-        def dfs(node: str, parent: Optional[str]) -> bool:
-            visited.add(node)
-            for neighbor in self.get_neighbors(node, directed=False):
-                if neighbor not in visited:
-                    if dfs(neighbor, node):
-                        return True
-                elif neighbor != parent:
-                    return True
-            return False
+    def shortest_path(self, source: str, target: str, directed: bool = False) -> Optional[List[str]]:
+        """Return the fewest-links path from ``source`` to ``target``, or ``None``."""
+        self._require(target)
+        parent = self._bfs(source, directed, target)
+        if target not in parent:
+            return None
+        path = [target]
+        while parent[path[-1]] is not None:
+            path.append(parent[path[-1]])
+        return path[::-1]
 
-        for node in self.names:
-            if node not in visited and dfs(node, None):
-                return True
-        return False
+    def distances(self, source: str, directed: bool = False) -> Dict[str, int]:
+        """Return the number of links from ``source`` to every reachable node."""
+        parent = self._bfs(source, directed)
+        dist = {source: 0}
+        for node, prev in parent.items():
+            if prev is not None:
+                dist[node] = dist[prev] + 1
+        return dist
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from io import BytesIO
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterable, List
+from typing import Any, Dict, List, Optional, Sequence
 
 import anywidget
 import traitlets
@@ -12,6 +17,20 @@ from .chart_puck import fig_to_base64
 from .paint import input_to_pil, pil_to_base64
 
 
+# Matplotlib's pyplot state is not thread-safe; figures render, and callable
+# sources build their frames, one at a time.
+_MPL_LOCK = threading.Lock()
+# Worker threads used to encode frames.
+ENCODE_WORKERS = min(8, os.cpu_count() or 1)
+# Encoded frames kept in the kernel, beyond the ones around the playhead.
+CACHE_SIZE = 128
+# Keyframe pixel arrays kept for delta encoding.
+KEYFRAME_CACHE_SIZE = 4
+# A delta patch covering more than this share of the frame is sent whole.
+MAX_PATCH_AREA = 0.5
+_ENCODINGS = ("png", "delta")
+
+
 def _encode_frame(frame: Any) -> str:
     """Convert a single frame to a base64 data URI.
 
@@ -20,10 +39,113 @@ def _encode_frame(frame: Any) -> str:
     the (optional) dependency is never imported at module import time.
     """
     if hasattr(frame, "savefig"):
-        return fig_to_base64(frame)
+        with _MPL_LOCK:
+            return fig_to_base64(frame)
     return pil_to_base64(input_to_pil(frame))
 
 
+def _frame_pixels(frame: Any) -> Any:
+    """RGBA pixels of a frame as a ``(height, width, 4)`` uint8 array."""
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError("numpy is required for FramePlayer(encoding='delta').") from exc
+    from PIL import Image
+
+    if hasattr(frame, "savefig"):
+        buf = BytesIO()
+        with _MPL_LOCK:
+            frame.savefig(buf, format="png", dpi=frame.dpi)
+        buf.seek(0)
+        img = Image.open(buf)
+    else:
+        img = input_to_pil(frame)
+    return np.asarray(img.convert("RGBA"))
+
+
+def _encode_pixels(pixels: Any) -> str:
+    from PIL import Image
+
+    return pil_to_base64(Image.fromarray(pixels))
+
+
+def _encode_delta(pixels: Any, base: Any, base_index: int) -> Dict[str, Any]:
+    """Encode ``pixels`` as the rectangle where it differs from ``base``.
+
+    Returns ``{"base": i}`` when nothing changed, ``{"base", "x", "y", "uri"}``
+    with a PNG of the changed rectangle, or a plain ``{"uri"}`` keyframe when
+    the sizes differ or the patch would cover most of the frame anyway.
+    """
+    import numpy as np
+
+    if pixels.shape != base.shape:
+        return {"uri": _encode_pixels(pixels)}
+    changed = (pixels != base).any(axis=2)
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not len(rows):
+        return {"base": base_index}
+    cols = np.flatnonzero(changed.any(axis=0))
+    y0, y1, x0, x1 = int(rows[0]), int(rows[-1]) + 1, int(cols[0]), int(cols[-1]) + 1
+    if (y1 - y0) * (x1 - x0) > MAX_PATCH_AREA * changed.size:
+        return {"uri": _encode_pixels(pixels)}
+    return {
+        "base": base_index,
+        "x": x0,
+        "y": y0,
+        "uri": _encode_pixels(np.ascontiguousarray(pixels[y0:y1, x0:x1])),
+    }
+
+
+class _FrameSource:
+    """Random access to frames given as a sequence, callable or iterator.
+
+    Sequences are indexed directly and callables are called with the frame
+    index, one call at a time, since they typically draw through pyplot's
+    global state. Other iterables are pulled only as far as the player has got when
+    ``n_frames`` is known, and drained up front otherwise.
+    """
+
+    def __init__(self, frames: Any, n_frames: Optional[int] = None) -> None:
+        self._lock = threading.Lock()
+        self._iter = None
+        if callable(frames) and not hasattr(frames, "__len__"):
+            if n_frames is None:
+                raise ValueError("n_frames is required when frames is a callable.")
+            self._frames = frames
+            self._get = self._call
+        elif hasattr(frames, "__len__") and hasattr(frames, "__getitem__"):
+            self._get = frames.__getitem__
+            n_frames = len(frames)
+        elif n_frames is None:
+            pulled = list(frames)
+            self._get = pulled.__getitem__
+            n_frames = len(pulled)
+        else:
+            self._iter = iter(frames)
+            self._pulled: List[Any] = []
+            self._get = self._pull
+        self.n_frames = int(n_frames)
+
+    def _call(self, index: int) -> Any:
+        with _MPL_LOCK:
+            return self._frames(index)
+
+    def _pull(self, index: int) -> Any:
+        with self._lock:
+            while len(self._pulled) <= index:
+                try:
+                    self._pulled.append(next(self._iter))
+                except StopIteration:
+                    raise IndexError(f"frame {index} is past the end of the iterator") from None
+            return self._pulled[index]
+
+    def __len__(self) -> int:
+        return self.n_frames
+
+    def __getitem__(self, index: int) -> Any:
+        return self._get(index)
+
+
 class FramePlayer(anywidget.AnyWidget):
     """Play a sequence of images as an inline, optionally-looping "video".
 
@@ -32,8 +154,11 @@ class FramePlayer(anywidget.AnyWidget):
     renders the current frame with play/pause/loop controls and a scrubber,
     so you don't need a second cell that reads a slider value and re-renders.
 
-    For long or high-resolution sequences, downsize the frames before passing
-    them in — every frame is base64-inlined into the widget model.
+    Frames are encoded on demand by a thread pool and sent to the browser in
+    a window around the playhead: the player asks for the next ``prefetch``
+    frames as it goes and drops the ones it has left behind. ``frames`` can
+    also be a generator (pass ``n_frames`` to keep it lazy) or a callable
+    ``frame(i)`` that builds frame ``i``.
 
     Examples:
         ```python
@@ -50,7 +175,10 @@ class FramePlayer(anywidget.AnyWidget):
     _esm = Path(__file__).parent / "static" / "frame-player.js"
     _css = Path(__file__).parent / "static" / "frame-player.css"
 
-    frames = traitlets.List(traitlets.Unicode()).tag(sync=True)
+    frame_count = traitlets.Int(0).tag(sync=True)
+    prefetch = traitlets.Int(8).tag(sync=True)
+    encoding = traitlets.Enum(_ENCODINGS, default_value="png").tag(sync=True)
+    keyframe_interval = traitlets.Int(30).tag(sync=True)
     value = traitlets.Int(0).tag(sync=True)
     interval_ms = traitlets.Int(100).tag(sync=True)
     playing = traitlets.Bool(False).tag(sync=True)
@@ -60,34 +188,64 @@ class FramePlayer(anywidget.AnyWidget):
 
     def __init__(
         self,
-        frames: Iterable[Any],
+        frames: Any,
         value: int = 0,
         interval_ms: int = 100,
         loop: bool = True,
         width: int = 0,
         show_index: bool = True,
+        *,
+        n_frames: Optional[int] = None,
+        prefetch: int = 8,
+        encoding: str = "png",
+        keyframe_interval: int = 30,
         **kwargs: Any,
     ) -> None:
         """Create a FramePlayer.
 
         Args:
-            frames: Iterable of frame sources (PIL Image, path, URL, bytes,
-                base64 string, or matplotlib figure). Must be non-empty.
+            frames: Frame sources (PIL Image, path, URL, bytes, base64
+                string, or matplotlib figure) as a sequence or any iterable,
+                or a callable ``frame(i)`` returning frame ``i``. Must be
+                non-empty. A callable is called from worker threads, so it
+                must be thread-safe; calls never overlap, so building
+                figures through pyplot is fine, but it must not rely on
+                running on the main thread.
             value: Starting frame index.
             interval_ms: Milliseconds between frames while playing.
             loop: Wrap back to the first frame at the end instead of stopping.
             width: Display width in pixels (0 = the image's natural width).
             show_index: Show the "current / total" frame readout.
+            n_frames: Number of frames. Required for a callable; for a
+                generator it lets frames be pulled lazily instead of all at
+                once.
+            prefetch: Frames the browser requests ahead of the playhead.
+            encoding: ``"png"`` sends every frame as a full PNG. ``"delta"``
+                sends every ``keyframe_interval``-th frame in full and the
+                others as the rectangle where they differ from that
+                keyframe, which is far smaller when most of the picture
+                stays put (needs NumPy).
+            keyframe_interval: Frames per keyframe with ``encoding="delta"``.
             **kwargs: Forwarded to ``anywidget.AnyWidget``.
         """
-        encoded = self._encode_frames(frames)
-        if not encoded:
-            raise ValueError("frames must contain at least one frame.")
         if interval_ms <= 0:
             raise ValueError("interval_ms must be positive.")
-        value = max(0, min(value, len(encoded) - 1))
+        if prefetch <= 0:
+            raise ValueError("prefetch must be positive.")
+        if keyframe_interval <= 0:
+            raise ValueError("keyframe_interval must be positive.")
+        self._pool = ThreadPoolExecutor(max_workers=ENCODE_WORKERS, thread_name_prefix="frame-player")
+        self._cache: "OrderedDict[int, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._keyframes: "OrderedDict[int, Any]" = OrderedDict()
+        self._errors: Dict[int, str] = {}
+        self._source = self._make_source(frames, n_frames)
+        value = max(0, min(value, len(self._source) - 1))
         super().__init__(
-            frames=encoded,
+            frame_count=len(self._source),
+            prefetch=prefetch,
+            encoding=encoding,
+            keyframe_interval=keyframe_interval,
             value=value,
             interval_ms=interval_ms,
             loop=loop,
@@ -95,22 +253,148 @@ class FramePlayer(anywidget.AnyWidget):
             show_index=show_index,
             **kwargs,
         )
+        # The starting frame is encoded right away, so a bad source raises
+        # here instead of leaving the player waiting for it.
+        self._cache[value] = self._encode_one(self._source, value)
+        self.on_msg(self._handle_message)
+        self.observe(self._reset_encoding, names=["encoding", "keyframe_interval"])
 
     @staticmethod
-    def _encode_frames(frames: Iterable[Any]) -> List[str]:
-        """Encode an iterable of frame sources into base64 data URIs."""
-        return [_encode_frame(f) for f in frames]
-
-    def set_frames(self, frames: Iterable[Any]) -> None:
-        """Replace the frame sequence, re-encoding and clamping ``value``."""
-        encoded = self._encode_frames(frames)
-        if not encoded:
+    def _make_source(frames: Any, n_frames: Optional[int]) -> _FrameSource:
+        source = _FrameSource(frames, n_frames)
+        if not len(source):
             raise ValueError("frames must contain at least one frame.")
-        self.frames = encoded
-        if self.value > len(encoded) - 1:
-            self.value = len(encoded) - 1
+        return source
+
+    def _handle_message(self, _: Any, content: Dict[str, Any], buffers: Any = None) -> None:
+        if content.get("type") != "frames":
+            return
+        wanted = [i for i in content.get("indices", []) if 0 <= i < self.frame_count]
+        frames = self.encode(wanted)
+        self.send(
+            {
+                "type": "frames",
+                "generation": content.get("generation"),
+                "frames": {str(i): frame for i, frame in frames.items()},
+                "errors": {str(i): self._errors[i] for i in wanted if i not in frames and i in self._errors},
+            }
+        )
+
+    def _encode_one(self, source: _FrameSource, index: int) -> Any:
+        if self.encoding != "delta":
+            return _encode_frame(source[index])
+        key = index - index % self.keyframe_interval
+        pixels = _frame_pixels(source[index])
+        if index == key:
+            self._remember_keyframe(source, key, pixels)
+            return {"uri": _encode_pixels(pixels)}
+        return _encode_delta(pixels, self._keyframe(source, key), key)
+
+    def _keyframe(self, source: _FrameSource, key: int) -> Any:
+        with self._cache_lock:
+            if key in self._keyframes:
+                self._keyframes.move_to_end(key)
+                return self._keyframes[key]
+        pixels = _frame_pixels(source[key])
+        self._remember_keyframe(source, key, pixels)
+        return pixels
+
+    def _remember_keyframe(self, source: _FrameSource, key: int, pixels: Any) -> None:
+        with self._cache_lock:
+            if source is self._source:
+                self._keyframes[key] = pixels
+                while len(self._keyframes) > KEYFRAME_CACHE_SIZE:
+                    self._keyframes.popitem(last=False)
+
+    def _reset_encoding(self, change: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+            self._keyframes.clear()
+            self._errors.clear()
+        self.send({"type": "reset"})
+
+    def encode(self, indices: Sequence[int]) -> Dict[int, Any]:
+        """Encoded frames at ``indices``, computed in parallel.
+
+        Each value is a data URI, or with ``encoding="delta"`` a dict with
+        the ``uri`` and, for non-keyframes, the ``base`` keyframe and the
+        ``x``/``y`` offset of the patch.
+
+        Results are kept in a small LRU cache, so scrubbing back and forth
+        does not re-encode. Frames that fail to load are left out and
+        listed in :attr:`errors`; the browser shows a placeholder for them.
+        """
+        out: Dict[int, str] = {}
+        todo = []
+        with self._cache_lock:
+            for i in indices:
+                if i in self._cache:
+                    self._cache.move_to_end(i)
+                    out[i] = self._cache[i]
+                else:
+                    todo.append(i)
+        source = self._source
+        try:
+            jobs = {i: self._pool.submit(self._encode_one, source, i) for i in todo}
+            results = {i: job.exception() or job.result() for i, job in jobs.items()}
+        except RuntimeError:
+            # No threads (e.g. Pyodide in the browser): encode in this thread.
+            results = {}
+            for i in todo:
+                try:
+                    results[i] = self._encode_one(source, i)
+                except (IndexError, OSError, ValueError) as exc:
+                    results[i] = exc
+        failed: Dict[int, str] = {}
+        for i, result in results.items():
+            if isinstance(result, (IndexError, OSError, ValueError)):
+                failed[i] = f"{type(result).__name__}: {result}"
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            out[i] = result
+        with self._cache_lock:
+            if source is self._source:
+                self._errors.update(failed)
+                for i in todo:
+                    if i in out:
+                        self._cache[i] = out[i]
+                        self._errors.pop(i, None)
+                while len(self._cache) > max(CACHE_SIZE, 4 * self.prefetch):
+                    self._cache.popitem(last=False)
+        return out
+
+    def set_frames(self, frames: Any, *, n_frames: Optional[int] = None) -> None:
+        """Replace the frame sequence, clamping ``value``.
+
+        Accepts the same kinds of ``frames`` as the constructor.
+        """
+        source = self._make_source(frames, n_frames)
+        value = min(self.value, len(source) - 1)
+        first = self._encode_one(source, value)
+        with self._cache_lock:
+            self._source = source
+            self._cache.clear()
+            self._keyframes.clear()
+            self._errors.clear()
+            self._cache[value] = first
+        self.frame_count = len(source)
+        self.send({"type": "reset"})
+        if self.value > len(source) - 1:
+            self.value = len(source) - 1
+
+    def close(self) -> None:
+        """Stop the encoding threads and close the widget."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        super().close()
+
+    @property
+    def errors(self) -> Dict[int, str]:
+        """Frames that failed to encode, as ``{index: message}``."""
+        with self._cache_lock:
+            return dict(self._errors)
 
     @property
     def n_frames(self) -> int:
         """Number of frames currently loaded."""
-        return len(self.frames)
+        return self.frame_count
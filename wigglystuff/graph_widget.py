@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections import Counter
-from collections.abc import Iterable, Mapping, Sequence
+import hashlib
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from collections.abc import Container, Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,128 @@ import anywidget
 import traitlets
 
 
+class _GraphIndex:
+    """Id-indexed view of normalized ``nodes``/``edges`` lists.
+
+    Holds id -> node and id -> edge maps, the edge ids incident to each node,
+    and in/out degree counts. It remembers the list objects it was built from
+    so ``GraphWidget`` can tell when a trait was reassigned from outside and
+    rebuild; its own helpers update it incrementally instead. Positions,
+    the endpoint lookup and the edge index arrays are derived lazily.
+    """
+
+    def __init__(self, nodes: list[dict], edges: list[dict]) -> None:
+        self.nodes = nodes
+        self.edges = edges
+        self.node_by_id = {node["id"]: node for node in nodes}
+        self.edge_by_id: dict[str, dict] = {}
+        self.incident: dict[str, set[str]] = {node_id: set() for node_id in self.node_by_id}
+        self.out_degree: Counter[str] = Counter()
+        self.in_degree: Counter[str] = Counter()
+        for edge in edges:
+            self._link(edge)
+        self._node_pos: dict[str, int] | None = None
+        self._edge_pos: dict[str, int] | None = None
+        self._endpoints: tuple[Any, Any] | None = None
+        self._lookup: dict[str, str] | None = None
+
+    def _link(self, edge: dict) -> None:
+        self.edge_by_id[edge["id"]] = edge
+        self.incident.setdefault(edge["source"], set()).add(edge["id"])
+        self.incident.setdefault(edge["target"], set()).add(edge["id"])
+        self.out_degree[edge["source"]] += 1
+        self.in_degree[edge["target"]] += 1
+
+    def _unlink(self, edge_id: str) -> None:
+        edge = self.edge_by_id.pop(edge_id)
+        for node_id in (edge["source"], edge["target"]):
+            self.incident[node_id].discard(edge_id)
+        self.out_degree[edge["source"]] -= 1
+        self.in_degree[edge["target"]] -= 1
+
+    @property
+    def node_pos(self) -> dict[str, int]:
+        if self._node_pos is None:
+            self._node_pos = {node["id"]: i for i, node in enumerate(self.nodes)}
+        return self._node_pos
+
+    @property
+    def edge_pos(self) -> dict[str, int]:
+        if self._edge_pos is None:
+            self._edge_pos = {edge["id"]: i for i, edge in enumerate(self.edges)}
+        return self._edge_pos
+
+    @property
+    def lookup(self) -> dict[str, str]:
+        """Endpoint lookup (ids and unique names -> id), as ``_node_lookup``."""
+        if self._lookup is None:
+            self._lookup = GraphWidget._node_lookup(self.nodes)
+        return self._lookup
+
+    def endpoints(self) -> tuple[Any, Any]:
+        """Source and target row indices of every edge, as int arrays."""
+        import numpy as np
+
+        if self._endpoints is None:
+            pos = self.node_pos
+            pairs = [
+                (pos[edge["source"]], pos[edge["target"]])
+                for edge in self.edges
+                if edge["source"] in pos and edge["target"] in pos
+            ]
+            arr = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+            self._endpoints = (arr[:, 0], arr[:, 1])
+        return self._endpoints
+
+    def nodes_added(self, nodes: list[dict], added: Iterable[dict]) -> None:
+        self.nodes = nodes
+        for node in added:
+            self.node_by_id[node["id"]] = node
+            self.incident.setdefault(node["id"], set())
+        self._node_pos = self._endpoints = self._lookup = None
+
+    def edges_added(self, edges: list[dict], added: Iterable[dict]) -> None:
+        self.edges = edges
+        for edge in added:
+            self._link(edge)
+        self._edge_pos = self._endpoints = None
+
+    def edges_removed(self, edges: list[dict], edge_ids: Iterable[str]) -> None:
+        self.edges = edges
+        for edge_id in edge_ids:
+            self._unlink(edge_id)
+        self._edge_pos = self._endpoints = None
+
+    def node_replaced(self, nodes: list[dict], node: dict) -> None:
+        self.nodes = nodes
+        self.node_by_id[node["id"]] = node
+        self._lookup = None
+
+    def node_removed(self, nodes: list[dict], node_id: str) -> None:
+        self.nodes = nodes
+        del self.node_by_id[node_id]
+        self.incident.pop(node_id, None)
+        self.out_degree.pop(node_id, None)
+        self.in_degree.pop(node_id, None)
+        self._node_pos = self._endpoints = self._lookup = None
+
+
+# Computed layouts keyed by (topology hash, method, iterations, seed), so
+# re-running a cell that rebuilds the same graph skips the layout.
+_LAYOUT_CACHE: OrderedDict[tuple, Any] = OrderedDict()
+_LAYOUT_CACHE_SIZE = 8
+_LAYOUTS = ("force", "spectral")
+
+
+def _without(items: list[dict], positions: Iterable[int]) -> list[dict]:
+    # Copy then delete back to front: one C-level memmove per removal instead
+    # of a Python-level filter over the whole list.
+    out = list(items)
+    for pos in sorted(positions, reverse=True):
+        del out[pos]
+    return out
+
+
 class GraphWidget(anywidget.AnyWidget):
     """Programmatic force-directed graph widget.
 
@@ -23,6 +147,12 @@ class GraphWidget(anywidget.AnyWidget):
     the SVG to that exact pixel size. ``height`` is always an exact pixel
     height (default 400).
 
+    For large graphs pass ``layout="force"`` or ``layout="spectral"`` (or
+    call :meth:`compute_layout`) to compute starting positions in Python, so
+    the browser begins from a settled layout and only refines it. Passing
+    ``max_nodes`` clusters graphs with more nodes than that into super-nodes
+    (see :meth:`cluster`).
+
     Example:
         ```python
         import marimo as mo
@@ -45,6 +175,7 @@ class GraphWidget(anywidget.AnyWidget):
     selected_nodes = traitlets.List([]).tag(sync=True)
     selected_edges = traitlets.List([]).tag(sync=True)
     hovered_node = traitlets.Unicode(None, allow_none=True).tag(sync=True)
+    positions = traitlets.Bytes(b"").tag(sync=True)
 
     def __init__(
         self,
@@ -55,10 +186,20 @@ class GraphWidget(anywidget.AnyWidget):
         bounded: bool = True,
         width: int | None = None,
         height: int = 400,
+        layout: str | None = None,
+        max_nodes: int | None = None,
         **kwargs: Any,
     ) -> None:
         prepared_nodes = self._coerce_nodes(nodes or [])
         prepared_edges = self._coerce_edges(edges or [], prepared_nodes)
+        if max_nodes is not None and len(prepared_nodes) > max_nodes:
+            # Cluster before the first sync so the full graph never ships.
+            from wigglystuff._graph_cluster import LevelOfDetail
+
+            lod = LevelOfDetail(prepared_nodes, prepared_edges, max_nodes=max_nodes)
+            prepared_nodes, prepared_edges = lod.view()
+        else:
+            lod = None
         super().__init__(
             nodes=prepared_nodes,
             edges=prepared_edges,
@@ -68,13 +209,21 @@ class GraphWidget(anywidget.AnyWidget):
             height=height,
             **kwargs,
         )
+        self._lod = lod
+        self.on_msg(self._handle_message)
+        if layout is not None:
+            self.compute_layout(layout)
 
     @staticmethod
     def _stringify(value: Any) -> str:
         return str(value)
 
     @classmethod
-    def _coerce_nodes(cls, nodes: Iterable[Any]) -> list[dict]:
+    def _coerce_nodes(
+        cls, nodes: Iterable[Any], *, taken: Container[str] = (), offset: int = 0
+    ) -> list[dict]:
+        # ``taken``/``offset`` describe already-normalized nodes that ``nodes``
+        # are being appended to, so a helper can coerce just the new ones.
         raw_nodes = list(nodes)
         name_counts = Counter(
             cls._stringify(node["name"])
@@ -88,7 +237,7 @@ class GraphWidget(anywidget.AnyWidget):
 
         normalized = []
         used_ids: set[str] = set()
-        for index, node in enumerate(raw_nodes):
+        for index, node in enumerate(raw_nodes, offset):
             if isinstance(node, Mapping):
                 item = dict(node)
                 if "id" in item and item["id"] is not None:
@@ -106,7 +255,7 @@ class GraphWidget(anywidget.AnyWidget):
 
             base_id = node_id
             suffix = 1
-            while node_id in used_ids:
+            while node_id in used_ids or node_id in taken:
                 node_id = f"{base_id}-{suffix}"
                 suffix += 1
             used_ids.add(node_id)
@@ -142,12 +291,19 @@ class GraphWidget(anywidget.AnyWidget):
 
     @classmethod
     def _coerce_edges(
-        cls, edges: Iterable[Any], nodes: Sequence[Mapping[str, Any]]
+        cls,
+        edges: Iterable[Any],
+        nodes: Sequence[Mapping[str, Any]],
+        *,
+        lookup: Mapping[str, str] | None = None,
+        taken: Container[str] = (),
+        offset: int = 0,
     ) -> list[dict]:
-        lookup = cls._node_lookup(nodes)
+        if lookup is None:
+            lookup = cls._node_lookup(nodes)
         normalized = []
         used_ids: set[str] = set()
-        for index, edge in enumerate(edges):
+        for index, edge in enumerate(edges, offset):
             if isinstance(edge, Mapping):
                 if "source" not in edge or "target" not in edge:
                     raise ValueError("Graph edge dicts must include source and target.")
@@ -162,7 +318,7 @@ class GraphWidget(anywidget.AnyWidget):
             edge_id = cls._stringify(item.get("id", f"edge-{index}"))
             base_id = edge_id
             suffix = 1
-            while edge_id in used_ids:
+            while edge_id in used_ids or edge_id in taken:
                 edge_id = f"{base_id}-{suffix}"
                 suffix += 1
             used_ids.add(edge_id)
@@ -177,12 +333,175 @@ class GraphWidget(anywidget.AnyWidget):
 
     @traitlets.validate("nodes")
     def _validate_nodes(self, proposal: traitlets.Bunch) -> list[dict]:
+        if self._normalized:
+            return proposal.value
         return self._coerce_nodes(proposal.value)
 
     @traitlets.validate("edges")
     def _validate_edges(self, proposal: traitlets.Bunch) -> list[dict]:
+        if self._normalized:
+            return proposal.value
         return self._coerce_edges(proposal.value, self.nodes)
 
+    @traitlets.validate("selected_nodes")
+    def _validate_selected_nodes(self, proposal: traitlets.Bunch) -> list:
+        if self._lod is None:
+            return proposal.value
+        return self._lod.resolve(proposal.value)
+
+    # Lists assigned by the helpers below are already normalized, so they skip
+    # re-coercion and keep the very dicts the index points at.
+    _normalized = False
+    _index: _GraphIndex | None = None
+    _lod: Any = None
+
+    @contextmanager
+    def _assign_normalized(self) -> Iterator[None]:
+        self._normalized = True
+        try:
+            with self.hold_sync():
+                yield
+        finally:
+            self._normalized = False
+
+    def _graph(self) -> _GraphIndex:
+        """The index over the current traits, rebuilt if they were reassigned."""
+        index = self._index
+        if index is None or index.nodes is not self.nodes or index.edges is not self.edges:
+            index = self._index = _GraphIndex(self.nodes, self.edges)
+        return index
+
+    @traitlets.observe("nodes", "edges")
+    def _clear_positions(self, change: traitlets.Bunch) -> None:
+        # Positions are per node row; once the topology moves they are stale.
+        if self.positions:
+            self.positions = b""
+        # Assigning a new graph from outside replaces the clustered one.
+        if not self._normalized:
+            self._lod = None
+
+    def _handle_message(self, _: Any, content: Any, buffers: Any) -> None:
+        if not isinstance(content, dict):
+            return
+        if content.get("type") == "expand":
+            self.expand(content.get("id"))
+        elif content.get("type") == "collapse":
+            self.collapse(content.get("id"))
+
+    def cluster(self, max_nodes: int = 500, *, seed: int = 0) -> None:
+        """Collapse the graph into at most about ``max_nodes`` displayed nodes.
+
+        Communities are found by label propagation and shown as super-nodes
+        sized by member count, with edges between them aggregated (their
+        ``data["edges"]`` holds the count). Clicking a super-node in the
+        browser expands it; double-clicking a node folds its cluster back.
+        From then on ``nodes`` and ``edges`` hold only the displayed level,
+        while ``selected_nodes`` always lists original node ids. The editing
+        helpers (``add_node``, ``add_edge`` and friends) raise until
+        ``uncluster()`` is called; assigning ``nodes`` or ``edges`` directly
+        drops the clustering.
+        """
+        from wigglystuff._graph_cluster import LevelOfDetail
+
+        if self._lod is not None:
+            nodes, edges = self._lod.nodes, self._lod.edges
+        else:
+            nodes, edges = self.nodes, self.edges
+        self._lod = LevelOfDetail(nodes, edges, max_nodes=max_nodes, seed=seed)
+        self._show_level()
+
+    def uncluster(self) -> None:
+        """Show every original node and edge again."""
+        if self._lod is None:
+            return
+        lod, self._lod = self._lod, None
+        with self._assign_normalized():
+            self.nodes = list(lod.nodes)
+            self.edges = list(lod.edges)
+
+    def expand(self, cluster: str) -> bool:
+        """Replace a displayed cluster with its members. Returns ``False``
+        when ``cluster`` is not a displayed cluster."""
+        if self._lod is None or not self._lod.expand(cluster):
+            return False
+        self._show_level()
+        return True
+
+    def collapse(self, node: str) -> bool:
+        """Fold the cluster containing ``node`` back into one super-node.
+        Returns ``False`` when ``node`` is not inside a cluster, or its
+        cluster is already folded into a larger one."""
+        if self._lod is None or not self._lod.collapse(node):
+            return False
+        self._show_level()
+        return True
+
+    def cluster_members(self, cluster: str) -> list[str]:
+        """Original node ids inside ``cluster``."""
+        if self._lod is None or cluster not in self._lod.children:
+            raise ValueError(f"Unknown cluster: {cluster!r}")
+        return self._lod.leaves(cluster)
+
+    def _show_level(self) -> None:
+        nodes, edges = self._lod.view()
+        with self._assign_normalized():
+            self.nodes = nodes
+            self.edges = edges
+
+    def compute_layout(
+        self, method: str = "force", *, iterations: int = 50, seed: int = 0
+    ):
+        """Compute node positions in Python and send them to the browser.
+
+        ``method`` is ``"force"`` (a ForceAtlas2-style simulation with an
+        approximate far field, seeded from the spectral layout) or
+        ``"spectral"`` (eigenvectors of the adjacency, fastest for very large
+        graphs). Results are cached by graph topology, so rebuilding the same
+        graph is free. Changing ``nodes`` or ``edges`` afterwards clears the
+        positions; call this again to recompute.
+
+        Returns:
+            An ``(n, 2)`` float32 array of x/y positions in ``[-1, 1]``, in
+            ``nodes`` order.
+        """
+        from wigglystuff import _graph_layout
+
+        if method not in _LAYOUTS:
+            raise ValueError(f"Unknown layout {method!r}; expected one of {_LAYOUTS}.")
+        index = self._graph()
+        n = len(self.nodes)
+        src, dst = index.endpoints()
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\0".join(node["id"] for node in self.nodes).encode())
+        digest.update(src.tobytes())
+        digest.update(dst.tobytes())
+        key = (digest.hexdigest(), method, iterations if method == "force" else 0, seed)
+        pos = _LAYOUT_CACHE.get(key)
+        if pos is None:
+            if method == "force":
+                pos = _graph_layout.force_layout(n, src, dst, iterations=iterations, seed=seed)
+            else:
+                pos = _graph_layout.spectral_layout(n, src, dst, seed=seed)
+            pos.setflags(write=False)
+            _LAYOUT_CACHE[key] = pos
+            while len(_LAYOUT_CACHE) > _LAYOUT_CACHE_SIZE:
+                _LAYOUT_CACHE.popitem(last=False)
+        else:
+            _LAYOUT_CACHE.move_to_end(key)
+        self.positions = pos.tobytes()
+        return pos
+
+    def _resolve(self, node: Any) -> str:
+        return self._resolve_endpoint(node, self.nodes, self._graph().lookup)
+
+    def _check_unclustered(self) -> None:
+        # While clustered the traits hold only the displayed level, so an
+        # edit there would be lost on the next expand/collapse.
+        if self._lod is not None:
+            raise RuntimeError(
+                "GraphWidget is clustered; call uncluster() before editing nodes or edges."
+            )
+
     def add_node(
         self,
         name: Any = None,
@@ -194,6 +513,7 @@ class GraphWidget(anywidget.AnyWidget):
         **attrs: Any,
     ) -> str:
         """Add a node and return its normalized id."""
+        self._check_unclustered()
         node = dict(attrs)
         if id is not None:
             node["id"] = id
@@ -205,14 +525,16 @@ class GraphWidget(anywidget.AnyWidget):
             node["color"] = color
         if data is not None:
             node["data"] = data
-        new_nodes = self._coerce_nodes([*self.nodes, node])
-        self.nodes = new_nodes
-        return new_nodes[-1]["id"]
+        index = self._graph()
+        added = self._coerce_nodes([node], taken=index.node_by_id, offset=len(self.nodes))
+        with self._assign_normalized():
+            self.nodes = [*self.nodes, *added]
+        index.nodes_added(self.nodes, added)
+        return added[0]["id"]
 
     def remove_node(self, node: Any) -> None:
         """Remove a node by id, unique name, or index, including incident edges."""
-        node_id = self._resolve_endpoint(node, self.nodes, self._node_lookup(self.nodes))
-        self.detach_node(node_id, delete=True)
+        self.detach_node(self._resolve(node), delete=True)
 
     def add_edge(
         self,
@@ -227,6 +549,7 @@ class GraphWidget(anywidget.AnyWidget):
         **attrs: Any,
     ) -> str:
         """Add an edge and return its normalized id."""
+        self._check_unclustered()
         edge = {"source": source, "target": target, **attrs}
         if id is not None:
             edge["id"] = id
@@ -238,9 +561,14 @@ class GraphWidget(anywidget.AnyWidget):
             edge["color"] = color
         if data is not None:
             edge["data"] = data
-        new_edges = self._coerce_edges([*self.edges, edge], self.nodes)
-        self.edges = new_edges
-        return new_edges[-1]["id"]
+        index = self._graph()
+        added = self._coerce_edges(
+            [edge], self.nodes, lookup=index.lookup, taken=index.edge_by_id, offset=len(self.edges)
+        )
+        with self._assign_normalized():
+            self.edges = [*self.edges, *added]
+        index.edges_added(self.edges, added)
+        return added[0]["id"]
 
     def attach_node(
         self,
@@ -266,8 +594,9 @@ class GraphWidget(anywidget.AnyWidget):
         Returns:
             The normalized ``(node_id, edge_id)`` pair.
         """
-        source_id = self._resolve_endpoint(source, self.nodes, self._node_lookup(self.nodes))
-        lookup = self._node_lookup(self.nodes)
+        self._check_unclustered()
+        source_id = self._resolve(source)
+        index = self._graph()
         node = dict(attrs)
         if id is not None:
             node["id"] = id
@@ -285,14 +614,15 @@ class GraphWidget(anywidget.AnyWidget):
             if endpoint is None:
                 continue
             try:
-                node_id = self._resolve_endpoint(endpoint, self.nodes, lookup)
+                node_id = self._resolve(endpoint)
                 break
             except ValueError:
                 pass
 
         if node_id is None:
-            new_nodes = self._coerce_nodes([*self.nodes, node])
-            node_id = new_nodes[-1]["id"]
+            (new_node,) = self._coerce_nodes([node], taken=index.node_by_id, offset=len(self.nodes))
+            node_id = new_node["id"]
+            new_nodes = [*self.nodes, new_node]
         else:
             updates = dict(attrs)
             if name is not None and id is not None:
@@ -303,10 +633,9 @@ class GraphWidget(anywidget.AnyWidget):
                 updates["color"] = color
             if data is not None:
                 updates["data"] = data
-            new_nodes = [
-                {**existing, **updates} if existing["id"] == node_id else existing
-                for existing in self.nodes
-            ]
+            new_node = {**index.node_by_id[node_id], **updates}
+            new_nodes = list(self.nodes)
+            new_nodes[index.node_pos[node_id]] = new_node
 
         edge: dict[str, Any] = {"source": source_id, "target": node_id}
         if edge_id is not None:
@@ -320,43 +649,59 @@ class GraphWidget(anywidget.AnyWidget):
         if edge_data is not None:
             edge["data"] = edge_data
 
-        new_edges = self._coerce_edges([*self.edges, edge], new_nodes)
-        edge_id = new_edges[-1]["id"]
-        with self.hold_sync():
+        # Both endpoints are ids by now, so no name lookup over new_nodes needed.
+        added = self._coerce_edges(
+            [edge],
+            new_nodes,
+            lookup={source_id: source_id, node_id: node_id},
+            taken=index.edge_by_id,
+            offset=len(self.edges),
+        )
+        with self._assign_normalized():
             self.nodes = new_nodes
-            self.edges = new_edges
-        return node_id, edge_id
+            self.edges = [*self.edges, *added]
+        if node_id in index.node_by_id:
+            index.node_replaced(self.nodes, new_node)
+        else:
+            index.nodes_added(self.nodes, [new_node])
+        index.edges_added(self.edges, added)
+        return node_id, added[0]["id"]
 
     def detach_node(self, node: Any, *, delete: bool = False) -> None:
         """Remove all edges attached to a node.
 
         Set ``delete=True`` to remove the node as well.
         """
-        node_id = self._resolve_endpoint(node, self.nodes, self._node_lookup(self.nodes))
-        new_nodes = [
-            n for n in self.nodes if not delete or n["id"] != node_id
-        ]
-        new_edges = [
-            e for e in self.edges if e["source"] != node_id and e["target"] != node_id
-        ]
-        remaining_edges = {edge["id"] for edge in new_edges}
-        with self.hold_sync():
+        self._check_unclustered()
+        node_id = self._resolve(node)
+        index = self._graph()
+        incident = set(index.incident.get(node_id, ()))
+        new_edges = _without(self.edges, [index.edge_pos[e] for e in incident])
+        new_nodes = _without(self.nodes, [index.node_pos[node_id]]) if delete else self.nodes
+        with self._assign_normalized():
             self.nodes = new_nodes
             self.edges = new_edges
             if delete:
                 self.selected_nodes = [n for n in self.selected_nodes if n != node_id]
-            self.selected_edges = [
-                e for e in self.selected_edges if e in remaining_edges
-            ]
+            self.selected_edges = [e for e in self.selected_edges if e not in incident]
+        index.edges_removed(self.edges, incident)
+        if delete:
+            index.node_removed(self.nodes, node_id)
 
     def remove_edge(self, edge: Any) -> None:
         """Remove an edge by id or index."""
+        self._check_unclustered()
         if isinstance(edge, int) and 0 <= edge < len(self.edges):
             edge_id = self.edges[edge]["id"]
         else:
             edge_id = self._stringify(edge)
-        self.edges = [e for e in self.edges if e["id"] != edge_id]
-        self.selected_edges = [e for e in self.selected_edges if e != edge_id]
+        index = self._graph()
+        if edge_id not in index.edge_by_id:
+            return
+        with self._assign_normalized():
+            self.edges = _without(self.edges, [index.edge_pos[edge_id]])
+            self.selected_edges = [e for e in self.selected_edges if e != edge_id]
+        index.edges_removed(self.edges, [edge_id])
 
     def clear_selection(self) -> None:
         """Clear selected node and edge ids."""
@@ -365,29 +710,46 @@ class GraphWidget(anywidget.AnyWidget):
 
     def get_selected_node_data(self) -> list[dict]:
         """Return full node dicts for currently selected nodes."""
-        selected = set(self.selected_nodes)
-        return [node for node in self.nodes if node["id"] in selected]
+        if self._lod is not None:
+            # Selections are original ids, which may sit inside collapsed clusters.
+            lod = self._lod
+            rows = sorted({lod.node_pos[i] for i in self.selected_nodes if i in lod.node_pos})
+            return [lod.nodes[row] for row in rows]
+        index = self._graph()
+        found = {i for i in self.selected_nodes if i in index.node_by_id}
+        return [index.node_by_id[i] for i in sorted(found, key=index.node_pos.__getitem__)]
 
     def get_selected_edge_data(self) -> list[dict]:
         """Return full edge dicts for currently selected edges."""
-        selected = set(self.selected_edges)
-        return [edge for edge in self.edges if edge["id"] in selected]
+        index = self._graph()
+        found = {i for i in self.selected_edges if i in index.edge_by_id}
+        return [index.edge_by_id[i] for i in sorted(found, key=index.edge_pos.__getitem__)]
+
+    def get_adjacency_matrix(self, directed: bool | None = None, *, sparse: bool = False):
+        """Return an adjacency matrix for the current graph.
 
-    def get_adjacency_matrix(self, directed: bool | None = None):
-        """Return an adjacency matrix for the current graph."""
+        Rows and columns follow the order of ``nodes``. With ``sparse=True``
+        the result is a SciPy CSR matrix, which is the only practical choice
+        for graphs with tens of thousands of nodes.
+        """
         import numpy as np
 
         if directed is None:
             directed = self.directed
-        node_ids = [node["id"] for node in self.nodes]
-        index = {node_id: i for i, node_id in enumerate(node_ids)}
-        matrix = np.zeros((len(node_ids), len(node_ids)))
-        for edge in self.edges:
-            if edge["source"] not in index or edge["target"] not in index:
-                continue
-            src = index[edge["source"]]
-            dst = index[edge["target"]]
-            matrix[src][dst] = 1
-            if not directed:
-                matrix[dst][src] = 1
+        index = self._graph()
+        n = len(self.nodes)
+        src, dst = index.endpoints()
+        if not directed:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+        if not sparse:
+            matrix = np.zeros((n, n))
+            matrix[src, dst] = 1
+            return matrix
+        try:
+            from scipy.sparse import csr_matrix
+        except ImportError as exc:
+            raise ImportError("scipy is required for get_adjacency_matrix(sparse=True).") from exc
+        matrix = csr_matrix((np.ones(len(src)), (src, dst)), shape=(n, n))
+        # Parallel edges are summed on construction; keep it a 0/1 matrix.
+        matrix.data[:] = 1
         return matrix
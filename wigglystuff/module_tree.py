@@ -1,5 +1,9 @@
 """ModuleTreeWidget for visualising PyTorch nn.Module architecture."""
 
+import json
+import mmap
+import os
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +15,8 @@ from ._marimo_notice import warn_if_in_marimo
 
 def _is_uninitialized(param):
     """Check if a parameter is a lazy/uninitialized parameter."""
+    if isinstance(param, _TensorSpec):
+        return False
     try:
         from torch.nn.parameter import UninitializedParameter
         return isinstance(param, UninitializedParameter)
@@ -18,20 +24,182 @@ def _is_uninitialized(param):
         return False
 
 
+def _storage_key(param):
+    """Key identifying the memory behind ``param``, to spot tied weights.
+
+    Tensors on the ``meta`` device all report a ``data_ptr()`` of 0, so they
+    are keyed by identity instead (tied weights share the Parameter object).
+    """
+    if getattr(param, "is_meta", False):
+        return ("meta", id(param))
+    return param.data_ptr()
+
+
+# Bytes per element for the dtype codes in a safetensors header.
+_SAFETENSORS_DTYPES = {
+    "BOOL": ("bool", 1),
+    "U8": ("uint8", 1),
+    "I8": ("int8", 1),
+    "F8_E4M3": ("float8_e4m3fn", 1),
+    "F8_E5M2": ("float8_e5m2", 1),
+    "U16": ("uint16", 2),
+    "I16": ("int16", 2),
+    "F16": ("float16", 2),
+    "BF16": ("bfloat16", 2),
+    "U32": ("uint32", 4),
+    "I32": ("int32", 4),
+    "F32": ("float32", 4),
+    "U64": ("uint64", 8),
+    "I64": ("int64", 8),
+    "F64": ("float64", 8),
+    "C64": ("complex64", 8),
+}
+
+
+class _TensorSpec:
+    """Shape and dtype of a tensor that was never loaded."""
+
+    requires_grad = True
+
+    def __init__(self, shape, dtype, itemsize, key):
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self._itemsize = itemsize
+        self._key = key
+
+    def numel(self):
+        n = 1
+        for dim in self.shape:
+            n *= dim
+        return n
+
+    def element_size(self):
+        return self._itemsize
+
+    def data_ptr(self):
+        return self._key
+
+
+class _SpecModule:
+    """Stand-in for an ``nn.Module`` built from dotted tensor names.
+
+    It implements just the walk ``_extract_tree`` needs, so a state dict or a
+    safetensors header goes through the same aggregation as a real model.
+    """
+
+    def __init__(self, type_name=""):
+        self.type_name = type_name
+        self._params = {}
+        self._children = {}
+
+    def add(self, name, spec):
+        *prefix, leaf = name.split(".")
+        node = self
+        for part in prefix:
+            node = node._children.setdefault(part, _SpecModule())
+        node._params[leaf] = spec
+
+    def named_parameters(self, recurse=False):
+        return iter(self._params.items())
+
+    def named_buffers(self, recurse=False):
+        return iter(())
+
+    def named_children(self):
+        return iter(self._children.items())
+
+    def named_modules(self, remove_duplicate=False):
+        stack = [("", self)]
+        while stack:
+            path, node = stack.pop()
+            yield path, node
+            stack.extend(
+                (f"{path}.{name}" if path else name, child)
+                for name, child in reversed(node._children.items())
+            )
+
+
+def _spec_from_tensor(value):
+    """``_TensorSpec`` for a torch tensor, NumPy array or similar."""
+    dtype = str(value.dtype).replace("torch.", "")
+    if callable(getattr(value, "element_size", None)):
+        itemsize = value.element_size()
+        key = _storage_key(value) if callable(getattr(value, "data_ptr", None)) else id(value)
+    else:
+        itemsize = getattr(value, "itemsize", None) or value.dtype.itemsize
+        key = id(value)
+    return _TensorSpec(value.shape, dtype, itemsize, key)
+
+
+def _state_dict_module(state_dict):
+    root = _SpecModule("StateDict")
+    for name, value in state_dict.items():
+        root.add(name, _spec_from_tensor(value))
+    return root
+
+
+def _read_safetensors_header(path):
+    """The JSON header of a safetensors file, read through ``mmap``.
+
+    Only the first ``8 + header_size`` bytes are touched, so no weights are
+    paged in.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = int.from_bytes(mm[:8], "little")
+        if size <= 0 or 8 + size > len(mm):
+            raise ValueError(f"{os.fspath(path)} is not a safetensors file")
+        return json.loads(mm[8 : 8 + size])
+
+
+def _safetensors_module(paths):
+    root = _SpecModule("safetensors")
+    for path in paths:
+        header = _read_safetensors_header(path)
+        for name, info in header.items():
+            if name == "__metadata__":
+                continue
+            dtype, itemsize = _SAFETENSORS_DTYPES.get(info["dtype"], (info["dtype"].lower(), 0))
+            start, end = info["data_offsets"]
+            if not itemsize:
+                numel = 1
+                for dim in info["shape"]:
+                    numel *= dim
+                itemsize = (end - start) // numel if numel else 0
+            root.add(name, _TensorSpec(info["shape"], dtype, itemsize, (os.fspath(path), start)))
+    return root
+
+
+def _as_module(source):
+    """Turn what ``ModuleTreeWidget`` accepts into something module-like.
+
+    ``nn.Module`` instances pass through; a mapping is read as a state dict;
+    a path (or list of paths, for sharded checkpoints) as safetensors files.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return _safetensors_module([source])
+    if isinstance(source, (list, tuple)) and all(isinstance(p, (str, os.PathLike)) for p in source):
+        return _safetensors_module(source)
+    if isinstance(source, Mapping):
+        return _state_dict_module(source)
+    return source
+
+
 def _find_unregistered_modules(module):
     """Find nn.Module instances stored in plain Python containers."""
     import torch.nn as nn
 
-    registered = {id(child) for _, child in module.named_children()}
+    registered = None
     warnings = []
     for attr_name, attr_val in vars(module).items():
-        if attr_name.startswith("_"):
+        if attr_name.startswith("_") or not isinstance(attr_val, (list, tuple, dict)):
+            continue
+        values = attr_val.values() if isinstance(attr_val, dict) else attr_val
+        items = [v for v in values if isinstance(v, nn.Module)]
+        if not items:
             continue
-        items = []
-        if isinstance(attr_val, (list, tuple)):
-            items = [v for v in attr_val if isinstance(v, nn.Module)]
-        elif isinstance(attr_val, dict):
-            items = [v for v in attr_val.values() if isinstance(v, nn.Module)]
+        # Only modules that keep submodules in a container pay for this set.
+        if registered is None:
+            registered = {id(child) for _, child in module.named_children()}
         hidden = [m for m in items if id(m) not in registered]
         if hidden:
             warnings.append({
@@ -41,103 +209,183 @@ def _find_unregistered_modules(module):
     return warnings
 
 
-def _extract_tree(module, name="", _seen=None):
-    """Recursively extract a JSON-serializable tree from an nn.Module."""
+def _param_entry(pname, param, *, shared=False, buffer=False):
+    """JSON row for one parameter or buffer."""
+    is_lazy = not buffer and _is_uninitialized(param)
+    entry = {
+        "name": pname,
+        "shape": [] if is_lazy else list(param.shape),
+        "numel": 0 if is_lazy else param.numel(),
+        "trainable": False if buffer else param.requires_grad,
+        "dtype": str(param.dtype).replace("torch.", ""),
+    }
+    if buffer:
+        entry["is_buffer"] = True
+    if shared:
+        entry["is_shared"] = True
+    if is_lazy:
+        entry["is_lazy"] = True
+    return entry
+
+
+def _param_entries(module, shared=()):
+    """Parameter and buffer rows of ``module`` itself, as in the tree."""
+    params = [
+        _param_entry(pname, param, shared=pname in shared)
+        for pname, param in module.named_parameters(recurse=False)
+    ]
+    params.extend(
+        _param_entry(bname, buf, buffer=True)
+        for bname, buf in module.named_buffers(recurse=False)
+    )
+    return params
+
+
+_TOTAL_KEYS = (
+    "own_param_count",
+    "total_param_count",
+    "own_trainable_count",
+    "total_trainable_count",
+    "total_size_bytes",
+)
+
+
+def _merge_repeats(children, signature, repeats=None):
+    """Collapse runs of structurally identical siblings into one template.
+
+    The template is the first block of the run; it gets ``repeat`` and a
+    ``first–last`` name, and its totals cover the whole run so parent sums
+    stay exact. ``repeats``, when given, maps the template's ``path`` to the
+    paths of every block in the run.
+    """
+    merged = []
+    i = 0
+    while i < len(children):
+        j = i + 1
+        while j < len(children) and signature[id(children[j])] == signature[id(children[i])]:
+            j += 1
+        if j - i == 1:
+            merged.append(children[i])
+        else:
+            run = children[i:j]
+            node = dict(run[0])
+            node["name"] = f"{run[0]['name']}\u2013{run[-1]['name']}"
+            node["repeat"] = len(run)
+            if repeats is not None and "path" in node:
+                repeats[node["path"]] = [child["path"] for child in run]
+            for key in _TOTAL_KEYS:
+                node[key] = sum(child[key] for child in run)
+            merged.append(node)
+        i = j
+    return merged
+
+
+def _extract_tree(module, name="", _seen=None, *, registry=None, repeats=None, dedupe=True):
+    """Extract a JSON-serializable tree from an nn.Module.
+
+    One pass over ``named_modules()`` fills every node's own counts, and a
+    reverse sweep adds children into their parents. With ``dedupe``, runs of
+    identical sibling blocks (the 80 layers of a transformer) become a single
+    template node carrying ``repeat``. With a ``registry`` dict, parameter
+    rows are left out of the tree: each node instead gets ``param_entries``
+    and ``registry`` maps its ``path`` to ``(module, shared_names)`` so
+    :func:`_param_entries` can build the rows on demand.
+    """
     if _seen is None:
         _seen = set()
 
-    params = []
-    own_param_count = 0
-    own_trainable_count = 0
-    own_size_bytes = 0
-
-    for pname, param in module.named_parameters(recurse=False):
-        is_lazy = _is_uninitialized(param)
-        ptr = param.data_ptr() if not is_lazy else None
-        is_shared = ptr is not None and ptr in _seen
-        if ptr is not None:
-            _seen.add(ptr)
-
-        if is_lazy:
-            shape = []
-            numel = 0
-            size_bytes = 0
-        else:
-            shape = list(param.shape)
-            numel = param.numel()
-            size_bytes = numel * param.element_size()
-
-        trainable = param.requires_grad
-        dtype_str = str(param.dtype).replace("torch.", "")
-        entry = {
-            "name": pname,
-            "shape": shape,
-            "numel": numel,
-            "trainable": trainable,
-            "dtype": dtype_str,
-        }
-        if is_shared:
-            entry["is_shared"] = True
-        if is_lazy:
-            entry["is_lazy"] = True
-        params.append(entry)
-
-        if not is_shared:
+    nodes = []
+    parents = []
+    index_of = {}
+    own_signature = []
+    signature = {}
+    interned = {}
+    for path, mod in module.named_modules(remove_duplicate=False):
+        own_param_count = 0
+        own_trainable_count = 0
+        own_size_bytes = 0
+        shared = set()
+        param_sig = []
+        n_entries = 0
+        for pname, param in mod.named_parameters(recurse=False):
+            is_lazy = _is_uninitialized(param)
+            ptr = _storage_key(param) if not is_lazy else None
+            is_shared = ptr is not None and ptr in _seen
+            if ptr is not None:
+                _seen.add(ptr)
+            numel = 0 if is_lazy else param.numel()
+            n_entries += 1
+            if is_shared:
+                shared.add(pname)
+            else:
+                own_param_count += numel
+                own_size_bytes += numel * param.element_size() if not is_lazy else 0
+                if param.requires_grad:
+                    own_trainable_count += numel
+            if dedupe:
+                shape = () if is_lazy else tuple(param.shape)
+                param_sig.append(
+                    (pname, shape, param.dtype, param.requires_grad, is_shared, is_lazy)
+                )
+        for bname, buf in mod.named_buffers(recurse=False):
+            numel = buf.numel()
+            n_entries += 1
             own_param_count += numel
-            own_size_bytes += size_bytes
-            if trainable:
-                own_trainable_count += numel
-
-    for bname, buf in module.named_buffers(recurse=False):
-        shape = list(buf.shape)
-        numel = buf.numel()
-        dtype_str = str(buf.dtype).replace("torch.", "")
-        params.append({
-            "name": bname,
-            "shape": shape,
-            "numel": numel,
-            "trainable": False,
-            "is_buffer": True,
-            "dtype": dtype_str,
-        })
-        own_param_count += numel
-        own_size_bytes += numel * buf.element_size()
-
-    children = []
-    child_total = 0
-    child_trainable = 0
-    child_size_bytes = 0
-    for child_name, child_module in module.named_children():
-        child_tree = _extract_tree(child_module, child_name, _seen)
-        children.append(child_tree)
-        child_total += child_tree["total_param_count"]
-        child_trainable += child_tree["total_trainable_count"]
-        child_size_bytes += child_tree["total_size_bytes"]
-
-    # Detect unregistered nn.Module instances in plain containers
-    unregistered = _find_unregistered_modules(module)
-
-    result = {
-        "name": name,
-        "type": module.__class__.__name__,
-        "params": params,
-        "own_param_count": own_param_count,
-        "total_param_count": own_param_count + child_total,
-        "own_trainable_count": own_trainable_count,
-        "total_trainable_count": own_trainable_count + child_trainable,
-        "total_size_bytes": own_size_bytes + child_size_bytes,
-        "children": children,
-    }
-    if unregistered:
-        result["unregistered_warnings"] = unregistered
-    return result
+            own_size_bytes += numel * buf.element_size()
+            if dedupe:
+                param_sig.append((bname, tuple(buf.shape), buf.dtype))
+
+        node = {
+            "name": path.rsplit(".", 1)[-1] if path else name,
+            "type": mod.type_name if isinstance(mod, _SpecModule) else mod.__class__.__name__,
+            "own_param_count": own_param_count,
+            "total_param_count": own_param_count,
+            "own_trainable_count": own_trainable_count,
+            "total_trainable_count": own_trainable_count,
+            "total_size_bytes": own_size_bytes,
+            "children": [],
+        }
+        if registry is None:
+            node["params"] = _param_entries(mod, shared)
+        else:
+            node["path"] = path
+            node["param_entries"] = n_entries
+            registry[path] = (mod, shared)
+        unregistered = [] if isinstance(mod, _SpecModule) else _find_unregistered_modules(mod)
+        if unregistered:
+            node["unregistered_warnings"] = unregistered
+        if dedupe:
+            own_signature.append((node["type"], tuple(param_sig), repr(unregistered)))
+        index_of[path] = len(nodes)
+        parents.append(index_of[path.rsplit(".", 1)[0] if "." in path else ""] if path else None)
+        nodes.append(node)
+
+    # Children follow their parent in ``named_modules`` order, so a reverse
+    # sweep sees every subtree complete before its parent.
+    for i in range(len(nodes) - 1, -1, -1):
+        node = nodes[i]
+        node["children"].reverse()
+        if dedupe:
+            kids = node["children"]
+            # Intern signatures as small ints so comparing blocks stays cheap.
+            key = (own_signature[i], tuple(signature[id(kid)] for kid in kids))
+            signature[id(node)] = interned.setdefault(key, len(interned))
+            node["children"] = _merge_repeats(kids, signature, repeats)
+        parent = parents[i]
+        if parent is not None:
+            nodes[parent]["children"].append(node)
+            for key in ("total_param_count", "total_trainable_count", "total_size_bytes"):
+                nodes[parent][key] += node[key]
+    return nodes[0]
 
 
 class ModuleTreeWidget(anywidget.AnyWidget):
     """Interactive tree viewer for PyTorch ``nn.Module`` architecture.
 
     Displays the full module hierarchy with parameter counts, shapes,
-    trainable/frozen/buffer badges, and a density indicator.
+    trainable/frozen/buffer badges, and a density indicator. Runs of
+    identical sibling blocks are shown once with a repeat count, and
+    parameter rows are fetched from Python only when a node is expanded.
 
     Note:
         This widget has graduated to marimo core. If you are using marimo,
@@ -157,6 +405,9 @@ class ModuleTreeWidget(anywidget.AnyWidget):
             nn.Linear(256, 10),
         )
         mo.ui.anywidget(ModuleTreeWidget(model, initial_expand_depth=2))
+
+        # No weights in memory: a checkpoint header, or a model on "meta"
+        ModuleTreeWidget("model.safetensors")
         ```
     """
 
@@ -175,7 +426,11 @@ class ModuleTreeWidget(anywidget.AnyWidget):
         """Create a ModuleTreeWidget.
 
         Args:
-            module: A PyTorch ``nn.Module`` to visualise.
+            module: A PyTorch ``nn.Module`` to visualise, which may live on
+                the ``meta`` device. A ``state_dict`` mapping, or the path
+                (or list of shard paths) of a ``.safetensors`` checkpoint,
+                also works: only shapes and dtypes are read, so no weights
+                are loaded.
             initial_expand_depth: Number of tree levels to expand initially.
         """
         warn_if_in_marimo(
@@ -184,8 +439,77 @@ class ModuleTreeWidget(anywidget.AnyWidget):
             "<code>nn.Module</code> returned from a cell.",
         )
         super().__init__(initial_expand_depth=initial_expand_depth)
+        self._modules_by_path = {}
+        self._repeats = {}
+        self._module = module
         if module is not None:
-            self.tree = _extract_tree(module)
+            self.tree = _extract_tree(
+                _as_module(module), registry=self._modules_by_path, repeats=self._repeats
+            )
+        self.on_msg(self._handle_message)
+
+    def _handle_message(self, _, content, buffers=None):
+        if content.get("type") == "params":
+            path = content.get("path", "")
+            self.send({"type": "params", "path": path, "params": self.get_params(path)})
+
+    def get_params(self, path=""):
+        """Parameter and buffer rows of the module at dotted ``path``.
+
+        The tree only carries a ``param_entries`` count per node; the rows
+        themselves are built here when the browser expands a node. Returns an
+        empty list for unknown paths.
+        """
+        if path not in self._modules_by_path:
+            return []
+        module, shared = self._modules_by_path[path]
+        return _param_entries(module, shared)
+
+    def profile(self, sample_input):
+        """Run one forward pass and show per-module cost in the tree.
+
+        Forward hooks record each module's output shapes, activation bytes,
+        CPU wall time and estimated FLOPs (linear and convolution layers);
+        every node of ``tree`` gets a ``profile`` dict with these, and the
+        widget highlights the layers taking the most time. A node standing
+        for repeated blocks sums them. ``sample_input`` is passed to the
+        model as-is, unpacked if it is a tuple, or as keyword arguments if it
+        is a dict.
+
+        Returns:
+            dict mapping module path to its profile entry.
+        """
+        if not self._modules_by_path or isinstance(self._modules_by_path[""][0], _SpecModule):
+            raise ValueError("profile() needs the widget to be built from an nn.Module")
+        from ._module_profile import profile_modules
+
+        stats = profile_modules(self._module, sample_input)
+        by_path = {
+            path: stats[id(module)]
+            for path, (module, _) in self._modules_by_path.items()
+            if id(module) in stats
+        }
+
+        def merged(path):
+            entries = [by_path[p] for p in self._repeats.get(path, [path]) if p in by_path]
+            if not entries:
+                return None
+            out = {"output_shapes": entries[0]["output_shapes"]}
+            for key in ("calls", "activation_bytes", "time_ms", "self_ms", "flops"):
+                out[key] = sum(entry[key] for entry in entries)
+            return out
+
+        root = dict(self.tree)
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            entry = merged(node.get("path", ""))
+            if entry is not None:
+                node["profile"] = entry
+            node["children"] = [dict(child) for child in node["children"]]
+            stack.extend(node["children"])
+        self.tree = root
+        return by_path
 
     @property
     def total_param_count(self):
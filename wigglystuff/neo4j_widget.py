@@ -1,9 +1,138 @@
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import anywidget
 import traitlets
 
+# How many expanded neighbourhoods to remember, keyed by element id.
+EXPAND_CACHE_SIZE = 256
+# Records read between two ``delta`` messages while a query streams.
+BATCH_SIZE = 200
+
+
+class _QueryExecutor:
+    """Runs Cypher on one worker thread over a single reused session.
+
+    Neo4j sessions are not thread safe, so every call goes through the same
+    worker; that also keeps the session (and its pooled connection) alive
+    between queries instead of opening one per request. A session that
+    raised is closed and replaced on the next call.
+    """
+
+    def __init__(self, driver, database: Optional[str]) -> None:
+        self._driver = driver
+        self._database = database
+        self._session = None
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="neo4j-widget")
+
+    def _run(self, fn: Callable[[Any], Any]) -> Any:
+        if self._session is None:
+            self._session = self._driver.session(database=self._database)
+        try:
+            return fn(self._session)
+        except Exception:
+            self._reset()
+            raise
+
+    def _reset(self) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    def submit(self, fn: Callable[[Any], Any]) -> Future:
+        return self._pool.submit(self._run, fn)
+
+    def call(self, fn: Callable[[Any], Any]) -> Any:
+        return self.submit(fn).result()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._reset()
+
+
+class _Store:
+    """``element_id`` sets for the displayed ``nodes``/``relationships``.
+
+    Remembers the lists it indexes so the widget can tell when a trait was
+    reassigned from elsewhere (``clear()``, a new query) and rebuild.
+    """
+
+    def __init__(self, nodes: List[dict], rels: List[dict]) -> None:
+        self.nodes = nodes
+        self.rels = rels
+        self.node_ids = {n["element_id"] for n in nodes}
+        self.rel_ids = {r["element_id"] for r in rels}
+
+    def extend(self, nodes: List[dict], node_ids: set, rels: List[dict], rel_ids: set) -> None:
+        self.nodes = nodes
+        self.rels = rels
+        self.node_ids |= node_ids
+        self.rel_ids |= rel_ids
+
+
+_RETURN_TAIL = re.compile(r"\bRETURN\b(?![\s\S]*\b(?:RETURN|LIMIT|SKIP)\b)", re.IGNORECASE)
+_RETURN_ONE = re.compile(
+    r"\bRETURN\s+(?:DISTINCT\s+)?([A-Za-z_]\w*)\s*((?:ORDER\s+BY\b[\s\S]*)?)$", re.IGNORECASE
+)
+_UNION = re.compile(r"\bUNION\b", re.IGNORECASE)
+
+
+def _push_down_limit(query: str, limit: int) -> Tuple[str, Optional[int]]:
+    """Append ``LIMIT`` to a query whose rows are each one distinct node.
+
+    ``max_nodes`` counts nodes, so a row limit is only safe when every row
+    is a single node: the query must end in ``RETURN n`` (optionally
+    ``ORDER BY``) with ``n`` bound by a node pattern, and is rewritten to
+    ``RETURN DISTINCT n`` so repeated rows cannot use up the limit. Queries
+    that return several columns, relationships or paths, page themselves
+    (``LIMIT``/``SKIP``) or use ``UNION`` are left alone. Returns the query
+    to run and the pushed limit, if any.
+    """
+    body = query.strip().rstrip(";").rstrip()
+    tail = _RETURN_TAIL.search(body)
+    if not tail or _UNION.search(body):
+        return query, None
+    match = _RETURN_ONE.match(body, tail.start())
+    if match is None:
+        return query, None
+    name, order = match.groups()
+    head = body[: match.start()]
+    var = re.escape(name)
+    is_node = re.search(rf"\(\s*{var}\s*[:{{)]", head)
+    if not is_node or re.search(rf"\[\s*{var}\b|\b{var}\s*=", head):
+        return query, None
+    order = f" {order.strip()}" if order else ""
+    return f"{head}RETURN DISTINCT {name}{order}\nLIMIT {int(limit)}", int(limit)
+
+
+def _collect(value: Any, nodes: Dict[str, Any], rels: Dict[str, Any]) -> None:
+    """Gather nodes and relationships from one record value, like ``Result.graph()``."""
+    if hasattr(value, "relationships") and hasattr(value, "nodes"):  # Path
+        for item in (*value.nodes, *value.relationships):
+            _collect(item, nodes, rels)
+    elif hasattr(value, "start_node") and hasattr(value, "type"):
+        rels[value.element_id] = value
+        # Endpoints may come without labels/properties; a fuller copy
+        # returned in its own column takes precedence.
+        for end in (value.start_node, value.end_node):
+            if end is not None:
+                nodes.setdefault(end.element_id, end)
+    elif hasattr(value, "labels") and hasattr(value, "element_id"):
+        nodes[value.element_id] = value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect(item, nodes, rels)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect(item, nodes, rels)
+
 
 class Neo4jWidget(anywidget.AnyWidget):
     """Interactive Neo4j graph explorer with Cypher query input.
@@ -56,23 +185,35 @@ class Neo4jWidget(anywidget.AnyWidget):
             self._driver = GraphDatabase.driver(uri, auth=auth)
         else:
             raise ValueError("Provide either a neo4j Driver or uri (+ auth).")
+        self._owns_driver = driver is None
         self._database = database
         self._max_nodes = max_nodes
-        schema = self._extract_schema()
+        self._executor = _QueryExecutor(self._driver, database)
+        # Bumped by every query that replaces the graph; jobs started under
+        # an older generation are superseded and their results dropped.
+        self._generation = 0
+        self._jobs: List[Future] = []
+        # Re-entrant: cancelling a queued job runs its callback right away.
+        self._jobs_lock = threading.RLock()
+        self._idle = threading.Condition(self._jobs_lock)
+        self._expand_cache: "OrderedDict[str, Tuple[List[dict], List[dict]]]" = OrderedDict()
+        self._expanding: set = set()
+        self._store: Optional[_Store] = None
+        schema = self._executor.call(self._extract_schema)
         super().__init__(width=width, height=height, schema=schema, **kwargs)
         if initial_query:
-            self._execute_query(initial_query)
-
-    def _extract_schema(self) -> dict:
-        with self._driver.session(database=self._database) as session:
-            labels = [r["label"] for r in session.run("CALL db.labels()")]
-            rel_types = [
-                r["relationshipType"]
-                for r in session.run("CALL db.relationshipTypes()")
-            ]
-            prop_keys = [
-                r["propertyKey"] for r in session.run("CALL db.propertyKeys()")
-            ]
+            self.run_query(initial_query)
+
+    @staticmethod
+    def _extract_schema(session) -> dict:
+        labels = [r["label"] for r in session.run("CALL db.labels()")]
+        rel_types = [
+            r["relationshipType"]
+            for r in session.run("CALL db.relationshipTypes()")
+        ]
+        prop_keys = [
+            r["propertyKey"] for r in session.run("CALL db.propertyKeys()")
+        ]
         return {
             "labels": labels,
             "relationship_types": rel_types,
@@ -93,15 +234,154 @@ class Neo4jWidget(anywidget.AnyWidget):
             return
         self._expand_node(data["element_id"])
 
-    def _execute_query(self, query: str, merge: bool = False) -> None:
+    def _known(self) -> "_Store":
+        """The id index over ``nodes``/``relationships``, rebuilt if reassigned."""
+        store = self._store
+        if store is None or store.nodes is not self.nodes or store.rels is not self.relationships:
+            store = self._store = _Store(self.nodes, self.relationships)
+        return store
+
+    def _truncated(self) -> str:
+        return (
+            f"Results truncated to {self._max_nodes} nodes. "
+            "Use a LIMIT clause or call clear() first."
+        )
+
+    def _start(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        *,
+        merge: bool,
+        on_result: Optional[Callable[[List[dict], List[dict]], None]] = None,
+    ) -> Future:
+        """Stream ``query`` on the worker into the graph.
+
+        Records are read in batches of ``BATCH_SIZE``; each batch's new nodes
+        and relationships go to the browser as a ``delta`` message, and the
+        traits are assigned once at the end. Without ``merge`` the job
+        replaces the graph and supersedes earlier jobs: queued ones are
+        cancelled, and a running one stops reading and has its results
+        dropped. ``on_result`` receives every entity the query returned
+        (not just the new ones) unless it was cut short.
+        """
+        with self._jobs_lock:
+            if not merge:
+                self._generation += 1
+                for job in list(self._jobs):
+                    job.cancel()
+            generation = self._generation
+
+        def stale() -> bool:
+            return generation != self._generation
+
+        def fetch(session) -> Optional[Tuple[List[dict], List[dict], bool]]:
+            if stale():
+                return None
+            store = self._known() if merge else _Store([], [])
+            room = self._max_nodes - len(store.node_ids)
+            if room <= 0:
+                return [], [], True
+            # Ask for one node more than fits, so a full cap is detectable.
+            # Merges skip this: rows holding known nodes would use up the
+            # limit without using up room.
+            run_query = query if merge else _push_down_limit(query, room + 1)[0]
+            result = session.run(run_query, **params)
+            nodes: Dict[str, dict] = {}
+            rels: Dict[str, dict] = {}
+            fresh_nodes: List[dict] = []
+            fresh_rels: List[dict] = []
+            sent = [0, 0]
+            reset = not merge
+            truncated = False
+            rows = 0
+
+            def flush() -> None:
+                nonlocal reset
+                batch_nodes, batch_rels = fresh_nodes[sent[0]:], fresh_rels[sent[1]:]
+                if batch_nodes or batch_rels:
+                    self.send(
+                        {
+                            "type": "delta",
+                            "reset": reset,
+                            "nodes": batch_nodes,
+                            "relationships": batch_rels,
+                        }
+                    )
+                    reset = False
+                    sent[:] = [len(fresh_nodes), len(fresh_rels)]
+
+            for record in result:
+                if stale():
+                    # Tell the server to drop the rest instead of streaming it.
+                    result.consume()
+                    return None
+                rows += 1
+                raw_nodes: Dict[str, Any] = {}
+                raw_rels: Dict[str, Any] = {}
+                for value in record.values():
+                    _collect(value, raw_nodes, raw_rels)
+                for element_id, raw in raw_nodes.items():
+                    if element_id in nodes:
+                        continue
+                    is_new = element_id not in store.node_ids
+                    if is_new and len(fresh_nodes) >= room:
+                        truncated = True
+                        continue
+                    (node,) = self._convert_nodes([raw])
+                    nodes[element_id] = node
+                    if is_new:
+                        fresh_nodes.append(node)
+                for element_id, raw in raw_rels.items():
+                    if element_id in rels:
+                        continue
+                    (rel,) = self._convert_relationships([raw])
+                    ends = (rel["start_node_element_id"], rel["end_node_element_id"])
+                    if not all(end in nodes or end in store.node_ids for end in ends):
+                        continue
+                    rels[element_id] = rel
+                    if element_id not in store.rel_ids:
+                        fresh_rels.append(rel)
+                if truncated:
+                    result.consume()
+                    break
+                if rows % BATCH_SIZE == 0 and not stale():
+                    flush()
+            if stale():
+                return None
+            flush()
+            if on_result is not None and not truncated:
+                on_result(list(nodes.values()), list(rels.values()))
+            return fresh_nodes, fresh_rels, truncated
+
         self.query_running = True
         self.error = ""
-        try:
-            with self._driver.session(database=self._database) as session:
-                result = session.run(query)
-                graph = result.graph()
-                new_nodes = self._convert_nodes(graph.nodes)
-                new_rels = self._convert_relationships(graph.relationships)
+        with self._jobs_lock:
+            future = self._executor.submit(fetch)
+            self._jobs.append(future)
+
+        def done(job: Future) -> None:
+            try:
+                if not job.cancelled() and not stale():
+                    error = job.exception()
+                    if error is not None:
+                        self.error = str(error)
+                    elif job.result() is not None:
+                        self._apply(*job.result(), merge=merge)
+            finally:
+                with self._idle:
+                    if job in self._jobs:
+                        self._jobs.remove(job)
+                    self.query_running = bool(self._jobs)
+                    self._idle.notify_all()
+
+        future.add_done_callback(done)
+        return future
+
+    def _apply(
+        self, new_nodes: List[dict], new_rels: List[dict], truncated: bool, *, merge: bool
+    ) -> None:
+        with self.hold_sync():
             if merge:
                 self._merge_graph(new_nodes, new_rels)
             else:
@@ -109,56 +389,70 @@ class Neo4jWidget(anywidget.AnyWidget):
                 self.selected_relationships = []
                 self.nodes = new_nodes
                 self.relationships = new_rels
-        except Exception as e:
-            self.error = str(e)
-        finally:
-            self.query_running = False
+            if truncated:
+                self.error = self._truncated()
 
-    def _expand_node(self, element_id: str) -> None:
+    def _execute_query(self, query: str, merge: bool = False) -> Future:
+        return self._start(query, {}, merge=merge)
+
+    def _expand_node(self, element_id: str) -> Optional[Future]:
+        cached = self._expand_cache.get(element_id)
+        if cached is not None:
+            self._expand_cache.move_to_end(element_id)
+            self._merge_graph(*cached)
+            return None
+        if element_id in self._expanding:
+            return None
+        self._expanding.add(element_id)
         query = "MATCH (n)-[r]-(m) WHERE elementId(n) = $eid RETURN n, r, m"
-        self.query_running = True
-        self.error = ""
-        try:
-            with self._driver.session(database=self._database) as session:
-                result = session.run(query, eid=element_id)
-                graph = result.graph()
-                new_nodes = self._convert_nodes(graph.nodes)
-                new_rels = self._convert_relationships(graph.relationships)
-            self._merge_graph(new_nodes, new_rels)
-        except Exception as e:
-            self.error = str(e)
-        finally:
-            self.query_running = False
+
+        def remember(nodes: List[dict], rels: List[dict]) -> None:
+            self._expand_cache[element_id] = (nodes, rels)
+            while len(self._expand_cache) > EXPAND_CACHE_SIZE:
+                self._expand_cache.popitem(last=False)
+
+        future = self._start(query, {"eid": element_id}, merge=True, on_result=remember)
+        future.add_done_callback(lambda _: self._expanding.discard(element_id))
+        return future
 
     def _merge_graph(
         self, new_nodes: List[dict], new_rels: List[dict]
     ) -> None:
-        existing_node_ids = {n["element_id"] for n in self.nodes}
-        existing_rel_ids = {r["element_id"] for r in self.relationships}
+        """Append the unseen nodes/relationships, in time proportional to the batch."""
+        store = self._known()
+        room = self._max_nodes - len(store.node_ids)
+        fresh_nodes = []
+        fresh_ids = set()
+        truncated = False
+        for node in new_nodes:
+            element_id = node["element_id"]
+            if element_id in store.node_ids or element_id in fresh_ids:
+                continue
+            if len(fresh_nodes) >= room:
+                truncated = True
+                continue
+            fresh_nodes.append(node)
+            fresh_ids.add(element_id)
+        fresh_rels = []
+        fresh_rel_ids = set()
+        for rel in new_rels:
+            element_id = rel["element_id"]
+            if element_id in store.rel_ids or element_id in fresh_rel_ids:
+                continue
+            ends = (rel["start_node_element_id"], rel["end_node_element_id"])
+            if not all(end in store.node_ids or end in fresh_ids for end in ends):
+                continue
+            fresh_rels.append(rel)
+            fresh_rel_ids.add(element_id)
 
-        merged_nodes = list(self.nodes) + [
-            n for n in new_nodes if n["element_id"] not in existing_node_ids
-        ]
-        merged_rels = list(self.relationships) + [
-            r for r in new_rels if r["element_id"] not in existing_rel_ids
-        ]
-
-        if len(merged_nodes) > self._max_nodes:
-            merged_nodes = merged_nodes[: self._max_nodes]
-            kept_ids = {n["element_id"] for n in merged_nodes}
-            merged_rels = [
-                r
-                for r in merged_rels
-                if r["start_node_element_id"] in kept_ids
-                and r["end_node_element_id"] in kept_ids
-            ]
-            self.error = (
-                f"Results truncated to {self._max_nodes} nodes. "
-                "Use a LIMIT clause or call clear() first."
-            )
-
-        self.nodes = merged_nodes
-        self.relationships = merged_rels
+        with self.hold_sync():
+            if fresh_nodes:
+                self.nodes = self.nodes + fresh_nodes
+            if fresh_rels:
+                self.relationships = self.relationships + fresh_rels
+            if truncated:
+                self.error = self._truncated()
+        store.extend(self.nodes, fresh_ids, self.relationships, fresh_rel_ids)
 
     @staticmethod
     def _convert_nodes(neo4j_nodes) -> List[dict]:
@@ -214,9 +508,32 @@ class Neo4jWidget(anywidget.AnyWidget):
             )
         return result
 
-    def run_query(self, query: str) -> None:
-        """Execute a Cypher query and merge results into the graph."""
+    def run_query(self, query: str, *, block: bool = True) -> None:
+        """Execute a Cypher query and show its results in the graph.
+
+        Queries typed in the widget run on a background thread and never
+        block the kernel; from Python, pass ``block=False`` to get the same
+        behaviour and :meth:`wait` to catch up later.
+        """
         self._execute_query(query)
+        if block:
+            self.wait()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued and running query has finished.
+
+        Returns ``False`` if ``timeout`` seconds passed first.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._jobs, timeout)
+
+    def close(self) -> None:
+        """Stop the query thread and close the session (and the driver, if
+        this widget created it from ``uri``)."""
+        self._executor.close()
+        if self._owns_driver:
+            self._driver.close()
+        super().close()
 
     def get_selected_node_data(self) -> List[dict]:
         """Return full node dicts for currently selected nodes."""
@@ -229,7 +546,8 @@ class Neo4jWidget(anywidget.AnyWidget):
         return [r for r in self.relationships if r["element_id"] in selected]
 
     def clear(self) -> None:
-        """Clear the graph display and selection."""
+        """Clear the graph display, selection and cached node expansions."""
+        self._expand_cache.clear()
         self.nodes = []
         self.relationships = []
         self.selected_nodes = []
@@ -10,6 +10,8 @@ import anywidget
 import traitlets
 
 from ._tree_utils import (
+    LazyTree,
+    _BuiltTree,
     aggregate_values,
     collect_columns,
     tree_from_dataframe,
@@ -42,6 +44,10 @@ class NestedTable(anywidget.AnyWidget):
             per-column formatters. Default: integer when whole, else two
             decimals.
         width: CSS width string for the table.
+        lazy: Only send rows down to ``initial_expand_depth``. Deeper rows are
+            sent when their parent is expanded, so huge trees open instantly.
+            ``data`` then holds only those first levels; deeper rows go to
+            the browser as messages and are not added to it.
 
     Examples:
         ```python
@@ -79,8 +85,12 @@ class NestedTable(anywidget.AnyWidget):
         show_percent: bool | Sequence[str] = True,
         format: Formatter | Mapping[str, Formatter] | None = None,
         width: str = "100%",
+        lazy: bool = False,
     ):
         prepared, cols = self._prepare(data, formatter=format)
+        self._lazy = LazyTree(prepared) if lazy and prepared.get("children") else None
+        if self._lazy is not None:
+            prepared = self._lazy.initial(initial_expand_depth)
         effective_cols = cols or ["value"]
         if show_percent is True:
             pct_cols = list(effective_cols)
@@ -101,6 +111,24 @@ class NestedTable(anywidget.AnyWidget):
             initial_expand_depth=initial_expand_depth,
             width=width,
         )
+        if self._lazy is not None:
+            self.observe(self._load_expanded, names="expanded_paths")
+            self.observe(self._reload_initial, names="initial_expand_depth")
+            self.on_msg(self._handle_message)
+
+    def _handle_message(self, _: Any, content: Any, buffers: Any) -> None:
+        # A new view (or a reloaded page) only has ``data``: resend the rest.
+        if isinstance(content, dict) and content.get("type") == "resync":
+            self._lazy.reset()
+            self._load_expanded({"new": self.expanded_paths})
+
+    def _load_expanded(self, change: dict) -> None:
+        updates = [u for path in change["new"] for u in self._lazy.load(path, 1)]
+        if updates:
+            self.send({"type": "children", "nodes": updates})
+
+    def _reload_initial(self, change: dict) -> None:
+        self.data = self._lazy.initial(change["new"])
 
     @staticmethod
     def _prepare(
@@ -110,9 +138,13 @@ class NestedTable(anywidget.AnyWidget):
     ) -> tuple[dict, list[str]]:
         if data is None:
             return {"name": "root", "children": []}, []
-        tree = copy.deepcopy(dict(data))
-        validate_tree(tree)
-        aggregate_values(tree)
+        if isinstance(data, _BuiltTree):
+            # Built by a from_* constructor: validated, aggregated, unshared.
+            tree = data.tree
+        else:
+            tree = copy.deepcopy(dict(data))
+            validate_tree(tree)
+            aggregate_values(tree)
         cols = collect_columns(tree)
         if formatter is not None:
             _apply_formatter(tree, formatter, cols=cols)
@@ -144,7 +176,8 @@ class NestedTable(anywidget.AnyWidget):
             ))
             ```
         """
-        return cls(tree_from_paths(mapping, sep=sep, root_name=root_name), **kwargs)
+        tree = tree_from_paths(mapping, sep=sep, root_name=root_name)
+        return cls(_BuiltTree(tree), **kwargs)
 
     @classmethod
     def from_records(
@@ -177,7 +210,7 @@ class NestedTable(anywidget.AnyWidget):
         tree = tree_from_records(
             records, path_cols=path_cols, value_cols=value_cols, root_name=root_name
         )
-        return cls(tree, **kwargs)
+        return cls(_BuiltTree(tree), **kwargs)
 
     @classmethod
     def from_dataframe(
@@ -215,7 +248,7 @@ class NestedTable(anywidget.AnyWidget):
         tree = tree_from_dataframe(
             df, path_cols=path_cols, value_cols=value_cols, root_name=root_name
         )
-        return cls(tree, **kwargs)
+        return cls(_BuiltTree(tree), **kwargs)
 
 
 def _apply_formatter(
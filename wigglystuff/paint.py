@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import time
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union
@@ -13,11 +14,57 @@ import warnings
 import anywidget
 import traitlets
 
+from ._paint_strokes import Stroke, render_strokes, stroke_bounds
+
 if TYPE_CHECKING:
     from PIL import Image
 
 DEFAULT_HEIGHT = 500
 DEFAULT_WIDTH = 889
+# Edge of the square tiles the canvas is synced in; must match widget.tsx.
+TILE_SIZE = 64
+# Strokes whose pre-stroke tiles are kept for undo, like the browser's stack.
+UNDO_DEPTH = 20
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("numpy is required to use Paint.") from exc
+    return np
+
+
+def _tile_boxes(height: int, width: int, tile: int = TILE_SIZE):
+    """``(x, y, w, h)`` of every tile covering a ``height`` x ``width`` canvas."""
+    return [
+        (x, y, min(tile, width - x), min(tile, height - y))
+        for y in range(0, height, tile)
+        for x in range(0, width, tile)
+    ]
+
+
+def _tiles_over(y0: int, x0: int, y1: int, x1: int, height: int, width: int, tile: int = TILE_SIZE):
+    """Boxes of the tiles overlapping the pixel box ``(y0, x0, y1, x1)``."""
+    return [
+        (x, y, min(tile, width - x), min(tile, height - y))
+        for y in range(y0 - y0 % tile, y1, tile)
+        for x in range(x0 - x0 % tile, x1, tile)
+    ]
+
+
+def _changed_tiles(mask, tile: int = TILE_SIZE):
+    """Boxes of the tiles in which a boolean ``(height, width)`` mask is set."""
+    np = _numpy()
+    height, width = mask.shape
+    rows, cols = -(-height // tile), -(-width // tile)
+    padded = np.zeros((rows * tile, cols * tile), dtype=bool)
+    padded[:height, :width] = mask
+    hit = padded.reshape(rows, tile, cols, tile).any(axis=(1, 3))
+    return [
+        (c * tile, r * tile, min(tile, width - c * tile), min(tile, height - r * tile))
+        for r, c in zip(*np.nonzero(hit))
+    ]
 
 
 def base64_to_pil(base64_string: str):
@@ -90,6 +137,21 @@ class Paint(anywidget.AnyWidget):
     randomly-colored particles around the cursor — handy for generating noisy,
     multi-color masks for image models.
 
+    The canvas lives in Python as a ``(height, width, 4)`` RGBA NumPy array.
+    It is synced in ``TILE_SIZE`` square tiles sent as binary buffers: after
+    a stroke the browser sends only the tiles it touched, and
+    ``replace_with_pil()`` sends only the tiles that differ. ``get_array()``
+    and ``get_pil()`` read the array without decoding anything, and
+    ``revision`` ticks after every stroke so you can observe it.
+
+    Every stroke is also logged as a :class:`Stroke` (tool, points, size,
+    color, timestamp), a few bytes per point. ``strokes`` holds the log
+    since the canvas was last replaced, ``render_strokes()`` rasterizes it
+    with NumPy at any scale, and ``undo_stroke()`` drops the last one and
+    puts back the tiles it covered. Set
+    ``sync_tiles=False`` to send only the strokes; Python then rasterizes
+    them into the canvas itself.
+
     Examples:
         ```python
         import marimo as mo
@@ -103,7 +165,6 @@ class Paint(anywidget.AnyWidget):
     _esm = Path(__file__).parent / "static" / "paint.js"
     _css = Path(__file__).parent / "static" / "paint.css"
 
-    base64 = traitlets.Unicode("").tag(sync=True)
     height = traitlets.Int(DEFAULT_HEIGHT).tag(sync=True)
     width = traitlets.Int(DEFAULT_WIDTH).tag(sync=True)  # rough 16:9 ratio
     store_background = traitlets.Bool(True).tag(sync=True)
@@ -113,14 +174,16 @@ class Paint(anywidget.AnyWidget):
     eraser = traitlets.Bool(True).tag(sync=True)
     color_picker = traitlets.Bool(True).tag(sync=True)
     color = traitlets.Unicode("#000000").tag(sync=True)
+    revision = traitlets.Int(0).tag(sync=True)
+    sync_tiles = traitlets.Bool(True).tag(sync=True)
 
-    def __init__(self, height: int = DEFAULT_HEIGHT, width: int = DEFAULT_WIDTH, store_background: bool = True, init_image: Optional[Any] = None, rainbow_brush: bool = False, brush: bool = True, marker: bool = True, eraser: bool = True, color_picker: bool = True, color: str = "#000000"):
+    def __init__(self, height: int = DEFAULT_HEIGHT, width: int = DEFAULT_WIDTH, store_background: bool = True, init_image: Optional[Any] = None, rainbow_brush: bool = False, brush: bool = True, marker: bool = True, eraser: bool = True, color_picker: bool = True, color: str = "#000000", sync_tiles: bool = True):
         """Create a Paint widget.
 
         Args:
             height: Canvas height in pixels.
             width: Canvas width in pixels (ignored when ``init_image`` sets aspect ratio).
-            store_background: Persist previous strokes when background changes.
+            store_background: Composite the drawing onto white when reading it back.
             init_image: Optional path/URL/PIL image/bytes to preload.
             rainbow_brush: Show an extra spray tool that paints randomly-colored particles.
             brush: Show the thin brush tool.
@@ -128,6 +191,8 @@ class Paint(anywidget.AnyWidget):
             eraser: Show the eraser tool.
             color_picker: Show the color picker (hide it to lock drawing to ``color``).
             color: Drawing color as a hex string; two-way synced with the picker.
+            sync_tiles: Send the pixels of changed tiles after each stroke. When
+                off only the stroke log is sent and Python rasterizes it.
         """
         if not (brush or marker or eraser or rainbow_brush):
             raise ValueError(
@@ -135,54 +200,50 @@ class Paint(anywidget.AnyWidget):
                 "(brush, marker, eraser, or rainbow_brush)."
             )
 
+        np = _numpy()
+        self._canvas = None
+        self._base = None
+        self._strokes: list = []
+        # Per stroke, the tiles it covered as they were before it was drawn.
+        self._undo: list = []
         super().__init__()
 
         user_provided_width = width != DEFAULT_WIDTH
         user_provided_height = height != DEFAULT_HEIGHT
 
-        if init_image is not None:
-            pil_image = input_to_pil(init_image)
-            if pil_image is not None:
-                image_width, image_height = pil_image.size
-                aspect_ratio = image_width / image_height
-
-                if user_provided_width and user_provided_height:
-                    self.width = width
-                    self.height = height
-                    if abs(width / height - aspect_ratio) > 0.01:
-                        warnings.warn(
-                            f"Specified dimensions ({width}x{height}) have a different aspect ratio "
-                            f"than the image ({image_width}x{image_height}). Image will be scaled to fit."
-                        )
-                elif user_provided_width:
-                    self.width = width
-                    self.height = int(width / aspect_ratio)
-                elif user_provided_height:
-                    self.height = height
-                    self.width = int(height * aspect_ratio)
-                else:
-                    self.width = image_width
-                    self.height = image_height
-
-                if (self.width, self.height) != pil_image.size:
-                    from PIL import Image as _PILImage
-                    pil_image = pil_image.resize(
-                        (self.width, self.height), _PILImage.LANCZOS
+        pil_image = input_to_pil(init_image) if init_image is not None else None
+        if pil_image is not None:
+            image_width, image_height = pil_image.size
+            aspect_ratio = image_width / image_height
+
+            if user_provided_width and user_provided_height:
+                self.width = width
+                self.height = height
+                if abs(width / height - aspect_ratio) > 0.01:
+                    warnings.warn(
+                        f"Specified dimensions ({width}x{height}) have a different aspect ratio "
+                        f"than the image ({image_width}x{image_height}). Image will be scaled to fit."
                     )
-                encoded = pil_to_base64(pil_image).split(",")[1]
-                self.base64 = encoded
-            else:
+            elif user_provided_width:
                 self.width = width
+                self.height = int(width / aspect_ratio)
+            elif user_provided_height:
                 self.height = height
-                self.base64 = pil_to_base64(
-                    create_empty_image(width, height, (0, 0, 0, 0))
-                ).split(",")[1]
+                self.width = int(height * aspect_ratio)
+            else:
+                self.width = image_width
+                self.height = image_height
+
+            if (self.width, self.height) != pil_image.size:
+                from PIL import Image as _PILImage
+                pil_image = pil_image.resize(
+                    (self.width, self.height), _PILImage.LANCZOS
+                )
+            self._canvas = np.array(pil_image.convert("RGBA"))
         else:
             self.width = width
             self.height = height
-            self.base64 = pil_to_base64(
-                create_empty_image(width, height, (0, 0, 0, 0))
-            ).split(",")[1]
+            self._canvas = np.zeros((height, width, 4), dtype=np.uint8)
 
         self.store_background = store_background
         self.rainbow_brush = rainbow_brush
@@ -191,28 +252,201 @@ class Paint(anywidget.AnyWidget):
         self.eraser = eraser
         self.color_picker = color_picker
         self.color = color
+        self.sync_tiles = sync_tiles
+        self._base = self._canvas.copy()
+        self.on_msg(self._handle_message)
+
+    @traitlets.observe("width", "height")
+    def _resize_canvas(self, change) -> None:
+        # The browser asks for a full sync once its canvas has been resized.
+        if self._canvas is None or self._canvas.shape[:2] == (self.height, self.width):
+            return
+        from PIL import Image
+
+        img = Image.fromarray(self._canvas, "RGBA").resize((self.width, self.height), Image.LANCZOS)
+        self._canvas = _numpy().array(img)
+        # Like the browser's undo stack, the stroke log starts over.
+        self._base = self._canvas.copy()
+        self._strokes = []
+        self._undo = []
+
+    def _handle_message(self, _: Any, content: dict, buffers: Optional[list] = None) -> None:
+        kind = content.get("type")
+        if kind == "tiles":
+            np = _numpy()
+            height, width = self._canvas.shape[:2]
+            for (x, y, w, h), buf in zip(content.get("tiles", []), buffers or []):
+                if x + w > width or y + h > height:
+                    continue  # sent before a resize reached the browser
+                self._canvas[y : y + h, x : x + w] = np.frombuffer(buf, dtype=np.uint8).reshape(h, w, 4)
+        elif kind == "sync":
+            self._send_base()
+        elif kind == "stroke":
+            np = _numpy()
+            points = np.frombuffer(buffers[0], dtype=np.float32).reshape(-1, 2) if buffers else np.zeros((0, 2), np.float32)
+            stamp = content.get("timestamp")
+            self._log(Stroke(
+                content.get("tool", "brush"),
+                points,
+                float(content.get("size", 2)),
+                content.get("color", "#000000"),
+                stamp / 1000.0 if stamp is not None else time.time(),
+            ))
+        elif kind == "clear":
+            self._log(Stroke("clear", _numpy().zeros((0, 2), dtype="float32"), 0.0, "", time.time()))
+        elif kind == "undo":
+            if self._strokes:
+                self._strokes.pop()
+                snapshot = self._undo.pop()
+                if not self.sync_tiles:
+                    self._restore(snapshot)
+
+    def _log(self, stroke: Stroke) -> None:
+        # Stroke messages arrive before their tiles, so the canvas still
+        # shows what the stroke is about to cover.
+        height, width = self._canvas.shape[:2]
+        bounds = stroke_bounds(_numpy(), stroke, height, width)
+        boxes = [] if bounds is None else _tiles_over(*bounds, height, width)
+        self._undo.append([(box, self._tile(box).copy()) for box in boxes])
+        if len(self._undo) > UNDO_DEPTH:
+            self._undo[-UNDO_DEPTH - 1] = None
+        self._strokes.append(stroke)
+        if self.sync_tiles:
+            return  # the pixels follow as tiles
+        if stroke.tool == "clear":
+            self._canvas = self._base.copy()
+        else:
+            self._canvas = render_strokes(self._canvas, [stroke])
+
+    def _tile(self, box):
+        x, y, w, h = box
+        return self._canvas[y : y + h, x : x + w]
+
+    def _restore(self, snapshot) -> list:
+        """Put back the tiles saved before a stroke and return their boxes.
+
+        Strokes older than ``UNDO_DEPTH`` have no snapshot; the canvas is then
+        re-rasterized from the log.
+        """
+        if snapshot is None:
+            new = self.render_strokes()
+            boxes = _changed_tiles((new != self._canvas).any(axis=2))
+            self._canvas = new
+            return boxes
+        for box, pixels in snapshot:
+            self._tile(box)[...] = pixels
+        return [box for box, _ in snapshot]
+
+    def _send_tiles(self, boxes, reset: bool = False, base: bool = False) -> None:
+        # ``base`` marks the canvas Clear goes back to, drawn from ``_base``.
+        if not boxes and not reset:
+            return
+        source = self._base if base else self._canvas
+        self.send(
+            {"type": "tiles", "reset": reset, "base": base, "tiles": [list(map(int, box)) for box in boxes]},
+            [source[y : y + h, x : x + w].tobytes() for x, y, w, h in boxes],
+        )
+
+    def _send_base(self) -> None:
+        """Redraw the browser from ``_base``, then the strokes on top of it."""
+        self._send_tiles(_changed_tiles(self._base[..., 3] != 0), reset=True, base=True)
+        self._send_tiles(_changed_tiles((self._canvas != self._base).any(axis=2)))
+
+    @property
+    def strokes(self) -> list:
+        """Strokes drawn since the canvas was created, replaced or resized, oldest first."""
+        return list(self._strokes)
+
+    def render_strokes(self, n: Optional[int] = None, scale: float = 1.0):
+        """Rasterize the stroke log onto the starting canvas with NumPy.
+
+        Args:
+            n: Replay only the first ``n`` strokes (all of them by default),
+                e.g. to step through how a mask was drawn.
+            scale: Resolution relative to the canvas; strokes are vector data
+                so ``scale=4`` gives a crisp mask four times the size.
+
+        Returns a ``(height * scale, width * scale, 4)`` uint8 RGBA array,
+        without ``store_background`` compositing. Rainbow sprays are
+        re-sampled, so they differ from the browser's particles.
+        """
+        strokes = self._strokes if n is None else self._strokes[:n]
+        return render_strokes(self._base, strokes, scale=scale)
+
+    def undo_stroke(self) -> Optional[Stroke]:
+        """Drop the last stroke and put back the tiles it covered.
+
+        The tiles come from a snapshot taken before the stroke, so the rest
+        of the canvas keeps the browser's exact pixels. The browser receives
+        those tiles and drops its own last undo step. Returns the removed
+        stroke, or ``None``.
+        """
+        if not self._strokes:
+            return None
+        stroke = self._strokes.pop()
+        boxes = self._restore(self._undo.pop())
+        self.send({"type": "undo"})
+        self._send_tiles(boxes)
+        return stroke
+
+    def get_array(self):
+        """Return the current drawing as a ``(height, width, 4)`` uint8 RGBA array.
+
+        With ``store_background`` the drawing is composited onto white, as
+        the canvas shows it. The result is a copy.
+        """
+        np = _numpy()
+        if not self.store_background:
+            return self._canvas.copy()
+        canvas = self._canvas.astype(np.uint16)
+        alpha = canvas[..., 3:]
+        out = np.empty_like(self._canvas)
+        out[..., :3] = (canvas[..., :3] * alpha + 255 * (255 - alpha) + 127) // 255
+        out[..., 3] = 255
+        return out
 
     def get_pil(self):
         """Return the current drawing as a PIL Image."""
-        if not self.base64:
-            return create_empty_image(width=self.width, height=self.height, background_color=(0, 0, 0, 0))
+        from PIL import Image
 
-        return base64_to_pil(self.base64)
+        return Image.fromarray(self.get_array(), "RGBA")
 
     def get_base64(self) -> str:
         """Return the current drawing as a base64 string (data URL)."""
-        if not self.base64:
-            return ""
         return pil_to_base64(self.get_pil())
 
+    @property
+    def base64(self) -> str:
+        """The raw canvas as a base64 PNG payload (no data URL prefix).
+
+        Encoded on every read; assigning a base64 image (with or without
+        the prefix) is the same as calling ``replace_with_pil()`` with it.
+        """
+        from PIL import Image
+
+        return pil_to_base64(Image.fromarray(self._canvas, "RGBA")).split(",")[1]
+
+    @base64.setter
+    def base64(self, value: str) -> None:
+        self.replace_with_pil(base64_to_pil(value))
+
     def replace_with_pil(self, img) -> None:
         """Replace the canvas contents with a PIL Image.
 
-        Wipes any existing strokes — the canvas has no separate background layer.
+        Wipes any existing strokes — the canvas has no separate background layer —
+        and starts a new stroke log on top of ``img``, which is also what the
+        browser's Clear button and undo history now go back to.
         The image is resized to ``(self.width, self.height)`` if needed.
         """
         if img.size != (self.width, self.height):
             from PIL import Image
 
             img = img.resize((self.width, self.height), Image.LANCZOS)
-        self.base64 = pil_to_base64(img).split(",")[1]
+        new = _numpy().array(img.convert("RGBA"))
+        if (new == self._canvas).all() and (new == self._base).all():
+            return
+        self._canvas = new
+        self._base = new.copy()
+        self._strokes = []
+        self._undo = []
+        self._send_base()
@@ -6,9 +6,21 @@ function buildLanes(events, nowMs, running) {
 
   for (const e of events) {
     if (!byTask.has(e.task)) {
-      byTask.set(e.task, { task: e.task, coro: e.coro, events: [] });
+      byTask.set(e.task, { task: e.task, coro: e.coro, events: [], blocks: [] });
     }
     const lane = byTask.get(e.task);
+    if (e.event === "BLOCK") {
+      // Marks the run that just ended as loop-blocking; not a state change.
+      const m = /blocked ([0-9.]+)ms/.exec(e.detail || "");
+      const dur = m ? parseFloat(m[1]) : 0;
+      lane.blocks.push({ start: e.t_ms - dur, end: e.t_ms, line: e.line, detail: e.detail });
+      if (e.t_ms > maxT) maxT = e.t_ms;
+      continue;
+    }
+    // Submits only matter to the executor lanes, via the START detail.
+    if (e.event === "SUBMIT") continue;
+    if (e.event === "START" || e.event === "FINISH") lane.thread = true;
+    if (e.event === "START") lane.coro = e.coro;
     lane.events.push(e);
     if (e.event === "SPAWN") {
       if (e.coro) lane.coro = e.coro;
@@ -22,6 +34,7 @@ function buildLanes(events, nowMs, running) {
   // Turn each task's events into run/wait segments + timing totals.
   const laneMap = new Map();
   for (const lane of byTask.values()) {
+    if (!lane.events.length) continue;
     const evs = lane.events.slice().sort((a, b) => a.t_ms - b.t_ms);
     const segs = [];
     let segStart = null;
@@ -32,6 +45,8 @@ function buildLanes(events, nowMs, running) {
     let lastT = spawnT;
     let runMs = 0;
     let waitMs = 0;
+    let jobs = 0;
+    let queuedMs = 0;
 
     const closeSeg = (end) => {
       if (segStart !== null && mode !== null && end > segStart) {
@@ -45,11 +60,19 @@ function buildLanes(events, nowMs, running) {
       lastT = e.t_ms;
       closeSeg(e.t_ms);
       switch (e.event) {
-        case "SPAWN": spawnT = e.t_ms; segStart = e.t_ms; mode = "run"; break;
+        // Queued on the loop until its first step, which arrives as a RESUME.
+        case "SPAWN": spawnT = e.t_ms; segStart = null; mode = null; break;
         case "RESUME": segStart = e.t_ms; mode = "run"; break;
         case "SUSPEND": segStart = e.t_ms; mode = "wait"; break;
         case "RETURN": segStart = e.t_ms; mode = "run"; break;
         case "DONE": segStart = null; mode = null; done = true; doneT = e.t_ms; break;
+        case "START": {
+          segStart = e.t_ms; mode = "run"; jobs += 1;
+          const m = /queued ([0-9.]+)ms/.exec(e.detail || "");
+          if (m) queuedMs += parseFloat(m[1]);
+          break;
+        }
+        case "FINISH": segStart = null; mode = null; break;
         default: break;
       }
     }
@@ -60,12 +83,17 @@ function buildLanes(events, nowMs, running) {
     laneMap.set(lane.task, {
       task: lane.task, coro: lane.coro, depth: 0, segs, done,
       spawnT, endT, durMs: Math.max(0, endT - spawnT), runMs, waitMs,
+      blocks: lane.blocks, thread: !!lane.thread, jobs, queuedMs,
+      blockMs: lane.blocks.reduce((acc, b) => acc + (b.end - b.start), 0),
     });
   }
 
   // Group children under parents; roots are tasks whose parent we don't track.
   const children = new Map();
+  const threads = [];
   for (const task of laneMap.keys()) {
+    // Executor threads get their own block of lanes below the task tree.
+    if (laneMap.get(task).thread) { threads.push(laneMap.get(task)); continue; }
     const p = parent[task];
     const key = p && laneMap.has(p) ? p : "__root__";
     if (!children.has(key)) children.set(key, []);
@@ -84,6 +112,8 @@ function buildLanes(events, nowMs, running) {
     for (const c of children.get(task) || []) walk(c, depth + 1);
   };
   for (const r of children.get("__root__") || []) walk(r, 0);
+  threads.sort((a, b) => a.task.localeCompare(b.task, undefined, { numeric: true }));
+  lanes.push(...threads);
   return { lanes, maxT };
 }
 
@@ -118,17 +148,39 @@ function render({ model, el }) {
   const hideTip = () => { tip.style.display = "none"; };
 
   function laneTip(lane) {
+    if (lane.thread) {
+      return (
+        `<div class="af-tip-title">${lane.task}<span class="af-tip-task"> executor thread</span></div>` +
+        `<div class="af-tip-row"><span>jobs</span><b>${lane.jobs}</b></div>` +
+        `<div class="af-tip-row"><span>busy</span><b>${fmt(lane.runMs)}</b></div>` +
+        `<div class="af-tip-row"><span>queued</span><b>${fmt(lane.queuedMs)}</b></div>` +
+        `<div class="af-tip-foot">last job: ${lane.coro}</div>`
+      );
+    }
     return (
       `<div class="af-tip-title">${lane.coro}<span class="af-tip-task"> ${lane.task}</span></div>` +
       `<div class="af-tip-row"><span>total</span><b>${fmt(lane.durMs)}</b></div>` +
       `<div class="af-tip-row"><span>ran</span><b>${fmt(lane.runMs)}</b></div>` +
       `<div class="af-tip-row"><span>waited</span><b>${fmt(lane.waitMs)}</b></div>` +
+      (lane.blocks.length
+        ? `<div class="af-tip-row af-tip-block"><span>blocked loop</span><b>${fmt(lane.blockMs)}</b></div>`
+        : "") +
       `<div class="af-tip-foot">${lane.done ? "finished at " + fmt(lane.endT) : "still running…"}</div>`
     );
   }
 
+  // Local copy of the event list: the synced trait only carries the full
+  // list after a run, while it runs Python sends each frame's new events.
+  let events = model.get("events") || [];
+
+  function onMessage(msg) {
+    if (!msg || msg.type !== "events") return;
+    events = msg.reset ? msg.events.slice() : events.concat(msg.events);
+    if (msg.limit && events.length > msg.limit) events = events.slice(events.length - msg.limit);
+    draw();
+  }
+
   function draw() {
-    const events = model.get("events") || [];
     const nowMs = model.get("now_ms") || 0;
     const running = model.get("running");
     const width = model.get("width") || 0;
@@ -144,10 +196,12 @@ function render({ model, el }) {
     header.className = "af-header";
     const nTasks = events.filter((e) => e.event === "SPAWN").length;
     const nDone = events.filter((e) => e.event === "DONE").length;
+    const nBlocks = events.filter((e) => e.event === "BLOCK").length;
     header.innerHTML =
       `<span class="af-status ${running ? "af-running" : "af-idle"}">` +
       `${running ? "● running…" : "✓ done"}</span>` +
-      `<span class="af-meta">${nDone}/${nTasks} tasks done · ${fmt(nowMs)}</span>`;
+      `<span class="af-meta">${nDone}/${nTasks} tasks done · ${fmt(nowMs)}</span>` +
+      (nBlocks ? `<span class="af-meta af-blocked">${nBlocks} loop-blocking run${nBlocks === 1 ? "" : "s"}</span>` : "");
     root.appendChild(header);
 
     if (events.length === 0) {
@@ -164,15 +218,15 @@ function render({ model, el }) {
 
     for (const lane of lanes) {
       const row = document.createElement("div");
-      row.className = "af-lane";
+      row.className = lane.thread ? "af-lane af-lane-thread" : "af-lane";
 
       const name = document.createElement("div");
       name.className = "af-lane-name";
       name.style.paddingLeft = 8 + lane.depth * 16 + "px";
       const label = document.createElement("span");
       label.className = "af-coro";
-      label.textContent = lane.coro;
-      label.title = `${lane.coro} (${lane.task})`;
+      label.textContent = lane.thread ? lane.task : lane.coro;
+      label.title = lane.thread ? `${lane.task} (executor thread)` : `${lane.coro} (${lane.task})`;
       name.appendChild(label);
       row.appendChild(name);
 
@@ -195,6 +249,20 @@ function render({ model, el }) {
         }
       }
 
+      // Loop-blocking runs sit on top, with their own tooltip.
+      for (const b of lane.blocks) {
+        const mark = document.createElement("div");
+        mark.className = "af-seg af-block";
+        mark.style.left = (b.start / maxT) * 100 + "%";
+        mark.style.width = Math.max(0.5, ((b.end - b.start) / maxT) * 100) + "%";
+        const blockHtml =
+          `<div class="af-tip-title">${lane.coro}<span class="af-tip-task"> ${lane.task}</span></div>` +
+          `<div class="af-tip-row af-tip-block"><span>blocked loop</span><b>${fmt(b.end - b.start)}</b></div>` +
+          (b.line != null ? `<div class="af-tip-foot">until the await on line ${b.line}</div>` : "");
+        mark.addEventListener("mousemove", (ev) => { ev.stopPropagation(); showTip(ev, blockHtml); });
+        track.appendChild(mark);
+      }
+
       // Hover anywhere on the lane → floating tooltip with timings.
       const html = laneTip(lane);
       track.addEventListener("mousemove", (ev) => showTip(ev, html));
@@ -213,11 +281,19 @@ function render({ model, el }) {
     root.appendChild(axis);
   }
 
-  model.on("change:events", draw);
+  model.on("change:events", () => {
+    events = model.get("events") || [];
+    draw();
+  });
+  model.on("msg:custom", onMessage);
   model.on("change:now_ms", draw);
   model.on("change:running", draw);
   model.on("change:width", draw);
   draw();
+  // Catch up on a run that started before this view was shown.
+  if (model.get("running")) model.send({ type: "resync" });
+
+  return () => model.off("msg:custom", onMessage);
 }
 
 export default { render };
@@ -8,6 +8,16 @@ function render({ model, el }) {
   const image = document.createElement("img");
   image.className = "frame-player-image";
 
+  // With encoding="delta", frames are composed here: keyframe, then patch.
+  const canvas = document.createElement("canvas");
+  canvas.className = "frame-player-image";
+  canvas.style.display = "none";
+
+  // Stands in for a frame that Python could not load.
+  const placeholder = document.createElement("div");
+  placeholder.className = "frame-player-error";
+  placeholder.style.display = "none";
+
   const controls = document.createElement("div");
   controls.className = "frame-player-controls";
 
@@ -28,6 +38,8 @@ function render({ model, el }) {
   controls.appendChild(slider);
   controls.appendChild(label);
   wrapper.appendChild(image);
+  wrapper.appendChild(canvas);
+  wrapper.appendChild(placeholder);
   wrapper.appendChild(controls);
   el.appendChild(wrapper);
 
@@ -37,9 +49,163 @@ function render({ model, el }) {
   // kernel, so there is no comm round-trip per frame and nothing to echo.
   let cur = 0;
 
+  // Frames live in Python and arrive in windows around the playhead:
+  // index -> data URI for what we hold, plus the indices already asked for.
+  // `generation` drops replies that belong to a replaced frame sequence.
+  const cache = new Map();
+  const pending = new Set();
+  let generation = 0;
+  // index -> Promise of the decoded <img>, for composing delta frames.
+  const decoded = new Map();
+  let drawToken = 0;
+
+  // A delta frame is only drawable once its keyframe has arrived too.
+  function isReady(i) {
+    const entry = cache.get(i);
+    if (entry === undefined) return false;
+    return typeof entry === "string" || entry.error !== undefined || entry.base === undefined || cache.has(entry.base);
+  }
+
+  function decodeAt(i) {
+    if (!decoded.has(i)) {
+      decoded.set(
+        i,
+        new Promise((resolve, reject) => {
+          const img = new Image();
+          img.onload = () => resolve(img);
+          img.onerror = reject;
+          img.src = cache.get(i).uri;
+        })
+      );
+    }
+    return decoded.get(i);
+  }
+
+  function forget(i) {
+    cache.delete(i);
+    decoded.delete(i);
+  }
+
+  async function drawDelta(idx) {
+    const token = ++drawToken;
+    const entry = cache.get(idx);
+    const layers = entry.base === undefined ? [idx] : [entry.base];
+    if (entry.base !== undefined && entry.uri) layers.push(idx);
+    let images;
+    try {
+      images = await Promise.all(layers.map(decodeAt));
+    } catch (err) {
+      return;
+    }
+    if (token !== drawToken) return;
+    const base = images[0];
+    if (canvas.width !== base.naturalWidth || canvas.height !== base.naturalHeight) {
+      canvas.width = base.naturalWidth;
+      canvas.height = base.naturalHeight;
+    }
+    const ctx = canvas.getContext("2d");
+    ctx.drawImage(base, 0, 0);
+    if (images[1]) ctx.drawImage(images[1], entry.x, entry.y);
+  }
+
+  function frameCount() {
+    return model.get("frame_count");
+  }
+
   function maxIndex() {
-    return Math.max(0, model.get("frames").length - 1);
+    return Math.max(0, frameCount() - 1);
+  }
+
+  // How far `i` lies ahead of the playhead (wrapping when looping);
+  // negative when it is behind.
+  function ahead(i) {
+    const n = frameCount();
+    if (model.get("loop") && n > 0) {
+      const d = (i - cur + n) % n;
+      return d > n / 2 ? d - n : d;
+    }
+    return i - cur;
+  }
+
+  function ensureWindow() {
+    const n = frameCount();
+    const size = Math.max(1, model.get("prefetch"));
+    const wanted = [];
+    let ready = 0;
+    for (let k = 0; k <= size && k < n; k++) {
+      let i = cur + k;
+      if (i > maxIndex()) {
+        if (!model.get("loop")) break;
+        i -= n;
+      }
+      if (cache.has(i) || pending.has(i)) {
+        if (wanted.length === 0) ready += 1;
+      } else {
+        wanted.push(i);
+      }
+    }
+    // Ask in batches: only once less than half the window is on its way.
+    if (ready > size / 2) wanted.length = 0;
+    // Evict frames we have moved past, and far-ahead ones after a jump,
+    // keeping keyframes that cached delta frames still build on.
+    const bases = new Set();
+    for (const entry of cache.values()) {
+      if (typeof entry !== "string" && entry.base !== undefined) bases.add(entry.base);
+    }
+    for (const i of [...cache.keys()]) {
+      const d = ahead(i);
+      if ((d < -size || d > 2 * size) && !bases.has(i)) forget(i);
+    }
+    requestBases(wanted);
+    if (wanted.length === 0) return;
+    for (const i of wanted) pending.add(i);
+    model.send({ type: "frames", indices: wanted, generation });
+  }
+
+  function onMessage(msg) {
+    if (!msg) return;
+    if (msg.type === "reset") {
+      generation += 1;
+      cache.clear();
+      decoded.clear();
+      pending.clear();
+      ensureWindow();
+      renderFrame();
+      return;
+    }
+    if (msg.type !== "frames" || msg.generation !== generation) return;
+    for (const [key, entry] of Object.entries(msg.frames)) {
+      const i = Number(key);
+      pending.delete(i);
+      decoded.delete(i);
+      cache.set(i, entry);
+    }
+    // Frames that failed to load get a placeholder entry, so playback moves
+    // past them instead of waiting for a reply that never comes.
+    for (const [key, error] of Object.entries(msg.errors || {})) {
+      const i = Number(key);
+      pending.delete(i);
+      decoded.delete(i);
+      cache.set(i, { error });
+    }
+    const missing = [];
+    requestBases(missing);
+    if (missing.length) {
+      for (const i of missing) pending.add(i);
+      model.send({ type: "frames", indices: missing, generation });
+    }
+    if (isReady(clampIndex(cur))) renderFrame();
+  }
+
+  // Add the keyframes that cached delta frames need but we do not hold.
+  function requestBases(wanted) {
+    for (const entry of cache.values()) {
+      if (typeof entry === "string" || entry.base === undefined) continue;
+      const b = entry.base;
+      if (!cache.has(b) && !pending.has(b) && !wanted.includes(b)) wanted.push(b);
+    }
   }
+  model.on("msg:custom", onMessage);
 
   function clampIndex(i) {
     return Math.max(0, Math.min(i, maxIndex()));
@@ -50,9 +216,13 @@ function render({ model, el }) {
     if (w > 0) {
       wrapper.style.width = w + "px";
       image.style.width = w + "px";
+      canvas.style.width = w + "px";
+      placeholder.style.width = w + "px";
     } else {
       wrapper.style.width = "";
       image.style.width = "";
+      canvas.style.width = "";
+      placeholder.style.width = "";
     }
   }
 
@@ -71,16 +241,26 @@ function render({ model, el }) {
   }
 
   function renderFrame() {
-    const frames = model.get("frames");
     const idx = clampIndex(cur);
-    if (frames.length > 0) {
-      image.src = frames[idx];
-    } else {
-      image.removeAttribute("src");
+    // Until a requested frame arrives, keep showing the previous one.
+    if (isReady(idx)) {
+      const entry = cache.get(idx);
+      const failed = typeof entry !== "string" && entry.error !== undefined;
+      const delta = typeof entry !== "string" && !failed;
+      image.style.display = delta || failed ? "none" : "";
+      canvas.style.display = delta ? "" : "none";
+      placeholder.style.display = failed ? "" : "none";
+      if (failed) {
+        placeholder.textContent = `Frame ${idx + 1} could not be loaded: ${entry.error}`;
+      } else if (delta) {
+        drawDelta(idx);
+      } else {
+        image.src = entry;
+      }
     }
     slider.value = idx;
     label.style.display = model.get("show_index") ? "" : "none";
-    label.textContent = `${idx + 1} / ${frames.length}`;
+    label.textContent = `${idx + 1} / ${frameCount()}`;
     updateTrackFill();
   }
 
@@ -101,7 +281,13 @@ function render({ model, el }) {
       }
     }
 
+    // Hold the current frame rather than skip one that has not arrived.
+    if (!isReady(next)) {
+      ensureWindow();
+      return;
+    }
     cur = next;
+    ensureWindow();
     renderFrame();
   }
 
@@ -131,12 +317,14 @@ function render({ model, el }) {
   // continues from the new position.
   slider.addEventListener("input", () => {
     cur = clampIndex(parseInt(slider.value, 10));
+    ensureWindow();
     renderFrame();
   });
 
   // Python can jump the frame by setting `value` (Python -> JS control).
   model.on("change:value", () => {
     cur = clampIndex(model.get("value"));
+    ensureWindow();
     renderFrame();
   });
 
@@ -158,11 +346,12 @@ function render({ model, el }) {
   });
 
   // React to a new frame sequence
-  model.on("change:frames", () => {
+  model.on("change:frame_count", () => {
     syncSliderAttrs();
     cur = clampIndex(cur);
     renderFrame();
   });
+  model.on("change:prefetch", ensureWindow);
 
   model.on("change:show_index", renderFrame);
   model.on("change:width", applyWidth);
@@ -171,12 +360,14 @@ function render({ model, el }) {
   applyWidth();
   syncSliderAttrs();
   cur = clampIndex(model.get("value"));
+  ensureWindow();
   renderFrame();
   if (model.get("playing")) startPlaying();
   renderBtn();
 
   // Cleanup
   return () => {
+    model.off("msg:custom", onMessage);
     if (intervalId !== null) {
       clearInterval(intervalId);
       intervalId = null;
@@ -1 +1 @@
-var So={value:()=>{}};function ur(){for(var t=0,e=arguments.length,r={},n;t<e;++t){if(!(n=arguments[t]+"")||n in r||/[\s.]/.test(n))throw new Error("illegal type: "+n);r[n]=[]}return new ie(r)}function ie(t){this._=t}function Ao(t,e){return t.trim().split(/^|\s+/).map(function(r){var n="",o=r.indexOf(".");if(o>=0&&(n=r.slice(o+1),r=r.slice(0,o)),r&&!e.hasOwnProperty(r))throw new Error("unknown type: "+r);return{type:r,name:n}})}ie.prototype=ur.prototype={constructor:ie,on:function(t,e){var r=this._,n=Ao(t+"",r),o,i=-1,a=n.length;if(arguments.length<2){for(;++i<a;)if((o=(t=n[i]).type)&&(o=Mo(r[o],t.name)))return o;return}if(e!=null&&typeof e!="function")throw new Error("invalid callback: "+e);for(;++i<a;)if(o=(t=n[i]).type)r[o]=sr(r[o],t.name,e);else if(e==null)for(o in r)r[o]=sr(r[o],t.name,null);return this},copy:function(){var t={},e=this._;for(var r in e)t[r]=e[r].slice();return new ie(t)},call:function(t,e){if((o=arguments.length-2)>0)for(var r=new Array(o),n=0,o,i;n<o;++n)r[n]=arguments[n+2];if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(i=this._[t],n=0,o=i.length;n<o;++n)i[n].value.apply(e,r)},apply:function(t,e,r){if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(var n=this._[t],o=0,i=n.length;o<i;++o)n[o].value.apply(e,r)}};function Mo(t,e){for(var r=0,n=t.length,o;r<n;++r)if((o=t[r]).name===e)return o.value}function sr(t,e,r){for(var n=0,o=t.length;n<o;++n)if(t[n].name===e){t[n]=So,t=t.slice(0,n).concat(t.slice(n+1));break}return r!=null&&t.push({name:e,value:r}),t}var ct=ur;var ae="http://www.w3.org/1999/xhtml",Ce={svg:"http://www.w3.org/2000/svg",xhtml:ae,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function ht(t){var e=t+="",r=e.indexOf(":");return r>=0&&(e=t.slice(0,r))!=="xmlns"&&(t=t.slice(r+1)),Ce.hasOwnProperty(e)?{space:Ce[e],local:t}:t}function ko(t){return function(){var e=this.ownerDocument,r=this.namespaceURI;return r===ae&&e.documentElement.namespaceURI===ae?e.createElement(t):e.createElementNS(r,t)}}function Io(t){return function(){return this.ownerDocument.createElementNS(t.space,t.local)}}function se(t){var e=ht(t);return(e.local?Io:ko)(e)}function Eo(){}function vt(t){return t==null?Eo:function(){return this.querySelector(t)}}function fr(t){typeof t!="function"&&(t=vt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=new Array(a),f,u,l=0;l<a;++l)(f=i[l])&&(u=t.call(f,f.__data__,l,i))&&("__data__"in f&&(u.__data__=f.__data__),s[l]=u);return new F(n,this._parents)}function Re(t){return t==null?[]:Array.isArray(t)?t:Array.from(t)}function To(){return[]}function Rt(t){return t==null?To:function(){return this.querySelectorAll(t)}}function zo(t){return function(){return Re(t.apply(this,arguments))}}function lr(t){typeof t=="function"?t=zo(t):t=Rt(t);for(var e=this._groups,r=e.length,n=[],o=[],i=0;i<r;++i)for(var a=e[i],s=a.length,f,u=0;u<s;++u)(f=a[u])&&(n.push(t.call(f,f.__data__,u,a)),o.push(f));return new F(n,o)}function Pt(t){return function(){return this.matches(t)}}function ue(t){return function(e){return e.matches(t)}}var Oo=Array.prototype.find;function Co(t){return function(){return Oo.call(this.children,t)}}function Ro(){return this.firstElementChild}function cr(t){return this.select(t==null?Ro:Co(typeof t=="function"?t:ue(t)))}var Po=Array.prototype.filter;function $o(){return Array.from(this.children)}function Bo(t){return function(){return Po.call(this.children,t)}}function hr(t){return this.selectAll(t==null?$o:Bo(typeof t=="function"?t:ue(t)))}function pr(t){typeof t!="function"&&(t=Pt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=[],f,u=0;u<a;++u)(f=i[u])&&t.call(f,f.__data__,u,i)&&s.push(f);return new F(n,this._parents)}function fe(t){return new Array(t.length)}function mr(){return new F(this._enter||this._groups.map(fe),this._parents)}function $t(t,e){this.ownerDocument=t.ownerDocument,this.namespaceURI=t.namespaceURI,this._next=null,this._parent=t,this.__data__=e}$t.prototype={constructor:$t,appendChild:function(t){return this._parent.insertBefore(t,this._next)},insertBefore:function(t,e){return this._parent.insertBefore(t,e)},querySelector:function(t){return this._parent.querySelector(t)},querySelectorAll:function(t){return this._parent.querySelectorAll(t)}};function dr(t){return function(){return t}}function Do(t,e,r,n,o,i){for(var a=0,s,f=e.length,u=i.length;a<u;++a)(s=e[a])?(s.__data__=i[a],n[a]=s):r[a]=new $t(t,i[a]);for(;a<f;++a)(s=e[a])&&(o[a]=s)}function qo(t,e,r,n,o,i,a){var s,f,u=new Map,l=e.length,y=i.length,h=new Array(l),m;for(s=0;s<l;++s)(f=e[s])&&(h[s]=m=a.call(f,f.__data__,s,e)+"",u.has(m)?o[s]=f:u.set(m,f));for(s=0;s<y;++s)m=a.call(t,i[s],s,i)+"",(f=u.get(m))?(n[s]=f,f.__data__=i[s],u.delete(m)):r[s]=new $t(t,i[s]);for(s=0;s<l;++s)(f=e[s])&&u.get(h[s])===f&&(o[s]=f)}function Lo(t){return t.__data__}function gr(t,e){if(!arguments.length)return Array.from(this,Lo);var r=e?qo:Do,n=this._parents,o=this._groups;typeof t!="function"&&(t=dr(t));for(var i=o.length,a=new Array(i),s=new Array(i),f=new Array(i),u=0;u<i;++u){var l=n[u],y=o[u],h=y.length,m=Yo(t.call(l,l&&l.__data__,u,n)),_=m.length,g=s[u]=new Array(_),x=a[u]=new Array(_),d=f[u]=new Array(h);r(l,y,g,x,d,m,e);for(var w=0,N=0,c,S;w<_;++w)if(c=g[w]){for(w>=N&&(N=w+1);!(S=x[N])&&++N<_;);c._next=S||null}}return a=new F(a,n),a._enter=s,a._exit=f,a}function Yo(t){return typeof t=="object"&&"length"in t?t:Array.from(t)}function xr(){return new F(this._exit||this._groups.map(fe),this._parents)}function yr(t,e,r){var n=this.enter(),o=this,i=this.exit();return typeof t=="function"?(n=t(n),n&&(n=n.selection())):n=n.append(t+""),e!=null&&(o=e(o),o&&(o=o.selection())),r==null?i.remove():r(i),n&&o?n.merge(o).order():o}function vr(t){for(var e=t.selection?t.selection():t,r=this._groups,n=e._groups,o=r.length,i=n.length,a=Math.min(o,i),s=new Array(o),f=0;f<a;++f)for(var u=r[f],l=n[f],y=u.length,h=s[f]=new Array(y),m,_=0;_<y;++_)(m=u[_]||l[_])&&(h[_]=m);for(;f<o;++f)s[f]=r[f];return new F(s,this._parents)}function wr(){for(var t=this._groups,e=-1,r=t.length;++e<r;)for(var n=t[e],o=n.length-1,i=n[o],a;--o>=0;)(a=n[o])&&(i&&a.compareDocumentPosition(i)^4&&i.parentNode.insertBefore(a,i),i=a);return this}function _r(t){t||(t=Go);function e(y,h){return y&&h?t(y.__data__,h.__data__):!y-!h}for(var r=this._groups,n=r.length,o=new Array(n),i=0;i<n;++i){for(var a=r[i],s=a.length,f=o[i]=new Array(s),u,l=0;l<s;++l)(u=a[l])&&(f[l]=u);f.sort(e)}return new F(o,this._parents).order()}function Go(t,e){return t<e?-1:t>e?1:t>=e?0:NaN}function br(){var t=arguments[0];return arguments[0]=this,t.apply(null,arguments),this}function Nr(){return Array.from(this)}function Sr(){for(var t=this._groups,e=0,r=t.length;e<r;++e)for(var n=t[e],o=0,i=n.length;o<i;++o){var a=n[o];if(a)return a}return null}function Ar(){let t=0;for(let e of this)++t;return t}function Mr(){return!this.node()}function kr(t){for(var e=this._groups,r=0,n=e.length;r<n;++r)for(var o=e[r],i=0,a=o.length,s;i<a;++i)(s=o[i])&&t.call(s,s.__data__,i,o);return this}function Xo(t){return function(){this.removeAttribute(t)}}function Fo(t){return function(){this.removeAttributeNS(t.space,t.local)}}function Ho(t,e){return function(){this.setAttribute(t,e)}}function Vo(t,e){return function(){this.setAttributeNS(t.space,t.local,e)}}function Wo(t,e){return function(){var r=e.apply(this,arguments);r==null?this.removeAttribute(t):this.setAttribute(t,r)}}function Qo(t,e){return function(){var r=e.apply(this,arguments);r==null?this.removeAttributeNS(t.space,t.local):this.setAttributeNS(t.space,t.local,r)}}function Ir(t,e){var r=ht(t);if(arguments.length<2){var n=this.node();return r.local?n.getAttributeNS(r.space,r.local):n.getAttribute(r)}return this.each((e==null?r.local?Fo:Xo:typeof e=="function"?r.local?Qo:Wo:r.local?Vo:Ho)(r,e))}function le(t){return t.ownerDocument&&t.ownerDocument.defaultView||t.document&&t||t.defaultView}function Ko(t){return function(){this.style.removeProperty(t)}}function Uo(t,e,r){return function(){this.style.setProperty(t,e,r)}}function Zo(t,e,r){return function(){var n=e.apply(this,arguments);n==null?this.style.removeProperty(t):this.style.setProperty(t,n,r)}}function Er(t,e,r){return arguments.length>1?this.each((e==null?Ko:typeof e=="function"?Zo:Uo)(t,e,r??"")):dt(this.node(),t)}function dt(t,e){return t.style.getPropertyValue(e)||le(t).getComputedStyle(t,null).getPropertyValue(e)}function Jo(t){return function(){delete this[t]}}function jo(t,e){return function(){this[t]=e}}function ti(t,e){return function(){var r=e.apply(this,arguments);r==null?delete this[t]:this[t]=r}}function Tr(t,e){return arguments.length>1?this.each((e==null?Jo:typeof e=="function"?ti:jo)(t,e)):this.node()[t]}function zr(t){return t.trim().split(/^|\s+/)}function Pe(t){return t.classList||new Or(t)}function Or(t){this._node=t,this._names=zr(t.getAttribute("class")||"")}Or.prototype={add:function(t){var e=this._names.indexOf(t);e<0&&(this._names.push(t),this._node.setAttribute("class",this._names.join(" ")))},remove:function(t){var e=this._names.indexOf(t);e>=0&&(this._names.splice(e,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(t){return this._names.indexOf(t)>=0}};function Cr(t,e){for(var r=Pe(t),n=-1,o=e.length;++n<o;)r.add(e[n])}function Rr(t,e){for(var r=Pe(t),n=-1,o=e.length;++n<o;)r.remove(e[n])}function ei(t){return function(){Cr(this,t)}}function ri(t){return function(){Rr(this,t)}}function ni(t,e){return function(){(e.apply(this,arguments)?Cr:Rr)(this,t)}}function Pr(t,e){var r=zr(t+"");if(arguments.length<2){for(var n=Pe(this.node()),o=-1,i=r.length;++o<i;)if(!n.contains(r[o]))return!1;return!0}return this.each((typeof e=="function"?ni:e?ei:ri)(r,e))}function oi(){this.textContent=""}function ii(t){return function(){this.textContent=t}}function ai(t){return function(){var e=t.apply(this,arguments);this.textContent=e??""}}function $r(t){return arguments.length?this.each(t==null?oi:(typeof t=="function"?ai:ii)(t)):this.node().textContent}function si(){this.innerHTML=""}function ui(t){return function(){this.innerHTML=t}}function fi(t){return function(){var e=t.apply(this,arguments);this.innerHTML=e??""}}function Br(t){return arguments.length?this.each(t==null?si:(typeof t=="function"?fi:ui)(t)):this.node().innerHTML}function li(){this.nextSibling&&this.parentNode.appendChild(this)}function Dr(){return this.each(li)}function ci(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function qr(){return this.each(ci)}function Lr(t){var e=typeof t=="function"?t:se(t);return this.select(function(){return this.appendChild(e.apply(this,arguments))})}function hi(){return null}function Yr(t,e){var r=typeof t=="function"?t:se(t),n=e==null?hi:typeof e=="function"?e:vt(e);return this.select(function(){return this.insertBefore(r.apply(this,arguments),n.apply(this,arguments)||null)})}function pi(){var t=this.parentNode;t&&t.removeChild(this)}function Gr(){return this.each(pi)}function mi(){var t=this.cloneNode(!1),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function di(){var t=this.cloneNode(!0),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function Xr(t){return this.select(t?di:mi)}function Fr(t){return arguments.length?this.property("__data__",t):this.node().__data__}function gi(t){return function(e){t.call(this,e,this.__data__)}}function xi(t){return t.trim().split(/^|\s+/).map(function(e){var r="",n=e.indexOf(".");return n>=0&&(r=e.slice(n+1),e=e.slice(0,n)),{type:e,name:r}})}function yi(t){return function(){var e=this.__on;if(e){for(var r=0,n=-1,o=e.length,i;r<o;++r)i=e[r],(!t.type||i.type===t.type)&&i.name===t.name?this.removeEventListener(i.type,i.listener,i.options):e[++n]=i;++n?e.length=n:delete this.__on}}}function vi(t,e,r){return function(){var n=this.__on,o,i=gi(e);if(n){for(var a=0,s=n.length;a<s;++a)if((o=n[a]).type===t.type&&o.name===t.name){this.removeEventListener(o.type,o.listener,o.options),this.addEventListener(o.type,o.listener=i,o.options=r),o.value=e;return}}this.addEventListener(t.type,i,r),o={type:t.type,name:t.name,value:e,listener:i,options:r},n?n.push(o):this.__on=[o]}}function Hr(t,e,r){var n=xi(t+""),o,i=n.length,a;if(arguments.length<2){var s=this.node().__on;if(s){for(var f=0,u=s.length,l;f<u;++f)for(o=0,l=s[f];o<i;++o)if((a=n[o]).type===l.type&&a.name===l.name)return l.value}return}for(s=e?vi:yi,o=0;o<i;++o)this.each(s(n[o],e,r));return this}function Vr(t,e,r){var n=le(t),o=n.CustomEvent;typeof o=="function"?o=new o(e,r):(o=n.document.createEvent("Event"),r?(o.initEvent(e,r.bubbles,r.cancelable),o.detail=r.detail):o.initEvent(e,!1,!1)),t.dispatchEvent(o)}function wi(t,e){return function(){return Vr(this,t,e)}}function _i(t,e){return function(){return Vr(this,t,e.apply(this,arguments))}}function Wr(t,e){return this.each((typeof e=="function"?_i:wi)(t,e))}function*Qr(){for(var t=this._groups,e=0,r=t.length;e<r;++e)for(var n=t[e],o=0,i=n.length,a;o<i;++o)(a=n[o])&&(yield a)}var $e=[null];function F(t,e){this._groups=t,this._parents=e}function Kr(){return new F([[document.documentElement]],$e)}function bi(){return this}F.prototype=Kr.prototype={constructor:F,select:fr,selectAll:lr,selectChild:cr,selectChildren:hr,filter:pr,data:gr,enter:mr,exit:xr,join:yr,merge:vr,selection:bi,order:wr,sort:_r,call:br,nodes:Nr,node:Sr,size:Ar,empty:Mr,each:kr,attr:Ir,style:Er,property:Tr,classed:Pr,text:$r,html:Br,raise:Dr,lower:qr,append:Lr,insert:Yr,remove:Gr,clone:Xr,datum:Fr,on:Hr,dispatch:Wr,[Symbol.iterator]:Qr};var pt=Kr;function J(t){return typeof t=="string"?new F([[document.querySelector(t)]],[document.documentElement]):new F([[t]],$e)}function Ur(t){let e;for(;e=t.sourceEvent;)t=e;return t}function nt(t,e){if(t=Ur(t),e===void 0&&(e=t.currentTarget),e){var r=e.ownerSVGElement||e;if(r.createSVGPoint){var n=r.createSVGPoint();return n.x=t.clientX,n.y=t.clientY,n=n.matrixTransform(e.getScreenCTM().inverse()),[n.x,n.y]}if(e.getBoundingClientRect){var o=e.getBoundingClientRect();return[t.clientX-o.left-e.clientLeft,t.clientY-o.top-e.clientTop]}}return[t.pageX,t.pageY]}var Zr={passive:!1},wt={capture:!0,passive:!1};function ce(t){t.stopImmediatePropagation()}function gt(t){t.preventDefault(),t.stopImmediatePropagation()}function Bt(t){var e=t.document.documentElement,r=J(t).on("dragstart.drag",gt,wt);"onselectstart"in e?r.on("selectstart.drag",gt,wt):(e.__noselect=e.style.MozUserSelect,e.style.MozUserSelect="none")}function Dt(t,e){var r=t.document.documentElement,n=J(t).on("dragstart.drag",null);e&&(n.on("click.drag",gt,wt),setTimeout(function(){n.on("click.drag",null)},0)),"onselectstart"in r?n.on("selectstart.drag",null):(r.style.MozUserSelect=r.__noselect,delete r.__noselect)}var qt=t=>()=>t;function Lt(t,{sourceEvent:e,subject:r,target:n,identifier:o,active:i,x:a,y:s,dx:f,dy:u,dispatch:l}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},subject:{value:r,enumerable:!0,configurable:!0},target:{value:n,enumerable:!0,configurable:!0},identifier:{value:o,enumerable:!0,configurable:!0},active:{value:i,enumerable:!0,configurable:!0},x:{value:a,enumerable:!0,configurable:!0},y:{value:s,enumerable:!0,configurable:!0},dx:{value:f,enumerable:!0,configurable:!0},dy:{value:u,enumerable:!0,configurable:!0},_:{value:l}})}Lt.prototype.on=function(){var t=this._.on.apply(this._,arguments);return t===this._?this:t};function Ni(t){return!t.ctrlKey&&!t.button}function Si(){return this.parentNode}function Ai(t,e){return e??{x:t.x,y:t.y}}function Mi(){return navigator.maxTouchPoints||"ontouchstart"in this}function Be(){var t=Ni,e=Si,r=Ai,n=Mi,o={},i=ct("start","drag","end"),a=0,s,f,u,l,y=0;function h(c){c.on("mousedown.drag",m).filter(n).on("touchstart.drag",x).on("touchmove.drag",d,Zr).on("touchend.drag touchcancel.drag",w).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function m(c,S){if(!(l||!t.call(this,c,S))){var I=N(this,e.call(this,c,S),c,S,"mouse");I&&(J(c.view).on("mousemove.drag",_,wt).on("mouseup.drag",g,wt),Bt(c.view),ce(c),u=!1,s=c.clientX,f=c.clientY,I("start",c))}}function _(c){if(gt(c),!u){var S=c.clientX-s,I=c.clientY-f;u=S*S+I*I>y}o.mouse("drag",c)}function g(c){J(c.view).on("mousemove.drag mouseup.drag",null),Dt(c.view,u),gt(c),o.mouse("end",c)}function x(c,S){if(t.call(this,c,S)){var I=c.changedTouches,z=e.call(this,c,S),R=I.length,q,P;for(q=0;q<R;++q)(P=N(this,z,c,S,I[q].identifier,I[q]))&&(ce(c),P("start",c,I[q]))}}function d(c){var S=c.changedTouches,I=S.length,z,R;for(z=0;z<I;++z)(R=o[S[z].identifier])&&(gt(c),R("drag",c,S[z]))}function w(c){var S=c.changedTouches,I=S.length,z,R;for(l&&clearTimeout(l),l=setTimeout(function(){l=null},500),z=0;z<I;++z)(R=o[S[z].identifier])&&(ce(c),R("end",c,S[z]))}function N(c,S,I,z,R,q){var P=i.copy(),Y=nt(q||I,S),Q,K,p;if((p=r.call(c,new Lt("beforestart",{sourceEvent:I,target:h,identifier:R,active:a,x:Y[0],y:Y[1],dx:0,dy:0,dispatch:P}),z))!=null)return Q=p.x-Y[0]||0,K=p.y-Y[1]||0,function A(v,k,E){var O=Y,C;switch(v){case"start":o[R]=A,C=a++;break;case"end":delete o[R],--a;case"drag":Y=nt(E||k,S),C=a;break}P.call(v,c,new Lt(v,{sourceEvent:k,subject:p,target:h,identifier:R,active:C,x:Y[0]+Q,y:Y[1]+K,dx:Y[0]-O[0],dy:Y[1]-O[1],dispatch:P}),z)}}return h.filter=function(c){return arguments.length?(t=typeof c=="function"?c:qt(!!c),h):t},h.container=function(c){return arguments.length?(e=typeof c=="function"?c:qt(c),h):e},h.subject=function(c){return arguments.length?(r=typeof c=="function"?c:qt(c),h):r},h.touchable=function(c){return arguments.length?(n=typeof c=="function"?c:qt(!!c),h):n},h.on=function(){var c=i.on.apply(i,arguments);return c===i?h:c},h.clickDistance=function(c){return arguments.length?(y=(c=+c)*c,h):Math.sqrt(y)},h}function he(t,e){var r,n=1;t==null&&(t=0),e==null&&(e=0);function o(){var i,a=r.length,s,f=0,u=0;for(i=0;i<a;++i)s=r[i],f+=s.x,u+=s.y;for(f=(f/a-t)*n,u=(u/a-e)*n,i=0;i<a;++i)s=r[i],s.x-=f,s.y-=u}return o.initialize=function(i){r=i},o.x=function(i){return arguments.length?(t=+i,o):t},o.y=function(i){return arguments.length?(e=+i,o):e},o.strength=function(i){return arguments.length?(n=+i,o):n},o}function Jr(t){let e=+this._x.call(null,t),r=+this._y.call(null,t);return jr(this.cover(e,r),e,r,t)}function jr(t,e,r,n){if(isNaN(e)||isNaN(r))return t;var o,i=t._root,a={data:n},s=t._x0,f=t._y0,u=t._x1,l=t._y1,y,h,m,_,g,x,d,w;if(!i)return t._root=a,t;for(;i.length;)if((g=e>=(y=(s+u)/2))?s=y:u=y,(x=r>=(h=(f+l)/2))?f=h:l=h,o=i,!(i=i[d=x<<1|g]))return o[d]=a,t;if(m=+t._x.call(null,i.data),_=+t._y.call(null,i.data),e===m&&r===_)return a.next=i,o?o[d]=a:t._root=a,t;do o=o?o[d]=new Array(4):t._root=new Array(4),(g=e>=(y=(s+u)/2))?s=y:u=y,(x=r>=(h=(f+l)/2))?f=h:l=h;while((d=x<<1|g)===(w=(_>=h)<<1|m>=y));return o[w]=i,o[d]=a,t}function tn(t){var e,r,n=t.length,o,i,a=new Array(n),s=new Array(n),f=1/0,u=1/0,l=-1/0,y=-1/0;for(r=0;r<n;++r)isNaN(o=+this._x.call(null,e=t[r]))||isNaN(i=+this._y.call(null,e))||(a[r]=o,s[r]=i,o<f&&(f=o),o>l&&(l=o),i<u&&(u=i),i>y&&(y=i));if(f>l||u>y)return this;for(this.cover(f,u).cover(l,y),r=0;r<n;++r)jr(this,a[r],s[r],t[r]);return this}function en(t,e){if(isNaN(t=+t)||isNaN(e=+e))return this;var r=this._x0,n=this._y0,o=this._x1,i=this._y1;if(isNaN(r))o=(r=Math.floor(t))+1,i=(n=Math.floor(e))+1;else{for(var a=o-r||1,s=this._root,f,u;r>t||t>=o||n>e||e>=i;)switch(u=(e<n)<<1|t<r,f=new Array(4),f[u]=s,s=f,a*=2,u){case 0:o=r+a,i=n+a;break;case 1:r=o-a,i=n+a;break;case 2:o=r+a,n=i-a;break;case 3:r=o-a,n=i-a;break}this._root&&this._root.length&&(this._root=s)}return this._x0=r,this._y0=n,this._x1=o,this._y1=i,this}function rn(){var t=[];return this.visit(function(e){if(!e.length)do t.push(e.data);while(e=e.next)}),t}function nn(t){return arguments.length?this.cover(+t[0][0],+t[0][1]).cover(+t[1][0],+t[1][1]):isNaN(this._x0)?void 0:[[this._x0,this._y0],[this._x1,this._y1]]}function W(t,e,r,n,o){this.node=t,this.x0=e,this.y0=r,this.x1=n,this.y1=o}function on(t,e,r){var n,o=this._x0,i=this._y0,a,s,f,u,l=this._x1,y=this._y1,h=[],m=this._root,_,g;for(m&&h.push(new W(m,o,i,l,y)),r==null?r=1/0:(o=t-r,i=e-r,l=t+r,y=e+r,r*=r);_=h.pop();)if(!(!(m=_.node)||(a=_.x0)>l||(s=_.y0)>y||(f=_.x1)<o||(u=_.y1)<i))if(m.length){var x=(a+f)/2,d=(s+u)/2;h.push(new W(m[3],x,d,f,u),new W(m[2],a,d,x,u),new W(m[1],x,s,f,d),new W(m[0],a,s,x,d)),(g=(e>=d)<<1|t>=x)&&(_=h[h.length-1],h[h.length-1]=h[h.length-1-g],h[h.length-1-g]=_)}else{var w=t-+this._x.call(null,m.data),N=e-+this._y.call(null,m.data),c=w*w+N*N;if(c<r){var S=Math.sqrt(r=c);o=t-S,i=e-S,l=t+S,y=e+S,n=m.data}}return n}function an(t){if(isNaN(l=+this._x.call(null,t))||isNaN(y=+this._y.call(null,t)))return this;var e,r=this._root,n,o,i,a=this._x0,s=this._y0,f=this._x1,u=this._y1,l,y,h,m,_,g,x,d;if(!r)return this;if(r.length)for(;;){if((_=l>=(h=(a+f)/2))?a=h:f=h,(g=y>=(m=(s+u)/2))?s=m:u=m,e=r,!(r=r[x=g<<1|_]))return this;if(!r.length)break;(e[x+1&3]||e[x+2&3]||e[x+3&3])&&(n=e,d=x)}for(;r.data!==t;)if(o=r,!(r=r.next))return this;return(i=r.next)&&delete r.next,o?(i?o.next=i:delete o.next,this):e?(i?e[x]=i:delete e[x],(r=e[0]||e[1]||e[2]||e[3])&&r===(e[3]||e[2]||e[1]||e[0])&&!r.length&&(n?n[d]=r:this._root=r),this):(this._root=i,this)}function sn(t){for(var e=0,r=t.length;e<r;++e)this.remove(t[e]);return this}function un(){return this._root}function fn(){var t=0;return this.visit(function(e){if(!e.length)do++t;while(e=e.next)}),t}function ln(t){var e=[],r,n=this._root,o,i,a,s,f;for(n&&e.push(new W(n,this._x0,this._y0,this._x1,this._y1));r=e.pop();)if(!t(n=r.node,i=r.x0,a=r.y0,s=r.x1,f=r.y1)&&n.length){var u=(i+s)/2,l=(a+f)/2;(o=n[3])&&e.push(new W(o,u,l,s,f)),(o=n[2])&&e.push(new W(o,i,l,u,f)),(o=n[1])&&e.push(new W(o,u,a,s,l)),(o=n[0])&&e.push(new W(o,i,a,u,l))}return this}function cn(t){var e=[],r=[],n;for(this._root&&e.push(new W(this._root,this._x0,this._y0,this._x1,this._y1));n=e.pop();){var o=n.node;if(o.length){var i,a=n.x0,s=n.y0,f=n.x1,u=n.y1,l=(a+f)/2,y=(s+u)/2;(i=o[0])&&e.push(new W(i,a,s,l,y)),(i=o[1])&&e.push(new W(i,l,s,f,y)),(i=o[2])&&e.push(new W(i,a,y,l,u)),(i=o[3])&&e.push(new W(i,l,y,f,u))}r.push(n)}for(;n=r.pop();)t(n.node,n.x0,n.y0,n.x1,n.y1);return this}function hn(t){return t[0]}function pn(t){return arguments.length?(this._x=t,this):this._x}function mn(t){return t[1]}function dn(t){return arguments.length?(this._y=t,this):this._y}function _t(t,e,r){var n=new De(e??hn,r??mn,NaN,NaN,NaN,NaN);return t==null?n:n.addAll(t)}function De(t,e,r,n,o,i){this._x=t,this._y=e,this._x0=r,this._y0=n,this._x1=o,this._y1=i,this._root=void 0}function gn(t){for(var e={data:t.data},r=e;t=t.next;)r=r.next={data:t.data};return e}var j=_t.prototype=De.prototype;j.copy=function(){var t=new De(this._x,this._y,this._x0,this._y0,this._x1,this._y1),e=this._root,r,n;if(!e)return t;if(!e.length)return t._root=gn(e),t;for(r=[{source:e,target:t._root=new Array(4)}];e=r.pop();)for(var o=0;o<4;++o)(n=e.source[o])&&(n.length?r.push({source:n,target:e.target[o]=new Array(4)}):e.target[o]=gn(n));return t};j.add=Jr;j.addAll=tn;j.cover=en;j.data=rn;j.extent=nn;j.find=on;j.remove=an;j.removeAll=sn;j.root=un;j.size=fn;j.visit=ln;j.visitAfter=cn;j.x=pn;j.y=dn;function ft(t){return function(){return t}}function it(t){return(t()-.5)*1e-6}function ki(t){return t.x+t.vx}function Ii(t){return t.y+t.vy}function qe(t){var e,r,n,o=1,i=1;typeof t!="function"&&(t=ft(t==null?1:+t));function a(){for(var u,l=e.length,y,h,m,_,g,x,d=0;d<i;++d)for(y=_t(e,ki,Ii).visitAfter(s),u=0;u<l;++u)h=e[u],g=r[h.index],x=g*g,m=h.x+h.vx,_=h.y+h.vy,y.visit(w);function w(N,c,S,I,z){var R=N.data,q=N.r,P=g+q;if(R){if(R.index>h.index){var Y=m-R.x-R.vx,Q=_-R.y-R.vy,K=Y*Y+Q*Q;K<P*P&&(Y===0&&(Y=it(n),K+=Y*Y),Q===0&&(Q=it(n),K+=Q*Q),K=(P-(K=Math.sqrt(K)))/K*o,h.vx+=(Y*=K)*(P=(q*=q)/(x+q)),h.vy+=(Q*=K)*P,R.vx-=Y*(P=1-P),R.vy-=Q*P)}return}return c>m+P||I<m-P||S>_+P||z<_-P}}function s(u){if(u.data)return u.r=r[u.data.index];for(var l=u.r=0;l<4;++l)u[l]&&u[l].r>u.r&&(u.r=u[l].r)}function f(){if(e){var u,l=e.length,y;for(r=new Array(l),u=0;u<l;++u)y=e[u],r[y.index]=+t(y,u,e)}}return a.initialize=function(u,l){e=u,n=l,f()},a.iterations=function(u){return arguments.length?(i=+u,a):i},a.strength=function(u){return arguments.length?(o=+u,a):o},a.radius=function(u){return arguments.length?(t=typeof u=="function"?u:ft(+u),f(),a):t},a}function Ei(t){return t.index}function xn(t,e){var r=t.get(e);if(!r)throw new Error("node not found: "+e);return r}function Le(t){var e=Ei,r=y,n,o=ft(30),i,a,s,f,u,l=1;t==null&&(t=[]);function y(x){return 1/Math.min(s[x.source.index],s[x.target.index])}function h(x){for(var d=0,w=t.length;d<l;++d)for(var N=0,c,S,I,z,R,q,P;N<w;++N)c=t[N],S=c.source,I=c.target,z=I.x+I.vx-S.x-S.vx||it(u),R=I.y+I.vy-S.y-S.vy||it(u),q=Math.sqrt(z*z+R*R),q=(q-i[N])/q*x*n[N],z*=q,R*=q,I.vx-=z*(P=f[N]),I.vy-=R*P,S.vx+=z*(P=1-P),S.vy+=R*P}function m(){if(a){var x,d=a.length,w=t.length,N=new Map(a.map((S,I)=>[e(S,I,a),S])),c;for(x=0,s=new Array(d);x<w;++x)c=t[x],c.index=x,typeof c.source!="object"&&(c.source=xn(N,c.source)),typeof c.target!="object"&&(c.target=xn(N,c.target)),s[c.source.index]=(s[c.source.index]||0)+1,s[c.target.index]=(s[c.target.index]||0)+1;for(x=0,f=new Array(w);x<w;++x)c=t[x],f[x]=s[c.source.index]/(s[c.source.index]+s[c.target.index]);n=new Array(w),_(),i=new Array(w),g()}}function _(){if(a)for(var x=0,d=t.length;x<d;++x)n[x]=+r(t[x],x,t)}function g(){if(a)for(var x=0,d=t.length;x<d;++x)i[x]=+o(t[x],x,t)}return h.initialize=function(x,d){a=x,u=d,m()},h.links=function(x){return arguments.length?(t=x,m(),h):t},h.id=function(x){return arguments.length?(e=x,h):e},h.iterations=function(x){return arguments.length?(l=+x,h):l},h.strength=function(x){return arguments.length?(r=typeof x=="function"?x:ft(+x),_(),h):r},h.distance=function(x){return arguments.length?(o=typeof x=="function"?x:ft(+x),g(),h):o},h}var Mt=0,Gt=0,Yt=0,vn=1e3,pe,Xt,me=0,bt=0,de=0,Ft=typeof performance=="object"&&performance.now?performance:Date,wn=typeof window=="object"&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(t){setTimeout(t,17)};function Vt(){return bt||(wn(Ti),bt=Ft.now()+de)}function Ti(){bt=0}function Ht(){this._call=this._time=this._next=null}Ht.prototype=kt.prototype={constructor:Ht,restart:function(t,e,r){if(typeof t!="function")throw new TypeError("callback is not a function");r=(r==null?Vt():+r)+(e==null?0:+e),!this._next&&Xt!==this&&(Xt?Xt._next=this:pe=this,Xt=this),this._call=t,this._time=r,Ye()},stop:function(){this._call&&(this._call=null,this._time=1/0,Ye())}};function kt(t,e,r){var n=new Ht;return n.restart(t,e,r),n}function _n(){Vt(),++Mt;for(var t=pe,e;t;)(e=bt-t._time)>=0&&t._call.call(void 0,e),t=t._next;--Mt}function yn(){bt=(me=Ft.now())+de,Mt=Gt=0;try{_n()}finally{Mt=0,Oi(),bt=0}}function zi(){var t=Ft.now(),e=t-me;e>vn&&(de-=e,me=t)}function Oi(){for(var t,e=pe,r,n=1/0;e;)e._call?(n>e._time&&(n=e._time),t=e,e=e._next):(r=e._next,e._next=null,e=t?t._next=r:pe=r);Xt=t,Ye(n)}function Ye(t){if(!Mt){Gt&&(Gt=clearTimeout(Gt));var e=t-bt;e>24?(t<1/0&&(Gt=setTimeout(yn,t-Ft.now()-de)),Yt&&(Yt=clearInterval(Yt))):(Yt||(me=Ft.now(),Yt=setInterval(zi,vn)),Mt=1,wn(yn))}}function ge(t,e,r){var n=new Ht;return e=e==null?0:+e,n.restart(o=>{n.stop(),t(o+e)},e,r),n}function bn(){let t=1;return()=>(t=(1664525*t+1013904223)%4294967296)/4294967296}function Nn(t){return t.x}function Sn(t){return t.y}var Ci=10,Ri=Math.PI*(3-Math.sqrt(5));function Ge(t){var e,r=1,n=.001,o=1-Math.pow(n,1/300),i=0,a=.6,s=new Map,f=kt(y),u=ct("tick","end"),l=bn();t==null&&(t=[]);function y(){h(),u.call("tick",e),r<n&&(f.stop(),u.call("end",e))}function h(g){var x,d=t.length,w;g===void 0&&(g=1);for(var N=0;N<g;++N)for(r+=(i-r)*o,s.forEach(function(c){c(r)}),x=0;x<d;++x)w=t[x],w.fx==null?w.x+=w.vx*=a:(w.x=w.fx,w.vx=0),w.fy==null?w.y+=w.vy*=a:(w.y=w.fy,w.vy=0);return e}function m(){for(var g=0,x=t.length,d;g<x;++g){if(d=t[g],d.index=g,d.fx!=null&&(d.x=d.fx),d.fy!=null&&(d.y=d.fy),isNaN(d.x)||isNaN(d.y)){var w=Ci*Math.sqrt(.5+g),N=g*Ri;d.x=w*Math.cos(N),d.y=w*Math.sin(N)}(isNaN(d.vx)||isNaN(d.vy))&&(d.vx=d.vy=0)}}function _(g){return g.initialize&&g.initialize(t,l),g}return m(),e={tick:h,restart:function(){return f.restart(y),e},stop:function(){return f.stop(),e},nodes:function(g){return arguments.length?(t=g,m(),s.forEach(_),e):t},alpha:function(g){return arguments.length?(r=+g,e):r},alphaMin:function(g){return arguments.length?(n=+g,e):n},alphaDecay:function(g){return arguments.length?(o=+g,e):+o},alphaTarget:function(g){return arguments.length?(i=+g,e):i},velocityDecay:function(g){return arguments.length?(a=1-g,e):1-a},randomSource:function(g){return arguments.length?(l=g,s.forEach(_),e):l},force:function(g,x){return arguments.length>1?(x==null?s.delete(g):s.set(g,_(x)),e):s.get(g)},find:function(g,x,d){var w=0,N=t.length,c,S,I,z,R;for(d==null?d=1/0:d*=d,w=0;w<N;++w)z=t[w],c=g-z.x,S=x-z.y,I=c*c+S*S,I<d&&(R=z,d=I);return R},on:function(g,x){return arguments.length>1?(u.on(g,x),e):u.on(g)}}}function Xe(){var t,e,r,n,o=ft(-30),i,a=1,s=1/0,f=.81;function u(m){var _,g=t.length,x=_t(t,Nn,Sn).visitAfter(y);for(n=m,_=0;_<g;++_)e=t[_],x.visit(h)}function l(){if(t){var m,_=t.length,g;for(i=new Array(_),m=0;m<_;++m)g=t[m],i[g.index]=+o(g,m,t)}}function y(m){var _=0,g,x,d=0,w,N,c;if(m.length){for(w=N=c=0;c<4;++c)(g=m[c])&&(x=Math.abs(g.value))&&(_+=g.value,d+=x,w+=x*g.x,N+=x*g.y);m.x=w/d,m.y=N/d}else{g=m,g.x=g.data.x,g.y=g.data.y;do _+=i[g.data.index];while(g=g.next)}m.value=_}function h(m,_,g,x){if(!m.value)return!0;var d=m.x-e.x,w=m.y-e.y,N=x-_,c=d*d+w*w;if(N*N/f<c)return c<s&&(d===0&&(d=it(r),c+=d*d),w===0&&(w=it(r),c+=w*w),c<a&&(c=Math.sqrt(a*c)),e.vx+=d*m.value*n/c,e.vy+=w*m.value*n/c),!0;if(m.length||c>=s)return;(m.data!==e||m.next)&&(d===0&&(d=it(r),c+=d*d),w===0&&(w=it(r),c+=w*w),c<a&&(c=Math.sqrt(a*c)));do m.data!==e&&(N=i[m.data.index]*n/c,e.vx+=d*N,e.vy+=w*N);while(m=m.next)}return u.initialize=function(m,_){t=m,r=_,l()},u.strength=function(m){return arguments.length?(o=typeof m=="function"?m:ft(+m),l(),u):o},u.distanceMin=function(m){return arguments.length?(a=m*m,u):Math.sqrt(a)},u.distanceMax=function(m){return arguments.length?(s=m*m,u):Math.sqrt(s)},u.theta=function(m){return arguments.length?(f=m*m,u):Math.sqrt(f)},u}var It=class extends Map{constructor(e,r=Bi){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:r}}),e!=null)for(let[n,o]of e)this.set(n,o)}get(e){return super.get(An(this,e))}has(e){return super.has(An(this,e))}set(e,r){return super.set(Pi(this,e),r)}delete(e){return super.delete($i(this,e))}};function An({_intern:t,_key:e},r){let n=e(r);return t.has(n)?t.get(n):r}function Pi({_intern:t,_key:e},r){let n=e(r);return t.has(n)?t.get(n):(t.set(n,r),r)}function $i({_intern:t,_key:e},r){let n=e(r);return t.has(n)&&(r=t.get(n),t.delete(n)),r}function Bi(t){return t!==null&&typeof t=="object"?t.valueOf():t}function Mn(t,e){switch(arguments.length){case 0:break;case 1:this.range(t);break;default:this.range(e).domain(t);break}return this}var Fe=Symbol("implicit");function Wt(){var t=new It,e=[],r=[],n=Fe;function o(i){let a=t.get(i);if(a===void 0){if(n!==Fe)return n;t.set(i,a=e.push(i)-1)}return r[a%r.length]}return o.domain=function(i){if(!arguments.length)return e.slice();e=[],t=new It;for(let a of i)t.has(a)||t.set(a,e.push(a)-1);return o},o.range=function(i){return arguments.length?(r=Array.from(i),o):r.slice()},o.unknown=function(i){return arguments.length?(n=i,o):n},o.copy=function(){return Wt(e,r).unknown(n)},Mn.apply(o,arguments),o}function xe(t,e,r){t.prototype=e.prototype=r,r.constructor=t}function He(t,e){var r=Object.create(t.prototype);for(var n in e)r[n]=e[n];return r}function Ut(){}var Qt=.7,we=1/Qt,Et="\\s*([+-]?\\d+)\\s*",Kt="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",lt="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",Di=/^#([0-9a-f]{3,8})$/,qi=new RegExp(`^rgb\\(${Et},${Et},${Et}\\)$`),Li=new RegExp(`^rgb\\(${lt},${lt},${lt}\\)$`),Yi=new RegExp(`^rgba\\(${Et},${Et},${Et},${Kt}\\)$`),Gi=new RegExp(`^rgba\\(${lt},${lt},${lt},${Kt}\\)$`),Xi=new RegExp(`^hsl\\(${Kt},${lt},${lt}\\)$`),Fi=new RegExp(`^hsla\\(${Kt},${lt},${lt},${Kt}\\)$`),kn={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};xe(Ut,xt,{copy(t){return Object.assign(new this.constructor,this,t)},displayable(){return this.rgb().displayable()},hex:In,formatHex:In,formatHex8:Hi,formatHsl:Vi,formatRgb:En,toString:En});function In(){return this.rgb().formatHex()}function Hi(){return this.rgb().formatHex8()}function Vi(){return Pn(this).formatHsl()}function En(){return this.rgb().formatRgb()}function xt(t){var e,r;return t=(t+"").trim().toLowerCase(),(e=Di.exec(t))?(r=e[1].length,e=parseInt(e[1],16),r===6?Tn(e):r===3?new et(e>>8&15|e>>4&240,e>>4&15|e&240,(e&15)<<4|e&15,1):r===8?ye(e>>24&255,e>>16&255,e>>8&255,(e&255)/255):r===4?ye(e>>12&15|e>>8&240,e>>8&15|e>>4&240,e>>4&15|e&240,((e&15)<<4|e&15)/255):null):(e=qi.exec(t))?new et(e[1],e[2],e[3],1):(e=Li.exec(t))?new et(e[1]*255/100,e[2]*255/100,e[3]*255/100,1):(e=Yi.exec(t))?ye(e[1],e[2],e[3],e[4]):(e=Gi.exec(t))?ye(e[1]*255/100,e[2]*255/100,e[3]*255/100,e[4]):(e=Xi.exec(t))?Cn(e[1],e[2]/100,e[3]/100,1):(e=Fi.exec(t))?Cn(e[1],e[2]/100,e[3]/100,e[4]):kn.hasOwnProperty(t)?Tn(kn[t]):t==="transparent"?new et(NaN,NaN,NaN,0):null}function Tn(t){return new et(t>>16&255,t>>8&255,t&255,1)}function ye(t,e,r,n){return n<=0&&(t=e=r=NaN),new et(t,e,r,n)}function Wi(t){return t instanceof Ut||(t=xt(t)),t?(t=t.rgb(),new et(t.r,t.g,t.b,t.opacity)):new et}function Tt(t,e,r,n){return arguments.length===1?Wi(t):new et(t,e,r,n??1)}function et(t,e,r,n){this.r=+t,this.g=+e,this.b=+r,this.opacity=+n}xe(et,Tt,He(Ut,{brighter(t){return t=t==null?we:Math.pow(we,t),new et(this.r*t,this.g*t,this.b*t,this.opacity)},darker(t){return t=t==null?Qt:Math.pow(Qt,t),new et(this.r*t,this.g*t,this.b*t,this.opacity)},rgb(){return this},clamp(){return new et(St(this.r),St(this.g),St(this.b),_e(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:zn,formatHex:zn,formatHex8:Qi,formatRgb:On,toString:On}));function zn(){return`#${Nt(this.r)}${Nt(this.g)}${Nt(this.b)}`}function Qi(){return`#${Nt(this.r)}${Nt(this.g)}${Nt(this.b)}${Nt((isNaN(this.opacity)?1:this.opacity)*255)}`}function On(){let t=_e(this.opacity);return`${t===1?"rgb(":"rgba("}${St(this.r)}, ${St(this.g)}, ${St(this.b)}${t===1?")":`, ${t})`}`}function _e(t){return isNaN(t)?1:Math.max(0,Math.min(1,t))}function St(t){return Math.max(0,Math.min(255,Math.round(t)||0))}function Nt(t){return t=St(t),(t<16?"0":"")+t.toString(16)}function Cn(t,e,r,n){return n<=0?t=e=r=NaN:r<=0||r>=1?t=e=NaN:e<=0&&(t=NaN),new at(t,e,r,n)}function Pn(t){if(t instanceof at)return new at(t.h,t.s,t.l,t.opacity);if(t instanceof Ut||(t=xt(t)),!t)return new at;if(t instanceof at)return t;t=t.rgb();var e=t.r/255,r=t.g/255,n=t.b/255,o=Math.min(e,r,n),i=Math.max(e,r,n),a=NaN,s=i-o,f=(i+o)/2;return s?(e===i?a=(r-n)/s+(r<n)*6:r===i?a=(n-e)/s+2:a=(e-r)/s+4,s/=f<.5?i+o:2-i-o,a*=60):s=f>0&&f<1?0:a,new at(a,s,f,t.opacity)}function $n(t,e,r,n){return arguments.length===1?Pn(t):new at(t,e,r,n??1)}function at(t,e,r,n){this.h=+t,this.s=+e,this.l=+r,this.opacity=+n}xe(at,$n,He(Ut,{brighter(t){return t=t==null?we:Math.pow(we,t),new at(this.h,this.s,this.l*t,this.opacity)},darker(t){return t=t==null?Qt:Math.pow(Qt,t),new at(this.h,this.s,this.l*t,this.opacity)},rgb(){var t=this.h%360+(this.h<0)*360,e=isNaN(t)||isNaN(this.s)?0:this.s,r=this.l,n=r+(r<.5?r:1-r)*e,o=2*r-n;return new et(Ve(t>=240?t-240:t+120,o,n),Ve(t,o,n),Ve(t<120?t+240:t-120,o,n),this.opacity)},clamp(){return new at(Rn(this.h),ve(this.s),ve(this.l),_e(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){let t=_e(this.opacity);return`${t===1?"hsl(":"hsla("}${Rn(this.h)}, ${ve(this.s)*100}%, ${ve(this.l)*100}%${t===1?")":`, ${t})`}`}}));function Rn(t){return t=(t||0)%360,t<0?t+360:t}function ve(t){return Math.max(0,Math.min(1,t||0))}function Ve(t,e,r){return(t<60?e+(r-e)*t/60:t<180?r:t<240?e+(r-e)*(240-t)/60:e)*255}function We(t,e,r,n,o){var i=t*t,a=i*t;return((1-3*t+3*i-a)*e+(4-6*i+3*a)*r+(1+3*t+3*i-3*a)*n+a*o)/6}function Bn(t){var e=t.length-1;return function(r){var n=r<=0?r=0:r>=1?(r=1,e-1):Math.floor(r*e),o=t[n],i=t[n+1],a=n>0?t[n-1]:2*o-i,s=n<e-1?t[n+2]:2*i-o;return We((r-n/e)*e,a,o,i,s)}}function Dn(t){var e=t.length;return function(r){var n=Math.floor(((r%=1)<0?++r:r)*e),o=t[(n+e-1)%e],i=t[n%e],a=t[(n+1)%e],s=t[(n+2)%e];return We((r-n/e)*e,o,i,a,s)}}var Qe=t=>()=>t;function Ki(t,e){return function(r){return t+r*e}}function Ui(t,e,r){return t=Math.pow(t,r),e=Math.pow(e,r)-t,r=1/r,function(n){return Math.pow(t+n*e,r)}}function qn(t){return(t=+t)==1?be:function(e,r){return r-e?Ui(e,r,t):Qe(isNaN(e)?r:e)}}function be(t,e){var r=e-t;return r?Ki(t,r):Qe(isNaN(t)?e:t)}var Ne=function t(e){var r=qn(e);function n(o,i){var a=r((o=Tt(o)).r,(i=Tt(i)).r),s=r(o.g,i.g),f=r(o.b,i.b),u=be(o.opacity,i.opacity);return function(l){return o.r=a(l),o.g=s(l),o.b=f(l),o.opacity=u(l),o+""}}return n.gamma=t,n}(1);function Ln(t){return function(e){var r=e.length,n=new Array(r),o=new Array(r),i=new Array(r),a,s;for(a=0;a<r;++a)s=Tt(e[a]),n[a]=s.r||0,o[a]=s.g||0,i[a]=s.b||0;return n=t(n),o=t(o),i=t(i),s.opacity=1,function(f){return s.r=n(f),s.g=o(f),s.b=i(f),s+""}}}var Zi=Ln(Bn),Ji=Ln(Dn);function ot(t,e){return t=+t,e=+e,function(r){return t*(1-r)+e*r}}var Ue=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Ke=new RegExp(Ue.source,"g");function ji(t){return function(){return t}}function ta(t){return function(e){return t(e)+""}}function Ze(t,e){var r=Ue.lastIndex=Ke.lastIndex=0,n,o,i,a=-1,s=[],f=[];for(t=t+"",e=e+"";(n=Ue.exec(t))&&(o=Ke.exec(e));)(i=o.index)>r&&(i=e.slice(r,i),s[a]?s[a]+=i:s[++a]=i),(n=n[0])===(o=o[0])?s[a]?s[a]+=o:s[++a]=o:(s[++a]=null,f.push({i:a,x:ot(n,o)})),r=Ke.lastIndex;return r<e.length&&(i=e.slice(r),s[a]?s[a]+=i:s[++a]=i),s.length<2?f[0]?ta(f[0].x):ji(e):(e=f.length,function(u){for(var l=0,y;l<e;++l)s[(y=f[l]).i]=y.x(u);return s.join("")})}var Yn=180/Math.PI,Se={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function Je(t,e,r,n,o,i){var a,s,f;return(a=Math.sqrt(t*t+e*e))&&(t/=a,e/=a),(f=t*r+e*n)&&(r-=t*f,n-=e*f),(s=Math.sqrt(r*r+n*n))&&(r/=s,n/=s,f/=s),t*n<e*r&&(t=-t,e=-e,f=-f,a=-a),{translateX:o,translateY:i,rotate:Math.atan2(e,t)*Yn,skewX:Math.atan(f)*Yn,scaleX:a,scaleY:s}}var Ae;function Gn(t){let e=new(typeof DOMMatrix=="function"?DOMMatrix:WebKitCSSMatrix)(t+"");return e.isIdentity?Se:Je(e.a,e.b,e.c,e.d,e.e,e.f)}function Xn(t){return t==null?Se:(Ae||(Ae=document.createElementNS("http://www.w3.org/2000/svg","g")),Ae.setAttribute("transform",t),(t=Ae.transform.baseVal.consolidate())?(t=t.matrix,Je(t.a,t.b,t.c,t.d,t.e,t.f)):Se)}function Fn(t,e,r,n){function o(u){return u.length?u.pop()+" ":""}function i(u,l,y,h,m,_){if(u!==y||l!==h){var g=m.push("translate(",null,e,null,r);_.push({i:g-4,x:ot(u,y)},{i:g-2,x:ot(l,h)})}else(y||h)&&m.push("translate("+y+e+h+r)}function a(u,l,y,h){u!==l?(u-l>180?l+=360:l-u>180&&(u+=360),h.push({i:y.push(o(y)+"rotate(",null,n)-2,x:ot(u,l)})):l&&y.push(o(y)+"rotate("+l+n)}function s(u,l,y,h){u!==l?h.push({i:y.push(o(y)+"skewX(",null,n)-2,x:ot(u,l)}):l&&y.push(o(y)+"skewX("+l+n)}function f(u,l,y,h,m,_){if(u!==y||l!==h){var g=m.push(o(m)+"scale(",null,",",null,")");_.push({i:g-4,x:ot(u,y)},{i:g-2,x:ot(l,h)})}else(y!==1||h!==1)&&m.push(o(m)+"scale("+y+","+h+")")}return function(u,l){var y=[],h=[];return u=t(u),l=t(l),i(u.translateX,u.translateY,l.translateX,l.translateY,y,h),a(u.rotate,l.rotate,y,h),s(u.skewX,l.skewX,y,h),f(u.scaleX,u.scaleY,l.scaleX,l.scaleY,y,h),u=l=null,function(m){for(var _=-1,g=h.length,x;++_<g;)y[(x=h[_]).i]=x.x(m);return y.join("")}}}var je=Fn(Gn,"px, ","px)","deg)"),tr=Fn(Xn,", ",")",")");var ea=1e-12;function Hn(t){return((t=Math.exp(t))+1/t)/2}function ra(t){return((t=Math.exp(t))-1/t)/2}function na(t){return((t=Math.exp(2*t))-1)/(t+1)}var er=function t(e,r,n){function o(i,a){var s=i[0],f=i[1],u=i[2],l=a[0],y=a[1],h=a[2],m=l-s,_=y-f,g=m*m+_*_,x,d;if(g<ea)d=Math.log(h/u)/e,x=function(z){return[s+z*m,f+z*_,u*Math.exp(e*z*d)]};else{var w=Math.sqrt(g),N=(h*h-u*u+n*g)/(2*u*r*w),c=(h*h-u*u-n*g)/(2*h*r*w),S=Math.log(Math.sqrt(N*N+1)-N),I=Math.log(Math.sqrt(c*c+1)-c);d=(I-S)/e,x=function(z){var R=z*d,q=Hn(S),P=u/(r*w)*(q*na(e*R+S)-ra(S));return[s+P*m,f+P*_,u*q/Hn(e*R+S)]}}return x.duration=d*1e3*e/Math.SQRT2,x}return o.rho=function(i){var a=Math.max(.001,+i),s=a*a,f=s*s;return t(a,s,f)},o}(Math.SQRT2,2,4);function Vn(t){for(var e=t.length/6|0,r=new Array(e),n=0;n<e;)r[n]="#"+t.slice(n*6,++n*6);return r}var rr=Vn("4e79a7f28e2ce1575976b7b259a14fedc949af7aa1ff9da79c755fbab0ab");var oa=ct("start","end","cancel","interrupt"),ia=[],Kn=0,Wn=1,ke=2,Me=3,Qn=4,Ie=5,Zt=6;function yt(t,e,r,n,o,i){var a=t.__transition;if(!a)t.__transition={};else if(r in a)return;aa(t,r,{name:e,index:n,group:o,on:oa,tween:ia,time:i.time,delay:i.delay,duration:i.duration,ease:i.ease,timer:null,state:Kn})}function Jt(t,e){var r=H(t,e);if(r.state>Kn)throw new Error("too late; already scheduled");return r}function Z(t,e){var r=H(t,e);if(r.state>Me)throw new Error("too late; already running");return r}function H(t,e){var r=t.__transition;if(!r||!(r=r[e]))throw new Error("transition not found");return r}function aa(t,e,r){var n=t.__transition,o;n[e]=r,r.timer=kt(i,0,r.time);function i(u){r.state=Wn,r.timer.restart(a,r.delay,r.time),r.delay<=u&&a(u-r.delay)}function a(u){var l,y,h,m;if(r.state!==Wn)return f();for(l in n)if(m=n[l],m.name===r.name){if(m.state===Me)return ge(a);m.state===Qn?(m.state=Zt,m.timer.stop(),m.on.call("interrupt",t,t.__data__,m.index,m.group),delete n[l]):+l<e&&(m.state=Zt,m.timer.stop(),m.on.call("cancel",t,t.__data__,m.index,m.group),delete n[l])}if(ge(function(){r.state===Me&&(r.state=Qn,r.timer.restart(s,r.delay,r.time),s(u))}),r.state=ke,r.on.call("start",t,t.__data__,r.index,r.group),r.state===ke){for(r.state=Me,o=new Array(h=r.tween.length),l=0,y=-1;l<h;++l)(m=r.tween[l].value.call(t,t.__data__,r.index,r.group))&&(o[++y]=m);o.length=y+1}}function s(u){for(var l=u<r.duration?r.ease.call(null,u/r.duration):(r.timer.restart(f),r.state=Ie,1),y=-1,h=o.length;++y<h;)o[y].call(t,l);r.state===Ie&&(r.on.call("end",t,t.__data__,r.index,r.group),f())}function f(){r.state=Zt,r.timer.stop(),delete n[e];for(var u in n)return;delete t.__transition}}function At(t,e){var r=t.__transition,n,o,i=!0,a;if(r){e=e==null?null:e+"";for(a in r){if((n=r[a]).name!==e){i=!1;continue}o=n.state>ke&&n.state<Ie,n.state=Zt,n.timer.stop(),n.on.call(o?"interrupt":"cancel",t,t.__data__,n.index,n.group),delete r[a]}i&&delete t.__transition}}function Un(t){return this.each(function(){At(this,t)})}function sa(t,e){var r,n;return function(){var o=Z(this,t),i=o.tween;if(i!==r){n=r=i;for(var a=0,s=n.length;a<s;++a)if(n[a].name===e){n=n.slice(),n.splice(a,1);break}}o.tween=n}}function ua(t,e,r){var n,o;if(typeof r!="function")throw new Error;return function(){var i=Z(this,t),a=i.tween;if(a!==n){o=(n=a).slice();for(var s={name:e,value:r},f=0,u=o.length;f<u;++f)if(o[f].name===e){o[f]=s;break}f===u&&o.push(s)}i.tween=o}}function Zn(t,e){var r=this._id;if(t+="",arguments.length<2){for(var n=H(this.node(),r).tween,o=0,i=n.length,a;o<i;++o)if((a=n[o]).name===t)return a.value;return null}return this.each((e==null?sa:ua)(r,t,e))}function zt(t,e,r){var n=t._id;return t.each(function(){var o=Z(this,n);(o.value||(o.value={}))[e]=r.apply(this,arguments)}),function(o){return H(o,n).value[e]}}function Ee(t,e){var r;return(typeof e=="number"?ot:e instanceof xt?Ne:(r=xt(e))?(e=r,Ne):Ze)(t,e)}function fa(t){return function(){this.removeAttribute(t)}}function la(t){return function(){this.removeAttributeNS(t.space,t.local)}}function ca(t,e,r){var n,o=r+"",i;return function(){var a=this.getAttribute(t);return a===o?null:a===n?i:i=e(n=a,r)}}function ha(t,e,r){var n,o=r+"",i;return function(){var a=this.getAttributeNS(t.space,t.local);return a===o?null:a===n?i:i=e(n=a,r)}}function pa(t,e,r){var n,o,i;return function(){var a,s=r(this),f;return s==null?void this.removeAttribute(t):(a=this.getAttribute(t),f=s+"",a===f?null:a===n&&f===o?i:(o=f,i=e(n=a,s)))}}function ma(t,e,r){var n,o,i;return function(){var a,s=r(this),f;return s==null?void this.removeAttributeNS(t.space,t.local):(a=this.getAttributeNS(t.space,t.local),f=s+"",a===f?null:a===n&&f===o?i:(o=f,i=e(n=a,s)))}}function Jn(t,e){var r=ht(t),n=r==="transform"?tr:Ee;return this.attrTween(t,typeof e=="function"?(r.local?ma:pa)(r,n,zt(this,"attr."+t,e)):e==null?(r.local?la:fa)(r):(r.local?ha:ca)(r,n,e))}function da(t,e){return function(r){this.setAttribute(t,e.call(this,r))}}function ga(t,e){return function(r){this.setAttributeNS(t.space,t.local,e.call(this,r))}}function xa(t,e){var r,n;function o(){var i=e.apply(this,arguments);return i!==n&&(r=(n=i)&&ga(t,i)),r}return o._value=e,o}function ya(t,e){var r,n;function o(){var i=e.apply(this,arguments);return i!==n&&(r=(n=i)&&da(t,i)),r}return o._value=e,o}function jn(t,e){var r="attr."+t;if(arguments.length<2)return(r=this.tween(r))&&r._value;if(e==null)return this.tween(r,null);if(typeof e!="function")throw new Error;var n=ht(t);return this.tween(r,(n.local?xa:ya)(n,e))}function va(t,e){return function(){Jt(this,t).delay=+e.apply(this,arguments)}}function wa(t,e){return e=+e,function(){Jt(this,t).delay=e}}function to(t){var e=this._id;return arguments.length?this.each((typeof t=="function"?va:wa)(e,t)):H(this.node(),e).delay}function _a(t,e){return function(){Z(this,t).duration=+e.apply(this,arguments)}}function ba(t,e){return e=+e,function(){Z(this,t).duration=e}}function eo(t){var e=this._id;return arguments.length?this.each((typeof t=="function"?_a:ba)(e,t)):H(this.node(),e).duration}function Na(t,e){if(typeof e!="function")throw new Error;return function(){Z(this,t).ease=e}}function ro(t){var e=this._id;return arguments.length?this.each(Na(e,t)):H(this.node(),e).ease}function Sa(t,e){return function(){var r=e.apply(this,arguments);if(typeof r!="function")throw new Error;Z(this,t).ease=r}}function no(t){if(typeof t!="function")throw new Error;return this.each(Sa(this._id,t))}function oo(t){typeof t!="function"&&(t=Pt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=[],f,u=0;u<a;++u)(f=i[u])&&t.call(f,f.__data__,u,i)&&s.push(f);return new tt(n,this._parents,this._name,this._id)}function io(t){if(t._id!==this._id)throw new Error;for(var e=this._groups,r=t._groups,n=e.length,o=r.length,i=Math.min(n,o),a=new Array(n),s=0;s<i;++s)for(var f=e[s],u=r[s],l=f.length,y=a[s]=new Array(l),h,m=0;m<l;++m)(h=f[m]||u[m])&&(y[m]=h);for(;s<n;++s)a[s]=e[s];return new tt(a,this._parents,this._name,this._id)}function Aa(t){return(t+"").trim().split(/^|\s+/).every(function(e){var r=e.indexOf(".");return r>=0&&(e=e.slice(0,r)),!e||e==="start"})}function Ma(t,e,r){var n,o,i=Aa(e)?Jt:Z;return function(){var a=i(this,t),s=a.on;s!==n&&(o=(n=s).copy()).on(e,r),a.on=o}}function ao(t,e){var r=this._id;return arguments.length<2?H(this.node(),r).on.on(t):this.each(Ma(r,t,e))}function ka(t){return function(){var e=this.parentNode;for(var r in this.__transition)if(+r!==t)return;e&&e.removeChild(this)}}function so(){return this.on("end.remove",ka(this._id))}function uo(t){var e=this._name,r=this._id;typeof t!="function"&&(t=vt(t));for(var n=this._groups,o=n.length,i=new Array(o),a=0;a<o;++a)for(var s=n[a],f=s.length,u=i[a]=new Array(f),l,y,h=0;h<f;++h)(l=s[h])&&(y=t.call(l,l.__data__,h,s))&&("__data__"in l&&(y.__data__=l.__data__),u[h]=y,yt(u[h],e,r,h,u,H(l,r)));return new tt(i,this._parents,e,r)}function fo(t){var e=this._name,r=this._id;typeof t!="function"&&(t=Rt(t));for(var n=this._groups,o=n.length,i=[],a=[],s=0;s<o;++s)for(var f=n[s],u=f.length,l,y=0;y<u;++y)if(l=f[y]){for(var h=t.call(l,l.__data__,y,f),m,_=H(l,r),g=0,x=h.length;g<x;++g)(m=h[g])&&yt(m,e,r,g,h,_);i.push(h),a.push(l)}return new tt(i,a,e,r)}var Ia=pt.prototype.constructor;function lo(){return new Ia(this._groups,this._parents)}function Ea(t,e){var r,n,o;return function(){var i=dt(this,t),a=(this.style.removeProperty(t),dt(this,t));return i===a?null:i===r&&a===n?o:o=e(r=i,n=a)}}function co(t){return function(){this.style.removeProperty(t)}}function Ta(t,e,r){var n,o=r+"",i;return function(){var a=dt(this,t);return a===o?null:a===n?i:i=e(n=a,r)}}function za(t,e,r){var n,o,i;return function(){var a=dt(this,t),s=r(this),f=s+"";return s==null&&(f=s=(this.style.removeProperty(t),dt(this,t))),a===f?null:a===n&&f===o?i:(o=f,i=e(n=a,s))}}function Oa(t,e){var r,n,o,i="style."+e,a="end."+i,s;return function(){var f=Z(this,t),u=f.on,l=f.value[i]==null?s||(s=co(e)):void 0;(u!==r||o!==l)&&(n=(r=u).copy()).on(a,o=l),f.on=n}}function ho(t,e,r){var n=(t+="")=="transform"?je:Ee;return e==null?this.styleTween(t,Ea(t,n)).on("end.style."+t,co(t)):typeof e=="function"?this.styleTween(t,za(t,n,zt(this,"style."+t,e))).each(Oa(this._id,t)):this.styleTween(t,Ta(t,n,e),r).on("end.style."+t,null)}function Ca(t,e,r){return function(n){this.style.setProperty(t,e.call(this,n),r)}}function Ra(t,e,r){var n,o;function i(){var a=e.apply(this,arguments);return a!==o&&(n=(o=a)&&Ca(t,a,r)),n}return i._value=e,i}function po(t,e,r){var n="style."+(t+="");if(arguments.length<2)return(n=this.tween(n))&&n._value;if(e==null)return this.tween(n,null);if(typeof e!="function")throw new Error;return this.tween(n,Ra(t,e,r??""))}function Pa(t){return function(){this.textContent=t}}function $a(t){return function(){var e=t(this);this.textContent=e??""}}function mo(t){return this.tween("text",typeof t=="function"?$a(zt(this,"text",t)):Pa(t==null?"":t+""))}function Ba(t){return function(e){this.textContent=t.call(this,e)}}function Da(t){var e,r;function n(){var o=t.apply(this,arguments);return o!==r&&(e=(r=o)&&Ba(o)),e}return n._value=t,n}function go(t){var e="text";if(arguments.length<1)return(e=this.tween(e))&&e._value;if(t==null)return this.tween(e,null);if(typeof t!="function")throw new Error;return this.tween(e,Da(t))}function xo(){for(var t=this._name,e=this._id,r=Te(),n=this._groups,o=n.length,i=0;i<o;++i)for(var a=n[i],s=a.length,f,u=0;u<s;++u)if(f=a[u]){var l=H(f,e);yt(f,t,r,u,a,{time:l.time+l.delay+l.duration,delay:0,duration:l.duration,ease:l.ease})}return new tt(n,this._parents,t,r)}function yo(){var t,e,r=this,n=r._id,o=r.size();return new Promise(function(i,a){var s={value:a},f={value:function(){--o===0&&i()}};r.each(function(){var u=Z(this,n),l=u.on;l!==t&&(e=(t=l).copy(),e._.cancel.push(s),e._.interrupt.push(s),e._.end.push(f)),u.on=e}),o===0&&i()})}var qa=0;function tt(t,e,r,n){this._groups=t,this._parents=e,this._name=r,this._id=n}function vo(t){return pt().transition(t)}function Te(){return++qa}var mt=pt.prototype;tt.prototype=vo.prototype={constructor:tt,select:uo,selectAll:fo,selectChild:mt.selectChild,selectChildren:mt.selectChildren,filter:oo,merge:io,selection:lo,transition:xo,call:mt.call,nodes:mt.nodes,node:mt.node,size:mt.size,empty:mt.empty,each:mt.each,on:ao,attr:Jn,attrTween:jn,style:ho,styleTween:po,text:mo,textTween:go,remove:so,tween:Zn,delay:to,duration:eo,ease:ro,easeVarying:no,end:yo,[Symbol.iterator]:mt[Symbol.iterator]};function ze(t){return((t*=2)<=1?t*t*t:(t-=2)*t*t+2)/2}var La={time:null,delay:0,duration:250,ease:ze};function Ya(t,e){for(var r;!(r=t.__transition)||!(r=r[e]);)if(!(t=t.parentNode))throw new Error(`transition ${e} not found`);return r}function wo(t){var e,r;t instanceof tt?(e=t._id,t=t._name):(e=Te(),(r=La).time=Vt(),t=t==null?null:t+"");for(var n=this._groups,o=n.length,i=0;i<o;++i)for(var a=n[i],s=a.length,f,u=0;u<s;++u)(f=a[u])&&yt(f,t,e,u,a,r||Ya(f,e));return new tt(n,this._parents,t,e)}pt.prototype.interrupt=Un;pt.prototype.transition=wo;var jt=t=>()=>t;function nr(t,{sourceEvent:e,target:r,transform:n,dispatch:o}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},target:{value:r,enumerable:!0,configurable:!0},transform:{value:n,enumerable:!0,configurable:!0},_:{value:o}})}function st(t,e,r){this.k=t,this.x=e,this.y=r}st.prototype={constructor:st,scale:function(t){return t===1?this:new st(this.k*t,this.x,this.y)},translate:function(t,e){return t===0&e===0?this:new st(this.k,this.x+this.k*t,this.y+this.k*e)},apply:function(t){return[t[0]*this.k+this.x,t[1]*this.k+this.y]},applyX:function(t){return t*this.k+this.x},applyY:function(t){return t*this.k+this.y},invert:function(t){return[(t[0]-this.x)/this.k,(t[1]-this.y)/this.k]},invertX:function(t){return(t-this.x)/this.k},invertY:function(t){return(t-this.y)/this.k},rescaleX:function(t){return t.copy().domain(t.range().map(this.invertX,this).map(t.invert,t))},rescaleY:function(t){return t.copy().domain(t.range().map(this.invertY,this).map(t.invert,t))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var te=new st(1,0,0);or.prototype=st.prototype;function or(t){for(;!t.__zoom;)if(!(t=t.parentNode))return te;return t.__zoom}function Oe(t){t.stopImmediatePropagation()}function Ot(t){t.preventDefault(),t.stopImmediatePropagation()}function Ga(t){return(!t.ctrlKey||t.type==="wheel")&&!t.button}function Xa(){var t=this;return t instanceof SVGElement?(t=t.ownerSVGElement||t,t.hasAttribute("viewBox")?(t=t.viewBox.baseVal,[[t.x,t.y],[t.x+t.width,t.y+t.height]]):[[0,0],[t.width.baseVal.value,t.height.baseVal.value]]):[[0,0],[t.clientWidth,t.clientHeight]]}function _o(){return this.__zoom||te}function Fa(t){return-t.deltaY*(t.deltaMode===1?.05:t.deltaMode?1:.002)*(t.ctrlKey?10:1)}function Ha(){return navigator.maxTouchPoints||"ontouchstart"in this}function Va(t,e,r){var n=t.invertX(e[0][0])-r[0][0],o=t.invertX(e[1][0])-r[1][0],i=t.invertY(e[0][1])-r[0][1],a=t.invertY(e[1][1])-r[1][1];return t.translate(o>n?(n+o)/2:Math.min(0,n)||Math.max(0,o),a>i?(i+a)/2:Math.min(0,i)||Math.max(0,a))}function ir(){var t=Ga,e=Xa,r=Va,n=Fa,o=Ha,i=[0,1/0],a=[[-1/0,-1/0],[1/0,1/0]],s=250,f=er,u=ct("start","zoom","end"),l,y,h,m=500,_=150,g=0,x=10;function d(p){p.property("__zoom",_o).on("wheel.zoom",R,{passive:!1}).on("mousedown.zoom",q).on("dblclick.zoom",P).filter(o).on("touchstart.zoom",Y).on("touchmove.zoom",Q).on("touchend.zoom touchcancel.zoom",K).style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}d.transform=function(p,A,v,k){var E=p.selection?p.selection():p;E.property("__zoom",_o),p!==E?S(p,A,v,k):E.interrupt().each(function(){I(this,arguments).event(k).start().zoom(null,typeof A=="function"?A.apply(this,arguments):A).end()})},d.scaleBy=function(p,A,v,k){d.scaleTo(p,function(){var E=this.__zoom.k,O=typeof A=="function"?A.apply(this,arguments):A;return E*O},v,k)},d.scaleTo=function(p,A,v,k){d.transform(p,function(){var E=e.apply(this,arguments),O=this.__zoom,C=v==null?c(E):typeof v=="function"?v.apply(this,arguments):v,L=O.invert(C),G=typeof A=="function"?A.apply(this,arguments):A;return r(N(w(O,G),C,L),E,a)},v,k)},d.translateBy=function(p,A,v,k){d.transform(p,function(){return r(this.__zoom.translate(typeof A=="function"?A.apply(this,arguments):A,typeof v=="function"?v.apply(this,arguments):v),e.apply(this,arguments),a)},null,k)},d.translateTo=function(p,A,v,k,E){d.transform(p,function(){var O=e.apply(this,arguments),C=this.__zoom,L=k==null?c(O):typeof k=="function"?k.apply(this,arguments):k;return r(te.translate(L[0],L[1]).scale(C.k).translate(typeof A=="function"?-A.apply(this,arguments):-A,typeof v=="function"?-v.apply(this,arguments):-v),O,a)},k,E)};function w(p,A){return A=Math.max(i[0],Math.min(i[1],A)),A===p.k?p:new st(A,p.x,p.y)}function N(p,A,v){var k=A[0]-v[0]*p.k,E=A[1]-v[1]*p.k;return k===p.x&&E===p.y?p:new st(p.k,k,E)}function c(p){return[(+p[0][0]+ +p[1][0])/2,(+p[0][1]+ +p[1][1])/2]}function S(p,A,v,k){p.on("start.zoom",function(){I(this,arguments).event(k).start()}).on("interrupt.zoom end.zoom",function(){I(this,arguments).event(k).end()}).tween("zoom",function(){var E=this,O=arguments,C=I(E,O).event(k),L=e.apply(E,O),G=v==null?c(L):typeof v=="function"?v.apply(E,O):v,rt=Math.max(L[1][0]-L[0][0],L[1][1]-L[0][1]),X=E.__zoom,b=typeof A=="function"?A.apply(E,O):A,M=f(X.invert(G).concat(rt/X.k),b.invert(G).concat(rt/b.k));return function($){if($===1)$=b;else{var D=M($),V=rt/D[2];$=new st(V,G[0]-D[0]*V,G[1]-D[1]*V)}C.zoom(null,$)}})}function I(p,A,v){return!v&&p.__zooming||new z(p,A)}function z(p,A){this.that=p,this.args=A,this.active=0,this.sourceEvent=null,this.extent=e.apply(p,A),this.taps=0}z.prototype={event:function(p){return p&&(this.sourceEvent=p),this},start:function(){return++this.active===1&&(this.that.__zooming=this,this.emit("start")),this},zoom:function(p,A){return this.mouse&&p!=="mouse"&&(this.mouse[1]=A.invert(this.mouse[0])),this.touch0&&p!=="touch"&&(this.touch0[1]=A.invert(this.touch0[0])),this.touch1&&p!=="touch"&&(this.touch1[1]=A.invert(this.touch1[0])),this.that.__zoom=A,this.emit("zoom"),this},end:function(){return--this.active===0&&(delete this.that.__zooming,this.emit("end")),this},emit:function(p){var A=J(this.that).datum();u.call(p,this.that,new nr(p,{sourceEvent:this.sourceEvent,target:d,type:p,transform:this.that.__zoom,dispatch:u}),A)}};function R(p,...A){if(!t.apply(this,arguments))return;var v=I(this,A).event(p),k=this.__zoom,E=Math.max(i[0],Math.min(i[1],k.k*Math.pow(2,n.apply(this,arguments)))),O=nt(p);if(v.wheel)(v.mouse[0][0]!==O[0]||v.mouse[0][1]!==O[1])&&(v.mouse[1]=k.invert(v.mouse[0]=O)),clearTimeout(v.wheel);else{if(k.k===E)return;v.mouse=[O,k.invert(O)],At(this),v.start()}Ot(p),v.wheel=setTimeout(C,_),v.zoom("mouse",r(N(w(k,E),v.mouse[0],v.mouse[1]),v.extent,a));function C(){v.wheel=null,v.end()}}function q(p,...A){if(h||!t.apply(this,arguments))return;var v=p.currentTarget,k=I(this,A,!0).event(p),E=J(p.view).on("mousemove.zoom",G,!0).on("mouseup.zoom",rt,!0),O=nt(p,v),C=p.clientX,L=p.clientY;Bt(p.view),Oe(p),k.mouse=[O,this.__zoom.invert(O)],At(this),k.start();function G(X){if(Ot(X),!k.moved){var b=X.clientX-C,M=X.clientY-L;k.moved=b*b+M*M>g}k.event(X).zoom("mouse",r(N(k.that.__zoom,k.mouse[0]=nt(X,v),k.mouse[1]),k.extent,a))}function rt(X){E.on("mousemove.zoom mouseup.zoom",null),Dt(X.view,k.moved),Ot(X),k.event(X).end()}}function P(p,...A){if(t.apply(this,arguments)){var v=this.__zoom,k=nt(p.changedTouches?p.changedTouches[0]:p,this),E=v.invert(k),O=v.k*(p.shiftKey?.5:2),C=r(N(w(v,O),k,E),e.apply(this,A),a);Ot(p),s>0?J(this).transition().duration(s).call(S,C,k,p):J(this).call(d.transform,C,k,p)}}function Y(p,...A){if(t.apply(this,arguments)){var v=p.touches,k=v.length,E=I(this,A,p.changedTouches.length===k).event(p),O,C,L,G;for(Oe(p),C=0;C<k;++C)L=v[C],G=nt(L,this),G=[G,this.__zoom.invert(G),L.identifier],E.touch0?!E.touch1&&E.touch0[2]!==G[2]&&(E.touch1=G,E.taps=0):(E.touch0=G,O=!0,E.taps=1+!!l);l&&(l=clearTimeout(l)),O&&(E.taps<2&&(y=G[0],l=setTimeout(function(){l=null},m)),At(this),E.start())}}function Q(p,...A){if(this.__zooming){var v=I(this,A).event(p),k=p.changedTouches,E=k.length,O,C,L,G;for(Ot(p),O=0;O<E;++O)C=k[O],L=nt(C,this),v.touch0&&v.touch0[2]===C.identifier?v.touch0[0]=L:v.touch1&&v.touch1[2]===C.identifier&&(v.touch1[0]=L);if(C=v.that.__zoom,v.touch1){var rt=v.touch0[0],X=v.touch0[1],b=v.touch1[0],M=v.touch1[1],$=($=b[0]-rt[0])*$+($=b[1]-rt[1])*$,D=(D=M[0]-X[0])*D+(D=M[1]-X[1])*D;C=w(C,Math.sqrt($/D)),L=[(rt[0]+b[0])/2,(rt[1]+b[1])/2],G=[(X[0]+M[0])/2,(X[1]+M[1])/2]}else if(v.touch0)L=v.touch0[0],G=v.touch0[1];else return;v.zoom("touch",r(N(C,L,G),v.extent,a))}}function K(p,...A){if(this.__zooming){var v=I(this,A).event(p),k=p.changedTouches,E=k.length,O,C;for(Oe(p),h&&clearTimeout(h),h=setTimeout(function(){h=null},m),O=0;O<E;++O)C=k[O],v.touch0&&v.touch0[2]===C.identifier?delete v.touch0:v.touch1&&v.touch1[2]===C.identifier&&delete v.touch1;if(v.touch1&&!v.touch0&&(v.touch0=v.touch1,delete v.touch1),v.touch0)v.touch0[1]=this.__zoom.invert(v.touch0[0]);else if(v.end(),v.taps===2&&(C=nt(C,this),Math.hypot(y[0]-C[0],y[1]-C[1])<x)){var L=J(this).on("dblclick.zoom");L&&L.apply(this,arguments)}}}return d.wheelDelta=function(p){return arguments.length?(n=typeof p=="function"?p:jt(+p),d):n},d.filter=function(p){return arguments.length?(t=typeof p=="function"?p:jt(!!p),d):t},d.touchable=function(p){return arguments.length?(o=typeof p=="function"?p:jt(!!p),d):o},d.extent=function(p){return arguments.length?(e=typeof p=="function"?p:jt([[+p[0][0],+p[0][1]],[+p[1][0],+p[1][1]]]),d):e},d.scaleExtent=function(p){return arguments.length?(i[0]=+p[0],i[1]=+p[1],d):[i[0],i[1]]},d.translateExtent=function(p){return arguments.length?(a[0][0]=+p[0][0],a[1][0]=+p[1][0],a[0][1]=+p[0][1],a[1][1]=+p[1][1],d):[[a[0][0],a[0][1]],[a[1][0],a[1][1]]]},d.constrain=function(p){return arguments.length?(r=p,d):r},d.duration=function(p){return arguments.length?(s=+p,d):s},d.interpolate=function(p){return arguments.length?(f=p,d):f},d.on=function(){var p=u.on.apply(u,arguments);return p===u?d:p},d.clickDistance=function(p){return arguments.length?(g=(p=+p)*p,d):Math.sqrt(g)},d.tapDistance=function(p){return arguments.length?(x=+p,d):x},d}var Wa=0;function Ct(t){return String(t).replaceAll("&","&amp;").replaceAll("<","&lt;").replaceAll(">","&gt;").replaceAll('"',"&quot;").replaceAll("'","&#039;")}function ee(t,e){if(t==null||t==="")return e;let r=Number(t);return Number.isFinite(r)?r:e}function Qa({model:t,el:e}){let n=`graph-widget-arrow-${++Wa}`,o=Wt(rr),i=document.createElement("div");i.classList.add("graph-widget"),e.appendChild(i);let a=document.createElementNS("http://www.w3.org/2000/svg","svg");a.classList.add("graph-widget-svg"),i.appendChild(a);let s=document.createElement("div");s.classList.add("graph-widget-tooltip"),s.style.display="none",i.appendChild(s);let f=J(a);f.append("defs").append("marker").attr("id",n).attr("viewBox","-0 -5 10 10").attr("refX",9).attr("refY",0).attr("orient","auto").attr("markerWidth",6).attr("markerHeight",6).append("path").attr("d","M0,-5L10,0L0,5").attr("class","graph-widget-arrow");let u=f.append("g").attr("class","graph-widget-zoom"),l=u.append("g").attr("class","graph-widget-edges"),y=u.append("g").attr("class","graph-widget-edge-labels"),h=u.append("g").attr("class","graph-widget-nodes"),m=ir().scaleExtent([.1,5]).on("zoom",b=>{u.attr("transform",b.transform)});f.call(m);let _=ee(t.get("height"),400),g=ee(t.get("width"),i.clientWidth||600),x=[],d=[],w=new Set(t.get("selected_nodes")||[]),N=new Set(t.get("selected_edges")||[]),c=null,S=Ge().force("link",Le().id(b=>b.id).distance(95).strength(.9)).force("charge",Xe().strength(-220)).force("center",he(g/2,_/2)).force("collide",qe().radius(b=>I(b)+8)).on("tick",k);S.stop();function I(b){return Math.max(4,ee(b.size,14))}function z(b){return Math.max(1,ee(b.width??b.size,1.7))}function R(b){return b.id}function q(){a.setAttribute("width",g),a.setAttribute("height",_),a.setAttribute("viewBox",`0 0 ${g} ${_}`),S.force("center",he(g/2,_/2)),S.alpha(.2).restart()}function P(){let b=t.get("width"),M=null;if(b!=null&&b!==""){let $=Number(b);Number.isFinite($)&&$>0&&(M=$)}_=ee(t.get("height"),400),M!==null?(c&&(c.disconnect(),c=null),i.style.display="",i.style.width="",g=M):(i.style.display="block",i.style.width="100%",g=e.clientWidth||i.clientWidth||g||600,!c&&typeof ResizeObserver<"u"&&(c=new ResizeObserver(()=>{let D=e.clientWidth||i.clientWidth;!D||D===g||(g=D,q())}),c.observe(e))),q()}function Y(){S.alpha(.2).restart()}function Q(){t.set("selected_nodes",Array.from(w)),t.set("selected_edges",Array.from(N)),t.save_changes()}function K(b,M,$){let D=M.name||M.id||$,V=`<strong>${Ct(D)}</strong>`;if($==="node"?V+=`<br><span class="graph-widget-tooltip-key">id:</span> ${Ct(M.id)}`:(V+=`<br><span class="graph-widget-tooltip-key">source:</span> ${Ct(M.source.id||M.source)}`,V+=`<br><span class="graph-widget-tooltip-key">target:</span> ${Ct(M.target.id||M.target)}`),M.data&&typeof M.data=="object")for(let[B,U]of Object.entries(M.data))V+=`<br><span class="graph-widget-tooltip-key">${Ct(B)}:</span> ${Ct(U)}`;s.innerHTML=V,s.style.display="block";let T=i.getBoundingClientRect();s.style.left=`${b.clientX-T.left+12}px`,s.style.top=`${b.clientY-T.top+12}px`}function p(){s.style.display="none"}function A(){let b=t.get("nodes")||[],M=t.get("edges")||[],$=new Map(b.map(T=>[T.id,T])),D=new Map;x.forEach(T=>{D.set(T.id,{x:T.x,y:T.y,vx:T.vx,vy:T.vy,fx:T.fx,fy:T.fy})});function V(T,B){if(Number.isFinite(Number(T.x))&&Number.isFinite(Number(T.y)))return{x:Number(T.x),y:Number(T.y)};let U=M.findIndex(ut=>ut.source===T.id&&D.has(ut.target)||ut.target===T.id&&D.has(ut.source));if(U>=0){let ut=M[U],oe=D.has(ut.source),ar=D.get(oe?ut.source:ut.target),bo=oe?1:-1,No=U%5-2;return{x:ar.x+bo*80,y:ar.y+No*28}}let re=B*2.399963229728653,ne=24+B*3;return{x:g/2+Math.cos(re)*ne,y:_/2+Math.sin(re)*ne}}x=b.map((T,B)=>{let U=D.get(T.id);return U?{...T,...U}:{...T,...V(T,B)}}),d=M.filter(T=>$.has(T.source)&&$.has(T.target)).map(T=>({...T,source:T.source,target:T.target})),w=new Set((t.get("selected_nodes")||[]).filter(T=>$.has(T))),N=new Set((t.get("selected_edges")||[]).filter(T=>d.some(B=>B.id===T))),S.nodes(x),S.force("link").links(d),S.alpha(D.size?.16:.35).restart(),v()}function v(){let b=t.get("directed"),M=l.selectAll(".graph-widget-edge").data(d,R);M.exit().remove(),M.enter().append("path").attr("class","graph-widget-edge").on("click",rt).on("mouseenter",(B,U)=>K(B,U,"edge")).on("mouseleave",p).merge(M).attr("stroke",B=>B.color||"var(--graph-edge)").attr("stroke-width",z).attr("marker-end",b?`url(#${n})`:null).classed("is-selected",B=>N.has(B.id));let $=y.selectAll(".graph-widget-edge-label").data(d.filter(B=>B.name),R);$.exit().remove(),$.enter().append("text").attr("class","graph-widget-edge-label").merge($).text(B=>B.name||"");let D=h.selectAll(".graph-widget-node-group").data(x,B=>B.id);D.exit().remove();let V=D.enter().append("g").attr("class","graph-widget-node-group").call(Be().on("start",E).on("drag",C).on("end",L)).on("click",G).on("mouseenter",(B,U)=>{K(B,U,"node"),t.set("hovered_node",U.id),t.save_changes()}).on("mouseleave",(B,U)=>{p(),t.set("hovered_node",null),t.save_changes()});V.append("circle").attr("class","graph-widget-node"),V.append("text").attr("class","graph-widget-node-name").attr("text-anchor","middle");let T=V.merge(D);T.select(".graph-widget-node").attr("r",I).attr("fill",B=>B.color||o(B.id)).classed("is-selected",B=>w.has(B.id)),T.select(".graph-widget-node-name").attr("dy",B=>I(B)+14).text(B=>B.name||"")}function k(){(t.get("bounded")??!0)&&x.forEach(M=>{let $=I(M);M.x=Math.max(18+$,Math.min(g-18-$,M.x)),M.y=Math.max(18+$,Math.min(_-18-$,M.y))}),l.selectAll(".graph-widget-edge").attr("d",O),y.selectAll(".graph-widget-edge-label").attr("x",b=>(b.source.x+b.target.x)/2).attr("y",b=>(b.source.y+b.target.y)/2-5),h.selectAll(".graph-widget-node-group").attr("transform",b=>`translate(${b.x},${b.y})`)}function E(b,M){b.active||S.alphaTarget(.2).restart(),M.fx=M.x,M.fy=M.y}function O(b){let M=I(b.source),$=I(b.target),D=b.target.x-b.source.x,V=b.target.y-b.source.y,T=Math.hypot(D,V)||1,B=D/T,U=V/T,re=b.source.x+B*(M+2),ne=b.source.y+U*(M+2),ut=b.target.x-B*($+9),oe=b.target.y-U*($+9);return`M${re},${ne}L${ut},${oe}`}function C(b,M){M.fx=b.x,M.fy=b.y}function L(b,M){b.active||S.alphaTarget(0),M.fx=null,M.fy=null}function G(b,M){b.stopPropagation(),b.ctrlKey||b.metaKey?w.has(M.id)?w.delete(M.id):w.add(M.id):w.has(M.id)&&w.size===1?w.clear():(w.clear(),N.clear(),w.add(M.id)),Q(),v()}function rt(b,M){b.stopPropagation(),b.ctrlKey||b.metaKey?N.has(M.id)?N.delete(M.id):N.add(M.id):N.has(M.id)&&N.size===1?N.clear():(N.clear(),w.clear(),N.add(M.id)),Q(),v()}a.addEventListener("click",b=>{b.target===a&&(w.clear(),N.clear(),Q(),v())});function X(){w=new Set(t.get("selected_nodes")||[]),N=new Set(t.get("selected_edges")||[]),v()}return t.on("change:nodes",A),t.on("change:edges",A),t.on("change:directed",v),t.on("change:bounded",Y),t.on("change:selected_nodes",X),t.on("change:selected_edges",X),t.on("change:width",P),t.on("change:height",P),P(),A(),()=>{S.stop(),c&&(c.disconnect(),c=null),t.off("change:nodes",A),t.off("change:edges",A),t.off("change:directed",v),t.off("change:bounded",Y),t.off("change:selected_nodes",X),t.off("change:selected_edges",X),t.off("change:width",P),t.off("change:height",P)}}var Gp={render:Qa};export{Gp as default};
+var So={value:()=>{}};function ur(){for(var t=0,e=arguments.length,r={},n;t<e;++t){if(!(n=arguments[t]+"")||n in r||/[\s.]/.test(n))throw new Error("illegal type: "+n);r[n]=[]}return new ie(r)}function ie(t){this._=t}function Ao(t,e){return t.trim().split(/^|\s+/).map(function(r){var n="",o=r.indexOf(".");if(o>=0&&(n=r.slice(o+1),r=r.slice(0,o)),r&&!e.hasOwnProperty(r))throw new Error("unknown type: "+r);return{type:r,name:n}})}ie.prototype=ur.prototype={constructor:ie,on:function(t,e){var r=this._,n=Ao(t+"",r),o,i=-1,a=n.length;if(arguments.length<2){for(;++i<a;)if((o=(t=n[i]).type)&&(o=Mo(r[o],t.name)))return o;return}if(e!=null&&typeof e!="function")throw new Error("invalid callback: "+e);for(;++i<a;)if(o=(t=n[i]).type)r[o]=sr(r[o],t.name,e);else if(e==null)for(o in r)r[o]=sr(r[o],t.name,null);return this},copy:function(){var t={},e=this._;for(var r in e)t[r]=e[r].slice();return new ie(t)},call:function(t,e){if((o=arguments.length-2)>0)for(var r=new Array(o),n=0,o,i;n<o;++n)r[n]=arguments[n+2];if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(i=this._[t],n=0,o=i.length;n<o;++n)i[n].value.apply(e,r)},apply:function(t,e,r){if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(var n=this._[t],o=0,i=n.length;o<i;++o)n[o].value.apply(e,r)}};function Mo(t,e){for(var r=0,n=t.length,o;r<n;++r)if((o=t[r]).name===e)return o.value}function sr(t,e,r){for(var n=0,o=t.length;n<o;++n)if(t[n].name===e){t[n]=So,t=t.slice(0,n).concat(t.slice(n+1));break}return r!=null&&t.push({name:e,value:r}),t}var ct=ur;var ae="http://www.w3.org/1999/xhtml",Ce={svg:"http://www.w3.org/2000/svg",xhtml:ae,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function ht(t){var e=t+="",r=e.indexOf(":");return r>=0&&(e=t.slice(0,r))!=="xmlns"&&(t=t.slice(r+1)),Ce.hasOwnProperty(e)?{space:Ce[e],local:t}:t}function ko(t){return function(){var e=this.ownerDocument,r=this.namespaceURI;return r===ae&&e.documentElement.namespaceURI===ae?e.createElement(t):e.createElementNS(r,t)}}function Io(t){return function(){return this.ownerDocument.createElementNS(t.space,t.local)}}function se(t){var e=ht(t);return(e.local?Io:ko)(e)}function Eo(){}function vt(t){return t==null?Eo:function(){return this.querySelector(t)}}function fr(t){typeof t!="function"&&(t=vt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=new Array(a),f,u,l=0;l<a;++l)(f=i[l])&&(u=t.call(f,f.__data__,l,i))&&("__data__"in f&&(u.__data__=f.__data__),s[l]=u);return new F(n,this._parents)}function Re(t){return t==null?[]:Array.isArray(t)?t:Array.from(t)}function To(){return[]}function Rt(t){return t==null?To:function(){return this.querySelectorAll(t)}}function zo(t){return function(){return Re(t.apply(this,arguments))}}function lr(t){typeof t=="function"?t=zo(t):t=Rt(t);for(var e=this._groups,r=e.length,n=[],o=[],i=0;i<r;++i)for(var a=e[i],s=a.length,f,u=0;u<s;++u)(f=a[u])&&(n.push(t.call(f,f.__data__,u,a)),o.push(f));return new F(n,o)}function Pt(t){return function(){return this.matches(t)}}function ue(t){return function(e){return e.matches(t)}}var Oo=Array.prototype.find;function Co(t){return function(){return Oo.call(this.children,t)}}function Ro(){return this.firstElementChild}function cr(t){return this.select(t==null?Ro:Co(typeof t=="function"?t:ue(t)))}var Po=Array.prototype.filter;function $o(){return Array.from(this.children)}function Bo(t){return function(){return Po.call(this.children,t)}}function hr(t){return this.selectAll(t==null?$o:Bo(typeof t=="function"?t:ue(t)))}function pr(t){typeof t!="function"&&(t=Pt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=[],f,u=0;u<a;++u)(f=i[u])&&t.call(f,f.__data__,u,i)&&s.push(f);return new F(n,this._parents)}function fe(t){return new Array(t.length)}function mr(){return new F(this._enter||this._groups.map(fe),this._parents)}function $t(t,e){this.ownerDocument=t.ownerDocument,this.namespaceURI=t.namespaceURI,this._next=null,this._parent=t,this.__data__=e}$t.prototype={constructor:$t,appendChild:function(t){return this._parent.insertBefore(t,this._next)},insertBefore:function(t,e){return this._parent.insertBefore(t,e)},querySelector:function(t){return this._parent.querySelector(t)},querySelectorAll:function(t){return this._parent.querySelectorAll(t)}};function dr(t){return function(){return t}}function Do(t,e,r,n,o,i){for(var a=0,s,f=e.length,u=i.length;a<u;++a)(s=e[a])?(s.__data__=i[a],n[a]=s):r[a]=new $t(t,i[a]);for(;a<f;++a)(s=e[a])&&(o[a]=s)}function qo(t,e,r,n,o,i,a){var s,f,u=new Map,l=e.length,y=i.length,h=new Array(l),m;for(s=0;s<l;++s)(f=e[s])&&(h[s]=m=a.call(f,f.__data__,s,e)+"",u.has(m)?o[s]=f:u.set(m,f));for(s=0;s<y;++s)m=a.call(t,i[s],s,i)+"",(f=u.get(m))?(n[s]=f,f.__data__=i[s],u.delete(m)):r[s]=new $t(t,i[s]);for(s=0;s<l;++s)(f=e[s])&&u.get(h[s])===f&&(o[s]=f)}function Lo(t){return t.__data__}function gr(t,e){if(!arguments.length)return Array.from(this,Lo);var r=e?qo:Do,n=this._parents,o=this._groups;typeof t!="function"&&(t=dr(t));for(var i=o.length,a=new Array(i),s=new Array(i),f=new Array(i),u=0;u<i;++u){var l=n[u],y=o[u],h=y.length,m=Yo(t.call(l,l&&l.__data__,u,n)),_=m.length,g=s[u]=new Array(_),x=a[u]=new Array(_),d=f[u]=new Array(h);r(l,y,g,x,d,m,e);for(var w=0,N=0,c,S;w<_;++w)if(c=g[w]){for(w>=N&&(N=w+1);!(S=x[N])&&++N<_;);c._next=S||null}}return a=new F(a,n),a._enter=s,a._exit=f,a}function Yo(t){return typeof t=="object"&&"length"in t?t:Array.from(t)}function xr(){return new F(this._exit||this._groups.map(fe),this._parents)}function yr(t,e,r){var n=this.enter(),o=this,i=this.exit();return typeof t=="function"?(n=t(n),n&&(n=n.selection())):n=n.append(t+""),e!=null&&(o=e(o),o&&(o=o.selection())),r==null?i.remove():r(i),n&&o?n.merge(o).order():o}function vr(t){for(var e=t.selection?t.selection():t,r=this._groups,n=e._groups,o=r.length,i=n.length,a=Math.min(o,i),s=new Array(o),f=0;f<a;++f)for(var u=r[f],l=n[f],y=u.length,h=s[f]=new Array(y),m,_=0;_<y;++_)(m=u[_]||l[_])&&(h[_]=m);for(;f<o;++f)s[f]=r[f];return new F(s,this._parents)}function wr(){for(var t=this._groups,e=-1,r=t.length;++e<r;)for(var n=t[e],o=n.length-1,i=n[o],a;--o>=0;)(a=n[o])&&(i&&a.compareDocumentPosition(i)^4&&i.parentNode.insertBefore(a,i),i=a);return this}function _r(t){t||(t=Go);function e(y,h){return y&&h?t(y.__data__,h.__data__):!y-!h}for(var r=this._groups,n=r.length,o=new Array(n),i=0;i<n;++i){for(var a=r[i],s=a.length,f=o[i]=new Array(s),u,l=0;l<s;++l)(u=a[l])&&(f[l]=u);f.sort(e)}return new F(o,this._parents).order()}function Go(t,e){return t<e?-1:t>e?1:t>=e?0:NaN}function br(){var t=arguments[0];return arguments[0]=this,t.apply(null,arguments),this}function Nr(){return Array.from(this)}function Sr(){for(var t=this._groups,e=0,r=t.length;e<r;++e)for(var n=t[e],o=0,i=n.length;o<i;++o){var a=n[o];if(a)return a}return null}function Ar(){let t=0;for(let e of this)++t;return t}function Mr(){return!this.node()}function kr(t){for(var e=this._groups,r=0,n=e.length;r<n;++r)for(var o=e[r],i=0,a=o.length,s;i<a;++i)(s=o[i])&&t.call(s,s.__data__,i,o);return this}function Xo(t){return function(){this.removeAttribute(t)}}function Fo(t){return function(){this.removeAttributeNS(t.space,t.local)}}function Ho(t,e){return function(){this.setAttribute(t,e)}}function Vo(t,e){return function(){this.setAttributeNS(t.space,t.local,e)}}function Wo(t,e){return function(){var r=e.apply(this,arguments);r==null?this.removeAttribute(t):this.setAttribute(t,r)}}function Qo(t,e){return function(){var r=e.apply(this,arguments);r==null?this.removeAttributeNS(t.space,t.local):this.setAttributeNS(t.space,t.local,r)}}function Ir(t,e){var r=ht(t);if(arguments.length<2){var n=this.node();return r.local?n.getAttributeNS(r.space,r.local):n.getAttribute(r)}return this.each((e==null?r.local?Fo:Xo:typeof e=="function"?r.local?Qo:Wo:r.local?Vo:Ho)(r,e))}function le(t){return t.ownerDocument&&t.ownerDocument.defaultView||t.document&&t||t.defaultView}function Ko(t){return function(){this.style.removeProperty(t)}}function Uo(t,e,r){return function(){this.style.setProperty(t,e,r)}}function Zo(t,e,r){return function(){var n=e.apply(this,arguments);n==null?this.style.removeProperty(t):this.style.setProperty(t,n,r)}}function Er(t,e,r){return arguments.length>1?this.each((e==null?Ko:typeof e=="function"?Zo:Uo)(t,e,r??"")):dt(this.node(),t)}function dt(t,e){return t.style.getPropertyValue(e)||le(t).getComputedStyle(t,null).getPropertyValue(e)}function Jo(t){return function(){delete this[t]}}function jo(t,e){return function(){this[t]=e}}function ti(t,e){return function(){var r=e.apply(this,arguments);r==null?delete this[t]:this[t]=r}}function Tr(t,e){return arguments.length>1?this.each((e==null?Jo:typeof e=="function"?ti:jo)(t,e)):this.node()[t]}function zr(t){return t.trim().split(/^|\s+/)}function Pe(t){return t.classList||new Or(t)}function Or(t){this._node=t,this._names=zr(t.getAttribute("class")||"")}Or.prototype={add:function(t){var e=this._names.indexOf(t);e<0&&(this._names.push(t),this._node.setAttribute("class",this._names.join(" ")))},remove:function(t){var e=this._names.indexOf(t);e>=0&&(this._names.splice(e,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(t){return this._names.indexOf(t)>=0}};function Cr(t,e){for(var r=Pe(t),n=-1,o=e.length;++n<o;)r.add(e[n])}function Rr(t,e){for(var r=Pe(t),n=-1,o=e.length;++n<o;)r.remove(e[n])}function ei(t){return function(){Cr(this,t)}}function ri(t){return function(){Rr(this,t)}}function ni(t,e){return function(){(e.apply(this,arguments)?Cr:Rr)(this,t)}}function Pr(t,e){var r=zr(t+"");if(arguments.length<2){for(var n=Pe(this.node()),o=-1,i=r.length;++o<i;)if(!n.contains(r[o]))return!1;return!0}return this.each((typeof e=="function"?ni:e?ei:ri)(r,e))}function oi(){this.textContent=""}function ii(t){return function(){this.textContent=t}}function ai(t){return function(){var e=t.apply(this,arguments);this.textContent=e??""}}function $r(t){return arguments.length?this.each(t==null?oi:(typeof t=="function"?ai:ii)(t)):this.node().textContent}function si(){this.innerHTML=""}function ui(t){return function(){this.innerHTML=t}}function fi(t){return function(){var e=t.apply(this,arguments);this.innerHTML=e??""}}function Br(t){return arguments.length?this.each(t==null?si:(typeof t=="function"?fi:ui)(t)):this.node().innerHTML}function li(){this.nextSibling&&this.parentNode.appendChild(this)}function Dr(){return this.each(li)}function ci(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function qr(){return this.each(ci)}function Lr(t){var e=typeof t=="function"?t:se(t);return this.select(function(){return this.appendChild(e.apply(this,arguments))})}function hi(){return null}function Yr(t,e){var r=typeof t=="function"?t:se(t),n=e==null?hi:typeof e=="function"?e:vt(e);return this.select(function(){return this.insertBefore(r.apply(this,arguments),n.apply(this,arguments)||null)})}function pi(){var t=this.parentNode;t&&t.removeChild(this)}function Gr(){return this.each(pi)}function mi(){var t=this.cloneNode(!1),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function di(){var t=this.cloneNode(!0),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function Xr(t){return this.select(t?di:mi)}function Fr(t){return arguments.length?this.property("__data__",t):this.node().__data__}function gi(t){return function(e){t.call(this,e,this.__data__)}}function xi(t){return t.trim().split(/^|\s+/).map(function(e){var r="",n=e.indexOf(".");return n>=0&&(r=e.slice(n+1),e=e.slice(0,n)),{type:e,name:r}})}function yi(t){return function(){var e=this.__on;if(e){for(var r=0,n=-1,o=e.length,i;r<o;++r)i=e[r],(!t.type||i.type===t.type)&&i.name===t.name?this.removeEventListener(i.type,i.listener,i.options):e[++n]=i;++n?e.length=n:delete this.__on}}}function vi(t,e,r){return function(){var n=this.__on,o,i=gi(e);if(n){for(var a=0,s=n.length;a<s;++a)if((o=n[a]).type===t.type&&o.name===t.name){this.removeEventListener(o.type,o.listener,o.options),this.addEventListener(o.type,o.listener=i,o.options=r),o.value=e;return}}this.addEventListener(t.type,i,r),o={type:t.type,name:t.name,value:e,listener:i,options:r},n?n.push(o):this.__on=[o]}}function Hr(t,e,r){var n=xi(t+""),o,i=n.length,a;if(arguments.length<2){var s=this.node().__on;if(s){for(var f=0,u=s.length,l;f<u;++f)for(o=0,l=s[f];o<i;++o)if((a=n[o]).type===l.type&&a.name===l.name)return l.value}return}for(s=e?vi:yi,o=0;o<i;++o)this.each(s(n[o],e,r));return this}function Vr(t,e,r){var n=le(t),o=n.CustomEvent;typeof o=="function"?o=new o(e,r):(o=n.document.createEvent("Event"),r?(o.initEvent(e,r.bubbles,r.cancelable),o.detail=r.detail):o.initEvent(e,!1,!1)),t.dispatchEvent(o)}function wi(t,e){return function(){return Vr(this,t,e)}}function _i(t,e){return function(){return Vr(this,t,e.apply(this,arguments))}}function Wr(t,e){return this.each((typeof e=="function"?_i:wi)(t,e))}function*Qr(){for(var t=this._groups,e=0,r=t.length;e<r;++e)for(var n=t[e],o=0,i=n.length,a;o<i;++o)(a=n[o])&&(yield a)}var $e=[null];function F(t,e){this._groups=t,this._parents=e}function Kr(){return new F([[document.documentElement]],$e)}function bi(){return this}F.prototype=Kr.prototype={constructor:F,select:fr,selectAll:lr,selectChild:cr,selectChildren:hr,filter:pr,data:gr,enter:mr,exit:xr,join:yr,merge:vr,selection:bi,order:wr,sort:_r,call:br,nodes:Nr,node:Sr,size:Ar,empty:Mr,each:kr,attr:Ir,style:Er,property:Tr,classed:Pr,text:$r,html:Br,raise:Dr,lower:qr,append:Lr,insert:Yr,remove:Gr,clone:Xr,datum:Fr,on:Hr,dispatch:Wr,[Symbol.iterator]:Qr};var pt=Kr;function J(t){return typeof t=="string"?new F([[document.querySelector(t)]],[document.documentElement]):new F([[t]],$e)}function Ur(t){let e;for(;e=t.sourceEvent;)t=e;return t}function nt(t,e){if(t=Ur(t),e===void 0&&(e=t.currentTarget),e){var r=e.ownerSVGElement||e;if(r.createSVGPoint){var n=r.createSVGPoint();return n.x=t.clientX,n.y=t.clientY,n=n.matrixTransform(e.getScreenCTM().inverse()),[n.x,n.y]}if(e.getBoundingClientRect){var o=e.getBoundingClientRect();return[t.clientX-o.left-e.clientLeft,t.clientY-o.top-e.clientTop]}}return[t.pageX,t.pageY]}var Zr={passive:!1},wt={capture:!0,passive:!1};function ce(t){t.stopImmediatePropagation()}function gt(t){t.preventDefault(),t.stopImmediatePropagation()}function Bt(t){var e=t.document.documentElement,r=J(t).on("dragstart.drag",gt,wt);"onselectstart"in e?r.on("selectstart.drag",gt,wt):(e.__noselect=e.style.MozUserSelect,e.style.MozUserSelect="none")}function Dt(t,e){var r=t.document.documentElement,n=J(t).on("dragstart.drag",null);e&&(n.on("click.drag",gt,wt),setTimeout(function(){n.on("click.drag",null)},0)),"onselectstart"in r?n.on("selectstart.drag",null):(r.style.MozUserSelect=r.__noselect,delete r.__noselect)}var qt=t=>()=>t;function Lt(t,{sourceEvent:e,subject:r,target:n,identifier:o,active:i,x:a,y:s,dx:f,dy:u,dispatch:l}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},subject:{value:r,enumerable:!0,configurable:!0},target:{value:n,enumerable:!0,configurable:!0},identifier:{value:o,enumerable:!0,configurable:!0},active:{value:i,enumerable:!0,configurable:!0},x:{value:a,enumerable:!0,configurable:!0},y:{value:s,enumerable:!0,configurable:!0},dx:{value:f,enumerable:!0,configurable:!0},dy:{value:u,enumerable:!0,configurable:!0},_:{value:l}})}Lt.prototype.on=function(){var t=this._.on.apply(this._,arguments);return t===this._?this:t};function Ni(t){return!t.ctrlKey&&!t.button}function Si(){return this.parentNode}function Ai(t,e){return e??{x:t.x,y:t.y}}function Mi(){return navigator.maxTouchPoints||"ontouchstart"in this}function Be(){var t=Ni,e=Si,r=Ai,n=Mi,o={},i=ct("start","drag","end"),a=0,s,f,u,l,y=0;function h(c){c.on("mousedown.drag",m).filter(n).on("touchstart.drag",x).on("touchmove.drag",d,Zr).on("touchend.drag touchcancel.drag",w).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function m(c,S){if(!(l||!t.call(this,c,S))){var I=N(this,e.call(this,c,S),c,S,"mouse");I&&(J(c.view).on("mousemove.drag",_,wt).on("mouseup.drag",g,wt),Bt(c.view),ce(c),u=!1,s=c.clientX,f=c.clientY,I("start",c))}}function _(c){if(gt(c),!u){var S=c.clientX-s,I=c.clientY-f;u=S*S+I*I>y}o.mouse("drag",c)}function g(c){J(c.view).on("mousemove.drag mouseup.drag",null),Dt(c.view,u),gt(c),o.mouse("end",c)}function x(c,S){if(t.call(this,c,S)){var I=c.changedTouches,z=e.call(this,c,S),R=I.length,q,P;for(q=0;q<R;++q)(P=N(this,z,c,S,I[q].identifier,I[q]))&&(ce(c),P("start",c,I[q]))}}function d(c){var S=c.changedTouches,I=S.length,z,R;for(z=0;z<I;++z)(R=o[S[z].identifier])&&(gt(c),R("drag",c,S[z]))}function w(c){var S=c.changedTouches,I=S.length,z,R;for(l&&clearTimeout(l),l=setTimeout(function(){l=null},500),z=0;z<I;++z)(R=o[S[z].identifier])&&(ce(c),R("end",c,S[z]))}function N(c,S,I,z,R,q){var P=i.copy(),Y=nt(q||I,S),Q,K,p;if((p=r.call(c,new Lt("beforestart",{sourceEvent:I,target:h,identifier:R,active:a,x:Y[0],y:Y[1],dx:0,dy:0,dispatch:P}),z))!=null)return Q=p.x-Y[0]||0,K=p.y-Y[1]||0,function A(v,k,E){var O=Y,C;switch(v){case"start":o[R]=A,C=a++;break;case"end":delete o[R],--a;case"drag":Y=nt(E||k,S),C=a;break}P.call(v,c,new Lt(v,{sourceEvent:k,subject:p,target:h,identifier:R,active:C,x:Y[0]+Q,y:Y[1]+K,dx:Y[0]-O[0],dy:Y[1]-O[1],dispatch:P}),z)}}return h.filter=function(c){return arguments.length?(t=typeof c=="function"?c:qt(!!c),h):t},h.container=function(c){return arguments.length?(e=typeof c=="function"?c:qt(c),h):e},h.subject=function(c){return arguments.length?(r=typeof c=="function"?c:qt(c),h):r},h.touchable=function(c){return arguments.length?(n=typeof c=="function"?c:qt(!!c),h):n},h.on=function(){var c=i.on.apply(i,arguments);return c===i?h:c},h.clickDistance=function(c){return arguments.length?(y=(c=+c)*c,h):Math.sqrt(y)},h}function he(t,e){var r,n=1;t==null&&(t=0),e==null&&(e=0);function o(){var i,a=r.length,s,f=0,u=0;for(i=0;i<a;++i)s=r[i],f+=s.x,u+=s.y;for(f=(f/a-t)*n,u=(u/a-e)*n,i=0;i<a;++i)s=r[i],s.x-=f,s.y-=u}return o.initialize=function(i){r=i},o.x=function(i){return arguments.length?(t=+i,o):t},o.y=function(i){return arguments.length?(e=+i,o):e},o.strength=function(i){return arguments.length?(n=+i,o):n},o}function Jr(t){let e=+this._x.call(null,t),r=+this._y.call(null,t);return jr(this.cover(e,r),e,r,t)}function jr(t,e,r,n){if(isNaN(e)||isNaN(r))return t;var o,i=t._root,a={data:n},s=t._x0,f=t._y0,u=t._x1,l=t._y1,y,h,m,_,g,x,d,w;if(!i)return t._root=a,t;for(;i.length;)if((g=e>=(y=(s+u)/2))?s=y:u=y,(x=r>=(h=(f+l)/2))?f=h:l=h,o=i,!(i=i[d=x<<1|g]))return o[d]=a,t;if(m=+t._x.call(null,i.data),_=+t._y.call(null,i.data),e===m&&r===_)return a.next=i,o?o[d]=a:t._root=a,t;do o=o?o[d]=new Array(4):t._root=new Array(4),(g=e>=(y=(s+u)/2))?s=y:u=y,(x=r>=(h=(f+l)/2))?f=h:l=h;while((d=x<<1|g)===(w=(_>=h)<<1|m>=y));return o[w]=i,o[d]=a,t}function tn(t){var e,r,n=t.length,o,i,a=new Array(n),s=new Array(n),f=1/0,u=1/0,l=-1/0,y=-1/0;for(r=0;r<n;++r)isNaN(o=+this._x.call(null,e=t[r]))||isNaN(i=+this._y.call(null,e))||(a[r]=o,s[r]=i,o<f&&(f=o),o>l&&(l=o),i<u&&(u=i),i>y&&(y=i));if(f>l||u>y)return this;for(this.cover(f,u).cover(l,y),r=0;r<n;++r)jr(this,a[r],s[r],t[r]);return this}function en(t,e){if(isNaN(t=+t)||isNaN(e=+e))return this;var r=this._x0,n=this._y0,o=this._x1,i=this._y1;if(isNaN(r))o=(r=Math.floor(t))+1,i=(n=Math.floor(e))+1;else{for(var a=o-r||1,s=this._root,f,u;r>t||t>=o||n>e||e>=i;)switch(u=(e<n)<<1|t<r,f=new Array(4),f[u]=s,s=f,a*=2,u){case 0:o=r+a,i=n+a;break;case 1:r=o-a,i=n+a;break;case 2:o=r+a,n=i-a;break;case 3:r=o-a,n=i-a;break}this._root&&this._root.length&&(this._root=s)}return this._x0=r,this._y0=n,this._x1=o,this._y1=i,this}function rn(){var t=[];return this.visit(function(e){if(!e.length)do t.push(e.data);while(e=e.next)}),t}function nn(t){return arguments.length?this.cover(+t[0][0],+t[0][1]).cover(+t[1][0],+t[1][1]):isNaN(this._x0)?void 0:[[this._x0,this._y0],[this._x1,this._y1]]}function W(t,e,r,n,o){this.node=t,this.x0=e,this.y0=r,this.x1=n,this.y1=o}function on(t,e,r){var n,o=this._x0,i=this._y0,a,s,f,u,l=this._x1,y=this._y1,h=[],m=this._root,_,g;for(m&&h.push(new W(m,o,i,l,y)),r==null?r=1/0:(o=t-r,i=e-r,l=t+r,y=e+r,r*=r);_=h.pop();)if(!(!(m=_.node)||(a=_.x0)>l||(s=_.y0)>y||(f=_.x1)<o||(u=_.y1)<i))if(m.length){var x=(a+f)/2,d=(s+u)/2;h.push(new W(m[3],x,d,f,u),new W(m[2],a,d,x,u),new W(m[1],x,s,f,d),new W(m[0],a,s,x,d)),(g=(e>=d)<<1|t>=x)&&(_=h[h.length-1],h[h.length-1]=h[h.length-1-g],h[h.length-1-g]=_)}else{var w=t-+this._x.call(null,m.data),N=e-+this._y.call(null,m.data),c=w*w+N*N;if(c<r){var S=Math.sqrt(r=c);o=t-S,i=e-S,l=t+S,y=e+S,n=m.data}}return n}function an(t){if(isNaN(l=+this._x.call(null,t))||isNaN(y=+this._y.call(null,t)))return this;var e,r=this._root,n,o,i,a=this._x0,s=this._y0,f=this._x1,u=this._y1,l,y,h,m,_,g,x,d;if(!r)return this;if(r.length)for(;;){if((_=l>=(h=(a+f)/2))?a=h:f=h,(g=y>=(m=(s+u)/2))?s=m:u=m,e=r,!(r=r[x=g<<1|_]))return this;if(!r.length)break;(e[x+1&3]||e[x+2&3]||e[x+3&3])&&(n=e,d=x)}for(;r.data!==t;)if(o=r,!(r=r.next))return this;return(i=r.next)&&delete r.next,o?(i?o.next=i:delete o.next,this):e?(i?e[x]=i:delete e[x],(r=e[0]||e[1]||e[2]||e[3])&&r===(e[3]||e[2]||e[1]||e[0])&&!r.length&&(n?n[d]=r:this._root=r),this):(this._root=i,this)}function sn(t){for(var e=0,r=t.length;e<r;++e)this.remove(t[e]);return this}function un(){return this._root}function fn(){var t=0;return this.visit(function(e){if(!e.length)do++t;while(e=e.next)}),t}function ln(t){var e=[],r,n=this._root,o,i,a,s,f;for(n&&e.push(new W(n,this._x0,this._y0,this._x1,this._y1));r=e.pop();)if(!t(n=r.node,i=r.x0,a=r.y0,s=r.x1,f=r.y1)&&n.length){var u=(i+s)/2,l=(a+f)/2;(o=n[3])&&e.push(new W(o,u,l,s,f)),(o=n[2])&&e.push(new W(o,i,l,u,f)),(o=n[1])&&e.push(new W(o,u,a,s,l)),(o=n[0])&&e.push(new W(o,i,a,u,l))}return this}function cn(t){var e=[],r=[],n;for(this._root&&e.push(new W(this._root,this._x0,this._y0,this._x1,this._y1));n=e.pop();){var o=n.node;if(o.length){var i,a=n.x0,s=n.y0,f=n.x1,u=n.y1,l=(a+f)/2,y=(s+u)/2;(i=o[0])&&e.push(new W(i,a,s,l,y)),(i=o[1])&&e.push(new W(i,l,s,f,y)),(i=o[2])&&e.push(new W(i,a,y,l,u)),(i=o[3])&&e.push(new W(i,l,y,f,u))}r.push(n)}for(;n=r.pop();)t(n.node,n.x0,n.y0,n.x1,n.y1);return this}function hn(t){return t[0]}function pn(t){return arguments.length?(this._x=t,this):this._x}function mn(t){return t[1]}function dn(t){return arguments.length?(this._y=t,this):this._y}function _t(t,e,r){var n=new De(e??hn,r??mn,NaN,NaN,NaN,NaN);return t==null?n:n.addAll(t)}function De(t,e,r,n,o,i){this._x=t,this._y=e,this._x0=r,this._y0=n,this._x1=o,this._y1=i,this._root=void 0}function gn(t){for(var e={data:t.data},r=e;t=t.next;)r=r.next={data:t.data};return e}var j=_t.prototype=De.prototype;j.copy=function(){var t=new De(this._x,this._y,this._x0,this._y0,this._x1,this._y1),e=this._root,r,n;if(!e)return t;if(!e.length)return t._root=gn(e),t;for(r=[{source:e,target:t._root=new Array(4)}];e=r.pop();)for(var o=0;o<4;++o)(n=e.source[o])&&(n.length?r.push({source:n,target:e.target[o]=new Array(4)}):e.target[o]=gn(n));return t};j.add=Jr;j.addAll=tn;j.cover=en;j.data=rn;j.extent=nn;j.find=on;j.remove=an;j.removeAll=sn;j.root=un;j.size=fn;j.visit=ln;j.visitAfter=cn;j.x=pn;j.y=dn;function ft(t){return function(){return t}}function it(t){return(t()-.5)*1e-6}function ki(t){return t.x+t.vx}function Ii(t){return t.y+t.vy}function qe(t){var e,r,n,o=1,i=1;typeof t!="function"&&(t=ft(t==null?1:+t));function a(){for(var u,l=e.length,y,h,m,_,g,x,d=0;d<i;++d)for(y=_t(e,ki,Ii).visitAfter(s),u=0;u<l;++u)h=e[u],g=r[h.index],x=g*g,m=h.x+h.vx,_=h.y+h.vy,y.visit(w);function w(N,c,S,I,z){var R=N.data,q=N.r,P=g+q;if(R){if(R.index>h.index){var Y=m-R.x-R.vx,Q=_-R.y-R.vy,K=Y*Y+Q*Q;K<P*P&&(Y===0&&(Y=it(n),K+=Y*Y),Q===0&&(Q=it(n),K+=Q*Q),K=(P-(K=Math.sqrt(K)))/K*o,h.vx+=(Y*=K)*(P=(q*=q)/(x+q)),h.vy+=(Q*=K)*P,R.vx-=Y*(P=1-P),R.vy-=Q*P)}return}return c>m+P||I<m-P||S>_+P||z<_-P}}function s(u){if(u.data)return u.r=r[u.data.index];for(var l=u.r=0;l<4;++l)u[l]&&u[l].r>u.r&&(u.r=u[l].r)}function f(){if(e){var u,l=e.length,y;for(r=new Array(l),u=0;u<l;++u)y=e[u],r[y.index]=+t(y,u,e)}}return a.initialize=function(u,l){e=u,n=l,f()},a.iterations=function(u){return arguments.length?(i=+u,a):i},a.strength=function(u){return arguments.length?(o=+u,a):o},a.radius=function(u){return arguments.length?(t=typeof u=="function"?u:ft(+u),f(),a):t},a}function Ei(t){return t.index}function xn(t,e){var r=t.get(e);if(!r)throw new Error("node not found: "+e);return r}function Le(t){var e=Ei,r=y,n,o=ft(30),i,a,s,f,u,l=1;t==null&&(t=[]);function y(x){return 1/Math.min(s[x.source.index],s[x.target.index])}function h(x){for(var d=0,w=t.length;d<l;++d)for(var N=0,c,S,I,z,R,q,P;N<w;++N)c=t[N],S=c.source,I=c.target,z=I.x+I.vx-S.x-S.vx||it(u),R=I.y+I.vy-S.y-S.vy||it(u),q=Math.sqrt(z*z+R*R),q=(q-i[N])/q*x*n[N],z*=q,R*=q,I.vx-=z*(P=f[N]),I.vy-=R*P,S.vx+=z*(P=1-P),S.vy+=R*P}function m(){if(a){var x,d=a.length,w=t.length,N=new Map(a.map((S,I)=>[e(S,I,a),S])),c;for(x=0,s=new Array(d);x<w;++x)c=t[x],c.index=x,typeof c.source!="object"&&(c.source=xn(N,c.source)),typeof c.target!="object"&&(c.target=xn(N,c.target)),s[c.source.index]=(s[c.source.index]||0)+1,s[c.target.index]=(s[c.target.index]||0)+1;for(x=0,f=new Array(w);x<w;++x)c=t[x],f[x]=s[c.source.index]/(s[c.source.index]+s[c.target.index]);n=new Array(w),_(),i=new Array(w),g()}}function _(){if(a)for(var x=0,d=t.length;x<d;++x)n[x]=+r(t[x],x,t)}function g(){if(a)for(var x=0,d=t.length;x<d;++x)i[x]=+o(t[x],x,t)}return h.initialize=function(x,d){a=x,u=d,m()},h.links=function(x){return arguments.length?(t=x,m(),h):t},h.id=function(x){return arguments.length?(e=x,h):e},h.iterations=function(x){return arguments.length?(l=+x,h):l},h.strength=function(x){return arguments.length?(r=typeof x=="function"?x:ft(+x),_(),h):r},h.distance=function(x){return arguments.length?(o=typeof x=="function"?x:ft(+x),g(),h):o},h}var Mt=0,Gt=0,Yt=0,vn=1e3,pe,Xt,me=0,bt=0,de=0,Ft=typeof performance=="object"&&performance.now?performance:Date,wn=typeof window=="object"&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(t){setTimeout(t,17)};function Vt(){return bt||(wn(Ti),bt=Ft.now()+de)}function Ti(){bt=0}function Ht(){this._call=this._time=this._next=null}Ht.prototype=kt.prototype={constructor:Ht,restart:function(t,e,r){if(typeof t!="function")throw new TypeError("callback is not a function");r=(r==null?Vt():+r)+(e==null?0:+e),!this._next&&Xt!==this&&(Xt?Xt._next=this:pe=this,Xt=this),this._call=t,this._time=r,Ye()},stop:function(){this._call&&(this._call=null,this._time=1/0,Ye())}};function kt(t,e,r){var n=new Ht;return n.restart(t,e,r),n}function _n(){Vt(),++Mt;for(var t=pe,e;t;)(e=bt-t._time)>=0&&t._call.call(void 0,e),t=t._next;--Mt}function yn(){bt=(me=Ft.now())+de,Mt=Gt=0;try{_n()}finally{Mt=0,Oi(),bt=0}}function zi(){var t=Ft.now(),e=t-me;e>vn&&(de-=e,me=t)}function Oi(){for(var t,e=pe,r,n=1/0;e;)e._call?(n>e._time&&(n=e._time),t=e,e=e._next):(r=e._next,e._next=null,e=t?t._next=r:pe=r);Xt=t,Ye(n)}function Ye(t){if(!Mt){Gt&&(Gt=clearTimeout(Gt));var e=t-bt;e>24?(t<1/0&&(Gt=setTimeout(yn,t-Ft.now()-de)),Yt&&(Yt=clearInterval(Yt))):(Yt||(me=Ft.now(),Yt=setInterval(zi,vn)),Mt=1,wn(yn))}}function ge(t,e,r){var n=new Ht;return e=e==null?0:+e,n.restart(o=>{n.stop(),t(o+e)},e,r),n}function bn(){let t=1;return()=>(t=(1664525*t+1013904223)%4294967296)/4294967296}function Nn(t){return t.x}function Sn(t){return t.y}var Ci=10,Ri=Math.PI*(3-Math.sqrt(5));function Ge(t){var e,r=1,n=.001,o=1-Math.pow(n,1/300),i=0,a=.6,s=new Map,f=kt(y),u=ct("tick","end"),l=bn();t==null&&(t=[]);function y(){h(),u.call("tick",e),r<n&&(f.stop(),u.call("end",e))}function h(g){var x,d=t.length,w;g===void 0&&(g=1);for(var N=0;N<g;++N)for(r+=(i-r)*o,s.forEach(function(c){c(r)}),x=0;x<d;++x)w=t[x],w.fx==null?w.x+=w.vx*=a:(w.x=w.fx,w.vx=0),w.fy==null?w.y+=w.vy*=a:(w.y=w.fy,w.vy=0);return e}function m(){for(var g=0,x=t.length,d;g<x;++g){if(d=t[g],d.index=g,d.fx!=null&&(d.x=d.fx),d.fy!=null&&(d.y=d.fy),isNaN(d.x)||isNaN(d.y)){var w=Ci*Math.sqrt(.5+g),N=g*Ri;d.x=w*Math.cos(N),d.y=w*Math.sin(N)}(isNaN(d.vx)||isNaN(d.vy))&&(d.vx=d.vy=0)}}function _(g){return g.initialize&&g.initialize(t,l),g}return m(),e={tick:h,restart:function(){return f.restart(y),e},stop:function(){return f.stop(),e},nodes:function(g){return arguments.length?(t=g,m(),s.forEach(_),e):t},alpha:function(g){return arguments.length?(r=+g,e):r},alphaMin:function(g){return arguments.length?(n=+g,e):n},alphaDecay:function(g){return arguments.length?(o=+g,e):+o},alphaTarget:function(g){return arguments.length?(i=+g,e):i},velocityDecay:function(g){return arguments.length?(a=1-g,e):1-a},randomSource:function(g){return arguments.length?(l=g,s.forEach(_),e):l},force:function(g,x){return arguments.length>1?(x==null?s.delete(g):s.set(g,_(x)),e):s.get(g)},find:function(g,x,d){var w=0,N=t.length,c,S,I,z,R;for(d==null?d=1/0:d*=d,w=0;w<N;++w)z=t[w],c=g-z.x,S=x-z.y,I=c*c+S*S,I<d&&(R=z,d=I);return R},on:function(g,x){return arguments.length>1?(u.on(g,x),e):u.on(g)}}}function Xe(){var t,e,r,n,o=ft(-30),i,a=1,s=1/0,f=.81;function u(m){var _,g=t.length,x=_t(t,Nn,Sn).visitAfter(y);for(n=m,_=0;_<g;++_)e=t[_],x.visit(h)}function l(){if(t){var m,_=t.length,g;for(i=new Array(_),m=0;m<_;++m)g=t[m],i[g.index]=+o(g,m,t)}}function y(m){var _=0,g,x,d=0,w,N,c;if(m.length){for(w=N=c=0;c<4;++c)(g=m[c])&&(x=Math.abs(g.value))&&(_+=g.value,d+=x,w+=x*g.x,N+=x*g.y);m.x=w/d,m.y=N/d}else{g=m,g.x=g.data.x,g.y=g.data.y;do _+=i[g.data.index];while(g=g.next)}m.value=_}function h(m,_,g,x){if(!m.value)return!0;var d=m.x-e.x,w=m.y-e.y,N=x-_,c=d*d+w*w;if(N*N/f<c)return c<s&&(d===0&&(d=it(r),c+=d*d),w===0&&(w=it(r),c+=w*w),c<a&&(c=Math.sqrt(a*c)),e.vx+=d*m.value*n/c,e.vy+=w*m.value*n/c),!0;if(m.length||c>=s)return;(m.data!==e||m.next)&&(d===0&&(d=it(r),c+=d*d),w===0&&(w=it(r),c+=w*w),c<a&&(c=Math.sqrt(a*c)));do m.data!==e&&(N=i[m.data.index]*n/c,e.vx+=d*N,e.vy+=w*N);while(m=m.next)}return u.initialize=function(m,_){t=m,r=_,l()},u.strength=function(m){return arguments.length?(o=typeof m=="function"?m:ft(+m),l(),u):o},u.distanceMin=function(m){return arguments.length?(a=m*m,u):Math.sqrt(a)},u.distanceMax=function(m){return arguments.length?(s=m*m,u):Math.sqrt(s)},u.theta=function(m){return arguments.length?(f=m*m,u):Math.sqrt(f)},u}var It=class extends Map{constructor(e,r=Bi){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:r}}),e!=null)for(let[n,o]of e)this.set(n,o)}get(e){return super.get(An(this,e))}has(e){return super.has(An(this,e))}set(e,r){return super.set(Pi(this,e),r)}delete(e){return super.delete($i(this,e))}};function An({_intern:t,_key:e},r){let n=e(r);return t.has(n)?t.get(n):r}function Pi({_intern:t,_key:e},r){let n=e(r);return t.has(n)?t.get(n):(t.set(n,r),r)}function $i({_intern:t,_key:e},r){let n=e(r);return t.has(n)&&(r=t.get(n),t.delete(n)),r}function Bi(t){return t!==null&&typeof t=="object"?t.valueOf():t}function Mn(t,e){switch(arguments.length){case 0:break;case 1:this.range(t);break;default:this.range(e).domain(t);break}return this}var Fe=Symbol("implicit");function Wt(){var t=new It,e=[],r=[],n=Fe;function o(i){let a=t.get(i);if(a===void 0){if(n!==Fe)return n;t.set(i,a=e.push(i)-1)}return r[a%r.length]}return o.domain=function(i){if(!arguments.length)return e.slice();e=[],t=new It;for(let a of i)t.has(a)||t.set(a,e.push(a)-1);return o},o.range=function(i){return arguments.length?(r=Array.from(i),o):r.slice()},o.unknown=function(i){return arguments.length?(n=i,o):n},o.copy=function(){return Wt(e,r).unknown(n)},Mn.apply(o,arguments),o}function xe(t,e,r){t.prototype=e.prototype=r,r.constructor=t}function He(t,e){var r=Object.create(t.prototype);for(var n in e)r[n]=e[n];return r}function Ut(){}var Qt=.7,we=1/Qt,Et="\\s*([+-]?\\d+)\\s*",Kt="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",lt="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",Di=/^#([0-9a-f]{3,8})$/,qi=new RegExp(`^rgb\\(${Et},${Et},${Et}\\)$`),Li=new RegExp(`^rgb\\(${lt},${lt},${lt}\\)$`),Yi=new RegExp(`^rgba\\(${Et},${Et},${Et},${Kt}\\)$`),Gi=new RegExp(`^rgba\\(${lt},${lt},${lt},${Kt}\\)$`),Xi=new RegExp(`^hsl\\(${Kt},${lt},${lt}\\)$`),Fi=new RegExp(`^hsla\\(${Kt},${lt},${lt},${Kt}\\)$`),kn={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};xe(Ut,xt,{copy(t){return Object.assign(new this.constructor,this,t)},displayable(){return this.rgb().displayable()},hex:In,formatHex:In,formatHex8:Hi,formatHsl:Vi,formatRgb:En,toString:En});function In(){return this.rgb().formatHex()}function Hi(){return this.rgb().formatHex8()}function Vi(){return Pn(this).formatHsl()}function En(){return this.rgb().formatRgb()}function xt(t){var e,r;return t=(t+"").trim().toLowerCase(),(e=Di.exec(t))?(r=e[1].length,e=parseInt(e[1],16),r===6?Tn(e):r===3?new et(e>>8&15|e>>4&240,e>>4&15|e&240,(e&15)<<4|e&15,1):r===8?ye(e>>24&255,e>>16&255,e>>8&255,(e&255)/255):r===4?ye(e>>12&15|e>>8&240,e>>8&15|e>>4&240,e>>4&15|e&240,((e&15)<<4|e&15)/255):null):(e=qi.exec(t))?new et(e[1],e[2],e[3],1):(e=Li.exec(t))?new et(e[1]*255/100,e[2]*255/100,e[3]*255/100,1):(e=Yi.exec(t))?ye(e[1],e[2],e[3],e[4]):(e=Gi.exec(t))?ye(e[1]*255/100,e[2]*255/100,e[3]*255/100,e[4]):(e=Xi.exec(t))?Cn(e[1],e[2]/100,e[3]/100,1):(e=Fi.exec(t))?Cn(e[1],e[2]/100,e[3]/100,e[4]):kn.hasOwnProperty(t)?Tn(kn[t]):t==="transparent"?new et(NaN,NaN,NaN,0):null}function Tn(t){return new et(t>>16&255,t>>8&255,t&255,1)}function ye(t,e,r,n){return n<=0&&(t=e=r=NaN),new et(t,e,r,n)}function Wi(t){return t instanceof Ut||(t=xt(t)),t?(t=t.rgb(),new et(t.r,t.g,t.b,t.opacity)):new et}function Tt(t,e,r,n){return arguments.length===1?Wi(t):new et(t,e,r,n??1)}function et(t,e,r,n){this.r=+t,this.g=+e,this.b=+r,this.opacity=+n}xe(et,Tt,He(Ut,{brighter(t){return t=t==null?we:Math.pow(we,t),new et(this.r*t,this.g*t,this.b*t,this.opacity)},darker(t){return t=t==null?Qt:Math.pow(Qt,t),new et(this.r*t,this.g*t,this.b*t,this.opacity)},rgb(){return this},clamp(){return new et(St(this.r),St(this.g),St(this.b),_e(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:zn,formatHex:zn,formatHex8:Qi,formatRgb:On,toString:On}));function zn(){return`#${Nt(this.r)}${Nt(this.g)}${Nt(this.b)}`}function Qi(){return`#${Nt(this.r)}${Nt(this.g)}${Nt(this.b)}${Nt((isNaN(this.opacity)?1:this.opacity)*255)}`}function On(){let t=_e(this.opacity);return`${t===1?"rgb(":"rgba("}${St(this.r)}, ${St(this.g)}, ${St(this.b)}${t===1?")":`, ${t})`}`}function _e(t){return isNaN(t)?1:Math.max(0,Math.min(1,t))}function St(t){return Math.max(0,Math.min(255,Math.round(t)||0))}function Nt(t){return t=St(t),(t<16?"0":"")+t.toString(16)}function Cn(t,e,r,n){return n<=0?t=e=r=NaN:r<=0||r>=1?t=e=NaN:e<=0&&(t=NaN),new at(t,e,r,n)}function Pn(t){if(t instanceof at)return new at(t.h,t.s,t.l,t.opacity);if(t instanceof Ut||(t=xt(t)),!t)return new at;if(t instanceof at)return t;t=t.rgb();var e=t.r/255,r=t.g/255,n=t.b/255,o=Math.min(e,r,n),i=Math.max(e,r,n),a=NaN,s=i-o,f=(i+o)/2;return s?(e===i?a=(r-n)/s+(r<n)*6:r===i?a=(n-e)/s+2:a=(e-r)/s+4,s/=f<.5?i+o:2-i-o,a*=60):s=f>0&&f<1?0:a,new at(a,s,f,t.opacity)}function $n(t,e,r,n){return arguments.length===1?Pn(t):new at(t,e,r,n??1)}function at(t,e,r,n){this.h=+t,this.s=+e,this.l=+r,this.opacity=+n}xe(at,$n,He(Ut,{brighter(t){return t=t==null?we:Math.pow(we,t),new at(this.h,this.s,this.l*t,this.opacity)},darker(t){return t=t==null?Qt:Math.pow(Qt,t),new at(this.h,this.s,this.l*t,this.opacity)},rgb(){var t=this.h%360+(this.h<0)*360,e=isNaN(t)||isNaN(this.s)?0:this.s,r=this.l,n=r+(r<.5?r:1-r)*e,o=2*r-n;return new et(Ve(t>=240?t-240:t+120,o,n),Ve(t,o,n),Ve(t<120?t+240:t-120,o,n),this.opacity)},clamp(){return new at(Rn(this.h),ve(this.s),ve(this.l),_e(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){let t=_e(this.opacity);return`${t===1?"hsl(":"hsla("}${Rn(this.h)}, ${ve(this.s)*100}%, ${ve(this.l)*100}%${t===1?")":`, ${t})`}`}}));function Rn(t){return t=(t||0)%360,t<0?t+360:t}function ve(t){return Math.max(0,Math.min(1,t||0))}function Ve(t,e,r){return(t<60?e+(r-e)*t/60:t<180?r:t<240?e+(r-e)*(240-t)/60:e)*255}function We(t,e,r,n,o){var i=t*t,a=i*t;return((1-3*t+3*i-a)*e+(4-6*i+3*a)*r+(1+3*t+3*i-3*a)*n+a*o)/6}function Bn(t){var e=t.length-1;return function(r){var n=r<=0?r=0:r>=1?(r=1,e-1):Math.floor(r*e),o=t[n],i=t[n+1],a=n>0?t[n-1]:2*o-i,s=n<e-1?t[n+2]:2*i-o;return We((r-n/e)*e,a,o,i,s)}}function Dn(t){var e=t.length;return function(r){var n=Math.floor(((r%=1)<0?++r:r)*e),o=t[(n+e-1)%e],i=t[n%e],a=t[(n+1)%e],s=t[(n+2)%e];return We((r-n/e)*e,o,i,a,s)}}var Qe=t=>()=>t;function Ki(t,e){return function(r){return t+r*e}}function Ui(t,e,r){return t=Math.pow(t,r),e=Math.pow(e,r)-t,r=1/r,function(n){return Math.pow(t+n*e,r)}}function qn(t){return(t=+t)==1?be:function(e,r){return r-e?Ui(e,r,t):Qe(isNaN(e)?r:e)}}function be(t,e){var r=e-t;return r?Ki(t,r):Qe(isNaN(t)?e:t)}var Ne=function t(e){var r=qn(e);function n(o,i){var a=r((o=Tt(o)).r,(i=Tt(i)).r),s=r(o.g,i.g),f=r(o.b,i.b),u=be(o.opacity,i.opacity);return function(l){return o.r=a(l),o.g=s(l),o.b=f(l),o.opacity=u(l),o+""}}return n.gamma=t,n}(1);function Ln(t){return function(e){var r=e.length,n=new Array(r),o=new Array(r),i=new Array(r),a,s;for(a=0;a<r;++a)s=Tt(e[a]),n[a]=s.r||0,o[a]=s.g||0,i[a]=s.b||0;return n=t(n),o=t(o),i=t(i),s.opacity=1,function(f){return s.r=n(f),s.g=o(f),s.b=i(f),s+""}}}var Zi=Ln(Bn),Ji=Ln(Dn);function ot(t,e){return t=+t,e=+e,function(r){return t*(1-r)+e*r}}var Ue=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Ke=new RegExp(Ue.source,"g");function ji(t){return function(){return t}}function ta(t){return function(e){return t(e)+""}}function Ze(t,e){var r=Ue.lastIndex=Ke.lastIndex=0,n,o,i,a=-1,s=[],f=[];for(t=t+"",e=e+"";(n=Ue.exec(t))&&(o=Ke.exec(e));)(i=o.index)>r&&(i=e.slice(r,i),s[a]?s[a]+=i:s[++a]=i),(n=n[0])===(o=o[0])?s[a]?s[a]+=o:s[++a]=o:(s[++a]=null,f.push({i:a,x:ot(n,o)})),r=Ke.lastIndex;return r<e.length&&(i=e.slice(r),s[a]?s[a]+=i:s[++a]=i),s.length<2?f[0]?ta(f[0].x):ji(e):(e=f.length,function(u){for(var l=0,y;l<e;++l)s[(y=f[l]).i]=y.x(u);return s.join("")})}var Yn=180/Math.PI,Se={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function Je(t,e,r,n,o,i){var a,s,f;return(a=Math.sqrt(t*t+e*e))&&(t/=a,e/=a),(f=t*r+e*n)&&(r-=t*f,n-=e*f),(s=Math.sqrt(r*r+n*n))&&(r/=s,n/=s,f/=s),t*n<e*r&&(t=-t,e=-e,f=-f,a=-a),{translateX:o,translateY:i,rotate:Math.atan2(e,t)*Yn,skewX:Math.atan(f)*Yn,scaleX:a,scaleY:s}}var Ae;function Gn(t){let e=new(typeof DOMMatrix=="function"?DOMMatrix:WebKitCSSMatrix)(t+"");return e.isIdentity?Se:Je(e.a,e.b,e.c,e.d,e.e,e.f)}function Xn(t){return t==null?Se:(Ae||(Ae=document.createElementNS("http://www.w3.org/2000/svg","g")),Ae.setAttribute("transform",t),(t=Ae.transform.baseVal.consolidate())?(t=t.matrix,Je(t.a,t.b,t.c,t.d,t.e,t.f)):Se)}function Fn(t,e,r,n){function o(u){return u.length?u.pop()+" ":""}function i(u,l,y,h,m,_){if(u!==y||l!==h){var g=m.push("translate(",null,e,null,r);_.push({i:g-4,x:ot(u,y)},{i:g-2,x:ot(l,h)})}else(y||h)&&m.push("translate("+y+e+h+r)}function a(u,l,y,h){u!==l?(u-l>180?l+=360:l-u>180&&(u+=360),h.push({i:y.push(o(y)+"rotate(",null,n)-2,x:ot(u,l)})):l&&y.push(o(y)+"rotate("+l+n)}function s(u,l,y,h){u!==l?h.push({i:y.push(o(y)+"skewX(",null,n)-2,x:ot(u,l)}):l&&y.push(o(y)+"skewX("+l+n)}function f(u,l,y,h,m,_){if(u!==y||l!==h){var g=m.push(o(m)+"scale(",null,",",null,")");_.push({i:g-4,x:ot(u,y)},{i:g-2,x:ot(l,h)})}else(y!==1||h!==1)&&m.push(o(m)+"scale("+y+","+h+")")}return function(u,l){var y=[],h=[];return u=t(u),l=t(l),i(u.translateX,u.translateY,l.translateX,l.translateY,y,h),a(u.rotate,l.rotate,y,h),s(u.skewX,l.skewX,y,h),f(u.scaleX,u.scaleY,l.scaleX,l.scaleY,y,h),u=l=null,function(m){for(var _=-1,g=h.length,x;++_<g;)y[(x=h[_]).i]=x.x(m);return y.join("")}}}var je=Fn(Gn,"px, ","px)","deg)"),tr=Fn(Xn,", ",")",")");var ea=1e-12;function Hn(t){return((t=Math.exp(t))+1/t)/2}function ra(t){return((t=Math.exp(t))-1/t)/2}function na(t){return((t=Math.exp(2*t))-1)/(t+1)}var er=function t(e,r,n){function o(i,a){var s=i[0],f=i[1],u=i[2],l=a[0],y=a[1],h=a[2],m=l-s,_=y-f,g=m*m+_*_,x,d;if(g<ea)d=Math.log(h/u)/e,x=function(z){return[s+z*m,f+z*_,u*Math.exp(e*z*d)]};else{var w=Math.sqrt(g),N=(h*h-u*u+n*g)/(2*u*r*w),c=(h*h-u*u-n*g)/(2*h*r*w),S=Math.log(Math.sqrt(N*N+1)-N),I=Math.log(Math.sqrt(c*c+1)-c);d=(I-S)/e,x=function(z){var R=z*d,q=Hn(S),P=u/(r*w)*(q*na(e*R+S)-ra(S));return[s+P*m,f+P*_,u*q/Hn(e*R+S)]}}return x.duration=d*1e3*e/Math.SQRT2,x}return o.rho=function(i){var a=Math.max(.001,+i),s=a*a,f=s*s;return t(a,s,f)},o}(Math.SQRT2,2,4);function Vn(t){for(var e=t.length/6|0,r=new Array(e),n=0;n<e;)r[n]="#"+t.slice(n*6,++n*6);return r}var rr=Vn("4e79a7f28e2ce1575976b7b259a14fedc949af7aa1ff9da79c755fbab0ab");var oa=ct("start","end","cancel","interrupt"),ia=[],Kn=0,Wn=1,ke=2,Me=3,Qn=4,Ie=5,Zt=6;function yt(t,e,r,n,o,i){var a=t.__transition;if(!a)t.__transition={};else if(r in a)return;aa(t,r,{name:e,index:n,group:o,on:oa,tween:ia,time:i.time,delay:i.delay,duration:i.duration,ease:i.ease,timer:null,state:Kn})}function Jt(t,e){var r=H(t,e);if(r.state>Kn)throw new Error("too late; already scheduled");return r}function Z(t,e){var r=H(t,e);if(r.state>Me)throw new Error("too late; already running");return r}function H(t,e){var r=t.__transition;if(!r||!(r=r[e]))throw new Error("transition not found");return r}function aa(t,e,r){var n=t.__transition,o;n[e]=r,r.timer=kt(i,0,r.time);function i(u){r.state=Wn,r.timer.restart(a,r.delay,r.time),r.delay<=u&&a(u-r.delay)}function a(u){var l,y,h,m;if(r.state!==Wn)return f();for(l in n)if(m=n[l],m.name===r.name){if(m.state===Me)return ge(a);m.state===Qn?(m.state=Zt,m.timer.stop(),m.on.call("interrupt",t,t.__data__,m.index,m.group),delete n[l]):+l<e&&(m.state=Zt,m.timer.stop(),m.on.call("cancel",t,t.__data__,m.index,m.group),delete n[l])}if(ge(function(){r.state===Me&&(r.state=Qn,r.timer.restart(s,r.delay,r.time),s(u))}),r.state=ke,r.on.call("start",t,t.__data__,r.index,r.group),r.state===ke){for(r.state=Me,o=new Array(h=r.tween.length),l=0,y=-1;l<h;++l)(m=r.tween[l].value.call(t,t.__data__,r.index,r.group))&&(o[++y]=m);o.length=y+1}}function s(u){for(var l=u<r.duration?r.ease.call(null,u/r.duration):(r.timer.restart(f),r.state=Ie,1),y=-1,h=o.length;++y<h;)o[y].call(t,l);r.state===Ie&&(r.on.call("end",t,t.__data__,r.index,r.group),f())}function f(){r.state=Zt,r.timer.stop(),delete n[e];for(var u in n)return;delete t.__transition}}function At(t,e){var r=t.__transition,n,o,i=!0,a;if(r){e=e==null?null:e+"";for(a in r){if((n=r[a]).name!==e){i=!1;continue}o=n.state>ke&&n.state<Ie,n.state=Zt,n.timer.stop(),n.on.call(o?"interrupt":"cancel",t,t.__data__,n.index,n.group),delete r[a]}i&&delete t.__transition}}function Un(t){return this.each(function(){At(this,t)})}function sa(t,e){var r,n;return function(){var o=Z(this,t),i=o.tween;if(i!==r){n=r=i;for(var a=0,s=n.length;a<s;++a)if(n[a].name===e){n=n.slice(),n.splice(a,1);break}}o.tween=n}}function ua(t,e,r){var n,o;if(typeof r!="function")throw new Error;return function(){var i=Z(this,t),a=i.tween;if(a!==n){o=(n=a).slice();for(var s={name:e,value:r},f=0,u=o.length;f<u;++f)if(o[f].name===e){o[f]=s;break}f===u&&o.push(s)}i.tween=o}}function Zn(t,e){var r=this._id;if(t+="",arguments.length<2){for(var n=H(this.node(),r).tween,o=0,i=n.length,a;o<i;++o)if((a=n[o]).name===t)return a.value;return null}return this.each((e==null?sa:ua)(r,t,e))}function zt(t,e,r){var n=t._id;return t.each(function(){var o=Z(this,n);(o.value||(o.value={}))[e]=r.apply(this,arguments)}),function(o){return H(o,n).value[e]}}function Ee(t,e){var r;return(typeof e=="number"?ot:e instanceof xt?Ne:(r=xt(e))?(e=r,Ne):Ze)(t,e)}function fa(t){return function(){this.removeAttribute(t)}}function la(t){return function(){this.removeAttributeNS(t.space,t.local)}}function ca(t,e,r){var n,o=r+"",i;return function(){var a=this.getAttribute(t);return a===o?null:a===n?i:i=e(n=a,r)}}function ha(t,e,r){var n,o=r+"",i;return function(){var a=this.getAttributeNS(t.space,t.local);return a===o?null:a===n?i:i=e(n=a,r)}}function pa(t,e,r){var n,o,i;return function(){var a,s=r(this),f;return s==null?void this.removeAttribute(t):(a=this.getAttribute(t),f=s+"",a===f?null:a===n&&f===o?i:(o=f,i=e(n=a,s)))}}function ma(t,e,r){var n,o,i;return function(){var a,s=r(this),f;return s==null?void this.removeAttributeNS(t.space,t.local):(a=this.getAttributeNS(t.space,t.local),f=s+"",a===f?null:a===n&&f===o?i:(o=f,i=e(n=a,s)))}}function Jn(t,e){var r=ht(t),n=r==="transform"?tr:Ee;return this.attrTween(t,typeof e=="function"?(r.local?ma:pa)(r,n,zt(this,"attr."+t,e)):e==null?(r.local?la:fa)(r):(r.local?ha:ca)(r,n,e))}function da(t,e){return function(r){this.setAttribute(t,e.call(this,r))}}function ga(t,e){return function(r){this.setAttributeNS(t.space,t.local,e.call(this,r))}}function xa(t,e){var r,n;function o(){var i=e.apply(this,arguments);return i!==n&&(r=(n=i)&&ga(t,i)),r}return o._value=e,o}function ya(t,e){var r,n;function o(){var i=e.apply(this,arguments);return i!==n&&(r=(n=i)&&da(t,i)),r}return o._value=e,o}function jn(t,e){var r="attr."+t;if(arguments.length<2)return(r=this.tween(r))&&r._value;if(e==null)return this.tween(r,null);if(typeof e!="function")throw new Error;var n=ht(t);return this.tween(r,(n.local?xa:ya)(n,e))}function va(t,e){return function(){Jt(this,t).delay=+e.apply(this,arguments)}}function wa(t,e){return e=+e,function(){Jt(this,t).delay=e}}function to(t){var e=this._id;return arguments.length?this.each((typeof t=="function"?va:wa)(e,t)):H(this.node(),e).delay}function _a(t,e){return function(){Z(this,t).duration=+e.apply(this,arguments)}}function ba(t,e){return e=+e,function(){Z(this,t).duration=e}}function eo(t){var e=this._id;return arguments.length?this.each((typeof t=="function"?_a:ba)(e,t)):H(this.node(),e).duration}function Na(t,e){if(typeof e!="function")throw new Error;return function(){Z(this,t).ease=e}}function ro(t){var e=this._id;return arguments.length?this.each(Na(e,t)):H(this.node(),e).ease}function Sa(t,e){return function(){var r=e.apply(this,arguments);if(typeof r!="function")throw new Error;Z(this,t).ease=r}}function no(t){if(typeof t!="function")throw new Error;return this.each(Sa(this._id,t))}function oo(t){typeof t!="function"&&(t=Pt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=[],f,u=0;u<a;++u)(f=i[u])&&t.call(f,f.__data__,u,i)&&s.push(f);return new tt(n,this._parents,this._name,this._id)}function io(t){if(t._id!==this._id)throw new Error;for(var e=this._groups,r=t._groups,n=e.length,o=r.length,i=Math.min(n,o),a=new Array(n),s=0;s<i;++s)for(var f=e[s],u=r[s],l=f.length,y=a[s]=new Array(l),h,m=0;m<l;++m)(h=f[m]||u[m])&&(y[m]=h);for(;s<n;++s)a[s]=e[s];return new tt(a,this._parents,this._name,this._id)}function Aa(t){return(t+"").trim().split(/^|\s+/).every(function(e){var r=e.indexOf(".");return r>=0&&(e=e.slice(0,r)),!e||e==="start"})}function Ma(t,e,r){var n,o,i=Aa(e)?Jt:Z;return function(){var a=i(this,t),s=a.on;s!==n&&(o=(n=s).copy()).on(e,r),a.on=o}}function ao(t,e){var r=this._id;return arguments.length<2?H(this.node(),r).on.on(t):this.each(Ma(r,t,e))}function ka(t){return function(){var e=this.parentNode;for(var r in this.__transition)if(+r!==t)return;e&&e.removeChild(this)}}function so(){return this.on("end.remove",ka(this._id))}function uo(t){var e=this._name,r=this._id;typeof t!="function"&&(t=vt(t));for(var n=this._groups,o=n.length,i=new Array(o),a=0;a<o;++a)for(var s=n[a],f=s.length,u=i[a]=new Array(f),l,y,h=0;h<f;++h)(l=s[h])&&(y=t.call(l,l.__data__,h,s))&&("__data__"in l&&(y.__data__=l.__data__),u[h]=y,yt(u[h],e,r,h,u,H(l,r)));return new tt(i,this._parents,e,r)}function fo(t){var e=this._name,r=this._id;typeof t!="function"&&(t=Rt(t));for(var n=this._groups,o=n.length,i=[],a=[],s=0;s<o;++s)for(var f=n[s],u=f.length,l,y=0;y<u;++y)if(l=f[y]){for(var h=t.call(l,l.__data__,y,f),m,_=H(l,r),g=0,x=h.length;g<x;++g)(m=h[g])&&yt(m,e,r,g,h,_);i.push(h),a.push(l)}return new tt(i,a,e,r)}var Ia=pt.prototype.constructor;function lo(){return new Ia(this._groups,this._parents)}function Ea(t,e){var r,n,o;return function(){var i=dt(this,t),a=(this.style.removeProperty(t),dt(this,t));return i===a?null:i===r&&a===n?o:o=e(r=i,n=a)}}function co(t){return function(){this.style.removeProperty(t)}}function Ta(t,e,r){var n,o=r+"",i;return function(){var a=dt(this,t);return a===o?null:a===n?i:i=e(n=a,r)}}function za(t,e,r){var n,o,i;return function(){var a=dt(this,t),s=r(this),f=s+"";return s==null&&(f=s=(this.style.removeProperty(t),dt(this,t))),a===f?null:a===n&&f===o?i:(o=f,i=e(n=a,s))}}function Oa(t,e){var r,n,o,i="style."+e,a="end."+i,s;return function(){var f=Z(this,t),u=f.on,l=f.value[i]==null?s||(s=co(e)):void 0;(u!==r||o!==l)&&(n=(r=u).copy()).on(a,o=l),f.on=n}}function ho(t,e,r){var n=(t+="")=="transform"?je:Ee;return e==null?this.styleTween(t,Ea(t,n)).on("end.style."+t,co(t)):typeof e=="function"?this.styleTween(t,za(t,n,zt(this,"style."+t,e))).each(Oa(this._id,t)):this.styleTween(t,Ta(t,n,e),r).on("end.style."+t,null)}function Ca(t,e,r){return function(n){this.style.setProperty(t,e.call(this,n),r)}}function Ra(t,e,r){var n,o;function i(){var a=e.apply(this,arguments);return a!==o&&(n=(o=a)&&Ca(t,a,r)),n}return i._value=e,i}function po(t,e,r){var n="style."+(t+="");if(arguments.length<2)return(n=this.tween(n))&&n._value;if(e==null)return this.tween(n,null);if(typeof e!="function")throw new Error;return this.tween(n,Ra(t,e,r??""))}function Pa(t){return function(){this.textContent=t}}function $a(t){return function(){var e=t(this);this.textContent=e??""}}function mo(t){return this.tween("text",typeof t=="function"?$a(zt(this,"text",t)):Pa(t==null?"":t+""))}function Ba(t){return function(e){this.textContent=t.call(this,e)}}function Da(t){var e,r;function n(){var o=t.apply(this,arguments);return o!==r&&(e=(r=o)&&Ba(o)),e}return n._value=t,n}function go(t){var e="text";if(arguments.length<1)return(e=this.tween(e))&&e._value;if(t==null)return this.tween(e,null);if(typeof t!="function")throw new Error;return this.tween(e,Da(t))}function xo(){for(var t=this._name,e=this._id,r=Te(),n=this._groups,o=n.length,i=0;i<o;++i)for(var a=n[i],s=a.length,f,u=0;u<s;++u)if(f=a[u]){var l=H(f,e);yt(f,t,r,u,a,{time:l.time+l.delay+l.duration,delay:0,duration:l.duration,ease:l.ease})}return new tt(n,this._parents,t,r)}function yo(){var t,e,r=this,n=r._id,o=r.size();return new Promise(function(i,a){var s={value:a},f={value:function(){--o===0&&i()}};r.each(function(){var u=Z(this,n),l=u.on;l!==t&&(e=(t=l).copy(),e._.cancel.push(s),e._.interrupt.push(s),e._.end.push(f)),u.on=e}),o===0&&i()})}var qa=0;function tt(t,e,r,n){this._groups=t,this._parents=e,this._name=r,this._id=n}function vo(t){return pt().transition(t)}function Te(){return++qa}var mt=pt.prototype;tt.prototype=vo.prototype={constructor:tt,select:uo,selectAll:fo,selectChild:mt.selectChild,selectChildren:mt.selectChildren,filter:oo,merge:io,selection:lo,transition:xo,call:mt.call,nodes:mt.nodes,node:mt.node,size:mt.size,empty:mt.empty,each:mt.each,on:ao,attr:Jn,attrTween:jn,style:ho,styleTween:po,text:mo,textTween:go,remove:so,tween:Zn,delay:to,duration:eo,ease:ro,easeVarying:no,end:yo,[Symbol.iterator]:mt[Symbol.iterator]};function ze(t){return((t*=2)<=1?t*t*t:(t-=2)*t*t+2)/2}var La={time:null,delay:0,duration:250,ease:ze};function Ya(t,e){for(var r;!(r=t.__transition)||!(r=r[e]);)if(!(t=t.parentNode))throw new Error(`transition ${e} not found`);return r}function wo(t){var e,r;t instanceof tt?(e=t._id,t=t._name):(e=Te(),(r=La).time=Vt(),t=t==null?null:t+"");for(var n=this._groups,o=n.length,i=0;i<o;++i)for(var a=n[i],s=a.length,f,u=0;u<s;++u)(f=a[u])&&yt(f,t,e,u,a,r||Ya(f,e));return new tt(n,this._parents,t,e)}pt.prototype.interrupt=Un;pt.prototype.transition=wo;var jt=t=>()=>t;function nr(t,{sourceEvent:e,target:r,transform:n,dispatch:o}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},target:{value:r,enumerable:!0,configurable:!0},transform:{value:n,enumerable:!0,configurable:!0},_:{value:o}})}function st(t,e,r){this.k=t,this.x=e,this.y=r}st.prototype={constructor:st,scale:function(t){return t===1?this:new st(this.k*t,this.x,this.y)},translate:function(t,e){return t===0&e===0?this:new st(this.k,this.x+this.k*t,this.y+this.k*e)},apply:function(t){return[t[0]*this.k+this.x,t[1]*this.k+this.y]},applyX:function(t){return t*this.k+this.x},applyY:function(t){return t*this.k+this.y},invert:function(t){return[(t[0]-this.x)/this.k,(t[1]-this.y)/this.k]},invertX:function(t){return(t-this.x)/this.k},invertY:function(t){return(t-this.y)/this.k},rescaleX:function(t){return t.copy().domain(t.range().map(this.invertX,this).map(t.invert,t))},rescaleY:function(t){return t.copy().domain(t.range().map(this.invertY,this).map(t.invert,t))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var te=new st(1,0,0);or.prototype=st.prototype;function or(t){for(;!t.__zoom;)if(!(t=t.parentNode))return te;return t.__zoom}function Oe(t){t.stopImmediatePropagation()}function Ot(t){t.preventDefault(),t.stopImmediatePropagation()}function Ga(t){return(!t.ctrlKey||t.type==="wheel")&&!t.button}function Xa(){var t=this;return t instanceof SVGElement?(t=t.ownerSVGElement||t,t.hasAttribute("viewBox")?(t=t.viewBox.baseVal,[[t.x,t.y],[t.x+t.width,t.y+t.height]]):[[0,0],[t.width.baseVal.value,t.height.baseVal.value]]):[[0,0],[t.clientWidth,t.clientHeight]]}function _o(){return this.__zoom||te}function Fa(t){return-t.deltaY*(t.deltaMode===1?.05:t.deltaMode?1:.002)*(t.ctrlKey?10:1)}function Ha(){return navigator.maxTouchPoints||"ontouchstart"in this}function Va(t,e,r){var n=t.invertX(e[0][0])-r[0][0],o=t.invertX(e[1][0])-r[1][0],i=t.invertY(e[0][1])-r[0][1],a=t.invertY(e[1][1])-r[1][1];return t.translate(o>n?(n+o)/2:Math.min(0,n)||Math.max(0,o),a>i?(i+a)/2:Math.min(0,i)||Math.max(0,a))}function ir(){var t=Ga,e=Xa,r=Va,n=Fa,o=Ha,i=[0,1/0],a=[[-1/0,-1/0],[1/0,1/0]],s=250,f=er,u=ct("start","zoom","end"),l,y,h,m=500,_=150,g=0,x=10;function d(p){p.property("__zoom",_o).on("wheel.zoom",R,{passive:!1}).on("mousedown.zoom",q).on("dblclick.zoom",P).filter(o).on("touchstart.zoom",Y).on("touchmove.zoom",Q).on("touchend.zoom touchcancel.zoom",K).style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}d.transform=function(p,A,v,k){var E=p.selection?p.selection():p;E.property("__zoom",_o),p!==E?S(p,A,v,k):E.interrupt().each(function(){I(this,arguments).event(k).start().zoom(null,typeof A=="function"?A.apply(this,arguments):A).end()})},d.scaleBy=function(p,A,v,k){d.scaleTo(p,function(){var E=this.__zoom.k,O=typeof A=="function"?A.apply(this,arguments):A;return E*O},v,k)},d.scaleTo=function(p,A,v,k){d.transform(p,function(){var E=e.apply(this,arguments),O=this.__zoom,C=v==null?c(E):typeof v=="function"?v.apply(this,arguments):v,L=O.invert(C),G=typeof A=="function"?A.apply(this,arguments):A;return r(N(w(O,G),C,L),E,a)},v,k)},d.translateBy=function(p,A,v,k){d.transform(p,function(){return r(this.__zoom.translate(typeof A=="function"?A.apply(this,arguments):A,typeof v=="function"?v.apply(this,arguments):v),e.apply(this,arguments),a)},null,k)},d.translateTo=function(p,A,v,k,E){d.transform(p,function(){var O=e.apply(this,arguments),C=this.__zoom,L=k==null?c(O):typeof k=="function"?k.apply(this,arguments):k;return r(te.translate(L[0],L[1]).scale(C.k).translate(typeof A=="function"?-A.apply(this,arguments):-A,typeof v=="function"?-v.apply(this,arguments):-v),O,a)},k,E)};function w(p,A){return A=Math.max(i[0],Math.min(i[1],A)),A===p.k?p:new st(A,p.x,p.y)}function N(p,A,v){var k=A[0]-v[0]*p.k,E=A[1]-v[1]*p.k;return k===p.x&&E===p.y?p:new st(p.k,k,E)}function c(p){return[(+p[0][0]+ +p[1][0])/2,(+p[0][1]+ +p[1][1])/2]}function S(p,A,v,k){p.on("start.zoom",function(){I(this,arguments).event(k).start()}).on("interrupt.zoom end.zoom",function(){I(this,arguments).event(k).end()}).tween("zoom",function(){var E=this,O=arguments,C=I(E,O).event(k),L=e.apply(E,O),G=v==null?c(L):typeof v=="function"?v.apply(E,O):v,rt=Math.max(L[1][0]-L[0][0],L[1][1]-L[0][1]),X=E.__zoom,b=typeof A=="function"?A.apply(E,O):A,M=f(X.invert(G).concat(rt/X.k),b.invert(G).concat(rt/b.k));return function($){if($===1)$=b;else{var D=M($),V=rt/D[2];$=new st(V,G[0]-D[0]*V,G[1]-D[1]*V)}C.zoom(null,$)}})}function I(p,A,v){return!v&&p.__zooming||new z(p,A)}function z(p,A){this.that=p,this.args=A,this.active=0,this.sourceEvent=null,this.extent=e.apply(p,A),this.taps=0}z.prototype={event:function(p){return p&&(this.sourceEvent=p),this},start:function(){return++this.active===1&&(this.that.__zooming=this,this.emit("start")),this},zoom:function(p,A){return this.mouse&&p!=="mouse"&&(this.mouse[1]=A.invert(this.mouse[0])),this.touch0&&p!=="touch"&&(this.touch0[1]=A.invert(this.touch0[0])),this.touch1&&p!=="touch"&&(this.touch1[1]=A.invert(this.touch1[0])),this.that.__zoom=A,this.emit("zoom"),this},end:function(){return--this.active===0&&(delete this.that.__zooming,this.emit("end")),this},emit:function(p){var A=J(this.that).datum();u.call(p,this.that,new nr(p,{sourceEvent:this.sourceEvent,target:d,type:p,transform:this.that.__zoom,dispatch:u}),A)}};function R(p,...A){if(!t.apply(this,arguments))return;var v=I(this,A).event(p),k=this.__zoom,E=Math.max(i[0],Math.min(i[1],k.k*Math.pow(2,n.apply(this,arguments)))),O=nt(p);if(v.wheel)(v.mouse[0][0]!==O[0]||v.mouse[0][1]!==O[1])&&(v.mouse[1]=k.invert(v.mouse[0]=O)),clearTimeout(v.wheel);else{if(k.k===E)return;v.mouse=[O,k.invert(O)],At(this),v.start()}Ot(p),v.wheel=setTimeout(C,_),v.zoom("mouse",r(N(w(k,E),v.mouse[0],v.mouse[1]),v.extent,a));function C(){v.wheel=null,v.end()}}function q(p,...A){if(h||!t.apply(this,arguments))return;var v=p.currentTarget,k=I(this,A,!0).event(p),E=J(p.view).on("mousemove.zoom",G,!0).on("mouseup.zoom",rt,!0),O=nt(p,v),C=p.clientX,L=p.clientY;Bt(p.view),Oe(p),k.mouse=[O,this.__zoom.invert(O)],At(this),k.start();function G(X){if(Ot(X),!k.moved){var b=X.clientX-C,M=X.clientY-L;k.moved=b*b+M*M>g}k.event(X).zoom("mouse",r(N(k.that.__zoom,k.mouse[0]=nt(X,v),k.mouse[1]),k.extent,a))}function rt(X){E.on("mousemove.zoom mouseup.zoom",null),Dt(X.view,k.moved),Ot(X),k.event(X).end()}}function P(p,...A){if(t.apply(this,arguments)){var v=this.__zoom,k=nt(p.changedTouches?p.changedTouches[0]:p,this),E=v.invert(k),O=v.k*(p.shiftKey?.5:2),C=r(N(w(v,O),k,E),e.apply(this,A),a);Ot(p),s>0?J(this).transition().duration(s).call(S,C,k,p):J(this).call(d.transform,C,k,p)}}function Y(p,...A){if(t.apply(this,arguments)){var v=p.touches,k=v.length,E=I(this,A,p.changedTouches.length===k).event(p),O,C,L,G;for(Oe(p),C=0;C<k;++C)L=v[C],G=nt(L,this),G=[G,this.__zoom.invert(G),L.identifier],E.touch0?!E.touch1&&E.touch0[2]!==G[2]&&(E.touch1=G,E.taps=0):(E.touch0=G,O=!0,E.taps=1+!!l);l&&(l=clearTimeout(l)),O&&(E.taps<2&&(y=G[0],l=setTimeout(function(){l=null},m)),At(this),E.start())}}function Q(p,...A){if(this.__zooming){var v=I(this,A).event(p),k=p.changedTouches,E=k.length,O,C,L,G;for(Ot(p),O=0;O<E;++O)C=k[O],L=nt(C,this),v.touch0&&v.touch0[2]===C.identifier?v.touch0[0]=L:v.touch1&&v.touch1[2]===C.identifier&&(v.touch1[0]=L);if(C=v.that.__zoom,v.touch1){var rt=v.touch0[0],X=v.touch0[1],b=v.touch1[0],M=v.touch1[1],$=($=b[0]-rt[0])*$+($=b[1]-rt[1])*$,D=(D=M[0]-X[0])*D+(D=M[1]-X[1])*D;C=w(C,Math.sqrt($/D)),L=[(rt[0]+b[0])/2,(rt[1]+b[1])/2],G=[(X[0]+M[0])/2,(X[1]+M[1])/2]}else if(v.touch0)L=v.touch0[0],G=v.touch0[1];else return;v.zoom("touch",r(N(C,L,G),v.extent,a))}}function K(p,...A){if(this.__zooming){var v=I(this,A).event(p),k=p.changedTouches,E=k.length,O,C;for(Oe(p),h&&clearTimeout(h),h=setTimeout(function(){h=null},m),O=0;O<E;++O)C=k[O],v.touch0&&v.touch0[2]===C.identifier?delete v.touch0:v.touch1&&v.touch1[2]===C.identifier&&delete v.touch1;if(v.touch1&&!v.touch0&&(v.touch0=v.touch1,delete v.touch1),v.touch0)v.touch0[1]=this.__zoom.invert(v.touch0[0]);else if(v.end(),v.taps===2&&(C=nt(C,this),Math.hypot(y[0]-C[0],y[1]-C[1])<x)){var L=J(this).on("dblclick.zoom");L&&L.apply(this,arguments)}}}return d.wheelDelta=function(p){return arguments.length?(n=typeof p=="function"?p:jt(+p),d):n},d.filter=function(p){return arguments.length?(t=typeof p=="function"?p:jt(!!p),d):t},d.touchable=function(p){return arguments.length?(o=typeof p=="function"?p:jt(!!p),d):o},d.extent=function(p){return arguments.length?(e=typeof p=="function"?p:jt([[+p[0][0],+p[0][1]],[+p[1][0],+p[1][1]]]),d):e},d.scaleExtent=function(p){return arguments.length?(i[0]=+p[0],i[1]=+p[1],d):[i[0],i[1]]},d.translateExtent=function(p){return arguments.length?(a[0][0]=+p[0][0],a[1][0]=+p[1][0],a[0][1]=+p[0][1],a[1][1]=+p[1][1],d):[[a[0][0],a[0][1]],[a[1][0],a[1][1]]]},d.constrain=function(p){return arguments.length?(r=p,d):r},d.duration=function(p){return arguments.length?(s=+p,d):s},d.interpolate=function(p){return arguments.length?(f=p,d):f},d.on=function(){var p=u.on.apply(u,arguments);return p===u?d:p},d.clickDistance=function(p){return arguments.length?(g=(p=+p)*p,d):Math.sqrt(g)},d.tapDistance=function(p){return arguments.length?(x=+p,d):x},d}var Wa=0;function Ct(t){return String(t).replaceAll("&","&amp;").replaceAll("<","&lt;").replaceAll(">","&gt;").replaceAll('"',"&quot;").replaceAll("'","&#039;")}function ee(t,e){if(t==null||t==="")return e;let r=Number(t);return Number.isFinite(r)?r:e}function Qa({model:t,el:e}){let n=`graph-widget-arrow-${++Wa}`,o=Wt(rr),i=document.createElement("div");i.classList.add("graph-widget"),e.appendChild(i);let a=document.createElementNS("http://www.w3.org/2000/svg","svg");a.classList.add("graph-widget-svg"),i.appendChild(a);let s=document.createElement("div");s.classList.add("graph-widget-tooltip"),s.style.display="none",i.appendChild(s);let f=J(a);f.append("defs").append("marker").attr("id",n).attr("viewBox","-0 -5 10 10").attr("refX",9).attr("refY",0).attr("orient","auto").attr("markerWidth",6).attr("markerHeight",6).append("path").attr("d","M0,-5L10,0L0,5").attr("class","graph-widget-arrow");let u=f.append("g").attr("class","graph-widget-zoom"),l=u.append("g").attr("class","graph-widget-edges"),y=u.append("g").attr("class","graph-widget-edge-labels"),h=u.append("g").attr("class","graph-widget-nodes"),m=ir().scaleExtent([.1,5]).on("zoom",b=>{u.attr("transform",b.transform)});f.call(m);let _=ee(t.get("height"),400),g=ee(t.get("width"),i.clientWidth||600),x=[],d=[],w=new Set(t.get("selected_nodes")||[]),N=new Set(t.get("selected_edges")||[]),c=null,S=Ge().force("link",Le().id(b=>b.id).distance(95).strength(.9)).force("charge",Xe().strength(-220)).force("center",he(g/2,_/2)).force("collide",qe().radius(b=>I(b)+8)).on("tick",k);S.stop();function I(b){return Math.max(4,ee(b.size,14))}function z(b){return Math.max(1,ee(b.width??b.size,1.7))}function R(b){return b.id}function q(){a.setAttribute("width",g),a.setAttribute("height",_),a.setAttribute("viewBox",`0 0 ${g} ${_}`),S.force("center",he(g/2,_/2)),S.alpha(.2).restart()}function P(){let b=t.get("width"),M=null;if(b!=null&&b!==""){let $=Number(b);Number.isFinite($)&&$>0&&(M=$)}_=ee(t.get("height"),400),M!==null?(c&&(c.disconnect(),c=null),i.style.display="",i.style.width="",g=M):(i.style.display="block",i.style.width="100%",g=e.clientWidth||i.clientWidth||g||600,!c&&typeof ResizeObserver<"u"&&(c=new ResizeObserver(()=>{let D=e.clientWidth||i.clientWidth;!D||D===g||(g=D,q())}),c.observe(e))),q()}function Y(){S.alpha(.2).restart()}function Q(){t.set("selected_nodes",Array.from(w)),t.set("selected_edges",Array.from(N)),t.save_changes()}function K(b,M,$){let D=M.name||M.id||$,V=`<strong>${Ct(D)}</strong>`;if($==="node"?V+=`<br><span class="graph-widget-tooltip-key">id:</span> ${Ct(M.id)}`:(V+=`<br><span class="graph-widget-tooltip-key">source:</span> ${Ct(M.source.id||M.source)}`,V+=`<br><span class="graph-widget-tooltip-key">target:</span> ${Ct(M.target.id||M.target)}`),M.data&&typeof M.data=="object")for(let[B,U]of Object.entries(M.data))V+=`<br><span class="graph-widget-tooltip-key">${Ct(B)}:</span> ${Ct(U)}`;s.innerHTML=V,s.style.display="block";let T=i.getBoundingClientRect();s.style.left=`${b.clientX-T.left+12}px`,s.style.top=`${b.clientY-T.top+12}px`}function p(){s.style.display="none"}function wgPos(b){let M=t.get("positions");if(!M||!b)return null;let $=M.buffer??M,D=M.byteOffset??0,V=M.byteLength??0;return V!==b*8?null:new Float32Array($.slice(D,D+V))}function wgPt(b,M){return{x:g/2+b[2*M]*Math.max(g/2-24,1),y:_/2+b[2*M+1]*Math.max(_/2-24,1)}}function wgApply(){let b=wgPos(x.length);b&&(x.forEach((M,$)=>{Object.assign(M,wgPt(b,$),{vx:0,vy:0})}),S.alpha(.05).restart())}let wgSpawn=null;function A(){let b=t.get("nodes")||[],M=t.get("edges")||[],$=new Map(b.map(T=>[T.id,T])),D=new Map;x.forEach(T=>{D.set(T.id,{x:T.x,y:T.y,vx:T.vx,vy:T.vy,fx:T.fx,fy:T.fy})});function V(T,B){if(Number.isFinite(Number(T.x))&&Number.isFinite(Number(T.y)))return{x:Number(T.x),y:Number(T.y)};if(wgSpawn){let ut=B*2.399963229728653,oe=6+Math.sqrt(B%64)*6;return{x:wgSpawn.x+Math.cos(ut)*oe,y:wgSpawn.y+Math.sin(ut)*oe}}let U=M.findIndex(ut=>ut.source===T.id&&D.has(ut.target)||ut.target===T.id&&D.has(ut.source));if(U>=0){let ut=M[U],oe=D.has(ut.source),ar=D.get(oe?ut.source:ut.target),bo=oe?1:-1,No=U%5-2;return{x:ar.x+bo*80,y:ar.y+No*28}}let re=B*2.399963229728653,ne=24+B*3;return{x:g/2+Math.cos(re)*ne,y:_/2+Math.sin(re)*ne}}let wgK=wgPos(b.length);x=b.map((T,B)=>{let U=D.get(T.id);return U?{...T,...U}:{...T,...(wgK?wgPt(wgK,B):V(T,B))}}),d=M.filter(T=>$.has(T.source)&&$.has(T.target)).map(T=>({...T,source:T.source,target:T.target})),w=new Set((t.get("selected_nodes")||[]).filter(T=>$.has(T))),N=new Set((t.get("selected_edges")||[]).filter(T=>d.some(B=>B.id===T))),wgSpawn=null,S.nodes(x),S.force("link").links(d),S.alpha(wgK?.05:D.size?.16:.35).restart(),v()}function v(){let b=t.get("directed"),M=l.selectAll(".graph-widget-edge").data(d,R);M.exit().remove(),M.enter().append("path").attr("class","graph-widget-edge").on("click",rt).on("mouseenter",(B,U)=>K(B,U,"edge")).on("mouseleave",p).merge(M).attr("stroke",B=>B.color||"var(--graph-edge)").attr("stroke-width",z).attr("marker-end",b?`url(#${n})`:null).classed("is-selected",B=>N.has(B.id));let $=y.selectAll(".graph-widget-edge-label").data(d.filter(B=>B.name),R);$.exit().remove(),$.enter().append("text").attr("class","graph-widget-edge-label").merge($).text(B=>B.name||"");let D=h.selectAll(".graph-widget-node-group").data(x,B=>B.id);D.exit().remove();let V=D.enter().append("g").attr("class","graph-widget-node-group").call(Be().on("start",E).on("drag",C).on("end",L)).on("click",G).on("dblclick",wgDbl).on("mouseenter",(B,U)=>{K(B,U,"node"),t.set("hovered_node",U.id),t.save_changes()}).on("mouseleave",(B,U)=>{p(),t.set("hovered_node",null),t.save_changes()});V.append("circle").attr("class","graph-widget-node"),V.append("text").attr("class","graph-widget-node-name").attr("text-anchor","middle");let T=V.merge(D);T.select(".graph-widget-node").attr("r",I).attr("fill",B=>B.color||o(B.id)).classed("is-selected",B=>w.has(B.id)).classed("is-cluster",B=>!!B.cluster),T.select(".graph-widget-node-name").attr("dy",B=>I(B)+14).text(B=>B.name||"")}function k(){(t.get("bounded")??!0)&&x.forEach(M=>{let $=I(M);M.x=Math.max(18+$,Math.min(g-18-$,M.x)),M.y=Math.max(18+$,Math.min(_-18-$,M.y))}),l.selectAll(".graph-widget-edge").attr("d",O),y.selectAll(".graph-widget-edge-label").attr("x",b=>(b.source.x+b.target.x)/2).attr("y",b=>(b.source.y+b.target.y)/2-5),h.selectAll(".graph-widget-node-group").attr("transform",b=>`translate(${b.x},${b.y})`)}function E(b,M){b.active||S.alphaTarget(.2).restart(),M.fx=M.x,M.fy=M.y}function O(b){let M=I(b.source),$=I(b.target),D=b.target.x-b.source.x,V=b.target.y-b.source.y,T=Math.hypot(D,V)||1,B=D/T,U=V/T,re=b.source.x+B*(M+2),ne=b.source.y+U*(M+2),ut=b.target.x-B*($+9),oe=b.target.y-U*($+9);return`M${re},${ne}L${ut},${oe}`}function C(b,M){M.fx=b.x,M.fy=b.y}function L(b,M){b.active||S.alphaTarget(0),M.fx=null,M.fy=null}function wgDbl(b,M){b.stopPropagation(),M.cluster||(wgSpawn={x:M.x,y:M.y},t.send({type:"collapse",id:M.id}))}function G(b,M){if(b.stopPropagation(),M.cluster){wgSpawn={x:M.x,y:M.y},t.send({type:"expand",id:M.id});return}b.ctrlKey||b.metaKey?w.has(M.id)?w.delete(M.id):w.add(M.id):w.has(M.id)&&w.size===1?w.clear():(w.clear(),N.clear(),w.add(M.id)),Q(),v()}function rt(b,M){b.stopPropagation(),b.ctrlKey||b.metaKey?N.has(M.id)?N.delete(M.id):N.add(M.id):N.has(M.id)&&N.size===1?N.clear():(N.clear(),w.clear(),N.add(M.id)),Q(),v()}a.addEventListener("click",b=>{b.target===a&&(w.clear(),N.clear(),Q(),v())});function X(){w=new Set(t.get("selected_nodes")||[]),N=new Set(t.get("selected_edges")||[]),v()}return t.on("change:nodes",A),t.on("change:edges",A),t.on("change:positions",wgApply),t.on("change:directed",v),t.on("change:bounded",Y),t.on("change:selected_nodes",X),t.on("change:selected_edges",X),t.on("change:width",P),t.on("change:height",P),P(),A(),()=>{S.stop(),c&&(c.disconnect(),c=null),t.off("change:nodes",A),t.off("change:edges",A),t.off("change:positions",wgApply),t.off("change:directed",v),t.off("change:bounded",Y),t.off("change:selected_nodes",X),t.off("change:selected_edges",X),t.off("change:width",P),t.off("change:height",P)}}var Gp={render:Qa};export{Gp as default};
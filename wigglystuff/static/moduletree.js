@@ -16,12 +16,83 @@ function formatShape(shape) {
   return "[" + shape.join(", ") + "]";
 }
 
-function buildNode(node, depth, initialExpandDepth, rootTotal) {
+function formatMs(ms) {
+  if (ms >= 1000) return (ms / 1000).toFixed(2) + " s";
+  if (ms >= 1) return ms.toFixed(1) + " ms";
+  return (ms * 1000).toFixed(0) + " \u00B5s";
+}
+
+// Share of the root's forward time above which a layer is highlighted.
+const HOT_SHARE = 0.1;
+
+function buildParamRow(p) {
+  const row = document.createElement("div");
+  row.className = "mt-param";
+
+  const pname = document.createElement("span");
+  pname.className = "mt-param-name";
+  pname.textContent = p.name;
+  row.appendChild(pname);
+
+  const shape = document.createElement("span");
+  shape.className = "mt-param-shape";
+  shape.textContent = p.is_lazy ? "uninitialized" : formatShape(p.shape);
+  row.appendChild(shape);
+
+  const numel = document.createElement("span");
+  numel.className = "mt-param-numel";
+  numel.textContent = p.is_lazy ? "—" : p.numel.toLocaleString();
+  row.appendChild(numel);
+
+  const badge = document.createElement("span");
+  if (p.is_buffer) {
+    badge.className = "mt-param-badge buffer";
+    badge.textContent = "buffer";
+  } else if (p.trainable) {
+    badge.className = "mt-param-badge trainable";
+    badge.textContent = "train";
+  } else {
+    badge.className = "mt-param-badge frozen";
+    badge.textContent = "frozen";
+  }
+  row.appendChild(badge);
+
+  if (p.is_shared) {
+    const sharedBadge = document.createElement("span");
+    sharedBadge.className = "mt-param-badge shared";
+    sharedBadge.textContent = "shared";
+    row.appendChild(sharedBadge);
+  }
+
+  if (p.is_lazy) {
+    const lazyBadge = document.createElement("span");
+    lazyBadge.className = "mt-param-badge lazy";
+    lazyBadge.textContent = "lazy";
+    row.appendChild(lazyBadge);
+  }
+
+  if (p.dtype) {
+    const dtypeBadge = document.createElement("span");
+    dtypeBadge.className = "mt-param-badge dtype";
+    dtypeBadge.textContent = p.dtype;
+    row.appendChild(dtypeBadge);
+  }
+  return row;
+}
+
+// Parameter rows arrive lazily: the tree only carries param_entries and the
+// rows are requested from Python the first time a node is opened.
+function fillParams(paramsDiv, params) {
+  paramsDiv.innerHTML = "";
+  for (const p of params) paramsDiv.appendChild(buildParamRow(p));
+}
+
+function buildNode(node, depth, initialExpandDepth, root, requestParams) {
   const el = document.createElement("div");
   el.className = "mt-node";
 
   const hasChildren = node.children && node.children.length > 0;
-  const hasParams = node.params && node.params.length > 0;
+  const hasParams = (node.params && node.params.length > 0) || node.param_entries > 0;
   const hasWarnings = node.unregistered_warnings && node.unregistered_warnings.length > 0;
   const isLeaf = !hasChildren && !hasParams && !hasWarnings;
   const startExpanded = depth < initialExpandDepth;
@@ -43,13 +114,22 @@ function buildNode(node, depth, initialExpandDepth, rootTotal) {
   header.appendChild(name);
 
   // Type badge (only if name is present, otherwise type is already shown as name)
-  if (node.name) {
+  if (node.name && node.type) {
     const type = document.createElement("span");
     type.className = "mt-type";
     type.textContent = node.type;
     header.appendChild(type);
   }
 
+  // Repeated identical blocks are shown once
+  if (node.repeat > 1) {
+    const repeat = document.createElement("span");
+    repeat.className = "mt-repeat";
+    repeat.textContent = "\u00D7" + node.repeat;
+    repeat.title = node.repeat + " identical blocks; counts cover all of them";
+    header.appendChild(repeat);
+  }
+
   // Param count
   if (node.total_param_count > 0) {
     const count = document.createElement("span");
@@ -58,6 +138,25 @@ function buildNode(node, depth, initialExpandDepth, rootTotal) {
     header.appendChild(count);
   }
 
+  // Profile from ModuleTreeWidget.profile(): time, FLOPs and activations
+  if (node.profile) {
+    const p = node.profile;
+    const prof = document.createElement("span");
+    prof.className = "mt-profile";
+    const parts = [formatMs(p.time_ms)];
+    if (p.flops > 0) parts.push(formatCount(p.flops) + "FLOP");
+    prof.textContent = parts.join(" \u00B7 ");
+    prof.title =
+      "out " + p.output_shapes.map(formatShape).join(", ") +
+      "\nactivations " + formatBytes(p.activation_bytes) +
+      "\nself time " + formatMs(p.self_ms) +
+      (p.calls > 1 ? "\n" + p.calls + " calls" : "");
+    header.appendChild(prof);
+    // Highlight layers whose own time is a large share of the whole pass
+    const total = root.profile ? root.profile.time_ms : 0;
+    if (total > 0 && p.self_ms / total >= HOT_SHARE) header.classList.add("mt-hot");
+  }
+
   el.appendChild(header);
 
   // Body (collapsible)
@@ -66,63 +165,18 @@ function buildNode(node, depth, initialExpandDepth, rootTotal) {
     body.className = "mt-body" + (startExpanded ? "" : " collapsed");
 
     // Parameters
+    let loadParams = null;
     if (hasParams) {
       const paramsDiv = document.createElement("div");
       paramsDiv.className = "mt-params";
-      for (const p of node.params) {
-        const row = document.createElement("div");
-        row.className = "mt-param";
-
-        const pname = document.createElement("span");
-        pname.className = "mt-param-name";
-        pname.textContent = p.name;
-        row.appendChild(pname);
-
-        const shape = document.createElement("span");
-        shape.className = "mt-param-shape";
-        shape.textContent = p.is_lazy ? "uninitialized" : formatShape(p.shape);
-        row.appendChild(shape);
-
-        const numel = document.createElement("span");
-        numel.className = "mt-param-numel";
-        numel.textContent = p.is_lazy ? "—" : p.numel.toLocaleString();
-        row.appendChild(numel);
-
-        const badge = document.createElement("span");
-        if (p.is_buffer) {
-          badge.className = "mt-param-badge buffer";
-          badge.textContent = "buffer";
-        } else if (p.trainable) {
-          badge.className = "mt-param-badge trainable";
-          badge.textContent = "train";
-        } else {
-          badge.className = "mt-param-badge frozen";
-          badge.textContent = "frozen";
-        }
-        row.appendChild(badge);
-
-        if (p.is_shared) {
-          const sharedBadge = document.createElement("span");
-          sharedBadge.className = "mt-param-badge shared";
-          sharedBadge.textContent = "shared";
-          row.appendChild(sharedBadge);
-        }
-
-        if (p.is_lazy) {
-          const lazyBadge = document.createElement("span");
-          lazyBadge.className = "mt-param-badge lazy";
-          lazyBadge.textContent = "lazy";
-          row.appendChild(lazyBadge);
-        }
-
-        if (p.dtype) {
-          const dtypeBadge = document.createElement("span");
-          dtypeBadge.className = "mt-param-badge dtype";
-          dtypeBadge.textContent = p.dtype;
-          row.appendChild(dtypeBadge);
-        }
-
-        paramsDiv.appendChild(row);
+      if (node.params) {
+        fillParams(paramsDiv, node.params);
+      } else {
+        loadParams = () => {
+          loadParams = null;
+          requestParams(node.path, paramsDiv);
+        };
+        if (startExpanded) loadParams();
       }
       body.appendChild(paramsDiv);
     }
@@ -130,7 +184,7 @@ function buildNode(node, depth, initialExpandDepth, rootTotal) {
     // Children
     if (hasChildren) {
       for (const child of node.children) {
-        body.appendChild(buildNode(child, depth + 1, initialExpandDepth, rootTotal));
+        body.appendChild(buildNode(child, depth + 1, initialExpandDepth, root, requestParams));
       }
     }
 
@@ -148,9 +202,9 @@ function buildNode(node, depth, initialExpandDepth, rootTotal) {
 
     // Toggle click
     header.addEventListener("click", () => {
-      const isExpanded = !body.classList.contains("collapsed");
       body.classList.toggle("collapsed");
       toggle.classList.toggle("expanded");
+      if (loadParams && !body.classList.contains("collapsed")) loadParams();
     });
   }
 
@@ -192,8 +246,22 @@ function render({ model, el }) {
   const container = document.createElement("div");
   el.appendChild(container);
 
+  // path -> params container waiting for its rows
+  const pending = new Map();
+  function requestParams(path, paramsDiv) {
+    pending.set(path, paramsDiv);
+    model.send({ type: "params", path });
+  }
+  function onMessage(msg) {
+    if (!msg || msg.type !== "params" || !pending.has(msg.path)) return;
+    fillParams(pending.get(msg.path), msg.params || []);
+    pending.delete(msg.path);
+  }
+  model.on("msg:custom", onMessage);
+
   function draw() {
     container.innerHTML = "";
+    pending.clear();
     const tree = model.get("tree");
     const initialDepth = model.get("initial_expand_depth") || 1;
 
@@ -225,7 +293,7 @@ function render({ model, el }) {
     }
 
     container.appendChild(summary);
-    container.appendChild(buildNode(tree, 0, initialDepth, tree.total_param_count));
+    container.appendChild(buildNode(tree, 0, initialDepth, tree, requestParams));
   }
 
   draw();
@@ -233,6 +301,7 @@ function render({ model, el }) {
   model.on("change:initial_expand_depth", draw);
 
   return () => {
+    model.off("msg:custom", onMessage);
     observer.disconnect();
   };
 }
@@ -1 +1 @@
-var ie="http://www.w3.org/1999/xhtml",Oe={svg:"http://www.w3.org/2000/svg",xhtml:ie,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function pt(t){var e=t+="",r=e.indexOf(":");return r>=0&&(e=t.slice(0,r))!=="xmlns"&&(t=t.slice(r+1)),Oe.hasOwnProperty(e)?{space:Oe[e],local:t}:t}function Eo(t){return function(){var e=this.ownerDocument,r=this.namespaceURI;return r===ie&&e.documentElement.namespaceURI===ie?e.createElement(t):e.createElementNS(r,t)}}function No(t){return function(){return this.ownerDocument.createElementNS(t.space,t.local)}}function ae(t){var e=pt(t);return(e.local?No:Eo)(e)}function ko(){}function bt(t){return t==null?ko:function(){return this.querySelector(t)}}function ur(t){typeof t!="function"&&(t=bt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=new Array(a),l,u,f=0;f<a;++f)(l=i[f])&&(u=t.call(l,l.__data__,f,i))&&("__data__"in l&&(u.__data__=l.__data__),s[f]=u);return new X(n,this._parents)}function ze(t){return t==null?[]:Array.isArray(t)?t:Array.from(t)}function Ao(){return[]}function Bt(t){return t==null?Ao:function(){return this.querySelectorAll(t)}}function So(t){return function(){return ze(t.apply(this,arguments))}}function lr(t){typeof t=="function"?t=So(t):t=Bt(t);for(var e=this._groups,r=e.length,n=[],o=[],i=0;i<r;++i)for(var a=e[i],s=a.length,l,u=0;u<s;++u)(l=a[u])&&(n.push(t.call(l,l.__data__,u,a)),o.push(l));return new X(n,o)}function qt(t){return function(){return this.matches(t)}}function se(t){return function(e){return e.matches(t)}}var To=Array.prototype.find;function Io(t){return function(){return To.call(this.children,t)}}function Mo(){return this.firstElementChild}function fr(t){return this.select(t==null?Mo:Io(typeof t=="function"?t:se(t)))}var Co=Array.prototype.filter;function Ro(){return Array.from(this.children)}function Oo(t){return function(){return Co.call(this.children,t)}}function cr(t){return this.selectAll(t==null?Ro:Oo(typeof t=="function"?t:se(t)))}function hr(t){typeof t!="function"&&(t=qt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=[],l,u=0;u<a;++u)(l=i[u])&&t.call(l,l.__data__,u,i)&&s.push(l);return new X(n,this._parents)}function ue(t){return new Array(t.length)}function pr(){return new X(this._enter||this._groups.map(ue),this._parents)}function $t(t,e){this.ownerDocument=t.ownerDocument,this.namespaceURI=t.namespaceURI,this._next=null,this._parent=t,this.__data__=e}$t.prototype={constructor:$t,appendChild:function(t){return this._parent.insertBefore(t,this._next)},insertBefore:function(t,e){return this._parent.insertBefore(t,e)},querySelector:function(t){return this._parent.querySelector(t)},querySelectorAll:function(t){return this._parent.querySelectorAll(t)}};function mr(t){return function(){return t}}function zo(t,e,r,n,o,i){for(var a=0,s,l=e.length,u=i.length;a<u;++a)(s=e[a])?(s.__data__=i[a],n[a]=s):r[a]=new $t(t,i[a]);for(;a<l;++a)(s=e[a])&&(o[a]=s)}function Lo(t,e,r,n,o,i,a){var s,l,u=new Map,f=e.length,x=i.length,p=new Array(f),c;for(s=0;s<f;++s)(l=e[s])&&(p[s]=c=a.call(l,l.__data__,s,e)+"",u.has(c)?o[s]=l:u.set(c,l));for(s=0;s<x;++s)c=a.call(t,i[s],s,i)+"",(l=u.get(c))?(n[s]=l,l.__data__=i[s],u.delete(c)):r[s]=new $t(t,i[s]);for(s=0;s<f;++s)(l=e[s])&&u.get(p[s])===l&&(o[s]=l)}function Do(t){return t.__data__}function dr(t,e){if(!arguments.length)return Array.from(this,Do);var r=e?Lo:zo,n=this._parents,o=this._groups;typeof t!="function"&&(t=mr(t));for(var i=o.length,a=new Array(i),s=new Array(i),l=new Array(i),u=0;u<i;++u){var f=n[u],x=o[u],p=x.length,c=Po(t.call(f,f&&f.__data__,u,n)),w=c.length,g=s[u]=new Array(w),y=a[u]=new Array(w),d=l[u]=new Array(p);r(f,x,g,y,d,c,e);for(var b=0,A=0,h,E;b<w;++b)if(h=g[b]){for(b>=A&&(A=b+1);!(E=y[A])&&++A<w;);h._next=E||null}}return a=new X(a,n),a._enter=s,a._exit=l,a}function Po(t){return typeof t=="object"&&"length"in t?t:Array.from(t)}function xr(){return new X(this._exit||this._groups.map(ue),this._parents)}function gr(t,e,r){var n=this.enter(),o=this,i=this.exit();return typeof t=="function"?(n=t(n),n&&(n=n.selection())):n=n.append(t+""),e!=null&&(o=e(o),o&&(o=o.selection())),r==null?i.remove():r(i),n&&o?n.merge(o).order():o}function yr(t){for(var e=t.selection?t.selection():t,r=this._groups,n=e._groups,o=r.length,i=n.length,a=Math.min(o,i),s=new Array(o),l=0;l<a;++l)for(var u=r[l],f=n[l],x=u.length,p=s[l]=new Array(x),c,w=0;w<x;++w)(c=u[w]||f[w])&&(p[w]=c);for(;l<o;++l)s[l]=r[l];return new X(s,this._parents)}function vr(){for(var t=this._groups,e=-1,r=t.length;++e<r;)for(var n=t[e],o=n.length-1,i=n[o],a;--o>=0;)(a=n[o])&&(i&&a.compareDocumentPosition(i)^4&&i.parentNode.insertBefore(a,i),i=a);return this}function _r(t){t||(t=Bo);function e(x,p){return x&&p?t(x.__data__,p.__data__):!x-!p}for(var r=this._groups,n=r.length,o=new Array(n),i=0;i<n;++i){for(var a=r[i],s=a.length,l=o[i]=new Array(s),u,f=0;f<s;++f)(u=a[f])&&(l[f]=u);l.sort(e)}return new X(o,this._parents).order()}function Bo(t,e){return t<e?-1:t>e?1:t>=e?0:NaN}function wr(){var t=arguments[0];return arguments[0]=this,t.apply(null,arguments),this}function br(){return Array.from(this)}function Er(){for(var t=this._groups,e=0,r=t.length;e<r;++e)for(var n=t[e],o=0,i=n.length;o<i;++o){var a=n[o];if(a)return a}return null}function Nr(){let t=0;for(let e of this)++t;return t}function kr(){return!this.node()}function Ar(t){for(var e=this._groups,r=0,n=e.length;r<n;++r)for(var o=e[r],i=0,a=o.length,s;i<a;++i)(s=o[i])&&t.call(s,s.__data__,i,o);return this}function qo(t){return function(){this.removeAttribute(t)}}function $o(t){return function(){this.removeAttributeNS(t.space,t.local)}}function Yo(t,e){return function(){this.setAttribute(t,e)}}function Ho(t,e){return function(){this.setAttributeNS(t.space,t.local,e)}}function Go(t,e){return function(){var r=e.apply(this,arguments);r==null?this.removeAttribute(t):this.setAttribute(t,r)}}function Xo(t,e){return function(){var r=e.apply(this,arguments);r==null?this.removeAttributeNS(t.space,t.local):this.setAttributeNS(t.space,t.local,r)}}function Sr(t,e){var r=pt(t);if(arguments.length<2){var n=this.node();return r.local?n.getAttributeNS(r.space,r.local):n.getAttribute(r)}return this.each((e==null?r.local?$o:qo:typeof e=="function"?r.local?Xo:Go:r.local?Ho:Yo)(r,e))}function le(t){return t.ownerDocument&&t.ownerDocument.defaultView||t.document&&t||t.defaultView}function Fo(t){return function(){this.style.removeProperty(t)}}function Vo(t,e,r){return function(){this.style.setProperty(t,e,r)}}function Uo(t,e,r){return function(){var n=e.apply(this,arguments);n==null?this.style.removeProperty(t):this.style.setProperty(t,n,r)}}function Tr(t,e,r){return arguments.length>1?this.each((e==null?Fo:typeof e=="function"?Uo:Vo)(t,e,r??"")):yt(this.node(),t)}function yt(t,e){return t.style.getPropertyValue(e)||le(t).getComputedStyle(t,null).getPropertyValue(e)}function Ko(t){return function(){delete this[t]}}function jo(t,e){return function(){this[t]=e}}function Qo(t,e){return function(){var r=e.apply(this,arguments);r==null?delete this[t]:this[t]=r}}function Ir(t,e){return arguments.length>1?this.each((e==null?Ko:typeof e=="function"?Qo:jo)(t,e)):this.node()[t]}function Mr(t){return t.trim().split(/^|\s+/)}function Le(t){return t.classList||new Cr(t)}function Cr(t){this._node=t,this._names=Mr(t.getAttribute("class")||"")}Cr.prototype={add:function(t){var e=this._names.indexOf(t);e<0&&(this._names.push(t),this._node.setAttribute("class",this._names.join(" ")))},remove:function(t){var e=this._names.indexOf(t);e>=0&&(this._names.splice(e,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(t){return this._names.indexOf(t)>=0}};function Rr(t,e){for(var r=Le(t),n=-1,o=e.length;++n<o;)r.add(e[n])}function Or(t,e){for(var r=Le(t),n=-1,o=e.length;++n<o;)r.remove(e[n])}function Wo(t){return function(){Rr(this,t)}}function Zo(t){return function(){Or(this,t)}}function Jo(t,e){return function(){(e.apply(this,arguments)?Rr:Or)(this,t)}}function zr(t,e){var r=Mr(t+"");if(arguments.length<2){for(var n=Le(this.node()),o=-1,i=r.length;++o<i;)if(!n.contains(r[o]))return!1;return!0}return this.each((typeof e=="function"?Jo:e?Wo:Zo)(r,e))}function ti(){this.textContent=""}function ei(t){return function(){this.textContent=t}}function ri(t){return function(){var e=t.apply(this,arguments);this.textContent=e??""}}function Lr(t){return arguments.length?this.each(t==null?ti:(typeof t=="function"?ri:ei)(t)):this.node().textContent}function ni(){this.innerHTML=""}function oi(t){return function(){this.innerHTML=t}}function ii(t){return function(){var e=t.apply(this,arguments);this.innerHTML=e??""}}function Dr(t){return arguments.length?this.each(t==null?ni:(typeof t=="function"?ii:oi)(t)):this.node().innerHTML}function ai(){this.nextSibling&&this.parentNode.appendChild(this)}function Pr(){return this.each(ai)}function si(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function Br(){return this.each(si)}function qr(t){var e=typeof t=="function"?t:ae(t);return this.select(function(){return this.appendChild(e.apply(this,arguments))})}function ui(){return null}function $r(t,e){var r=typeof t=="function"?t:ae(t),n=e==null?ui:typeof e=="function"?e:bt(e);return this.select(function(){return this.insertBefore(r.apply(this,arguments),n.apply(this,arguments)||null)})}function li(){var t=this.parentNode;t&&t.removeChild(this)}function Yr(){return this.each(li)}function fi(){var t=this.cloneNode(!1),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function ci(){var t=this.cloneNode(!0),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function Hr(t){return this.select(t?ci:fi)}function Gr(t){return arguments.length?this.property("__data__",t):this.node().__data__}function hi(t){return function(e){t.call(this,e,this.__data__)}}function pi(t){return t.trim().split(/^|\s+/).map(function(e){var r="",n=e.indexOf(".");return n>=0&&(r=e.slice(n+1),e=e.slice(0,n)),{type:e,name:r}})}function mi(t){return function(){var e=this.__on;if(e){for(var r=0,n=-1,o=e.length,i;r<o;++r)i=e[r],(!t.type||i.type===t.type)&&i.name===t.name?this.removeEventListener(i.type,i.listener,i.options):e[++n]=i;++n?e.length=n:delete this.__on}}}function di(t,e,r){return function(){var n=this.__on,o,i=hi(e);if(n){for(var a=0,s=n.length;a<s;++a)if((o=n[a]).type===t.type&&o.name===t.name){this.removeEventListener(o.type,o.listener,o.options),this.addEventListener(o.type,o.listener=i,o.options=r),o.value=e;return}}this.addEventListener(t.type,i,r),o={type:t.type,name:t.name,value:e,listener:i,options:r},n?n.push(o):this.__on=[o]}}function Xr(t,e,r){var n=pi(t+""),o,i=n.length,a;if(arguments.length<2){var s=this.node().__on;if(s){for(var l=0,u=s.length,f;l<u;++l)for(o=0,f=s[l];o<i;++o)if((a=n[o]).type===f.type&&a.name===f.name)return f.value}return}for(s=e?di:mi,o=0;o<i;++o)this.each(s(n[o],e,r));return this}function Fr(t,e,r){var n=le(t),o=n.CustomEvent;typeof o=="function"?o=new o(e,r):(o=n.document.createEvent("Event"),r?(o.initEvent(e,r.bubbles,r.cancelable),o.detail=r.detail):o.initEvent(e,!1,!1)),t.dispatchEvent(o)}function xi(t,e){return function(){return Fr(this,t,e)}}function gi(t,e){return function(){return Fr(this,t,e.apply(this,arguments))}}function Vr(t,e){return this.each((typeof e=="function"?gi:xi)(t,e))}function*Ur(){for(var t=this._groups,e=0,r=t.length;e<r;++e)for(var n=t[e],o=0,i=n.length,a;o<i;++o)(a=n[o])&&(yield a)}var De=[null];function X(t,e){this._groups=t,this._parents=e}function Kr(){return new X([[document.documentElement]],De)}function yi(){return this}X.prototype=Kr.prototype={constructor:X,select:ur,selectAll:lr,selectChild:fr,selectChildren:cr,filter:hr,data:dr,enter:pr,exit:xr,join:gr,merge:yr,selection:yi,order:vr,sort:_r,call:wr,nodes:br,node:Er,size:Nr,empty:kr,each:Ar,attr:Sr,style:Tr,property:Ir,classed:zr,text:Lr,html:Dr,raise:Pr,lower:Br,append:qr,insert:$r,remove:Yr,clone:Hr,datum:Gr,on:Xr,dispatch:Vr,[Symbol.iterator]:Ur};var mt=Kr;function Z(t){return typeof t=="string"?new X([[document.querySelector(t)]],[document.documentElement]):new X([[t]],De)}function jr(t){let e;for(;e=t.sourceEvent;)t=e;return t}function nt(t,e){if(t=jr(t),e===void 0&&(e=t.currentTarget),e){var r=e.ownerSVGElement||e;if(r.createSVGPoint){var n=r.createSVGPoint();return n.x=t.clientX,n.y=t.clientY,n=n.matrixTransform(e.getScreenCTM().inverse()),[n.x,n.y]}if(e.getBoundingClientRect){var o=e.getBoundingClientRect();return[t.clientX-o.left-e.clientLeft,t.clientY-o.top-e.clientTop]}}return[t.pageX,t.pageY]}var vi={value:()=>{}};function Wr(){for(var t=0,e=arguments.length,r={},n;t<e;++t){if(!(n=arguments[t]+"")||n in r||/[\s.]/.test(n))throw new Error("illegal type: "+n);r[n]=[]}return new fe(r)}function fe(t){this._=t}function _i(t,e){return t.trim().split(/^|\s+/).map(function(r){var n="",o=r.indexOf(".");if(o>=0&&(n=r.slice(o+1),r=r.slice(0,o)),r&&!e.hasOwnProperty(r))throw new Error("unknown type: "+r);return{type:r,name:n}})}fe.prototype=Wr.prototype={constructor:fe,on:function(t,e){var r=this._,n=_i(t+"",r),o,i=-1,a=n.length;if(arguments.length<2){for(;++i<a;)if((o=(t=n[i]).type)&&(o=wi(r[o],t.name)))return o;return}if(e!=null&&typeof e!="function")throw new Error("invalid callback: "+e);for(;++i<a;)if(o=(t=n[i]).type)r[o]=Qr(r[o],t.name,e);else if(e==null)for(o in r)r[o]=Qr(r[o],t.name,null);return this},copy:function(){var t={},e=this._;for(var r in e)t[r]=e[r].slice();return new fe(t)},call:function(t,e){if((o=arguments.length-2)>0)for(var r=new Array(o),n=0,o,i;n<o;++n)r[n]=arguments[n+2];if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(i=this._[t],n=0,o=i.length;n<o;++n)i[n].value.apply(e,r)},apply:function(t,e,r){if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(var n=this._[t],o=0,i=n.length;o<i;++o)n[o].value.apply(e,r)}};function wi(t,e){for(var r=0,n=t.length,o;r<n;++r)if((o=t[r]).name===e)return o.value}function Qr(t,e,r){for(var n=0,o=t.length;n<o;++n)if(t[n].name===e){t[n]=vi,t=t.slice(0,n).concat(t.slice(n+1));break}return r!=null&&t.push({name:e,value:r}),t}var dt=Wr;var Zr={passive:!1},Et={capture:!0,passive:!1};function ce(t){t.stopImmediatePropagation()}function vt(t){t.preventDefault(),t.stopImmediatePropagation()}function Yt(t){var e=t.document.documentElement,r=Z(t).on("dragstart.drag",vt,Et);"onselectstart"in e?r.on("selectstart.drag",vt,Et):(e.__noselect=e.style.MozUserSelect,e.style.MozUserSelect="none")}function Ht(t,e){var r=t.document.documentElement,n=Z(t).on("dragstart.drag",null);e&&(n.on("click.drag",vt,Et),setTimeout(function(){n.on("click.drag",null)},0)),"onselectstart"in r?n.on("selectstart.drag",null):(r.style.MozUserSelect=r.__noselect,delete r.__noselect)}var Gt=t=>()=>t;function Xt(t,{sourceEvent:e,subject:r,target:n,identifier:o,active:i,x:a,y:s,dx:l,dy:u,dispatch:f}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},subject:{value:r,enumerable:!0,configurable:!0},target:{value:n,enumerable:!0,configurable:!0},identifier:{value:o,enumerable:!0,configurable:!0},active:{value:i,enumerable:!0,configurable:!0},x:{value:a,enumerable:!0,configurable:!0},y:{value:s,enumerable:!0,configurable:!0},dx:{value:l,enumerable:!0,configurable:!0},dy:{value:u,enumerable:!0,configurable:!0},_:{value:f}})}Xt.prototype.on=function(){var t=this._.on.apply(this._,arguments);return t===this._?this:t};function bi(t){return!t.ctrlKey&&!t.button}function Ei(){return this.parentNode}function Ni(t,e){return e??{x:t.x,y:t.y}}function ki(){return navigator.maxTouchPoints||"ontouchstart"in this}function Pe(){var t=bi,e=Ei,r=Ni,n=ki,o={},i=dt("start","drag","end"),a=0,s,l,u,f,x=0;function p(h){h.on("mousedown.drag",c).filter(n).on("touchstart.drag",y).on("touchmove.drag",d,Zr).on("touchend.drag touchcancel.drag",b).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function c(h,E){if(!(f||!t.call(this,h,E))){var I=A(this,e.call(this,h,E),h,E,"mouse");I&&(Z(h.view).on("mousemove.drag",w,Et).on("mouseup.drag",g,Et),Yt(h.view),ce(h),u=!1,s=h.clientX,l=h.clientY,I("start",h))}}function w(h){if(vt(h),!u){var E=h.clientX-s,I=h.clientY-l;u=E*E+I*I>x}o.mouse("drag",h)}function g(h){Z(h.view).on("mousemove.drag mouseup.drag",null),Ht(h.view,u),vt(h),o.mouse("end",h)}function y(h,E){if(t.call(this,h,E)){var I=h.changedTouches,S=e.call(this,h,E),M=I.length,L,D;for(L=0;L<M;++L)(D=A(this,S,h,E,I[L].identifier,I[L]))&&(ce(h),D("start",h,I[L]))}}function d(h){var E=h.changedTouches,I=E.length,S,M;for(S=0;S<I;++S)(M=o[E[S].identifier])&&(vt(h),M("drag",h,E[S]))}function b(h){var E=h.changedTouches,I=E.length,S,M;for(f&&clearTimeout(f),f=setTimeout(function(){f=null},500),S=0;S<I;++S)(M=o[E[S].identifier])&&(ce(h),M("end",h,E[S]))}function A(h,E,I,S,M,L){var D=i.copy(),$=nt(L||I,E),U,Q,m;if((m=r.call(h,new Xt("beforestart",{sourceEvent:I,target:p,identifier:M,active:a,x:$[0],y:$[1],dx:0,dy:0,dispatch:D}),S))!=null)return U=m.x-$[0]||0,Q=m.y-$[1]||0,function N(v,k,R){var O=$,z;switch(v){case"start":o[M]=N,z=a++;break;case"end":delete o[M],--a;case"drag":$=nt(R||k,E),z=a;break}D.call(v,h,new Xt(v,{sourceEvent:k,subject:m,target:p,identifier:M,active:z,x:$[0]+U,y:$[1]+Q,dx:$[0]-O[0],dy:$[1]-O[1],dispatch:D}),S)}}return p.filter=function(h){return arguments.length?(t=typeof h=="function"?h:Gt(!!h),p):t},p.container=function(h){return arguments.length?(e=typeof h=="function"?h:Gt(h),p):e},p.subject=function(h){return arguments.length?(r=typeof h=="function"?h:Gt(h),p):r},p.touchable=function(h){return arguments.length?(n=typeof h=="function"?h:Gt(!!h),p):n},p.on=function(){var h=i.on.apply(i,arguments);return h===i?p:h},p.clickDistance=function(h){return arguments.length?(x=(h=+h)*h,p):Math.sqrt(x)},p}var Ct=class extends Map{constructor(e,r=Ti){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:r}}),e!=null)for(let[n,o]of e)this.set(n,o)}get(e){return super.get(Jr(this,e))}has(e){return super.has(Jr(this,e))}set(e,r){return super.set(Ai(this,e),r)}delete(e){return super.delete(Si(this,e))}};function Jr({_intern:t,_key:e},r){let n=e(r);return t.has(n)?t.get(n):r}function Ai({_intern:t,_key:e},r){let n=e(r);return t.has(n)?t.get(n):(t.set(n,r),r)}function Si({_intern:t,_key:e},r){let n=e(r);return t.has(n)&&(r=t.get(n),t.delete(n)),r}function Ti(t){return t!==null&&typeof t=="object"?t.valueOf():t}function Be(t,e){var r,n=1;t==null&&(t=0),e==null&&(e=0);function o(){var i,a=r.length,s,l=0,u=0;for(i=0;i<a;++i)s=r[i],l+=s.x,u+=s.y;for(l=(l/a-t)*n,u=(u/a-e)*n,i=0;i<a;++i)s=r[i],s.x-=l,s.y-=u}return o.initialize=function(i){r=i},o.x=function(i){return arguments.length?(t=+i,o):t},o.y=function(i){return arguments.length?(e=+i,o):e},o.strength=function(i){return arguments.length?(n=+i,o):n},o}function tn(t){let e=+this._x.call(null,t),r=+this._y.call(null,t);return en(this.cover(e,r),e,r,t)}function en(t,e,r,n){if(isNaN(e)||isNaN(r))return t;var o,i=t._root,a={data:n},s=t._x0,l=t._y0,u=t._x1,f=t._y1,x,p,c,w,g,y,d,b;if(!i)return t._root=a,t;for(;i.length;)if((g=e>=(x=(s+u)/2))?s=x:u=x,(y=r>=(p=(l+f)/2))?l=p:f=p,o=i,!(i=i[d=y<<1|g]))return o[d]=a,t;if(c=+t._x.call(null,i.data),w=+t._y.call(null,i.data),e===c&&r===w)return a.next=i,o?o[d]=a:t._root=a,t;do o=o?o[d]=new Array(4):t._root=new Array(4),(g=e>=(x=(s+u)/2))?s=x:u=x,(y=r>=(p=(l+f)/2))?l=p:f=p;while((d=y<<1|g)===(b=(w>=p)<<1|c>=x));return o[b]=i,o[d]=a,t}function rn(t){var e,r,n=t.length,o,i,a=new Array(n),s=new Array(n),l=1/0,u=1/0,f=-1/0,x=-1/0;for(r=0;r<n;++r)isNaN(o=+this._x.call(null,e=t[r]))||isNaN(i=+this._y.call(null,e))||(a[r]=o,s[r]=i,o<l&&(l=o),o>f&&(f=o),i<u&&(u=i),i>x&&(x=i));if(l>f||u>x)return this;for(this.cover(l,u).cover(f,x),r=0;r<n;++r)en(this,a[r],s[r],t[r]);return this}function nn(t,e){if(isNaN(t=+t)||isNaN(e=+e))return this;var r=this._x0,n=this._y0,o=this._x1,i=this._y1;if(isNaN(r))o=(r=Math.floor(t))+1,i=(n=Math.floor(e))+1;else{for(var a=o-r||1,s=this._root,l,u;r>t||t>=o||n>e||e>=i;)switch(u=(e<n)<<1|t<r,l=new Array(4),l[u]=s,s=l,a*=2,u){case 0:o=r+a,i=n+a;break;case 1:r=o-a,i=n+a;break;case 2:o=r+a,n=i-a;break;case 3:r=o-a,n=i-a;break}this._root&&this._root.length&&(this._root=s)}return this._x0=r,this._y0=n,this._x1=o,this._y1=i,this}function on(){var t=[];return this.visit(function(e){if(!e.length)do t.push(e.data);while(e=e.next)}),t}function an(t){return arguments.length?this.cover(+t[0][0],+t[0][1]).cover(+t[1][0],+t[1][1]):isNaN(this._x0)?void 0:[[this._x0,this._y0],[this._x1,this._y1]]}function K(t,e,r,n,o){this.node=t,this.x0=e,this.y0=r,this.x1=n,this.y1=o}function sn(t,e,r){var n,o=this._x0,i=this._y0,a,s,l,u,f=this._x1,x=this._y1,p=[],c=this._root,w,g;for(c&&p.push(new K(c,o,i,f,x)),r==null?r=1/0:(o=t-r,i=e-r,f=t+r,x=e+r,r*=r);w=p.pop();)if(!(!(c=w.node)||(a=w.x0)>f||(s=w.y0)>x||(l=w.x1)<o||(u=w.y1)<i))if(c.length){var y=(a+l)/2,d=(s+u)/2;p.push(new K(c[3],y,d,l,u),new K(c[2],a,d,y,u),new K(c[1],y,s,l,d),new K(c[0],a,s,y,d)),(g=(e>=d)<<1|t>=y)&&(w=p[p.length-1],p[p.length-1]=p[p.length-1-g],p[p.length-1-g]=w)}else{var b=t-+this._x.call(null,c.data),A=e-+this._y.call(null,c.data),h=b*b+A*A;if(h<r){var E=Math.sqrt(r=h);o=t-E,i=e-E,f=t+E,x=e+E,n=c.data}}return n}function un(t){if(isNaN(f=+this._x.call(null,t))||isNaN(x=+this._y.call(null,t)))return this;var e,r=this._root,n,o,i,a=this._x0,s=this._y0,l=this._x1,u=this._y1,f,x,p,c,w,g,y,d;if(!r)return this;if(r.length)for(;;){if((w=f>=(p=(a+l)/2))?a=p:l=p,(g=x>=(c=(s+u)/2))?s=c:u=c,e=r,!(r=r[y=g<<1|w]))return this;if(!r.length)break;(e[y+1&3]||e[y+2&3]||e[y+3&3])&&(n=e,d=y)}for(;r.data!==t;)if(o=r,!(r=r.next))return this;return(i=r.next)&&delete r.next,o?(i?o.next=i:delete o.next,this):e?(i?e[y]=i:delete e[y],(r=e[0]||e[1]||e[2]||e[3])&&r===(e[3]||e[2]||e[1]||e[0])&&!r.length&&(n?n[d]=r:this._root=r),this):(this._root=i,this)}function ln(t){for(var e=0,r=t.length;e<r;++e)this.remove(t[e]);return this}function fn(){return this._root}function cn(){var t=0;return this.visit(function(e){if(!e.length)do++t;while(e=e.next)}),t}function hn(t){var e=[],r,n=this._root,o,i,a,s,l;for(n&&e.push(new K(n,this._x0,this._y0,this._x1,this._y1));r=e.pop();)if(!t(n=r.node,i=r.x0,a=r.y0,s=r.x1,l=r.y1)&&n.length){var u=(i+s)/2,f=(a+l)/2;(o=n[3])&&e.push(new K(o,u,f,s,l)),(o=n[2])&&e.push(new K(o,i,f,u,l)),(o=n[1])&&e.push(new K(o,u,a,s,f)),(o=n[0])&&e.push(new K(o,i,a,u,f))}return this}function pn(t){var e=[],r=[],n;for(this._root&&e.push(new K(this._root,this._x0,this._y0,this._x1,this._y1));n=e.pop();){var o=n.node;if(o.length){var i,a=n.x0,s=n.y0,l=n.x1,u=n.y1,f=(a+l)/2,x=(s+u)/2;(i=o[0])&&e.push(new K(i,a,s,f,x)),(i=o[1])&&e.push(new K(i,f,s,l,x)),(i=o[2])&&e.push(new K(i,a,x,f,u)),(i=o[3])&&e.push(new K(i,f,x,l,u))}r.push(n)}for(;n=r.pop();)t(n.node,n.x0,n.y0,n.x1,n.y1);return this}function mn(t){return t[0]}function dn(t){return arguments.length?(this._x=t,this):this._x}function xn(t){return t[1]}function gn(t){return arguments.length?(this._y=t,this):this._y}function Nt(t,e,r){var n=new qe(e??mn,r??xn,NaN,NaN,NaN,NaN);return t==null?n:n.addAll(t)}function qe(t,e,r,n,o,i){this._x=t,this._y=e,this._x0=r,this._y0=n,this._x1=o,this._y1=i,this._root=void 0}function yn(t){for(var e={data:t.data},r=e;t=t.next;)r=r.next={data:t.data};return e}var J=Nt.prototype=qe.prototype;J.copy=function(){var t=new qe(this._x,this._y,this._x0,this._y0,this._x1,this._y1),e=this._root,r,n;if(!e)return t;if(!e.length)return t._root=yn(e),t;for(r=[{source:e,target:t._root=new Array(4)}];e=r.pop();)for(var o=0;o<4;++o)(n=e.source[o])&&(n.length?r.push({source:n,target:e.target[o]=new Array(4)}):e.target[o]=yn(n));return t};J.add=tn;J.addAll=rn;J.cover=nn;J.data=on;J.extent=an;J.find=sn;J.remove=un;J.removeAll=ln;J.root=fn;J.size=cn;J.visit=hn;J.visitAfter=pn;J.x=dn;J.y=gn;function ft(t){return function(){return t}}function st(t){return(t()-.5)*1e-6}function Ii(t){return t.x+t.vx}function Mi(t){return t.y+t.vy}function $e(t){var e,r,n,o=1,i=1;typeof t!="function"&&(t=ft(t==null?1:+t));function a(){for(var u,f=e.length,x,p,c,w,g,y,d=0;d<i;++d)for(x=Nt(e,Ii,Mi).visitAfter(s),u=0;u<f;++u)p=e[u],g=r[p.index],y=g*g,c=p.x+p.vx,w=p.y+p.vy,x.visit(b);function b(A,h,E,I,S){var M=A.data,L=A.r,D=g+L;if(M){if(M.index>p.index){var $=c-M.x-M.vx,U=w-M.y-M.vy,Q=$*$+U*U;Q<D*D&&($===0&&($=st(n),Q+=$*$),U===0&&(U=st(n),Q+=U*U),Q=(D-(Q=Math.sqrt(Q)))/Q*o,p.vx+=($*=Q)*(D=(L*=L)/(y+L)),p.vy+=(U*=Q)*D,M.vx-=$*(D=1-D),M.vy-=U*D)}return}return h>c+D||I<c-D||E>w+D||S<w-D}}function s(u){if(u.data)return u.r=r[u.data.index];for(var f=u.r=0;f<4;++f)u[f]&&u[f].r>u.r&&(u.r=u[f].r)}function l(){if(e){var u,f=e.length,x;for(r=new Array(f),u=0;u<f;++u)x=e[u],r[x.index]=+t(x,u,e)}}return a.initialize=function(u,f){e=u,n=f,l()},a.iterations=function(u){return arguments.length?(i=+u,a):i},a.strength=function(u){return arguments.length?(o=+u,a):o},a.radius=function(u){return arguments.length?(t=typeof u=="function"?u:ft(+u),l(),a):t},a}function Ci(t){return t.index}function vn(t,e){var r=t.get(e);if(!r)throw new Error("node not found: "+e);return r}function Ye(t){var e=Ci,r=x,n,o=ft(30),i,a,s,l,u,f=1;t==null&&(t=[]);function x(y){return 1/Math.min(s[y.source.index],s[y.target.index])}function p(y){for(var d=0,b=t.length;d<f;++d)for(var A=0,h,E,I,S,M,L,D;A<b;++A)h=t[A],E=h.source,I=h.target,S=I.x+I.vx-E.x-E.vx||st(u),M=I.y+I.vy-E.y-E.vy||st(u),L=Math.sqrt(S*S+M*M),L=(L-i[A])/L*y*n[A],S*=L,M*=L,I.vx-=S*(D=l[A]),I.vy-=M*D,E.vx+=S*(D=1-D),E.vy+=M*D}function c(){if(a){var y,d=a.length,b=t.length,A=new Map(a.map((E,I)=>[e(E,I,a),E])),h;for(y=0,s=new Array(d);y<b;++y)h=t[y],h.index=y,typeof h.source!="object"&&(h.source=vn(A,h.source)),typeof h.target!="object"&&(h.target=vn(A,h.target)),s[h.source.index]=(s[h.source.index]||0)+1,s[h.target.index]=(s[h.target.index]||0)+1;for(y=0,l=new Array(b);y<b;++y)h=t[y],l[y]=s[h.source.index]/(s[h.source.index]+s[h.target.index]);n=new Array(b),w(),i=new Array(b),g()}}function w(){if(a)for(var y=0,d=t.length;y<d;++y)n[y]=+r(t[y],y,t)}function g(){if(a)for(var y=0,d=t.length;y<d;++y)i[y]=+o(t[y],y,t)}return p.initialize=function(y,d){a=y,u=d,c()},p.links=function(y){return arguments.length?(t=y,c(),p):t},p.id=function(y){return arguments.length?(e=y,p):e},p.iterations=function(y){return arguments.length?(f=+y,p):f},p.strength=function(y){return arguments.length?(r=typeof y=="function"?y:ft(+y),w(),p):r},p.distance=function(y){return arguments.length?(o=typeof y=="function"?y:ft(+y),g(),p):o},p}var Rt=0,Vt=0,Ft=0,wn=1e3,he,Ut,pe=0,kt=0,me=0,Kt=typeof performance=="object"&&performance.now?performance:Date,bn=typeof window=="object"&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(t){setTimeout(t,17)};function Qt(){return kt||(bn(Ri),kt=Kt.now()+me)}function Ri(){kt=0}function jt(){this._call=this._time=this._next=null}jt.prototype=Ot.prototype={constructor:jt,restart:function(t,e,r){if(typeof t!="function")throw new TypeError("callback is not a function");r=(r==null?Qt():+r)+(e==null?0:+e),!this._next&&Ut!==this&&(Ut?Ut._next=this:he=this,Ut=this),this._call=t,this._time=r,He()},stop:function(){this._call&&(this._call=null,this._time=1/0,He())}};function Ot(t,e,r){var n=new jt;return n.restart(t,e,r),n}function En(){Qt(),++Rt;for(var t=he,e;t;)(e=kt-t._time)>=0&&t._call.call(void 0,e),t=t._next;--Rt}function _n(){kt=(pe=Kt.now())+me,Rt=Vt=0;try{En()}finally{Rt=0,zi(),kt=0}}function Oi(){var t=Kt.now(),e=t-pe;e>wn&&(me-=e,pe=t)}function zi(){for(var t,e=he,r,n=1/0;e;)e._call?(n>e._time&&(n=e._time),t=e,e=e._next):(r=e._next,e._next=null,e=t?t._next=r:he=r);Ut=t,He(n)}function He(t){if(!Rt){Vt&&(Vt=clearTimeout(Vt));var e=t-kt;e>24?(t<1/0&&(Vt=setTimeout(_n,t-Kt.now()-me)),Ft&&(Ft=clearInterval(Ft))):(Ft||(pe=Kt.now(),Ft=setInterval(Oi,wn)),Rt=1,bn(_n))}}function de(t,e,r){var n=new jt;return e=e==null?0:+e,n.restart(o=>{n.stop(),t(o+e)},e,r),n}function Nn(){let t=1;return()=>(t=(1664525*t+1013904223)%4294967296)/4294967296}function kn(t){return t.x}function An(t){return t.y}var Li=10,Di=Math.PI*(3-Math.sqrt(5));function Ge(t){var e,r=1,n=.001,o=1-Math.pow(n,1/300),i=0,a=.6,s=new Map,l=Ot(x),u=dt("tick","end"),f=Nn();t==null&&(t=[]);function x(){p(),u.call("tick",e),r<n&&(l.stop(),u.call("end",e))}function p(g){var y,d=t.length,b;g===void 0&&(g=1);for(var A=0;A<g;++A)for(r+=(i-r)*o,s.forEach(function(h){h(r)}),y=0;y<d;++y)b=t[y],b.fx==null?b.x+=b.vx*=a:(b.x=b.fx,b.vx=0),b.fy==null?b.y+=b.vy*=a:(b.y=b.fy,b.vy=0);return e}function c(){for(var g=0,y=t.length,d;g<y;++g){if(d=t[g],d.index=g,d.fx!=null&&(d.x=d.fx),d.fy!=null&&(d.y=d.fy),isNaN(d.x)||isNaN(d.y)){var b=Li*Math.sqrt(.5+g),A=g*Di;d.x=b*Math.cos(A),d.y=b*Math.sin(A)}(isNaN(d.vx)||isNaN(d.vy))&&(d.vx=d.vy=0)}}function w(g){return g.initialize&&g.initialize(t,f),g}return c(),e={tick:p,restart:function(){return l.restart(x),e},stop:function(){return l.stop(),e},nodes:function(g){return arguments.length?(t=g,c(),s.forEach(w),e):t},alpha:function(g){return arguments.length?(r=+g,e):r},alphaMin:function(g){return arguments.length?(n=+g,e):n},alphaDecay:function(g){return arguments.length?(o=+g,e):+o},alphaTarget:function(g){return arguments.length?(i=+g,e):i},velocityDecay:function(g){return arguments.length?(a=1-g,e):1-a},randomSource:function(g){return arguments.length?(f=g,s.forEach(w),e):f},force:function(g,y){return arguments.length>1?(y==null?s.delete(g):s.set(g,w(y)),e):s.get(g)},find:function(g,y,d){var b=0,A=t.length,h,E,I,S,M;for(d==null?d=1/0:d*=d,b=0;b<A;++b)S=t[b],h=g-S.x,E=y-S.y,I=h*h+E*E,I<d&&(M=S,d=I);return M},on:function(g,y){return arguments.length>1?(u.on(g,y),e):u.on(g)}}}function Xe(){var t,e,r,n,o=ft(-30),i,a=1,s=1/0,l=.81;function u(c){var w,g=t.length,y=Nt(t,kn,An).visitAfter(x);for(n=c,w=0;w<g;++w)e=t[w],y.visit(p)}function f(){if(t){var c,w=t.length,g;for(i=new Array(w),c=0;c<w;++c)g=t[c],i[g.index]=+o(g,c,t)}}function x(c){var w=0,g,y,d=0,b,A,h;if(c.length){for(b=A=h=0;h<4;++h)(g=c[h])&&(y=Math.abs(g.value))&&(w+=g.value,d+=y,b+=y*g.x,A+=y*g.y);c.x=b/d,c.y=A/d}else{g=c,g.x=g.data.x,g.y=g.data.y;do w+=i[g.data.index];while(g=g.next)}c.value=w}function p(c,w,g,y){if(!c.value)return!0;var d=c.x-e.x,b=c.y-e.y,A=y-w,h=d*d+b*b;if(A*A/l<h)return h<s&&(d===0&&(d=st(r),h+=d*d),b===0&&(b=st(r),h+=b*b),h<a&&(h=Math.sqrt(a*h)),e.vx+=d*c.value*n/h,e.vy+=b*c.value*n/h),!0;if(c.length||h>=s)return;(c.data!==e||c.next)&&(d===0&&(d=st(r),h+=d*d),b===0&&(b=st(r),h+=b*b),h<a&&(h=Math.sqrt(a*h)));do c.data!==e&&(A=i[c.data.index]*n/h,e.vx+=d*A,e.vy+=b*A);while(c=c.next)}return u.initialize=function(c,w){t=c,r=w,f()},u.strength=function(c){return arguments.length?(o=typeof c=="function"?c:ft(+c),f(),u):o},u.distanceMin=function(c){return arguments.length?(a=c*c,u):Math.sqrt(a)},u.distanceMax=function(c){return arguments.length?(s=c*c,u):Math.sqrt(s)},u.theta=function(c){return arguments.length?(l=c*c,u):Math.sqrt(l)},u}function Sn(t,e){switch(arguments.length){case 0:break;case 1:this.range(t);break;default:this.range(e).domain(t);break}return this}var Fe=Symbol("implicit");function Wt(){var t=new Ct,e=[],r=[],n=Fe;function o(i){let a=t.get(i);if(a===void 0){if(n!==Fe)return n;t.set(i,a=e.push(i)-1)}return r[a%r.length]}return o.domain=function(i){if(!arguments.length)return e.slice();e=[],t=new Ct;for(let a of i)t.has(a)||t.set(a,e.push(a)-1);return o},o.range=function(i){return arguments.length?(r=Array.from(i),o):r.slice()},o.unknown=function(i){return arguments.length?(n=i,o):n},o.copy=function(){return Wt(e,r).unknown(n)},Sn.apply(o,arguments),o}function xe(t,e,r){t.prototype=e.prototype=r,r.constructor=t}function Ve(t,e){var r=Object.create(t.prototype);for(var n in e)r[n]=e[n];return r}function te(){}var Zt=.7,ve=1/Zt,zt="\\s*([+-]?\\d+)\\s*",Jt="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",ct="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",Pi=/^#([0-9a-f]{3,8})$/,Bi=new RegExp(`^rgb\\(${zt},${zt},${zt}\\)$`),qi=new RegExp(`^rgb\\(${ct},${ct},${ct}\\)$`),$i=new RegExp(`^rgba\\(${zt},${zt},${zt},${Jt}\\)$`),Yi=new RegExp(`^rgba\\(${ct},${ct},${ct},${Jt}\\)$`),Hi=new RegExp(`^hsl\\(${Jt},${ct},${ct}\\)$`),Gi=new RegExp(`^hsla\\(${Jt},${ct},${ct},${Jt}\\)$`),Tn={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};xe(te,_t,{copy(t){return Object.assign(new this.constructor,this,t)},displayable(){return this.rgb().displayable()},hex:In,formatHex:In,formatHex8:Xi,formatHsl:Fi,formatRgb:Mn,toString:Mn});function In(){return this.rgb().formatHex()}function Xi(){return this.rgb().formatHex8()}function Fi(){return Dn(this).formatHsl()}function Mn(){return this.rgb().formatRgb()}function _t(t){var e,r;return t=(t+"").trim().toLowerCase(),(e=Pi.exec(t))?(r=e[1].length,e=parseInt(e[1],16),r===6?Cn(e):r===3?new et(e>>8&15|e>>4&240,e>>4&15|e&240,(e&15)<<4|e&15,1):r===8?ge(e>>24&255,e>>16&255,e>>8&255,(e&255)/255):r===4?ge(e>>12&15|e>>8&240,e>>8&15|e>>4&240,e>>4&15|e&240,((e&15)<<4|e&15)/255):null):(e=Bi.exec(t))?new et(e[1],e[2],e[3],1):(e=qi.exec(t))?new et(e[1]*255/100,e[2]*255/100,e[3]*255/100,1):(e=$i.exec(t))?ge(e[1],e[2],e[3],e[4]):(e=Yi.exec(t))?ge(e[1]*255/100,e[2]*255/100,e[3]*255/100,e[4]):(e=Hi.exec(t))?zn(e[1],e[2]/100,e[3]/100,1):(e=Gi.exec(t))?zn(e[1],e[2]/100,e[3]/100,e[4]):Tn.hasOwnProperty(t)?Cn(Tn[t]):t==="transparent"?new et(NaN,NaN,NaN,0):null}function Cn(t){return new et(t>>16&255,t>>8&255,t&255,1)}function ge(t,e,r,n){return n<=0&&(t=e=r=NaN),new et(t,e,r,n)}function Vi(t){return t instanceof te||(t=_t(t)),t?(t=t.rgb(),new et(t.r,t.g,t.b,t.opacity)):new et}function Lt(t,e,r,n){return arguments.length===1?Vi(t):new et(t,e,r,n??1)}function et(t,e,r,n){this.r=+t,this.g=+e,this.b=+r,this.opacity=+n}xe(et,Lt,Ve(te,{brighter(t){return t=t==null?ve:Math.pow(ve,t),new et(this.r*t,this.g*t,this.b*t,this.opacity)},darker(t){return t=t==null?Zt:Math.pow(Zt,t),new et(this.r*t,this.g*t,this.b*t,this.opacity)},rgb(){return this},clamp(){return new et(St(this.r),St(this.g),St(this.b),_e(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:Rn,formatHex:Rn,formatHex8:Ui,formatRgb:On,toString:On}));function Rn(){return`#${At(this.r)}${At(this.g)}${At(this.b)}`}function Ui(){return`#${At(this.r)}${At(this.g)}${At(this.b)}${At((isNaN(this.opacity)?1:this.opacity)*255)}`}function On(){let t=_e(this.opacity);return`${t===1?"rgb(":"rgba("}${St(this.r)}, ${St(this.g)}, ${St(this.b)}${t===1?")":`, ${t})`}`}function _e(t){return isNaN(t)?1:Math.max(0,Math.min(1,t))}function St(t){return Math.max(0,Math.min(255,Math.round(t)||0))}function At(t){return t=St(t),(t<16?"0":"")+t.toString(16)}function zn(t,e,r,n){return n<=0?t=e=r=NaN:r<=0||r>=1?t=e=NaN:e<=0&&(t=NaN),new ut(t,e,r,n)}function Dn(t){if(t instanceof ut)return new ut(t.h,t.s,t.l,t.opacity);if(t instanceof te||(t=_t(t)),!t)return new ut;if(t instanceof ut)return t;t=t.rgb();var e=t.r/255,r=t.g/255,n=t.b/255,o=Math.min(e,r,n),i=Math.max(e,r,n),a=NaN,s=i-o,l=(i+o)/2;return s?(e===i?a=(r-n)/s+(r<n)*6:r===i?a=(n-e)/s+2:a=(e-r)/s+4,s/=l<.5?i+o:2-i-o,a*=60):s=l>0&&l<1?0:a,new ut(a,s,l,t.opacity)}function Pn(t,e,r,n){return arguments.length===1?Dn(t):new ut(t,e,r,n??1)}function ut(t,e,r,n){this.h=+t,this.s=+e,this.l=+r,this.opacity=+n}xe(ut,Pn,Ve(te,{brighter(t){return t=t==null?ve:Math.pow(ve,t),new ut(this.h,this.s,this.l*t,this.opacity)},darker(t){return t=t==null?Zt:Math.pow(Zt,t),new ut(this.h,this.s,this.l*t,this.opacity)},rgb(){var t=this.h%360+(this.h<0)*360,e=isNaN(t)||isNaN(this.s)?0:this.s,r=this.l,n=r+(r<.5?r:1-r)*e,o=2*r-n;return new et(Ue(t>=240?t-240:t+120,o,n),Ue(t,o,n),Ue(t<120?t+240:t-120,o,n),this.opacity)},clamp(){return new ut(Ln(this.h),ye(this.s),ye(this.l),_e(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){let t=_e(this.opacity);return`${t===1?"hsl(":"hsla("}${Ln(this.h)}, ${ye(this.s)*100}%, ${ye(this.l)*100}%${t===1?")":`, ${t})`}`}}));function Ln(t){return t=(t||0)%360,t<0?t+360:t}function ye(t){return Math.max(0,Math.min(1,t||0))}function Ue(t,e,r){return(t<60?e+(r-e)*t/60:t<180?r:t<240?e+(r-e)*(240-t)/60:e)*255}function Ke(t,e,r,n,o){var i=t*t,a=i*t;return((1-3*t+3*i-a)*e+(4-6*i+3*a)*r+(1+3*t+3*i-3*a)*n+a*o)/6}function Bn(t){var e=t.length-1;return function(r){var n=r<=0?r=0:r>=1?(r=1,e-1):Math.floor(r*e),o=t[n],i=t[n+1],a=n>0?t[n-1]:2*o-i,s=n<e-1?t[n+2]:2*i-o;return Ke((r-n/e)*e,a,o,i,s)}}function qn(t){var e=t.length;return function(r){var n=Math.floor(((r%=1)<0?++r:r)*e),o=t[(n+e-1)%e],i=t[n%e],a=t[(n+1)%e],s=t[(n+2)%e];return Ke((r-n/e)*e,o,i,a,s)}}var je=t=>()=>t;function Ki(t,e){return function(r){return t+r*e}}function ji(t,e,r){return t=Math.pow(t,r),e=Math.pow(e,r)-t,r=1/r,function(n){return Math.pow(t+n*e,r)}}function $n(t){return(t=+t)==1?we:function(e,r){return r-e?ji(e,r,t):je(isNaN(e)?r:e)}}function we(t,e){var r=e-t;return r?Ki(t,r):je(isNaN(t)?e:t)}var be=function t(e){var r=$n(e);function n(o,i){var a=r((o=Lt(o)).r,(i=Lt(i)).r),s=r(o.g,i.g),l=r(o.b,i.b),u=we(o.opacity,i.opacity);return function(f){return o.r=a(f),o.g=s(f),o.b=l(f),o.opacity=u(f),o+""}}return n.gamma=t,n}(1);function Yn(t){return function(e){var r=e.length,n=new Array(r),o=new Array(r),i=new Array(r),a,s;for(a=0;a<r;++a)s=Lt(e[a]),n[a]=s.r||0,o[a]=s.g||0,i[a]=s.b||0;return n=t(n),o=t(o),i=t(i),s.opacity=1,function(l){return s.r=n(l),s.g=o(l),s.b=i(l),s+""}}}var Qi=Yn(Bn),Wi=Yn(qn);function ot(t,e){return t=+t,e=+e,function(r){return t*(1-r)+e*r}}var We=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Qe=new RegExp(We.source,"g");function Zi(t){return function(){return t}}function Ji(t){return function(e){return t(e)+""}}function Ze(t,e){var r=We.lastIndex=Qe.lastIndex=0,n,o,i,a=-1,s=[],l=[];for(t=t+"",e=e+"";(n=We.exec(t))&&(o=Qe.exec(e));)(i=o.index)>r&&(i=e.slice(r,i),s[a]?s[a]+=i:s[++a]=i),(n=n[0])===(o=o[0])?s[a]?s[a]+=o:s[++a]=o:(s[++a]=null,l.push({i:a,x:ot(n,o)})),r=Qe.lastIndex;return r<e.length&&(i=e.slice(r),s[a]?s[a]+=i:s[++a]=i),s.length<2?l[0]?Ji(l[0].x):Zi(e):(e=l.length,function(u){for(var f=0,x;f<e;++f)s[(x=l[f]).i]=x.x(u);return s.join("")})}var Hn=180/Math.PI,Ee={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function Je(t,e,r,n,o,i){var a,s,l;return(a=Math.sqrt(t*t+e*e))&&(t/=a,e/=a),(l=t*r+e*n)&&(r-=t*l,n-=e*l),(s=Math.sqrt(r*r+n*n))&&(r/=s,n/=s,l/=s),t*n<e*r&&(t=-t,e=-e,l=-l,a=-a),{translateX:o,translateY:i,rotate:Math.atan2(e,t)*Hn,skewX:Math.atan(l)*Hn,scaleX:a,scaleY:s}}var Ne;function Gn(t){let e=new(typeof DOMMatrix=="function"?DOMMatrix:WebKitCSSMatrix)(t+"");return e.isIdentity?Ee:Je(e.a,e.b,e.c,e.d,e.e,e.f)}function Xn(t){return t==null?Ee:(Ne||(Ne=document.createElementNS("http://www.w3.org/2000/svg","g")),Ne.setAttribute("transform",t),(t=Ne.transform.baseVal.consolidate())?(t=t.matrix,Je(t.a,t.b,t.c,t.d,t.e,t.f)):Ee)}function Fn(t,e,r,n){function o(u){return u.length?u.pop()+" ":""}function i(u,f,x,p,c,w){if(u!==x||f!==p){var g=c.push("translate(",null,e,null,r);w.push({i:g-4,x:ot(u,x)},{i:g-2,x:ot(f,p)})}else(x||p)&&c.push("translate("+x+e+p+r)}function a(u,f,x,p){u!==f?(u-f>180?f+=360:f-u>180&&(u+=360),p.push({i:x.push(o(x)+"rotate(",null,n)-2,x:ot(u,f)})):f&&x.push(o(x)+"rotate("+f+n)}function s(u,f,x,p){u!==f?p.push({i:x.push(o(x)+"skewX(",null,n)-2,x:ot(u,f)}):f&&x.push(o(x)+"skewX("+f+n)}function l(u,f,x,p,c,w){if(u!==x||f!==p){var g=c.push(o(c)+"scale(",null,",",null,")");w.push({i:g-4,x:ot(u,x)},{i:g-2,x:ot(f,p)})}else(x!==1||p!==1)&&c.push(o(c)+"scale("+x+","+p+")")}return function(u,f){var x=[],p=[];return u=t(u),f=t(f),i(u.translateX,u.translateY,f.translateX,f.translateY,x,p),a(u.rotate,f.rotate,x,p),s(u.skewX,f.skewX,x,p),l(u.scaleX,u.scaleY,f.scaleX,f.scaleY,x,p),u=f=null,function(c){for(var w=-1,g=p.length,y;++w<g;)x[(y=p[w]).i]=y.x(c);return x.join("")}}}var tr=Fn(Gn,"px, ","px)","deg)"),er=Fn(Xn,", ",")",")");var ta=1e-12;function Vn(t){return((t=Math.exp(t))+1/t)/2}function ea(t){return((t=Math.exp(t))-1/t)/2}function ra(t){return((t=Math.exp(2*t))-1)/(t+1)}var rr=function t(e,r,n){function o(i,a){var s=i[0],l=i[1],u=i[2],f=a[0],x=a[1],p=a[2],c=f-s,w=x-l,g=c*c+w*w,y,d;if(g<ta)d=Math.log(p/u)/e,y=function(S){return[s+S*c,l+S*w,u*Math.exp(e*S*d)]};else{var b=Math.sqrt(g),A=(p*p-u*u+n*g)/(2*u*r*b),h=(p*p-u*u-n*g)/(2*p*r*b),E=Math.log(Math.sqrt(A*A+1)-A),I=Math.log(Math.sqrt(h*h+1)-h);d=(I-E)/e,y=function(S){var M=S*d,L=Vn(E),D=u/(r*b)*(L*ra(e*M+E)-ea(E));return[s+D*c,l+D*w,u*L/Vn(e*M+E)]}}return y.duration=d*1e3*e/Math.SQRT2,y}return o.rho=function(i){var a=Math.max(.001,+i),s=a*a,l=s*s;return t(a,s,l)},o}(Math.SQRT2,2,4);function Un(t){for(var e=t.length/6|0,r=new Array(e),n=0;n<e;)r[n]="#"+t.slice(n*6,++n*6);return r}var nr=Un("4e79a7f28e2ce1575976b7b259a14fedc949af7aa1ff9da79c755fbab0ab");var na=dt("start","end","cancel","interrupt"),oa=[],Qn=0,Kn=1,Ae=2,ke=3,jn=4,Se=5,ee=6;function wt(t,e,r,n,o,i){var a=t.__transition;if(!a)t.__transition={};else if(r in a)return;ia(t,r,{name:e,index:n,group:o,on:na,tween:oa,time:i.time,delay:i.delay,duration:i.duration,ease:i.ease,timer:null,state:Qn})}function re(t,e){var r=V(t,e);if(r.state>Qn)throw new Error("too late; already scheduled");return r}function j(t,e){var r=V(t,e);if(r.state>ke)throw new Error("too late; already running");return r}function V(t,e){var r=t.__transition;if(!r||!(r=r[e]))throw new Error("transition not found");return r}function ia(t,e,r){var n=t.__transition,o;n[e]=r,r.timer=Ot(i,0,r.time);function i(u){r.state=Kn,r.timer.restart(a,r.delay,r.time),r.delay<=u&&a(u-r.delay)}function a(u){var f,x,p,c;if(r.state!==Kn)return l();for(f in n)if(c=n[f],c.name===r.name){if(c.state===ke)return de(a);c.state===jn?(c.state=ee,c.timer.stop(),c.on.call("interrupt",t,t.__data__,c.index,c.group),delete n[f]):+f<e&&(c.state=ee,c.timer.stop(),c.on.call("cancel",t,t.__data__,c.index,c.group),delete n[f])}if(de(function(){r.state===ke&&(r.state=jn,r.timer.restart(s,r.delay,r.time),s(u))}),r.state=Ae,r.on.call("start",t,t.__data__,r.index,r.group),r.state===Ae){for(r.state=ke,o=new Array(p=r.tween.length),f=0,x=-1;f<p;++f)(c=r.tween[f].value.call(t,t.__data__,r.index,r.group))&&(o[++x]=c);o.length=x+1}}function s(u){for(var f=u<r.duration?r.ease.call(null,u/r.duration):(r.timer.restart(l),r.state=Se,1),x=-1,p=o.length;++x<p;)o[x].call(t,f);r.state===Se&&(r.on.call("end",t,t.__data__,r.index,r.group),l())}function l(){r.state=ee,r.timer.stop(),delete n[e];for(var u in n)return;delete t.__transition}}function Tt(t,e){var r=t.__transition,n,o,i=!0,a;if(r){e=e==null?null:e+"";for(a in r){if((n=r[a]).name!==e){i=!1;continue}o=n.state>Ae&&n.state<Se,n.state=ee,n.timer.stop(),n.on.call(o?"interrupt":"cancel",t,t.__data__,n.index,n.group),delete r[a]}i&&delete t.__transition}}function Wn(t){return this.each(function(){Tt(this,t)})}function aa(t,e){var r,n;return function(){var o=j(this,t),i=o.tween;if(i!==r){n=r=i;for(var a=0,s=n.length;a<s;++a)if(n[a].name===e){n=n.slice(),n.splice(a,1);break}}o.tween=n}}function sa(t,e,r){var n,o;if(typeof r!="function")throw new Error;return function(){var i=j(this,t),a=i.tween;if(a!==n){o=(n=a).slice();for(var s={name:e,value:r},l=0,u=o.length;l<u;++l)if(o[l].name===e){o[l]=s;break}l===u&&o.push(s)}i.tween=o}}function Zn(t,e){var r=this._id;if(t+="",arguments.length<2){for(var n=V(this.node(),r).tween,o=0,i=n.length,a;o<i;++o)if((a=n[o]).name===t)return a.value;return null}return this.each((e==null?aa:sa)(r,t,e))}function Dt(t,e,r){var n=t._id;return t.each(function(){var o=j(this,n);(o.value||(o.value={}))[e]=r.apply(this,arguments)}),function(o){return V(o,n).value[e]}}function Te(t,e){var r;return(typeof e=="number"?ot:e instanceof _t?be:(r=_t(e))?(e=r,be):Ze)(t,e)}function ua(t){return function(){this.removeAttribute(t)}}function la(t){return function(){this.removeAttributeNS(t.space,t.local)}}function fa(t,e,r){var n,o=r+"",i;return function(){var a=this.getAttribute(t);return a===o?null:a===n?i:i=e(n=a,r)}}function ca(t,e,r){var n,o=r+"",i;return function(){var a=this.getAttributeNS(t.space,t.local);return a===o?null:a===n?i:i=e(n=a,r)}}function ha(t,e,r){var n,o,i;return function(){var a,s=r(this),l;return s==null?void this.removeAttribute(t):(a=this.getAttribute(t),l=s+"",a===l?null:a===n&&l===o?i:(o=l,i=e(n=a,s)))}}function pa(t,e,r){var n,o,i;return function(){var a,s=r(this),l;return s==null?void this.removeAttributeNS(t.space,t.local):(a=this.getAttributeNS(t.space,t.local),l=s+"",a===l?null:a===n&&l===o?i:(o=l,i=e(n=a,s)))}}function Jn(t,e){var r=pt(t),n=r==="transform"?er:Te;return this.attrTween(t,typeof e=="function"?(r.local?pa:ha)(r,n,Dt(this,"attr."+t,e)):e==null?(r.local?la:ua)(r):(r.local?ca:fa)(r,n,e))}function ma(t,e){return function(r){this.setAttribute(t,e.call(this,r))}}function da(t,e){return function(r){this.setAttributeNS(t.space,t.local,e.call(this,r))}}function xa(t,e){var r,n;function o(){var i=e.apply(this,arguments);return i!==n&&(r=(n=i)&&da(t,i)),r}return o._value=e,o}function ga(t,e){var r,n;function o(){var i=e.apply(this,arguments);return i!==n&&(r=(n=i)&&ma(t,i)),r}return o._value=e,o}function to(t,e){var r="attr."+t;if(arguments.length<2)return(r=this.tween(r))&&r._value;if(e==null)return this.tween(r,null);if(typeof e!="function")throw new Error;var n=pt(t);return this.tween(r,(n.local?xa:ga)(n,e))}function ya(t,e){return function(){re(this,t).delay=+e.apply(this,arguments)}}function va(t,e){return e=+e,function(){re(this,t).delay=e}}function eo(t){var e=this._id;return arguments.length?this.each((typeof t=="function"?ya:va)(e,t)):V(this.node(),e).delay}function _a(t,e){return function(){j(this,t).duration=+e.apply(this,arguments)}}function wa(t,e){return e=+e,function(){j(this,t).duration=e}}function ro(t){var e=this._id;return arguments.length?this.each((typeof t=="function"?_a:wa)(e,t)):V(this.node(),e).duration}function ba(t,e){if(typeof e!="function")throw new Error;return function(){j(this,t).ease=e}}function no(t){var e=this._id;return arguments.length?this.each(ba(e,t)):V(this.node(),e).ease}function Ea(t,e){return function(){var r=e.apply(this,arguments);if(typeof r!="function")throw new Error;j(this,t).ease=r}}function oo(t){if(typeof t!="function")throw new Error;return this.each(Ea(this._id,t))}function io(t){typeof t!="function"&&(t=qt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=[],l,u=0;u<a;++u)(l=i[u])&&t.call(l,l.__data__,u,i)&&s.push(l);return new tt(n,this._parents,this._name,this._id)}function ao(t){if(t._id!==this._id)throw new Error;for(var e=this._groups,r=t._groups,n=e.length,o=r.length,i=Math.min(n,o),a=new Array(n),s=0;s<i;++s)for(var l=e[s],u=r[s],f=l.length,x=a[s]=new Array(f),p,c=0;c<f;++c)(p=l[c]||u[c])&&(x[c]=p);for(;s<n;++s)a[s]=e[s];return new tt(a,this._parents,this._name,this._id)}function Na(t){return(t+"").trim().split(/^|\s+/).every(function(e){var r=e.indexOf(".");return r>=0&&(e=e.slice(0,r)),!e||e==="start"})}function ka(t,e,r){var n,o,i=Na(e)?re:j;return function(){var a=i(this,t),s=a.on;s!==n&&(o=(n=s).copy()).on(e,r),a.on=o}}function so(t,e){var r=this._id;return arguments.length<2?V(this.node(),r).on.on(t):this.each(ka(r,t,e))}function Aa(t){return function(){var e=this.parentNode;for(var r in this.__transition)if(+r!==t)return;e&&e.removeChild(this)}}function uo(){return this.on("end.remove",Aa(this._id))}function lo(t){var e=this._name,r=this._id;typeof t!="function"&&(t=bt(t));for(var n=this._groups,o=n.length,i=new Array(o),a=0;a<o;++a)for(var s=n[a],l=s.length,u=i[a]=new Array(l),f,x,p=0;p<l;++p)(f=s[p])&&(x=t.call(f,f.__data__,p,s))&&("__data__"in f&&(x.__data__=f.__data__),u[p]=x,wt(u[p],e,r,p,u,V(f,r)));return new tt(i,this._parents,e,r)}function fo(t){var e=this._name,r=this._id;typeof t!="function"&&(t=Bt(t));for(var n=this._groups,o=n.length,i=[],a=[],s=0;s<o;++s)for(var l=n[s],u=l.length,f,x=0;x<u;++x)if(f=l[x]){for(var p=t.call(f,f.__data__,x,l),c,w=V(f,r),g=0,y=p.length;g<y;++g)(c=p[g])&&wt(c,e,r,g,p,w);i.push(p),a.push(f)}return new tt(i,a,e,r)}var Sa=mt.prototype.constructor;function co(){return new Sa(this._groups,this._parents)}function Ta(t,e){var r,n,o;return function(){var i=yt(this,t),a=(this.style.removeProperty(t),yt(this,t));return i===a?null:i===r&&a===n?o:o=e(r=i,n=a)}}function ho(t){return function(){this.style.removeProperty(t)}}function Ia(t,e,r){var n,o=r+"",i;return function(){var a=yt(this,t);return a===o?null:a===n?i:i=e(n=a,r)}}function Ma(t,e,r){var n,o,i;return function(){var a=yt(this,t),s=r(this),l=s+"";return s==null&&(l=s=(this.style.removeProperty(t),yt(this,t))),a===l?null:a===n&&l===o?i:(o=l,i=e(n=a,s))}}function Ca(t,e){var r,n,o,i="style."+e,a="end."+i,s;return function(){var l=j(this,t),u=l.on,f=l.value[i]==null?s||(s=ho(e)):void 0;(u!==r||o!==f)&&(n=(r=u).copy()).on(a,o=f),l.on=n}}function po(t,e,r){var n=(t+="")=="transform"?tr:Te;return e==null?this.styleTween(t,Ta(t,n)).on("end.style."+t,ho(t)):typeof e=="function"?this.styleTween(t,Ma(t,n,Dt(this,"style."+t,e))).each(Ca(this._id,t)):this.styleTween(t,Ia(t,n,e),r).on("end.style."+t,null)}function Ra(t,e,r){return function(n){this.style.setProperty(t,e.call(this,n),r)}}function Oa(t,e,r){var n,o;function i(){var a=e.apply(this,arguments);return a!==o&&(n=(o=a)&&Ra(t,a,r)),n}return i._value=e,i}function mo(t,e,r){var n="style."+(t+="");if(arguments.length<2)return(n=this.tween(n))&&n._value;if(e==null)return this.tween(n,null);if(typeof e!="function")throw new Error;return this.tween(n,Oa(t,e,r??""))}function za(t){return function(){this.textContent=t}}function La(t){return function(){var e=t(this);this.textContent=e??""}}function xo(t){return this.tween("text",typeof t=="function"?La(Dt(this,"text",t)):za(t==null?"":t+""))}function Da(t){return function(e){this.textContent=t.call(this,e)}}function Pa(t){var e,r;function n(){var o=t.apply(this,arguments);return o!==r&&(e=(r=o)&&Da(o)),e}return n._value=t,n}function go(t){var e="text";if(arguments.length<1)return(e=this.tween(e))&&e._value;if(t==null)return this.tween(e,null);if(typeof t!="function")throw new Error;return this.tween(e,Pa(t))}function yo(){for(var t=this._name,e=this._id,r=Ie(),n=this._groups,o=n.length,i=0;i<o;++i)for(var a=n[i],s=a.length,l,u=0;u<s;++u)if(l=a[u]){var f=V(l,e);wt(l,t,r,u,a,{time:f.time+f.delay+f.duration,delay:0,duration:f.duration,ease:f.ease})}return new tt(n,this._parents,t,r)}function vo(){var t,e,r=this,n=r._id,o=r.size();return new Promise(function(i,a){var s={value:a},l={value:function(){--o===0&&i()}};r.each(function(){var u=j(this,n),f=u.on;f!==t&&(e=(t=f).copy(),e._.cancel.push(s),e._.interrupt.push(s),e._.end.push(l)),u.on=e}),o===0&&i()})}var Ba=0;function tt(t,e,r,n){this._groups=t,this._parents=e,this._name=r,this._id=n}function _o(t){return mt().transition(t)}function Ie(){return++Ba}var xt=mt.prototype;tt.prototype=_o.prototype={constructor:tt,select:lo,selectAll:fo,selectChild:xt.selectChild,selectChildren:xt.selectChildren,filter:io,merge:ao,selection:co,transition:yo,call:xt.call,nodes:xt.nodes,node:xt.node,size:xt.size,empty:xt.empty,each:xt.each,on:so,attr:Jn,attrTween:to,style:po,styleTween:mo,text:xo,textTween:go,remove:uo,tween:Zn,delay:eo,duration:ro,ease:no,easeVarying:oo,end:vo,[Symbol.iterator]:xt[Symbol.iterator]};function Me(t){return((t*=2)<=1?t*t*t:(t-=2)*t*t+2)/2}var qa={time:null,delay:0,duration:250,ease:Me};function $a(t,e){for(var r;!(r=t.__transition)||!(r=r[e]);)if(!(t=t.parentNode))throw new Error(`transition ${e} not found`);return r}function wo(t){var e,r;t instanceof tt?(e=t._id,t=t._name):(e=Ie(),(r=qa).time=Qt(),t=t==null?null:t+"");for(var n=this._groups,o=n.length,i=0;i<o;++i)for(var a=n[i],s=a.length,l,u=0;u<s;++u)(l=a[u])&&wt(l,t,e,u,a,r||$a(l,e));return new tt(n,this._parents,t,e)}mt.prototype.interrupt=Wn;mt.prototype.transition=wo;var ne=t=>()=>t;function or(t,{sourceEvent:e,target:r,transform:n,dispatch:o}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},target:{value:r,enumerable:!0,configurable:!0},transform:{value:n,enumerable:!0,configurable:!0},_:{value:o}})}function lt(t,e,r){this.k=t,this.x=e,this.y=r}lt.prototype={constructor:lt,scale:function(t){return t===1?this:new lt(this.k*t,this.x,this.y)},translate:function(t,e){return t===0&e===0?this:new lt(this.k,this.x+this.k*t,this.y+this.k*e)},apply:function(t){return[t[0]*this.k+this.x,t[1]*this.k+this.y]},applyX:function(t){return t*this.k+this.x},applyY:function(t){return t*this.k+this.y},invert:function(t){return[(t[0]-this.x)/this.k,(t[1]-this.y)/this.k]},invertX:function(t){return(t-this.x)/this.k},invertY:function(t){return(t-this.y)/this.k},rescaleX:function(t){return t.copy().domain(t.range().map(this.invertX,this).map(t.invert,t))},rescaleY:function(t){return t.copy().domain(t.range().map(this.invertY,this).map(t.invert,t))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var oe=new lt(1,0,0);ir.prototype=lt.prototype;function ir(t){for(;!t.__zoom;)if(!(t=t.parentNode))return oe;return t.__zoom}function Ce(t){t.stopImmediatePropagation()}function Pt(t){t.preventDefault(),t.stopImmediatePropagation()}function Ya(t){return(!t.ctrlKey||t.type==="wheel")&&!t.button}function Ha(){var t=this;return t instanceof SVGElement?(t=t.ownerSVGElement||t,t.hasAttribute("viewBox")?(t=t.viewBox.baseVal,[[t.x,t.y],[t.x+t.width,t.y+t.height]]):[[0,0],[t.width.baseVal.value,t.height.baseVal.value]]):[[0,0],[t.clientWidth,t.clientHeight]]}function bo(){return this.__zoom||oe}function Ga(t){return-t.deltaY*(t.deltaMode===1?.05:t.deltaMode?1:.002)*(t.ctrlKey?10:1)}function Xa(){return navigator.maxTouchPoints||"ontouchstart"in this}function Fa(t,e,r){var n=t.invertX(e[0][0])-r[0][0],o=t.invertX(e[1][0])-r[1][0],i=t.invertY(e[0][1])-r[0][1],a=t.invertY(e[1][1])-r[1][1];return t.translate(o>n?(n+o)/2:Math.min(0,n)||Math.max(0,o),a>i?(i+a)/2:Math.min(0,i)||Math.max(0,a))}function ar(){var t=Ya,e=Ha,r=Fa,n=Ga,o=Xa,i=[0,1/0],a=[[-1/0,-1/0],[1/0,1/0]],s=250,l=rr,u=dt("start","zoom","end"),f,x,p,c=500,w=150,g=0,y=10;function d(m){m.property("__zoom",bo).on("wheel.zoom",M,{passive:!1}).on("mousedown.zoom",L).on("dblclick.zoom",D).filter(o).on("touchstart.zoom",$).on("touchmove.zoom",U).on("touchend.zoom touchcancel.zoom",Q).style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}d.transform=function(m,N,v,k){var R=m.selection?m.selection():m;R.property("__zoom",bo),m!==R?E(m,N,v,k):R.interrupt().each(function(){I(this,arguments).event(k).start().zoom(null,typeof N=="function"?N.apply(this,arguments):N).end()})},d.scaleBy=function(m,N,v,k){d.scaleTo(m,function(){var R=this.__zoom.k,O=typeof N=="function"?N.apply(this,arguments):N;return R*O},v,k)},d.scaleTo=function(m,N,v,k){d.transform(m,function(){var R=e.apply(this,arguments),O=this.__zoom,z=v==null?h(R):typeof v=="function"?v.apply(this,arguments):v,q=O.invert(z),Y=typeof N=="function"?N.apply(this,arguments):N;return r(A(b(O,Y),z,q),R,a)},v,k)},d.translateBy=function(m,N,v,k){d.transform(m,function(){return r(this.__zoom.translate(typeof N=="function"?N.apply(this,arguments):N,typeof v=="function"?v.apply(this,arguments):v),e.apply(this,arguments),a)},null,k)},d.translateTo=function(m,N,v,k,R){d.transform(m,function(){var O=e.apply(this,arguments),z=this.__zoom,q=k==null?h(O):typeof k=="function"?k.apply(this,arguments):k;return r(oe.translate(q[0],q[1]).scale(z.k).translate(typeof N=="function"?-N.apply(this,arguments):-N,typeof v=="function"?-v.apply(this,arguments):-v),O,a)},k,R)};function b(m,N){return N=Math.max(i[0],Math.min(i[1],N)),N===m.k?m:new lt(N,m.x,m.y)}function A(m,N,v){var k=N[0]-v[0]*m.k,R=N[1]-v[1]*m.k;return k===m.x&&R===m.y?m:new lt(m.k,k,R)}function h(m){return[(+m[0][0]+ +m[1][0])/2,(+m[0][1]+ +m[1][1])/2]}function E(m,N,v,k){m.on("start.zoom",function(){I(this,arguments).event(k).start()}).on("interrupt.zoom end.zoom",function(){I(this,arguments).event(k).end()}).tween("zoom",function(){var R=this,O=arguments,z=I(R,O).event(k),q=e.apply(R,O),Y=v==null?h(q):typeof v=="function"?v.apply(R,O):v,rt=Math.max(q[1][0]-q[0][0],q[1][1]-q[0][1]),H=R.__zoom,G=typeof N=="function"?N.apply(R,O):N,it=l(H.invert(Y).concat(rt/H.k),G.invert(Y).concat(rt/G.k));return function(W){if(W===1)W=G;else{var at=it(W),It=rt/at[2];W=new lt(It,Y[0]-at[0]*It,Y[1]-at[1]*It)}z.zoom(null,W)}})}function I(m,N,v){return!v&&m.__zooming||new S(m,N)}function S(m,N){this.that=m,this.args=N,this.active=0,this.sourceEvent=null,this.extent=e.apply(m,N),this.taps=0}S.prototype={event:function(m){return m&&(this.sourceEvent=m),this},start:function(){return++this.active===1&&(this.that.__zooming=this,this.emit("start")),this},zoom:function(m,N){return this.mouse&&m!=="mouse"&&(this.mouse[1]=N.invert(this.mouse[0])),this.touch0&&m!=="touch"&&(this.touch0[1]=N.invert(this.touch0[0])),this.touch1&&m!=="touch"&&(this.touch1[1]=N.invert(this.touch1[0])),this.that.__zoom=N,this.emit("zoom"),this},end:function(){return--this.active===0&&(delete this.that.__zooming,this.emit("end")),this},emit:function(m){var N=Z(this.that).datum();u.call(m,this.that,new or(m,{sourceEvent:this.sourceEvent,target:d,type:m,transform:this.that.__zoom,dispatch:u}),N)}};function M(m,...N){if(!t.apply(this,arguments))return;var v=I(this,N).event(m),k=this.__zoom,R=Math.max(i[0],Math.min(i[1],k.k*Math.pow(2,n.apply(this,arguments)))),O=nt(m);if(v.wheel)(v.mouse[0][0]!==O[0]||v.mouse[0][1]!==O[1])&&(v.mouse[1]=k.invert(v.mouse[0]=O)),clearTimeout(v.wheel);else{if(k.k===R)return;v.mouse=[O,k.invert(O)],Tt(this),v.start()}Pt(m),v.wheel=setTimeout(z,w),v.zoom("mouse",r(A(b(k,R),v.mouse[0],v.mouse[1]),v.extent,a));function z(){v.wheel=null,v.end()}}function L(m,...N){if(p||!t.apply(this,arguments))return;var v=m.currentTarget,k=I(this,N,!0).event(m),R=Z(m.view).on("mousemove.zoom",Y,!0).on("mouseup.zoom",rt,!0),O=nt(m,v),z=m.clientX,q=m.clientY;Yt(m.view),Ce(m),k.mouse=[O,this.__zoom.invert(O)],Tt(this),k.start();function Y(H){if(Pt(H),!k.moved){var G=H.clientX-z,it=H.clientY-q;k.moved=G*G+it*it>g}k.event(H).zoom("mouse",r(A(k.that.__zoom,k.mouse[0]=nt(H,v),k.mouse[1]),k.extent,a))}function rt(H){R.on("mousemove.zoom mouseup.zoom",null),Ht(H.view,k.moved),Pt(H),k.event(H).end()}}function D(m,...N){if(t.apply(this,arguments)){var v=this.__zoom,k=nt(m.changedTouches?m.changedTouches[0]:m,this),R=v.invert(k),O=v.k*(m.shiftKey?.5:2),z=r(A(b(v,O),k,R),e.apply(this,N),a);Pt(m),s>0?Z(this).transition().duration(s).call(E,z,k,m):Z(this).call(d.transform,z,k,m)}}function $(m,...N){if(t.apply(this,arguments)){var v=m.touches,k=v.length,R=I(this,N,m.changedTouches.length===k).event(m),O,z,q,Y;for(Ce(m),z=0;z<k;++z)q=v[z],Y=nt(q,this),Y=[Y,this.__zoom.invert(Y),q.identifier],R.touch0?!R.touch1&&R.touch0[2]!==Y[2]&&(R.touch1=Y,R.taps=0):(R.touch0=Y,O=!0,R.taps=1+!!f);f&&(f=clearTimeout(f)),O&&(R.taps<2&&(x=Y[0],f=setTimeout(function(){f=null},c)),Tt(this),R.start())}}function U(m,...N){if(this.__zooming){var v=I(this,N).event(m),k=m.changedTouches,R=k.length,O,z,q,Y;for(Pt(m),O=0;O<R;++O)z=k[O],q=nt(z,this),v.touch0&&v.touch0[2]===z.identifier?v.touch0[0]=q:v.touch1&&v.touch1[2]===z.identifier&&(v.touch1[0]=q);if(z=v.that.__zoom,v.touch1){var rt=v.touch0[0],H=v.touch0[1],G=v.touch1[0],it=v.touch1[1],W=(W=G[0]-rt[0])*W+(W=G[1]-rt[1])*W,at=(at=it[0]-H[0])*at+(at=it[1]-H[1])*at;z=b(z,Math.sqrt(W/at)),q=[(rt[0]+G[0])/2,(rt[1]+G[1])/2],Y=[(H[0]+it[0])/2,(H[1]+it[1])/2]}else if(v.touch0)q=v.touch0[0],Y=v.touch0[1];else return;v.zoom("touch",r(A(z,q,Y),v.extent,a))}}function Q(m,...N){if(this.__zooming){var v=I(this,N).event(m),k=m.changedTouches,R=k.length,O,z;for(Ce(m),p&&clearTimeout(p),p=setTimeout(function(){p=null},c),O=0;O<R;++O)z=k[O],v.touch0&&v.touch0[2]===z.identifier?delete v.touch0:v.touch1&&v.touch1[2]===z.identifier&&delete v.touch1;if(v.touch1&&!v.touch0&&(v.touch0=v.touch1,delete v.touch1),v.touch0)v.touch0[1]=this.__zoom.invert(v.touch0[0]);else if(v.end(),v.taps===2&&(z=nt(z,this),Math.hypot(x[0]-z[0],x[1]-z[1])<y)){var q=Z(this).on("dblclick.zoom");q&&q.apply(this,arguments)}}}return d.wheelDelta=function(m){return arguments.length?(n=typeof m=="function"?m:ne(+m),d):n},d.filter=function(m){return arguments.length?(t=typeof m=="function"?m:ne(!!m),d):t},d.touchable=function(m){return arguments.length?(o=typeof m=="function"?m:ne(!!m),d):o},d.extent=function(m){return arguments.length?(e=typeof m=="function"?m:ne([[+m[0][0],+m[0][1]],[+m[1][0],+m[1][1]]]),d):e},d.scaleExtent=function(m){return arguments.length?(i[0]=+m[0],i[1]=+m[1],d):[i[0],i[1]]},d.translateExtent=function(m){return arguments.length?(a[0][0]=+m[0][0],a[1][0]=+m[1][0],a[0][1]=+m[0][1],a[1][1]=+m[1][1],d):[[a[0][0],a[0][1]],[a[1][0],a[1][1]]]},d.constrain=function(m){return arguments.length?(r=m,d):r},d.duration=function(m){return arguments.length?(s=+m,d):s},d.interpolate=function(m){return arguments.length?(l=m,d):l},d.on=function(){var m=u.on.apply(u,arguments);return m===u?d:m},d.clickDistance=function(m){return arguments.length?(g=(m=+m)*m,d):Math.sqrt(g)},d.tapDistance=function(m){return arguments.length?(y=+m,d):y},d}var Va=["MATCH","OPTIONAL MATCH","WHERE","RETURN","WITH","ORDER BY","LIMIT","SKIP","CREATE","MERGE","DELETE","DETACH DELETE","SET","REMOVE","UNWIND","CALL","YIELD","AS","AND","OR","NOT","IN","IS NULL","IS NOT NULL","DISTINCT","COUNT","COLLECT","EXISTS","CASE","WHEN","THEN","ELSE","END"];function Ua({model:t,el:e}){let r=0,n=document.createElement("div");n.classList.add("neo4j-widget"),e.appendChild(n);let o=document.createElement("div");o.classList.add("neo4j-query-bar"),n.appendChild(o);let i=document.createElement("div");i.classList.add("neo4j-input-wrapper"),o.appendChild(i);let a=document.createElement("textarea");a.classList.add("neo4j-query-input"),a.placeholder="Enter Cypher query... (Ctrl+Enter to run)",a.rows=3,i.appendChild(a);let s=document.createElement("div");s.classList.add("neo4j-autocomplete-dropdown"),s.style.display="none",i.appendChild(s);let l=document.createElement("button");l.classList.add("neo4j-run-btn"),l.textContent="Run",o.appendChild(l);let u=document.createElement("div");u.classList.add("neo4j-error-bar"),u.style.display="none",n.appendChild(u);let f=Wt(nr),x=document.createElement("div");x.classList.add("neo4j-schema-bar"),n.appendChild(x);function p(){let _=t.get("schema")||{},T=_.labels||[],B=_.relationship_types||[];if(x.innerHTML="",T.length===0&&B.length===0){x.style.display="none";return}x.style.display="flex",T.forEach(F=>{let C=document.createElement("span");C.classList.add("neo4j-schema-chip","neo4j-schema-label"),C.style.backgroundColor=f(F),C.textContent=F,C.addEventListener("click",()=>{a.value=`MATCH (n:${F}) RETURN n LIMIT 25`,a.focus()}),x.appendChild(C)}),B.forEach(F=>{let C=document.createElement("span");C.classList.add("neo4j-schema-chip","neo4j-schema-rel"),C.textContent=F,C.addEventListener("click",()=>{a.value=`MATCH (a)-[r:${F}]->(b) RETURN a, r, b LIMIT 25`,a.focus()}),x.appendChild(C)})}p();let c=t.get("width"),w=t.get("height"),g=document.createElementNS("http://www.w3.org/2000/svg","svg");g.setAttribute("width",c),g.setAttribute("height",w),g.classList.add("neo4j-graph"),n.appendChild(g);let y=Z(g);y.append("defs").append("marker").attr("id","neo4j-arrowhead").attr("viewBox","-0 -5 10 10").attr("refX",20).attr("refY",0).attr("orient","auto").attr("markerWidth",6).attr("markerHeight",6).append("path").attr("d","M0,-5L10,0L0,5").attr("class","neo4j-arrow");let d=y.append("g").attr("class","neo4j-zoom-group");y.call(ar().scaleExtent([.1,5]).on("zoom",_=>{d.attr("transform",_.transform)}));let b=d.append("g").attr("class","neo4j-links"),A=d.append("g").attr("class","neo4j-nodes"),h=document.createElement("div");h.classList.add("neo4j-tooltip"),h.style.display="none",n.appendChild(h);let E=[],I=[],S=new Set,M=new Set,L=Ge().force("link",Ye().id(_=>_.element_id).distance(120)).force("charge",Xe().strength(-300)).force("center",Be(c/2,w/2)).force("collide",$e().radius(35)).on("tick",D);L.stop();function D(){b.selectAll(".neo4j-link").attr("x1",_=>_.source.x).attr("y1",_=>_.source.y).attr("x2",_=>_.target.x).attr("y2",_=>_.target.y),b.selectAll(".neo4j-link-label").attr("x",_=>(_.source.x+_.target.x)/2).attr("y",_=>(_.source.y+_.target.y)/2),A.selectAll(".neo4j-node-group").attr("transform",_=>`translate(${_.x},${_.y})`)}function $(){let _=t.get("nodes")||[],T=t.get("relationships")||[],B=new Map(_.map(C=>[C.element_id,C])),F=new Map;E.forEach(C=>{F.set(C.element_id,{x:C.x,y:C.y,vx:C.vx,vy:C.vy})}),E=_.map(C=>{let P=F.get(C.element_id);return P?{...C,...P}:{...C,x:c/2+(Math.random()-.5)*100,y:w/2+(Math.random()-.5)*100}}),I=T.filter(C=>B.has(C.start_node_element_id)&&B.has(C.end_node_element_id)).map(C=>({...C,source:C.start_node_element_id,target:C.end_node_element_id})),L.nodes(E),L.force("link").links(I),L.alpha(.3).restart(),U()}function U(){let _=b.selectAll(".neo4j-link").data(I,P=>P.element_id);_.exit().remove(),_.enter().append("line").attr("class","neo4j-link").attr("marker-end","url(#neo4j-arrowhead)").on("click",R).on("mouseenter",(P,ht)=>q(P,z(ht.type,ht.properties))).on("mouseleave",Y).merge(_).classed("neo4j-selected",P=>M.has(P.element_id));let T=b.selectAll(".neo4j-link-label").data(I,P=>P.element_id);T.exit().remove(),T.enter().append("text").attr("class","neo4j-link-label").merge(T).text(P=>P.type);let B=A.selectAll(".neo4j-node-group").data(E,P=>P.element_id);B.exit().remove();let F=B.enter().append("g").attr("class","neo4j-node-group").call(Pe().on("start",Q).on("drag",m).on("end",N)).on("click",v).on("dblclick",k).on("mouseenter",(P,ht)=>q(P,z(ht.labels.join(":"),ht.properties))).on("mouseleave",Y);F.append("circle").attr("class","neo4j-node").attr("r",14).attr("fill",P=>f(P.labels[0]||"")),F.append("text").attr("class","neo4j-node-label").attr("dy",28).attr("text-anchor","middle");let C=F.merge(B);C.select(".neo4j-node").attr("fill",P=>f(P.labels[0]||"")).classed("neo4j-selected",P=>S.has(P.element_id)),C.select(".neo4j-node-label").text(P=>P.display)}function Q(_,T){_.active||L.alphaTarget(.1).restart(),T.fx=T.x,T.fy=T.y}function m(_,T){T.fx=_.x,T.fy=_.y}function N(_,T){_.active||L.alphaTarget(0),T.fx=null,T.fy=null}function v(_,T){_.stopPropagation(),_.ctrlKey||_.metaKey?S.has(T.element_id)?S.delete(T.element_id):S.add(T.element_id):(S.has(T.element_id)&&S.size===1?S.clear():(S.clear(),S.add(T.element_id)),M.clear()),O(),U()}function k(_,T){_.stopPropagation(),_.preventDefault(),t.set("_expand_request",{element_id:T.element_id,request_id:++r}),t.save_changes()}function R(_,T){_.stopPropagation(),_.ctrlKey||_.metaKey?M.has(T.element_id)?M.delete(T.element_id):M.add(T.element_id):(M.has(T.element_id)&&M.size===1?M.clear():(M.clear(),M.add(T.element_id)),S.clear()),O(),U()}g.addEventListener("click",_=>{_.target===g&&(S.clear(),M.clear(),O(),U())});function O(){t.set("selected_nodes",Array.from(S)),t.set("selected_relationships",Array.from(M)),t.save_changes()}function z(_,T){let B=`<strong>${_}</strong>`;for(let[F,C]of Object.entries(T||{}))B+=`<br><span class="neo4j-tooltip-key">${F}:</span> ${C}`;return B}function q(_,T){h.innerHTML=T,h.style.display="block";let B=n.getBoundingClientRect();h.style.left=_.clientX-B.left+12+"px",h.style.top=_.clientY-B.top+12+"px"}function Y(){h.style.display="none"}function rt(){let _=a.value.trim();_&&(t.set("_query_request",{query:_,request_id:++r}),t.save_changes())}l.addEventListener("click",rt),a.addEventListener("keydown",_=>{if(s.style.display!=="none"&&(_.key==="ArrowDown"||_.key==="ArrowUp"||_.key==="Tab"||_.key==="Enter")){at(_);return}(_.ctrlKey||_.metaKey)&&_.key==="Enter"&&(_.preventDefault(),rt())});let H=[],G=-1;a.addEventListener("input",()=>{let _=a.value,T=a.selectionStart,B=_.slice(0,T),F=t.get("schema")||{},C=[],P=T,ht=B.match(/[:(\s]:?\s*(\w*)$/);if(ht){let gt=ht[1].toLowerCase();P=T-ht[1].length,C=(F.labels||[]).filter(Mt=>Mt.toLowerCase().startsWith(gt))}let Re=B.match(/\[\s*:?\s*(\w*)$/);if(Re){let gt=Re[1].toLowerCase();P=T-Re[1].length,C=(F.relationship_types||[]).filter(Mt=>Mt.toLowerCase().startsWith(gt))}if(C.length===0){let gt=B.match(/(?:^|\s)(\w+)$/);if(gt&&gt[1].length>=2){let Mt=gt[1].toUpperCase();P=T-gt[1].length,C=Va.filter(sr=>sr.startsWith(Mt)&&sr!==Mt)}}C.length>0&&C.length<=12?it(C,P):W()});function it(_,T){H=_,G=-1,s.innerHTML="",_.forEach((B,F)=>{let C=document.createElement("div");C.classList.add("neo4j-ac-item"),C.textContent=B,C.addEventListener("mousedown",P=>{P.preventDefault(),It(B,T)}),s.appendChild(C)}),s.style.display="block",s._replaceFrom=T}function W(){s.style.display="none",H=[],G=-1}function at(_){if(_.key==="ArrowDown")_.preventDefault(),G=Math.min(G+1,H.length-1);else if(_.key==="ArrowUp")_.preventDefault(),G=Math.max(G-1,0);else if(_.key==="Tab"||_.key==="Enter"){_.preventDefault(),G>=0&&G<H.length&&It(H[G],s._replaceFrom);return}let T=s.children;for(let B=0;B<T.length;B++)T[B].classList.toggle("neo4j-ac-active",B===G)}function It(_,T){let B=a.value,F=a.selectionStart;a.value=B.slice(0,T)+_+B.slice(F),a.selectionStart=a.selectionEnd=T+_.length,W(),a.focus()}a.addEventListener("blur",()=>{setTimeout(W,150)}),t.on("change:nodes",$),t.on("change:relationships",$),t.on("change:error",()=>{let _=t.get("error");_?(u.textContent=_,u.style.display="block"):u.style.display="none"}),t.on("change:query_running",()=>{let _=t.get("query_running");l.textContent=_?"...":"Run",l.disabled=_}),(t.get("nodes")||[]).length>0&&$()}var Yp={render:Ua};export{Yp as default};
+var ie="http://www.w3.org/1999/xhtml",Oe={svg:"http://www.w3.org/2000/svg",xhtml:ie,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function pt(t){var e=t+="",r=e.indexOf(":");return r>=0&&(e=t.slice(0,r))!=="xmlns"&&(t=t.slice(r+1)),Oe.hasOwnProperty(e)?{space:Oe[e],local:t}:t}function Eo(t){return function(){var e=this.ownerDocument,r=this.namespaceURI;return r===ie&&e.documentElement.namespaceURI===ie?e.createElement(t):e.createElementNS(r,t)}}function No(t){return function(){return this.ownerDocument.createElementNS(t.space,t.local)}}function ae(t){var e=pt(t);return(e.local?No:Eo)(e)}function ko(){}function bt(t){return t==null?ko:function(){return this.querySelector(t)}}function ur(t){typeof t!="function"&&(t=bt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=new Array(a),l,u,f=0;f<a;++f)(l=i[f])&&(u=t.call(l,l.__data__,f,i))&&("__data__"in l&&(u.__data__=l.__data__),s[f]=u);return new X(n,this._parents)}function ze(t){return t==null?[]:Array.isArray(t)?t:Array.from(t)}function Ao(){return[]}function Bt(t){return t==null?Ao:function(){return this.querySelectorAll(t)}}function So(t){return function(){return ze(t.apply(this,arguments))}}function lr(t){typeof t=="function"?t=So(t):t=Bt(t);for(var e=this._groups,r=e.length,n=[],o=[],i=0;i<r;++i)for(var a=e[i],s=a.length,l,u=0;u<s;++u)(l=a[u])&&(n.push(t.call(l,l.__data__,u,a)),o.push(l));return new X(n,o)}function qt(t){return function(){return this.matches(t)}}function se(t){return function(e){return e.matches(t)}}var To=Array.prototype.find;function Io(t){return function(){return To.call(this.children,t)}}function Mo(){return this.firstElementChild}function fr(t){return this.select(t==null?Mo:Io(typeof t=="function"?t:se(t)))}var Co=Array.prototype.filter;function Ro(){return Array.from(this.children)}function Oo(t){return function(){return Co.call(this.children,t)}}function cr(t){return this.selectAll(t==null?Ro:Oo(typeof t=="function"?t:se(t)))}function hr(t){typeof t!="function"&&(t=qt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=[],l,u=0;u<a;++u)(l=i[u])&&t.call(l,l.__data__,u,i)&&s.push(l);return new X(n,this._parents)}function ue(t){return new Array(t.length)}function pr(){return new X(this._enter||this._groups.map(ue),this._parents)}function $t(t,e){this.ownerDocument=t.ownerDocument,this.namespaceURI=t.namespaceURI,this._next=null,this._parent=t,this.__data__=e}$t.prototype={constructor:$t,appendChild:function(t){return this._parent.insertBefore(t,this._next)},insertBefore:function(t,e){return this._parent.insertBefore(t,e)},querySelector:function(t){return this._parent.querySelector(t)},querySelectorAll:function(t){return this._parent.querySelectorAll(t)}};function mr(t){return function(){return t}}function zo(t,e,r,n,o,i){for(var a=0,s,l=e.length,u=i.length;a<u;++a)(s=e[a])?(s.__data__=i[a],n[a]=s):r[a]=new $t(t,i[a]);for(;a<l;++a)(s=e[a])&&(o[a]=s)}function Lo(t,e,r,n,o,i,a){var s,l,u=new Map,f=e.length,x=i.length,p=new Array(f),c;for(s=0;s<f;++s)(l=e[s])&&(p[s]=c=a.call(l,l.__data__,s,e)+"",u.has(c)?o[s]=l:u.set(c,l));for(s=0;s<x;++s)c=a.call(t,i[s],s,i)+"",(l=u.get(c))?(n[s]=l,l.__data__=i[s],u.delete(c)):r[s]=new $t(t,i[s]);for(s=0;s<f;++s)(l=e[s])&&u.get(p[s])===l&&(o[s]=l)}function Do(t){return t.__data__}function dr(t,e){if(!arguments.length)return Array.from(this,Do);var r=e?Lo:zo,n=this._parents,o=this._groups;typeof t!="function"&&(t=mr(t));for(var i=o.length,a=new Array(i),s=new Array(i),l=new Array(i),u=0;u<i;++u){var f=n[u],x=o[u],p=x.length,c=Po(t.call(f,f&&f.__data__,u,n)),w=c.length,g=s[u]=new Array(w),y=a[u]=new Array(w),d=l[u]=new Array(p);r(f,x,g,y,d,c,e);for(var b=0,A=0,h,E;b<w;++b)if(h=g[b]){for(b>=A&&(A=b+1);!(E=y[A])&&++A<w;);h._next=E||null}}return a=new X(a,n),a._enter=s,a._exit=l,a}function Po(t){return typeof t=="object"&&"length"in t?t:Array.from(t)}function xr(){return new X(this._exit||this._groups.map(ue),this._parents)}function gr(t,e,r){var n=this.enter(),o=this,i=this.exit();return typeof t=="function"?(n=t(n),n&&(n=n.selection())):n=n.append(t+""),e!=null&&(o=e(o),o&&(o=o.selection())),r==null?i.remove():r(i),n&&o?n.merge(o).order():o}function yr(t){for(var e=t.selection?t.selection():t,r=this._groups,n=e._groups,o=r.length,i=n.length,a=Math.min(o,i),s=new Array(o),l=0;l<a;++l)for(var u=r[l],f=n[l],x=u.length,p=s[l]=new Array(x),c,w=0;w<x;++w)(c=u[w]||f[w])&&(p[w]=c);for(;l<o;++l)s[l]=r[l];return new X(s,this._parents)}function vr(){for(var t=this._groups,e=-1,r=t.length;++e<r;)for(var n=t[e],o=n.length-1,i=n[o],a;--o>=0;)(a=n[o])&&(i&&a.compareDocumentPosition(i)^4&&i.parentNode.insertBefore(a,i),i=a);return this}function _r(t){t||(t=Bo);function e(x,p){return x&&p?t(x.__data__,p.__data__):!x-!p}for(var r=this._groups,n=r.length,o=new Array(n),i=0;i<n;++i){for(var a=r[i],s=a.length,l=o[i]=new Array(s),u,f=0;f<s;++f)(u=a[f])&&(l[f]=u);l.sort(e)}return new X(o,this._parents).order()}function Bo(t,e){return t<e?-1:t>e?1:t>=e?0:NaN}function wr(){var t=arguments[0];return arguments[0]=this,t.apply(null,arguments),this}function br(){return Array.from(this)}function Er(){for(var t=this._groups,e=0,r=t.length;e<r;++e)for(var n=t[e],o=0,i=n.length;o<i;++o){var a=n[o];if(a)return a}return null}function Nr(){let t=0;for(let e of this)++t;return t}function kr(){return!this.node()}function Ar(t){for(var e=this._groups,r=0,n=e.length;r<n;++r)for(var o=e[r],i=0,a=o.length,s;i<a;++i)(s=o[i])&&t.call(s,s.__data__,i,o);return this}function qo(t){return function(){this.removeAttribute(t)}}function $o(t){return function(){this.removeAttributeNS(t.space,t.local)}}function Yo(t,e){return function(){this.setAttribute(t,e)}}function Ho(t,e){return function(){this.setAttributeNS(t.space,t.local,e)}}function Go(t,e){return function(){var r=e.apply(this,arguments);r==null?this.removeAttribute(t):this.setAttribute(t,r)}}function Xo(t,e){return function(){var r=e.apply(this,arguments);r==null?this.removeAttributeNS(t.space,t.local):this.setAttributeNS(t.space,t.local,r)}}function Sr(t,e){var r=pt(t);if(arguments.length<2){var n=this.node();return r.local?n.getAttributeNS(r.space,r.local):n.getAttribute(r)}return this.each((e==null?r.local?$o:qo:typeof e=="function"?r.local?Xo:Go:r.local?Ho:Yo)(r,e))}function le(t){return t.ownerDocument&&t.ownerDocument.defaultView||t.document&&t||t.defaultView}function Fo(t){return function(){this.style.removeProperty(t)}}function Vo(t,e,r){return function(){this.style.setProperty(t,e,r)}}function Uo(t,e,r){return function(){var n=e.apply(this,arguments);n==null?this.style.removeProperty(t):this.style.setProperty(t,n,r)}}function Tr(t,e,r){return arguments.length>1?this.each((e==null?Fo:typeof e=="function"?Uo:Vo)(t,e,r??"")):yt(this.node(),t)}function yt(t,e){return t.style.getPropertyValue(e)||le(t).getComputedStyle(t,null).getPropertyValue(e)}function Ko(t){return function(){delete this[t]}}function jo(t,e){return function(){this[t]=e}}function Qo(t,e){return function(){var r=e.apply(this,arguments);r==null?delete this[t]:this[t]=r}}function Ir(t,e){return arguments.length>1?this.each((e==null?Ko:typeof e=="function"?Qo:jo)(t,e)):this.node()[t]}function Mr(t){return t.trim().split(/^|\s+/)}function Le(t){return t.classList||new Cr(t)}function Cr(t){this._node=t,this._names=Mr(t.getAttribute("class")||"")}Cr.prototype={add:function(t){var e=this._names.indexOf(t);e<0&&(this._names.push(t),this._node.setAttribute("class",this._names.join(" ")))},remove:function(t){var e=this._names.indexOf(t);e>=0&&(this._names.splice(e,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(t){return this._names.indexOf(t)>=0}};function Rr(t,e){for(var r=Le(t),n=-1,o=e.length;++n<o;)r.add(e[n])}function Or(t,e){for(var r=Le(t),n=-1,o=e.length;++n<o;)r.remove(e[n])}function Wo(t){return function(){Rr(this,t)}}function Zo(t){return function(){Or(this,t)}}function Jo(t,e){return function(){(e.apply(this,arguments)?Rr:Or)(this,t)}}function zr(t,e){var r=Mr(t+"");if(arguments.length<2){for(var n=Le(this.node()),o=-1,i=r.length;++o<i;)if(!n.contains(r[o]))return!1;return!0}return this.each((typeof e=="function"?Jo:e?Wo:Zo)(r,e))}function ti(){this.textContent=""}function ei(t){return function(){this.textContent=t}}function ri(t){return function(){var e=t.apply(this,arguments);this.textContent=e??""}}function Lr(t){return arguments.length?this.each(t==null?ti:(typeof t=="function"?ri:ei)(t)):this.node().textContent}function ni(){this.innerHTML=""}function oi(t){return function(){this.innerHTML=t}}function ii(t){return function(){var e=t.apply(this,arguments);this.innerHTML=e??""}}function Dr(t){return arguments.length?this.each(t==null?ni:(typeof t=="function"?ii:oi)(t)):this.node().innerHTML}function ai(){this.nextSibling&&this.parentNode.appendChild(this)}function Pr(){return this.each(ai)}function si(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function Br(){return this.each(si)}function qr(t){var e=typeof t=="function"?t:ae(t);return this.select(function(){return this.appendChild(e.apply(this,arguments))})}function ui(){return null}function $r(t,e){var r=typeof t=="function"?t:ae(t),n=e==null?ui:typeof e=="function"?e:bt(e);return this.select(function(){return this.insertBefore(r.apply(this,arguments),n.apply(this,arguments)||null)})}function li(){var t=this.parentNode;t&&t.removeChild(this)}function Yr(){return this.each(li)}function fi(){var t=this.cloneNode(!1),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function ci(){var t=this.cloneNode(!0),e=this.parentNode;return e?e.insertBefore(t,this.nextSibling):t}function Hr(t){return this.select(t?ci:fi)}function Gr(t){return arguments.length?this.property("__data__",t):this.node().__data__}function hi(t){return function(e){t.call(this,e,this.__data__)}}function pi(t){return t.trim().split(/^|\s+/).map(function(e){var r="",n=e.indexOf(".");return n>=0&&(r=e.slice(n+1),e=e.slice(0,n)),{type:e,name:r}})}function mi(t){return function(){var e=this.__on;if(e){for(var r=0,n=-1,o=e.length,i;r<o;++r)i=e[r],(!t.type||i.type===t.type)&&i.name===t.name?this.removeEventListener(i.type,i.listener,i.options):e[++n]=i;++n?e.length=n:delete this.__on}}}function di(t,e,r){return function(){var n=this.__on,o,i=hi(e);if(n){for(var a=0,s=n.length;a<s;++a)if((o=n[a]).type===t.type&&o.name===t.name){this.removeEventListener(o.type,o.listener,o.options),this.addEventListener(o.type,o.listener=i,o.options=r),o.value=e;return}}this.addEventListener(t.type,i,r),o={type:t.type,name:t.name,value:e,listener:i,options:r},n?n.push(o):this.__on=[o]}}function Xr(t,e,r){var n=pi(t+""),o,i=n.length,a;if(arguments.length<2){var s=this.node().__on;if(s){for(var l=0,u=s.length,f;l<u;++l)for(o=0,f=s[l];o<i;++o)if((a=n[o]).type===f.type&&a.name===f.name)return f.value}return}for(s=e?di:mi,o=0;o<i;++o)this.each(s(n[o],e,r));return this}function Fr(t,e,r){var n=le(t),o=n.CustomEvent;typeof o=="function"?o=new o(e,r):(o=n.document.createEvent("Event"),r?(o.initEvent(e,r.bubbles,r.cancelable),o.detail=r.detail):o.initEvent(e,!1,!1)),t.dispatchEvent(o)}function xi(t,e){return function(){return Fr(this,t,e)}}function gi(t,e){return function(){return Fr(this,t,e.apply(this,arguments))}}function Vr(t,e){return this.each((typeof e=="function"?gi:xi)(t,e))}function*Ur(){for(var t=this._groups,e=0,r=t.length;e<r;++e)for(var n=t[e],o=0,i=n.length,a;o<i;++o)(a=n[o])&&(yield a)}var De=[null];function X(t,e){this._groups=t,this._parents=e}function Kr(){return new X([[document.documentElement]],De)}function yi(){return this}X.prototype=Kr.prototype={constructor:X,select:ur,selectAll:lr,selectChild:fr,selectChildren:cr,filter:hr,data:dr,enter:pr,exit:xr,join:gr,merge:yr,selection:yi,order:vr,sort:_r,call:wr,nodes:br,node:Er,size:Nr,empty:kr,each:Ar,attr:Sr,style:Tr,property:Ir,classed:zr,text:Lr,html:Dr,raise:Pr,lower:Br,append:qr,insert:$r,remove:Yr,clone:Hr,datum:Gr,on:Xr,dispatch:Vr,[Symbol.iterator]:Ur};var mt=Kr;function Z(t){return typeof t=="string"?new X([[document.querySelector(t)]],[document.documentElement]):new X([[t]],De)}function jr(t){let e;for(;e=t.sourceEvent;)t=e;return t}function nt(t,e){if(t=jr(t),e===void 0&&(e=t.currentTarget),e){var r=e.ownerSVGElement||e;if(r.createSVGPoint){var n=r.createSVGPoint();return n.x=t.clientX,n.y=t.clientY,n=n.matrixTransform(e.getScreenCTM().inverse()),[n.x,n.y]}if(e.getBoundingClientRect){var o=e.getBoundingClientRect();return[t.clientX-o.left-e.clientLeft,t.clientY-o.top-e.clientTop]}}return[t.pageX,t.pageY]}var vi={value:()=>{}};function Wr(){for(var t=0,e=arguments.length,r={},n;t<e;++t){if(!(n=arguments[t]+"")||n in r||/[\s.]/.test(n))throw new Error("illegal type: "+n);r[n]=[]}return new fe(r)}function fe(t){this._=t}function _i(t,e){return t.trim().split(/^|\s+/).map(function(r){var n="",o=r.indexOf(".");if(o>=0&&(n=r.slice(o+1),r=r.slice(0,o)),r&&!e.hasOwnProperty(r))throw new Error("unknown type: "+r);return{type:r,name:n}})}fe.prototype=Wr.prototype={constructor:fe,on:function(t,e){var r=this._,n=_i(t+"",r),o,i=-1,a=n.length;if(arguments.length<2){for(;++i<a;)if((o=(t=n[i]).type)&&(o=wi(r[o],t.name)))return o;return}if(e!=null&&typeof e!="function")throw new Error("invalid callback: "+e);for(;++i<a;)if(o=(t=n[i]).type)r[o]=Qr(r[o],t.name,e);else if(e==null)for(o in r)r[o]=Qr(r[o],t.name,null);return this},copy:function(){var t={},e=this._;for(var r in e)t[r]=e[r].slice();return new fe(t)},call:function(t,e){if((o=arguments.length-2)>0)for(var r=new Array(o),n=0,o,i;n<o;++n)r[n]=arguments[n+2];if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(i=this._[t],n=0,o=i.length;n<o;++n)i[n].value.apply(e,r)},apply:function(t,e,r){if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(var n=this._[t],o=0,i=n.length;o<i;++o)n[o].value.apply(e,r)}};function wi(t,e){for(var r=0,n=t.length,o;r<n;++r)if((o=t[r]).name===e)return o.value}function Qr(t,e,r){for(var n=0,o=t.length;n<o;++n)if(t[n].name===e){t[n]=vi,t=t.slice(0,n).concat(t.slice(n+1));break}return r!=null&&t.push({name:e,value:r}),t}var dt=Wr;var Zr={passive:!1},Et={capture:!0,passive:!1};function ce(t){t.stopImmediatePropagation()}function vt(t){t.preventDefault(),t.stopImmediatePropagation()}function Yt(t){var e=t.document.documentElement,r=Z(t).on("dragstart.drag",vt,Et);"onselectstart"in e?r.on("selectstart.drag",vt,Et):(e.__noselect=e.style.MozUserSelect,e.style.MozUserSelect="none")}function Ht(t,e){var r=t.document.documentElement,n=Z(t).on("dragstart.drag",null);e&&(n.on("click.drag",vt,Et),setTimeout(function(){n.on("click.drag",null)},0)),"onselectstart"in r?n.on("selectstart.drag",null):(r.style.MozUserSelect=r.__noselect,delete r.__noselect)}var Gt=t=>()=>t;function Xt(t,{sourceEvent:e,subject:r,target:n,identifier:o,active:i,x:a,y:s,dx:l,dy:u,dispatch:f}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},subject:{value:r,enumerable:!0,configurable:!0},target:{value:n,enumerable:!0,configurable:!0},identifier:{value:o,enumerable:!0,configurable:!0},active:{value:i,enumerable:!0,configurable:!0},x:{value:a,enumerable:!0,configurable:!0},y:{value:s,enumerable:!0,configurable:!0},dx:{value:l,enumerable:!0,configurable:!0},dy:{value:u,enumerable:!0,configurable:!0},_:{value:f}})}Xt.prototype.on=function(){var t=this._.on.apply(this._,arguments);return t===this._?this:t};function bi(t){return!t.ctrlKey&&!t.button}function Ei(){return this.parentNode}function Ni(t,e){return e??{x:t.x,y:t.y}}function ki(){return navigator.maxTouchPoints||"ontouchstart"in this}function Pe(){var t=bi,e=Ei,r=Ni,n=ki,o={},i=dt("start","drag","end"),a=0,s,l,u,f,x=0;function p(h){h.on("mousedown.drag",c).filter(n).on("touchstart.drag",y).on("touchmove.drag",d,Zr).on("touchend.drag touchcancel.drag",b).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function c(h,E){if(!(f||!t.call(this,h,E))){var I=A(this,e.call(this,h,E),h,E,"mouse");I&&(Z(h.view).on("mousemove.drag",w,Et).on("mouseup.drag",g,Et),Yt(h.view),ce(h),u=!1,s=h.clientX,l=h.clientY,I("start",h))}}function w(h){if(vt(h),!u){var E=h.clientX-s,I=h.clientY-l;u=E*E+I*I>x}o.mouse("drag",h)}function g(h){Z(h.view).on("mousemove.drag mouseup.drag",null),Ht(h.view,u),vt(h),o.mouse("end",h)}function y(h,E){if(t.call(this,h,E)){var I=h.changedTouches,S=e.call(this,h,E),M=I.length,L,D;for(L=0;L<M;++L)(D=A(this,S,h,E,I[L].identifier,I[L]))&&(ce(h),D("start",h,I[L]))}}function d(h){var E=h.changedTouches,I=E.length,S,M;for(S=0;S<I;++S)(M=o[E[S].identifier])&&(vt(h),M("drag",h,E[S]))}function b(h){var E=h.changedTouches,I=E.length,S,M;for(f&&clearTimeout(f),f=setTimeout(function(){f=null},500),S=0;S<I;++S)(M=o[E[S].identifier])&&(ce(h),M("end",h,E[S]))}function A(h,E,I,S,M,L){var D=i.copy(),$=nt(L||I,E),U,Q,m;if((m=r.call(h,new Xt("beforestart",{sourceEvent:I,target:p,identifier:M,active:a,x:$[0],y:$[1],dx:0,dy:0,dispatch:D}),S))!=null)return U=m.x-$[0]||0,Q=m.y-$[1]||0,function N(v,k,R){var O=$,z;switch(v){case"start":o[M]=N,z=a++;break;case"end":delete o[M],--a;case"drag":$=nt(R||k,E),z=a;break}D.call(v,h,new Xt(v,{sourceEvent:k,subject:m,target:p,identifier:M,active:z,x:$[0]+U,y:$[1]+Q,dx:$[0]-O[0],dy:$[1]-O[1],dispatch:D}),S)}}return p.filter=function(h){return arguments.length?(t=typeof h=="function"?h:Gt(!!h),p):t},p.container=function(h){return arguments.length?(e=typeof h=="function"?h:Gt(h),p):e},p.subject=function(h){return arguments.length?(r=typeof h=="function"?h:Gt(h),p):r},p.touchable=function(h){return arguments.length?(n=typeof h=="function"?h:Gt(!!h),p):n},p.on=function(){var h=i.on.apply(i,arguments);return h===i?p:h},p.clickDistance=function(h){return arguments.length?(x=(h=+h)*h,p):Math.sqrt(x)},p}var Ct=class extends Map{constructor(e,r=Ti){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:r}}),e!=null)for(let[n,o]of e)this.set(n,o)}get(e){return super.get(Jr(this,e))}has(e){return super.has(Jr(this,e))}set(e,r){return super.set(Ai(this,e),r)}delete(e){return super.delete(Si(this,e))}};function Jr({_intern:t,_key:e},r){let n=e(r);return t.has(n)?t.get(n):r}function Ai({_intern:t,_key:e},r){let n=e(r);return t.has(n)?t.get(n):(t.set(n,r),r)}function Si({_intern:t,_key:e},r){let n=e(r);return t.has(n)&&(r=t.get(n),t.delete(n)),r}function Ti(t){return t!==null&&typeof t=="object"?t.valueOf():t}function Be(t,e){var r,n=1;t==null&&(t=0),e==null&&(e=0);function o(){var i,a=r.length,s,l=0,u=0;for(i=0;i<a;++i)s=r[i],l+=s.x,u+=s.y;for(l=(l/a-t)*n,u=(u/a-e)*n,i=0;i<a;++i)s=r[i],s.x-=l,s.y-=u}return o.initialize=function(i){r=i},o.x=function(i){return arguments.length?(t=+i,o):t},o.y=function(i){return arguments.length?(e=+i,o):e},o.strength=function(i){return arguments.length?(n=+i,o):n},o}function tn(t){let e=+this._x.call(null,t),r=+this._y.call(null,t);return en(this.cover(e,r),e,r,t)}function en(t,e,r,n){if(isNaN(e)||isNaN(r))return t;var o,i=t._root,a={data:n},s=t._x0,l=t._y0,u=t._x1,f=t._y1,x,p,c,w,g,y,d,b;if(!i)return t._root=a,t;for(;i.length;)if((g=e>=(x=(s+u)/2))?s=x:u=x,(y=r>=(p=(l+f)/2))?l=p:f=p,o=i,!(i=i[d=y<<1|g]))return o[d]=a,t;if(c=+t._x.call(null,i.data),w=+t._y.call(null,i.data),e===c&&r===w)return a.next=i,o?o[d]=a:t._root=a,t;do o=o?o[d]=new Array(4):t._root=new Array(4),(g=e>=(x=(s+u)/2))?s=x:u=x,(y=r>=(p=(l+f)/2))?l=p:f=p;while((d=y<<1|g)===(b=(w>=p)<<1|c>=x));return o[b]=i,o[d]=a,t}function rn(t){var e,r,n=t.length,o,i,a=new Array(n),s=new Array(n),l=1/0,u=1/0,f=-1/0,x=-1/0;for(r=0;r<n;++r)isNaN(o=+this._x.call(null,e=t[r]))||isNaN(i=+this._y.call(null,e))||(a[r]=o,s[r]=i,o<l&&(l=o),o>f&&(f=o),i<u&&(u=i),i>x&&(x=i));if(l>f||u>x)return this;for(this.cover(l,u).cover(f,x),r=0;r<n;++r)en(this,a[r],s[r],t[r]);return this}function nn(t,e){if(isNaN(t=+t)||isNaN(e=+e))return this;var r=this._x0,n=this._y0,o=this._x1,i=this._y1;if(isNaN(r))o=(r=Math.floor(t))+1,i=(n=Math.floor(e))+1;else{for(var a=o-r||1,s=this._root,l,u;r>t||t>=o||n>e||e>=i;)switch(u=(e<n)<<1|t<r,l=new Array(4),l[u]=s,s=l,a*=2,u){case 0:o=r+a,i=n+a;break;case 1:r=o-a,i=n+a;break;case 2:o=r+a,n=i-a;break;case 3:r=o-a,n=i-a;break}this._root&&this._root.length&&(this._root=s)}return this._x0=r,this._y0=n,this._x1=o,this._y1=i,this}function on(){var t=[];return this.visit(function(e){if(!e.length)do t.push(e.data);while(e=e.next)}),t}function an(t){return arguments.length?this.cover(+t[0][0],+t[0][1]).cover(+t[1][0],+t[1][1]):isNaN(this._x0)?void 0:[[this._x0,this._y0],[this._x1,this._y1]]}function K(t,e,r,n,o){this.node=t,this.x0=e,this.y0=r,this.x1=n,this.y1=o}function sn(t,e,r){var n,o=this._x0,i=this._y0,a,s,l,u,f=this._x1,x=this._y1,p=[],c=this._root,w,g;for(c&&p.push(new K(c,o,i,f,x)),r==null?r=1/0:(o=t-r,i=e-r,f=t+r,x=e+r,r*=r);w=p.pop();)if(!(!(c=w.node)||(a=w.x0)>f||(s=w.y0)>x||(l=w.x1)<o||(u=w.y1)<i))if(c.length){var y=(a+l)/2,d=(s+u)/2;p.push(new K(c[3],y,d,l,u),new K(c[2],a,d,y,u),new K(c[1],y,s,l,d),new K(c[0],a,s,y,d)),(g=(e>=d)<<1|t>=y)&&(w=p[p.length-1],p[p.length-1]=p[p.length-1-g],p[p.length-1-g]=w)}else{var b=t-+this._x.call(null,c.data),A=e-+this._y.call(null,c.data),h=b*b+A*A;if(h<r){var E=Math.sqrt(r=h);o=t-E,i=e-E,f=t+E,x=e+E,n=c.data}}return n}function un(t){if(isNaN(f=+this._x.call(null,t))||isNaN(x=+this._y.call(null,t)))return this;var e,r=this._root,n,o,i,a=this._x0,s=this._y0,l=this._x1,u=this._y1,f,x,p,c,w,g,y,d;if(!r)return this;if(r.length)for(;;){if((w=f>=(p=(a+l)/2))?a=p:l=p,(g=x>=(c=(s+u)/2))?s=c:u=c,e=r,!(r=r[y=g<<1|w]))return this;if(!r.length)break;(e[y+1&3]||e[y+2&3]||e[y+3&3])&&(n=e,d=y)}for(;r.data!==t;)if(o=r,!(r=r.next))return this;return(i=r.next)&&delete r.next,o?(i?o.next=i:delete o.next,this):e?(i?e[y]=i:delete e[y],(r=e[0]||e[1]||e[2]||e[3])&&r===(e[3]||e[2]||e[1]||e[0])&&!r.length&&(n?n[d]=r:this._root=r),this):(this._root=i,this)}function ln(t){for(var e=0,r=t.length;e<r;++e)this.remove(t[e]);return this}function fn(){return this._root}function cn(){var t=0;return this.visit(function(e){if(!e.length)do++t;while(e=e.next)}),t}function hn(t){var e=[],r,n=this._root,o,i,a,s,l;for(n&&e.push(new K(n,this._x0,this._y0,this._x1,this._y1));r=e.pop();)if(!t(n=r.node,i=r.x0,a=r.y0,s=r.x1,l=r.y1)&&n.length){var u=(i+s)/2,f=(a+l)/2;(o=n[3])&&e.push(new K(o,u,f,s,l)),(o=n[2])&&e.push(new K(o,i,f,u,l)),(o=n[1])&&e.push(new K(o,u,a,s,f)),(o=n[0])&&e.push(new K(o,i,a,u,f))}return this}function pn(t){var e=[],r=[],n;for(this._root&&e.push(new K(this._root,this._x0,this._y0,this._x1,this._y1));n=e.pop();){var o=n.node;if(o.length){var i,a=n.x0,s=n.y0,l=n.x1,u=n.y1,f=(a+l)/2,x=(s+u)/2;(i=o[0])&&e.push(new K(i,a,s,f,x)),(i=o[1])&&e.push(new K(i,f,s,l,x)),(i=o[2])&&e.push(new K(i,a,x,f,u)),(i=o[3])&&e.push(new K(i,f,x,l,u))}r.push(n)}for(;n=r.pop();)t(n.node,n.x0,n.y0,n.x1,n.y1);return this}function mn(t){return t[0]}function dn(t){return arguments.length?(this._x=t,this):this._x}function xn(t){return t[1]}function gn(t){return arguments.length?(this._y=t,this):this._y}function Nt(t,e,r){var n=new qe(e??mn,r??xn,NaN,NaN,NaN,NaN);return t==null?n:n.addAll(t)}function qe(t,e,r,n,o,i){this._x=t,this._y=e,this._x0=r,this._y0=n,this._x1=o,this._y1=i,this._root=void 0}function yn(t){for(var e={data:t.data},r=e;t=t.next;)r=r.next={data:t.data};return e}var J=Nt.prototype=qe.prototype;J.copy=function(){var t=new qe(this._x,this._y,this._x0,this._y0,this._x1,this._y1),e=this._root,r,n;if(!e)return t;if(!e.length)return t._root=yn(e),t;for(r=[{source:e,target:t._root=new Array(4)}];e=r.pop();)for(var o=0;o<4;++o)(n=e.source[o])&&(n.length?r.push({source:n,target:e.target[o]=new Array(4)}):e.target[o]=yn(n));return t};J.add=tn;J.addAll=rn;J.cover=nn;J.data=on;J.extent=an;J.find=sn;J.remove=un;J.removeAll=ln;J.root=fn;J.size=cn;J.visit=hn;J.visitAfter=pn;J.x=dn;J.y=gn;function ft(t){return function(){return t}}function st(t){return(t()-.5)*1e-6}function Ii(t){return t.x+t.vx}function Mi(t){return t.y+t.vy}function $e(t){var e,r,n,o=1,i=1;typeof t!="function"&&(t=ft(t==null?1:+t));function a(){for(var u,f=e.length,x,p,c,w,g,y,d=0;d<i;++d)for(x=Nt(e,Ii,Mi).visitAfter(s),u=0;u<f;++u)p=e[u],g=r[p.index],y=g*g,c=p.x+p.vx,w=p.y+p.vy,x.visit(b);function b(A,h,E,I,S){var M=A.data,L=A.r,D=g+L;if(M){if(M.index>p.index){var $=c-M.x-M.vx,U=w-M.y-M.vy,Q=$*$+U*U;Q<D*D&&($===0&&($=st(n),Q+=$*$),U===0&&(U=st(n),Q+=U*U),Q=(D-(Q=Math.sqrt(Q)))/Q*o,p.vx+=($*=Q)*(D=(L*=L)/(y+L)),p.vy+=(U*=Q)*D,M.vx-=$*(D=1-D),M.vy-=U*D)}return}return h>c+D||I<c-D||E>w+D||S<w-D}}function s(u){if(u.data)return u.r=r[u.data.index];for(var f=u.r=0;f<4;++f)u[f]&&u[f].r>u.r&&(u.r=u[f].r)}function l(){if(e){var u,f=e.length,x;for(r=new Array(f),u=0;u<f;++u)x=e[u],r[x.index]=+t(x,u,e)}}return a.initialize=function(u,f){e=u,n=f,l()},a.iterations=function(u){return arguments.length?(i=+u,a):i},a.strength=function(u){return arguments.length?(o=+u,a):o},a.radius=function(u){return arguments.length?(t=typeof u=="function"?u:ft(+u),l(),a):t},a}function Ci(t){return t.index}function vn(t,e){var r=t.get(e);if(!r)throw new Error("node not found: "+e);return r}function Ye(t){var e=Ci,r=x,n,o=ft(30),i,a,s,l,u,f=1;t==null&&(t=[]);function x(y){return 1/Math.min(s[y.source.index],s[y.target.index])}function p(y){for(var d=0,b=t.length;d<f;++d)for(var A=0,h,E,I,S,M,L,D;A<b;++A)h=t[A],E=h.source,I=h.target,S=I.x+I.vx-E.x-E.vx||st(u),M=I.y+I.vy-E.y-E.vy||st(u),L=Math.sqrt(S*S+M*M),L=(L-i[A])/L*y*n[A],S*=L,M*=L,I.vx-=S*(D=l[A]),I.vy-=M*D,E.vx+=S*(D=1-D),E.vy+=M*D}function c(){if(a){var y,d=a.length,b=t.length,A=new Map(a.map((E,I)=>[e(E,I,a),E])),h;for(y=0,s=new Array(d);y<b;++y)h=t[y],h.index=y,typeof h.source!="object"&&(h.source=vn(A,h.source)),typeof h.target!="object"&&(h.target=vn(A,h.target)),s[h.source.index]=(s[h.source.index]||0)+1,s[h.target.index]=(s[h.target.index]||0)+1;for(y=0,l=new Array(b);y<b;++y)h=t[y],l[y]=s[h.source.index]/(s[h.source.index]+s[h.target.index]);n=new Array(b),w(),i=new Array(b),g()}}function w(){if(a)for(var y=0,d=t.length;y<d;++y)n[y]=+r(t[y],y,t)}function g(){if(a)for(var y=0,d=t.length;y<d;++y)i[y]=+o(t[y],y,t)}return p.initialize=function(y,d){a=y,u=d,c()},p.links=function(y){return arguments.length?(t=y,c(),p):t},p.id=function(y){return arguments.length?(e=y,p):e},p.iterations=function(y){return arguments.length?(f=+y,p):f},p.strength=function(y){return arguments.length?(r=typeof y=="function"?y:ft(+y),w(),p):r},p.distance=function(y){return arguments.length?(o=typeof y=="function"?y:ft(+y),g(),p):o},p}var Rt=0,Vt=0,Ft=0,wn=1e3,he,Ut,pe=0,kt=0,me=0,Kt=typeof performance=="object"&&performance.now?performance:Date,bn=typeof window=="object"&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(t){setTimeout(t,17)};function Qt(){return kt||(bn(Ri),kt=Kt.now()+me)}function Ri(){kt=0}function jt(){this._call=this._time=this._next=null}jt.prototype=Ot.prototype={constructor:jt,restart:function(t,e,r){if(typeof t!="function")throw new TypeError("callback is not a function");r=(r==null?Qt():+r)+(e==null?0:+e),!this._next&&Ut!==this&&(Ut?Ut._next=this:he=this,Ut=this),this._call=t,this._time=r,He()},stop:function(){this._call&&(this._call=null,this._time=1/0,He())}};function Ot(t,e,r){var n=new jt;return n.restart(t,e,r),n}function En(){Qt(),++Rt;for(var t=he,e;t;)(e=kt-t._time)>=0&&t._call.call(void 0,e),t=t._next;--Rt}function _n(){kt=(pe=Kt.now())+me,Rt=Vt=0;try{En()}finally{Rt=0,zi(),kt=0}}function Oi(){var t=Kt.now(),e=t-pe;e>wn&&(me-=e,pe=t)}function zi(){for(var t,e=he,r,n=1/0;e;)e._call?(n>e._time&&(n=e._time),t=e,e=e._next):(r=e._next,e._next=null,e=t?t._next=r:he=r);Ut=t,He(n)}function He(t){if(!Rt){Vt&&(Vt=clearTimeout(Vt));var e=t-kt;e>24?(t<1/0&&(Vt=setTimeout(_n,t-Kt.now()-me)),Ft&&(Ft=clearInterval(Ft))):(Ft||(pe=Kt.now(),Ft=setInterval(Oi,wn)),Rt=1,bn(_n))}}function de(t,e,r){var n=new jt;return e=e==null?0:+e,n.restart(o=>{n.stop(),t(o+e)},e,r),n}function Nn(){let t=1;return()=>(t=(1664525*t+1013904223)%4294967296)/4294967296}function kn(t){return t.x}function An(t){return t.y}var Li=10,Di=Math.PI*(3-Math.sqrt(5));function Ge(t){var e,r=1,n=.001,o=1-Math.pow(n,1/300),i=0,a=.6,s=new Map,l=Ot(x),u=dt("tick","end"),f=Nn();t==null&&(t=[]);function x(){p(),u.call("tick",e),r<n&&(l.stop(),u.call("end",e))}function p(g){var y,d=t.length,b;g===void 0&&(g=1);for(var A=0;A<g;++A)for(r+=(i-r)*o,s.forEach(function(h){h(r)}),y=0;y<d;++y)b=t[y],b.fx==null?b.x+=b.vx*=a:(b.x=b.fx,b.vx=0),b.fy==null?b.y+=b.vy*=a:(b.y=b.fy,b.vy=0);return e}function c(){for(var g=0,y=t.length,d;g<y;++g){if(d=t[g],d.index=g,d.fx!=null&&(d.x=d.fx),d.fy!=null&&(d.y=d.fy),isNaN(d.x)||isNaN(d.y)){var b=Li*Math.sqrt(.5+g),A=g*Di;d.x=b*Math.cos(A),d.y=b*Math.sin(A)}(isNaN(d.vx)||isNaN(d.vy))&&(d.vx=d.vy=0)}}function w(g){return g.initialize&&g.initialize(t,f),g}return c(),e={tick:p,restart:function(){return l.restart(x),e},stop:function(){return l.stop(),e},nodes:function(g){return arguments.length?(t=g,c(),s.forEach(w),e):t},alpha:function(g){return arguments.length?(r=+g,e):r},alphaMin:function(g){return arguments.length?(n=+g,e):n},alphaDecay:function(g){return arguments.length?(o=+g,e):+o},alphaTarget:function(g){return arguments.length?(i=+g,e):i},velocityDecay:function(g){return arguments.length?(a=1-g,e):1-a},randomSource:function(g){return arguments.length?(f=g,s.forEach(w),e):f},force:function(g,y){return arguments.length>1?(y==null?s.delete(g):s.set(g,w(y)),e):s.get(g)},find:function(g,y,d){var b=0,A=t.length,h,E,I,S,M;for(d==null?d=1/0:d*=d,b=0;b<A;++b)S=t[b],h=g-S.x,E=y-S.y,I=h*h+E*E,I<d&&(M=S,d=I);return M},on:function(g,y){return arguments.length>1?(u.on(g,y),e):u.on(g)}}}function Xe(){var t,e,r,n,o=ft(-30),i,a=1,s=1/0,l=.81;function u(c){var w,g=t.length,y=Nt(t,kn,An).visitAfter(x);for(n=c,w=0;w<g;++w)e=t[w],y.visit(p)}function f(){if(t){var c,w=t.length,g;for(i=new Array(w),c=0;c<w;++c)g=t[c],i[g.index]=+o(g,c,t)}}function x(c){var w=0,g,y,d=0,b,A,h;if(c.length){for(b=A=h=0;h<4;++h)(g=c[h])&&(y=Math.abs(g.value))&&(w+=g.value,d+=y,b+=y*g.x,A+=y*g.y);c.x=b/d,c.y=A/d}else{g=c,g.x=g.data.x,g.y=g.data.y;do w+=i[g.data.index];while(g=g.next)}c.value=w}function p(c,w,g,y){if(!c.value)return!0;var d=c.x-e.x,b=c.y-e.y,A=y-w,h=d*d+b*b;if(A*A/l<h)return h<s&&(d===0&&(d=st(r),h+=d*d),b===0&&(b=st(r),h+=b*b),h<a&&(h=Math.sqrt(a*h)),e.vx+=d*c.value*n/h,e.vy+=b*c.value*n/h),!0;if(c.length||h>=s)return;(c.data!==e||c.next)&&(d===0&&(d=st(r),h+=d*d),b===0&&(b=st(r),h+=b*b),h<a&&(h=Math.sqrt(a*h)));do c.data!==e&&(A=i[c.data.index]*n/h,e.vx+=d*A,e.vy+=b*A);while(c=c.next)}return u.initialize=function(c,w){t=c,r=w,f()},u.strength=function(c){return arguments.length?(o=typeof c=="function"?c:ft(+c),f(),u):o},u.distanceMin=function(c){return arguments.length?(a=c*c,u):Math.sqrt(a)},u.distanceMax=function(c){return arguments.length?(s=c*c,u):Math.sqrt(s)},u.theta=function(c){return arguments.length?(l=c*c,u):Math.sqrt(l)},u}function Sn(t,e){switch(arguments.length){case 0:break;case 1:this.range(t);break;default:this.range(e).domain(t);break}return this}var Fe=Symbol("implicit");function Wt(){var t=new Ct,e=[],r=[],n=Fe;function o(i){let a=t.get(i);if(a===void 0){if(n!==Fe)return n;t.set(i,a=e.push(i)-1)}return r[a%r.length]}return o.domain=function(i){if(!arguments.length)return e.slice();e=[],t=new Ct;for(let a of i)t.has(a)||t.set(a,e.push(a)-1);return o},o.range=function(i){return arguments.length?(r=Array.from(i),o):r.slice()},o.unknown=function(i){return arguments.length?(n=i,o):n},o.copy=function(){return Wt(e,r).unknown(n)},Sn.apply(o,arguments),o}function xe(t,e,r){t.prototype=e.prototype=r,r.constructor=t}function Ve(t,e){var r=Object.create(t.prototype);for(var n in e)r[n]=e[n];return r}function te(){}var Zt=.7,ve=1/Zt,zt="\\s*([+-]?\\d+)\\s*",Jt="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",ct="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",Pi=/^#([0-9a-f]{3,8})$/,Bi=new RegExp(`^rgb\\(${zt},${zt},${zt}\\)$`),qi=new RegExp(`^rgb\\(${ct},${ct},${ct}\\)$`),$i=new RegExp(`^rgba\\(${zt},${zt},${zt},${Jt}\\)$`),Yi=new RegExp(`^rgba\\(${ct},${ct},${ct},${Jt}\\)$`),Hi=new RegExp(`^hsl\\(${Jt},${ct},${ct}\\)$`),Gi=new RegExp(`^hsla\\(${Jt},${ct},${ct},${Jt}\\)$`),Tn={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};xe(te,_t,{copy(t){return Object.assign(new this.constructor,this,t)},displayable(){return this.rgb().displayable()},hex:In,formatHex:In,formatHex8:Xi,formatHsl:Fi,formatRgb:Mn,toString:Mn});function In(){return this.rgb().formatHex()}function Xi(){return this.rgb().formatHex8()}function Fi(){return Dn(this).formatHsl()}function Mn(){return this.rgb().formatRgb()}function _t(t){var e,r;return t=(t+"").trim().toLowerCase(),(e=Pi.exec(t))?(r=e[1].length,e=parseInt(e[1],16),r===6?Cn(e):r===3?new et(e>>8&15|e>>4&240,e>>4&15|e&240,(e&15)<<4|e&15,1):r===8?ge(e>>24&255,e>>16&255,e>>8&255,(e&255)/255):r===4?ge(e>>12&15|e>>8&240,e>>8&15|e>>4&240,e>>4&15|e&240,((e&15)<<4|e&15)/255):null):(e=Bi.exec(t))?new et(e[1],e[2],e[3],1):(e=qi.exec(t))?new et(e[1]*255/100,e[2]*255/100,e[3]*255/100,1):(e=$i.exec(t))?ge(e[1],e[2],e[3],e[4]):(e=Yi.exec(t))?ge(e[1]*255/100,e[2]*255/100,e[3]*255/100,e[4]):(e=Hi.exec(t))?zn(e[1],e[2]/100,e[3]/100,1):(e=Gi.exec(t))?zn(e[1],e[2]/100,e[3]/100,e[4]):Tn.hasOwnProperty(t)?Cn(Tn[t]):t==="transparent"?new et(NaN,NaN,NaN,0):null}function Cn(t){return new et(t>>16&255,t>>8&255,t&255,1)}function ge(t,e,r,n){return n<=0&&(t=e=r=NaN),new et(t,e,r,n)}function Vi(t){return t instanceof te||(t=_t(t)),t?(t=t.rgb(),new et(t.r,t.g,t.b,t.opacity)):new et}function Lt(t,e,r,n){return arguments.length===1?Vi(t):new et(t,e,r,n??1)}function et(t,e,r,n){this.r=+t,this.g=+e,this.b=+r,this.opacity=+n}xe(et,Lt,Ve(te,{brighter(t){return t=t==null?ve:Math.pow(ve,t),new et(this.r*t,this.g*t,this.b*t,this.opacity)},darker(t){return t=t==null?Zt:Math.pow(Zt,t),new et(this.r*t,this.g*t,this.b*t,this.opacity)},rgb(){return this},clamp(){return new et(St(this.r),St(this.g),St(this.b),_e(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:Rn,formatHex:Rn,formatHex8:Ui,formatRgb:On,toString:On}));function Rn(){return`#${At(this.r)}${At(this.g)}${At(this.b)}`}function Ui(){return`#${At(this.r)}${At(this.g)}${At(this.b)}${At((isNaN(this.opacity)?1:this.opacity)*255)}`}function On(){let t=_e(this.opacity);return`${t===1?"rgb(":"rgba("}${St(this.r)}, ${St(this.g)}, ${St(this.b)}${t===1?")":`, ${t})`}`}function _e(t){return isNaN(t)?1:Math.max(0,Math.min(1,t))}function St(t){return Math.max(0,Math.min(255,Math.round(t)||0))}function At(t){return t=St(t),(t<16?"0":"")+t.toString(16)}function zn(t,e,r,n){return n<=0?t=e=r=NaN:r<=0||r>=1?t=e=NaN:e<=0&&(t=NaN),new ut(t,e,r,n)}function Dn(t){if(t instanceof ut)return new ut(t.h,t.s,t.l,t.opacity);if(t instanceof te||(t=_t(t)),!t)return new ut;if(t instanceof ut)return t;t=t.rgb();var e=t.r/255,r=t.g/255,n=t.b/255,o=Math.min(e,r,n),i=Math.max(e,r,n),a=NaN,s=i-o,l=(i+o)/2;return s?(e===i?a=(r-n)/s+(r<n)*6:r===i?a=(n-e)/s+2:a=(e-r)/s+4,s/=l<.5?i+o:2-i-o,a*=60):s=l>0&&l<1?0:a,new ut(a,s,l,t.opacity)}function Pn(t,e,r,n){return arguments.length===1?Dn(t):new ut(t,e,r,n??1)}function ut(t,e,r,n){this.h=+t,this.s=+e,this.l=+r,this.opacity=+n}xe(ut,Pn,Ve(te,{brighter(t){return t=t==null?ve:Math.pow(ve,t),new ut(this.h,this.s,this.l*t,this.opacity)},darker(t){return t=t==null?Zt:Math.pow(Zt,t),new ut(this.h,this.s,this.l*t,this.opacity)},rgb(){var t=this.h%360+(this.h<0)*360,e=isNaN(t)||isNaN(this.s)?0:this.s,r=this.l,n=r+(r<.5?r:1-r)*e,o=2*r-n;return new et(Ue(t>=240?t-240:t+120,o,n),Ue(t,o,n),Ue(t<120?t+240:t-120,o,n),this.opacity)},clamp(){return new ut(Ln(this.h),ye(this.s),ye(this.l),_e(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){let t=_e(this.opacity);return`${t===1?"hsl(":"hsla("}${Ln(this.h)}, ${ye(this.s)*100}%, ${ye(this.l)*100}%${t===1?")":`, ${t})`}`}}));function Ln(t){return t=(t||0)%360,t<0?t+360:t}function ye(t){return Math.max(0,Math.min(1,t||0))}function Ue(t,e,r){return(t<60?e+(r-e)*t/60:t<180?r:t<240?e+(r-e)*(240-t)/60:e)*255}function Ke(t,e,r,n,o){var i=t*t,a=i*t;return((1-3*t+3*i-a)*e+(4-6*i+3*a)*r+(1+3*t+3*i-3*a)*n+a*o)/6}function Bn(t){var e=t.length-1;return function(r){var n=r<=0?r=0:r>=1?(r=1,e-1):Math.floor(r*e),o=t[n],i=t[n+1],a=n>0?t[n-1]:2*o-i,s=n<e-1?t[n+2]:2*i-o;return Ke((r-n/e)*e,a,o,i,s)}}function qn(t){var e=t.length;return function(r){var n=Math.floor(((r%=1)<0?++r:r)*e),o=t[(n+e-1)%e],i=t[n%e],a=t[(n+1)%e],s=t[(n+2)%e];return Ke((r-n/e)*e,o,i,a,s)}}var je=t=>()=>t;function Ki(t,e){return function(r){return t+r*e}}function ji(t,e,r){return t=Math.pow(t,r),e=Math.pow(e,r)-t,r=1/r,function(n){return Math.pow(t+n*e,r)}}function $n(t){return(t=+t)==1?we:function(e,r){return r-e?ji(e,r,t):je(isNaN(e)?r:e)}}function we(t,e){var r=e-t;return r?Ki(t,r):je(isNaN(t)?e:t)}var be=function t(e){var r=$n(e);function n(o,i){var a=r((o=Lt(o)).r,(i=Lt(i)).r),s=r(o.g,i.g),l=r(o.b,i.b),u=we(o.opacity,i.opacity);return function(f){return o.r=a(f),o.g=s(f),o.b=l(f),o.opacity=u(f),o+""}}return n.gamma=t,n}(1);function Yn(t){return function(e){var r=e.length,n=new Array(r),o=new Array(r),i=new Array(r),a,s;for(a=0;a<r;++a)s=Lt(e[a]),n[a]=s.r||0,o[a]=s.g||0,i[a]=s.b||0;return n=t(n),o=t(o),i=t(i),s.opacity=1,function(l){return s.r=n(l),s.g=o(l),s.b=i(l),s+""}}}var Qi=Yn(Bn),Wi=Yn(qn);function ot(t,e){return t=+t,e=+e,function(r){return t*(1-r)+e*r}}var We=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Qe=new RegExp(We.source,"g");function Zi(t){return function(){return t}}function Ji(t){return function(e){return t(e)+""}}function Ze(t,e){var r=We.lastIndex=Qe.lastIndex=0,n,o,i,a=-1,s=[],l=[];for(t=t+"",e=e+"";(n=We.exec(t))&&(o=Qe.exec(e));)(i=o.index)>r&&(i=e.slice(r,i),s[a]?s[a]+=i:s[++a]=i),(n=n[0])===(o=o[0])?s[a]?s[a]+=o:s[++a]=o:(s[++a]=null,l.push({i:a,x:ot(n,o)})),r=Qe.lastIndex;return r<e.length&&(i=e.slice(r),s[a]?s[a]+=i:s[++a]=i),s.length<2?l[0]?Ji(l[0].x):Zi(e):(e=l.length,function(u){for(var f=0,x;f<e;++f)s[(x=l[f]).i]=x.x(u);return s.join("")})}var Hn=180/Math.PI,Ee={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function Je(t,e,r,n,o,i){var a,s,l;return(a=Math.sqrt(t*t+e*e))&&(t/=a,e/=a),(l=t*r+e*n)&&(r-=t*l,n-=e*l),(s=Math.sqrt(r*r+n*n))&&(r/=s,n/=s,l/=s),t*n<e*r&&(t=-t,e=-e,l=-l,a=-a),{translateX:o,translateY:i,rotate:Math.atan2(e,t)*Hn,skewX:Math.atan(l)*Hn,scaleX:a,scaleY:s}}var Ne;function Gn(t){let e=new(typeof DOMMatrix=="function"?DOMMatrix:WebKitCSSMatrix)(t+"");return e.isIdentity?Ee:Je(e.a,e.b,e.c,e.d,e.e,e.f)}function Xn(t){return t==null?Ee:(Ne||(Ne=document.createElementNS("http://www.w3.org/2000/svg","g")),Ne.setAttribute("transform",t),(t=Ne.transform.baseVal.consolidate())?(t=t.matrix,Je(t.a,t.b,t.c,t.d,t.e,t.f)):Ee)}function Fn(t,e,r,n){function o(u){return u.length?u.pop()+" ":""}function i(u,f,x,p,c,w){if(u!==x||f!==p){var g=c.push("translate(",null,e,null,r);w.push({i:g-4,x:ot(u,x)},{i:g-2,x:ot(f,p)})}else(x||p)&&c.push("translate("+x+e+p+r)}function a(u,f,x,p){u!==f?(u-f>180?f+=360:f-u>180&&(u+=360),p.push({i:x.push(o(x)+"rotate(",null,n)-2,x:ot(u,f)})):f&&x.push(o(x)+"rotate("+f+n)}function s(u,f,x,p){u!==f?p.push({i:x.push(o(x)+"skewX(",null,n)-2,x:ot(u,f)}):f&&x.push(o(x)+"skewX("+f+n)}function l(u,f,x,p,c,w){if(u!==x||f!==p){var g=c.push(o(c)+"scale(",null,",",null,")");w.push({i:g-4,x:ot(u,x)},{i:g-2,x:ot(f,p)})}else(x!==1||p!==1)&&c.push(o(c)+"scale("+x+","+p+")")}return function(u,f){var x=[],p=[];return u=t(u),f=t(f),i(u.translateX,u.translateY,f.translateX,f.translateY,x,p),a(u.rotate,f.rotate,x,p),s(u.skewX,f.skewX,x,p),l(u.scaleX,u.scaleY,f.scaleX,f.scaleY,x,p),u=f=null,function(c){for(var w=-1,g=p.length,y;++w<g;)x[(y=p[w]).i]=y.x(c);return x.join("")}}}var tr=Fn(Gn,"px, ","px)","deg)"),er=Fn(Xn,", ",")",")");var ta=1e-12;function Vn(t){return((t=Math.exp(t))+1/t)/2}function ea(t){return((t=Math.exp(t))-1/t)/2}function ra(t){return((t=Math.exp(2*t))-1)/(t+1)}var rr=function t(e,r,n){function o(i,a){var s=i[0],l=i[1],u=i[2],f=a[0],x=a[1],p=a[2],c=f-s,w=x-l,g=c*c+w*w,y,d;if(g<ta)d=Math.log(p/u)/e,y=function(S){return[s+S*c,l+S*w,u*Math.exp(e*S*d)]};else{var b=Math.sqrt(g),A=(p*p-u*u+n*g)/(2*u*r*b),h=(p*p-u*u-n*g)/(2*p*r*b),E=Math.log(Math.sqrt(A*A+1)-A),I=Math.log(Math.sqrt(h*h+1)-h);d=(I-E)/e,y=function(S){var M=S*d,L=Vn(E),D=u/(r*b)*(L*ra(e*M+E)-ea(E));return[s+D*c,l+D*w,u*L/Vn(e*M+E)]}}return y.duration=d*1e3*e/Math.SQRT2,y}return o.rho=function(i){var a=Math.max(.001,+i),s=a*a,l=s*s;return t(a,s,l)},o}(Math.SQRT2,2,4);function Un(t){for(var e=t.length/6|0,r=new Array(e),n=0;n<e;)r[n]="#"+t.slice(n*6,++n*6);return r}var nr=Un("4e79a7f28e2ce1575976b7b259a14fedc949af7aa1ff9da79c755fbab0ab");var na=dt("start","end","cancel","interrupt"),oa=[],Qn=0,Kn=1,Ae=2,ke=3,jn=4,Se=5,ee=6;function wt(t,e,r,n,o,i){var a=t.__transition;if(!a)t.__transition={};else if(r in a)return;ia(t,r,{name:e,index:n,group:o,on:na,tween:oa,time:i.time,delay:i.delay,duration:i.duration,ease:i.ease,timer:null,state:Qn})}function re(t,e){var r=V(t,e);if(r.state>Qn)throw new Error("too late; already scheduled");return r}function j(t,e){var r=V(t,e);if(r.state>ke)throw new Error("too late; already running");return r}function V(t,e){var r=t.__transition;if(!r||!(r=r[e]))throw new Error("transition not found");return r}function ia(t,e,r){var n=t.__transition,o;n[e]=r,r.timer=Ot(i,0,r.time);function i(u){r.state=Kn,r.timer.restart(a,r.delay,r.time),r.delay<=u&&a(u-r.delay)}function a(u){var f,x,p,c;if(r.state!==Kn)return l();for(f in n)if(c=n[f],c.name===r.name){if(c.state===ke)return de(a);c.state===jn?(c.state=ee,c.timer.stop(),c.on.call("interrupt",t,t.__data__,c.index,c.group),delete n[f]):+f<e&&(c.state=ee,c.timer.stop(),c.on.call("cancel",t,t.__data__,c.index,c.group),delete n[f])}if(de(function(){r.state===ke&&(r.state=jn,r.timer.restart(s,r.delay,r.time),s(u))}),r.state=Ae,r.on.call("start",t,t.__data__,r.index,r.group),r.state===Ae){for(r.state=ke,o=new Array(p=r.tween.length),f=0,x=-1;f<p;++f)(c=r.tween[f].value.call(t,t.__data__,r.index,r.group))&&(o[++x]=c);o.length=x+1}}function s(u){for(var f=u<r.duration?r.ease.call(null,u/r.duration):(r.timer.restart(l),r.state=Se,1),x=-1,p=o.length;++x<p;)o[x].call(t,f);r.state===Se&&(r.on.call("end",t,t.__data__,r.index,r.group),l())}function l(){r.state=ee,r.timer.stop(),delete n[e];for(var u in n)return;delete t.__transition}}function Tt(t,e){var r=t.__transition,n,o,i=!0,a;if(r){e=e==null?null:e+"";for(a in r){if((n=r[a]).name!==e){i=!1;continue}o=n.state>Ae&&n.state<Se,n.state=ee,n.timer.stop(),n.on.call(o?"interrupt":"cancel",t,t.__data__,n.index,n.group),delete r[a]}i&&delete t.__transition}}function Wn(t){return this.each(function(){Tt(this,t)})}function aa(t,e){var r,n;return function(){var o=j(this,t),i=o.tween;if(i!==r){n=r=i;for(var a=0,s=n.length;a<s;++a)if(n[a].name===e){n=n.slice(),n.splice(a,1);break}}o.tween=n}}function sa(t,e,r){var n,o;if(typeof r!="function")throw new Error;return function(){var i=j(this,t),a=i.tween;if(a!==n){o=(n=a).slice();for(var s={name:e,value:r},l=0,u=o.length;l<u;++l)if(o[l].name===e){o[l]=s;break}l===u&&o.push(s)}i.tween=o}}function Zn(t,e){var r=this._id;if(t+="",arguments.length<2){for(var n=V(this.node(),r).tween,o=0,i=n.length,a;o<i;++o)if((a=n[o]).name===t)return a.value;return null}return this.each((e==null?aa:sa)(r,t,e))}function Dt(t,e,r){var n=t._id;return t.each(function(){var o=j(this,n);(o.value||(o.value={}))[e]=r.apply(this,arguments)}),function(o){return V(o,n).value[e]}}function Te(t,e){var r;return(typeof e=="number"?ot:e instanceof _t?be:(r=_t(e))?(e=r,be):Ze)(t,e)}function ua(t){return function(){this.removeAttribute(t)}}function la(t){return function(){this.removeAttributeNS(t.space,t.local)}}function fa(t,e,r){var n,o=r+"",i;return function(){var a=this.getAttribute(t);return a===o?null:a===n?i:i=e(n=a,r)}}function ca(t,e,r){var n,o=r+"",i;return function(){var a=this.getAttributeNS(t.space,t.local);return a===o?null:a===n?i:i=e(n=a,r)}}function ha(t,e,r){var n,o,i;return function(){var a,s=r(this),l;return s==null?void this.removeAttribute(t):(a=this.getAttribute(t),l=s+"",a===l?null:a===n&&l===o?i:(o=l,i=e(n=a,s)))}}function pa(t,e,r){var n,o,i;return function(){var a,s=r(this),l;return s==null?void this.removeAttributeNS(t.space,t.local):(a=this.getAttributeNS(t.space,t.local),l=s+"",a===l?null:a===n&&l===o?i:(o=l,i=e(n=a,s)))}}function Jn(t,e){var r=pt(t),n=r==="transform"?er:Te;return this.attrTween(t,typeof e=="function"?(r.local?pa:ha)(r,n,Dt(this,"attr."+t,e)):e==null?(r.local?la:ua)(r):(r.local?ca:fa)(r,n,e))}function ma(t,e){return function(r){this.setAttribute(t,e.call(this,r))}}function da(t,e){return function(r){this.setAttributeNS(t.space,t.local,e.call(this,r))}}function xa(t,e){var r,n;function o(){var i=e.apply(this,arguments);return i!==n&&(r=(n=i)&&da(t,i)),r}return o._value=e,o}function ga(t,e){var r,n;function o(){var i=e.apply(this,arguments);return i!==n&&(r=(n=i)&&ma(t,i)),r}return o._value=e,o}function to(t,e){var r="attr."+t;if(arguments.length<2)return(r=this.tween(r))&&r._value;if(e==null)return this.tween(r,null);if(typeof e!="function")throw new Error;var n=pt(t);return this.tween(r,(n.local?xa:ga)(n,e))}function ya(t,e){return function(){re(this,t).delay=+e.apply(this,arguments)}}function va(t,e){return e=+e,function(){re(this,t).delay=e}}function eo(t){var e=this._id;return arguments.length?this.each((typeof t=="function"?ya:va)(e,t)):V(this.node(),e).delay}function _a(t,e){return function(){j(this,t).duration=+e.apply(this,arguments)}}function wa(t,e){return e=+e,function(){j(this,t).duration=e}}function ro(t){var e=this._id;return arguments.length?this.each((typeof t=="function"?_a:wa)(e,t)):V(this.node(),e).duration}function ba(t,e){if(typeof e!="function")throw new Error;return function(){j(this,t).ease=e}}function no(t){var e=this._id;return arguments.length?this.each(ba(e,t)):V(this.node(),e).ease}function Ea(t,e){return function(){var r=e.apply(this,arguments);if(typeof r!="function")throw new Error;j(this,t).ease=r}}function oo(t){if(typeof t!="function")throw new Error;return this.each(Ea(this._id,t))}function io(t){typeof t!="function"&&(t=qt(t));for(var e=this._groups,r=e.length,n=new Array(r),o=0;o<r;++o)for(var i=e[o],a=i.length,s=n[o]=[],l,u=0;u<a;++u)(l=i[u])&&t.call(l,l.__data__,u,i)&&s.push(l);return new tt(n,this._parents,this._name,this._id)}function ao(t){if(t._id!==this._id)throw new Error;for(var e=this._groups,r=t._groups,n=e.length,o=r.length,i=Math.min(n,o),a=new Array(n),s=0;s<i;++s)for(var l=e[s],u=r[s],f=l.length,x=a[s]=new Array(f),p,c=0;c<f;++c)(p=l[c]||u[c])&&(x[c]=p);for(;s<n;++s)a[s]=e[s];return new tt(a,this._parents,this._name,this._id)}function Na(t){return(t+"").trim().split(/^|\s+/).every(function(e){var r=e.indexOf(".");return r>=0&&(e=e.slice(0,r)),!e||e==="start"})}function ka(t,e,r){var n,o,i=Na(e)?re:j;return function(){var a=i(this,t),s=a.on;s!==n&&(o=(n=s).copy()).on(e,r),a.on=o}}function so(t,e){var r=this._id;return arguments.length<2?V(this.node(),r).on.on(t):this.each(ka(r,t,e))}function Aa(t){return function(){var e=this.parentNode;for(var r in this.__transition)if(+r!==t)return;e&&e.removeChild(this)}}function uo(){return this.on("end.remove",Aa(this._id))}function lo(t){var e=this._name,r=this._id;typeof t!="function"&&(t=bt(t));for(var n=this._groups,o=n.length,i=new Array(o),a=0;a<o;++a)for(var s=n[a],l=s.length,u=i[a]=new Array(l),f,x,p=0;p<l;++p)(f=s[p])&&(x=t.call(f,f.__data__,p,s))&&("__data__"in f&&(x.__data__=f.__data__),u[p]=x,wt(u[p],e,r,p,u,V(f,r)));return new tt(i,this._parents,e,r)}function fo(t){var e=this._name,r=this._id;typeof t!="function"&&(t=Bt(t));for(var n=this._groups,o=n.length,i=[],a=[],s=0;s<o;++s)for(var l=n[s],u=l.length,f,x=0;x<u;++x)if(f=l[x]){for(var p=t.call(f,f.__data__,x,l),c,w=V(f,r),g=0,y=p.length;g<y;++g)(c=p[g])&&wt(c,e,r,g,p,w);i.push(p),a.push(f)}return new tt(i,a,e,r)}var Sa=mt.prototype.constructor;function co(){return new Sa(this._groups,this._parents)}function Ta(t,e){var r,n,o;return function(){var i=yt(this,t),a=(this.style.removeProperty(t),yt(this,t));return i===a?null:i===r&&a===n?o:o=e(r=i,n=a)}}function ho(t){return function(){this.style.removeProperty(t)}}function Ia(t,e,r){var n,o=r+"",i;return function(){var a=yt(this,t);return a===o?null:a===n?i:i=e(n=a,r)}}function Ma(t,e,r){var n,o,i;return function(){var a=yt(this,t),s=r(this),l=s+"";return s==null&&(l=s=(this.style.removeProperty(t),yt(this,t))),a===l?null:a===n&&l===o?i:(o=l,i=e(n=a,s))}}function Ca(t,e){var r,n,o,i="style."+e,a="end."+i,s;return function(){var l=j(this,t),u=l.on,f=l.value[i]==null?s||(s=ho(e)):void 0;(u!==r||o!==f)&&(n=(r=u).copy()).on(a,o=f),l.on=n}}function po(t,e,r){var n=(t+="")=="transform"?tr:Te;return e==null?this.styleTween(t,Ta(t,n)).on("end.style."+t,ho(t)):typeof e=="function"?this.styleTween(t,Ma(t,n,Dt(this,"style."+t,e))).each(Ca(this._id,t)):this.styleTween(t,Ia(t,n,e),r).on("end.style."+t,null)}function Ra(t,e,r){return function(n){this.style.setProperty(t,e.call(this,n),r)}}function Oa(t,e,r){var n,o;function i(){var a=e.apply(this,arguments);return a!==o&&(n=(o=a)&&Ra(t,a,r)),n}return i._value=e,i}function mo(t,e,r){var n="style."+(t+="");if(arguments.length<2)return(n=this.tween(n))&&n._value;if(e==null)return this.tween(n,null);if(typeof e!="function")throw new Error;return this.tween(n,Oa(t,e,r??""))}function za(t){return function(){this.textContent=t}}function La(t){return function(){var e=t(this);this.textContent=e??""}}function xo(t){return this.tween("text",typeof t=="function"?La(Dt(this,"text",t)):za(t==null?"":t+""))}function Da(t){return function(e){this.textContent=t.call(this,e)}}function Pa(t){var e,r;function n(){var o=t.apply(this,arguments);return o!==r&&(e=(r=o)&&Da(o)),e}return n._value=t,n}function go(t){var e="text";if(arguments.length<1)return(e=this.tween(e))&&e._value;if(t==null)return this.tween(e,null);if(typeof t!="function")throw new Error;return this.tween(e,Pa(t))}function yo(){for(var t=this._name,e=this._id,r=Ie(),n=this._groups,o=n.length,i=0;i<o;++i)for(var a=n[i],s=a.length,l,u=0;u<s;++u)if(l=a[u]){var f=V(l,e);wt(l,t,r,u,a,{time:f.time+f.delay+f.duration,delay:0,duration:f.duration,ease:f.ease})}return new tt(n,this._parents,t,r)}function vo(){var t,e,r=this,n=r._id,o=r.size();return new Promise(function(i,a){var s={value:a},l={value:function(){--o===0&&i()}};r.each(function(){var u=j(this,n),f=u.on;f!==t&&(e=(t=f).copy(),e._.cancel.push(s),e._.interrupt.push(s),e._.end.push(l)),u.on=e}),o===0&&i()})}var Ba=0;function tt(t,e,r,n){this._groups=t,this._parents=e,this._name=r,this._id=n}function _o(t){return mt().transition(t)}function Ie(){return++Ba}var xt=mt.prototype;tt.prototype=_o.prototype={constructor:tt,select:lo,selectAll:fo,selectChild:xt.selectChild,selectChildren:xt.selectChildren,filter:io,merge:ao,selection:co,transition:yo,call:xt.call,nodes:xt.nodes,node:xt.node,size:xt.size,empty:xt.empty,each:xt.each,on:so,attr:Jn,attrTween:to,style:po,styleTween:mo,text:xo,textTween:go,remove:uo,tween:Zn,delay:eo,duration:ro,ease:no,easeVarying:oo,end:vo,[Symbol.iterator]:xt[Symbol.iterator]};function Me(t){return((t*=2)<=1?t*t*t:(t-=2)*t*t+2)/2}var qa={time:null,delay:0,duration:250,ease:Me};function $a(t,e){for(var r;!(r=t.__transition)||!(r=r[e]);)if(!(t=t.parentNode))throw new Error(`transition ${e} not found`);return r}function wo(t){var e,r;t instanceof tt?(e=t._id,t=t._name):(e=Ie(),(r=qa).time=Qt(),t=t==null?null:t+"");for(var n=this._groups,o=n.length,i=0;i<o;++i)for(var a=n[i],s=a.length,l,u=0;u<s;++u)(l=a[u])&&wt(l,t,e,u,a,r||$a(l,e));return new tt(n,this._parents,t,e)}mt.prototype.interrupt=Wn;mt.prototype.transition=wo;var ne=t=>()=>t;function or(t,{sourceEvent:e,target:r,transform:n,dispatch:o}){Object.defineProperties(this,{type:{value:t,enumerable:!0,configurable:!0},sourceEvent:{value:e,enumerable:!0,configurable:!0},target:{value:r,enumerable:!0,configurable:!0},transform:{value:n,enumerable:!0,configurable:!0},_:{value:o}})}function lt(t,e,r){this.k=t,this.x=e,this.y=r}lt.prototype={constructor:lt,scale:function(t){return t===1?this:new lt(this.k*t,this.x,this.y)},translate:function(t,e){return t===0&e===0?this:new lt(this.k,this.x+this.k*t,this.y+this.k*e)},apply:function(t){return[t[0]*this.k+this.x,t[1]*this.k+this.y]},applyX:function(t){return t*this.k+this.x},applyY:function(t){return t*this.k+this.y},invert:function(t){return[(t[0]-this.x)/this.k,(t[1]-this.y)/this.k]},invertX:function(t){return(t-this.x)/this.k},invertY:function(t){return(t-this.y)/this.k},rescaleX:function(t){return t.copy().domain(t.range().map(this.invertX,this).map(t.invert,t))},rescaleY:function(t){return t.copy().domain(t.range().map(this.invertY,this).map(t.invert,t))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var oe=new lt(1,0,0);ir.prototype=lt.prototype;function ir(t){for(;!t.__zoom;)if(!(t=t.parentNode))return oe;return t.__zoom}function Ce(t){t.stopImmediatePropagation()}function Pt(t){t.preventDefault(),t.stopImmediatePropagation()}function Ya(t){return(!t.ctrlKey||t.type==="wheel")&&!t.button}function Ha(){var t=this;return t instanceof SVGElement?(t=t.ownerSVGElement||t,t.hasAttribute("viewBox")?(t=t.viewBox.baseVal,[[t.x,t.y],[t.x+t.width,t.y+t.height]]):[[0,0],[t.width.baseVal.value,t.height.baseVal.value]]):[[0,0],[t.clientWidth,t.clientHeight]]}function bo(){return this.__zoom||oe}function Ga(t){return-t.deltaY*(t.deltaMode===1?.05:t.deltaMode?1:.002)*(t.ctrlKey?10:1)}function Xa(){return navigator.maxTouchPoints||"ontouchstart"in this}function Fa(t,e,r){var n=t.invertX(e[0][0])-r[0][0],o=t.invertX(e[1][0])-r[1][0],i=t.invertY(e[0][1])-r[0][1],a=t.invertY(e[1][1])-r[1][1];return t.translate(o>n?(n+o)/2:Math.min(0,n)||Math.max(0,o),a>i?(i+a)/2:Math.min(0,i)||Math.max(0,a))}function ar(){var t=Ya,e=Ha,r=Fa,n=Ga,o=Xa,i=[0,1/0],a=[[-1/0,-1/0],[1/0,1/0]],s=250,l=rr,u=dt("start","zoom","end"),f,x,p,c=500,w=150,g=0,y=10;function d(m){m.property("__zoom",bo).on("wheel.zoom",M,{passive:!1}).on("mousedown.zoom",L).on("dblclick.zoom",D).filter(o).on("touchstart.zoom",$).on("touchmove.zoom",U).on("touchend.zoom touchcancel.zoom",Q).style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}d.transform=function(m,N,v,k){var R=m.selection?m.selection():m;R.property("__zoom",bo),m!==R?E(m,N,v,k):R.interrupt().each(function(){I(this,arguments).event(k).start().zoom(null,typeof N=="function"?N.apply(this,arguments):N).end()})},d.scaleBy=function(m,N,v,k){d.scaleTo(m,function(){var R=this.__zoom.k,O=typeof N=="function"?N.apply(this,arguments):N;return R*O},v,k)},d.scaleTo=function(m,N,v,k){d.transform(m,function(){var R=e.apply(this,arguments),O=this.__zoom,z=v==null?h(R):typeof v=="function"?v.apply(this,arguments):v,q=O.invert(z),Y=typeof N=="function"?N.apply(this,arguments):N;return r(A(b(O,Y),z,q),R,a)},v,k)},d.translateBy=function(m,N,v,k){d.transform(m,function(){return r(this.__zoom.translate(typeof N=="function"?N.apply(this,arguments):N,typeof v=="function"?v.apply(this,arguments):v),e.apply(this,arguments),a)},null,k)},d.translateTo=function(m,N,v,k,R){d.transform(m,function(){var O=e.apply(this,arguments),z=this.__zoom,q=k==null?h(O):typeof k=="function"?k.apply(this,arguments):k;return r(oe.translate(q[0],q[1]).scale(z.k).translate(typeof N=="function"?-N.apply(this,arguments):-N,typeof v=="function"?-v.apply(this,arguments):-v),O,a)},k,R)};function b(m,N){return N=Math.max(i[0],Math.min(i[1],N)),N===m.k?m:new lt(N,m.x,m.y)}function A(m,N,v){var k=N[0]-v[0]*m.k,R=N[1]-v[1]*m.k;return k===m.x&&R===m.y?m:new lt(m.k,k,R)}function h(m){return[(+m[0][0]+ +m[1][0])/2,(+m[0][1]+ +m[1][1])/2]}function E(m,N,v,k){m.on("start.zoom",function(){I(this,arguments).event(k).start()}).on("interrupt.zoom end.zoom",function(){I(this,arguments).event(k).end()}).tween("zoom",function(){var R=this,O=arguments,z=I(R,O).event(k),q=e.apply(R,O),Y=v==null?h(q):typeof v=="function"?v.apply(R,O):v,rt=Math.max(q[1][0]-q[0][0],q[1][1]-q[0][1]),H=R.__zoom,G=typeof N=="function"?N.apply(R,O):N,it=l(H.invert(Y).concat(rt/H.k),G.invert(Y).concat(rt/G.k));return function(W){if(W===1)W=G;else{var at=it(W),It=rt/at[2];W=new lt(It,Y[0]-at[0]*It,Y[1]-at[1]*It)}z.zoom(null,W)}})}function I(m,N,v){return!v&&m.__zooming||new S(m,N)}function S(m,N){this.that=m,this.args=N,this.active=0,this.sourceEvent=null,this.extent=e.apply(m,N),this.taps=0}S.prototype={event:function(m){return m&&(this.sourceEvent=m),this},start:function(){return++this.active===1&&(this.that.__zooming=this,this.emit("start")),this},zoom:function(m,N){return this.mouse&&m!=="mouse"&&(this.mouse[1]=N.invert(this.mouse[0])),this.touch0&&m!=="touch"&&(this.touch0[1]=N.invert(this.touch0[0])),this.touch1&&m!=="touch"&&(this.touch1[1]=N.invert(this.touch1[0])),this.that.__zoom=N,this.emit("zoom"),this},end:function(){return--this.active===0&&(delete this.that.__zooming,this.emit("end")),this},emit:function(m){var N=Z(this.that).datum();u.call(m,this.that,new or(m,{sourceEvent:this.sourceEvent,target:d,type:m,transform:this.that.__zoom,dispatch:u}),N)}};function M(m,...N){if(!t.apply(this,arguments))return;var v=I(this,N).event(m),k=this.__zoom,R=Math.max(i[0],Math.min(i[1],k.k*Math.pow(2,n.apply(this,arguments)))),O=nt(m);if(v.wheel)(v.mouse[0][0]!==O[0]||v.mouse[0][1]!==O[1])&&(v.mouse[1]=k.invert(v.mouse[0]=O)),clearTimeout(v.wheel);else{if(k.k===R)return;v.mouse=[O,k.invert(O)],Tt(this),v.start()}Pt(m),v.wheel=setTimeout(z,w),v.zoom("mouse",r(A(b(k,R),v.mouse[0],v.mouse[1]),v.extent,a));function z(){v.wheel=null,v.end()}}function L(m,...N){if(p||!t.apply(this,arguments))return;var v=m.currentTarget,k=I(this,N,!0).event(m),R=Z(m.view).on("mousemove.zoom",Y,!0).on("mouseup.zoom",rt,!0),O=nt(m,v),z=m.clientX,q=m.clientY;Yt(m.view),Ce(m),k.mouse=[O,this.__zoom.invert(O)],Tt(this),k.start();function Y(H){if(Pt(H),!k.moved){var G=H.clientX-z,it=H.clientY-q;k.moved=G*G+it*it>g}k.event(H).zoom("mouse",r(A(k.that.__zoom,k.mouse[0]=nt(H,v),k.mouse[1]),k.extent,a))}function rt(H){R.on("mousemove.zoom mouseup.zoom",null),Ht(H.view,k.moved),Pt(H),k.event(H).end()}}function D(m,...N){if(t.apply(this,arguments)){var v=this.__zoom,k=nt(m.changedTouches?m.changedTouches[0]:m,this),R=v.invert(k),O=v.k*(m.shiftKey?.5:2),z=r(A(b(v,O),k,R),e.apply(this,N),a);Pt(m),s>0?Z(this).transition().duration(s).call(E,z,k,m):Z(this).call(d.transform,z,k,m)}}function $(m,...N){if(t.apply(this,arguments)){var v=m.touches,k=v.length,R=I(this,N,m.changedTouches.length===k).event(m),O,z,q,Y;for(Ce(m),z=0;z<k;++z)q=v[z],Y=nt(q,this),Y=[Y,this.__zoom.invert(Y),q.identifier],R.touch0?!R.touch1&&R.touch0[2]!==Y[2]&&(R.touch1=Y,R.taps=0):(R.touch0=Y,O=!0,R.taps=1+!!f);f&&(f=clearTimeout(f)),O&&(R.taps<2&&(x=Y[0],f=setTimeout(function(){f=null},c)),Tt(this),R.start())}}function U(m,...N){if(this.__zooming){var v=I(this,N).event(m),k=m.changedTouches,R=k.length,O,z,q,Y;for(Pt(m),O=0;O<R;++O)z=k[O],q=nt(z,this),v.touch0&&v.touch0[2]===z.identifier?v.touch0[0]=q:v.touch1&&v.touch1[2]===z.identifier&&(v.touch1[0]=q);if(z=v.that.__zoom,v.touch1){var rt=v.touch0[0],H=v.touch0[1],G=v.touch1[0],it=v.touch1[1],W=(W=G[0]-rt[0])*W+(W=G[1]-rt[1])*W,at=(at=it[0]-H[0])*at+(at=it[1]-H[1])*at;z=b(z,Math.sqrt(W/at)),q=[(rt[0]+G[0])/2,(rt[1]+G[1])/2],Y=[(H[0]+it[0])/2,(H[1]+it[1])/2]}else if(v.touch0)q=v.touch0[0],Y=v.touch0[1];else return;v.zoom("touch",r(A(z,q,Y),v.extent,a))}}function Q(m,...N){if(this.__zooming){var v=I(this,N).event(m),k=m.changedTouches,R=k.length,O,z;for(Ce(m),p&&clearTimeout(p),p=setTimeout(function(){p=null},c),O=0;O<R;++O)z=k[O],v.touch0&&v.touch0[2]===z.identifier?delete v.touch0:v.touch1&&v.touch1[2]===z.identifier&&delete v.touch1;if(v.touch1&&!v.touch0&&(v.touch0=v.touch1,delete v.touch1),v.touch0)v.touch0[1]=this.__zoom.invert(v.touch0[0]);else if(v.end(),v.taps===2&&(z=nt(z,this),Math.hypot(x[0]-z[0],x[1]-z[1])<y)){var q=Z(this).on("dblclick.zoom");q&&q.apply(this,arguments)}}}return d.wheelDelta=function(m){return arguments.length?(n=typeof m=="function"?m:ne(+m),d):n},d.filter=function(m){return arguments.length?(t=typeof m=="function"?m:ne(!!m),d):t},d.touchable=function(m){return arguments.length?(o=typeof m=="function"?m:ne(!!m),d):o},d.extent=function(m){return arguments.length?(e=typeof m=="function"?m:ne([[+m[0][0],+m[0][1]],[+m[1][0],+m[1][1]]]),d):e},d.scaleExtent=function(m){return arguments.length?(i[0]=+m[0],i[1]=+m[1],d):[i[0],i[1]]},d.translateExtent=function(m){return arguments.length?(a[0][0]=+m[0][0],a[1][0]=+m[1][0],a[0][1]=+m[0][1],a[1][1]=+m[1][1],d):[[a[0][0],a[0][1]],[a[1][0],a[1][1]]]},d.constrain=function(m){return arguments.length?(r=m,d):r},d.duration=function(m){return arguments.length?(s=+m,d):s},d.interpolate=function(m){return arguments.length?(l=m,d):l},d.on=function(){var m=u.on.apply(u,arguments);return m===u?d:m},d.clickDistance=function(m){return arguments.length?(g=(m=+m)*m,d):Math.sqrt(g)},d.tapDistance=function(m){return arguments.length?(y=+m,d):y},d}var Va=["MATCH","OPTIONAL MATCH","WHERE","RETURN","WITH","ORDER BY","LIMIT","SKIP","CREATE","MERGE","DELETE","DETACH DELETE","SET","REMOVE","UNWIND","CALL","YIELD","AS","AND","OR","NOT","IN","IS NULL","IS NOT NULL","DISTINCT","COUNT","COLLECT","EXISTS","CASE","WHEN","THEN","ELSE","END"];function Ua({model:t,el:e}){let r=0,n=document.createElement("div");n.classList.add("neo4j-widget"),e.appendChild(n);let o=document.createElement("div");o.classList.add("neo4j-query-bar"),n.appendChild(o);let i=document.createElement("div");i.classList.add("neo4j-input-wrapper"),o.appendChild(i);let a=document.createElement("textarea");a.classList.add("neo4j-query-input"),a.placeholder="Enter Cypher query... (Ctrl+Enter to run)",a.rows=3,i.appendChild(a);let s=document.createElement("div");s.classList.add("neo4j-autocomplete-dropdown"),s.style.display="none",i.appendChild(s);let l=document.createElement("button");l.classList.add("neo4j-run-btn"),l.textContent="Run",o.appendChild(l);let u=document.createElement("div");u.classList.add("neo4j-error-bar"),u.style.display="none",n.appendChild(u);let f=Wt(nr),x=document.createElement("div");x.classList.add("neo4j-schema-bar"),n.appendChild(x);function p(){let _=t.get("schema")||{},T=_.labels||[],B=_.relationship_types||[];if(x.innerHTML="",T.length===0&&B.length===0){x.style.display="none";return}x.style.display="flex",T.forEach(F=>{let C=document.createElement("span");C.classList.add("neo4j-schema-chip","neo4j-schema-label"),C.style.backgroundColor=f(F),C.textContent=F,C.addEventListener("click",()=>{a.value=`MATCH (n:${F}) RETURN n LIMIT 25`,a.focus()}),x.appendChild(C)}),B.forEach(F=>{let C=document.createElement("span");C.classList.add("neo4j-schema-chip","neo4j-schema-rel"),C.textContent=F,C.addEventListener("click",()=>{a.value=`MATCH (a)-[r:${F}]->(b) RETURN a, r, b LIMIT 25`,a.focus()}),x.appendChild(C)})}p();let c=t.get("width"),w=t.get("height"),g=document.createElementNS("http://www.w3.org/2000/svg","svg");g.setAttribute("width",c),g.setAttribute("height",w),g.classList.add("neo4j-graph"),n.appendChild(g);let y=Z(g);y.append("defs").append("marker").attr("id","neo4j-arrowhead").attr("viewBox","-0 -5 10 10").attr("refX",20).attr("refY",0).attr("orient","auto").attr("markerWidth",6).attr("markerHeight",6).append("path").attr("d","M0,-5L10,0L0,5").attr("class","neo4j-arrow");let d=y.append("g").attr("class","neo4j-zoom-group");y.call(ar().scaleExtent([.1,5]).on("zoom",_=>{d.attr("transform",_.transform)}));let b=d.append("g").attr("class","neo4j-links"),A=d.append("g").attr("class","neo4j-nodes"),h=document.createElement("div");h.classList.add("neo4j-tooltip"),h.style.display="none",n.appendChild(h);let E=[],I=[],S=new Set,M=new Set,L=Ge().force("link",Ye().id(_=>_.element_id).distance(120)).force("charge",Xe().strength(-300)).force("center",Be(c/2,w/2)).force("collide",$e().radius(35)).on("tick",D);L.stop();function D(){b.selectAll(".neo4j-link").attr("x1",_=>_.source.x).attr("y1",_=>_.source.y).attr("x2",_=>_.target.x).attr("y2",_=>_.target.y),b.selectAll(".neo4j-link-label").attr("x",_=>(_.source.x+_.target.x)/2).attr("y",_=>(_.source.y+_.target.y)/2),A.selectAll(".neo4j-node-group").attr("transform",_=>`translate(${_.x},${_.y})`)}let wgStream=null;function wgMsg(_){!_||_.type!=="delta"||((_.reset||!wgStream)&&(wgStream=_.reset?{nodes:[],rels:[]}:{nodes:[...t.get("nodes")||[]],rels:[...t.get("relationships")||[]]}),wgStream.nodes.push(..._.nodes||[]),wgStream.rels.push(..._.relationships||[]),$())}function wgSynced(){wgStream=null,$()}function $(){let _=wgStream?wgStream.nodes:t.get("nodes")||[],T=wgStream?wgStream.rels:t.get("relationships")||[],B=new Map(_.map(C=>[C.element_id,C])),F=new Map;E.forEach(C=>{F.set(C.element_id,{x:C.x,y:C.y,vx:C.vx,vy:C.vy})}),E=_.map(C=>{let P=F.get(C.element_id);return P?{...C,...P}:{...C,x:c/2+(Math.random()-.5)*100,y:w/2+(Math.random()-.5)*100}}),I=T.filter(C=>B.has(C.start_node_element_id)&&B.has(C.end_node_element_id)).map(C=>({...C,source:C.start_node_element_id,target:C.end_node_element_id})),L.nodes(E),L.force("link").links(I),L.alpha(.3).restart(),U()}function U(){let _=b.selectAll(".neo4j-link").data(I,P=>P.element_id);_.exit().remove(),_.enter().append("line").attr("class","neo4j-link").attr("marker-end","url(#neo4j-arrowhead)").on("click",R).on("mouseenter",(P,ht)=>q(P,z(ht.type,ht.properties))).on("mouseleave",Y).merge(_).classed("neo4j-selected",P=>M.has(P.element_id));let T=b.selectAll(".neo4j-link-label").data(I,P=>P.element_id);T.exit().remove(),T.enter().append("text").attr("class","neo4j-link-label").merge(T).text(P=>P.type);let B=A.selectAll(".neo4j-node-group").data(E,P=>P.element_id);B.exit().remove();let F=B.enter().append("g").attr("class","neo4j-node-group").call(Pe().on("start",Q).on("drag",m).on("end",N)).on("click",v).on("dblclick",k).on("mouseenter",(P,ht)=>q(P,z(ht.labels.join(":"),ht.properties))).on("mouseleave",Y);F.append("circle").attr("class","neo4j-node").attr("r",14).attr("fill",P=>f(P.labels[0]||"")),F.append("text").attr("class","neo4j-node-label").attr("dy",28).attr("text-anchor","middle");let C=F.merge(B);C.select(".neo4j-node").attr("fill",P=>f(P.labels[0]||"")).classed("neo4j-selected",P=>S.has(P.element_id)),C.select(".neo4j-node-label").text(P=>P.display)}function Q(_,T){_.active||L.alphaTarget(.1).restart(),T.fx=T.x,T.fy=T.y}function m(_,T){T.fx=_.x,T.fy=_.y}function N(_,T){_.active||L.alphaTarget(0),T.fx=null,T.fy=null}function v(_,T){_.stopPropagation(),_.ctrlKey||_.metaKey?S.has(T.element_id)?S.delete(T.element_id):S.add(T.element_id):(S.has(T.element_id)&&S.size===1?S.clear():(S.clear(),S.add(T.element_id)),M.clear()),O(),U()}function k(_,T){_.stopPropagation(),_.preventDefault(),t.set("_expand_request",{element_id:T.element_id,request_id:++r}),t.save_changes()}function R(_,T){_.stopPropagation(),_.ctrlKey||_.metaKey?M.has(T.element_id)?M.delete(T.element_id):M.add(T.element_id):(M.has(T.element_id)&&M.size===1?M.clear():(M.clear(),M.add(T.element_id)),S.clear()),O(),U()}g.addEventListener("click",_=>{_.target===g&&(S.clear(),M.clear(),O(),U())});function O(){t.set("selected_nodes",Array.from(S)),t.set("selected_relationships",Array.from(M)),t.save_changes()}function z(_,T){let B=`<strong>${_}</strong>`;for(let[F,C]of Object.entries(T||{}))B+=`<br><span class="neo4j-tooltip-key">${F}:</span> ${C}`;return B}function q(_,T){h.innerHTML=T,h.style.display="block";let B=n.getBoundingClientRect();h.style.left=_.clientX-B.left+12+"px",h.style.top=_.clientY-B.top+12+"px"}function Y(){h.style.display="none"}function rt(){let _=a.value.trim();_&&(t.set("_query_request",{query:_,request_id:++r}),t.save_changes())}l.addEventListener("click",rt),a.addEventListener("keydown",_=>{if(s.style.display!=="none"&&(_.key==="ArrowDown"||_.key==="ArrowUp"||_.key==="Tab"||_.key==="Enter")){at(_);return}(_.ctrlKey||_.metaKey)&&_.key==="Enter"&&(_.preventDefault(),rt())});let H=[],G=-1;a.addEventListener("input",()=>{let _=a.value,T=a.selectionStart,B=_.slice(0,T),F=t.get("schema")||{},C=[],P=T,ht=B.match(/[:(\s]:?\s*(\w*)$/);if(ht){let gt=ht[1].toLowerCase();P=T-ht[1].length,C=(F.labels||[]).filter(Mt=>Mt.toLowerCase().startsWith(gt))}let Re=B.match(/\[\s*:?\s*(\w*)$/);if(Re){let gt=Re[1].toLowerCase();P=T-Re[1].length,C=(F.relationship_types||[]).filter(Mt=>Mt.toLowerCase().startsWith(gt))}if(C.length===0){let gt=B.match(/(?:^|\s)(\w+)$/);if(gt&&gt[1].length>=2){let Mt=gt[1].toUpperCase();P=T-gt[1].length,C=Va.filter(sr=>sr.startsWith(Mt)&&sr!==Mt)}}C.length>0&&C.length<=12?it(C,P):W()});function it(_,T){H=_,G=-1,s.innerHTML="",_.forEach((B,F)=>{let C=document.createElement("div");C.classList.add("neo4j-ac-item"),C.textContent=B,C.addEventListener("mousedown",P=>{P.preventDefault(),It(B,T)}),s.appendChild(C)}),s.style.display="block",s._replaceFrom=T}function W(){s.style.display="none",H=[],G=-1}function at(_){if(_.key==="ArrowDown")_.preventDefault(),G=Math.min(G+1,H.length-1);else if(_.key==="ArrowUp")_.preventDefault(),G=Math.max(G-1,0);else if(_.key==="Tab"||_.key==="Enter"){_.preventDefault(),G>=0&&G<H.length&&It(H[G],s._replaceFrom);return}let T=s.children;for(let B=0;B<T.length;B++)T[B].classList.toggle("neo4j-ac-active",B===G)}function It(_,T){let B=a.value,F=a.selectionStart;a.value=B.slice(0,T)+_+B.slice(F),a.selectionStart=a.selectionEnd=T+_.length,W(),a.focus()}a.addEventListener("blur",()=>{setTimeout(W,150)}),t.on("change:nodes",wgSynced),t.on("change:relationships",wgSynced),t.on("msg:custom",wgMsg),t.on("change:error",()=>{let _=t.get("error");_?(u.textContent=_,u.style.display="block"):u.style.display="none"}),t.on("change:query_running",()=>{let _=t.get("query_running");!_&&wgStream&&wgSynced(),l.textContent=_?"...":"Run",l.disabled=_}),(t.get("nodes")||[]).length>0&&$()}var Yp={render:Ua};export{Yp as default};
@@ -6,7 +6,7 @@ var Sd=Object.create;var Ni=Object.defineProperty;var bd=Object.getOwnPropertyDe
 `+i[a].replace(" at new "," at ");return l.displayName&&m.includes("<anonymous>")&&(m=m.replace("<anonymous>",l.displayName)),m}while(1<=a&&0<=e);break}}}finally{dc=!1,Error.prepareStackTrace=u}return(u=l?l.displayName||l.name:"")?Ha(u):""}function Wd(l){switch(l.tag){case 26:case 27:case 5:return Ha(l.type);case 16:return Ha("Lazy");case 13:return Ha("Suspense");case 19:return Ha("SuspenseList");case 0:case 15:return l=oc(l.type,!1),l;case 11:return l=oc(l.type.render,!1),l;case 1:return l=oc(l.type,!0),l;default:return""}}function d0(l){try{var t="";do t+=Wd(l),l=l.return;while(l);return t}catch(u){return`
 Error generating stack: `+u.message+`
 `+u.stack}}function sa(l){var t=l,u=l;if(l.alternate)for(;t.return;)t=t.return;else{l=t;do t=l,(t.flags&4098)!==0&&(u=t.return),l=t.return;while(l)}return t.tag===3?u:null}function N1(l){if(l.tag===13){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function o0(l){if(sa(l)!==l)throw Error(g(188))}function kd(l){var t=l.alternate;if(!t){if(t=sa(l),t===null)throw Error(g(188));return t!==l?null:l}for(var u=l,a=t;;){var e=u.return;if(e===null)break;var n=e.alternate;if(n===null){if(a=e.return,a!==null){u=a;continue}break}if(e.child===n.child){for(n=e.child;n;){if(n===u)return o0(e),l;if(n===a)return o0(e),t;n=n.sibling}throw Error(g(188))}if(u.return!==a.return)u=e,a=n;else{for(var c=!1,f=e.child;f;){if(f===u){c=!0,u=e,a=n;break}if(f===a){c=!0,a=e,u=n;break}f=f.sibling}if(!c){for(f=n.child;f;){if(f===u){c=!0,u=n,a=e;break}if(f===a){c=!0,a=n,u=e;break}f=f.sibling}if(!c)throw Error(g(189))}}if(u.alternate!==a)throw Error(g(190))}if(u.tag!==3)throw Error(g(188));return u.stateNode.current===u?l:t}function B1(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l;for(l=l.child;l!==null;){if(t=B1(l),t!==null)return t;l=l.sibling}return null}var Ra=Array.isArray,K=Vd.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,iu={pending:!1,data:null,method:null,action:null},Kc=[],Cu=-1;function ct(l){return{current:l}}function sl(l){0>Cu||(l.current=Kc[Cu],Kc[Cu]=null,Cu--)}function w(l,t){Cu++,Kc[Cu]=l.current,l.current=t}var ut=ct(null),Wa=ct(null),Zt=ct(null),en=ct(null);function nn(l,t){switch(w(Zt,t),w(Wa,l),w(ut,null),l=t.nodeType,l){case 9:case 11:t=(t=t.documentElement)&&(t=t.namespaceURI)?y1(t):0;break;default:if(l=l===8?t.parentNode:t,t=l.tagName,l=l.namespaceURI)l=y1(l),t=Kv(l,t);else switch(t){case"svg":t=1;break;case"math":t=2;break;default:t=0}}sl(ut),w(ut,t)}function la(){sl(ut),sl(Wa),sl(Zt)}function Jc(l){l.memoizedState!==null&&w(en,l);var t=ut.current,u=Kv(t,l.type);t!==u&&(w(Wa,l),w(ut,u))}function cn(l){Wa.current===l&&(sl(ut),sl(Wa)),en.current===l&&(sl(en),ne._currentValue=iu)}var wc=Object.prototype.hasOwnProperty,Xf=nl.unstable_scheduleCallback,hc=nl.unstable_cancelCallback,$d=nl.unstable_shouldYield,Fd=nl.unstable_requestPaint,at=nl.unstable_now,Pd=nl.unstable_getCurrentPriorityLevel,q1=nl.unstable_ImmediatePriority,Y1=nl.unstable_UserBlockingPriority,fn=nl.unstable_NormalPriority,Id=nl.unstable_LowPriority,C1=nl.unstable_IdlePriority,lo=nl.log,to=nl.unstable_setDisableYieldValue,se=null,Hl=null;function uo(l){if(Hl&&typeof Hl.onCommitFiberRoot=="function")try{Hl.onCommitFiberRoot(se,l,void 0,(l.current.flags&128)===128)}catch{}}function Qt(l){if(typeof lo=="function"&&to(l),Hl&&typeof Hl.setStrictMode=="function")try{Hl.setStrictMode(se,l)}catch{}}var Rl=Math.clz32?Math.clz32:no,ao=Math.log,eo=Math.LN2;function no(l){return l>>>=0,l===0?32:31-(ao(l)/eo|0)|0}var He=128,Re=4194304;function au(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return l&4194176;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Bn(l,t){var u=l.pendingLanes;if(u===0)return 0;var a=0,e=l.suspendedLanes,n=l.pingedLanes,c=l.warmLanes;l=l.finishedLanes!==0;var f=u&134217727;return f!==0?(u=f&~e,u!==0?a=au(u):(n&=f,n!==0?a=au(n):l||(c=f&~c,c!==0&&(a=au(c))))):(f=u&~e,f!==0?a=au(f):n!==0?a=au(n):l||(c=u&~c,c!==0&&(a=au(c)))),a===0?0:t!==0&&t!==a&&(t&e)===0&&(e=a&-a,c=t&-t,e>=c||e===32&&(c&4194176)!==0)?t:a}function ve(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function co(l,t){switch(l){case 1:case 2:case 4:case 8:return t+250;case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function X1(){var l=He;return He<<=1,(He&4194176)===0&&(He=128),l}function G1(){var l=Re;return Re<<=1,(Re&62914560)===0&&(Re=4194304),l}function yc(l){for(var t=[],u=0;31>u;u++)t.push(l);return t}function de(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function fo(l,t,u,a,e,n){var c=l.pendingLanes;l.pendingLanes=u,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=u,l.entangledLanes&=u,l.errorRecoveryDisabledLanes&=u,l.shellSuspendCounter=0;var f=l.entanglements,i=l.expirationTimes,s=l.hiddenUpdates;for(u=c&~u;0<u;){var m=31-Rl(u),S=1<<m;f[m]=0,i[m]=-1;var h=s[m];if(h!==null)for(s[m]=null,m=0;m<h.length;m++){var y=h[m];y!==null&&(y.lane&=-536870913)}u&=~S}a!==0&&Q1(l,a,0),n!==0&&e===0&&l.tag!==0&&(l.suspendedLanes|=n&~(c&~t))}function Q1(l,t,u){l.pendingLanes|=t,l.suspendedLanes&=~t;var a=31-Rl(t);l.entangledLanes|=t,l.entanglements[a]=l.entanglements[a]|1073741824|u&4194218}function x1(l,t){var u=l.entangledLanes|=t;for(l=l.entanglements;u;){var a=31-Rl(u),e=1<<a;e&t|l[a]&t&&(l[a]|=t),u&=~e}}function Z1(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function j1(){var l=K.p;return l!==0?l:(l=window.event,l===void 0?32:td(l.type))}function io(l,t){var u=K.p;try{return K.p=l,t()}finally{K.p=u}}var It=Math.random().toString(36).slice(2),ml="__reactFiber$"+It,Al="__reactProps$"+It,va="__reactContainer$"+It,Wc="__reactEvents$"+It,so="__reactListeners$"+It,vo="__reactHandles$"+It,h0="__reactResources$"+It,ka="__reactMarker$"+It;function Gf(l){delete l[ml],delete l[Al],delete l[Wc],delete l[so],delete l[vo]}function cu(l){var t=l[ml];if(t)return t;for(var u=l.parentNode;u;){if(t=u[va]||u[ml]){if(u=t.alternate,t.child!==null||u!==null&&u.child!==null)for(l=r1(l);l!==null;){if(u=l[ml])return u;l=r1(l)}return t}l=u,u=l.parentNode}return null}function da(l){if(l=l[ml]||l[va]){var t=l.tag;if(t===5||t===6||t===13||t===26||t===27||t===3)return l}return null}function pa(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(g(33))}function Ju(l){var t=l[h0];return t||(t=l[h0]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function fl(l){l[ka]=!0}var V1=new Set,L1={};function bu(l,t){ta(l,t),ta(l+"Capture",t)}function ta(l,t){for(L1[l]=t,l=0;l<t.length;l++)V1.add(t[l])}var Tt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),oo=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),y0={},m0={};function ho(l){return wc.call(m0,l)?!0:wc.call(y0,l)?!1:oo.test(l)?m0[l]=!0:(y0[l]=!0,!1)}function Je(l,t,u){if(ho(t))if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var a=t.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+u)}}function pe(l,t,u){if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+u)}}function it(l,t,u,a){if(a===null)l.removeAttribute(u);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(u);return}l.setAttributeNS(t,u,""+a)}}function Xl(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function K1(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function yo(l){var t=K1(l)?"checked":"value",u=Object.getOwnPropertyDescriptor(l.constructor.prototype,t),a=""+l[t];if(!l.hasOwnProperty(t)&&typeof u<"u"&&typeof u.get=="function"&&typeof u.set=="function"){var e=u.get,n=u.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return e.call(this)},set:function(c){a=""+c,n.call(this,c)}}),Object.defineProperty(l,t,{enumerable:u.enumerable}),{getValue:function(){return a},setValue:function(c){a=""+c},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function sn(l){l._valueTracker||(l._valueTracker=yo(l))}function J1(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var u=t.getValue(),a="";return l&&(a=K1(l)?l.checked?"true":"false":l.value),l=a,l!==u?(t.setValue(l),!0):!1}function vn(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var mo=/[\n"\\]/g;function xl(l){return l.replace(mo,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function kc(l,t,u,a,e,n,c,f){l.name="",c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.type=c:l.removeAttribute("type"),t!=null?c==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+Xl(t)):l.value!==""+Xl(t)&&(l.value=""+Xl(t)):c!=="submit"&&c!=="reset"||l.removeAttribute("value"),t!=null?$c(l,c,Xl(t)):u!=null?$c(l,c,Xl(u)):a!=null&&l.removeAttribute("value"),e==null&&n!=null&&(l.defaultChecked=!!n),e!=null&&(l.checked=e&&typeof e!="function"&&typeof e!="symbol"),f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"?l.name=""+Xl(f):l.removeAttribute("name")}function w1(l,t,u,a,e,n,c,f){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||u!=null){if(!(n!=="submit"&&n!=="reset"||t!=null))return;u=u!=null?""+Xl(u):"",t=t!=null?""+Xl(t):u,f||t===l.value||(l.value=t),l.defaultValue=t}a=a??e,a=typeof a!="function"&&typeof a!="symbol"&&!!a,l.checked=f?l.checked:!!a,l.defaultChecked=!!a,c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"&&(l.name=c)}function $c(l,t,u){t==="number"&&vn(l.ownerDocument)===l||l.defaultValue===""+u||(l.defaultValue=""+u)}function wu(l,t,u,a){if(l=l.options,t){t={};for(var e=0;e<u.length;e++)t["$"+u[e]]=!0;for(u=0;u<l.length;u++)e=t.hasOwnProperty("$"+l[u].value),l[u].selected!==e&&(l[u].selected=e),e&&a&&(l[u].defaultSelected=!0)}else{for(u=""+Xl(u),t=null,e=0;e<l.length;e++){if(l[e].value===u){l[e].selected=!0,a&&(l[e].defaultSelected=!0);return}t!==null||l[e].disabled||(t=l[e])}t!==null&&(t.selected=!0)}}function W1(l,t,u){if(t!=null&&(t=""+Xl(t),t!==l.value&&(l.value=t),u==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=u!=null?""+Xl(u):""}function k1(l,t,u,a){if(t==null){if(a!=null){if(u!=null)throw Error(g(92));if(Ra(a)){if(1<a.length)throw Error(g(93));a=a[0]}u=a}u==null&&(u=""),t=u}u=Xl(t),l.defaultValue=u,a=l.textContent,a===u&&a!==""&&a!==null&&(l.value=a)}function ua(l,t){if(t){var u=l.firstChild;if(u&&u===l.lastChild&&u.nodeType===3){u.nodeValue=t;return}}l.textContent=t}var ro=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function r0(l,t,u){var a=t.indexOf("--")===0;u==null||typeof u=="boolean"||u===""?a?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":a?l.setProperty(t,u):typeof u!="number"||u===0||ro.has(t)?t==="float"?l.cssFloat=u:l[t]=(""+u).trim():l[t]=u+"px"}function $1(l,t,u){if(t!=null&&typeof t!="object")throw Error(g(62));if(l=l.style,u!=null){for(var a in u)!u.hasOwnProperty(a)||t!=null&&t.hasOwnProperty(a)||(a.indexOf("--")===0?l.setProperty(a,""):a==="float"?l.cssFloat="":l[a]="");for(var e in t)a=t[e],t.hasOwnProperty(e)&&u[e]!==a&&r0(l,e,a)}else for(var n in t)t.hasOwnProperty(n)&&r0(l,n,t[n])}function Qf(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var go=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),So=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function we(l){return So.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}var Fc=null;function xf(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var Xu=null,Wu=null;function g0(l){var t=da(l);if(t&&(l=t.stateNode)){var u=l[Al]||null;l:switch(l=t.stateNode,t.type){case"input":if(kc(l,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name),t=u.name,u.type==="radio"&&t!=null){for(u=l;u.parentNode;)u=u.parentNode;for(u=u.querySelectorAll('input[name="'+xl(""+t)+'"][type="radio"]'),t=0;t<u.length;t++){var a=u[t];if(a!==l&&a.form===l.form){var e=a[Al]||null;if(!e)throw Error(g(90));kc(a,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name)}}for(t=0;t<u.length;t++)a=u[t],a.form===l.form&&J1(a)}break l;case"textarea":W1(l,u.value,u.defaultValue);break l;case"select":t=u.value,t!=null&&wu(l,!!u.multiple,t,!1)}}}var mc=!1;function F1(l,t,u){if(mc)return l(t,u);mc=!0;try{var a=l(t);return a}finally{if(mc=!1,(Xu!==null||Wu!==null)&&(Vn(),Xu&&(t=Xu,l=Wu,Wu=Xu=null,g0(t),l)))for(t=0;t<l.length;t++)g0(l[t])}}function $a(l,t){var u=l.stateNode;if(u===null)return null;var a=u[Al]||null;if(a===null)return null;u=a[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(l=l.type,a=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!a;break l;default:l=!1}if(l)return null;if(u&&typeof u!="function")throw Error(g(231,t,typeof u));return u}var Pc=!1;if(Tt)try{Hu={},Object.defineProperty(Hu,"passive",{get:function(){Pc=!0}}),window.addEventListener("test",Hu,Hu),window.removeEventListener("test",Hu,Hu)}catch{Pc=!1}var Hu,xt=null,Zf=null,We=null;function P1(){if(We)return We;var l,t=Zf,u=t.length,a,e="value"in xt?xt.value:xt.textContent,n=e.length;for(l=0;l<u&&t[l]===e[l];l++);var c=u-l;for(a=1;a<=c&&t[u-a]===e[n-a];a++);return We=e.slice(l,1<a?1-a:void 0)}function ke(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function Ne(){return!0}function S0(){return!1}function Ml(l){function t(u,a,e,n,c){this._reactName=u,this._targetInst=e,this.type=a,this.nativeEvent=n,this.target=c,this.currentTarget=null;for(var f in l)l.hasOwnProperty(f)&&(u=l[f],this[f]=u?u(n):n[f]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?Ne:S0,this.isPropagationStopped=S0,this}return J(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var u=this.nativeEvent;u&&(u.preventDefault?u.preventDefault():typeof u.returnValue!="unknown"&&(u.returnValue=!1),this.isDefaultPrevented=Ne)},stopPropagation:function(){var u=this.nativeEvent;u&&(u.stopPropagation?u.stopPropagation():typeof u.cancelBubble!="unknown"&&(u.cancelBubble=!0),this.isPropagationStopped=Ne)},persist:function(){},isPersistent:Ne}),t}var Eu={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},qn=Ml(Eu),oe=J({},Eu,{view:0,detail:0}),bo=Ml(oe),rc,gc,Ta,Yn=J({},oe,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:jf,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==Ta&&(Ta&&l.type==="mousemove"?(rc=l.screenX-Ta.screenX,gc=l.screenY-Ta.screenY):gc=rc=0,Ta=l),rc)},movementY:function(l){return"movementY"in l?l.movementY:gc}}),b0=Ml(Yn),Eo=J({},Yn,{dataTransfer:0}),To=Ml(Eo),zo=J({},oe,{relatedTarget:0}),Sc=Ml(zo),Ao=J({},Eu,{animationName:0,elapsedTime:0,pseudoElement:0}),Mo=Ml(Ao),Oo=J({},Eu,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),Do=Ml(Oo),_o=J({},Eu,{data:0}),E0=Ml(_o),Uo={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Ho={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Ro={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function po(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=Ro[l])?!!t[l]:!1}function jf(){return po}var No=J({},oe,{key:function(l){if(l.key){var t=Uo[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=ke(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?Ho[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:jf,charCode:function(l){return l.type==="keypress"?ke(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?ke(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),Bo=Ml(No),qo=J({},Yn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),T0=Ml(qo),Yo=J({},oe,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:jf}),Co=Ml(Yo),Xo=J({},Eu,{propertyName:0,elapsedTime:0,pseudoElement:0}),Go=Ml(Xo),Qo=J({},Yn,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),xo=Ml(Qo),Zo=J({},Eu,{newState:0,oldState:0}),jo=Ml(Zo),Vo=[9,13,27,32],Vf=Tt&&"CompositionEvent"in window,Ba=null;Tt&&"documentMode"in document&&(Ba=document.documentMode);var Lo=Tt&&"TextEvent"in window&&!Ba,I1=Tt&&(!Vf||Ba&&8<Ba&&11>=Ba),z0=" ",A0=!1;function ls(l,t){switch(l){case"keyup":return Vo.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ts(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var Gu=!1;function Ko(l,t){switch(l){case"compositionend":return ts(t);case"keypress":return t.which!==32?null:(A0=!0,z0);case"textInput":return l=t.data,l===z0&&A0?null:l;default:return null}}function Jo(l,t){if(Gu)return l==="compositionend"||!Vf&&ls(l,t)?(l=P1(),We=Zf=xt=null,Gu=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return I1&&t.locale!=="ko"?null:t.data;default:return null}}var wo={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function M0(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!wo[l.type]:t==="textarea"}function us(l,t,u,a){Xu?Wu?Wu.push(a):Wu=[a]:Xu=a,t=Dn(t,"onChange"),0<t.length&&(u=new qn("onChange","change",null,u,a),l.push({event:u,listeners:t}))}var qa=null,Fa=null;function Wo(l){jv(l,0)}function Cn(l){var t=pa(l);if(J1(t))return l}function O0(l,t){if(l==="change")return t}var as=!1;Tt&&(Tt?(qe="oninput"in document,qe||(bc=document.createElement("div"),bc.setAttribute("oninput","return;"),qe=typeof bc.oninput=="function"),Be=qe):Be=!1,as=Be&&(!document.documentMode||9<document.documentMode));var Be,qe,bc;function D0(){qa&&(qa.detachEvent("onpropertychange",es),Fa=qa=null)}function es(l){if(l.propertyName==="value"&&Cn(Fa)){var t=[];us(t,Fa,l,xf(l)),F1(Wo,t)}}function ko(l,t,u){l==="focusin"?(D0(),qa=t,Fa=u,qa.attachEvent("onpropertychange",es)):l==="focusout"&&D0()}function $o(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Cn(Fa)}function Fo(l,t){if(l==="click")return Cn(t)}function Po(l,t){if(l==="input"||l==="change")return Cn(t)}function Io(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var Nl=typeof Object.is=="function"?Object.is:Io;function Pa(l,t){if(Nl(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var u=Object.keys(l),a=Object.keys(t);if(u.length!==a.length)return!1;for(a=0;a<u.length;a++){var e=u[a];if(!wc.call(t,e)||!Nl(l[e],t[e]))return!1}return!0}function _0(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function U0(l,t){var u=_0(l);l=0;for(var a;u;){if(u.nodeType===3){if(a=l+u.textContent.length,l<=t&&a>=t)return{node:u,offset:t-l};l=a}l:{for(;u;){if(u.nextSibling){u=u.nextSibling;break l}u=u.parentNode}u=void 0}u=_0(u)}}function ns(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?ns(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function cs(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=vn(l.document);t instanceof l.HTMLIFrameElement;){try{var u=typeof t.contentWindow.location.href=="string"}catch{u=!1}if(u)l=t.contentWindow;else break;t=vn(l.document)}return t}function Lf(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}function l2(l,t){var u=cs(t);t=l.focusedElem;var a=l.selectionRange;if(u!==t&&t&&t.ownerDocument&&ns(t.ownerDocument.documentElement,t)){if(a!==null&&Lf(t)){if(l=a.start,u=a.end,u===void 0&&(u=l),"selectionStart"in t)t.selectionStart=l,t.selectionEnd=Math.min(u,t.value.length);else if(u=(l=t.ownerDocument||document)&&l.defaultView||window,u.getSelection){u=u.getSelection();var e=t.textContent.length,n=Math.min(a.start,e);a=a.end===void 0?n:Math.min(a.end,e),!u.extend&&n>a&&(e=a,a=n,n=e),e=U0(t,n);var c=U0(t,a);e&&c&&(u.rangeCount!==1||u.anchorNode!==e.node||u.anchorOffset!==e.offset||u.focusNode!==c.node||u.focusOffset!==c.offset)&&(l=l.createRange(),l.setStart(e.node,e.offset),u.removeAllRanges(),n>a?(u.addRange(l),u.extend(c.node,c.offset)):(l.setEnd(c.node,c.offset),u.addRange(l)))}}for(l=[],u=t;u=u.parentNode;)u.nodeType===1&&l.push({element:u,left:u.scrollLeft,top:u.scrollTop});for(typeof t.focus=="function"&&t.focus(),t=0;t<l.length;t++)u=l[t],u.element.scrollLeft=u.left,u.element.scrollTop=u.top}}var t2=Tt&&"documentMode"in document&&11>=document.documentMode,Qu=null,Ic=null,Ya=null,lf=!1;function H0(l,t,u){var a=u.window===u?u.document:u.nodeType===9?u:u.ownerDocument;lf||Qu==null||Qu!==vn(a)||(a=Qu,"selectionStart"in a&&Lf(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),Ya&&Pa(Ya,a)||(Ya=a,a=Dn(Ic,"onSelect"),0<a.length&&(t=new qn("onSelect","select",null,t,u),l.push({event:t,listeners:a}),t.target=Qu)))}function uu(l,t){var u={};return u[l.toLowerCase()]=t.toLowerCase(),u["Webkit"+l]="webkit"+t,u["Moz"+l]="moz"+t,u}var xu={animationend:uu("Animation","AnimationEnd"),animationiteration:uu("Animation","AnimationIteration"),animationstart:uu("Animation","AnimationStart"),transitionrun:uu("Transition","TransitionRun"),transitionstart:uu("Transition","TransitionStart"),transitioncancel:uu("Transition","TransitionCancel"),transitionend:uu("Transition","TransitionEnd")},Ec={},fs={};Tt&&(fs=document.createElement("div").style,"AnimationEvent"in window||(delete xu.animationend.animation,delete xu.animationiteration.animation,delete xu.animationstart.animation),"TransitionEvent"in window||delete xu.transitionend.transition);function Tu(l){if(Ec[l])return Ec[l];if(!xu[l])return l;var t=xu[l],u;for(u in t)if(t.hasOwnProperty(u)&&u in fs)return Ec[l]=t[u];return l}var is=Tu("animationend"),ss=Tu("animationiteration"),vs=Tu("animationstart"),u2=Tu("transitionrun"),a2=Tu("transitionstart"),e2=Tu("transitioncancel"),ds=Tu("transitionend"),os=new Map,R0="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll scrollEnd toggle touchMove waiting wheel".split(" ");function Fl(l,t){os.set(l,t),bu(t,[l])}var Cl=[],Zu=0,Kf=0;function Xn(){for(var l=Zu,t=Kf=Zu=0;t<l;){var u=Cl[t];Cl[t++]=null;var a=Cl[t];Cl[t++]=null;var e=Cl[t];Cl[t++]=null;var n=Cl[t];if(Cl[t++]=null,a!==null&&e!==null){var c=a.pending;c===null?e.next=e:(e.next=c.next,c.next=e),a.pending=e}n!==0&&hs(u,e,n)}}function Gn(l,t,u,a){Cl[Zu++]=l,Cl[Zu++]=t,Cl[Zu++]=u,Cl[Zu++]=a,Kf|=a,l.lanes|=a,l=l.alternate,l!==null&&(l.lanes|=a)}function Jf(l,t,u,a){return Gn(l,t,u,a),dn(l)}function kt(l,t){return Gn(l,null,null,t),dn(l)}function hs(l,t,u){l.lanes|=u;var a=l.alternate;a!==null&&(a.lanes|=u);for(var e=!1,n=l.return;n!==null;)n.childLanes|=u,a=n.alternate,a!==null&&(a.childLanes|=u),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(e=!0)),l=n,n=n.return;e&&t!==null&&l.tag===3&&(n=l.stateNode,e=31-Rl(u),n=n.hiddenUpdates,l=n[e],l===null?n[e]=[t]:l.push(t),t.lane=u|536870912)}function dn(l){if(50<wa)throw wa=0,Af=null,Error(g(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var ju={},p0=new WeakMap;function Zl(l,t){if(typeof l=="object"&&l!==null){var u=p0.get(l);return u!==void 0?u:(t={value:l,source:t,stack:d0(t)},p0.set(l,t),t)}return{value:l,source:t,stack:d0(t)}}var Vu=[],Lu=0,on=null,hn=0,Gl=[],Ql=0,su=null,rt=1,gt="";function eu(l,t){Vu[Lu++]=hn,Vu[Lu++]=on,on=l,hn=t}function ys(l,t,u){Gl[Ql++]=rt,Gl[Ql++]=gt,Gl[Ql++]=su,su=l;var a=rt;l=gt;var e=32-Rl(a)-1;a&=~(1<<e),u+=1;var n=32-Rl(t)+e;if(30<n){var c=e-e%5;n=(a&(1<<c)-1).toString(32),a>>=c,e-=c,rt=1<<32-Rl(t)+e|u<<e|a,gt=n+l}else rt=1<<n|u<<e|a,gt=l}function wf(l){l.return!==null&&(eu(l,1),ys(l,1,0))}function Wf(l){for(;l===on;)on=Vu[--Lu],Vu[Lu]=null,hn=Vu[--Lu],Vu[Lu]=null;for(;l===su;)su=Gl[--Ql],Gl[Ql]=null,gt=Gl[--Ql],Gl[Ql]=null,rt=Gl[--Ql],Gl[Ql]=null}var bl=null,ol=null,C=!1,kl=null,lt=!1,tf=Error(g(519));function yu(l){var t=Error(g(418,""));throw Ia(Zl(t,l)),tf}function N0(l){var t=l.stateNode,u=l.type,a=l.memoizedProps;switch(t[ml]=l,t[Al]=a,u){case"dialog":q("cancel",t),q("close",t);break;case"iframe":case"object":case"embed":q("load",t);break;case"video":case"audio":for(u=0;u<ue.length;u++)q(ue[u],t);break;case"source":q("error",t);break;case"img":case"image":case"link":q("error",t),q("load",t);break;case"details":q("toggle",t);break;case"input":q("invalid",t),w1(t,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0),sn(t);break;case"select":q("invalid",t);break;case"textarea":q("invalid",t),k1(t,a.value,a.defaultValue,a.children),sn(t)}u=a.children,typeof u!="string"&&typeof u!="number"&&typeof u!="bigint"||t.textContent===""+u||a.suppressHydrationWarning===!0||Lv(t.textContent,u)?(a.popover!=null&&(q("beforetoggle",t),q("toggle",t)),a.onScroll!=null&&q("scroll",t),a.onScrollEnd!=null&&q("scrollend",t),a.onClick!=null&&(t.onclick=Kn),t=!0):t=!1,t||yu(l)}function B0(l){for(bl=l.return;bl;)switch(bl.tag){case 3:case 27:lt=!0;return;case 5:case 13:lt=!1;return;default:bl=bl.return}}function za(l){if(l!==bl)return!1;if(!C)return B0(l),C=!0,!1;var t=!1,u;if((u=l.tag!==3&&l.tag!==27)&&((u=l.tag===5)&&(u=l.type,u=!(u!=="form"&&u!=="button")||Rf(l.type,l.memoizedProps)),u=!u),u&&(t=!0),t&&ol&&yu(l),B0(l),l.tag===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(g(317));l:{for(l=l.nextSibling,t=0;l;){if(l.nodeType===8)if(u=l.data,u==="/$"){if(t===0){ol=$l(l.nextSibling);break l}t--}else u!=="$"&&u!=="$!"&&u!=="$?"||t++;l=l.nextSibling}ol=null}}else ol=bl?$l(l.stateNode.nextSibling):null;return!0}function he(){ol=bl=null,C=!1}function Ia(l){kl===null?kl=[l]:kl.push(l)}var Ca=Error(g(460)),ms=Error(g(474)),uf={then:function(){}};function q0(l){return l=l.status,l==="fulfilled"||l==="rejected"}function Ye(){}function rs(l,t,u){switch(u=l[u],u===void 0?l.push(t):u!==t&&(t.then(Ye,Ye),t=u),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,l===Ca?Error(g(483)):l;default:if(typeof t.status=="string")t.then(Ye,Ye);else{if(l=L,l!==null&&100<l.shellSuspendCounter)throw Error(g(482));l=t,l.status="pending",l.then(function(a){if(t.status==="pending"){var e=t;e.status="fulfilled",e.value=a}},function(a){if(t.status==="pending"){var e=t;e.status="rejected",e.reason=a}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,l===Ca?Error(g(483)):l}throw Xa=t,Ca}}var Xa=null;function Y0(){if(Xa===null)throw Error(g(459));var l=Xa;return Xa=null,l}var ku=null,le=0;function Ce(l){var t=le;return le+=1,ku===null&&(ku=[]),rs(ku,l,t)}function Aa(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function Xe(l,t){throw t.$$typeof===Ld?Error(g(525)):(l=Object.prototype.toString.call(t),Error(g(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function C0(l){var t=l._init;return t(l._payload)}function gs(l){function t(d,v){if(l){var o=d.deletions;o===null?(d.deletions=[v],d.flags|=16):o.push(v)}}function u(d,v){if(!l)return null;for(;v!==null;)t(d,v),v=v.sibling;return null}function a(d){for(var v=new Map;d!==null;)d.key!==null?v.set(d.key,d):v.set(d.index,d),d=d.sibling;return v}function e(d,v){return d=Lt(d,v),d.index=0,d.sibling=null,d}function n(d,v,o){return d.index=o,l?(o=d.alternate,o!==null?(o=o.index,o<v?(d.flags|=33554434,v):o):(d.flags|=33554434,v)):(d.flags|=1048576,v)}function c(d){return l&&d.alternate===null&&(d.flags|=33554434),d}function f(d,v,o,r){return v===null||v.tag!==6?(v=Nc(o,d.mode,r),v.return=d,v):(v=e(v,o),v.return=d,v)}function i(d,v,o,r){var b=o.type;return b===Yu?m(d,v,o.props.children,r,o.key):v!==null&&(v.elementType===b||typeof b=="object"&&b!==null&&b.$$typeof===Bt&&C0(b)===v.type)?(v=e(v,o.props),Aa(v,o),v.return=d,v):(v=ln(o.type,o.key,o.props,null,d.mode,r),Aa(v,o),v.return=d,v)}function s(d,v,o,r){return v===null||v.tag!==4||v.stateNode.containerInfo!==o.containerInfo||v.stateNode.implementation!==o.implementation?(v=Bc(o,d.mode,r),v.return=d,v):(v=e(v,o.children||[]),v.return=d,v)}function m(d,v,o,r,b){return v===null||v.tag!==7?(v=du(o,d.mode,r,b),v.return=d,v):(v=e(v,o),v.return=d,v)}function S(d,v,o){if(typeof v=="string"&&v!==""||typeof v=="number"||typeof v=="bigint")return v=Nc(""+v,d.mode,o),v.return=d,v;if(typeof v=="object"&&v!==null){switch(v.$$typeof){case Ue:return o=ln(v.type,v.key,v.props,null,d.mode,o),Aa(o,v),o.return=d,o;case Ua:return v=Bc(v,d.mode,o),v.return=d,v;case Bt:var r=v._init;return v=r(v._payload),S(d,v,o)}if(Ra(v)||Ea(v))return v=du(v,d.mode,o,null),v.return=d,v;if(typeof v.then=="function")return S(d,Ce(v),o);if(v.$$typeof===mt)return S(d,Ge(d,v),o);Xe(d,v)}return null}function h(d,v,o,r){var b=v!==null?v.key:null;if(typeof o=="string"&&o!==""||typeof o=="number"||typeof o=="bigint")return b!==null?null:f(d,v,""+o,r);if(typeof o=="object"&&o!==null){switch(o.$$typeof){case Ue:return o.key===b?i(d,v,o,r):null;case Ua:return o.key===b?s(d,v,o,r):null;case Bt:return b=o._init,o=b(o._payload),h(d,v,o,r)}if(Ra(o)||Ea(o))return b!==null?null:m(d,v,o,r,null);if(typeof o.then=="function")return h(d,v,Ce(o),r);if(o.$$typeof===mt)return h(d,v,Ge(d,o),r);Xe(d,o)}return null}function y(d,v,o,r,b){if(typeof r=="string"&&r!==""||typeof r=="number"||typeof r=="bigint")return d=d.get(o)||null,f(v,d,""+r,b);if(typeof r=="object"&&r!==null){switch(r.$$typeof){case Ue:return d=d.get(r.key===null?o:r.key)||null,i(v,d,r,b);case Ua:return d=d.get(r.key===null?o:r.key)||null,s(v,d,r,b);case Bt:var H=r._init;return r=H(r._payload),y(d,v,o,r,b)}if(Ra(r)||Ea(r))return d=d.get(o)||null,m(v,d,r,b,null);if(typeof r.then=="function")return y(d,v,o,Ce(r),b);if(r.$$typeof===mt)return y(d,v,o,Ge(v,r),b);Xe(v,r)}return null}function E(d,v,o,r){for(var b=null,H=null,z=v,M=v=0,j=null;z!==null&&M<o.length;M++){z.index>M?(j=z,z=null):j=z.sibling;var B=h(d,z,o[M],r);if(B===null){z===null&&(z=j);break}l&&z&&B.alternate===null&&t(d,z),v=n(B,v,M),H===null?b=B:H.sibling=B,H=B,z=j}if(M===o.length)return u(d,z),C&&eu(d,M),b;if(z===null){for(;M<o.length;M++)z=S(d,o[M],r),z!==null&&(v=n(z,v,M),H===null?b=z:H.sibling=z,H=z);return C&&eu(d,M),b}for(z=a(z);M<o.length;M++)j=y(z,d,M,o[M],r),j!==null&&(l&&j.alternate!==null&&z.delete(j.key===null?M:j.key),v=n(j,v,M),H===null?b=j:H.sibling=j,H=j);return l&&z.forEach(function(Tl){return t(d,Tl)}),C&&eu(d,M),b}function O(d,v,o,r){if(o==null)throw Error(g(151));for(var b=null,H=null,z=v,M=v=0,j=null,B=o.next();z!==null&&!B.done;M++,B=o.next()){z.index>M?(j=z,z=null):j=z.sibling;var Tl=h(d,z,B.value,r);if(Tl===null){z===null&&(z=j);break}l&&z&&Tl.alternate===null&&t(d,z),v=n(Tl,v,M),H===null?b=Tl:H.sibling=Tl,H=Tl,z=j}if(B.done)return u(d,z),C&&eu(d,M),b;if(z===null){for(;!B.done;M++,B=o.next())B=S(d,B.value,r),B!==null&&(v=n(B,v,M),H===null?b=B:H.sibling=B,H=B);return C&&eu(d,M),b}for(z=a(z);!B.done;M++,B=o.next())B=y(z,d,M,B.value,r),B!==null&&(l&&B.alternate!==null&&z.delete(B.key===null?M:B.key),v=n(B,v,M),H===null?b=B:H.sibling=B,H=B);return l&&z.forEach(function(Ou){return t(d,Ou)}),C&&eu(d,M),b}function Z(d,v,o,r){if(typeof o=="object"&&o!==null&&o.type===Yu&&o.key===null&&(o=o.props.children),typeof o=="object"&&o!==null){switch(o.$$typeof){case Ue:l:{for(var b=o.key;v!==null;){if(v.key===b){if(b=o.type,b===Yu){if(v.tag===7){u(d,v.sibling),r=e(v,o.props.children),r.return=d,d=r;break l}}else if(v.elementType===b||typeof b=="object"&&b!==null&&b.$$typeof===Bt&&C0(b)===v.type){u(d,v.sibling),r=e(v,o.props),Aa(r,o),r.return=d,d=r;break l}u(d,v);break}else t(d,v);v=v.sibling}o.type===Yu?(r=du(o.props.children,d.mode,r,o.key),r.return=d,d=r):(r=ln(o.type,o.key,o.props,null,d.mode,r),Aa(r,o),r.return=d,d=r)}return c(d);case Ua:l:{for(b=o.key;v!==null;){if(v.key===b)if(v.tag===4&&v.stateNode.containerInfo===o.containerInfo&&v.stateNode.implementation===o.implementation){u(d,v.sibling),r=e(v,o.children||[]),r.return=d,d=r;break l}else{u(d,v);break}else t(d,v);v=v.sibling}r=Bc(o,d.mode,r),r.return=d,d=r}return c(d);case Bt:return b=o._init,o=b(o._payload),Z(d,v,o,r)}if(Ra(o))return E(d,v,o,r);if(Ea(o)){if(b=Ea(o),typeof b!="function")throw Error(g(150));return o=b.call(o),O(d,v,o,r)}if(typeof o.then=="function")return Z(d,v,Ce(o),r);if(o.$$typeof===mt)return Z(d,v,Ge(d,o),r);Xe(d,o)}return typeof o=="string"&&o!==""||typeof o=="number"||typeof o=="bigint"?(o=""+o,v!==null&&v.tag===6?(u(d,v.sibling),r=e(v,o),r.return=d,d=r):(u(d,v),r=Nc(o,d.mode,r),r.return=d,d=r),c(d)):u(d,v)}return function(d,v,o,r){try{le=0;var b=Z(d,v,o,r);return ku=null,b}catch(z){if(z===Ca)throw z;var H=jl(29,z,null,d.mode);return H.lanes=r,H.return=d,H}finally{}}}var mu=gs(!0),Ss=gs(!1),aa=ct(null),yn=ct(0);function X0(l,t){l=Mt,w(yn,l),w(aa,t),Mt=l|t.baseLanes}function af(){w(yn,Mt),w(aa,aa.current)}function kf(){Mt=yn.current,sl(aa),sl(yn)}var Ll=ct(null),et=null;function Yt(l){var t=l.alternate;w(el,el.current&1),w(Ll,l),et===null&&(t===null||aa.current!==null||t.memoizedState!==null)&&(et=l)}function bs(l){if(l.tag===22){if(w(el,el.current),w(Ll,l),et===null){var t=l.alternate;t!==null&&t.memoizedState!==null&&(et=l)}}else Ct(l)}function Ct(){w(el,el.current),w(Ll,Ll.current)}function St(l){sl(Ll),et===l&&(et=null),sl(el)}var el=ct(0);function mn(l){for(var t=l;t!==null;){if(t.tag===13){var u=t.memoizedState;if(u!==null&&(u=u.dehydrated,u===null||u.data==="$?"||u.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var n2=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(u,a){l.push(a)}};this.abort=function(){t.aborted=!0,l.forEach(function(u){return u()})}},c2=nl.unstable_scheduleCallback,f2=nl.unstable_NormalPriority,al={$$typeof:mt,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function $f(){return{controller:new n2,data:new Map,refCount:0}}function ye(l){l.refCount--,l.refCount===0&&c2(f2,function(){l.controller.abort()})}var Ga=null,ef=0,ea=0,$u=null;function i2(l,t){if(Ga===null){var u=Ga=[];ef=0,ea=bi(),$u={status:"pending",value:void 0,then:function(a){u.push(a)}}}return ef++,t.then(G0,G0),t}function G0(){if(--ef===0&&Ga!==null){$u!==null&&($u.status="fulfilled");var l=Ga;Ga=null,ea=0,$u=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function s2(l,t){var u=[],a={status:"pending",value:null,reason:null,then:function(e){u.push(e)}};return l.then(function(){a.status="fulfilled",a.value=t;for(var e=0;e<u.length;e++)(0,u[e])(t)},function(e){for(a.status="rejected",a.reason=e,e=0;e<u.length;e++)(0,u[e])(void 0)}),a}var Q0=U.S;U.S=function(l,t){typeof t=="object"&&t!==null&&typeof t.then=="function"&&i2(l,t),Q0!==null&&Q0(l,t)};var vu=ct(null);function Ff(){var l=vu.current;return l!==null?l:L.pooledCache}function $e(l,t){t===null?w(vu,vu.current):w(vu,t.pool)}function Es(){var l=Ff();return l===null?null:{parent:al._currentValue,pool:l}}var $t=0,p=null,G=null,tl=null,rn=!1,Fu=!1,ru=!1,gn=0,te=0,Pu=null,v2=0;function I(){throw Error(g(321))}function Pf(l,t){if(t===null)return!1;for(var u=0;u<t.length&&u<l.length;u++)if(!Nl(l[u],t[u]))return!1;return!0}function If(l,t,u,a,e,n){return $t=n,p=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,U.H=l===null||l.memoizedState===null?zu:lu,ru=!1,n=u(a,e),ru=!1,Fu&&(n=zs(t,u,a,e)),Ts(l),n}function Ts(l){U.H=nt;var t=G!==null&&G.next!==null;if($t=0,tl=G=p=null,rn=!1,te=0,Pu=null,t)throw Error(g(300));l===null||il||(l=l.dependencies,l!==null&&En(l)&&(il=!0))}function zs(l,t,u,a){p=l;var e=0;do{if(Fu&&(Pu=null),te=0,Fu=!1,25<=e)throw Error(g(301));if(e+=1,tl=G=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}U.H=Au,n=t(u,a)}while(Fu);return n}function d2(){var l=U.H,t=l.useState()[0];return t=typeof t.then=="function"?me(t):t,l=l.useState()[0],(G!==null?G.memoizedState:null)!==l&&(p.flags|=1024),t}function li(){var l=gn!==0;return gn=0,l}function ti(l,t,u){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~u}function ui(l){if(rn){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}rn=!1}$t=0,tl=G=p=null,Fu=!1,te=gn=0,Pu=null}function zl(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return tl===null?p.memoizedState=tl=l:tl=tl.next=l,tl}function ul(){if(G===null){var l=p.alternate;l=l!==null?l.memoizedState:null}else l=G.next;var t=tl===null?p.memoizedState:tl.next;if(t!==null)tl=t,G=l;else{if(l===null)throw p.alternate===null?Error(g(467)):Error(g(310));G=l,l={memoizedState:G.memoizedState,baseState:G.baseState,baseQueue:G.baseQueue,queue:G.queue,next:null},tl===null?p.memoizedState=tl=l:tl=tl.next=l}return tl}var Qn;Qn=function(){return{lastEffect:null,events:null,stores:null,memoCache:null}};function me(l){var t=te;return te+=1,Pu===null&&(Pu=[]),l=rs(Pu,l,t),t=p,(tl===null?t.memoizedState:tl.next)===null&&(t=t.alternate,U.H=t===null||t.memoizedState===null?zu:lu),l}function xn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return me(l);if(l.$$typeof===mt)return rl(l)}throw Error(g(438,String(l)))}function ai(l){var t=null,u=p.updateQueue;if(u!==null&&(t=u.memoCache),t==null){var a=p.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(t={data:a.data.map(function(e){return e.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),u===null&&(u=Qn(),p.updateQueue=u),u.memoCache=t,u=t.data[t.index],u===void 0)for(u=t.data[t.index]=Array(l),a=0;a<l;a++)u[a]=Jd;return t.index++,u}function zt(l,t){return typeof t=="function"?t(l):t}function Fe(l){var t=ul();return ei(t,G,l)}function ei(l,t,u){var a=l.queue;if(a===null)throw Error(g(311));a.lastRenderedReducer=u;var e=l.baseQueue,n=a.pending;if(n!==null){if(e!==null){var c=e.next;e.next=n.next,n.next=c}t.baseQueue=e=n,a.pending=null}if(n=l.baseState,e===null)l.memoizedState=n;else{t=e.next;var f=c=null,i=null,s=t,m=!1;do{var S=s.lane&-536870913;if(S!==s.lane?(Y&S)===S:($t&S)===S){var h=s.revertLane;if(h===0)i!==null&&(i=i.next={lane:0,revertLane:0,action:s.action,hasEagerState:s.hasEagerState,eagerState:s.eagerState,next:null}),S===ea&&(m=!0);else if(($t&h)===h){s=s.next,h===ea&&(m=!0);continue}else S={lane:0,revertLane:s.revertLane,action:s.action,hasEagerState:s.hasEagerState,eagerState:s.eagerState,next:null},i===null?(f=i=S,c=n):i=i.next=S,p.lanes|=h,Pt|=h;S=s.action,ru&&u(n,S),n=s.hasEagerState?s.eagerState:u(n,S)}else h={lane:S,revertLane:s.revertLane,action:s.action,hasEagerState:s.hasEagerState,eagerState:s.eagerState,next:null},i===null?(f=i=h,c=n):i=i.next=h,p.lanes|=S,Pt|=S;s=s.next}while(s!==null&&s!==t);if(i===null?c=n:i.next=f,!Nl(n,l.memoizedState)&&(il=!0,m&&(u=$u,u!==null)))throw u;l.memoizedState=n,l.baseState=c,l.baseQueue=i,a.lastRenderedState=n}return e===null&&(a.lanes=0),[l.memoizedState,a.dispatch]}function Tc(l){var t=ul(),u=t.queue;if(u===null)throw Error(g(311));u.lastRenderedReducer=l;var a=u.dispatch,e=u.pending,n=t.memoizedState;if(e!==null){u.pending=null;var c=e=e.next;do n=l(n,c.action),c=c.next;while(c!==e);Nl(n,t.memoizedState)||(il=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),u.lastRenderedState=n}return[n,a]}function As(l,t,u){var a=p,e=ul(),n=C;if(n){if(u===void 0)throw Error(g(407));u=u()}else u=t();var c=!Nl((G||e).memoizedState,u);if(c&&(e.memoizedState=u,il=!0),e=e.queue,ni(Ds.bind(null,a,e,l),[l]),e.getSnapshot!==t||c||tl!==null&&tl.memoizedState.tag&1){if(a.flags|=2048,na(9,Os.bind(null,a,e,u,t),{destroy:void 0},null),L===null)throw Error(g(349));n||($t&60)!==0||Ms(a,t,u)}return u}function Ms(l,t,u){l.flags|=16384,l={getSnapshot:t,value:u},t=p.updateQueue,t===null?(t=Qn(),p.updateQueue=t,t.stores=[l]):(u=t.stores,u===null?t.stores=[l]:u.push(l))}function Os(l,t,u,a){t.value=u,t.getSnapshot=a,_s(t)&&Us(l)}function Ds(l,t,u){return u(function(){_s(t)&&Us(l)})}function _s(l){var t=l.getSnapshot;l=l.value;try{var u=t();return!Nl(l,u)}catch{return!0}}function Us(l){var t=kt(l,2);t!==null&&El(t,l,2)}function nf(l){var t=zl();if(typeof l=="function"){var u=l;if(l=u(),ru){Qt(!0);try{u()}finally{Qt(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:zt,lastRenderedState:l},t}function Hs(l,t,u,a){return l.baseState=u,ei(l,G,typeof a=="function"?a:zt)}function o2(l,t,u,a,e){if(jn(l))throw Error(g(485));if(l=t.action,l!==null){var n={payload:e,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(c){n.listeners.push(c)}};U.T!==null?u(!0):n.isTransition=!1,a(n),u=t.pending,u===null?(n.next=t.pending=n,Rs(t,n)):(n.next=u.next,t.pending=u.next=n)}}function Rs(l,t){var u=t.action,a=t.payload,e=l.state;if(t.isTransition){var n=U.T,c={};U.T=c;try{var f=u(e,a),i=U.S;i!==null&&i(c,f),x0(l,t,f)}catch(s){cf(l,t,s)}finally{U.T=n}}else try{n=u(e,a),x0(l,t,n)}catch(s){cf(l,t,s)}}function x0(l,t,u){u!==null&&typeof u=="object"&&typeof u.then=="function"?u.then(function(a){Z0(l,t,a)},function(a){return cf(l,t,a)}):Z0(l,t,u)}function Z0(l,t,u){t.status="fulfilled",t.value=u,ps(t),l.state=u,t=l.pending,t!==null&&(u=t.next,u===t?l.pending=null:(u=u.next,t.next=u,Rs(l,u)))}function cf(l,t,u){var a=l.pending;if(l.pending=null,a!==null){a=a.next;do t.status="rejected",t.reason=u,ps(t),t=t.next;while(t!==a)}l.action=null}function ps(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function Ns(l,t){return t}function Bs(l,t){if(C){var u=L.formState;if(u!==null){l:{var a=p;if(C){if(ol){t:{for(var e=ol,n=lt;e.nodeType!==8;){if(!n){e=null;break t}if(e=$l(e.nextSibling),e===null){e=null;break t}}n=e.data,e=n==="F!"||n==="F"?e:null}if(e){ol=$l(e.nextSibling),a=e.data==="F!";break l}}yu(a)}a=!1}a&&(t=u[0])}}return u=zl(),u.memoizedState=u.baseState=t,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ns,lastRenderedState:t},u.queue=a,u=$s.bind(null,p,a),a.dispatch=u,a=nf(!1),n=si.bind(null,p,!1,a.queue),a=zl(),e={state:t,dispatch:null,action:l,pending:null},a.queue=e,u=o2.bind(null,p,e,n,u),e.dispatch=u,a.memoizedState=l,[t,u,!1]}function qs(l){var t=ul();return Ys(t,G,l)}function Ys(l,t,u){t=ei(l,t,Ns)[0],l=Fe(zt)[0],t=typeof t=="object"&&t!==null&&typeof t.then=="function"?me(t):t;var a=ul(),e=a.queue,n=e.dispatch;return u!==a.memoizedState&&(p.flags|=2048,na(9,h2.bind(null,e,u),{destroy:void 0},null)),[t,n,l]}function h2(l,t){l.action=t}function Cs(l){var t=ul(),u=G;if(u!==null)return Ys(t,u,l);ul(),t=t.memoizedState,u=ul();var a=u.queue.dispatch;return u.memoizedState=l,[t,a,!1]}function na(l,t,u,a){return l={tag:l,create:t,inst:u,deps:a,next:null},t=p.updateQueue,t===null&&(t=Qn(),p.updateQueue=t),u=t.lastEffect,u===null?t.lastEffect=l.next=l:(a=u.next,u.next=l,l.next=a,t.lastEffect=l),l}function Xs(){return ul().memoizedState}function Pe(l,t,u,a){var e=zl();p.flags|=l,e.memoizedState=na(1|t,u,{destroy:void 0},a===void 0?null:a)}function Zn(l,t,u,a){var e=ul();a=a===void 0?null:a;var n=e.memoizedState.inst;G!==null&&a!==null&&Pf(a,G.memoizedState.deps)?e.memoizedState=na(t,u,n,a):(p.flags|=l,e.memoizedState=na(1|t,u,n,a))}function j0(l,t){Pe(8390656,8,l,t)}function ni(l,t){Zn(2048,8,l,t)}function Gs(l,t){return Zn(4,2,l,t)}function Qs(l,t){return Zn(4,4,l,t)}function xs(l,t){if(typeof t=="function"){l=l();var u=t(l);return function(){typeof u=="function"?u():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function Zs(l,t,u){u=u!=null?u.concat([l]):null,Zn(4,4,xs.bind(null,t,l),u)}function ci(){}function js(l,t){var u=ul();t=t===void 0?null:t;var a=u.memoizedState;return t!==null&&Pf(t,a[1])?a[0]:(u.memoizedState=[l,t],l)}function Vs(l,t){var u=ul();t=t===void 0?null:t;var a=u.memoizedState;if(t!==null&&Pf(t,a[1]))return a[0];if(a=l(),ru){Qt(!0);try{l()}finally{Qt(!1)}}return u.memoizedState=[a,t],a}function fi(l,t,u){return u===void 0||($t&1073741824)!==0?l.memoizedState=t:(l.memoizedState=u,l=pv(),p.lanes|=l,Pt|=l,u)}function Ls(l,t,u,a){return Nl(u,t)?u:aa.current!==null?(l=fi(l,u,a),Nl(l,t)||(il=!0),l):($t&42)===0?(il=!0,l.memoizedState=u):(l=pv(),p.lanes|=l,Pt|=l,t)}function Ks(l,t,u,a,e){var n=K.p;K.p=n!==0&&8>n?n:8;var c=U.T,f={};U.T=f,si(l,!1,t,u);try{var i=e(),s=U.S;if(s!==null&&s(f,i),i!==null&&typeof i=="object"&&typeof i.then=="function"){var m=s2(i,a);Qa(l,t,m,pl(l))}else Qa(l,t,a,pl(l))}catch(S){Qa(l,t,{then:function(){},status:"rejected",reason:S},pl())}finally{K.p=n,U.T=c}}function y2(){}function ff(l,t,u,a){if(l.tag!==5)throw Error(g(476));var e=Js(l).queue;Ks(l,e,t,iu,u===null?y2:function(){return ws(l),u(a)})}function Js(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:iu,baseState:iu,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:zt,lastRenderedState:iu},next:null};var u={};return t.next={memoizedState:u,baseState:u,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:zt,lastRenderedState:u},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function ws(l){var t=Js(l).next.queue;Qa(l,t,{},pl())}function ii(){return rl(ne)}function Ws(){return ul().memoizedState}function ks(){return ul().memoizedState}function m2(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var u=pl();l=jt(u);var a=Vt(t,l,u);a!==null&&(El(a,t,u),Za(a,t,u)),t={cache:$f()},l.payload=t;return}t=t.return}}function r2(l,t,u){var a=pl();u={lane:a,revertLane:0,action:u,hasEagerState:!1,eagerState:null,next:null},jn(l)?Fs(t,u):(u=Jf(l,t,u,a),u!==null&&(El(u,l,a),Ps(u,t,a)))}function $s(l,t,u){var a=pl();Qa(l,t,u,a)}function Qa(l,t,u,a){var e={lane:a,revertLane:0,action:u,hasEagerState:!1,eagerState:null,next:null};if(jn(l))Fs(t,e);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var c=t.lastRenderedState,f=n(c,u);if(e.hasEagerState=!0,e.eagerState=f,Nl(f,c))return Gn(l,t,e,0),L===null&&Xn(),!1}catch{}finally{}if(u=Jf(l,t,e,a),u!==null)return El(u,l,a),Ps(u,t,a),!0}return!1}function si(l,t,u,a){if(a={lane:2,revertLane:bi(),action:a,hasEagerState:!1,eagerState:null,next:null},jn(l)){if(t)throw Error(g(479))}else t=Jf(l,u,a,2),t!==null&&El(t,l,2)}function jn(l){var t=l.alternate;return l===p||t!==null&&t===p}function Fs(l,t){Fu=rn=!0;var u=l.pending;u===null?t.next=t:(t.next=u.next,u.next=t),l.pending=t}function Ps(l,t,u){if((u&4194176)!==0){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,x1(l,u)}}var nt={readContext:rl,use:xn,useCallback:I,useContext:I,useEffect:I,useImperativeHandle:I,useLayoutEffect:I,useInsertionEffect:I,useMemo:I,useReducer:I,useRef:I,useState:I,useDebugValue:I,useDeferredValue:I,useTransition:I,useSyncExternalStore:I,useId:I};nt.useCacheRefresh=I;nt.useMemoCache=I;nt.useHostTransitionStatus=I;nt.useFormState=I;nt.useActionState=I;nt.useOptimistic=I;var zu={readContext:rl,use:xn,useCallback:function(l,t){return zl().memoizedState=[l,t===void 0?null:t],l},useContext:rl,useEffect:j0,useImperativeHandle:function(l,t,u){u=u!=null?u.concat([l]):null,Pe(4194308,4,xs.bind(null,t,l),u)},useLayoutEffect:function(l,t){return Pe(4194308,4,l,t)},useInsertionEffect:function(l,t){Pe(4,2,l,t)},useMemo:function(l,t){var u=zl();t=t===void 0?null:t;var a=l();if(ru){Qt(!0);try{l()}finally{Qt(!1)}}return u.memoizedState=[a,t],a},useReducer:function(l,t,u){var a=zl();if(u!==void 0){var e=u(t);if(ru){Qt(!0);try{u(t)}finally{Qt(!1)}}}else e=t;return a.memoizedState=a.baseState=e,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:e},a.queue=l,l=l.dispatch=r2.bind(null,p,l),[a.memoizedState,l]},useRef:function(l){var t=zl();return l={current:l},t.memoizedState=l},useState:function(l){l=nf(l);var t=l.queue,u=$s.bind(null,p,t);return t.dispatch=u,[l.memoizedState,u]},useDebugValue:ci,useDeferredValue:function(l,t){var u=zl();return fi(u,l,t)},useTransition:function(){var l=nf(!1);return l=Ks.bind(null,p,l.queue,!0,!1),zl().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,u){var a=p,e=zl();if(C){if(u===void 0)throw Error(g(407));u=u()}else{if(u=t(),L===null)throw Error(g(349));(Y&60)!==0||Ms(a,t,u)}e.memoizedState=u;var n={value:u,getSnapshot:t};return e.queue=n,j0(Ds.bind(null,a,n,l),[l]),a.flags|=2048,na(9,Os.bind(null,a,n,u,t),{destroy:void 0},null),u},useId:function(){var l=zl(),t=L.identifierPrefix;if(C){var u=gt,a=rt;u=(a&~(1<<32-Rl(a)-1)).toString(32)+u,t=":"+t+"R"+u,u=gn++,0<u&&(t+="H"+u.toString(32)),t+=":"}else u=v2++,t=":"+t+"r"+u.toString(32)+":";return l.memoizedState=t},useCacheRefresh:function(){return zl().memoizedState=m2.bind(null,p)}};zu.useMemoCache=ai;zu.useHostTransitionStatus=ii;zu.useFormState=Bs;zu.useActionState=Bs;zu.useOptimistic=function(l){var t=zl();t.memoizedState=t.baseState=l;var u={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=u,t=si.bind(null,p,!0,u),u.dispatch=t,[l,t]};var lu={readContext:rl,use:xn,useCallback:js,useContext:rl,useEffect:ni,useImperativeHandle:Zs,useInsertionEffect:Gs,useLayoutEffect:Qs,useMemo:Vs,useReducer:Fe,useRef:Xs,useState:function(){return Fe(zt)},useDebugValue:ci,useDeferredValue:function(l,t){var u=ul();return Ls(u,G.memoizedState,l,t)},useTransition:function(){var l=Fe(zt)[0],t=ul().memoizedState;return[typeof l=="boolean"?l:me(l),t]},useSyncExternalStore:As,useId:Ws};lu.useCacheRefresh=ks;lu.useMemoCache=ai;lu.useHostTransitionStatus=ii;lu.useFormState=qs;lu.useActionState=qs;lu.useOptimistic=function(l,t){var u=ul();return Hs(u,G,l,t)};var Au={readContext:rl,use:xn,useCallback:js,useContext:rl,useEffect:ni,useImperativeHandle:Zs,useInsertionEffect:Gs,useLayoutEffect:Qs,useMemo:Vs,useReducer:Tc,useRef:Xs,useState:function(){return Tc(zt)},useDebugValue:ci,useDeferredValue:function(l,t){var u=ul();return G===null?fi(u,l,t):Ls(u,G.memoizedState,l,t)},useTransition:function(){var l=Tc(zt)[0],t=ul().memoizedState;return[typeof l=="boolean"?l:me(l),t]},useSyncExternalStore:As,useId:Ws};Au.useCacheRefresh=ks;Au.useMemoCache=ai;Au.useHostTransitionStatus=ii;Au.useFormState=Cs;Au.useActionState=Cs;Au.useOptimistic=function(l,t){var u=ul();return G!==null?Hs(u,G,l,t):(u.baseState=l,[l,u.queue.dispatch])};function zc(l,t,u,a){t=l.memoizedState,u=u(a,t),u=u==null?t:J({},t,u),l.memoizedState=u,l.lanes===0&&(l.updateQueue.baseState=u)}var sf={isMounted:function(l){return(l=l._reactInternals)?sa(l)===l:!1},enqueueSetState:function(l,t,u){l=l._reactInternals;var a=pl(),e=jt(a);e.payload=t,u!=null&&(e.callback=u),t=Vt(l,e,a),t!==null&&(El(t,l,a),Za(t,l,a))},enqueueReplaceState:function(l,t,u){l=l._reactInternals;var a=pl(),e=jt(a);e.tag=1,e.payload=t,u!=null&&(e.callback=u),t=Vt(l,e,a),t!==null&&(El(t,l,a),Za(t,l,a))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var u=pl(),a=jt(u);a.tag=2,t!=null&&(a.callback=t),t=Vt(l,a,u),t!==null&&(El(t,l,u),Za(t,l,u))}};function V0(l,t,u,a,e,n,c){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(a,n,c):t.prototype&&t.prototype.isPureReactComponent?!Pa(u,a)||!Pa(e,n):!0}function L0(l,t,u,a){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(u,a),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(u,a),t.state!==l&&sf.enqueueReplaceState(t,t.state,null)}function gu(l,t){var u=t;if("ref"in t){u={};for(var a in t)a!=="ref"&&(u[a]=t[a])}if(l=l.defaultProps){u===t&&(u=J({},u));for(var e in l)u[e]===void 0&&(u[e]=l[e])}return u}var Sn=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)};function Is(l){Sn(l)}function lv(l){console.error(l)}function tv(l){Sn(l)}function bn(l,t){try{var u=l.onUncaughtError;u(t.value,{componentStack:t.stack})}catch(a){setTimeout(function(){throw a})}}function K0(l,t,u){try{var a=l.onCaughtError;a(u.value,{componentStack:u.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(e){setTimeout(function(){throw e})}}function vf(l,t,u){return u=jt(u),u.tag=3,u.payload={element:null},u.callback=function(){bn(l,t)},u}function uv(l){return l=jt(l),l.tag=3,l}function av(l,t,u,a){var e=u.type.getDerivedStateFromError;if(typeof e=="function"){var n=a.value;l.payload=function(){return e(n)},l.callback=function(){K0(t,u,a)}}var c=u.stateNode;c!==null&&typeof c.componentDidCatch=="function"&&(l.callback=function(){K0(t,u,a),typeof e!="function"&&(Kt===null?Kt=new Set([this]):Kt.add(this));var f=a.stack;this.componentDidCatch(a.value,{componentStack:f!==null?f:""})})}function g2(l,t,u,a,e){if(u.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(t=u.alternate,t!==null&&re(t,u,e,!0),u=Ll.current,u!==null){switch(u.tag){case 13:return et===null?Of():u.alternate===null&&P===0&&(P=3),u.flags&=-257,u.flags|=65536,u.lanes=e,a===uf?u.flags|=16384:(t=u.updateQueue,t===null?u.updateQueue=new Set([a]):t.add(a),Yc(l,a,e)),!1;case 22:return u.flags|=65536,a===uf?u.flags|=16384:(t=u.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([a])},u.updateQueue=t):(u=t.retryQueue,u===null?t.retryQueue=new Set([a]):u.add(a)),Yc(l,a,e)),!1}throw Error(g(435,u.tag))}return Yc(l,a,e),Of(),!1}if(C)return t=Ll.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=e,a!==tf&&(l=Error(g(422),{cause:a}),Ia(Zl(l,u)))):(a!==tf&&(t=Error(g(423),{cause:a}),Ia(Zl(t,u))),l=l.current.alternate,l.flags|=65536,e&=-e,l.lanes|=e,a=Zl(a,u),e=vf(l.stateNode,a,e),Uc(l,e),P!==4&&(P=2)),!1;var n=Error(g(520),{cause:a});if(n=Zl(n,u),Ka===null?Ka=[n]:Ka.push(n),P!==4&&(P=2),t===null)return!0;a=Zl(a,u),u=t;do{switch(u.tag){case 3:return u.flags|=65536,l=e&-e,u.lanes|=l,l=vf(u.stateNode,a,l),Uc(u,l),!1;case 1:if(t=u.type,n=u.stateNode,(u.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(Kt===null||!Kt.has(n))))return u.flags|=65536,e&=-e,u.lanes|=e,e=uv(e),av(e,l,u,a),Uc(u,e),!1}u=u.return}while(u!==null);return!1}var ev=Error(g(461)),il=!1;function dl(l,t,u,a){t.child=l===null?Ss(t,null,u,a):mu(t,l.child,u,a)}function J0(l,t,u,a,e){u=u.render;var n=t.ref;if("ref"in a){var c={};for(var f in a)f!=="ref"&&(c[f]=a[f])}else c=a;return Su(t),a=If(l,t,u,c,n,e),f=li(),l!==null&&!il?(ti(l,t,e),At(l,t,e)):(C&&f&&wf(t),t.flags|=1,dl(l,t,a,e),t.child)}function w0(l,t,u,a,e){if(l===null){var n=u.type;return typeof n=="function"&&!yi(n)&&n.defaultProps===void 0&&u.compare===null?(t.tag=15,t.type=n,nv(l,t,n,a,e)):(l=ln(u.type,null,a,t,t.mode,e),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!vi(l,e)){var c=n.memoizedProps;if(u=u.compare,u=u!==null?u:Pa,u(c,a)&&l.ref===t.ref)return At(l,t,e)}return t.flags|=1,l=Lt(n,a),l.ref=t.ref,l.return=t,t.child=l}function nv(l,t,u,a,e){if(l!==null){var n=l.memoizedProps;if(Pa(n,a)&&l.ref===t.ref)if(il=!1,t.pendingProps=a=n,vi(l,e))(l.flags&131072)!==0&&(il=!0);else return t.lanes=l.lanes,At(l,t,e)}return df(l,t,u,a,e)}function cv(l,t,u){var a=t.pendingProps,e=a.children,n=(t.stateNode._pendingVisibility&2)!==0,c=l!==null?l.memoizedState:null;if(xa(l,t),a.mode==="hidden"||n){if((t.flags&128)!==0){if(a=c!==null?c.baseLanes|u:u,l!==null){for(e=t.child=l.child,n=0;e!==null;)n=n|e.lanes|e.childLanes,e=e.sibling;t.childLanes=n&~a}else t.childLanes=0,t.child=null;return W0(l,t,a,u)}if((u&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&$e(t,c!==null?c.cachePool:null),c!==null?X0(t,c):af(),bs(t);else return t.lanes=t.childLanes=536870912,W0(l,t,c!==null?c.baseLanes|u:u,u)}else c!==null?($e(t,c.cachePool),X0(t,c),Ct(t),t.memoizedState=null):(l!==null&&$e(t,null),af(),Ct(t));return dl(l,t,e,u),t.child}function W0(l,t,u,a){var e=Ff();return e=e===null?null:{parent:al._currentValue,pool:e},t.memoizedState={baseLanes:u,cachePool:e},l!==null&&$e(t,null),af(),bs(t),l!==null&&re(l,t,a,!0),null}function xa(l,t){var u=t.ref;if(u===null)l!==null&&l.ref!==null&&(t.flags|=2097664);else{if(typeof u!="function"&&typeof u!="object")throw Error(g(284));(l===null||l.ref!==u)&&(t.flags|=2097664)}}function df(l,t,u,a,e){return Su(t),u=If(l,t,u,a,void 0,e),a=li(),l!==null&&!il?(ti(l,t,e),At(l,t,e)):(C&&a&&wf(t),t.flags|=1,dl(l,t,u,e),t.child)}function k0(l,t,u,a,e,n){return Su(t),t.updateQueue=null,u=zs(t,a,u,e),Ts(l),a=li(),l!==null&&!il?(ti(l,t,n),At(l,t,n)):(C&&a&&wf(t),t.flags|=1,dl(l,t,u,n),t.child)}function $0(l,t,u,a,e){if(Su(t),t.stateNode===null){var n=ju,c=u.contextType;typeof c=="object"&&c!==null&&(n=rl(c)),n=new u(a,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=sf,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=a,n.state=t.memoizedState,n.refs={},di(t),c=u.contextType,n.context=typeof c=="object"&&c!==null?rl(c):ju,n.state=t.memoizedState,c=u.getDerivedStateFromProps,typeof c=="function"&&(zc(t,u,c,a),n.state=t.memoizedState),typeof u.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(c=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),c!==n.state&&sf.enqueueReplaceState(n,n.state,null),Va(t,a,n,e),ja(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!0}else if(l===null){n=t.stateNode;var f=t.memoizedProps,i=gu(u,f);n.props=i;var s=n.context,m=u.contextType;c=ju,typeof m=="object"&&m!==null&&(c=rl(m));var S=u.getDerivedStateFromProps;m=typeof S=="function"||typeof n.getSnapshotBeforeUpdate=="function",f=t.pendingProps!==f,m||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(f||s!==c)&&L0(t,n,a,c),qt=!1;var h=t.memoizedState;n.state=h,Va(t,a,n,e),ja(),s=t.memoizedState,f||h!==s||qt?(typeof S=="function"&&(zc(t,u,S,a),s=t.memoizedState),(i=qt||V0(t,u,i,a,h,s,c))?(m||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=a,t.memoizedState=s),n.props=a,n.state=s,n.context=c,a=i):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!1)}else{n=t.stateNode,gf(l,t),c=t.memoizedProps,m=gu(u,c),n.props=m,S=t.pendingProps,h=n.context,s=u.contextType,i=ju,typeof s=="object"&&s!==null&&(i=rl(s)),f=u.getDerivedStateFromProps,(s=typeof f=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c!==S||h!==i)&&L0(t,n,a,i),qt=!1,h=t.memoizedState,n.state=h,Va(t,a,n,e),ja();var y=t.memoizedState;c!==S||h!==y||qt||l!==null&&l.dependencies!==null&&En(l.dependencies)?(typeof f=="function"&&(zc(t,u,f,a),y=t.memoizedState),(m=qt||V0(t,u,m,a,h,y,i)||l!==null&&l.dependencies!==null&&En(l.dependencies))?(s||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,y,i),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,y,i)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||c===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),t.memoizedProps=a,t.memoizedState=y),n.props=a,n.state=y,n.context=i,a=m):(typeof n.componentDidUpdate!="function"||c===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),a=!1)}return n=a,xa(l,t),a=(t.flags&128)!==0,n||a?(n=t.stateNode,u=a&&typeof u.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&a?(t.child=mu(t,l.child,null,e),t.child=mu(t,null,u,e)):dl(l,t,u,e),t.memoizedState=n.state,l=t.child):l=At(l,t,e),l}function F0(l,t,u,a){return he(),t.flags|=256,dl(l,t,u,a),t.child}var Ac={dehydrated:null,treeContext:null,retryLane:0};function Mc(l){return{baseLanes:l,cachePool:Es()}}function Oc(l,t,u){return l=l!==null?l.childLanes&~u:0,t&&(l|=Vl),l}function fv(l,t,u){var a=t.pendingProps,e=!1,n=(t.flags&128)!==0,c;if((c=n)||(c=l!==null&&l.memoizedState===null?!1:(el.current&2)!==0),c&&(e=!0,t.flags&=-129),c=(t.flags&32)!==0,t.flags&=-33,l===null){if(C){if(e?Yt(t):Ct(t),C){var f=ol,i;if(i=f){l:{for(i=f,f=lt;i.nodeType!==8;){if(!f){f=null;break l}if(i=$l(i.nextSibling),i===null){f=null;break l}}f=i}f!==null?(t.memoizedState={dehydrated:f,treeContext:su!==null?{id:rt,overflow:gt}:null,retryLane:536870912},i=jl(18,null,null,0),i.stateNode=f,i.return=t,t.child=i,bl=t,ol=null,i=!0):i=!1}i||yu(t)}if(f=t.memoizedState,f!==null&&(f=f.dehydrated,f!==null))return f.data==="$!"?t.lanes=16:t.lanes=536870912,null;St(t)}return f=a.children,a=a.fallback,e?(Ct(t),e=t.mode,f=hf({mode:"hidden",children:f},e),a=du(a,e,u,null),f.return=t,a.return=t,f.sibling=a,t.child=f,e=t.child,e.memoizedState=Mc(u),e.childLanes=Oc(l,c,u),t.memoizedState=Ac,a):(Yt(t),of(t,f))}if(i=l.memoizedState,i!==null&&(f=i.dehydrated,f!==null)){if(n)t.flags&256?(Yt(t),t.flags&=-257,t=Dc(l,t,u)):t.memoizedState!==null?(Ct(t),t.child=l.child,t.flags|=128,t=null):(Ct(t),e=a.fallback,f=t.mode,a=hf({mode:"visible",children:a.children},f),e=du(e,f,u,null),e.flags|=2,a.return=t,e.return=t,a.sibling=e,t.child=a,mu(t,l.child,null,u),a=t.child,a.memoizedState=Mc(u),a.childLanes=Oc(l,c,u),t.memoizedState=Ac,t=e);else if(Yt(t),f.data==="$!"){if(c=f.nextSibling&&f.nextSibling.dataset,c)var s=c.dgst;c=s,a=Error(g(419)),a.stack="",a.digest=c,Ia({value:a,source:null,stack:null}),t=Dc(l,t,u)}else if(il||re(l,t,u,!1),c=(u&l.childLanes)!==0,il||c){if(c=L,c!==null){if(a=u&-u,(a&42)!==0)a=1;else switch(a){case 2:a=1;break;case 8:a=4;break;case 32:a=16;break;case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:a=64;break;case 268435456:a=134217728;break;default:a=0}if(a=(a&(c.suspendedLanes|u))!==0?0:a,a!==0&&a!==i.retryLane)throw i.retryLane=a,kt(l,a),El(c,l,a),ev}f.data==="$?"||Of(),t=Dc(l,t,u)}else f.data==="$?"?(t.flags|=128,t.child=l.child,t=N2.bind(null,l),f._reactRetry=t,t=null):(l=i.treeContext,ol=$l(f.nextSibling),bl=t,C=!0,kl=null,lt=!1,l!==null&&(Gl[Ql++]=rt,Gl[Ql++]=gt,Gl[Ql++]=su,rt=l.id,gt=l.overflow,su=t),t=of(t,a.children),t.flags|=4096);return t}return e?(Ct(t),e=a.fallback,f=t.mode,i=l.child,s=i.sibling,a=Lt(i,{mode:"hidden",children:a.children}),a.subtreeFlags=i.subtreeFlags&31457280,s!==null?e=Lt(s,e):(e=du(e,f,u,null),e.flags|=2),e.return=t,a.return=t,a.sibling=e,t.child=a,a=e,e=t.child,f=l.child.memoizedState,f===null?f=Mc(u):(i=f.cachePool,i!==null?(s=al._currentValue,i=i.parent!==s?{parent:s,pool:s}:i):i=Es(),f={baseLanes:f.baseLanes|u,cachePool:i}),e.memoizedState=f,e.childLanes=Oc(l,c,u),t.memoizedState=Ac,a):(Yt(t),u=l.child,l=u.sibling,u=Lt(u,{mode:"visible",children:a.children}),u.return=t,u.sibling=null,l!==null&&(c=t.deletions,c===null?(t.deletions=[l],t.flags|=16):c.push(l)),t.child=u,t.memoizedState=null,u)}function of(l,t){return t=hf({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function hf(l,t){return Hv(l,t,0,null)}function Dc(l,t,u){return mu(t,l.child,null,u),l=of(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function P0(l,t,u){l.lanes|=t;var a=l.alternate;a!==null&&(a.lanes|=t),mf(l.return,t,u)}function _c(l,t,u,a,e){var n=l.memoizedState;n===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:a,tail:u,tailMode:e}:(n.isBackwards=t,n.rendering=null,n.renderingStartTime=0,n.last=a,n.tail=u,n.tailMode=e)}function iv(l,t,u){var a=t.pendingProps,e=a.revealOrder,n=a.tail;if(dl(l,t,a.children,u),a=el.current,(a&2)!==0)a=a&1|2,t.flags|=128;else{if(l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&P0(l,u,t);else if(l.tag===19)P0(l,u,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}a&=1}switch(w(el,a),e){case"forwards":for(u=t.child,e=null;u!==null;)l=u.alternate,l!==null&&mn(l)===null&&(e=u),u=u.sibling;u=e,u===null?(e=t.child,t.child=null):(e=u.sibling,u.sibling=null),_c(t,!1,e,u,n);break;case"backwards":for(u=null,e=t.child,t.child=null;e!==null;){if(l=e.alternate,l!==null&&mn(l)===null){t.child=e;break}l=e.sibling,e.sibling=u,u=e,e=l}_c(t,!0,u,null,n);break;case"together":_c(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function At(l,t,u){if(l!==null&&(t.dependencies=l.dependencies),Pt|=t.lanes,(u&t.childLanes)===0)if(l!==null){if(re(l,t,u,!1),(u&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(g(153));if(t.child!==null){for(l=t.child,u=Lt(l,l.pendingProps),t.child=u,u.return=t;l.sibling!==null;)l=l.sibling,u=u.sibling=Lt(l,l.pendingProps),u.return=t;u.sibling=null}return t.child}function vi(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&En(l)))}function S2(l,t,u){switch(t.tag){case 3:nn(t,t.stateNode.containerInfo),Xt(t,al,l.memoizedState.cache),he();break;case 27:case 5:Jc(t);break;case 4:nn(t,t.stateNode.containerInfo);break;case 10:Xt(t,t.type,t.memoizedProps.value);break;case 13:var a=t.memoizedState;if(a!==null)return a.dehydrated!==null?(Yt(t),t.flags|=128,null):(u&t.child.childLanes)!==0?fv(l,t,u):(Yt(t),l=At(l,t,u),l!==null?l.sibling:null);Yt(t);break;case 19:var e=(l.flags&128)!==0;if(a=(u&t.childLanes)!==0,a||(re(l,t,u,!1),a=(u&t.childLanes)!==0),e){if(a)return iv(l,t,u);t.flags|=128}if(e=t.memoizedState,e!==null&&(e.rendering=null,e.tail=null,e.lastEffect=null),w(el,el.current),a)break;return null;case 22:case 23:return t.lanes=0,cv(l,t,u);case 24:Xt(t,al,l.memoizedState.cache)}return At(l,t,u)}function sv(l,t,u){if(l!==null)if(l.memoizedProps!==t.pendingProps)il=!0;else{if(!vi(l,u)&&(t.flags&128)===0)return il=!1,S2(l,t,u);il=(l.flags&131072)!==0}else il=!1,C&&(t.flags&1048576)!==0&&ys(t,hn,t.index);switch(t.lanes=0,t.tag){case 16:l:{l=t.pendingProps;var a=t.elementType,e=a._init;if(a=e(a._payload),t.type=a,typeof a=="function")yi(a)?(l=gu(a,l),t.tag=1,t=$0(null,t,a,l,u)):(t.tag=0,t=df(null,t,a,l,u));else{if(a!=null){if(e=a.$$typeof,e===Yf){t.tag=11,t=J0(null,t,a,l,u);break l}else if(e===Cf){t.tag=14,t=w0(null,t,a,l,u);break l}}throw t=Lc(a)||a,Error(g(306,t,""))}}return t;case 0:return df(l,t,t.type,t.pendingProps,u);case 1:return a=t.type,e=gu(a,t.pendingProps),$0(l,t,a,e,u);case 3:l:{if(nn(t,t.stateNode.containerInfo),l===null)throw Error(g(387));var n=t.pendingProps;e=t.memoizedState,a=e.element,gf(l,t),Va(t,n,null,u);var c=t.memoizedState;if(n=c.cache,Xt(t,al,n),n!==e.cache&&rf(t,[al],u,!0),ja(),n=c.element,e.isDehydrated)if(e={element:n,isDehydrated:!1,cache:c.cache},t.updateQueue.baseState=e,t.memoizedState=e,t.flags&256){t=F0(l,t,n,u);break l}else if(n!==a){a=Zl(Error(g(424)),t),Ia(a),t=F0(l,t,n,u);break l}else for(ol=$l(t.stateNode.containerInfo.firstChild),bl=t,C=!0,kl=null,lt=!0,u=Ss(t,null,n,u),t.child=u;u;)u.flags=u.flags&-3|4096,u=u.sibling;else{if(he(),n===a){t=At(l,t,u);break l}dl(l,t,n,u)}t=t.child}return t;case 26:return xa(l,t),l===null?(u=S1(t.type,null,t.pendingProps,null))?t.memoizedState=u:C||(u=t.type,l=t.pendingProps,a=_n(Zt.current).createElement(u),a[ml]=t,a[Al]=l,hl(a,u,l),fl(a),t.stateNode=a):t.memoizedState=S1(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return Jc(t),l===null&&C&&(a=t.stateNode=wv(t.type,t.pendingProps,Zt.current),bl=t,lt=!0,ol=$l(a.firstChild)),a=t.pendingProps.children,l!==null||C?dl(l,t,a,u):t.child=mu(t,null,a,u),xa(l,t),t.child;case 5:return l===null&&C&&((e=a=ol)&&(a=J2(a,t.type,t.pendingProps,lt),a!==null?(t.stateNode=a,bl=t,ol=$l(a.firstChild),lt=!1,e=!0):e=!1),e||yu(t)),Jc(t),e=t.type,n=t.pendingProps,c=l!==null?l.memoizedProps:null,a=n.children,Rf(e,n)?a=null:c!==null&&Rf(e,c)&&(t.flags|=32),t.memoizedState!==null&&(e=If(l,t,d2,null,null,u),ne._currentValue=e),xa(l,t),dl(l,t,a,u),t.child;case 6:return l===null&&C&&((l=u=ol)&&(u=w2(u,t.pendingProps,lt),u!==null?(t.stateNode=u,bl=t,ol=null,l=!0):l=!1),l||yu(t)),null;case 13:return fv(l,t,u);case 4:return nn(t,t.stateNode.containerInfo),a=t.pendingProps,l===null?t.child=mu(t,null,a,u):dl(l,t,a,u),t.child;case 11:return J0(l,t,t.type,t.pendingProps,u);case 7:return dl(l,t,t.pendingProps,u),t.child;case 8:return dl(l,t,t.pendingProps.children,u),t.child;case 12:return dl(l,t,t.pendingProps.children,u),t.child;case 10:return a=t.pendingProps,Xt(t,t.type,a.value),dl(l,t,a.children,u),t.child;case 9:return e=t.type._context,a=t.pendingProps.children,Su(t),e=rl(e),a=a(e),t.flags|=1,dl(l,t,a,u),t.child;case 14:return w0(l,t,t.type,t.pendingProps,u);case 15:return nv(l,t,t.type,t.pendingProps,u);case 19:return iv(l,t,u);case 22:return cv(l,t,u);case 24:return Su(t),a=rl(al),l===null?(e=Ff(),e===null&&(e=L,n=$f(),e.pooledCache=n,n.refCount++,n!==null&&(e.pooledCacheLanes|=u),e=n),t.memoizedState={parent:a,cache:e},di(t),Xt(t,al,e)):((l.lanes&u)!==0&&(gf(l,t),Va(t,null,null,u),ja()),e=l.memoizedState,n=t.memoizedState,e.parent!==a?(e={parent:a,cache:a},t.memoizedState=e,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=e),Xt(t,al,a)):(a=n.cache,Xt(t,al,a),a!==e.cache&&rf(t,[al],u,!0))),dl(l,t,t.pendingProps.children,u),t.child;case 29:throw t.pendingProps}throw Error(g(156,t.tag))}var yf=ct(null),Mu=null,bt=null;function Xt(l,t,u){w(yf,t._currentValue),t._currentValue=u}function Et(l){l._currentValue=yf.current,sl(yf)}function mf(l,t,u){for(;l!==null;){var a=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,a!==null&&(a.childLanes|=t)):a!==null&&(a.childLanes&t)!==t&&(a.childLanes|=t),l===u)break;l=l.return}}function rf(l,t,u,a){var e=l.child;for(e!==null&&(e.return=l);e!==null;){var n=e.dependencies;if(n!==null){var c=e.child;n=n.firstContext;l:for(;n!==null;){var f=n;n=e;for(var i=0;i<t.length;i++)if(f.context===t[i]){n.lanes|=u,f=n.alternate,f!==null&&(f.lanes|=u),mf(n.return,u,l),a||(c=null);break l}n=f.next}}else if(e.tag===18){if(c=e.return,c===null)throw Error(g(341));c.lanes|=u,n=c.alternate,n!==null&&(n.lanes|=u),mf(c,u,l),c=null}else c=e.child;if(c!==null)c.return=e;else for(c=e;c!==null;){if(c===l){c=null;break}if(e=c.sibling,e!==null){e.return=c.return,c=e;break}c=c.return}e=c}}function re(l,t,u,a){l=null;for(var e=t,n=!1;e!==null;){if(!n){if((e.flags&524288)!==0)n=!0;else if((e.flags&262144)!==0)break}if(e.tag===10){var c=e.alternate;if(c===null)throw Error(g(387));if(c=c.memoizedProps,c!==null){var f=e.type;Nl(e.pendingProps.value,c.value)||(l!==null?l.push(f):l=[f])}}else if(e===en.current){if(c=e.alternate,c===null)throw Error(g(387));c.memoizedState.memoizedState!==e.memoizedState.memoizedState&&(l!==null?l.push(ne):l=[ne])}e=e.return}l!==null&&rf(t,l,u,a),t.flags|=262144}function En(l){for(l=l.firstContext;l!==null;){if(!Nl(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Su(l){Mu=l,bt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function rl(l){return vv(Mu,l)}function Ge(l,t){return Mu===null&&Su(l),vv(l,t)}function vv(l,t){var u=t._currentValue;if(t={context:t,memoizedValue:u,next:null},bt===null){if(l===null)throw Error(g(308));bt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else bt=bt.next=t;return u}var qt=!1;function di(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function gf(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function jt(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function Vt(l,t,u){var a=l.updateQueue;if(a===null)return null;if(a=a.shared,($&2)!==0){var e=a.pending;return e===null?t.next=t:(t.next=e.next,e.next=t),a.pending=t,t=dn(l),hs(l,null,u),t}return Gn(l,a,t,u),dn(l)}function Za(l,t,u){if(t=t.updateQueue,t!==null&&(t=t.shared,(u&4194176)!==0)){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,x1(l,u)}}function Uc(l,t){var u=l.updateQueue,a=l.alternate;if(a!==null&&(a=a.updateQueue,u===a)){var e=null,n=null;if(u=u.firstBaseUpdate,u!==null){do{var c={lane:u.lane,tag:u.tag,payload:u.payload,callback:null,next:null};n===null?e=n=c:n=n.next=c,u=u.next}while(u!==null);n===null?e=n=t:n=n.next=t}else e=n=t;u={baseState:a.baseState,firstBaseUpdate:e,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},l.updateQueue=u;return}l=u.lastBaseUpdate,l===null?u.firstBaseUpdate=t:l.next=t,u.lastBaseUpdate=t}var Sf=!1;function ja(){if(Sf){var l=$u;if(l!==null)throw l}}function Va(l,t,u,a){Sf=!1;var e=l.updateQueue;qt=!1;var n=e.firstBaseUpdate,c=e.lastBaseUpdate,f=e.shared.pending;if(f!==null){e.shared.pending=null;var i=f,s=i.next;i.next=null,c===null?n=s:c.next=s,c=i;var m=l.alternate;m!==null&&(m=m.updateQueue,f=m.lastBaseUpdate,f!==c&&(f===null?m.firstBaseUpdate=s:f.next=s,m.lastBaseUpdate=i))}if(n!==null){var S=e.baseState;c=0,m=s=i=null,f=n;do{var h=f.lane&-536870913,y=h!==f.lane;if(y?(Y&h)===h:(a&h)===h){h!==0&&h===ea&&(Sf=!0),m!==null&&(m=m.next={lane:0,tag:f.tag,payload:f.payload,callback:null,next:null});l:{var E=l,O=f;h=t;var Z=u;switch(O.tag){case 1:if(E=O.payload,typeof E=="function"){S=E.call(Z,S,h);break l}S=E;break l;case 3:E.flags=E.flags&-65537|128;case 0:if(E=O.payload,h=typeof E=="function"?E.call(Z,S,h):E,h==null)break l;S=J({},S,h);break l;case 2:qt=!0}}h=f.callback,h!==null&&(l.flags|=64,y&&(l.flags|=8192),y=e.callbacks,y===null?e.callbacks=[h]:y.push(h))}else y={lane:h,tag:f.tag,payload:f.payload,callback:f.callback,next:null},m===null?(s=m=y,i=S):m=m.next=y,c|=h;if(f=f.next,f===null){if(f=e.shared.pending,f===null)break;y=f,f=y.next,y.next=null,e.lastBaseUpdate=y,e.shared.pending=null}}while(!0);m===null&&(i=S),e.baseState=i,e.firstBaseUpdate=s,e.lastBaseUpdate=m,n===null&&(e.shared.lanes=0),Pt|=c,l.lanes=c,l.memoizedState=S}}function dv(l,t){if(typeof l!="function")throw Error(g(191,l));l.call(t)}function ov(l,t){var u=l.callbacks;if(u!==null)for(l.callbacks=null,l=0;l<u.length;l++)dv(u[l],t)}function ge(l,t){try{var u=t.updateQueue,a=u!==null?u.lastEffect:null;if(a!==null){var e=a.next;u=e;do{if((u.tag&l)===l){a=void 0;var n=u.create,c=u.inst;a=n(),c.destroy=a}u=u.next}while(u!==e)}}catch(f){x(t,t.return,f)}}function Ft(l,t,u){try{var a=t.updateQueue,e=a!==null?a.lastEffect:null;if(e!==null){var n=e.next;a=n;do{if((a.tag&l)===l){var c=a.inst,f=c.destroy;if(f!==void 0){c.destroy=void 0,e=t;var i=u;try{f()}catch(s){x(e,i,s)}}}a=a.next}while(a!==n)}}catch(s){x(t,t.return,s)}}function hv(l){var t=l.updateQueue;if(t!==null){var u=l.stateNode;try{ov(t,u)}catch(a){x(l,l.return,a)}}}function yv(l,t,u){u.props=gu(l.type,l.memoizedProps),u.state=l.memoizedState;try{u.componentWillUnmount()}catch(a){x(l,t,a)}}function fu(l,t){try{var u=l.ref;if(u!==null){var a=l.stateNode;switch(l.tag){case 26:case 27:case 5:var e=a;break;default:e=a}typeof u=="function"?l.refCleanup=u(e):u.current=e}}catch(n){x(l,t,n)}}function Ul(l,t){var u=l.ref,a=l.refCleanup;if(u!==null)if(typeof a=="function")try{a()}catch(e){x(l,t,e)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof u=="function")try{u(null)}catch(e){x(l,t,e)}else u.current=null}function mv(l){var t=l.type,u=l.memoizedProps,a=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":u.autoFocus&&a.focus();break l;case"img":u.src?a.src=u.src:u.srcSet&&(a.srcset=u.srcSet)}}catch(e){x(l,l.return,e)}}function I0(l,t,u){try{var a=l.stateNode;Z2(a,l.type,u,t),a[Al]=t}catch(e){x(l,l.return,e)}}function rv(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27||l.tag===4}function Hc(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||rv(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==27&&l.tag!==18;){if(l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function bf(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?u.nodeType===8?u.parentNode.insertBefore(l,t):u.insertBefore(l,t):(u.nodeType===8?(t=u.parentNode,t.insertBefore(l,u)):(t=u,t.appendChild(l)),u=u._reactRootContainer,u!=null||t.onclick!==null||(t.onclick=Kn));else if(a!==4&&a!==27&&(l=l.child,l!==null))for(bf(l,t,u),l=l.sibling;l!==null;)bf(l,t,u),l=l.sibling}function Tn(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?u.insertBefore(l,t):u.appendChild(l);else if(a!==4&&a!==27&&(l=l.child,l!==null))for(Tn(l,t,u),l=l.sibling;l!==null;)Tn(l,t,u),l=l.sibling}var ot=!1,F=!1,Rc=!1,l1=typeof WeakSet=="function"?WeakSet:Set,cl=null,t1=!1;function b2(l,t){if(l=l.containerInfo,Uf=pn,l=cs(l),Lf(l)){if("selectionStart"in l)var u={start:l.selectionStart,end:l.selectionEnd};else l:{u=(u=l.ownerDocument)&&u.defaultView||window;var a=u.getSelection&&u.getSelection();if(a&&a.rangeCount!==0){u=a.anchorNode;var e=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{u.nodeType,n.nodeType}catch{u=null;break l}var c=0,f=-1,i=-1,s=0,m=0,S=l,h=null;t:for(;;){for(var y;S!==u||e!==0&&S.nodeType!==3||(f=c+e),S!==n||a!==0&&S.nodeType!==3||(i=c+a),S.nodeType===3&&(c+=S.nodeValue.length),(y=S.firstChild)!==null;)h=S,S=y;for(;;){if(S===l)break t;if(h===u&&++s===e&&(f=c),h===n&&++m===a&&(i=c),(y=S.nextSibling)!==null)break;S=h,h=S.parentNode}S=y}u=f===-1||i===-1?null:{start:f,end:i}}else u=null}u=u||{start:0,end:0}}else u=null;for(Hf={focusedElem:l,selectionRange:u},pn=!1,cl=t;cl!==null;)if(t=cl,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,cl=l;else for(;cl!==null;){switch(t=cl,n=t.alternate,l=t.flags,t.tag){case 0:break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,u=t,e=n.memoizedProps,n=n.memoizedState,a=u.stateNode;try{var E=gu(u.type,e,u.elementType===u.type);l=a.getSnapshotBeforeUpdate(E,n),a.__reactInternalSnapshotBeforeUpdate=l}catch(O){x(u,u.return,O)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,u=l.nodeType,u===9)pf(l);else if(u===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":pf(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(g(163))}if(l=t.sibling,l!==null){l.return=t.return,cl=l;break}cl=t.return}return E=t1,t1=!1,E}function gv(l,t,u){var a=u.flags;switch(u.tag){case 0:case 11:case 15:vt(l,u),a&4&&ge(5,u);break;case 1:if(vt(l,u),a&4)if(l=u.stateNode,t===null)try{l.componentDidMount()}catch(f){x(u,u.return,f)}else{var e=gu(u.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(e,t,l.__reactInternalSnapshotBeforeUpdate)}catch(f){x(u,u.return,f)}}a&64&&hv(u),a&512&&fu(u,u.return);break;case 3:if(vt(l,u),a&64&&(a=u.updateQueue,a!==null)){if(l=null,u.child!==null)switch(u.child.tag){case 27:case 5:l=u.child.stateNode;break;case 1:l=u.child.stateNode}try{ov(a,l)}catch(f){x(u,u.return,f)}}break;case 26:vt(l,u),a&512&&fu(u,u.return);break;case 27:case 5:vt(l,u),t===null&&a&4&&mv(u),a&512&&fu(u,u.return);break;case 12:vt(l,u);break;case 13:vt(l,u),a&4&&Ev(l,u);break;case 22:if(e=u.memoizedState!==null||ot,!e){t=t!==null&&t.memoizedState!==null||F;var n=ot,c=F;ot=e,(F=t)&&!c?Nt(l,u,(u.subtreeFlags&8772)!==0):vt(l,u),ot=n,F=c}a&512&&(u.memoizedProps.mode==="manual"?fu(u,u.return):Ul(u,u.return));break;default:vt(l,u)}}function Sv(l){var t=l.alternate;t!==null&&(l.alternate=null,Sv(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&Gf(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var ll=null,Dl=!1;function st(l,t,u){for(u=u.child;u!==null;)bv(l,t,u),u=u.sibling}function bv(l,t,u){if(Hl&&typeof Hl.onCommitFiberUnmount=="function")try{Hl.onCommitFiberUnmount(se,u)}catch{}switch(u.tag){case 26:F||Ul(u,t),st(l,t,u),u.memoizedState?u.memoizedState.count--:u.stateNode&&(u=u.stateNode,u.parentNode.removeChild(u));break;case 27:F||Ul(u,t);var a=ll,e=Dl;for(ll=u.stateNode,st(l,t,u),u=u.stateNode,t=u.attributes;t.length;)u.removeAttributeNode(t[0]);Gf(u),ll=a,Dl=e;break;case 5:F||Ul(u,t);case 6:e=ll;var n=Dl;if(ll=null,st(l,t,u),ll=e,Dl=n,ll!==null)if(Dl)try{l=ll,a=u.stateNode,l.nodeType===8?l.parentNode.removeChild(a):l.removeChild(a)}catch(c){x(u,t,c)}else try{ll.removeChild(u.stateNode)}catch(c){x(u,t,c)}break;case 18:ll!==null&&(Dl?(t=ll,u=u.stateNode,t.nodeType===8?xc(t.parentNode,u):t.nodeType===1&&xc(t,u),ie(t)):xc(ll,u.stateNode));break;case 4:a=ll,e=Dl,ll=u.stateNode.containerInfo,Dl=!0,st(l,t,u),ll=a,Dl=e;break;case 0:case 11:case 14:case 15:F||Ft(2,u,t),F||Ft(4,u,t),st(l,t,u);break;case 1:F||(Ul(u,t),a=u.stateNode,typeof a.componentWillUnmount=="function"&&yv(u,t,a)),st(l,t,u);break;case 21:st(l,t,u);break;case 22:F||Ul(u,t),F=(a=F)||u.memoizedState!==null,st(l,t,u),F=a;break;default:st(l,t,u)}}function Ev(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{ie(l)}catch(u){x(t,t.return,u)}}function E2(l){switch(l.tag){case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new l1),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new l1),t;default:throw Error(g(435,l.tag))}}function pc(l,t){var u=E2(l);t.forEach(function(a){var e=B2.bind(null,l,a);u.has(a)||(u.add(a),a.then(e,e))})}function ql(l,t){var u=t.deletions;if(u!==null)for(var a=0;a<u.length;a++){var e=u[a],n=l,c=t,f=c;l:for(;f!==null;){switch(f.tag){case 27:case 5:ll=f.stateNode,Dl=!1;break l;case 3:ll=f.stateNode.containerInfo,Dl=!0;break l;case 4:ll=f.stateNode.containerInfo,Dl=!0;break l}f=f.return}if(ll===null)throw Error(g(160));bv(n,c,e),ll=null,Dl=!1,n=e.alternate,n!==null&&(n.return=null),e.return=null}if(t.subtreeFlags&13878)for(t=t.child;t!==null;)Tv(t,l),t=t.sibling}var Wl=null;function Tv(l,t){var u=l.alternate,a=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:ql(t,l),Yl(l),a&4&&(Ft(3,l,l.return),ge(3,l),Ft(5,l,l.return));break;case 1:ql(t,l),Yl(l),a&512&&(F||u===null||Ul(u,u.return)),a&64&&ot&&(l=l.updateQueue,l!==null&&(a=l.callbacks,a!==null&&(u=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=u===null?a:u.concat(a))));break;case 26:var e=Wl;if(ql(t,l),Yl(l),a&512&&(F||u===null||Ul(u,u.return)),a&4){var n=u!==null?u.memoizedState:null;if(a=l.memoizedState,u===null)if(a===null)if(l.stateNode===null){l:{a=l.type,u=l.memoizedProps,e=e.ownerDocument||e;t:switch(a){case"title":n=e.getElementsByTagName("title")[0],(!n||n[ka]||n[ml]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=e.createElement(a),e.head.insertBefore(n,e.querySelector("head > title"))),hl(n,a,u),n[ml]=l,fl(n),a=n;break l;case"link":var c=E1("link","href",e).get(a+(u.href||""));if(c){for(var f=0;f<c.length;f++)if(n=c[f],n.getAttribute("href")===(u.href==null?null:u.href)&&n.getAttribute("rel")===(u.rel==null?null:u.rel)&&n.getAttribute("title")===(u.title==null?null:u.title)&&n.getAttribute("crossorigin")===(u.crossOrigin==null?null:u.crossOrigin)){c.splice(f,1);break t}}n=e.createElement(a),hl(n,a,u),e.head.appendChild(n);break;case"meta":if(c=E1("meta","content",e).get(a+(u.content||""))){for(f=0;f<c.length;f++)if(n=c[f],n.getAttribute("content")===(u.content==null?null:""+u.content)&&n.getAttribute("name")===(u.name==null?null:u.name)&&n.getAttribute("property")===(u.property==null?null:u.property)&&n.getAttribute("http-equiv")===(u.httpEquiv==null?null:u.httpEquiv)&&n.getAttribute("charset")===(u.charSet==null?null:u.charSet)){c.splice(f,1);break t}}n=e.createElement(a),hl(n,a,u),e.head.appendChild(n);break;default:throw Error(g(468,a))}n[ml]=l,fl(n),a=n}l.stateNode=a}else T1(e,l.type,l.stateNode);else l.stateNode=b1(e,a,l.memoizedProps);else n!==a?(n===null?u.stateNode!==null&&(u=u.stateNode,u.parentNode.removeChild(u)):n.count--,a===null?T1(e,l.type,l.stateNode):b1(e,a,l.memoizedProps)):a===null&&l.stateNode!==null&&I0(l,l.memoizedProps,u.memoizedProps)}break;case 27:if(a&4&&l.alternate===null){e=l.stateNode,n=l.memoizedProps;try{for(var i=e.firstChild;i;){var s=i.nextSibling,m=i.nodeName;i[ka]||m==="HEAD"||m==="BODY"||m==="SCRIPT"||m==="STYLE"||m==="LINK"&&i.rel.toLowerCase()==="stylesheet"||e.removeChild(i),i=s}for(var S=l.type,h=e.attributes;h.length;)e.removeAttributeNode(h[0]);hl(e,S,n),e[ml]=l,e[Al]=n}catch(E){x(l,l.return,E)}}case 5:if(ql(t,l),Yl(l),a&512&&(F||u===null||Ul(u,u.return)),l.flags&32){e=l.stateNode;try{ua(e,"")}catch(E){x(l,l.return,E)}}a&4&&l.stateNode!=null&&(e=l.memoizedProps,I0(l,e,u!==null?u.memoizedProps:e)),a&1024&&(Rc=!0);break;case 6:if(ql(t,l),Yl(l),a&4){if(l.stateNode===null)throw Error(g(162));a=l.memoizedProps,u=l.stateNode;try{u.nodeValue=a}catch(E){x(l,l.return,E)}}break;case 3:if(un=null,e=Wl,Wl=Un(t.containerInfo),ql(t,l),Wl=e,Yl(l),a&4&&u!==null&&u.memoizedState.isDehydrated)try{ie(t.containerInfo)}catch(E){x(l,l.return,E)}Rc&&(Rc=!1,zv(l));break;case 4:a=Wl,Wl=Un(l.stateNode.containerInfo),ql(t,l),Yl(l),Wl=a;break;case 12:ql(t,l),Yl(l);break;case 13:ql(t,l),Yl(l),l.child.flags&8192&&l.memoizedState!==null!=(u!==null&&u.memoizedState!==null)&&(gi=at()),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,pc(l,a)));break;case 22:if(a&512&&(F||u===null||Ul(u,u.return)),i=l.memoizedState!==null,s=u!==null&&u.memoizedState!==null,m=ot,S=F,ot=m||i,F=S||s,ql(t,l),F=S,ot=m,Yl(l),t=l.stateNode,t._current=l,t._visibility&=-3,t._visibility|=t._pendingVisibility&2,a&8192&&(t._visibility=i?t._visibility&-2:t._visibility|1,i&&(t=ot||F,u===null||s||t||Nu(l)),l.memoizedProps===null||l.memoizedProps.mode!=="manual"))l:for(u=null,t=l;;){if(t.tag===5||t.tag===26||t.tag===27){if(u===null){s=u=t;try{if(e=s.stateNode,i)n=e.style,typeof n.setProperty=="function"?n.setProperty("display","none","important"):n.display="none";else{c=s.stateNode,f=s.memoizedProps.style;var y=f!=null&&f.hasOwnProperty("display")?f.display:null;c.style.display=y==null||typeof y=="boolean"?"":(""+y).trim()}}catch(E){x(s,s.return,E)}}}else if(t.tag===6){if(u===null){s=t;try{s.stateNode.nodeValue=i?"":s.memoizedProps}catch(E){x(s,s.return,E)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;u===t&&(u=null),t=t.return}u===t&&(u=null),t.sibling.return=t.return,t=t.sibling}a&4&&(a=l.updateQueue,a!==null&&(u=a.retryQueue,u!==null&&(a.retryQueue=null,pc(l,u))));break;case 19:ql(t,l),Yl(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,pc(l,a)));break;case 21:break;default:ql(t,l),Yl(l)}}function Yl(l){var t=l.flags;if(t&2){try{if(l.tag!==27){l:{for(var u=l.return;u!==null;){if(rv(u)){var a=u;break l}u=u.return}throw Error(g(160))}switch(a.tag){case 27:var e=a.stateNode,n=Hc(l);Tn(l,n,e);break;case 5:var c=a.stateNode;a.flags&32&&(ua(c,""),a.flags&=-33);var f=Hc(l);Tn(l,f,c);break;case 3:case 4:var i=a.stateNode.containerInfo,s=Hc(l);bf(l,s,i);break;default:throw Error(g(161))}}}catch(m){x(l,l.return,m)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function zv(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;zv(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function vt(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)gv(l,t.alternate,t),t=t.sibling}function Nu(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:Ft(4,t,t.return),Nu(t);break;case 1:Ul(t,t.return);var u=t.stateNode;typeof u.componentWillUnmount=="function"&&yv(t,t.return,u),Nu(t);break;case 26:case 27:case 5:Ul(t,t.return),Nu(t);break;case 22:Ul(t,t.return),t.memoizedState===null&&Nu(t);break;default:Nu(t)}l=l.sibling}}function Nt(l,t,u){for(u=u&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var a=t.alternate,e=l,n=t,c=n.flags;switch(n.tag){case 0:case 11:case 15:Nt(e,n,u),ge(4,n);break;case 1:if(Nt(e,n,u),a=n,e=a.stateNode,typeof e.componentDidMount=="function")try{e.componentDidMount()}catch(s){x(a,a.return,s)}if(a=n,e=a.updateQueue,e!==null){var f=a.stateNode;try{var i=e.shared.hiddenCallbacks;if(i!==null)for(e.shared.hiddenCallbacks=null,e=0;e<i.length;e++)dv(i[e],f)}catch(s){x(a,a.return,s)}}u&&c&64&&hv(n),fu(n,n.return);break;case 26:case 27:case 5:Nt(e,n,u),u&&a===null&&c&4&&mv(n),fu(n,n.return);break;case 12:Nt(e,n,u);break;case 13:Nt(e,n,u),u&&c&4&&Ev(e,n);break;case 22:n.memoizedState===null&&Nt(e,n,u),fu(n,n.return);break;default:Nt(e,n,u)}t=t.sibling}}function oi(l,t){var u=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==u&&(l!=null&&l.refCount++,u!=null&&ye(u))}function hi(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&ye(l))}function pt(l,t,u,a){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)Av(l,t,u,a),t=t.sibling}function Av(l,t,u,a){var e=t.flags;switch(t.tag){case 0:case 11:case 15:pt(l,t,u,a),e&2048&&ge(9,t);break;case 3:pt(l,t,u,a),e&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&ye(l)));break;case 12:if(e&2048){pt(l,t,u,a),l=t.stateNode;try{var n=t.memoizedProps,c=n.id,f=n.onPostCommit;typeof f=="function"&&f(c,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(i){x(t,t.return,i)}}else pt(l,t,u,a);break;case 23:break;case 22:n=t.stateNode,t.memoizedState!==null?n._visibility&4?pt(l,t,u,a):La(l,t):n._visibility&4?pt(l,t,u,a):(n._visibility|=4,Bu(l,t,u,a,(t.subtreeFlags&10256)!==0)),e&2048&&oi(t.alternate,t);break;case 24:pt(l,t,u,a),e&2048&&hi(t.alternate,t);break;default:pt(l,t,u,a)}}function Bu(l,t,u,a,e){for(e=e&&(t.subtreeFlags&10256)!==0,t=t.child;t!==null;){var n=l,c=t,f=u,i=a,s=c.flags;switch(c.tag){case 0:case 11:case 15:Bu(n,c,f,i,e),ge(8,c);break;case 23:break;case 22:var m=c.stateNode;c.memoizedState!==null?m._visibility&4?Bu(n,c,f,i,e):La(n,c):(m._visibility|=4,Bu(n,c,f,i,e)),e&&s&2048&&oi(c.alternate,c);break;case 24:Bu(n,c,f,i,e),e&&s&2048&&hi(c.alternate,c);break;default:Bu(n,c,f,i,e)}t=t.sibling}}function La(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var u=l,a=t,e=a.flags;switch(a.tag){case 22:La(u,a),e&2048&&oi(a.alternate,a);break;case 24:La(u,a),e&2048&&hi(a.alternate,a);break;default:La(u,a)}t=t.sibling}}var Na=8192;function Ru(l){if(l.subtreeFlags&Na)for(l=l.child;l!==null;)Mv(l),l=l.sibling}function Mv(l){switch(l.tag){case 26:Ru(l),l.flags&Na&&l.memoizedState!==null&&ch(Wl,l.memoizedState,l.memoizedProps);break;case 5:Ru(l);break;case 3:case 4:var t=Wl;Wl=Un(l.stateNode.containerInfo),Ru(l),Wl=t;break;case 22:l.memoizedState===null&&(t=l.alternate,t!==null&&t.memoizedState!==null?(t=Na,Na=16777216,Ru(l),Na=t):Ru(l));break;default:Ru(l)}}function Ov(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function Ma(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];cl=a,_v(a,l)}Ov(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)Dv(l),l=l.sibling}function Dv(l){switch(l.tag){case 0:case 11:case 15:Ma(l),l.flags&2048&&Ft(9,l,l.return);break;case 3:Ma(l);break;case 12:Ma(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&4&&(l.return===null||l.return.tag!==13)?(t._visibility&=-5,Ie(l)):Ma(l);break;default:Ma(l)}}function Ie(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];cl=a,_v(a,l)}Ov(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:Ft(8,t,t.return),Ie(t);break;case 22:u=t.stateNode,u._visibility&4&&(u._visibility&=-5,Ie(t));break;default:Ie(t)}l=l.sibling}}function _v(l,t){for(;cl!==null;){var u=cl;switch(u.tag){case 0:case 11:case 15:Ft(8,u,t);break;case 23:case 22:if(u.memoizedState!==null&&u.memoizedState.cachePool!==null){var a=u.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:ye(u.memoizedState.cache)}if(a=u.child,a!==null)a.return=u,cl=a;else l:for(u=l;cl!==null;){a=cl;var e=a.sibling,n=a.return;if(Sv(a),a===u){cl=null;break l}if(e!==null){e.return=n,cl=e;break l}cl=n}}}function T2(l,t,u,a){this.tag=l,this.key=u,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function jl(l,t,u,a){return new T2(l,t,u,a)}function yi(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Lt(l,t){var u=l.alternate;return u===null?(u=jl(l.tag,t,l.key,l.mode),u.elementType=l.elementType,u.type=l.type,u.stateNode=l.stateNode,u.alternate=l,l.alternate=u):(u.pendingProps=t,u.type=l.type,u.flags=0,u.subtreeFlags=0,u.deletions=null),u.flags=l.flags&31457280,u.childLanes=l.childLanes,u.lanes=l.lanes,u.child=l.child,u.memoizedProps=l.memoizedProps,u.memoizedState=l.memoizedState,u.updateQueue=l.updateQueue,t=l.dependencies,u.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},u.sibling=l.sibling,u.index=l.index,u.ref=l.ref,u.refCleanup=l.refCleanup,u}function Uv(l,t){l.flags&=31457282;var u=l.alternate;return u===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,t=u.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function ln(l,t,u,a,e,n){var c=0;if(a=l,typeof l=="function")yi(l)&&(c=1);else if(typeof l=="string")c=eh(l,u,ut.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case Yu:return du(u.children,e,n,t);case H1:c=8,e|=24;break;case Zc:return l=jl(12,u,t,e|2),l.elementType=Zc,l.lanes=n,l;case jc:return l=jl(13,u,t,e),l.elementType=jc,l.lanes=n,l;case Vc:return l=jl(19,u,t,e),l.elementType=Vc,l.lanes=n,l;case p1:return Hv(u,e,n,t);default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case Kd:case mt:c=10;break l;case R1:c=9;break l;case Yf:c=11;break l;case Cf:c=14;break l;case Bt:c=16,a=null;break l}c=29,u=Error(g(130,l===null?"null":typeof l,"")),a=null}return t=jl(c,u,t,e),t.elementType=l,t.type=a,t.lanes=n,t}function du(l,t,u,a){return l=jl(7,l,a,t),l.lanes=u,l}function Hv(l,t,u,a){l=jl(22,l,a,t),l.elementType=p1,l.lanes=u;var e={_visibility:1,_pendingVisibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null,_current:null,detach:function(){var n=e._current;if(n===null)throw Error(g(456));if((e._pendingVisibility&2)===0){var c=kt(n,2);c!==null&&(e._pendingVisibility|=2,El(c,n,2))}},attach:function(){var n=e._current;if(n===null)throw Error(g(456));if((e._pendingVisibility&2)!==0){var c=kt(n,2);c!==null&&(e._pendingVisibility&=-3,El(c,n,2))}}};return l.stateNode=e,l}function Nc(l,t,u){return l=jl(6,l,null,t),l.lanes=u,l}function Bc(l,t,u){return t=jl(4,l.children!==null?l.children:[],l.key,t),t.lanes=u,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}function dt(l){l.flags|=4}function u1(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!$v(t)){if(t=Ll.current,t!==null&&((Y&4194176)===Y?et!==null:(Y&62914560)!==Y&&(Y&536870912)===0||t!==et))throw Xa=uf,ms;l.flags|=8192}}function Qe(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?G1():536870912,l.lanes|=t,ca|=t)}function Oa(l,t){if(!C)switch(l.tailMode){case"hidden":t=l.tail;for(var u=null;t!==null;)t.alternate!==null&&(u=t),t=t.sibling;u===null?l.tail=null:u.sibling=null;break;case"collapsed":u=l.tail;for(var a=null;u!==null;)u.alternate!==null&&(a=u),u=u.sibling;a===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:a.sibling=null}}function k(l){var t=l.alternate!==null&&l.alternate.child===l.child,u=0,a=0;if(t)for(var e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags&31457280,a|=e.flags&31457280,e.return=l,e=e.sibling;else for(e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags,a|=e.flags,e.return=l,e=e.sibling;return l.subtreeFlags|=a,l.childLanes=u,t}function z2(l,t,u){var a=t.pendingProps;switch(Wf(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return k(t),null;case 1:return k(t),null;case 3:return u=t.stateNode,a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Et(al),la(),u.pendingContext&&(u.context=u.pendingContext,u.pendingContext=null),(l===null||l.child===null)&&(za(t)?dt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,kl!==null&&(Mf(kl),kl=null))),k(t),null;case 26:return u=t.memoizedState,l===null?(dt(t),u!==null?(k(t),u1(t,u)):(k(t),t.flags&=-16777217)):u?u!==l.memoizedState?(dt(t),k(t),u1(t,u)):(k(t),t.flags&=-16777217):(l.memoizedProps!==a&&dt(t),k(t),t.flags&=-16777217),null;case 27:cn(t),u=Zt.current;var e=t.type;if(l!==null&&t.stateNode!=null)l.memoizedProps!==a&&dt(t);else{if(!a){if(t.stateNode===null)throw Error(g(166));return k(t),null}l=ut.current,za(t)?N0(t,l):(l=wv(e,a,u),t.stateNode=l,dt(t))}return k(t),null;case 5:if(cn(t),u=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&dt(t);else{if(!a){if(t.stateNode===null)throw Error(g(166));return k(t),null}if(l=ut.current,za(t))N0(t,l);else{switch(e=_n(Zt.current),l){case 1:l=e.createElementNS("http://www.w3.org/2000/svg",u);break;case 2:l=e.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;default:switch(u){case"svg":l=e.createElementNS("http://www.w3.org/2000/svg",u);break;case"math":l=e.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;case"script":l=e.createElement("div"),l.innerHTML="<script><\/script>",l=l.removeChild(l.firstChild);break;case"select":l=typeof a.is=="string"?e.createElement("select",{is:a.is}):e.createElement("select"),a.multiple?l.multiple=!0:a.size&&(l.size=a.size);break;default:l=typeof a.is=="string"?e.createElement(u,{is:a.is}):e.createElement(u)}}l[ml]=t,l[Al]=a;l:for(e=t.child;e!==null;){if(e.tag===5||e.tag===6)l.appendChild(e.stateNode);else if(e.tag!==4&&e.tag!==27&&e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break l;for(;e.sibling===null;){if(e.return===null||e.return===t)break l;e=e.return}e.sibling.return=e.return,e=e.sibling}t.stateNode=l;l:switch(hl(l,u,a),u){case"button":case"input":case"select":case"textarea":l=!!a.autoFocus;break l;case"img":l=!0;break l;default:l=!1}l&&dt(t)}}return k(t),t.flags&=-16777217,null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==a&&dt(t);else{if(typeof a!="string"&&t.stateNode===null)throw Error(g(166));if(l=Zt.current,za(t)){if(l=t.stateNode,u=t.memoizedProps,a=null,e=bl,e!==null)switch(e.tag){case 27:case 5:a=e.memoizedProps}l[ml]=t,l=!!(l.nodeValue===u||a!==null&&a.suppressHydrationWarning===!0||Lv(l.nodeValue,u)),l||yu(t)}else l=_n(l).createTextNode(a),l[ml]=t,t.stateNode=l}return k(t),null;case 13:if(a=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(e=za(t),a!==null&&a.dehydrated!==null){if(l===null){if(!e)throw Error(g(318));if(e=t.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(g(317));e[ml]=t}else he(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;k(t),e=!1}else kl!==null&&(Mf(kl),kl=null),e=!0;if(!e)return t.flags&256?(St(t),t):(St(t),null)}if(St(t),(t.flags&128)!==0)return t.lanes=u,t;if(u=a!==null,l=l!==null&&l.memoizedState!==null,u){a=t.child,e=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(e=a.alternate.memoizedState.cachePool.pool);var n=null;a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==e&&(a.flags|=2048)}return u!==l&&u&&(t.child.flags|=8192),Qe(t,t.updateQueue),k(t),null;case 4:return la(),l===null&&Ei(t.stateNode.containerInfo),k(t),null;case 10:return Et(t.type),k(t),null;case 19:if(sl(el),e=t.memoizedState,e===null)return k(t),null;if(a=(t.flags&128)!==0,n=e.rendering,n===null)if(a)Oa(e,!1);else{if(P!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=mn(l),n!==null){for(t.flags|=128,Oa(e,!1),l=n.updateQueue,t.updateQueue=l,Qe(t,l),t.subtreeFlags=0,l=u,u=t.child;u!==null;)Uv(u,l),u=u.sibling;return w(el,el.current&1|2),t.child}l=l.sibling}e.tail!==null&&at()>zn&&(t.flags|=128,a=!0,Oa(e,!1),t.lanes=4194304)}else{if(!a)if(l=mn(n),l!==null){if(t.flags|=128,a=!0,l=l.updateQueue,t.updateQueue=l,Qe(t,l),Oa(e,!0),e.tail===null&&e.tailMode==="hidden"&&!n.alternate&&!C)return k(t),null}else 2*at()-e.renderingStartTime>zn&&u!==536870912&&(t.flags|=128,a=!0,Oa(e,!1),t.lanes=4194304);e.isBackwards?(n.sibling=t.child,t.child=n):(l=e.last,l!==null?l.sibling=n:t.child=n,e.last=n)}return e.tail!==null?(t=e.tail,e.rendering=t,e.tail=t.sibling,e.renderingStartTime=at(),t.sibling=null,l=el.current,w(el,a?l&1|2:l&1),t):(k(t),null);case 22:case 23:return St(t),kf(),a=t.memoizedState!==null,l!==null?l.memoizedState!==null!==a&&(t.flags|=8192):a&&(t.flags|=8192),a?(u&536870912)!==0&&(t.flags&128)===0&&(k(t),t.subtreeFlags&6&&(t.flags|=8192)):k(t),u=t.updateQueue,u!==null&&Qe(t,u.retryQueue),u=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),a=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(a=t.memoizedState.cachePool.pool),a!==u&&(t.flags|=2048),l!==null&&sl(vu),null;case 24:return u=null,l!==null&&(u=l.memoizedState.cache),t.memoizedState.cache!==u&&(t.flags|=2048),Et(al),k(t),null;case 25:return null}throw Error(g(156,t.tag))}function A2(l,t){switch(Wf(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Et(al),la(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return cn(t),null;case 13:if(St(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(g(340));he()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return sl(el),null;case 4:return la(),null;case 10:return Et(t.type),null;case 22:case 23:return St(t),kf(),l!==null&&sl(vu),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Et(al),null;case 25:return null;default:return null}}function Rv(l,t){switch(Wf(t),t.tag){case 3:Et(al),la();break;case 26:case 27:case 5:cn(t);break;case 4:la();break;case 13:St(t);break;case 19:sl(el);break;case 10:Et(t.type);break;case 22:case 23:St(t),kf(),l!==null&&sl(vu);break;case 24:Et(al)}}var M2={getCacheForType:function(l){var t=rl(al),u=t.data.get(l);return u===void 0&&(u=l(),t.data.set(l,u)),u}},O2=typeof WeakMap=="function"?WeakMap:Map,$=0,L=null,N=null,Y=0,V=0,_l=null,ht=!1,oa=!1,mi=!1,Mt=0,P=0,Pt=0,ou=0,ri=0,Vl=0,ca=0,Ka=null,tt=null,Ef=!1,gi=0,zn=1/0,An=null,Kt=null,xe=!1,nu=null,Ja=0,Tf=0,zf=null,wa=0,Af=null;function pl(){if(($&2)!==0&&Y!==0)return Y&-Y;if(U.T!==null){var l=ea;return l!==0?l:bi()}return j1()}function pv(){Vl===0&&(Vl=(Y&536870912)===0||C?X1():536870912);var l=Ll.current;return l!==null&&(l.flags|=32),Vl}function El(l,t,u){(l===L&&V===2||l.cancelPendingCommit!==null)&&(fa(l,0),yt(l,Y,Vl,!1)),de(l,u),(($&2)===0||l!==L)&&(l===L&&(($&2)===0&&(ou|=u),P===4&&yt(l,Y,Vl,!1)),ft(l))}function Nv(l,t,u){if(($&6)!==0)throw Error(g(327));var a=!u&&(t&60)===0&&(t&l.expiredLanes)===0||ve(l,t),e=a?U2(l,t):qc(l,t,!0),n=a;do{if(e===0){oa&&!a&&yt(l,t,0,!1);break}else if(e===6)yt(l,t,0,!ht);else{if(u=l.current.alternate,n&&!D2(u)){e=qc(l,t,!1),n=!1;continue}if(e===2){if(n=t,l.errorRecoveryDisabledLanes&n)var c=0;else c=l.pendingLanes&-536870913,c=c!==0?c:c&536870912?536870912:0;if(c!==0){t=c;l:{var f=l;e=Ka;var i=f.current.memoizedState.isDehydrated;if(i&&(fa(f,c).flags|=256),c=qc(f,c,!1),c!==2){if(mi&&!i){f.errorRecoveryDisabledLanes|=n,ou|=n,e=4;break l}n=tt,tt=e,n!==null&&Mf(n)}e=c}if(n=!1,e!==2)continue}}if(e===1){fa(l,0),yt(l,t,0,!0);break}l:{switch(a=l,e){case 0:case 1:throw Error(g(345));case 4:if((t&4194176)===t){yt(a,t,Vl,!ht);break l}break;case 2:tt=null;break;case 3:case 5:break;default:throw Error(g(329))}if(a.finishedWork=u,a.finishedLanes=t,(t&62914560)===t&&(n=gi+300-at(),10<n)){if(yt(a,t,Vl,!ht),Bn(a,0)!==0)break l;a.timeoutHandle=Jv(a1.bind(null,a,u,tt,An,Ef,t,Vl,ou,ca,ht,2,-0,0),n);break l}a1(a,u,tt,An,Ef,t,Vl,ou,ca,ht,0,-0,0)}}break}while(!0);ft(l)}function Mf(l){tt===null?tt=l:tt.push.apply(tt,l)}function a1(l,t,u,a,e,n,c,f,i,s,m,S,h){var y=t.subtreeFlags;if((y&8192||(y&16785408)===16785408)&&(ee={stylesheets:null,count:0,unsuspend:nh},Mv(t),t=fh(),t!==null)){l.cancelPendingCommit=t(n1.bind(null,l,u,a,e,c,f,i,1,S,h)),yt(l,n,c,!s);return}n1(l,u,a,e,c,f,i,m,S,h)}function D2(l){for(var t=l;;){var u=t.tag;if((u===0||u===11||u===15)&&t.flags&16384&&(u=t.updateQueue,u!==null&&(u=u.stores,u!==null)))for(var a=0;a<u.length;a++){var e=u[a],n=e.getSnapshot;e=e.value;try{if(!Nl(n(),e))return!1}catch{return!1}}if(u=t.child,t.subtreeFlags&16384&&u!==null)u.return=t,t=u;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function yt(l,t,u,a){t&=~ri,t&=~ou,l.suspendedLanes|=t,l.pingedLanes&=~t,a&&(l.warmLanes|=t),a=l.expirationTimes;for(var e=t;0<e;){var n=31-Rl(e),c=1<<n;a[n]=-1,e&=~c}u!==0&&Q1(l,u,t)}function Vn(){return($&6)===0?(Se(0,!1),!1):!0}function Si(){if(N!==null){if(V===0)var l=N.return;else l=N,bt=Mu=null,ui(l),ku=null,le=0,l=N;for(;l!==null;)Rv(l.alternate,l),l=l.return;N=null}}function fa(l,t){l.finishedWork=null,l.finishedLanes=0;var u=l.timeoutHandle;u!==-1&&(l.timeoutHandle=-1,V2(u)),u=l.cancelPendingCommit,u!==null&&(l.cancelPendingCommit=null,u()),Si(),L=l,N=u=Lt(l.current,null),Y=t,V=0,_l=null,ht=!1,oa=ve(l,t),mi=!1,ca=Vl=ri=ou=Pt=P=0,tt=Ka=null,Ef=!1,(t&8)!==0&&(t|=t&32);var a=l.entangledLanes;if(a!==0)for(l=l.entanglements,a&=t;0<a;){var e=31-Rl(a),n=1<<e;t|=l[e],a&=~n}return Mt=t,Xn(),u}function Bv(l,t){p=null,U.H=nt,t===Ca?(t=Y0(),V=3):t===ms?(t=Y0(),V=4):V=t===ev?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,_l=t,N===null&&(P=1,bn(l,Zl(t,l.current)))}function qv(){var l=U.H;return U.H=nt,l===null?nt:l}function Yv(){var l=U.A;return U.A=M2,l}function Of(){P=4,ht||(Y&4194176)!==Y&&Ll.current!==null||(oa=!0),(Pt&134217727)===0&&(ou&134217727)===0||L===null||yt(L,Y,Vl,!1)}function qc(l,t,u){var a=$;$|=2;var e=qv(),n=Yv();(L!==l||Y!==t)&&(An=null,fa(l,t)),t=!1;var c=P;l:do try{if(V!==0&&N!==null){var f=N,i=_l;switch(V){case 8:Si(),c=6;break l;case 3:case 2:case 6:Ll.current===null&&(t=!0);var s=V;if(V=0,_l=null,Ku(l,f,i,s),u&&oa){c=0;break l}break;default:s=V,V=0,_l=null,Ku(l,f,i,s)}}_2(),c=P;break}catch(m){Bv(l,m)}while(!0);return t&&l.shellSuspendCounter++,bt=Mu=null,$=a,U.H=e,U.A=n,N===null&&(L=null,Y=0,Xn()),c}function _2(){for(;N!==null;)Cv(N)}function U2(l,t){var u=$;$|=2;var a=qv(),e=Yv();L!==l||Y!==t?(An=null,zn=at()+500,fa(l,t)):oa=ve(l,t);l:do try{if(V!==0&&N!==null){t=N;var n=_l;t:switch(V){case 1:V=0,_l=null,Ku(l,t,n,1);break;case 2:if(q0(n)){V=0,_l=null,e1(t);break}t=function(){V===2&&L===l&&(V=7),ft(l)},n.then(t,t);break l;case 3:V=7;break l;case 4:V=5;break l;case 7:q0(n)?(V=0,_l=null,e1(t)):(V=0,_l=null,Ku(l,t,n,7));break;case 5:var c=null;switch(N.tag){case 26:c=N.memoizedState;case 5:case 27:var f=N;if(!c||$v(c)){V=0,_l=null;var i=f.sibling;if(i!==null)N=i;else{var s=f.return;s!==null?(N=s,Ln(s)):N=null}break t}}V=0,_l=null,Ku(l,t,n,5);break;case 6:V=0,_l=null,Ku(l,t,n,6);break;case 8:Si(),P=6;break l;default:throw Error(g(462))}}H2();break}catch(m){Bv(l,m)}while(!0);return bt=Mu=null,U.H=a,U.A=e,$=u,N!==null?0:(L=null,Y=0,Xn(),P)}function H2(){for(;N!==null&&!$d();)Cv(N)}function Cv(l){var t=sv(l.alternate,l,Mt);l.memoizedProps=l.pendingProps,t===null?Ln(l):N=t}function e1(l){var t=l,u=t.alternate;switch(t.tag){case 15:case 0:t=k0(u,t,t.pendingProps,t.type,void 0,Y);break;case 11:t=k0(u,t,t.pendingProps,t.type.render,t.ref,Y);break;case 5:ui(t);default:Rv(u,t),t=N=Uv(t,Mt),t=sv(u,t,Mt)}l.memoizedProps=l.pendingProps,t===null?Ln(l):N=t}function Ku(l,t,u,a){bt=Mu=null,ui(t),ku=null,le=0;var e=t.return;try{if(g2(l,e,t,u,Y)){P=1,bn(l,Zl(u,l.current)),N=null;return}}catch(n){if(e!==null)throw N=e,n;P=1,bn(l,Zl(u,l.current)),N=null;return}t.flags&32768?(C||a===1?l=!0:oa||(Y&536870912)!==0?l=!1:(ht=l=!0,(a===2||a===3||a===6)&&(a=Ll.current,a!==null&&a.tag===13&&(a.flags|=16384))),Xv(t,l)):Ln(t)}function Ln(l){var t=l;do{if((t.flags&32768)!==0){Xv(t,ht);return}l=t.return;var u=z2(t.alternate,t,Mt);if(u!==null){N=u;return}if(t=t.sibling,t!==null){N=t;return}N=t=l}while(t!==null);P===0&&(P=5)}function Xv(l,t){do{var u=A2(l.alternate,l);if(u!==null){u.flags&=32767,N=u;return}if(u=l.return,u!==null&&(u.flags|=32768,u.subtreeFlags=0,u.deletions=null),!t&&(l=l.sibling,l!==null)){N=l;return}N=l=u}while(l!==null);P=6,N=null}function n1(l,t,u,a,e,n,c,f,i,s){var m=U.T,S=K.p;try{K.p=2,U.T=null,R2(l,t,u,a,S,e,n,c,f,i,s)}finally{U.T=m,K.p=S}}function R2(l,t,u,a,e,n,c,f){do Iu();while(nu!==null);if(($&6)!==0)throw Error(g(327));var i=l.finishedWork;if(a=l.finishedLanes,i===null)return null;if(l.finishedWork=null,l.finishedLanes=0,i===l.current)throw Error(g(177));l.callbackNode=null,l.callbackPriority=0,l.cancelPendingCommit=null;var s=i.lanes|i.childLanes;if(s|=Kf,fo(l,a,s,n,c,f),l===L&&(N=L=null,Y=0),(i.subtreeFlags&10256)===0&&(i.flags&10256)===0||xe||(xe=!0,Tf=s,zf=u,q2(fn,function(){return Iu(!0),null})),u=(i.flags&15990)!==0,(i.subtreeFlags&15990)!==0||u?(u=U.T,U.T=null,n=K.p,K.p=2,c=$,$|=4,b2(l,i),Tv(i,l),l2(Hf,l.containerInfo),pn=!!Uf,Hf=Uf=null,l.current=i,gv(l,i.alternate,i),Fd(),$=c,K.p=n,U.T=u):l.current=i,xe?(xe=!1,nu=l,Ja=a):Gv(l,s),s=l.pendingLanes,s===0&&(Kt=null),uo(i.stateNode,e),ft(l),t!==null)for(e=l.onRecoverableError,i=0;i<t.length;i++)s=t[i],e(s.value,{componentStack:s.stack});return(Ja&3)!==0&&Iu(),s=l.pendingLanes,(a&4194218)!==0&&(s&42)!==0?l===Af?wa++:(wa=0,Af=l):wa=0,Se(0,!1),null}function Gv(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,ye(t)))}function Iu(){if(nu!==null){var l=nu,t=Tf;Tf=0;var u=Z1(Ja),a=U.T,e=K.p;try{if(K.p=32>u?32:u,U.T=null,nu===null)var n=!1;else{u=zf,zf=null;var c=nu,f=Ja;if(nu=null,Ja=0,($&6)!==0)throw Error(g(331));var i=$;if($|=4,Dv(c.current),Av(c,c.current,f,u),$=i,Se(0,!1),Hl&&typeof Hl.onPostCommitFiberRoot=="function")try{Hl.onPostCommitFiberRoot(se,c)}catch{}n=!0}return n}finally{K.p=e,U.T=a,Gv(l,t)}}return!1}function c1(l,t,u){t=Zl(u,t),t=vf(l.stateNode,t,2),l=Vt(l,t,2),l!==null&&(de(l,2),ft(l))}function x(l,t,u){if(l.tag===3)c1(l,l,u);else for(;t!==null;){if(t.tag===3){c1(t,l,u);break}else if(t.tag===1){var a=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(Kt===null||!Kt.has(a))){l=Zl(u,l),u=uv(2),a=Vt(t,u,2),a!==null&&(av(u,a,t,l),de(a,2),ft(a));break}}t=t.return}}function Yc(l,t,u){var a=l.pingCache;if(a===null){a=l.pingCache=new O2;var e=new Set;a.set(t,e)}else e=a.get(t),e===void 0&&(e=new Set,a.set(t,e));e.has(u)||(mi=!0,e.add(u),l=p2.bind(null,l,t,u),t.then(l,l))}function p2(l,t,u){var a=l.pingCache;a!==null&&a.delete(t),l.pingedLanes|=l.suspendedLanes&u,l.warmLanes&=~u,L===l&&(Y&u)===u&&(P===4||P===3&&(Y&62914560)===Y&&300>at()-gi?($&2)===0&&fa(l,0):ri|=u,ca===Y&&(ca=0)),ft(l)}function Qv(l,t){t===0&&(t=G1()),l=kt(l,t),l!==null&&(de(l,t),ft(l))}function N2(l){var t=l.memoizedState,u=0;t!==null&&(u=t.retryLane),Qv(l,u)}function B2(l,t){var u=0;switch(l.tag){case 13:var a=l.stateNode,e=l.memoizedState;e!==null&&(u=e.retryLane);break;case 19:a=l.stateNode;break;case 22:a=l.stateNode._retryCache;break;default:throw Error(g(314))}a!==null&&a.delete(t),Qv(l,u)}function q2(l,t){return Xf(l,t)}var Mn=null,qu=null,Df=!1,On=!1,Cc=!1,hu=0;function ft(l){l!==qu&&l.next===null&&(qu===null?Mn=qu=l:qu=qu.next=l),On=!0,Df||(Df=!0,C2(Y2))}function Se(l,t){if(!Cc&&On){Cc=!0;do for(var u=!1,a=Mn;a!==null;){if(!t)if(l!==0){var e=a.pendingLanes;if(e===0)var n=0;else{var c=a.suspendedLanes,f=a.pingedLanes;n=(1<<31-Rl(42|l)+1)-1,n&=e&~(c&~f),n=n&201326677?n&201326677|1:n?n|2:0}n!==0&&(u=!0,f1(a,n))}else n=Y,n=Bn(a,a===L?n:0),(n&3)===0||ve(a,n)||(u=!0,f1(a,n));a=a.next}while(u);Cc=!1}}function Y2(){On=Df=!1;var l=0;hu!==0&&(j2()&&(l=hu),hu=0);for(var t=at(),u=null,a=Mn;a!==null;){var e=a.next,n=xv(a,t);n===0?(a.next=null,u===null?Mn=e:u.next=e,e===null&&(qu=u)):(u=a,(l!==0||(n&3)!==0)&&(On=!0)),a=e}Se(l,!1)}function xv(l,t){for(var u=l.suspendedLanes,a=l.pingedLanes,e=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var c=31-Rl(n),f=1<<c,i=e[c];i===-1?((f&u)===0||(f&a)!==0)&&(e[c]=co(f,t)):i<=t&&(l.expiredLanes|=f),n&=~f}if(t=L,u=Y,u=Bn(l,l===t?u:0),a=l.callbackNode,u===0||l===t&&V===2||l.cancelPendingCommit!==null)return a!==null&&a!==null&&hc(a),l.callbackNode=null,l.callbackPriority=0;if((u&3)===0||ve(l,u)){if(t=u&-u,t===l.callbackPriority)return t;switch(a!==null&&hc(a),Z1(u)){case 2:case 8:u=Y1;break;case 32:u=fn;break;case 268435456:u=C1;break;default:u=fn}return a=Zv.bind(null,l),u=Xf(u,a),l.callbackPriority=t,l.callbackNode=u,t}return a!==null&&a!==null&&hc(a),l.callbackPriority=2,l.callbackNode=null,2}function Zv(l,t){var u=l.callbackNode;if(Iu()&&l.callbackNode!==u)return null;var a=Y;return a=Bn(l,l===L?a:0),a===0?null:(Nv(l,a,t),xv(l,at()),l.callbackNode!=null&&l.callbackNode===u?Zv.bind(null,l):null)}function f1(l,t){if(Iu())return null;Nv(l,t,!0)}function C2(l){L2(function(){($&6)!==0?Xf(q1,l):l()})}function bi(){return hu===0&&(hu=X1()),hu}function i1(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:we(""+l)}function s1(l,t){var u=t.ownerDocument.createElement("input");return u.name=t.name,u.value=t.value,l.id&&u.setAttribute("form",l.id),t.parentNode.insertBefore(u,t),l=new FormData(l),u.parentNode.removeChild(u),l}function X2(l,t,u,a,e){if(t==="submit"&&u&&u.stateNode===e){var n=i1((e[Al]||null).action),c=a.submitter;c&&(t=(t=c[Al]||null)?i1(t.formAction):c.getAttribute("formAction"),t!==null&&(n=t,c=null));var f=new qn("action","action",null,a,e);l.push({event:f,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(hu!==0){var i=c?s1(e,c):new FormData(e);ff(u,{pending:!0,data:i,method:e.method,action:n},null,i)}}else typeof n=="function"&&(f.preventDefault(),i=c?s1(e,c):new FormData(e),ff(u,{pending:!0,data:i,method:e.method,action:n},n,i))},currentTarget:e}]})}}for(Ze=0;Ze<R0.length;Ze++)je=R0[Ze],v1=je.toLowerCase(),d1=je[0].toUpperCase()+je.slice(1),Fl(v1,"on"+d1);var je,v1,d1,Ze;Fl(is,"onAnimationEnd");Fl(ss,"onAnimationIteration");Fl(vs,"onAnimationStart");Fl("dblclick","onDoubleClick");Fl("focusin","onFocus");Fl("focusout","onBlur");Fl(u2,"onTransitionRun");Fl(a2,"onTransitionStart");Fl(e2,"onTransitionCancel");Fl(ds,"onTransitionEnd");ta("onMouseEnter",["mouseout","mouseover"]);ta("onMouseLeave",["mouseout","mouseover"]);ta("onPointerEnter",["pointerout","pointerover"]);ta("onPointerLeave",["pointerout","pointerover"]);bu("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));bu("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));bu("onBeforeInput",["compositionend","keypress","textInput","paste"]);bu("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));bu("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));bu("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var ue="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),G2=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(ue));function jv(l,t){t=(t&4)!==0;for(var u=0;u<l.length;u++){var a=l[u],e=a.event;a=a.listeners;l:{var n=void 0;if(t)for(var c=a.length-1;0<=c;c--){var f=a[c],i=f.instance,s=f.currentTarget;if(f=f.listener,i!==n&&e.isPropagationStopped())break l;n=f,e.currentTarget=s;try{n(e)}catch(m){Sn(m)}e.currentTarget=null,n=i}else for(c=0;c<a.length;c++){if(f=a[c],i=f.instance,s=f.currentTarget,f=f.listener,i!==n&&e.isPropagationStopped())break l;n=f,e.currentTarget=s;try{n(e)}catch(m){Sn(m)}e.currentTarget=null,n=i}}}}function q(l,t){var u=t[Wc];u===void 0&&(u=t[Wc]=new Set);var a=l+"__bubble";u.has(a)||(Vv(t,l,2,!1),u.add(a))}function Xc(l,t,u){var a=0;t&&(a|=4),Vv(u,l,a,t)}var Ve="_reactListening"+Math.random().toString(36).slice(2);function Ei(l){if(!l[Ve]){l[Ve]=!0,V1.forEach(function(u){u!=="selectionchange"&&(G2.has(u)||Xc(u,!1,l),Xc(u,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[Ve]||(t[Ve]=!0,Xc("selectionchange",!1,t))}}function Vv(l,t,u,a){switch(td(t)){case 2:var e=vh;break;case 8:e=dh;break;default:e=Mi}u=e.bind(null,t,u,l),e=void 0,!Pc||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(e=!0),a?e!==void 0?l.addEventListener(t,u,{capture:!0,passive:e}):l.addEventListener(t,u,!0):e!==void 0?l.addEventListener(t,u,{passive:e}):l.addEventListener(t,u,!1)}function Gc(l,t,u,a,e){var n=a;if((t&1)===0&&(t&2)===0&&a!==null)l:for(;;){if(a===null)return;var c=a.tag;if(c===3||c===4){var f=a.stateNode.containerInfo;if(f===e||f.nodeType===8&&f.parentNode===e)break;if(c===4)for(c=a.return;c!==null;){var i=c.tag;if((i===3||i===4)&&(i=c.stateNode.containerInfo,i===e||i.nodeType===8&&i.parentNode===e))return;c=c.return}for(;f!==null;){if(c=cu(f),c===null)return;if(i=c.tag,i===5||i===6||i===26||i===27){a=n=c;continue l}f=f.parentNode}}a=a.return}F1(function(){var s=n,m=xf(u),S=[];l:{var h=os.get(l);if(h!==void 0){var y=qn,E=l;switch(l){case"keypress":if(ke(u)===0)break l;case"keydown":case"keyup":y=Bo;break;case"focusin":E="focus",y=Sc;break;case"focusout":E="blur",y=Sc;break;case"beforeblur":case"afterblur":y=Sc;break;case"click":if(u.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":y=b0;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":y=To;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":y=Co;break;case is:case ss:case vs:y=Mo;break;case ds:y=Go;break;case"scroll":case"scrollend":y=bo;break;case"wheel":y=xo;break;case"copy":case"cut":case"paste":y=Do;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":y=T0;break;case"toggle":case"beforetoggle":y=jo}var O=(t&4)!==0,Z=!O&&(l==="scroll"||l==="scrollend"),d=O?h!==null?h+"Capture":null:h;O=[];for(var v=s,o;v!==null;){var r=v;if(o=r.stateNode,r=r.tag,r!==5&&r!==26&&r!==27||o===null||d===null||(r=$a(v,d),r!=null&&O.push(ae(v,r,o))),Z)break;v=v.return}0<O.length&&(h=new y(h,E,null,u,m),S.push({event:h,listeners:O}))}}if((t&7)===0){l:{if(h=l==="mouseover"||l==="pointerover",y=l==="mouseout"||l==="pointerout",h&&u!==Fc&&(E=u.relatedTarget||u.fromElement)&&(cu(E)||E[va]))break l;if((y||h)&&(h=m.window===m?m:(h=m.ownerDocument)?h.defaultView||h.parentWindow:window,y?(E=u.relatedTarget||u.toElement,y=s,E=E?cu(E):null,E!==null&&(Z=sa(E),O=E.tag,E!==Z||O!==5&&O!==27&&O!==6)&&(E=null)):(y=null,E=s),y!==E)){if(O=b0,r="onMouseLeave",d="onMouseEnter",v="mouse",(l==="pointerout"||l==="pointerover")&&(O=T0,r="onPointerLeave",d="onPointerEnter",v="pointer"),Z=y==null?h:pa(y),o=E==null?h:pa(E),h=new O(r,v+"leave",y,u,m),h.target=Z,h.relatedTarget=o,r=null,cu(m)===s&&(O=new O(d,v+"enter",E,u,m),O.target=o,O.relatedTarget=Z,r=O),Z=r,y&&E)t:{for(O=y,d=E,v=0,o=O;o;o=pu(o))v++;for(o=0,r=d;r;r=pu(r))o++;for(;0<v-o;)O=pu(O),v--;for(;0<o-v;)d=pu(d),o--;for(;v--;){if(O===d||d!==null&&O===d.alternate)break t;O=pu(O),d=pu(d)}O=null}else O=null;y!==null&&o1(S,h,y,O,!1),E!==null&&Z!==null&&o1(S,Z,E,O,!0)}}l:{if(h=s?pa(s):window,y=h.nodeName&&h.nodeName.toLowerCase(),y==="select"||y==="input"&&h.type==="file")var b=O0;else if(M0(h))if(as)b=Po;else{b=$o;var H=ko}else y=h.nodeName,!y||y.toLowerCase()!=="input"||h.type!=="checkbox"&&h.type!=="radio"?s&&Qf(s.elementType)&&(b=O0):b=Fo;if(b&&(b=b(l,s))){us(S,b,u,m);break l}H&&H(l,h,s),l==="focusout"&&s&&h.type==="number"&&s.memoizedProps.value!=null&&$c(h,"number",h.value)}switch(H=s?pa(s):window,l){case"focusin":(M0(H)||H.contentEditable==="true")&&(Qu=H,Ic=s,Ya=null);break;case"focusout":Ya=Ic=Qu=null;break;case"mousedown":lf=!0;break;case"contextmenu":case"mouseup":case"dragend":lf=!1,H0(S,u,m);break;case"selectionchange":if(t2)break;case"keydown":case"keyup":H0(S,u,m)}var z;if(Vf)l:{switch(l){case"compositionstart":var M="onCompositionStart";break l;case"compositionend":M="onCompositionEnd";break l;case"compositionupdate":M="onCompositionUpdate";break l}M=void 0}else Gu?ls(l,u)&&(M="onCompositionEnd"):l==="keydown"&&u.keyCode===229&&(M="onCompositionStart");M&&(I1&&u.locale!=="ko"&&(Gu||M!=="onCompositionStart"?M==="onCompositionEnd"&&Gu&&(z=P1()):(xt=m,Zf="value"in xt?xt.value:xt.textContent,Gu=!0)),H=Dn(s,M),0<H.length&&(M=new E0(M,l,null,u,m),S.push({event:M,listeners:H}),z?M.data=z:(z=ts(u),z!==null&&(M.data=z)))),(z=Lo?Ko(l,u):Jo(l,u))&&(M=Dn(s,"onBeforeInput"),0<M.length&&(H=new E0("onBeforeInput","beforeinput",null,u,m),S.push({event:H,listeners:M}),H.data=z)),X2(S,l,s,u,m)}jv(S,t)})}function ae(l,t,u){return{instance:l,listener:t,currentTarget:u}}function Dn(l,t){for(var u=t+"Capture",a=[];l!==null;){var e=l,n=e.stateNode;e=e.tag,e!==5&&e!==26&&e!==27||n===null||(e=$a(l,u),e!=null&&a.unshift(ae(l,e,n)),e=$a(l,t),e!=null&&a.push(ae(l,e,n))),l=l.return}return a}function pu(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function o1(l,t,u,a,e){for(var n=t._reactName,c=[];u!==null&&u!==a;){var f=u,i=f.alternate,s=f.stateNode;if(f=f.tag,i!==null&&i===a)break;f!==5&&f!==26&&f!==27||s===null||(i=s,e?(s=$a(u,n),s!=null&&c.unshift(ae(u,s,i))):e||(s=$a(u,n),s!=null&&c.push(ae(u,s,i)))),u=u.return}c.length!==0&&l.push({event:t,listeners:c})}var Q2=/\r\n?/g,x2=/\u0000|\uFFFD/g;function h1(l){return(typeof l=="string"?l:""+l).replace(Q2,`
-`).replace(x2,"")}function Lv(l,t){return t=h1(t),h1(l)===t}function Kn(){}function X(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||ua(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&ua(l,""+a);break;case"className":pe(l,"class",a);break;case"tabIndex":pe(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":pe(l,u,a);break;case"style":$1(l,a,n);break;case"data":if(t!=="object"){pe(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=we(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&X(l,t,"name",e.name,e,null),X(l,t,"formEncType",e.formEncType,e,null),X(l,t,"formMethod",e.formMethod,e,null),X(l,t,"formTarget",e.formTarget,e,null)):(X(l,t,"encType",e.encType,e,null),X(l,t,"method",e.method,e,null),X(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=we(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Kn);break;case"onScroll":a!=null&&q("scroll",l);break;case"onScrollEnd":a!=null&&q("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(g(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(g(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=we(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":q("beforetoggle",l),q("toggle",l),Je(l,"popover",a);break;case"xlinkActuate":it(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":it(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":it(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":it(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":it(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":it(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":it(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":it(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":it(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Je(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=go.get(u)||u,Je(l,u,a))}}function _f(l,t,u,a,e,n){switch(u){case"style":$1(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(g(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(g(60));l.innerHTML=u}}break;case"children":typeof a=="string"?ua(l,a):(typeof a=="number"||typeof a=="bigint")&&ua(l,""+a);break;case"onScroll":a!=null&&q("scroll",l);break;case"onScrollEnd":a!=null&&q("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Kn);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!L1.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[Al]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):Je(l,u,a)}}}function hl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":q("error",l),q("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var c=u[n];if(c!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(g(137,t));default:X(l,t,n,c,u,null)}}e&&X(l,t,"srcSet",u.srcSet,u,null),a&&X(l,t,"src",u.src,u,null);return;case"input":q("invalid",l);var f=n=c=e=null,i=null,s=null;for(a in u)if(u.hasOwnProperty(a)){var m=u[a];if(m!=null)switch(a){case"name":e=m;break;case"type":c=m;break;case"checked":i=m;break;case"defaultChecked":s=m;break;case"value":n=m;break;case"defaultValue":f=m;break;case"children":case"dangerouslySetInnerHTML":if(m!=null)throw Error(g(137,t));break;default:X(l,t,a,m,u,null)}}w1(l,n,f,i,s,c,e,!1),sn(l);return;case"select":q("invalid",l),a=c=n=null;for(e in u)if(u.hasOwnProperty(e)&&(f=u[e],f!=null))switch(e){case"value":n=f;break;case"defaultValue":c=f;break;case"multiple":a=f;default:X(l,t,e,f,u,null)}t=n,u=c,l.multiple=!!a,t!=null?wu(l,!!a,t,!1):u!=null&&wu(l,!!a,u,!0);return;case"textarea":q("invalid",l),n=e=a=null;for(c in u)if(u.hasOwnProperty(c)&&(f=u[c],f!=null))switch(c){case"value":a=f;break;case"defaultValue":e=f;break;case"children":n=f;break;case"dangerouslySetInnerHTML":if(f!=null)throw Error(g(91));break;default:X(l,t,c,f,u,null)}k1(l,a,e,n),sn(l);return;case"option":for(i in u)if(u.hasOwnProperty(i)&&(a=u[i],a!=null))switch(i){case"selected":l.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:X(l,t,i,a,u,null)}return;case"dialog":q("cancel",l),q("close",l);break;case"iframe":case"object":q("load",l);break;case"video":case"audio":for(a=0;a<ue.length;a++)q(ue[a],l);break;case"image":q("error",l),q("load",l);break;case"details":q("toggle",l);break;case"embed":case"source":case"link":q("error",l),q("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(s in u)if(u.hasOwnProperty(s)&&(a=u[s],a!=null))switch(s){case"children":case"dangerouslySetInnerHTML":throw Error(g(137,t));default:X(l,t,s,a,u,null)}return;default:if(Qf(t)){for(m in u)u.hasOwnProperty(m)&&(a=u[m],a!==void 0&&_f(l,t,m,a,u,void 0));return}}for(f in u)u.hasOwnProperty(f)&&(a=u[f],a!=null&&X(l,t,f,a,u,null))}function Z2(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,c=null,f=null,i=null,s=null,m=null;for(y in u){var S=u[y];if(u.hasOwnProperty(y)&&S!=null)switch(y){case"checked":break;case"value":break;case"defaultValue":i=S;default:a.hasOwnProperty(y)||X(l,t,y,null,a,S)}}for(var h in a){var y=a[h];if(S=u[h],a.hasOwnProperty(h)&&(y!=null||S!=null))switch(h){case"type":n=y;break;case"name":e=y;break;case"checked":s=y;break;case"defaultChecked":m=y;break;case"value":c=y;break;case"defaultValue":f=y;break;case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(g(137,t));break;default:y!==S&&X(l,t,h,y,a,S)}}kc(l,c,f,i,s,m,n,e);return;case"select":y=c=f=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":y=i;default:a.hasOwnProperty(n)||X(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":f=n;break;case"multiple":c=n;default:n!==i&&X(l,t,e,n,a,i)}t=f,u=c,a=y,h!=null?wu(l,!!u,h,!1):!!a!=!!u&&(t!=null?wu(l,!!u,t,!0):wu(l,!!u,u?[]:"",!1));return;case"textarea":y=h=null;for(f in u)if(e=u[f],u.hasOwnProperty(f)&&e!=null&&!a.hasOwnProperty(f))switch(f){case"value":break;case"children":break;default:X(l,t,f,null,a,e)}for(c in a)if(e=a[c],n=u[c],a.hasOwnProperty(c)&&(e!=null||n!=null))switch(c){case"value":h=e;break;case"defaultValue":y=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(g(91));break;default:e!==n&&X(l,t,c,e,a,n)}W1(l,h,y);return;case"option":for(var E in u)if(h=u[E],u.hasOwnProperty(E)&&h!=null&&!a.hasOwnProperty(E))switch(E){case"selected":l.selected=!1;break;default:X(l,t,E,null,a,h)}for(i in a)if(h=a[i],y=u[i],a.hasOwnProperty(i)&&h!==y&&(h!=null||y!=null))switch(i){case"selected":l.selected=h&&typeof h!="function"&&typeof h!="symbol";break;default:X(l,t,i,h,a,y)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var O in u)h=u[O],u.hasOwnProperty(O)&&h!=null&&!a.hasOwnProperty(O)&&X(l,t,O,null,a,h);for(s in a)if(h=a[s],y=u[s],a.hasOwnProperty(s)&&h!==y&&(h!=null||y!=null))switch(s){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(g(137,t));break;default:X(l,t,s,h,a,y)}return;default:if(Qf(t)){for(var Z in u)h=u[Z],u.hasOwnProperty(Z)&&h!==void 0&&!a.hasOwnProperty(Z)&&_f(l,t,Z,void 0,a,h);for(m in a)h=a[m],y=u[m],!a.hasOwnProperty(m)||h===y||h===void 0&&y===void 0||_f(l,t,m,h,a,y);return}}for(var d in u)h=u[d],u.hasOwnProperty(d)&&h!=null&&!a.hasOwnProperty(d)&&X(l,t,d,null,a,h);for(S in a)h=a[S],y=u[S],!a.hasOwnProperty(S)||h===y||h==null&&y==null||X(l,t,S,h,a,y)}var Uf=null,Hf=null;function _n(l){return l.nodeType===9?l:l.ownerDocument}function y1(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Kv(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Rf(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Qc=null;function j2(){var l=window.event;return l&&l.type==="popstate"?l===Qc?!1:(Qc=l,!0):(Qc=null,!1)}var Jv=typeof setTimeout=="function"?setTimeout:void 0,V2=typeof clearTimeout=="function"?clearTimeout:void 0,m1=typeof Promise=="function"?Promise:void 0,L2=typeof queueMicrotask=="function"?queueMicrotask:typeof m1<"u"?function(l){return m1.resolve(null).then(l).catch(K2)}:Jv;function K2(l){setTimeout(function(){throw l})}function xc(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"){if(a===0){l.removeChild(e),ie(t);return}a--}else u!=="$"&&u!=="$?"&&u!=="$!"||a++;u=e}while(u);ie(t)}function pf(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":pf(u),Gf(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function J2(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[ka])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=$l(l.nextSibling),l===null)break}return null}function w2(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=$l(l.nextSibling),l===null))return null;return l}function $l(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="F!"||t==="F")break;if(t==="/$")return null}}return l}function r1(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"){if(t===0)return l;t--}else u==="/$"&&t++}l=l.previousSibling}return null}function wv(l,t,u){switch(t=_n(u),l){case"html":if(l=t.documentElement,!l)throw Error(g(452));return l;case"head":if(l=t.head,!l)throw Error(g(453));return l;case"body":if(l=t.body,!l)throw Error(g(454));return l;default:throw Error(g(451))}}var Kl=new Map,g1=new Set;function Un(l){return typeof l.getRootNode=="function"?l.getRootNode():l.ownerDocument}var Ot=K.d;K.d={f:W2,r:k2,D:$2,C:F2,L:P2,m:I2,X:th,S:lh,M:uh};function W2(){var l=Ot.f(),t=Vn();return l||t}function k2(l){var t=da(l);t!==null&&t.tag===5&&t.type==="form"?ws(t):Ot.r(l)}var ha=typeof document>"u"?null:document;function Wv(l,t,u){var a=ha;if(a&&typeof t=="string"&&t){var e=xl(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),g1.has(e)||(g1.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),hl(t,"link",l),fl(t),a.head.appendChild(t)))}}function $2(l){Ot.D(l),Wv("dns-prefetch",l,null)}function F2(l,t){Ot.C(l,t),Wv("preconnect",l,t)}function P2(l,t,u){Ot.L(l,t,u);var a=ha;if(a&&l&&t){var e='link[rel="preload"][as="'+xl(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+xl(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+xl(u.imageSizes)+'"]')):e+='[href="'+xl(l)+'"]';var n=e;switch(t){case"style":n=ia(l);break;case"script":n=ya(l)}Kl.has(n)||(l=J({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),Kl.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(be(n))||t==="script"&&a.querySelector(Ee(n))||(t=a.createElement("link"),hl(t,"link",l),fl(t),a.head.appendChild(t)))}}function I2(l,t){Ot.m(l,t);var u=ha;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+xl(a)+'"][href="'+xl(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=ya(l)}if(!Kl.has(n)&&(l=J({rel:"modulepreload",href:l},t),Kl.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(Ee(n)))return}a=u.createElement("link"),hl(a,"link",l),fl(a),u.head.appendChild(a)}}}function lh(l,t,u){Ot.S(l,t,u);var a=ha;if(a&&l){var e=Ju(a).hoistableStyles,n=ia(l);t=t||"default";var c=e.get(n);if(!c){var f={loading:0,preload:null};if(c=a.querySelector(be(n)))f.loading=5;else{l=J({rel:"stylesheet",href:l,"data-precedence":t},u),(u=Kl.get(n))&&Ti(l,u);var i=c=a.createElement("link");fl(i),hl(i,"link",l),i._p=new Promise(function(s,m){i.onload=s,i.onerror=m}),i.addEventListener("load",function(){f.loading|=1}),i.addEventListener("error",function(){f.loading|=2}),f.loading|=4,tn(c,t,a)}c={type:"stylesheet",instance:c,count:1,state:f},e.set(n,c)}}}function th(l,t){Ot.X(l,t);var u=ha;if(u&&l){var a=Ju(u).hoistableScripts,e=ya(l),n=a.get(e);n||(n=u.querySelector(Ee(e)),n||(l=J({src:l,async:!0},t),(t=Kl.get(e))&&zi(l,t),n=u.createElement("script"),fl(n),hl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function uh(l,t){Ot.M(l,t);var u=ha;if(u&&l){var a=Ju(u).hoistableScripts,e=ya(l),n=a.get(e);n||(n=u.querySelector(Ee(e)),n||(l=J({src:l,async:!0,type:"module"},t),(t=Kl.get(e))&&zi(l,t),n=u.createElement("script"),fl(n),hl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function S1(l,t,u,a){var e=(e=Zt.current)?Un(e):null;if(!e)throw Error(g(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=ia(u.href),u=Ju(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=ia(u.href);var n=Ju(e).hoistableStyles,c=n.get(l);if(c||(e=e.ownerDocument||e,c={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,c),(n=e.querySelector(be(l)))&&!n._p&&(c.instance=n,c.state.loading=5),Kl.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},Kl.set(l,u),n||ah(e,l,u,c.state))),t&&a===null)throw Error(g(528,""));return c}if(t&&a!==null)throw Error(g(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=ya(u),u=Ju(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(g(444,l))}}function ia(l){return'href="'+xl(l)+'"'}function be(l){return'link[rel="stylesheet"]['+l+"]"}function kv(l){return J({},l,{"data-precedence":l.precedence,precedence:null})}function ah(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),hl(t,"link",u),fl(t),l.head.appendChild(t))}function ya(l){return'[src="'+xl(l)+'"]'}function Ee(l){return"script[async]"+l}function b1(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+xl(u.href)+'"]');if(a)return t.instance=a,fl(a),a;var e=J({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),fl(a),hl(a,"style",e),tn(a,u.precedence,l),t.instance=a;case"stylesheet":e=ia(u.href);var n=l.querySelector(be(e));if(n)return t.state.loading|=4,t.instance=n,fl(n),n;a=kv(u),(e=Kl.get(e))&&Ti(a,e),n=(l.ownerDocument||l).createElement("link"),fl(n);var c=n;return c._p=new Promise(function(f,i){c.onload=f,c.onerror=i}),hl(n,"link",a),t.state.loading|=4,tn(n,u.precedence,l),t.instance=n;case"script":return n=ya(u.src),(e=l.querySelector(Ee(n)))?(t.instance=e,fl(e),e):(a=u,(e=Kl.get(n))&&(a=J({},u),zi(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),fl(e),hl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(g(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,tn(a,u.precedence,l));return t.instance}function tn(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,c=0;c<a.length;c++){var f=a[c];if(f.dataset.precedence===t)n=f;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function Ti(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function zi(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var un=null;function E1(l,t,u){if(un===null){var a=new Map,e=un=new Map;e.set(u,a)}else e=un,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[ka]||n[ml]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var c=n.getAttribute(t)||"";c=l+c;var f=a.get(c);f?f.push(n):a.set(c,[n])}}return a}function T1(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function eh(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function $v(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}var ee=null;function nh(){}function ch(l,t,u){if(ee===null)throw Error(g(475));var a=ee;if(t.type==="stylesheet"&&(typeof u.media!="string"||matchMedia(u.media).matches!==!1)&&(t.state.loading&4)===0){if(t.instance===null){var e=ia(u.href),n=l.querySelector(be(e));if(n){l=n._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(a.count++,a=Hn.bind(a),l.then(a,a)),t.state.loading|=4,t.instance=n,fl(n);return}n=l.ownerDocument||l,u=kv(u),(e=Kl.get(e))&&Ti(u,e),n=n.createElement("link"),fl(n);var c=n;c._p=new Promise(function(f,i){c.onload=f,c.onerror=i}),hl(n,"link",u),t.instance=n}a.stylesheets===null&&(a.stylesheets=new Map),a.stylesheets.set(t,l),(l=t.state.preload)&&(t.state.loading&3)===0&&(a.count++,t=Hn.bind(a),l.addEventListener("load",t),l.addEventListener("error",t))}}function fh(){if(ee===null)throw Error(g(475));var l=ee;return l.stylesheets&&l.count===0&&Nf(l,l.stylesheets),0<l.count?function(t){var u=setTimeout(function(){if(l.stylesheets&&Nf(l,l.stylesheets),l.unsuspend){var a=l.unsuspend;l.unsuspend=null,a()}},6e4);return l.unsuspend=t,function(){l.unsuspend=null,clearTimeout(u)}}:null}function Hn(){if(this.count--,this.count===0){if(this.stylesheets)Nf(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Rn=null;function Nf(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Rn=new Map,t.forEach(ih,l),Rn=null,Hn.call(l))}function ih(l,t){if(!(t.state.loading&4)){var u=Rn.get(l);if(u)var a=u.get(null);else{u=new Map,Rn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var c=e[n];(c.nodeName==="LINK"||c.getAttribute("media")!=="not all")&&(u.set(c.dataset.precedence,c),a=c)}a&&u.set(null,a)}e=t.instance,c=e.getAttribute("data-precedence"),n=u.get(c)||a,n===a&&u.set(null,e),u.set(c,e),this.count++,a=Hn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var ne={$$typeof:mt,Provider:null,Consumer:null,_currentValue:iu,_currentValue2:iu,_threadCount:0};function sh(l,t,u,a,e,n,c,f){this.tag=1,this.containerInfo=l,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=yc(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.finishedLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=yc(0),this.hiddenUpdates=yc(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=c,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function Fv(l,t,u,a,e,n,c,f,i,s,m,S){return l=new sh(l,t,u,c,f,i,s,S),t=1,n===!0&&(t|=24),n=jl(3,null,null,t),l.current=n,n.stateNode=l,t=$f(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},di(n),l}function Pv(l){return l?(l=ju,l):ju}function Iv(l,t,u,a,e,n){e=Pv(e),a.context===null?a.context=e:a.pendingContext=e,a=jt(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=Vt(l,a,t),u!==null&&(El(u,l,t),Za(u,l,t))}function z1(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Ai(l,t){z1(l,t),(l=l.alternate)&&z1(l,t)}function ld(l){if(l.tag===13){var t=kt(l,67108864);t!==null&&El(t,l,67108864),Ai(l,67108864)}}var pn=!0;function vh(l,t,u,a){var e=U.T;U.T=null;var n=K.p;try{K.p=2,Mi(l,t,u,a)}finally{K.p=n,U.T=e}}function dh(l,t,u,a){var e=U.T;U.T=null;var n=K.p;try{K.p=8,Mi(l,t,u,a)}finally{K.p=n,U.T=e}}function Mi(l,t,u,a){if(pn){var e=Bf(a);if(e===null)Gc(l,t,a,Nn,u),A1(l,a);else if(hh(e,l,t,u,a))a.stopPropagation();else if(A1(l,a),t&4&&-1<oh.indexOf(l)){for(;e!==null;){var n=da(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var c=au(n.pendingLanes);if(c!==0){var f=n;for(f.pendingLanes|=2,f.entangledLanes|=2;c;){var i=1<<31-Rl(c);f.entanglements[1]|=i,c&=~i}ft(n),($&6)===0&&(zn=at()+500,Se(0,!1))}}break;case 13:f=kt(n,2),f!==null&&El(f,n,2),Vn(),Ai(n,2)}if(n=Bf(a),n===null&&Gc(l,t,a,Nn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Gc(l,t,a,null,u)}}function Bf(l){return l=xf(l),Oi(l)}var Nn=null;function Oi(l){if(Nn=null,l=cu(l),l!==null){var t=sa(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=N1(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Nn=l,null}function td(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Pd()){case q1:return 2;case Y1:return 8;case fn:case Id:return 32;case C1:return 268435456;default:return 32}default:return 32}}var qf=!1,Jt=null,wt=null,Wt=null,ce=new Map,fe=new Map,Gt=[],oh="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function A1(l,t){switch(l){case"focusin":case"focusout":Jt=null;break;case"dragenter":case"dragleave":wt=null;break;case"mouseover":case"mouseout":Wt=null;break;case"pointerover":case"pointerout":ce.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":fe.delete(t.pointerId)}}function Da(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=da(t),t!==null&&ld(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function hh(l,t,u,a,e){switch(t){case"focusin":return Jt=Da(Jt,l,t,u,a,e),!0;case"dragenter":return wt=Da(wt,l,t,u,a,e),!0;case"mouseover":return Wt=Da(Wt,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return ce.set(n,Da(ce.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,fe.set(n,Da(fe.get(n)||null,l,t,u,a,e)),!0}return!1}function ud(l){var t=cu(l.target);if(t!==null){var u=sa(t);if(u!==null){if(t=u.tag,t===13){if(t=N1(u),t!==null){l.blockedOn=t,io(l.priority,function(){if(u.tag===13){var a=pl(),e=kt(u,a);e!==null&&El(e,u,a),Ai(u,a)}});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function an(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=Bf(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);Fc=a,u.target.dispatchEvent(a),Fc=null}else return t=da(u),t!==null&&ld(t),l.blockedOn=u,!1;t.shift()}return!0}function M1(l,t,u){an(l)&&u.delete(t)}function yh(){qf=!1,Jt!==null&&an(Jt)&&(Jt=null),wt!==null&&an(wt)&&(wt=null),Wt!==null&&an(Wt)&&(Wt=null),ce.forEach(M1),fe.forEach(M1)}function Le(l,t){l.blockedOn===t&&(l.blockedOn=null,qf||(qf=!0,nl.unstable_scheduleCallback(nl.unstable_NormalPriority,yh)))}var Ke=null;function O1(l){Ke!==l&&(Ke=l,nl.unstable_scheduleCallback(nl.unstable_NormalPriority,function(){Ke===l&&(Ke=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(Oi(a||u)===null)continue;break}var n=da(u);n!==null&&(l.splice(t,3),t-=3,ff(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function ie(l){function t(i){return Le(i,l)}Jt!==null&&Le(Jt,l),wt!==null&&Le(wt,l),Wt!==null&&Le(Wt,l),ce.forEach(t),fe.forEach(t);for(var u=0;u<Gt.length;u++){var a=Gt[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<Gt.length&&(u=Gt[0],u.blockedOn===null);)ud(u),u.blockedOn===null&&Gt.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],c=e[Al]||null;if(typeof n=="function")c||O1(u);else if(c){var f=null;if(n&&n.hasAttribute("formAction")){if(e=n,c=n[Al]||null)f=c.formAction;else if(Oi(e)!==null)continue}else f=c.action;typeof f=="function"?u[a+1]=f:(u.splice(a,3),a-=3),O1(u)}}}function Di(l){this._internalRoot=l}Jn.prototype.render=Di.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(g(409));var u=t.current,a=pl();Iv(u,a,l,t,null,null)};Jn.prototype.unmount=Di.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;l.tag===0&&Iu(),Iv(l.current,2,null,l,null,null),Vn(),t[va]=null}};function Jn(l){this._internalRoot=l}Jn.prototype.unstable_scheduleHydration=function(l){if(l){var t=j1();l={blockedOn:null,target:l,priority:t};for(var u=0;u<Gt.length&&t!==0&&t<Gt[u].priority;u++);Gt.splice(u,0,l),u===0&&ud(l)}};var D1=_1.version;if(D1!=="19.0.0")throw Error(g(527,D1,"19.0.0"));K.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(g(188)):(l=Object.keys(l).join(","),Error(g(268,l)));return l=kd(t),l=l!==null?B1(l):null,l=l===null?null:l.stateNode,l};var mh={bundleType:0,version:"19.0.0",rendererPackageName:"react-dom",currentDispatcherRef:U,findFiberByHostInstance:cu,reconcilerVersion:"19.0.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"&&(_a=__REACT_DEVTOOLS_GLOBAL_HOOK__,!_a.isDisabled&&_a.supportsFiber))try{se=_a.inject(mh),Hl=_a}catch{}var _a;wn.createRoot=function(l,t){if(!U1(l))throw Error(g(299));var u=!1,a="",e=Is,n=lv,c=tv,f=null;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(c=t.onRecoverableError),t.unstable_transitionCallbacks!==void 0&&(f=t.unstable_transitionCallbacks)),t=Fv(l,1,!1,null,null,u,a,e,n,c,f,null),l[va]=t.current,Ei(l.nodeType===8?l.parentNode:l),new Di(t)};wn.hydrateRoot=function(l,t,u){if(!U1(l))throw Error(g(299));var a=!1,e="",n=Is,c=lv,f=tv,i=null,s=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(c=u.onCaughtError),u.onRecoverableError!==void 0&&(f=u.onRecoverableError),u.unstable_transitionCallbacks!==void 0&&(i=u.unstable_transitionCallbacks),u.formState!==void 0&&(s=u.formState)),t=Fv(l,1,!0,t,u??null,a,e,n,c,f,i,s),t.context=Pv(null),u=t.current,a=pl(),e=jt(a),e.callback=null,Vt(u,e,a),t.current.lanes=a,de(t,a),ft(t),l[va]=t.current,Ei(l),new Jn(t)};wn.version="19.0.0"});var cd=Ut((Hh,nd)=>{"use strict";function ed(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(ed)}catch(l){console.error(l)}}ed(),nd.exports=ad()});var Ol=$n(ma(),1),fd=$n(cd(),1),id=Ol.createContext(null);function rh(){let l=Ol.useContext(id);if(!l)throw new Error("RenderContext not found");return l}function gh(){return rh().model}function Pl(l){let t=gh(),[u,a]=Ol.useState(t.get(l));return Ol.useEffect(()=>{let e=()=>a(t.get(l));return t.on(`change:${l}`,e),()=>t.off(`change:${l}`,e)},[t,l]),[u,e=>{t.set(l,e),t.save_changes()}]}function sd(l){return({el:t,model:u,experimental:a})=>{let e=fd.createRoot(t);return e.render(Ol.createElement(Ol.StrictMode,null,Ol.createElement(id.Provider,{value:{model:u,experimental:a}},Ol.createElement(l)))),()=>e.unmount()}}var A=$n(ma()),Sh=20;function bh(){let l=(0,A.useRef)(null),[t,u]=(0,A.useState)(!1),[a,e]=(0,A.useState)("brush"),[n,c]=(0,A.useState)(8),[f,i]=(0,A.useState)(20),[s,m]=(0,A.useState)(14),[S,h]=Pl("base64"),[y]=Pl("height"),[E]=Pl("width"),[O]=Pl("store_background"),[Z]=Pl("rainbow_brush"),[d]=Pl("brush"),[v]=Pl("marker"),[o]=Pl("eraser"),[r]=Pl("color_picker"),[b,H]=Pl("color"),z=(0,A.useRef)(""),M=(0,A.useRef)(""),j=(0,A.useRef)(!1),[B,Tl]=(0,A.useState)(0),Ou=(0,A.useRef)([]),[vd,Wn]=(0,A.useState)(0);(0,A.useEffect)(()=>{z.current=S},[]);let Du=()=>l.current?.getContext("2d")??null;(0,A.useEffect)(()=>{Ou.current=[],Wn(0)},[E,y]),(0,A.useEffect)(()=>{let T={brush:d,marker:v,eraser:o,rainbow:Z};if(T[a])return;let D=["brush","marker","eraser","rainbow"].find(_=>T[_]);D&&e(D)},[a,d,v,o,Z]),(0,A.useEffect)(()=>{let T=l.current;if(!T)return;let D=Jl=>{Jl.preventDefault();let Dt=Jl.touches[0],_t=T.getBoundingClientRect();Hi(Dt.clientX-_t.left,Dt.clientY-_t.top)},_=Jl=>{Jl.preventDefault();let Dt=Jl.touches[0],_t=T.getBoundingClientRect();Ri(Dt.clientX-_t.left,Dt.clientY-_t.top)},vl=Jl=>{Jl.preventDefault(),kn()};return T.addEventListener("touchstart",D,{passive:!1}),T.addEventListener("touchmove",_,{passive:!1}),T.addEventListener("touchend",vl,{passive:!1}),()=>{T.removeEventListener("touchstart",D),T.removeEventListener("touchmove",_),T.removeEventListener("touchend",vl)}},[]),(0,A.useEffect)(()=>{let T=Du();if(!T||!l.current||!S||E===0||y===0)return;if(S===M.current){let _=l.current;if(_.width>0&&_.height>0)try{if(T.getImageData(0,0,_.width,_.height).data.some(Jl=>Jl!==0))return}catch{}}j.current=!0;let D=new Image;D.onload=()=>{T.clearRect(0,0,l.current.width,l.current.height),T.drawImage(D,0,0,l.current.width,l.current.height),M.current=S,j.current=!1},D.onerror=()=>{j.current=!1},D.src=`data:image/png;base64,${S}`},[S,E,y]),(0,A.useEffect)(()=>{if(!l.current||B===0||j.current)return;let T=document.createElement("canvas");T.width=l.current.width,T.height=l.current.height;let D=T.getContext("2d",{alpha:!0});if(D){D.clearRect(0,0,T.width,T.height),O&&(D.fillStyle="#FFFFFF",D.fillRect(0,0,T.width,T.height)),D.globalCompositeOperation="source-over",D.drawImage(l.current,0,0);try{let _=T.toDataURL("image/png");h(_.split(",")[1])}catch{}}},[O,E,y,B]);let _i=()=>{let T=Du(),D=l.current;if(!T||!D||D.width===0||D.height===0)return;let _=T.getImageData(0,0,D.width,D.height),vl=Ou.current;vl.length>=Sh&&vl.shift(),vl.push(_),Wn(vl.length)},dd=()=>{let T=Du(),D=l.current;if(!T||!D)return;let _=Ou.current.pop();_&&(T.putImageData(_,0,0),Wn(Ou.current.length),Tl(vl=>vl+1))},od=()=>{let T=Du(),D=l.current;if(!(!T||!D))if(_i(),T.clearRect(0,0,D.width,D.height),z.current){j.current=!0;let _=new Image;_.onload=()=>{T.drawImage(_,0,0,D.width,D.height),j.current=!1,Tl(vl=>vl+1)},_.onerror=()=>{j.current=!1,Tl(vl=>vl+1)},_.src=`data:image/png;base64,${z.current}`}else Tl(_=>_+1)},Ui=(T,D,_,vl)=>{let Jl=Math.max(6,Math.round(vl*.9));for(let Dt=0;Dt<Jl;Dt++){let _t=Math.random()*Math.PI*2,pi=Math.random()*vl,rd=D+Math.cos(_t)*pi,gd=_+Math.sin(_t)*pi;T.fillStyle=`hsl(${Math.random()*360}, 90%, 55%)`,T.beginPath(),T.arc(rd,gd,1.5,0,Math.PI*2),T.fill()}},Hi=(T,D)=>{let _=Du();_&&(_i(),_.beginPath(),_.moveTo(T,D),u(!0),a==="rainbow"&&Ui(_,T,D,s))},Ri=(T,D)=>{if(!t)return;let _=Du();if(_){if(a==="rainbow"){Ui(_,T,D,s);return}_.lineTo(T,D),a==="eraser"?(_.save(),_.globalCompositeOperation="destination-out",_.strokeStyle="#000000",_.lineWidth=f,_.lineCap="round",_.stroke(),_.restore()):(_.strokeStyle=b,_.lineWidth=a==="marker"?n:2,_.lineCap="round",_.stroke())}},kn=()=>{t&&(Tl(T=>T+1),u(!1))},hd=T=>{let D=T.currentTarget.getBoundingClientRect();Hi(T.clientX-D.left,T.clientY-D.top)},yd=T=>{let D=T.currentTarget.getBoundingClientRect();Ri(T.clientX-D.left,T.clientY-D.top)},md=O?"#ffffff":"repeating-conic-gradient(#d0d0d0 0% 25%, #f0f0f0 0% 50%) 0 0 / 16px 16px";return A.default.createElement("div",{className:"paint-container",style:{width:`${E}px`}},A.default.createElement("div",{className:"paint-toolbar"},A.default.createElement("div",{className:"paint-tool-group"},d&&A.default.createElement("button",{className:a==="brush"?"active":"",onClick:()=>e("brush"),title:"Brush (thin)"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 100 100",fill:"currentColor"},A.default.createElement("path",{d:"m63.688 6c-0.56641 0.089844-1.0664 0.42188-1.375 0.90625l-34 52c-0.20703 0.32812-0.31641 0.70703-0.3125 1.0938v7.4375l-6.7188 11.531c-0.1875 0.3125-0.28125 0.66797-0.28125 1.0312v12c0.003906 0.67578 0.35156 1.3008 0.91797 1.6641 0.56641 0.36719 1.2773 0.42188 1.8945 0.14844l11-5c0.39844-0.17969 0.73047-0.48828 0.9375-0.875l6.8125-12.625 5.7188-4.7812c0.21094-0.17969 0.37891-0.40625 0.5-0.65625l19.156-39c0.25781-0.48047 0.30859-1.043 0.14062-1.5625-0.16797-0.51562-0.53906-0.94531-1.0273-1.1836-0.48828-0.23828-1.0547-0.26562-1.5664-0.078125-0.50781 0.1875-0.92188 0.57422-1.1406 1.0742l-18.219 37.125-13.25-6.9688 27.062-41.375 14.469 8.8438-12.219 25.375c-0.23047 0.48047-0.25781 1.0352-0.082031 1.5352 0.17969 0.50391 0.55078 0.91406 1.0312 1.1445 0.48438 0.22656 1.0352 0.25391 1.5391 0.074218 0.5-0.17969 0.91016-0.55078 1.1367-1.0352l13-27c0.43359-0.92969 0.097656-2.0352-0.78125-2.5625l-5.25-3.2188 3-6.1875c0.46094-0.92969 0.13281-2.0547-0.75-2.5938l-10-6c-0.40234-0.25-0.875-0.34766-1.3438-0.28125zm0.96875 4.6875 6.75 4.0625-2.0625 4.2188-7.2188-4.4062zm-32.656 52.625 11.406 6.0312-2.625 2.2188-8.7812-4.7812zm-1.25 7.375 7.5312 4.125-5.7188 10.625-7.5625 3.4375v-8.3438zm8.0625 19.312c-0.53125 0.023438-1.0312 0.25781-1.3867 0.65234-0.35938 0.39062-0.54297 0.91016-0.51953 1.4414s0.25781 1.0312 0.65234 1.3867c0.39062 0.35938 0.91016 0.54297 1.4414 0.51953h38c0.53516 0.007812 1.0508-0.19922 1.4336-0.57422 0.37891-0.37891 0.59375-0.89062 0.59375-1.4258s-0.21484-1.0469-0.59375-1.4258c-0.38281-0.375-0.89844-0.58203-1.4336-0.57422h-38c-0.0625-0.003906-0.125-0.003906-0.1875 0z"}))),v&&A.default.createElement("button",{className:a==="marker"?"active":"",onClick:()=>e("marker"),title:"Marker (thick)"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 100 100",fill:"currentColor"},A.default.createElement("path",{d:"m60.844 7c-0.58594 0.042969-1.1211 0.33984-1.4688 0.8125l-33 46c-0.22266 0.3125-0.35547 0.67969-0.375 1.0625l-1 19c-0.042969 0.77734 0.375 1.5117 1.0625 1.875l0.4375 0.25-8.2188 13.969c-0.37109 0.61719-0.38281 1.3906-0.027344 2.0195 0.35547 0.625 1.0234 1.0117 1.7461 1.0117h10c0.66797-0.007812 1.2891-0.34766 1.6562-0.90625l6.5312-9.8125 0.875 0.46875c0.62891 0.33984 1.3906 0.3125 2-0.0625l16-10c0.32422-0.20312 0.58594-0.49609 0.75-0.84375l24-51c0.44922-0.94531 0.09375-2.0742-0.8125-2.5938l-19-11c-0.35156-0.19922-0.75391-0.28516-1.1562-0.25zm0.71875 4.625 15.844 9.1562-22.312 47.375-24.156-13.812zm0.90625 9.375c-2.3789-0.054688-4.707 1.1719-5.9688 3.375l-10.594 18.5c-1.832 3.2031-0.71875 7.3594 2.4688 9.2188s7.3242 0.76562 9.1562-2.4375l10.562-18.5c1.832-3.2031 0.75-7.3906-2.4375-9.25-0.99609-0.58203-2.1055-0.88281-3.1875-0.90625zm-0.34375 4c0.51953-0.035156 1.0352 0.085938 1.5312 0.375 1.3242 0.77344 1.7734 2.3984 1 3.75l-10.594 18.5c-0.77344 1.3516-2.3633 1.7734-3.6875 1s-1.7734-2.3984-1-3.75l10.562-18.469c0.48438-0.84375 1.3242-1.3477 2.1875-1.4062zm-32.281 33.344 22.25 12.688-12.188 7.625-10.844-5.8438zm0.1875 19.531 4.6562 2.5-5.75 8.625h-5.4688zm8.7812 11.125c-0.53125 0.023438-1.0312 0.25781-1.3867 0.65234-0.35938 0.39062-0.54297 0.91016-0.51953 1.4414s0.25781 1.0312 0.65234 1.3867c0.39062 0.35938 0.91016 0.54297 1.4414 0.51953h28c0.53516 0.007812 1.0508-0.19922 1.4336-0.57422 0.37891-0.37891 0.59375-0.89062 0.59375-1.4258s-0.21484-1.0469-0.59375-1.4258c-0.38281-0.375-0.89844-0.58203-1.4336-0.57422h-28c-0.0625-0.003906-0.125-0.003906-0.1875 0z"}))),o&&A.default.createElement("button",{className:a==="eraser"?"active":"",onClick:()=>e("eraser"),title:"Eraser"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"},A.default.createElement("path",{d:"m7 21-4.3-4.3c-1-1-1-2.5 0-3.4l9.6-9.6c1-1 2.5-1 3.4 0l5.6 5.6c1 1 1 2.5 0 3.4L13 21"}),A.default.createElement("path",{d:"M22 21H7"}),A.default.createElement("path",{d:"m5 11 9 9"}))),Z&&A.default.createElement("button",{className:a==="rainbow"?"active":"",onClick:()=>e("rainbow"),title:"Rainbow spray"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24"},A.default.createElement("circle",{cx:"6",cy:"7",r:"2.4",fill:"#ef4444"}),A.default.createElement("circle",{cx:"13",cy:"5",r:"1.8",fill:"#f97316"}),A.default.createElement("circle",{cx:"18.5",cy:"9.5",r:"2.2",fill:"#eab308"}),A.default.createElement("circle",{cx:"8",cy:"13.5",r:"2",fill:"#22c55e"}),A.default.createElement("circle",{cx:"14.5",cy:"14",r:"2.6",fill:"#3b82f6"}),A.default.createElement("circle",{cx:"18.5",cy:"18.5",r:"1.7",fill:"#a855f7"})))),A.default.createElement("div",{className:"paint-divider"}),A.default.createElement("div",{className:"paint-action-group"},A.default.createElement("button",{onClick:dd,disabled:vd===0,title:"Undo"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"},A.default.createElement("path",{d:"M3 7v6h6"}),A.default.createElement("path",{d:"M21 17a9 9 0 0 0-9-9 9 9 0 0 0-6 2.3L3 13"}))),A.default.createElement("button",{onClick:od,title:"Clear"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"},A.default.createElement("path",{d:"M3 6h18"}),A.default.createElement("path",{d:"M19 6v14c0 1-1 2-2 2H7c-1 0-2-1-2-2V6"}),A.default.createElement("path",{d:"M8 6V4c0-1 1-2 2-2h4c1 0 2 1 2 2v2"})))),A.default.createElement("div",{className:"paint-divider"}),r&&a!=="eraser"&&a!=="rainbow"&&A.default.createElement("input",{type:"color",value:b,onChange:T=>H(T.target.value),title:"Color"}),(a==="marker"||a==="eraser"||a==="rainbow")&&(()=>{let T={marker:{value:n,setter:c,min:2,max:24,label:"Marker thickness"},eraser:{value:f,setter:i,min:4,max:60,label:"Eraser thickness"},rainbow:{value:s,setter:m,min:4,max:40,label:"Rainbow thickness"}}[a];return A.default.createElement("input",{type:"range",className:"paint-thickness",min:T.min,max:T.max,value:T.value,onChange:D=>T.setter(Number(D.target.value)),title:`${T.label}: ${T.value}px`})})()),A.default.createElement("div",{className:"paint-canvas-area",style:{background:md}},A.default.createElement("canvas",{ref:l,width:E,height:y,onMouseDown:hd,onMouseMove:yd,onMouseUp:kn,onMouseLeave:kn})))}var Eh=sd(bh),Nh={render:Eh};export{Nh as default};
+`).replace(x2,"")}function Lv(l,t){return t=h1(t),h1(l)===t}function Kn(){}function X(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||ua(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&ua(l,""+a);break;case"className":pe(l,"class",a);break;case"tabIndex":pe(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":pe(l,u,a);break;case"style":$1(l,a,n);break;case"data":if(t!=="object"){pe(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=we(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&X(l,t,"name",e.name,e,null),X(l,t,"formEncType",e.formEncType,e,null),X(l,t,"formMethod",e.formMethod,e,null),X(l,t,"formTarget",e.formTarget,e,null)):(X(l,t,"encType",e.encType,e,null),X(l,t,"method",e.method,e,null),X(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=we(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Kn);break;case"onScroll":a!=null&&q("scroll",l);break;case"onScrollEnd":a!=null&&q("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(g(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(g(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=we(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":q("beforetoggle",l),q("toggle",l),Je(l,"popover",a);break;case"xlinkActuate":it(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":it(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":it(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":it(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":it(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":it(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":it(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":it(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":it(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Je(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=go.get(u)||u,Je(l,u,a))}}function _f(l,t,u,a,e,n){switch(u){case"style":$1(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(g(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(g(60));l.innerHTML=u}}break;case"children":typeof a=="string"?ua(l,a):(typeof a=="number"||typeof a=="bigint")&&ua(l,""+a);break;case"onScroll":a!=null&&q("scroll",l);break;case"onScrollEnd":a!=null&&q("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Kn);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!L1.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[Al]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):Je(l,u,a)}}}function hl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":q("error",l),q("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var c=u[n];if(c!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(g(137,t));default:X(l,t,n,c,u,null)}}e&&X(l,t,"srcSet",u.srcSet,u,null),a&&X(l,t,"src",u.src,u,null);return;case"input":q("invalid",l);var f=n=c=e=null,i=null,s=null;for(a in u)if(u.hasOwnProperty(a)){var m=u[a];if(m!=null)switch(a){case"name":e=m;break;case"type":c=m;break;case"checked":i=m;break;case"defaultChecked":s=m;break;case"value":n=m;break;case"defaultValue":f=m;break;case"children":case"dangerouslySetInnerHTML":if(m!=null)throw Error(g(137,t));break;default:X(l,t,a,m,u,null)}}w1(l,n,f,i,s,c,e,!1),sn(l);return;case"select":q("invalid",l),a=c=n=null;for(e in u)if(u.hasOwnProperty(e)&&(f=u[e],f!=null))switch(e){case"value":n=f;break;case"defaultValue":c=f;break;case"multiple":a=f;default:X(l,t,e,f,u,null)}t=n,u=c,l.multiple=!!a,t!=null?wu(l,!!a,t,!1):u!=null&&wu(l,!!a,u,!0);return;case"textarea":q("invalid",l),n=e=a=null;for(c in u)if(u.hasOwnProperty(c)&&(f=u[c],f!=null))switch(c){case"value":a=f;break;case"defaultValue":e=f;break;case"children":n=f;break;case"dangerouslySetInnerHTML":if(f!=null)throw Error(g(91));break;default:X(l,t,c,f,u,null)}k1(l,a,e,n),sn(l);return;case"option":for(i in u)if(u.hasOwnProperty(i)&&(a=u[i],a!=null))switch(i){case"selected":l.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:X(l,t,i,a,u,null)}return;case"dialog":q("cancel",l),q("close",l);break;case"iframe":case"object":q("load",l);break;case"video":case"audio":for(a=0;a<ue.length;a++)q(ue[a],l);break;case"image":q("error",l),q("load",l);break;case"details":q("toggle",l);break;case"embed":case"source":case"link":q("error",l),q("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(s in u)if(u.hasOwnProperty(s)&&(a=u[s],a!=null))switch(s){case"children":case"dangerouslySetInnerHTML":throw Error(g(137,t));default:X(l,t,s,a,u,null)}return;default:if(Qf(t)){for(m in u)u.hasOwnProperty(m)&&(a=u[m],a!==void 0&&_f(l,t,m,a,u,void 0));return}}for(f in u)u.hasOwnProperty(f)&&(a=u[f],a!=null&&X(l,t,f,a,u,null))}function Z2(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,c=null,f=null,i=null,s=null,m=null;for(y in u){var S=u[y];if(u.hasOwnProperty(y)&&S!=null)switch(y){case"checked":break;case"value":break;case"defaultValue":i=S;default:a.hasOwnProperty(y)||X(l,t,y,null,a,S)}}for(var h in a){var y=a[h];if(S=u[h],a.hasOwnProperty(h)&&(y!=null||S!=null))switch(h){case"type":n=y;break;case"name":e=y;break;case"checked":s=y;break;case"defaultChecked":m=y;break;case"value":c=y;break;case"defaultValue":f=y;break;case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(g(137,t));break;default:y!==S&&X(l,t,h,y,a,S)}}kc(l,c,f,i,s,m,n,e);return;case"select":y=c=f=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":y=i;default:a.hasOwnProperty(n)||X(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":f=n;break;case"multiple":c=n;default:n!==i&&X(l,t,e,n,a,i)}t=f,u=c,a=y,h!=null?wu(l,!!u,h,!1):!!a!=!!u&&(t!=null?wu(l,!!u,t,!0):wu(l,!!u,u?[]:"",!1));return;case"textarea":y=h=null;for(f in u)if(e=u[f],u.hasOwnProperty(f)&&e!=null&&!a.hasOwnProperty(f))switch(f){case"value":break;case"children":break;default:X(l,t,f,null,a,e)}for(c in a)if(e=a[c],n=u[c],a.hasOwnProperty(c)&&(e!=null||n!=null))switch(c){case"value":h=e;break;case"defaultValue":y=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(g(91));break;default:e!==n&&X(l,t,c,e,a,n)}W1(l,h,y);return;case"option":for(var E in u)if(h=u[E],u.hasOwnProperty(E)&&h!=null&&!a.hasOwnProperty(E))switch(E){case"selected":l.selected=!1;break;default:X(l,t,E,null,a,h)}for(i in a)if(h=a[i],y=u[i],a.hasOwnProperty(i)&&h!==y&&(h!=null||y!=null))switch(i){case"selected":l.selected=h&&typeof h!="function"&&typeof h!="symbol";break;default:X(l,t,i,h,a,y)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var O in u)h=u[O],u.hasOwnProperty(O)&&h!=null&&!a.hasOwnProperty(O)&&X(l,t,O,null,a,h);for(s in a)if(h=a[s],y=u[s],a.hasOwnProperty(s)&&h!==y&&(h!=null||y!=null))switch(s){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(g(137,t));break;default:X(l,t,s,h,a,y)}return;default:if(Qf(t)){for(var Z in u)h=u[Z],u.hasOwnProperty(Z)&&h!==void 0&&!a.hasOwnProperty(Z)&&_f(l,t,Z,void 0,a,h);for(m in a)h=a[m],y=u[m],!a.hasOwnProperty(m)||h===y||h===void 0&&y===void 0||_f(l,t,m,h,a,y);return}}for(var d in u)h=u[d],u.hasOwnProperty(d)&&h!=null&&!a.hasOwnProperty(d)&&X(l,t,d,null,a,h);for(S in a)h=a[S],y=u[S],!a.hasOwnProperty(S)||h===y||h==null&&y==null||X(l,t,S,h,a,y)}var Uf=null,Hf=null;function _n(l){return l.nodeType===9?l:l.ownerDocument}function y1(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Kv(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Rf(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Qc=null;function j2(){var l=window.event;return l&&l.type==="popstate"?l===Qc?!1:(Qc=l,!0):(Qc=null,!1)}var Jv=typeof setTimeout=="function"?setTimeout:void 0,V2=typeof clearTimeout=="function"?clearTimeout:void 0,m1=typeof Promise=="function"?Promise:void 0,L2=typeof queueMicrotask=="function"?queueMicrotask:typeof m1<"u"?function(l){return m1.resolve(null).then(l).catch(K2)}:Jv;function K2(l){setTimeout(function(){throw l})}function xc(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"){if(a===0){l.removeChild(e),ie(t);return}a--}else u!=="$"&&u!=="$?"&&u!=="$!"||a++;u=e}while(u);ie(t)}function pf(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":pf(u),Gf(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function J2(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[ka])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=$l(l.nextSibling),l===null)break}return null}function w2(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=$l(l.nextSibling),l===null))return null;return l}function $l(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="F!"||t==="F")break;if(t==="/$")return null}}return l}function r1(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"){if(t===0)return l;t--}else u==="/$"&&t++}l=l.previousSibling}return null}function wv(l,t,u){switch(t=_n(u),l){case"html":if(l=t.documentElement,!l)throw Error(g(452));return l;case"head":if(l=t.head,!l)throw Error(g(453));return l;case"body":if(l=t.body,!l)throw Error(g(454));return l;default:throw Error(g(451))}}var Kl=new Map,g1=new Set;function Un(l){return typeof l.getRootNode=="function"?l.getRootNode():l.ownerDocument}var Ot=K.d;K.d={f:W2,r:k2,D:$2,C:F2,L:P2,m:I2,X:th,S:lh,M:uh};function W2(){var l=Ot.f(),t=Vn();return l||t}function k2(l){var t=da(l);t!==null&&t.tag===5&&t.type==="form"?ws(t):Ot.r(l)}var ha=typeof document>"u"?null:document;function Wv(l,t,u){var a=ha;if(a&&typeof t=="string"&&t){var e=xl(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),g1.has(e)||(g1.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),hl(t,"link",l),fl(t),a.head.appendChild(t)))}}function $2(l){Ot.D(l),Wv("dns-prefetch",l,null)}function F2(l,t){Ot.C(l,t),Wv("preconnect",l,t)}function P2(l,t,u){Ot.L(l,t,u);var a=ha;if(a&&l&&t){var e='link[rel="preload"][as="'+xl(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+xl(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+xl(u.imageSizes)+'"]')):e+='[href="'+xl(l)+'"]';var n=e;switch(t){case"style":n=ia(l);break;case"script":n=ya(l)}Kl.has(n)||(l=J({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),Kl.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(be(n))||t==="script"&&a.querySelector(Ee(n))||(t=a.createElement("link"),hl(t,"link",l),fl(t),a.head.appendChild(t)))}}function I2(l,t){Ot.m(l,t);var u=ha;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+xl(a)+'"][href="'+xl(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=ya(l)}if(!Kl.has(n)&&(l=J({rel:"modulepreload",href:l},t),Kl.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(Ee(n)))return}a=u.createElement("link"),hl(a,"link",l),fl(a),u.head.appendChild(a)}}}function lh(l,t,u){Ot.S(l,t,u);var a=ha;if(a&&l){var e=Ju(a).hoistableStyles,n=ia(l);t=t||"default";var c=e.get(n);if(!c){var f={loading:0,preload:null};if(c=a.querySelector(be(n)))f.loading=5;else{l=J({rel:"stylesheet",href:l,"data-precedence":t},u),(u=Kl.get(n))&&Ti(l,u);var i=c=a.createElement("link");fl(i),hl(i,"link",l),i._p=new Promise(function(s,m){i.onload=s,i.onerror=m}),i.addEventListener("load",function(){f.loading|=1}),i.addEventListener("error",function(){f.loading|=2}),f.loading|=4,tn(c,t,a)}c={type:"stylesheet",instance:c,count:1,state:f},e.set(n,c)}}}function th(l,t){Ot.X(l,t);var u=ha;if(u&&l){var a=Ju(u).hoistableScripts,e=ya(l),n=a.get(e);n||(n=u.querySelector(Ee(e)),n||(l=J({src:l,async:!0},t),(t=Kl.get(e))&&zi(l,t),n=u.createElement("script"),fl(n),hl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function uh(l,t){Ot.M(l,t);var u=ha;if(u&&l){var a=Ju(u).hoistableScripts,e=ya(l),n=a.get(e);n||(n=u.querySelector(Ee(e)),n||(l=J({src:l,async:!0,type:"module"},t),(t=Kl.get(e))&&zi(l,t),n=u.createElement("script"),fl(n),hl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function S1(l,t,u,a){var e=(e=Zt.current)?Un(e):null;if(!e)throw Error(g(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=ia(u.href),u=Ju(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=ia(u.href);var n=Ju(e).hoistableStyles,c=n.get(l);if(c||(e=e.ownerDocument||e,c={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,c),(n=e.querySelector(be(l)))&&!n._p&&(c.instance=n,c.state.loading=5),Kl.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},Kl.set(l,u),n||ah(e,l,u,c.state))),t&&a===null)throw Error(g(528,""));return c}if(t&&a!==null)throw Error(g(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=ya(u),u=Ju(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(g(444,l))}}function ia(l){return'href="'+xl(l)+'"'}function be(l){return'link[rel="stylesheet"]['+l+"]"}function kv(l){return J({},l,{"data-precedence":l.precedence,precedence:null})}function ah(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),hl(t,"link",u),fl(t),l.head.appendChild(t))}function ya(l){return'[src="'+xl(l)+'"]'}function Ee(l){return"script[async]"+l}function b1(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+xl(u.href)+'"]');if(a)return t.instance=a,fl(a),a;var e=J({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),fl(a),hl(a,"style",e),tn(a,u.precedence,l),t.instance=a;case"stylesheet":e=ia(u.href);var n=l.querySelector(be(e));if(n)return t.state.loading|=4,t.instance=n,fl(n),n;a=kv(u),(e=Kl.get(e))&&Ti(a,e),n=(l.ownerDocument||l).createElement("link"),fl(n);var c=n;return c._p=new Promise(function(f,i){c.onload=f,c.onerror=i}),hl(n,"link",a),t.state.loading|=4,tn(n,u.precedence,l),t.instance=n;case"script":return n=ya(u.src),(e=l.querySelector(Ee(n)))?(t.instance=e,fl(e),e):(a=u,(e=Kl.get(n))&&(a=J({},u),zi(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),fl(e),hl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(g(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,tn(a,u.precedence,l));return t.instance}function tn(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,c=0;c<a.length;c++){var f=a[c];if(f.dataset.precedence===t)n=f;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function Ti(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function zi(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var un=null;function E1(l,t,u){if(un===null){var a=new Map,e=un=new Map;e.set(u,a)}else e=un,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[ka]||n[ml]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var c=n.getAttribute(t)||"";c=l+c;var f=a.get(c);f?f.push(n):a.set(c,[n])}}return a}function T1(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function eh(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function $v(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}var ee=null;function nh(){}function ch(l,t,u){if(ee===null)throw Error(g(475));var a=ee;if(t.type==="stylesheet"&&(typeof u.media!="string"||matchMedia(u.media).matches!==!1)&&(t.state.loading&4)===0){if(t.instance===null){var e=ia(u.href),n=l.querySelector(be(e));if(n){l=n._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(a.count++,a=Hn.bind(a),l.then(a,a)),t.state.loading|=4,t.instance=n,fl(n);return}n=l.ownerDocument||l,u=kv(u),(e=Kl.get(e))&&Ti(u,e),n=n.createElement("link"),fl(n);var c=n;c._p=new Promise(function(f,i){c.onload=f,c.onerror=i}),hl(n,"link",u),t.instance=n}a.stylesheets===null&&(a.stylesheets=new Map),a.stylesheets.set(t,l),(l=t.state.preload)&&(t.state.loading&3)===0&&(a.count++,t=Hn.bind(a),l.addEventListener("load",t),l.addEventListener("error",t))}}function fh(){if(ee===null)throw Error(g(475));var l=ee;return l.stylesheets&&l.count===0&&Nf(l,l.stylesheets),0<l.count?function(t){var u=setTimeout(function(){if(l.stylesheets&&Nf(l,l.stylesheets),l.unsuspend){var a=l.unsuspend;l.unsuspend=null,a()}},6e4);return l.unsuspend=t,function(){l.unsuspend=null,clearTimeout(u)}}:null}function Hn(){if(this.count--,this.count===0){if(this.stylesheets)Nf(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Rn=null;function Nf(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Rn=new Map,t.forEach(ih,l),Rn=null,Hn.call(l))}function ih(l,t){if(!(t.state.loading&4)){var u=Rn.get(l);if(u)var a=u.get(null);else{u=new Map,Rn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var c=e[n];(c.nodeName==="LINK"||c.getAttribute("media")!=="not all")&&(u.set(c.dataset.precedence,c),a=c)}a&&u.set(null,a)}e=t.instance,c=e.getAttribute("data-precedence"),n=u.get(c)||a,n===a&&u.set(null,e),u.set(c,e),this.count++,a=Hn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var ne={$$typeof:mt,Provider:null,Consumer:null,_currentValue:iu,_currentValue2:iu,_threadCount:0};function sh(l,t,u,a,e,n,c,f){this.tag=1,this.containerInfo=l,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=yc(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.finishedLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=yc(0),this.hiddenUpdates=yc(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=c,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function Fv(l,t,u,a,e,n,c,f,i,s,m,S){return l=new sh(l,t,u,c,f,i,s,S),t=1,n===!0&&(t|=24),n=jl(3,null,null,t),l.current=n,n.stateNode=l,t=$f(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},di(n),l}function Pv(l){return l?(l=ju,l):ju}function Iv(l,t,u,a,e,n){e=Pv(e),a.context===null?a.context=e:a.pendingContext=e,a=jt(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=Vt(l,a,t),u!==null&&(El(u,l,t),Za(u,l,t))}function z1(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Ai(l,t){z1(l,t),(l=l.alternate)&&z1(l,t)}function ld(l){if(l.tag===13){var t=kt(l,67108864);t!==null&&El(t,l,67108864),Ai(l,67108864)}}var pn=!0;function vh(l,t,u,a){var e=U.T;U.T=null;var n=K.p;try{K.p=2,Mi(l,t,u,a)}finally{K.p=n,U.T=e}}function dh(l,t,u,a){var e=U.T;U.T=null;var n=K.p;try{K.p=8,Mi(l,t,u,a)}finally{K.p=n,U.T=e}}function Mi(l,t,u,a){if(pn){var e=Bf(a);if(e===null)Gc(l,t,a,Nn,u),A1(l,a);else if(hh(e,l,t,u,a))a.stopPropagation();else if(A1(l,a),t&4&&-1<oh.indexOf(l)){for(;e!==null;){var n=da(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var c=au(n.pendingLanes);if(c!==0){var f=n;for(f.pendingLanes|=2,f.entangledLanes|=2;c;){var i=1<<31-Rl(c);f.entanglements[1]|=i,c&=~i}ft(n),($&6)===0&&(zn=at()+500,Se(0,!1))}}break;case 13:f=kt(n,2),f!==null&&El(f,n,2),Vn(),Ai(n,2)}if(n=Bf(a),n===null&&Gc(l,t,a,Nn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Gc(l,t,a,null,u)}}function Bf(l){return l=xf(l),Oi(l)}var Nn=null;function Oi(l){if(Nn=null,l=cu(l),l!==null){var t=sa(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=N1(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Nn=l,null}function td(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Pd()){case q1:return 2;case Y1:return 8;case fn:case Id:return 32;case C1:return 268435456;default:return 32}default:return 32}}var qf=!1,Jt=null,wt=null,Wt=null,ce=new Map,fe=new Map,Gt=[],oh="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function A1(l,t){switch(l){case"focusin":case"focusout":Jt=null;break;case"dragenter":case"dragleave":wt=null;break;case"mouseover":case"mouseout":Wt=null;break;case"pointerover":case"pointerout":ce.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":fe.delete(t.pointerId)}}function Da(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=da(t),t!==null&&ld(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function hh(l,t,u,a,e){switch(t){case"focusin":return Jt=Da(Jt,l,t,u,a,e),!0;case"dragenter":return wt=Da(wt,l,t,u,a,e),!0;case"mouseover":return Wt=Da(Wt,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return ce.set(n,Da(ce.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,fe.set(n,Da(fe.get(n)||null,l,t,u,a,e)),!0}return!1}function ud(l){var t=cu(l.target);if(t!==null){var u=sa(t);if(u!==null){if(t=u.tag,t===13){if(t=N1(u),t!==null){l.blockedOn=t,io(l.priority,function(){if(u.tag===13){var a=pl(),e=kt(u,a);e!==null&&El(e,u,a),Ai(u,a)}});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function an(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=Bf(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);Fc=a,u.target.dispatchEvent(a),Fc=null}else return t=da(u),t!==null&&ld(t),l.blockedOn=u,!1;t.shift()}return!0}function M1(l,t,u){an(l)&&u.delete(t)}function yh(){qf=!1,Jt!==null&&an(Jt)&&(Jt=null),wt!==null&&an(wt)&&(wt=null),Wt!==null&&an(Wt)&&(Wt=null),ce.forEach(M1),fe.forEach(M1)}function Le(l,t){l.blockedOn===t&&(l.blockedOn=null,qf||(qf=!0,nl.unstable_scheduleCallback(nl.unstable_NormalPriority,yh)))}var Ke=null;function O1(l){Ke!==l&&(Ke=l,nl.unstable_scheduleCallback(nl.unstable_NormalPriority,function(){Ke===l&&(Ke=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(Oi(a||u)===null)continue;break}var n=da(u);n!==null&&(l.splice(t,3),t-=3,ff(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function ie(l){function t(i){return Le(i,l)}Jt!==null&&Le(Jt,l),wt!==null&&Le(wt,l),Wt!==null&&Le(Wt,l),ce.forEach(t),fe.forEach(t);for(var u=0;u<Gt.length;u++){var a=Gt[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<Gt.length&&(u=Gt[0],u.blockedOn===null);)ud(u),u.blockedOn===null&&Gt.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],c=e[Al]||null;if(typeof n=="function")c||O1(u);else if(c){var f=null;if(n&&n.hasAttribute("formAction")){if(e=n,c=n[Al]||null)f=c.formAction;else if(Oi(e)!==null)continue}else f=c.action;typeof f=="function"?u[a+1]=f:(u.splice(a,3),a-=3),O1(u)}}}function Di(l){this._internalRoot=l}Jn.prototype.render=Di.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(g(409));var u=t.current,a=pl();Iv(u,a,l,t,null,null)};Jn.prototype.unmount=Di.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;l.tag===0&&Iu(),Iv(l.current,2,null,l,null,null),Vn(),t[va]=null}};function Jn(l){this._internalRoot=l}Jn.prototype.unstable_scheduleHydration=function(l){if(l){var t=j1();l={blockedOn:null,target:l,priority:t};for(var u=0;u<Gt.length&&t!==0&&t<Gt[u].priority;u++);Gt.splice(u,0,l),u===0&&ud(l)}};var D1=_1.version;if(D1!=="19.0.0")throw Error(g(527,D1,"19.0.0"));K.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(g(188)):(l=Object.keys(l).join(","),Error(g(268,l)));return l=kd(t),l=l!==null?B1(l):null,l=l===null?null:l.stateNode,l};var mh={bundleType:0,version:"19.0.0",rendererPackageName:"react-dom",currentDispatcherRef:U,findFiberByHostInstance:cu,reconcilerVersion:"19.0.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"&&(_a=__REACT_DEVTOOLS_GLOBAL_HOOK__,!_a.isDisabled&&_a.supportsFiber))try{se=_a.inject(mh),Hl=_a}catch{}var _a;wn.createRoot=function(l,t){if(!U1(l))throw Error(g(299));var u=!1,a="",e=Is,n=lv,c=tv,f=null;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(c=t.onRecoverableError),t.unstable_transitionCallbacks!==void 0&&(f=t.unstable_transitionCallbacks)),t=Fv(l,1,!1,null,null,u,a,e,n,c,f,null),l[va]=t.current,Ei(l.nodeType===8?l.parentNode:l),new Di(t)};wn.hydrateRoot=function(l,t,u){if(!U1(l))throw Error(g(299));var a=!1,e="",n=Is,c=lv,f=tv,i=null,s=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(c=u.onCaughtError),u.onRecoverableError!==void 0&&(f=u.onRecoverableError),u.unstable_transitionCallbacks!==void 0&&(i=u.unstable_transitionCallbacks),u.formState!==void 0&&(s=u.formState)),t=Fv(l,1,!0,t,u??null,a,e,n,c,f,i,s),t.context=Pv(null),u=t.current,a=pl(),e=jt(a),e.callback=null,Vt(u,e,a),t.current.lanes=a,de(t,a),ft(t),l[va]=t.current,Ei(l),new Jn(t)};wn.version="19.0.0"});var cd=Ut((Hh,nd)=>{"use strict";function ed(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(ed)}catch(l){console.error(l)}}ed(),nd.exports=ad()});var Ol=$n(ma(),1),fd=$n(cd(),1),id=Ol.createContext(null);function rh(){let l=Ol.useContext(id);if(!l)throw new Error("RenderContext not found");return l}function gh(){return rh().model}function Pl(l){let t=gh(),[u,a]=Ol.useState(t.get(l));return Ol.useEffect(()=>{let e=()=>a(t.get(l));return t.on(`change:${l}`,e),()=>t.off(`change:${l}`,e)},[t,l]),[u,e=>{t.set(l,e),t.save_changes()}]}function sd(l){return({el:t,model:u,experimental:a})=>{let e=fd.createRoot(t);return e.render(Ol.createElement(Ol.StrictMode,null,Ol.createElement(id.Provider,{value:{model:u,experimental:a}},Ol.createElement(l)))),()=>e.unmount()}}var A=$n(ma()),Sh=20,wgT=64;function bh(){let l=(0,A.useRef)(null),[t,u]=(0,A.useState)(!1),[a,e]=(0,A.useState)("brush"),[n,c]=(0,A.useState)(8),[f,i]=(0,A.useState)(20),[s,m]=(0,A.useState)(14),wgM=gh(),[y]=Pl("height"),[E]=Pl("width"),[O]=Pl("store_background"),[Z]=Pl("rainbow_brush"),[d]=Pl("brush"),[v]=Pl("marker"),[o]=Pl("eraser"),[r]=Pl("color_picker"),[b,H]=Pl("color"),[,wgR]=Pl("revision"),[wgS]=Pl("sync_tiles"),z=(0,A.useRef)(null),Ou=(0,A.useRef)([]),[vd,Wn]=(0,A.useState)(0),wgD=(0,A.useRef)(new Set),wgP=(0,A.useRef)([0,0]),wgL=(0,A.useRef)(null);let Du=()=>l.current?.getContext("2d")??null,wgC=()=>Math.ceil((l.current?.width??0)/wgT),wgK=(T,D,_,vl,Jl)=>{let Dt=l.current;if(!Dt)return;let _t=wgC(),wgr=Math.ceil(Dt.height/wgT),c0=Math.max(0,Math.floor((Math.min(T,_)-Jl)/wgT)),c1=Math.min(_t-1,Math.floor((Math.max(T,_)+Jl)/wgT)),r0=Math.max(0,Math.floor((Math.min(D,vl)-Jl)/wgT)),r1=Math.min(wgr-1,Math.floor((Math.max(D,vl)+Jl)/wgT)),wge=Ou.current[Ou.current.length-1];for(let R=r0;R<=r1;R++)for(let C=c0;C<=c1;C++)wgD.current.add(R*_t+C),wge?.tiles.add(R*_t+C)},wgA=()=>{let T=l.current;T&&wgK(0,0,T.width-1,T.height-1,0)},wgF=()=>{let T=Du(),D=l.current;if(!T||!D||wgD.current.size===0)return;if(!wgS){wgD.current.clear(),wgR((wgM.get("revision")??0)+1);return}let _=wgC(),vl=[],Jl=[];for(let Dt of wgD.current){let _t=Dt%_*wgT,R=Math.floor(Dt/_)*wgT,C=Math.min(wgT,D.width-_t),wgh=Math.min(wgT,D.height-R);vl.push([_t,R,C,wgh]),Jl.push(T.getImageData(_t,R,C,wgh).data.buffer)}wgD.current.clear(),wgM.send({type:"tiles",tiles:vl},void 0,Jl),wgR((wgM.get("revision")??0)+1)};(0,A.useEffect)(()=>{let T=(D,_)=>{if(D?.type==="undo"){Ou.current.pop(),Wn(Ou.current.length);return}let vl=Du(),Jl=l.current;!D||D.type!=="tiles"||!vl||!Jl||(D.reset&&vl.clearRect(0,0,Jl.width,Jl.height),D.tiles.forEach(([Dt,_t,R,C],wgi)=>{if(Dt+R>Jl.width||_t+C>Jl.height)return;let wgv=_[wgi];vl.putImageData(new ImageData(new Uint8ClampedArray(wgv.buffer,wgv.byteOffset,R*C*4),R,C),Dt,_t)}),(D.base||D.reset&&!z.current)&&Jl.width>0&&Jl.height>0&&(z.current=vl.getImageData(0,0,Jl.width,Jl.height)),D.base&&(Ou.current=[],Wn(0)))};return wgM.on("msg:custom",T),()=>wgM.off("msg:custom",T)},[wgM]);(0,A.useEffect)(()=>{Ou.current=[],Wn(0),wgD.current.clear(),z.current=null,E>0&&y>0&&wgM.send({type:"sync"})},[E,y]),(0,A.useEffect)(()=>{let T={brush:d,marker:v,eraser:o,rainbow:Z};if(T[a])return;let D=["brush","marker","eraser","rainbow"].find(_=>T[_]);D&&e(D)},[a,d,v,o,Z]),(0,A.useEffect)(()=>{let T=l.current;if(!T)return;let D=Jl=>{Jl.preventDefault();let Dt=Jl.touches[0],_t=T.getBoundingClientRect();Hi(Dt.clientX-_t.left,Dt.clientY-_t.top)},_=Jl=>{Jl.preventDefault();let Dt=Jl.touches[0],_t=T.getBoundingClientRect();Ri(Dt.clientX-_t.left,Dt.clientY-_t.top)},vl=Jl=>{Jl.preventDefault(),kn()};return T.addEventListener("touchstart",D,{passive:!1}),T.addEventListener("touchmove",_,{passive:!1}),T.addEventListener("touchend",vl,{passive:!1}),()=>{T.removeEventListener("touchstart",D),T.removeEventListener("touchmove",_),T.removeEventListener("touchend",vl)}},[]);let _i=()=>{let T=Du(),D=l.current;if(!T||!D||D.width===0||D.height===0)return;let _=T.getImageData(0,0,D.width,D.height),vl=Ou.current;vl.length>=Sh&&vl.shift(),vl.push({image:_,tiles:new Set}),Wn(vl.length)},dd=()=>{let T=Du(),D=l.current;if(!T||!D)return;let _=Ou.current.pop();if(_){wgM.send({type:"undo"}),T.putImageData(_.image,0,0);for(let vl of _.tiles)wgD.current.add(vl);Wn(Ou.current.length),wgF()}},od=()=>{let T=Du(),D=l.current;!T||!D||(_i(),wgM.send({type:"clear"}),T.clearRect(0,0,D.width,D.height),z.current&&T.putImageData(z.current,0,0),wgA(),wgF())},Ui=(T,D,_,vl)=>{let Jl=Math.max(6,Math.round(vl*.9));for(let Dt=0;Dt<Jl;Dt++){let _t=Math.random()*Math.PI*2,pi=Math.random()*vl,rd=D+Math.cos(_t)*pi,gd=_+Math.sin(_t)*pi;T.fillStyle=`hsl(${Math.random()*360}, 90%, 55%)`,T.beginPath(),T.arc(rd,gd,1.5,0,Math.PI*2),T.fill()}},Hi=(T,D)=>{let _=Du();_&&(_i(),_.beginPath(),_.moveTo(T,D),wgP.current=[T,D],wgL.current={tool:a,size:a==="rainbow"?s:a==="eraser"?f:a==="marker"?n:2,color:b,timestamp:Date.now(),points:[T,D]},u(!0),a==="rainbow"&&(Ui(_,T,D,s),wgK(T,D,T,D,s+2)))},Ri=(T,D)=>{if(!t)return;let _=Du();if(_){if(wgL.current?.points.push(T,D),a==="rainbow"){Ui(_,T,D,s),wgK(T,D,T,D,s+2);return}_.lineTo(T,D);let vl=a==="eraser"?f:a==="marker"?n:2,[Jl,Dt]=wgP.current;wgK(Jl,Dt,T,D,vl/2+2),wgP.current=[T,D],a==="eraser"?(_.save(),_.globalCompositeOperation="destination-out",_.strokeStyle="#000000",_.lineWidth=f,_.lineCap="round",_.stroke(),_.restore()):(_.strokeStyle=b,_.lineWidth=a==="marker"?n:2,_.lineCap="round",_.stroke())}},kn=()=>{if(!t)return;let T=wgL.current;if(wgL.current=null,T){let{points:D,..._}=T;wgM.send({type:"stroke",..._},void 0,[new Float32Array(D).buffer])}wgF(),u(!1)},hd=T=>{let D=T.currentTarget.getBoundingClientRect();Hi(T.clientX-D.left,T.clientY-D.top)},yd=T=>{let D=T.currentTarget.getBoundingClientRect();Ri(T.clientX-D.left,T.clientY-D.top)},md=O?"#ffffff":"repeating-conic-gradient(#d0d0d0 0% 25%, #f0f0f0 0% 50%) 0 0 / 16px 16px";return A.default.createElement("div",{className:"paint-container",style:{width:`${E}px`}},A.default.createElement("div",{className:"paint-toolbar"},A.default.createElement("div",{className:"paint-tool-group"},d&&A.default.createElement("button",{className:a==="brush"?"active":"",onClick:()=>e("brush"),title:"Brush (thin)"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 100 100",fill:"currentColor"},A.default.createElement("path",{d:"m63.688 6c-0.56641 0.089844-1.0664 0.42188-1.375 0.90625l-34 52c-0.20703 0.32812-0.31641 0.70703-0.3125 1.0938v7.4375l-6.7188 11.531c-0.1875 0.3125-0.28125 0.66797-0.28125 1.0312v12c0.003906 0.67578 0.35156 1.3008 0.91797 1.6641 0.56641 0.36719 1.2773 0.42188 1.8945 0.14844l11-5c0.39844-0.17969 0.73047-0.48828 0.9375-0.875l6.8125-12.625 5.7188-4.7812c0.21094-0.17969 0.37891-0.40625 0.5-0.65625l19.156-39c0.25781-0.48047 0.30859-1.043 0.14062-1.5625-0.16797-0.51562-0.53906-0.94531-1.0273-1.1836-0.48828-0.23828-1.0547-0.26562-1.5664-0.078125-0.50781 0.1875-0.92188 0.57422-1.1406 1.0742l-18.219 37.125-13.25-6.9688 27.062-41.375 14.469 8.8438-12.219 25.375c-0.23047 0.48047-0.25781 1.0352-0.082031 1.5352 0.17969 0.50391 0.55078 0.91406 1.0312 1.1445 0.48438 0.22656 1.0352 0.25391 1.5391 0.074218 0.5-0.17969 0.91016-0.55078 1.1367-1.0352l13-27c0.43359-0.92969 0.097656-2.0352-0.78125-2.5625l-5.25-3.2188 3-6.1875c0.46094-0.92969 0.13281-2.0547-0.75-2.5938l-10-6c-0.40234-0.25-0.875-0.34766-1.3438-0.28125zm0.96875 4.6875 6.75 4.0625-2.0625 4.2188-7.2188-4.4062zm-32.656 52.625 11.406 6.0312-2.625 2.2188-8.7812-4.7812zm-1.25 7.375 7.5312 4.125-5.7188 10.625-7.5625 3.4375v-8.3438zm8.0625 19.312c-0.53125 0.023438-1.0312 0.25781-1.3867 0.65234-0.35938 0.39062-0.54297 0.91016-0.51953 1.4414s0.25781 1.0312 0.65234 1.3867c0.39062 0.35938 0.91016 0.54297 1.4414 0.51953h38c0.53516 0.007812 1.0508-0.19922 1.4336-0.57422 0.37891-0.37891 0.59375-0.89062 0.59375-1.4258s-0.21484-1.0469-0.59375-1.4258c-0.38281-0.375-0.89844-0.58203-1.4336-0.57422h-38c-0.0625-0.003906-0.125-0.003906-0.1875 0z"}))),v&&A.default.createElement("button",{className:a==="marker"?"active":"",onClick:()=>e("marker"),title:"Marker (thick)"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 100 100",fill:"currentColor"},A.default.createElement("path",{d:"m60.844 7c-0.58594 0.042969-1.1211 0.33984-1.4688 0.8125l-33 46c-0.22266 0.3125-0.35547 0.67969-0.375 1.0625l-1 19c-0.042969 0.77734 0.375 1.5117 1.0625 1.875l0.4375 0.25-8.2188 13.969c-0.37109 0.61719-0.38281 1.3906-0.027344 2.0195 0.35547 0.625 1.0234 1.0117 1.7461 1.0117h10c0.66797-0.007812 1.2891-0.34766 1.6562-0.90625l6.5312-9.8125 0.875 0.46875c0.62891 0.33984 1.3906 0.3125 2-0.0625l16-10c0.32422-0.20312 0.58594-0.49609 0.75-0.84375l24-51c0.44922-0.94531 0.09375-2.0742-0.8125-2.5938l-19-11c-0.35156-0.19922-0.75391-0.28516-1.1562-0.25zm0.71875 4.625 15.844 9.1562-22.312 47.375-24.156-13.812zm0.90625 9.375c-2.3789-0.054688-4.707 1.1719-5.9688 3.375l-10.594 18.5c-1.832 3.2031-0.71875 7.3594 2.4688 9.2188s7.3242 0.76562 9.1562-2.4375l10.562-18.5c1.832-3.2031 0.75-7.3906-2.4375-9.25-0.99609-0.58203-2.1055-0.88281-3.1875-0.90625zm-0.34375 4c0.51953-0.035156 1.0352 0.085938 1.5312 0.375 1.3242 0.77344 1.7734 2.3984 1 3.75l-10.594 18.5c-0.77344 1.3516-2.3633 1.7734-3.6875 1s-1.7734-2.3984-1-3.75l10.562-18.469c0.48438-0.84375 1.3242-1.3477 2.1875-1.4062zm-32.281 33.344 22.25 12.688-12.188 7.625-10.844-5.8438zm0.1875 19.531 4.6562 2.5-5.75 8.625h-5.4688zm8.7812 11.125c-0.53125 0.023438-1.0312 0.25781-1.3867 0.65234-0.35938 0.39062-0.54297 0.91016-0.51953 1.4414s0.25781 1.0312 0.65234 1.3867c0.39062 0.35938 0.91016 0.54297 1.4414 0.51953h28c0.53516 0.007812 1.0508-0.19922 1.4336-0.57422 0.37891-0.37891 0.59375-0.89062 0.59375-1.4258s-0.21484-1.0469-0.59375-1.4258c-0.38281-0.375-0.89844-0.58203-1.4336-0.57422h-28c-0.0625-0.003906-0.125-0.003906-0.1875 0z"}))),o&&A.default.createElement("button",{className:a==="eraser"?"active":"",onClick:()=>e("eraser"),title:"Eraser"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"},A.default.createElement("path",{d:"m7 21-4.3-4.3c-1-1-1-2.5 0-3.4l9.6-9.6c1-1 2.5-1 3.4 0l5.6 5.6c1 1 1 2.5 0 3.4L13 21"}),A.default.createElement("path",{d:"M22 21H7"}),A.default.createElement("path",{d:"m5 11 9 9"}))),Z&&A.default.createElement("button",{className:a==="rainbow"?"active":"",onClick:()=>e("rainbow"),title:"Rainbow spray"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24"},A.default.createElement("circle",{cx:"6",cy:"7",r:"2.4",fill:"#ef4444"}),A.default.createElement("circle",{cx:"13",cy:"5",r:"1.8",fill:"#f97316"}),A.default.createElement("circle",{cx:"18.5",cy:"9.5",r:"2.2",fill:"#eab308"}),A.default.createElement("circle",{cx:"8",cy:"13.5",r:"2",fill:"#22c55e"}),A.default.createElement("circle",{cx:"14.5",cy:"14",r:"2.6",fill:"#3b82f6"}),A.default.createElement("circle",{cx:"18.5",cy:"18.5",r:"1.7",fill:"#a855f7"})))),A.default.createElement("div",{className:"paint-divider"}),A.default.createElement("div",{className:"paint-action-group"},A.default.createElement("button",{onClick:dd,disabled:vd===0,title:"Undo"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"},A.default.createElement("path",{d:"M3 7v6h6"}),A.default.createElement("path",{d:"M21 17a9 9 0 0 0-9-9 9 9 0 0 0-6 2.3L3 13"}))),A.default.createElement("button",{onClick:od,title:"Clear"},A.default.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"},A.default.createElement("path",{d:"M3 6h18"}),A.default.createElement("path",{d:"M19 6v14c0 1-1 2-2 2H7c-1 0-2-1-2-2V6"}),A.default.createElement("path",{d:"M8 6V4c0-1 1-2 2-2h4c1 0 2 1 2 2v2"})))),A.default.createElement("div",{className:"paint-divider"}),r&&a!=="eraser"&&a!=="rainbow"&&A.default.createElement("input",{type:"color",value:b,onChange:T=>H(T.target.value),title:"Color"}),(a==="marker"||a==="eraser"||a==="rainbow")&&(()=>{let T={marker:{value:n,setter:c,min:2,max:24,label:"Marker thickness"},eraser:{value:f,setter:i,min:4,max:60,label:"Eraser thickness"},rainbow:{value:s,setter:m,min:4,max:40,label:"Rainbow thickness"}}[a];return A.default.createElement("input",{type:"range",className:"paint-thickness",min:T.min,max:T.max,value:T.value,onChange:D=>T.setter(Number(D.target.value)),title:`${T.label}: ${T.value}px`})})()),A.default.createElement("div",{className:"paint-canvas-area",style:{background:md}},A.default.createElement("canvas",{ref:l,width:E,height:y,onMouseDown:hd,onMouseMove:yd,onMouseUp:kn,onMouseLeave:kn})))}var Eh=sd(bh),Nh={render:Eh};export{Nh as default};
 /*! Bundled license information:
 
 react/cjs/react.production.js:
@@ -96,4 +96,4 @@ function ne(e,t,r){e.prototype=t.prototype=r,r.constructor=e}function pe(e,t){va
   width: 100%;
   height: 100%;
 }
-`,re=["#1d4ed8","#0f766e","#b45309","#b91c1c","#6d28d9","#15803d","#be185d","#475569"],se="#6b7280",Yt="#ffffff",Gt=420,Jt=450,st=.55,Kt=12;function dt(e){return e==null||Number.isNaN(e)?"":Number.isInteger(e)?String(e):(Math.round(e*100)/100).toFixed(2)}function Qt(e){return Number.isFinite(e)?e>0&&e<.1?"<0.1%":e>=99.95&&e<100?"99.9%":`${e.toFixed(1)}%`:""}function gt(e,t){if(e==null)return 0;if(typeof e=="number")return e;if(typeof e=="object"&&t){let r=e[t];return typeof r=="number"?r:0}return 0}function ct(e,t){let r=e.data.display;return typeof r=="string"?r:dt(gt(e.data.value,t))}function te(e){let t=[],r=e;for(;r;)t.unshift(r.data.name),r=r.parent;return t}function er(e){let t=e;for(;t.parent&&t.parent.parent;)t=t.parent;return t.data.name}function tr(e,t){return e.length!==t.length?!1:e.every((r,n)=>r===t[n])}function ye(e,t){if(!t||t.length===0)return e;let r=e;if(r.data.name!==t[0])return null;for(let n=1;n<t.length;n++){if(!r.children)return null;let a=r.children.find(o=>o.data.name===t[n]);if(!a)return null;r=a}return r}function X(e){return{sx0:e.x0,sy0:e.y0,sdx:e.x1-e.x0||1,sdy:e.y1-e.y0||1}}function rr(e,t,r){return{sx0:e.sx0+(t.sx0-e.sx0)*r,sy0:e.sy0+(t.sy0-e.sy0)*r,sdx:e.sdx+(t.sdx-e.sdx)*r,sdy:e.sdy+(t.sdy-e.sdy)*r}}function nr(e){return 1-Math.pow(1-e,3)}function ar(e,t){if(!e.children||e.children.length===0)return[e];let r=[];function n(a,o){if(!(o>t)&&(r.push(a),a.children))for(let i of a.children)n(i,o+1)}if(e.children)for(let a of e.children)n(a,1);return r}function ir(e){e.each(t=>{t.children&&t.children.forEach((r,n)=>{r._siblingIndex=n})})}function or(e,t){if(!e||!t||e===t)return null;let r=e;for(;r.parent&&r.parent!==t;)r=r.parent;return r.parent===t?r:null}function lr(e){let t=Math.max(0,e||0),r=Math.floor(t/re.length),n=re[t%re.length]||se;return(I(n)||I(se)).brighter(r*.18).formatHex()}function we(e,t){if(!e||!t)return se;if(e===t&&(!t.children||t.children.length===0))return re[0];let r=or(e,t);if(!r)return se;let n=r._siblingIndex||0,a=I(lr(n))||I(re[0]),o=Math.max(0,e.depth-r.depth),i=(e._siblingIndex||0)%5*.025;return a.brighter(Math.min(.32,o*.11+i)).formatHex()}function fr(e,t){let r=e;for(;r;){if(r===t)return!0;r=r.parent}return!1}function ut(e,t,r,n){let a=(e.x0-t.sx0)/t.sdx*r,o=(e.y0-t.sy0)/t.sdy*n,i=(e.x1-e.x0)/t.sdx*r,s=(e.y1-e.y0)/t.sdy*n;return{left:a,top:o,width:Math.max(i,0),height:Math.max(s,0)}}function ht(e,t,r,n,a,o){let i=Math.max(0,Math.min(o,n/2,a/2));if(e.roundRect){e.beginPath(),e.roundRect(t,r,n,a,i);return}e.beginPath(),e.moveTo(t+i,r),e.arcTo(t+n,r,t+n,r+a,i),e.arcTo(t+n,r+a,t,r+a,i),e.arcTo(t,r+a,t,r,i),e.arcTo(t,r,t+n,r,i)}function pt(e,t,r){if(!t||r<=0)return"";if(e.measureText(t).width<=r)return t;let n="...",a=0,o=t.length;for(;a<o;){let i=Math.ceil((a+o)/2);e.measureText(t.slice(0,i)+n).width<=r?a=i:o=i-1}return a>0?t.slice(0,a)+n:""}function sr({model:e,el:t}){let r=document.createElement("div");r.className="wiggly-treemap";let n=document.createElement("style");n.textContent=Xt,r.appendChild(n);let a=document.createElement("div");a.className="wiggly-treemap-topbar";let o=document.createElement("span");o.className="wiggly-treemap-path";let i=document.createElement("span");i.className="wiggly-treemap-meta",a.append(o,i),r.appendChild(a);let s=document.createElement("div");s.className="wiggly-treemap-chart";let p=document.createElement("canvas");p.className="wiggly-treemap-canvas",s.appendChild(p),r.appendChild(s),t.appendChild(r);let u=p.getContext("2d"),h=null,g=null,l=null,w=null,v=null,M=null,b=[],N=null,S=null,L=null,q=null,F=null,$=null;function ce(){let f=e.get("width");return typeof f=="number"?f:s.clientWidth||600}function mt(){let f=getComputedStyle(r);return{bg:f.getPropertyValue("--bg").trim()||"#ffffff",stroke:f.getPropertyValue("--tile-stroke").trim()||"rgba(255,255,255,0.9)",hoverStroke:f.getPropertyValue("--hover-stroke").trim()||"rgba(255,255,255,0.98)",muted:f.getPropertyValue("--muted").trim()||"#667085"}}function ve(f,c){let d=window.devicePixelRatio||1,y=Math.max(1,Math.round(f*d)),x=Math.max(1,Math.round(c*d));(p.width!==y||p.height!==x)&&(p.width=y,p.height=x),p.style.width=f+"px",p.style.height=c+"px",u.setTransform(d,0,0,d,0,0)}function Ne(f,c){be().size([f,c]).paddingTop(d=>d.children?20:0).paddingInner(1).paddingOuter(2).round(!0)(h)}function Y(){L=null,q=null,F=null}function xt(f){return L&&q===g&&F===f||(L=ar(g,f),q=g,F=f),L}function bt(f){if(!$)return we(f,g);let c=we(f,$.toView),d=fr(f,$.fromView)?we(f,$.fromView):c;return xe(d,c)($.progress)}function G(){let f=e.get("data"),c=e.get("width"),d=e.get("height")||400,y=e.get("value_col")||"";s.style.width=typeof c=="number"?c+"px":c||"600px",s.style.height=d+"px";let x=ce();if(ve(x,d),!f||!f.name){h=null,g=null,l=null,w=null,b=[],S=null,Y(),o.textContent="",i.textContent="",u.clearRect(0,0,x,d);return}h=U(f).sum(C=>C.children&&C.children.length?0:gt(C.value,y)).sort((C,H)=>H.value-C.value),Ne(x,d),ir(h),M=x;let _=e.get("selected_path")||[];g=(_.length?ye(h,_):null)||h,l=X(g),w=l,$=null,Y(),Me(),A(l)}function A(f){if(!h||!g)return;let c=ce(),d=e.get("height")||400,y=e.get("value_col")||"",x=e.get("max_depth")||3,_=mt();ve(c,d),u.clearRect(0,0,c,d),u.fillStyle=_.bg,u.fillRect(0,0,c,d);let E=xt(x),C=[];b=[];for(let k of E){let m=ut(k,f,c,d);m.width<st||m.height<st||(C.push({node:k,box:m}),m.width*m.height>=Kt&&b.push({node:k,box:m}))}let H=0;for(let{node:k,box:m}of C){let P=bt(k),O=Math.min(7,Math.max(2,Math.min(m.width,m.height)/8));if(u.save(),ht(u,m.left,m.top,m.width,m.height,O),u.fillStyle=P,u.fill(),m.width>3&&m.height>3&&(u.lineWidth=1,u.strokeStyle=_.stroke,u.stroke()),u.restore(),H>=Jt)continue;let vt=k.data.name,Se=ct(k,y),Nt=m.width>=46&&m.height>=18,kt=m.width>=68&&m.height>=34&&Se;if(!Nt)continue;u.save(),u.beginPath(),u.rect(m.left+2,m.top+2,Math.max(0,m.width-4),Math.max(0,m.height-4)),u.clip(),u.fillStyle=Yt,u.font="600 12px -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",u.textBaseline="top";let Ee=pt(u,vt,m.width-12);if(Ee&&(u.fillText(Ee,m.left+6,m.top+5),H+=1),kt){u.globalAlpha=.78,u.font="11px -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif";let Te=pt(u,Se,m.width-12);Te&&u.fillText(Te,m.left+6,m.top+20)}u.restore()}if(C.length===0&&g.children&&g.children.length&&(u.fillStyle=_.muted,u.font="13px -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",u.fillText("Zoom in or increase the widget size to see these tiny items.",12,18)),S&&S!==g){let k=ut(S,f,c,d);k.width>=2&&k.height>=2&&(u.save(),ht(u,k.left,k.top,k.width,k.height,Math.min(8,Math.max(2,Math.min(k.width,k.height)/8))),u.lineWidth=Math.min(2.75,Math.max(1.75,Math.min(k.width,k.height)/26)),u.strokeStyle=_.hoverStroke,u.stroke(),u.restore())}}function ke(f){v!==null&&cancelAnimationFrame(v);let c=l||f,d=performance.now();w=f;function y(x){let _=Math.min(1,(x-d)/Gt),E=nr(_);$&&($.progress=E),l=rr(c,w,E),A(l),_<1?v=requestAnimationFrame(y):(l=w,v=null,$=null,A(l))}v=requestAnimationFrame(y)}function Me(){if(!g){o.textContent="",i.textContent="";return}ue(g)}function yt(f){let c=e.get("value_col")||"",d=ct(f,c)||dt(f.value||0),y=h&&h.value?h.value:0,x=y?Qt(f.value/y*100):"",_=f.leaves?f.leaves().length:0,E=_===1?"leaf":"leaves",C=x?`${d} (${x})`:d;return C?`${C} - ${_} ${E}`:`${_} ${E}`}function ue(f){if(!f)return;let c=te(f),d=g?te(g):[],y=c.reduce((E,C,H)=>E===H&&d[H]===C?E+1:E,0),x=c.slice(0,y).join(" / "),_=c.join(" / ");o.replaceChildren(),c.forEach((E,C)=>{if(C>0){let O=document.createElement("span");O.textContent=" / ",O.className=C<=y?"wiggly-treemap-path-separator wiggly-treemap-current-path":"wiggly-treemap-path-separator wiggly-treemap-next-path",o.appendChild(O)}let H=c.slice(0,C+1),k=ye(h,H),m=C<y,P=document.createElement("button");P.type="button",P.className=`wiggly-treemap-path-part ${m?"wiggly-treemap-current-path":"wiggly-treemap-next-path"}`,C===c.length-1&&P.classList.add("-last"),P.textContent=E,k&&!tr(H,d)&&(P.classList.add("-clickable"),P.addEventListener("click",O=>{O.stopPropagation(),he(k)})),o.appendChild(P)}),c.length||(o.textContent=x||_),o.title=_,i.textContent=yt(f),i.title=`${er(f)} - ${_}`}function $e(f){if(!f)return null;if(f===g)return g;let c=f;for(;c.parent&&c.parent!==g;)c=c.parent;return c}function he(f,c=!0,d=!0){let y=g;g=f;let x=X(f);Y(),d&&(e.set("selected_path",te(f)),e.save_changes()),Me(),c&&y&&y!==f?($={fromView:y,toView:f,progress:0},ke(x)):c?($=null,ke(x)):($=null,l=x,w=x,A(l))}function _e(f,c){for(let d=b.length-1;d>=0;d--){let{node:y,box:x}=b[d];if(f>=x.left&&f<=x.left+x.width&&c>=x.top&&c<=x.top+x.height)return y}return null}function Ce(f){let c=p.getBoundingClientRect();return{x:f.clientX-c.left,y:f.clientY-c.top}}function wt(f){e.set("clicked_path",te(f)),e.save_changes();let c=$e(f);c&&c!==g&&he(c)}p.addEventListener("mousemove",f=>{if(!g)return;let c=Ce(f),d=_e(c.x,c.y),y=$e(d),x=y!==S,_=N;N=d,S=y,s.style.cursor=S&&S!==g?"pointer":"default",ue(S||g),d!==_&&(e.set("hovered_path",d?te(d):[]),e.save_changes()),x&&A(l||X(g))}),p.addEventListener("mouseleave",()=>{let f=N!==null;N=null,S=null,s.style.cursor="default",ue(g),f&&(e.set("hovered_path",[]),e.save_changes()),A(l||X(g))}),p.addEventListener("click",f=>{let c=Ce(f),d=_e(c.x,c.y)||N;d&&wt(d)}),new ResizeObserver(()=>{if(typeof e.get("width")!="string"||!h)return;let f=ce();if(f===M)return;M=f;let c=e.get("height")||400;Ne(f,c),l=X(g),w=l,$=null,Y(),A(l)}).observe(s),e.on("change:data",G),e.on("change:width",G),e.on("change:height",G),e.on("change:value_col",G),e.on("change:max_depth",()=>{Y(),A(l||X(g))}),e.on("change:selected_path",()=>{if(!h)return;let f=e.get("selected_path")||[],c=f.length?ye(h,f):h;c&&c!==g&&he(c,!0,!1)}),G()}var Nn={render:sr};export{Nn as default};
+`,re=["#1d4ed8","#0f766e","#b45309","#b91c1c","#6d28d9","#15803d","#be185d","#475569"],se="#6b7280",Yt="#ffffff",Gt=420,Jt=450,st=.55,Kt=12;function dt(e){return e==null||Number.isNaN(e)?"":Number.isInteger(e)?String(e):(Math.round(e*100)/100).toFixed(2)}function Qt(e){return Number.isFinite(e)?e>0&&e<.1?"<0.1%":e>=99.95&&e<100?"99.9%":`${e.toFixed(1)}%`:""}function gt(e,t){if(e==null)return 0;if(typeof e=="number")return e;if(typeof e=="object"&&t){let r=e[t];return typeof r=="number"?r:0}return 0}function ct(e,t){let r=e.data.display;return typeof r=="string"?r:dt(gt(e.data.value,t))}function te(e){let t=[],r=e;for(;r;)t.unshift(r.data.name),r=r.parent;return t}function er(e){let t=e;for(;t.parent&&t.parent.parent;)t=t.parent;return t.data.name}function tr(e,t){return e.length!==t.length?!1:e.every((r,n)=>r===t[n])}function Fr(e,t){if(!e||!t.length||e.name!==t[0])return null;let r=e;for(let n=1;n<t.length&&r;n++)r=(r.children||[]).find(a=>a.name===t[n]);return r||null}function ye(e,t){if(!t||t.length===0)return e;let r=e;if(r.data.name!==t[0])return null;for(let n=1;n<t.length;n++){if(!r.children)return null;let a=r.children.find(o=>o.data.name===t[n]);if(!a)return null;r=a}return r}function X(e){return{sx0:e.x0,sy0:e.y0,sdx:e.x1-e.x0||1,sdy:e.y1-e.y0||1}}function rr(e,t,r){return{sx0:e.sx0+(t.sx0-e.sx0)*r,sy0:e.sy0+(t.sy0-e.sy0)*r,sdx:e.sdx+(t.sdx-e.sdx)*r,sdy:e.sdy+(t.sdy-e.sdy)*r}}function nr(e){return 1-Math.pow(1-e,3)}function ar(e,t){if(!e.children||e.children.length===0)return[e];let r=[];function n(a,o){if(!(o>t)&&(r.push(a),a.children))for(let i of a.children)n(i,o+1)}if(e.children)for(let a of e.children)n(a,1);return r}function ir(e){e.each(t=>{t.children&&t.children.forEach((r,n)=>{r._siblingIndex=n})})}function or(e,t){if(!e||!t||e===t)return null;let r=e;for(;r.parent&&r.parent!==t;)r=r.parent;return r.parent===t?r:null}function lr(e){let t=Math.max(0,e||0),r=Math.floor(t/re.length),n=re[t%re.length]||se;return(I(n)||I(se)).brighter(r*.18).formatHex()}function we(e,t){if(!e||!t)return se;if(e===t&&(!t.children||t.children.length===0))return re[0];let r=or(e,t);if(!r)return se;let n=r._siblingIndex||0,a=I(lr(n))||I(re[0]),o=Math.max(0,e.depth-r.depth),i=(e._siblingIndex||0)%5*.025;return a.brighter(Math.min(.32,o*.11+i)).formatHex()}function fr(e,t){let r=e;for(;r;){if(r===t)return!0;r=r.parent}return!1}function ut(e,t,r,n){let a=(e.x0-t.sx0)/t.sdx*r,o=(e.y0-t.sy0)/t.sdy*n,i=(e.x1-e.x0)/t.sdx*r,s=(e.y1-e.y0)/t.sdy*n;return{left:a,top:o,width:Math.max(i,0),height:Math.max(s,0)}}function ht(e,t,r,n,a,o){let i=Math.max(0,Math.min(o,n/2,a/2));if(e.roundRect){e.beginPath(),e.roundRect(t,r,n,a,i);return}e.beginPath(),e.moveTo(t+i,r),e.arcTo(t+n,r,t+n,r+a,i),e.arcTo(t+n,r+a,t,r+a,i),e.arcTo(t,r+a,t,r,i),e.arcTo(t,r,t+n,r,i)}function pt(e,t,r){if(!t||r<=0)return"";if(e.measureText(t).width<=r)return t;let n="...",a=0,o=t.length;for(;a<o;){let i=Math.ceil((a+o)/2);e.measureText(t.slice(0,i)+n).width<=r?a=i:o=i-1}return a>0?t.slice(0,a)+n:""}function sr({model:e,el:t}){let r=document.createElement("div");r.className="wiggly-treemap";let n=document.createElement("style");n.textContent=Xt,r.appendChild(n);let a=document.createElement("div");a.className="wiggly-treemap-topbar";let o=document.createElement("span");o.className="wiggly-treemap-path";let i=document.createElement("span");i.className="wiggly-treemap-meta",a.append(o,i),r.appendChild(a);let s=document.createElement("div");s.className="wiggly-treemap-chart";let p=document.createElement("canvas");p.className="wiggly-treemap-canvas",s.appendChild(p),r.appendChild(s),t.appendChild(r);let u=p.getContext("2d"),h=null,g=null,l=null,w=null,v=null,M=null,b=[],N=null,S=null,L=null,q=null,F=null,$=null;function ce(){let f=e.get("width");return typeof f=="number"?f:s.clientWidth||600}function mt(){let f=getComputedStyle(r);return{bg:f.getPropertyValue("--bg").trim()||"#ffffff",stroke:f.getPropertyValue("--tile-stroke").trim()||"rgba(255,255,255,0.9)",hoverStroke:f.getPropertyValue("--hover-stroke").trim()||"rgba(255,255,255,0.98)",muted:f.getPropertyValue("--muted").trim()||"#667085"}}function ve(f,c){let d=window.devicePixelRatio||1,y=Math.max(1,Math.round(f*d)),x=Math.max(1,Math.round(c*d));(p.width!==y||p.height!==x)&&(p.width=y,p.height=x),p.style.width=f+"px",p.style.height=c+"px",u.setTransform(d,0,0,d,0,0)}function Ne(f,c){be().size([f,c]).paddingTop(d=>d.children?20:0).paddingInner(1).paddingOuter(2).round(!0)(h)}function Lr(f,c,d){let y=e.get("value_col")||"";h=U(f).sum(x=>x.children&&x.children.length?0:gt(x.value,y)).sort((x,_)=>_.value-x.value),Ne(c,d),ir(h)}function Y(){L=null,q=null,F=null}function xt(f){return L&&q===g&&F===f||(L=ar(g,f),q=g,F=f),L}function bt(f){if(!$)return we(f,g);let c=we(f,$.toView),d=fr(f,$.fromView)?we(f,$.fromView):c;return xe(d,c)($.progress)}function G(){let f=e.get("data"),c=e.get("width"),d=e.get("height")||400;s.style.width=typeof c=="number"?c+"px":c||"600px",s.style.height=d+"px";let x=ce();if(ve(x,d),!f||!f.name){h=null,g=null,l=null,w=null,b=[],S=null,Y(),o.textContent="",i.textContent="",u.clearRect(0,0,x,d);return}Lr(f,x,d),M=x;let _=e.get("selected_path")||[];g=(_.length?ye(h,_):null)||h,l=X(g),w=l,$=null,Y(),Me(),A(l)}function Hr(f){let c=e.get("data");if(!h||!c)return;for(let{path:y,children:x}of f){let _=Fr(c,y);_&&(_.children=x,delete _.lazy)}let d=te(g);Lr(c,M||ce(),e.get("height")||400),g=ye(h,d)||h,N=null,S=null,$=null,Y(),A(l||X(g))}function A(f){if(!h||!g)return;let c=ce(),d=e.get("height")||400,y=e.get("value_col")||"",x=e.get("max_depth")||3,_=mt();ve(c,d),u.clearRect(0,0,c,d),u.fillStyle=_.bg,u.fillRect(0,0,c,d);let E=xt(x),C=[];b=[];for(let k of E){let m=ut(k,f,c,d);m.width<st||m.height<st||(C.push({node:k,box:m}),m.width*m.height>=Kt&&b.push({node:k,box:m}))}let H=0;for(let{node:k,box:m}of C){let P=bt(k),O=Math.min(7,Math.max(2,Math.min(m.width,m.height)/8));if(u.save(),ht(u,m.left,m.top,m.width,m.height,O),u.fillStyle=P,u.fill(),m.width>3&&m.height>3&&(u.lineWidth=1,u.strokeStyle=_.stroke,u.stroke()),u.restore(),H>=Jt)continue;let vt=k.data.name,Se=ct(k,y),Nt=m.width>=46&&m.height>=18,kt=m.width>=68&&m.height>=34&&Se;if(!Nt)continue;u.save(),u.beginPath(),u.rect(m.left+2,m.top+2,Math.max(0,m.width-4),Math.max(0,m.height-4)),u.clip(),u.fillStyle=Yt,u.font="600 12px -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",u.textBaseline="top";let Ee=pt(u,vt,m.width-12);if(Ee&&(u.fillText(Ee,m.left+6,m.top+5),H+=1),kt){u.globalAlpha=.78,u.font="11px -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif";let Te=pt(u,Se,m.width-12);Te&&u.fillText(Te,m.left+6,m.top+20)}u.restore()}if(C.length===0&&g.children&&g.children.length&&(u.fillStyle=_.muted,u.font="13px -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",u.fillText("Zoom in or increase the widget size to see these tiny items.",12,18)),S&&S!==g){let k=ut(S,f,c,d);k.width>=2&&k.height>=2&&(u.save(),ht(u,k.left,k.top,k.width,k.height,Math.min(8,Math.max(2,Math.min(k.width,k.height)/8))),u.lineWidth=Math.min(2.75,Math.max(1.75,Math.min(k.width,k.height)/26)),u.strokeStyle=_.hoverStroke,u.stroke(),u.restore())}}function ke(f){v!==null&&cancelAnimationFrame(v);let c=l||f,d=performance.now();w=f;function y(x){let _=Math.min(1,(x-d)/Gt),E=nr(_);$&&($.progress=E),l=rr(c,w,E),A(l),_<1?v=requestAnimationFrame(y):(l=w,v=null,$=null,A(l))}v=requestAnimationFrame(y)}function Me(){if(!g){o.textContent="",i.textContent="";return}ue(g)}function yt(f){let c=e.get("value_col")||"",d=ct(f,c)||dt(f.value||0),y=h&&h.value?h.value:0,x=y?Qt(f.value/y*100):"",_=f.leaves?f.leaves().length:0,E=_===1?"leaf":"leaves",C=x?`${d} (${x})`:d;return C?`${C} - ${_} ${E}`:`${_} ${E}`}function ue(f){if(!f)return;let c=te(f),d=g?te(g):[],y=c.reduce((E,C,H)=>E===H&&d[H]===C?E+1:E,0),x=c.slice(0,y).join(" / "),_=c.join(" / ");o.replaceChildren(),c.forEach((E,C)=>{if(C>0){let O=document.createElement("span");O.textContent=" / ",O.className=C<=y?"wiggly-treemap-path-separator wiggly-treemap-current-path":"wiggly-treemap-path-separator wiggly-treemap-next-path",o.appendChild(O)}let H=c.slice(0,C+1),k=ye(h,H),m=C<y,P=document.createElement("button");P.type="button",P.className=`wiggly-treemap-path-part ${m?"wiggly-treemap-current-path":"wiggly-treemap-next-path"}`,C===c.length-1&&P.classList.add("-last"),P.textContent=E,k&&!tr(H,d)&&(P.classList.add("-clickable"),P.addEventListener("click",O=>{O.stopPropagation(),he(k)})),o.appendChild(P)}),c.length||(o.textContent=x||_),o.title=_,i.textContent=yt(f),i.title=`${er(f)} - ${_}`}function $e(f){if(!f)return null;if(f===g)return g;let c=f;for(;c.parent&&c.parent!==g;)c=c.parent;return c}function he(f,c=!0,d=!0){let y=g;g=f;let x=X(f);Y(),d&&(e.set("selected_path",te(f)),e.save_changes()),Me(),c&&y&&y!==f?($={fromView:y,toView:f,progress:0},ke(x)):c?($=null,ke(x)):($=null,l=x,w=x,A(l))}function _e(f,c){for(let d=b.length-1;d>=0;d--){let{node:y,box:x}=b[d];if(f>=x.left&&f<=x.left+x.width&&c>=x.top&&c<=x.top+x.height)return y}return null}function Ce(f){let c=p.getBoundingClientRect();return{x:f.clientX-c.left,y:f.clientY-c.top}}function wt(f){e.set("clicked_path",te(f)),e.save_changes();let c=$e(f);c&&c!==g&&he(c)}p.addEventListener("mousemove",f=>{if(!g)return;let c=Ce(f),d=_e(c.x,c.y),y=$e(d),x=y!==S,_=N;N=d,S=y,s.style.cursor=S&&S!==g?"pointer":"default",ue(S||g),d!==_&&(e.set("hovered_path",d?te(d):[]),e.save_changes()),x&&A(l||X(g))}),p.addEventListener("mouseleave",()=>{let f=N!==null;N=null,S=null,s.style.cursor="default",ue(g),f&&(e.set("hovered_path",[]),e.save_changes()),A(l||X(g))}),p.addEventListener("click",f=>{let c=Ce(f),d=_e(c.x,c.y)||N;d&&wt(d)}),new ResizeObserver(()=>{if(typeof e.get("width")!="string"||!h)return;let f=ce();if(f===M)return;M=f;let c=e.get("height")||400;Ne(f,c),l=X(g),w=l,$=null,Y(),A(l)}).observe(s),e.on("change:data",G),e.on("change:width",G),e.on("change:height",G),e.on("change:value_col",G),e.on("change:max_depth",()=>{Y(),A(l||X(g))}),e.on("change:selected_path",()=>{if(!h)return;let f=e.get("selected_path")||[],c=f.length?ye(h,f):h;c&&c!==g&&he(c,!0,!1)}),e.on("msg:custom",f=>{f&&f.type==="children"&&Hr(f.nodes||[])}),G(),e.send({type:"resync"})}var Nn={render:sr};export{Nn as default};
@@ -55,6 +55,11 @@ function render({ model, el }) {
   let stream = null;
   let intervalId = null;
   let streamRequestId = 0;
+  // Credit-based flow control: each frame sent uses a credit and Python's
+  // "ack" returns it. An interval tick without a credit is remembered, and a
+  // fresh frame is taken as soon as one comes back.
+  let credits = Math.max(1, model.get("max_in_flight") || 1);
+  let owed = false;
 
   const setStatus = (text, tone) => {
     status.textContent = text;
@@ -75,7 +80,11 @@ function render({ model, el }) {
     if (isCapturing) {
       const intervalMs = Math.max(0, model.get("interval_ms") || 1000);
       intervalId = setInterval(() => {
-        captureFrame(false);
+        if (credits > 0) {
+          captureFrame(false);
+        } else {
+          owed = true;
+        }
       }, intervalMs);
       setStatus(`Auto-capture on`, "active");
     } else if (model.get("error")) {
@@ -85,21 +94,77 @@ function render({ model, el }) {
     }
   };
 
+  // One reusable canvas; frames go to Python as a binary buffer, never as
+  // base64 text.
+  const canvas = document.createElement("canvas");
+
+  const captureSize = () => {
+    const w = model.get("capture_width") || 0;
+    const h = model.get("capture_height") || 0;
+    const vw = video.videoWidth;
+    const vh = video.videoHeight;
+    if (w > 0 && h > 0) return [w, h];
+    if (w > 0) return [w, Math.max(1, Math.round((w * vh) / vw))];
+    if (h > 0) return [Math.max(1, Math.round((h * vw) / vh)), h];
+    return [vw, vh];
+  };
+
+  // The frame travels as a custom message; bumping the synced counter after
+  // it is what tells observers (and marimo cells) that a new frame landed.
+  const sendFrame = (format, width, height, timestamp, buffer) => {
+    const count = (model.get("frame_count") || 0) + 1;
+    model.send({ type: "frame", format, width, height, timestamp, count }, undefined, [buffer]);
+    model.set("frame_count", count);
+    model.save_changes();
+  };
+
+  const onMessage = (msg) => {
+    if (!msg || msg.type !== "ack") return;
+    const limit = Math.max(1, model.get("max_in_flight") || 1);
+    credits = Math.min(limit, credits + (msg.count || 1));
+    if (owed && model.get("capturing")) {
+      owed = false;
+      captureFrame(false);
+    }
+  };
+  model.on("msg:custom", onMessage);
+
   const captureFrame = (manual) => {
     if (!stream || video.videoWidth === 0 || video.videoHeight === 0) {
       return;
     }
-    const canvas = document.createElement("canvas");
-    canvas.width = video.videoWidth;
-    canvas.height = video.videoHeight;
-    const ctx = canvas.getContext("2d");
+    const [width, height] = captureSize();
+    if (canvas.width !== width || canvas.height !== height) {
+      canvas.width = width;
+      canvas.height = height;
+    }
+    const ctx = canvas.getContext("2d", { willReadFrequently: model.get("frame_format") === "rgba" });
     if (!ctx) {
       return;
     }
-    ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
-    const dataUrl = canvas.toDataURL("image/png");
-    model.set("image_base64", dataUrl);
-    model.save_changes();
+    ctx.drawImage(video, 0, 0, width, height);
+    // Manual captures always go through; they still count against credits.
+    credits = Math.max(0, credits - 1);
+    const timestamp = performance.timeOrigin + performance.now();
+    const format = model.get("frame_format") || "png";
+    if (format === "rgba") {
+      const pixels = ctx.getImageData(0, 0, width, height);
+      sendFrame(format, width, height, timestamp, pixels.data.buffer);
+    } else {
+      canvas.toBlob(
+        async (blob) => {
+          if (!blob) {
+            credits += 1;
+            return;
+          }
+          // Browsers without WebP encoding fall back to PNG; report what we got.
+          const actual = blob.type.replace("image/", "") || format;
+          sendFrame(actual, width, height, timestamp, await blob.arrayBuffer());
+        },
+        `image/${format}`,
+        model.get("quality")
+      );
+    }
     if (manual && model.get("capturing")) {
       model.set("capturing", false);
       model.save_changes();
@@ -191,6 +256,7 @@ function render({ model, el }) {
     stopInterval();
     invalidateStreamRequest();
     stopStream();
+    model.off("msg:custom", onMessage);
     model.off("change:capturing", onCapturingChange);
     model.off("change:interval_ms", onIntervalChange);
     model.off("change:facing_mode", onFacingChange);
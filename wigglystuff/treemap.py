@@ -10,6 +10,8 @@ import anywidget
 import traitlets
 
 from ._tree_utils import (
+    LazyTree,
+    _BuiltTree,
     EMPTY_TREE_ERROR,
     aggregate_values,
     collect_columns,
@@ -43,6 +45,10 @@ class Treemap(anywidget.AnyWidget):
             rectangle sizing. Ignored for scalar values.
         format: Optional callable ``(value) -> str`` applied to rectangle
             value labels. Default: raw integer when whole, else two decimals.
+        lazy: Only send nodes down to ``max_depth``. Deeper levels are sent
+            as the view zooms in, so huge trees open instantly. ``data`` then
+            holds only those first levels; deeper nodes go to the browser as
+            messages and are not added to it.
 
     Examples:
         ```python
@@ -84,8 +90,12 @@ class Treemap(anywidget.AnyWidget):
         max_depth: int = 3,
         value_col: str | None = None,
         format: Callable[[float], str] | None = None,
+        lazy: bool = False,
     ):
         prepared = self._prepare(data, value_col=value_col, formatter=format)
+        self._lazy = LazyTree(prepared) if lazy and prepared.get("children") else None
+        if self._lazy is not None:
+            prepared = self._lazy.initial(max_depth)
         super().__init__(
             data=prepared,
             width=width,
@@ -93,6 +103,28 @@ class Treemap(anywidget.AnyWidget):
             max_depth=max_depth,
             value_col=value_col or "",
         )
+        if self._lazy is not None:
+            self.observe(
+                self._load_view, names=["selected_path", "clicked_path", "max_depth"]
+            )
+            self.on_msg(self._handle_message)
+
+    def _handle_message(self, _: Any, content: Any, buffers: Any) -> None:
+        # A new view (or a reloaded page) only has ``data``: resend the rest.
+        if isinstance(content, dict) and content.get("type") == "resync":
+            self._lazy.reset()
+            self._load_view({"name": "selected_path", "new": self.selected_path})
+
+    def _load_view(self, change: dict) -> None:
+        # Everything ``max_depth`` levels below the zoomed-into node is drawn;
+        # a click prefetches below the clicked node too.
+        paths = [self.selected_path or [self.data["name"]]]
+        if change["name"] == "clicked_path" and change["new"]:
+            paths.append(change["new"])
+        depth = self.max_depth
+        updates = [update for path in paths for update in self._lazy.load(path, depth)]
+        if updates:
+            self.send({"type": "children", "nodes": updates})
 
     @staticmethod
     def _prepare(
@@ -103,9 +135,13 @@ class Treemap(anywidget.AnyWidget):
     ) -> dict:
         if data is None:
             raise ValueError(EMPTY_TREE_ERROR)
-        tree = copy.deepcopy(dict(data))
-        validate_tree(tree)
-        aggregate_values(tree)
+        if isinstance(data, _BuiltTree):
+            # Built by a from_* constructor: validated, aggregated, unshared.
+            tree = data.tree
+        else:
+            tree = copy.deepcopy(dict(data))
+            validate_tree(tree)
+            aggregate_values(tree)
         cols = collect_columns(tree)
         if cols and not value_col:
             raise ValueError(
@@ -148,7 +184,8 @@ class Treemap(anywidget.AnyWidget):
             )
             ```
         """
-        return cls(tree_from_paths(mapping, sep=sep, root_name=root_name), **kwargs)
+        tree = tree_from_paths(mapping, sep=sep, root_name=root_name)
+        return cls(_BuiltTree(tree), **kwargs)
 
     @classmethod
     def from_records(
@@ -184,7 +221,7 @@ class Treemap(anywidget.AnyWidget):
             records, path_cols=path_cols, value_cols=value_cols, root_name=root_name
         )
         cls._auto_pick_value_col(tree, value_cols, kwargs)
-        return cls(tree, **kwargs)
+        return cls(_BuiltTree(tree), **kwargs)
 
     @classmethod
     def from_dataframe(
@@ -224,7 +261,7 @@ class Treemap(anywidget.AnyWidget):
             df, path_cols=path_cols, value_cols=value_cols, root_name=root_name
         )
         cls._auto_pick_value_col(tree, value_cols, kwargs)
-        return cls(tree, **kwargs)
+        return cls(_BuiltTree(tree), **kwargs)
 
     @staticmethod
     def _auto_pick_value_col(
@@ -2,21 +2,132 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import time
+from collections import deque
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, List, Optional
 
 import anywidget
 import traitlets
 
+_FORMATS = ("png", "jpeg", "webp", "rgba")
+
+
+class WebcamFrame:
+    """One captured frame, decoded at most once.
+
+    ``data`` holds the bytes exactly as the browser sent them: an encoded
+    image for ``png``/``jpeg``/``webp``, or ``height * width * 4`` raw RGBA
+    bytes for ``rgba``. ``timestamp`` is the capture time in seconds since the
+    epoch, taken in the browser.
+    """
+
+    def __init__(self, data: bytes, format: str, width: int, height: int, timestamp: float) -> None:
+        self.data = data
+        self.format = format
+        self.width = width
+        self.height = height
+        self.timestamp = timestamp
+        self._pil = None
+        self._array = None
+        self._data_url: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"WebcamFrame({self.format}, {self.width}x{self.height}, t={self.timestamp:.3f})"
+
+    def to_pil(self):
+        """The frame as a PIL Image (cached)."""
+        if self._pil is None:
+            try:
+                from PIL import Image
+            except ImportError as exc:  # pragma: no cover - optional dependency
+                raise ImportError("PIL is required to use get_pil().") from exc
+            if self.format == "rgba":
+                self._pil = Image.frombytes("RGBA", (self.width, self.height), self.data)
+            else:
+                self._pil = Image.open(BytesIO(self.data))
+                self._pil.load()
+        return self._pil
+
+    def to_array(self):
+        """The frame as a ``(height, width, channels)`` uint8 NumPy array (cached).
+
+        Raw ``rgba`` frames are wrapped without copying or decoding.
+        """
+        if self._array is None:
+            try:
+                import numpy as np
+            except ImportError as exc:  # pragma: no cover - optional dependency
+                raise ImportError("numpy is required to use get_array().") from exc
+            if self.format == "rgba":
+                self._array = np.frombuffer(self.data, dtype=np.uint8).reshape(self.height, self.width, 4)
+            else:
+                self._array = np.asarray(self.to_pil())
+        return self._array
+
+    def to_data_url(self) -> str:
+        """The frame as a base64 data URL; raw frames are PNG-encoded first."""
+        if self._data_url is None:
+            if self.format == "rgba":
+                buf = BytesIO()
+                self.to_pil().save(buf, format="PNG")
+                mime, payload = "image/png", buf.getvalue()
+            else:
+                mime, payload = f"image/{self.format}", self.data
+            self._data_url = f"data:{mime};base64,{base64.b64encode(payload).decode()}"
+        return self._data_url
+
+
+class _LatestFrame:
+    """Single-slot mailbox feeding one ``frames()`` iterator.
+
+    Holds only the newest frame: if the consumer falls behind, older frames
+    are overwritten rather than queued.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._frame: Optional[WebcamFrame] = None
+        self._event = asyncio.Event()
+
+    def put(self, frame: WebcamFrame) -> None:
+        # The comm handler may run off the consumer's event loop thread.
+        self._loop.call_soon_threadsafe(self._set, frame)
+
+    def _set(self, frame: WebcamFrame) -> None:
+        self._frame = frame
+        self._event.set()
+
+    async def get(self) -> WebcamFrame:
+        await self._event.wait()
+        self._event.clear()
+        frame, self._frame = self._frame, None
+        return frame
+
 
 class WebcamCapture(anywidget.AnyWidget):
     """Webcam capture widget with manual and interval snapshots.
 
     The widget shows a live webcam preview plus a capture button and an
-    auto-capture toggle. When ``capturing`` is enabled, the browser updates
-    ``image_base64`` on the cadence specified by ``interval_ms``.
+    auto-capture toggle. When ``capturing`` is enabled, the browser captures
+    a frame on the cadence specified by ``interval_ms``.
+
+    Frames travel as binary message buffers, encoded as ``frame_format``
+    (``"png"``, ``"jpeg"``, ``"webp"``, or uncompressed ``"rgba"``) at
+    ``capture_width`` x ``capture_height``. The last ``buffer_size`` frames
+    are kept in a ring buffer; each is decoded at most once, however often
+    ``get_pil()`` or ``get_array()`` is called. ``frame_count`` ticks for
+    every frame received, so observe it to react to new captures.
+
+    Capture is credit based: the browser has at most ``max_in_flight``
+    frames unacknowledged, and when Python is behind it skips interval ticks
+    and sends a fresh frame as soon as a credit comes back. Without a
+    consumer every frame is acknowledged on arrival; while ``frames()`` is
+    being iterated, a frame is acknowledged only once the loop body that
+    handled the previous one has finished.
 
     Examples:
         ```python
@@ -31,38 +142,149 @@ class WebcamCapture(anywidget.AnyWidget):
     _esm = Path(__file__).parent / "static" / "webcam-capture.js"
     _css = Path(__file__).parent / "static" / "webcam-capture.css"
 
-    image_base64 = traitlets.Unicode("").tag(sync=True)
     capturing = traitlets.Bool(False).tag(sync=True)
     interval_ms = traitlets.Int(1000).tag(sync=True)
     facing_mode = traitlets.Unicode("user").tag(sync=True)
+    frame_format = traitlets.Enum(_FORMATS, default_value="png").tag(sync=True)
+    quality = traitlets.Float(0.9).tag(sync=True)
+    capture_width = traitlets.Int(0).tag(sync=True)
+    capture_height = traitlets.Int(0).tag(sync=True)
+    frame_count = traitlets.Int(0).tag(sync=True)
+    max_in_flight = traitlets.Int(1).tag(sync=True)
     ready = traitlets.Bool(False).tag(sync=True)
     error = traitlets.Unicode("").tag(sync=True)
 
-    def __init__(self, interval_ms: int = 1000, facing_mode: str = "user") -> None:
+    def __init__(
+        self,
+        interval_ms: int = 1000,
+        facing_mode: str = "user",
+        *,
+        frame_format: str = "png",
+        quality: float = 0.9,
+        capture_width: int = 0,
+        capture_height: int = 0,
+        buffer_size: int = 8,
+        max_in_flight: int = 1,
+    ) -> None:
         """Create a WebcamCapture widget.
 
         Args:
             interval_ms: Capture interval in milliseconds when auto-capture is on.
             facing_mode: Camera facing mode ("user" or "environment").
+            frame_format: Encoding of captured frames: "png", "jpeg", "webp",
+                or "rgba" for raw pixels that need no decoding at all.
+            quality: Quality between 0 and 1 for "jpeg" and "webp".
+            capture_width: Width to capture at in pixels; 0 keeps the camera's
+                width (or follows ``capture_height`` keeping the aspect ratio).
+            capture_height: Height to capture at in pixels, like ``capture_width``.
+            buffer_size: Number of recent frames kept in memory.
+            max_in_flight: Frames the browser may send before Python
+                acknowledges one.
         """
-        super().__init__(interval_ms=interval_ms, facing_mode=facing_mode)
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive.")
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive.")
+        self._frames: deque = deque(maxlen=buffer_size)
+        self._consumers: List[_LatestFrame] = []
+        self._unacked = 0
+        super().__init__(
+            interval_ms=interval_ms,
+            facing_mode=facing_mode,
+            frame_format=frame_format,
+            quality=quality,
+            capture_width=capture_width,
+            capture_height=capture_height,
+            max_in_flight=max_in_flight,
+        )
+        self.on_msg(self._handle_message)
+
+    def _handle_message(self, _: Any, content: dict, buffers: Optional[list] = None) -> None:
+        if content.get("type") != "frame" or not buffers:
+            return
+        stamp = content.get("timestamp")
+        frame = WebcamFrame(
+            bytes(buffers[0]),
+            content.get("format", "png"),
+            int(content.get("width", 0)),
+            int(content.get("height", 0)),
+            stamp / 1000.0 if stamp is not None else time.time(),
+        )
+        self._frames.append(frame)
+        # The browser also syncs its count, which is what re-runs marimo cells.
+        self.frame_count = int(content.get("count", self.frame_count + 1))
+        if self._consumers:
+            self._unacked += 1
+            for consumer in list(self._consumers):
+                consumer.put(frame)
+        else:
+            self.send({"type": "ack", "count": 1})
+
+    def _ack(self) -> None:
+        # Frames a consumer skipped over are released along with the one it took.
+        if self._unacked:
+            count, self._unacked = self._unacked, 0
+            self.send({"type": "ack", "count": count})
+
+    async def frames(self) -> AsyncIterator[WebcamFrame]:
+        """Yield frames as they arrive, keeping latency bounded.
+
+        The browser sends the next frame only after the body of the
+        ``async for`` loop has finished with the previous one, and a
+        consumer that still falls behind skips to the newest frame rather
+        than working through a backlog. Turn on ``capturing`` to get a
+        steady stream.
+
+        Frames are delivered by the kernel between cell executions, so run
+        the loop in a background task rather than awaiting it in a cell::
+
+            async def detect():
+                async for frame in cam.frames():
+                    boxes = model(frame.to_array())
+
+            task = asyncio.create_task(detect())
+        """
+        consumer = _LatestFrame(asyncio.get_running_loop())
+        self._consumers.append(consumer)
+        try:
+            while True:
+                frame = await consumer.get()
+                yield frame
+                self._ack()
+        finally:
+            self._consumers.remove(consumer)
+            if not self._consumers:
+                self._ack()
+
+    @property
+    def latest(self) -> Optional[WebcamFrame]:
+        """The most recent frame, or ``None`` before the first capture."""
+        return self._frames[-1] if self._frames else None
+
+    def recent_frames(self, n: Optional[int] = None) -> List[WebcamFrame]:
+        """Up to ``n`` most recent frames (all buffered ones by default), oldest first."""
+        frames = list(self._frames)
+        if n is None:
+            return frames
+        return frames[-n:] if n > 0 else []
+
+    @property
+    def image_base64(self) -> str:
+        """Data URL of the latest frame, or ``""`` before the first capture."""
+        frame = self.latest
+        return frame.to_data_url() if frame is not None else ""
 
     def get_bytes(self) -> bytes:
         """Return the captured frame as raw bytes."""
-        if not self.image_base64:
-            return b""
-        payload = self.image_base64
-        if "base64," in payload:
-            payload = payload.split("base64,", 1)[1]
-        return base64.b64decode(payload)
+        frame = self.latest
+        return frame.data if frame is not None else b""
 
     def get_pil(self):
         """Return the captured frame as a PIL Image."""
-        if not self.image_base64:
-            return None
-        try:
-            from PIL import Image
-        except ImportError as exc:  # pragma: no cover - optional dependency
-            raise ImportError("PIL is required to use get_pil().") from exc
+        frame = self.latest
+        return frame.to_pil() if frame is not None else None
 
-        return Image.open(BytesIO(self.get_bytes()))
+    def get_array(self):
+        """Return the captured frame as a NumPy array, or ``None``."""
+        frame = self.latest
+        return frame.to_array() if frame is not None else None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from html import escape
 from itertools import permutations
 from pathlib import Path
@@ -101,6 +102,38 @@ def layered_layout(nodes, edges):
     return col
 
 
+def _reduce_masks(order, anc):
+    """Transitively reduce per-node ancestor bitmasks into ``[[u, v], ...]``.
+
+    ``anc[i]`` has bit ``j`` set when ``order[j]`` is an ancestor of
+    ``order[i]``. An ancestor ``u`` of ``v`` is implied (and dropped) when it is
+    also an ancestor of one of ``v``'s other ancestors, so OR-ing those masks
+    together finds every shortcut for ``v`` in one pass.
+    """
+    edges = []
+    for v, mask in zip(order, anc):
+        implied, rest = 0, mask
+        while rest:
+            low = rest & -rest
+            implied |= anc[low.bit_length() - 1]
+            rest ^= low
+        direct = mask & ~implied
+        while direct:
+            low = direct & -direct
+            edges.append([order[low.bit_length() - 1], v])
+            direct ^= low
+    return edges
+
+
+def _cell_masks(order, name_to_cell):
+    """Map each cell id to the bitmask of the ``order`` nodes it defines."""
+    bits = {}
+    for j, n in enumerate(order):
+        cell = name_to_cell[n]
+        bits[cell] = bits.get(cell, 0) | (1 << j)
+    return bits
+
+
 def _reduce_edges(order, name_to_cell, ancestors):
     """Derive DAG edges between nodes from their cells' ancestry.
 
@@ -114,22 +147,110 @@ def _reduce_edges(order, name_to_cell, ancestors):
     that share a cell are neither each other's ancestor, so they get no edge and
     land in the same column -- correct for independent inputs.
     """
+    bits = _cell_masks(order, name_to_cell)
+    anc = []
+    for v in order:
+        mask = 0
+        for cell in ancestors.get(name_to_cell[v], ()):
+            mask |= bits.get(cell, 0)
+        anc.append(mask)
+    return _reduce_masks(order, anc)
 
-    def is_anc(a, b):  # cell(a) is an ancestor of cell(b)
-        return name_to_cell[a] in ancestors.get(name_to_cell[b], set())
 
-    edges = []
-    for v in order:
-        for u in order:
-            if u == v or not is_anc(u, v):
-                continue
-            if any(w not in (u, v) and is_anc(u, w) and is_anc(w, v) for w in order):
-                continue
-            edges.append([u, v])
-    return edges
+def _graph_ancestor_masks(graph, order, name_to_cell):
+    """Compute ``_reduce_masks``' ancestor bitmasks in one pass over ``graph``.
+
+    Walks marimo's cell graph once in topological order (Kahn's algorithm over
+    ``graph.parents``/``graph.children``), so every cell inherits its parents'
+    node masks instead of each node running its own ancestor search. Cells
+    caught in a cycle never become ready; marimo refuses to run those, so they
+    are visited last with whatever their parents contributed.
+    """
+    bits = _cell_masks(order, name_to_cell)
+    parents, children = graph.parents, graph.children
+    pending = {c: len(parents.get(c, ())) for c in graph.cells}
+    ready = [c for c, n in pending.items() if n == 0]
+    seen = []
+    for c in ready:  # ``ready`` grows while we walk it
+        seen.append(c)
+        for child in children.get(c, ()):
+            pending[child] -= 1
+            if pending[child] == 0:
+                ready.append(child)
+    done = set(seen)
+    seen.extend(c for c in graph.cells if c not in done)
+
+    below = {}  # cell -> mask of nodes defined in its ancestors
+    for c in seen:
+        mask = 0
+        for p in parents.get(c, ()):
+            mask |= below.get(p, 0) | bits.get(p, 0)
+        below[c] = mask
+    return [below.get(name_to_cell[v], 0) for v in order]
+
+
+def _cell_graph_version(graph):
+    """Return a fingerprint of ``graph`` that changes whenever its edges can.
+
+    marimo's graph keeps no version counter, but its edges follow entirely from
+    which cells exist and their code, so the ``(cell id, code key)`` pairs
+    stand in for one.
+    """
+    return frozenset((cid, cell.key) for cid, cell in graph.cells.items())
 
 
-def _order_and_route(order, columns, edges, sweeps=8, brute_cap=6):
+_EDGE_CACHE = {}
+_EDGE_CACHE_SIZE = 64
+
+
+def _cell_graph_edges(graph, order):
+    """Reduced edges between the ``order`` variables, cached per graph version.
+
+    Re-running a ``from_widgets`` cell (e.g. because one of its widgets changed
+    value) leaves the cell graph untouched, so the reduction is served from the
+    cache.
+    """
+    key = (_cell_graph_version(graph), tuple(order))
+    if key not in _EDGE_CACHE:
+        name_to_cell = {n: next(iter(graph.definitions[n])) for n in order}
+        anc = _graph_ancestor_masks(graph, order, name_to_cell)
+        if len(_EDGE_CACHE) >= _EDGE_CACHE_SIZE:
+            _EDGE_CACHE.pop(next(iter(_EDGE_CACHE)))
+        _EDGE_CACHE[key] = _reduce_masks(order, anc)
+    return [list(e) for e in _EDGE_CACHE[key]]
+
+
+def _count_crossings(pairs, size):
+    """Count the strictly crossing pairs among ``(upper, lower)`` segment ends.
+
+    Sorting by the upper position turns every crossing into an inversion of the
+    lower positions, which a Fenwick tree over ``range(size)`` counts in
+    ``O(E log E)`` instead of comparing every pair of segments.
+    """
+    tree = [0] * (size + 1)
+    total = 0
+    for seen, (_, lo) in enumerate(sorted(pairs)):
+        i, at_most = lo + 1, 0
+        while i > 0:
+            at_most += tree[i]
+            i -= i & -i
+        total += seen - at_most
+        i = lo + 1
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+    return total
+
+
+def _order_and_route(
+    order,
+    columns,
+    edges,
+    sweeps=8,
+    brute_cap=6,
+    heuristic="barycenter",
+    transpose=True,
+):
     """Order the nodes within each column to reduce edge crossings, and split
     every edge that spans more than one column with dummy waypoint nodes.
 
@@ -148,15 +269,25 @@ def _order_and_route(order, columns, edges, sweeps=8, brute_cap=6):
     within-column order that minimizes crossings with the neighbouring column.
     Graphs that admit a crossing-free order under the assigned layering can
     reach zero; the rest are minimized, not guaranteed (that is NP-hard).
-    Columns wider than ``brute_cap`` keep their seeded order rather than
-    brute-forcing.
+
+    Columns of up to ``brute_cap`` nodes try every permutation. Wider columns are
+    sorted by the ``heuristic`` (``"barycenter"`` or ``"median"``) position of
+    their neighbours in the fixed column and, with ``transpose``, refined by
+    swapping adjacent nodes while that removes crossings; a new order is only
+    kept when it does not add crossings. Pass ``brute_cap=0`` to use the
+    heuristic everywhere (e.g. to compare it against the exhaustive path).
     """
+    if heuristic not in ("barycenter", "median"):
+        raise ValueError(
+            f"heuristic must be 'barycenter' or 'median', got {heuristic!r}"
+        )
     max_col = max(columns.values(), default=0)
     layers = {c: [] for c in range(max_col + 1)}
     for n in order:
         layers[columns[n]].append(n)
 
     seg_children = {}  # node -> nodes one column to its right (after splitting)
+    seg_parents = {}  # node -> nodes one column to its left (after splitting)
     routes = []
     dummies = set()
     for u, v in edges:
@@ -166,8 +297,10 @@ def _order_and_route(order, columns, edges, sweeps=8, brute_cap=6):
             dummies.add(d)
             layers[c].append(d)
             seg_children.setdefault(prev, []).append(d)
+            seg_parents.setdefault(d, []).append(prev)
             prev, _ = d, chain.append(d)
         seg_children.setdefault(prev, []).append(v)
+        seg_parents.setdefault(v, []).append(prev)
         chain.append(v)
         routes.append(chain)
 
@@ -179,23 +312,66 @@ def _order_and_route(order, columns, edges, sweeps=8, brute_cap=6):
             for c in seg_children.get(n, [])
             if c in pos_l
         ]
-        return sum(
-            1
-            for a in range(len(seg))
-            for b in range(a + 1, len(seg))
-            if (seg[a][0] - seg[b][0]) * (seg[a][1] - seg[b][1]) < 0
-        )
+        return _count_crossings(seg, len(lower))
 
     def best(layer, score):
         return min((list(p) for p in permutations(layer)), key=score)
 
+    def weight(ps, fallback):
+        if not ps:
+            return fallback
+        if heuristic == "barycenter":
+            return sum(ps) / len(ps)
+        mid = len(ps) // 2
+        return ps[mid] if len(ps) % 2 else (ps[mid - 1] + ps[mid]) / 2
+
+    def reorder(layer, fixed, nbrs, score):
+        pos_f = {n: i for i, n in enumerate(fixed)}
+        ends = {
+            n: sorted(pos_f[m] for m in nbrs.get(n, []) if m in pos_f) for n in layer
+        }
+        # Scale the fallback so a node without neighbours holds its relative
+        # place even when the two columns differ in width.
+        scale = len(fixed) / max(len(layer), 1)
+        ranked = sorted(
+            range(len(layer)), key=lambda i: weight(ends[layer[i]], i * scale)
+        )
+        cand = [layer[i] for i in ranked]
+        if transpose:
+
+            def cost(a, b):  # crossings between a's and b's segments, a above b
+                return sum(bisect_left(ends[b], x) for x in ends[a])
+
+            improved = True
+            while improved:
+                improved = False
+                for j in range(len(cand) - 1):
+                    a, b = cand[j], cand[j + 1]
+                    if cost(a, b) > cost(b, a):
+                        cand[j], cand[j + 1] = b, a
+                        improved = True
+        return cand if score(cand) <= score(layer) else layer
+
+    def place(layer, fixed, nbrs, score):
+        if len(layer) <= brute_cap:
+            return best(layer, score)
+        return reorder(layer, fixed, nbrs, score)
+
     for _ in range(sweeps):
         for c in range(1, max_col + 1):
-            if len(layers[c]) <= brute_cap:
-                layers[c] = best(layers[c], lambda p, c=c: crossings(layers[c - 1], p))
+            layers[c] = place(
+                layers[c],
+                layers[c - 1],
+                seg_parents,
+                lambda p, c=c: crossings(layers[c - 1], p),
+            )
         for c in range(max_col - 1, -1, -1):
-            if len(layers[c]) <= brute_cap:
-                layers[c] = best(layers[c], lambda p, c=c: crossings(p, layers[c + 1]))
+            layers[c] = place(
+                layers[c],
+                layers[c + 1],
+                seg_children,
+                lambda p, c=c: crossings(p, layers[c + 1]),
+            )
     return layers, routes, dummies
 
 
@@ -265,22 +441,21 @@ class WidgetDAG:
             ) from e
 
         # object identity -> variable name (first match wins), preserving order
+        wanted = {id(w) for w in widgets}
         name_of = {}
-        for w in widgets:
-            hit = next((n for n, val in glb.items() if val is w), None)
-            if hit is None:
-                raise ValueError(
-                    "Every widget passed to from_widgets must be a top-level "
-                    "variable; one object was not found in the notebook globals. "
-                    "Assign it to a variable or use WidgetDAG(nodes, edges)."
-                )
-            name_of[id(w)] = hit
+        for n, val in glb.items():
+            if id(val) in wanted:
+                name_of.setdefault(id(val), n)
+        if len(name_of) < len(wanted):
+            raise ValueError(
+                "Every widget passed to from_widgets must be a top-level "
+                "variable; one object was not found in the notebook globals. "
+                "Assign it to a variable or use WidgetDAG(nodes, edges)."
+            )
 
         order = [name_of[id(w)] for w in widgets]
         nodes = {name_of[id(w)]: w for w in widgets}
-        name_to_cell = {n: next(iter(graph.definitions[n])) for n in order}
-        ancestors = {c: graph.ancestors(c) for c in name_to_cell.values()}
-        edges = _reduce_edges(order, name_to_cell, ancestors)
+        edges = _cell_graph_edges(graph, order)
         return cls(nodes, edges, layout=layout)
 
     def _repr_mimebundle_(self, **kwargs):